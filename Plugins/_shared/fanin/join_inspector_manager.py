@@ -13,7 +13,20 @@
   каждый кадр (иначе FPS просядет на ожидании).
 - merge: list-ключи (`overlay` и т.п.) конкатенируются («со всех линий суммируются»);
   скаляры — last-wins (primary имеет приоритет, мёржится первым).
-- TTL: наборы старше 2*timeout выселяются; счётчик дропов в drop_count.
+- TTL: наборы старше timeout выселяются; счётчик дропов в drop_count.
+
+Стоимость — O(1) амортизированно и на item, и на check_timeouts:
+- полнота набора — битовая маска: каждый требуемый вход получает бит, у ключа —
+  OR пришедших битов; «набор полон» = ``mask & eff == eff``. Маска ожидаемых
+  входов (``eff``) кэшируется до ближайшего момента, когда активный вход станет
+  неактивным (или неактивный — снова придёт);
+- окно у всех наборов одно → порядок истечения = порядок создания: check_timeouts
+  снимает просроченные с головы монотонной очереди (deque) и останавливается на
+  первом живом, не сканируя весь буфер. Слитые раньше ключи остаются в очереди и
+  пропускаются лениво (сверка времени создания).
+
+Телеметрия: pending/merge/drop + гистограмма ожидания набора (first item → emit)
+в :meth:`get_stats`.
 
 Items без `data_type` или без `seq_id` → немедленный pass-through (безопасный fallback).
 Используется DataReceiver вместо InspectorManager, когда процесс в join-режиме.
@@ -21,10 +34,15 @@ Items без `data_type` или без `seq_id` → немедленный pass-
 
 from __future__ import annotations
 
+import bisect
 import math
 import threading
 import time
-from typing import Callable, Iterable
+from collections import deque
+from typing import Any, Callable, Iterable
+
+#: Верхние границы корзин гистограммы ожидания набора, мс (последняя корзина — «больше»).
+JOIN_WAIT_BOUNDS_MS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0)
 
 
 class JoinInspectorManager:
@@ -62,33 +80,64 @@ class JoinInspectorManager:
         self._log_error = log_error or (lambda msg: None)
         self._log_debug = log_debug or (lambda msg: None)
 
+        # Бит на каждый требуемый вход; чужие data_type (не в required) — бит 0:
+        # мёржатся, но на полноту набора не влияют.
+        self._bits = {dt: 1 << i for i, dt in enumerate(sorted(self._required))}
+        self._primary_bit = self._bits[primary]
+
         # Буфер: {(camera_id, seq_id): {data_type: item}} — camera_id в ключе разводит
         # кадры разных камер с одинаковым seq_id (Ф7 P2), см. on_item.
         self._buffer: dict[tuple, dict[str, dict]] = {}
+        # Маска пришедших требуемых входов: {(camera_id, seq_id): int}
+        self._masks: dict[tuple, int] = {}
         # Время первого item набора: {(camera_id, seq_id): monotonic}
         self._timestamps: dict[tuple, float] = {}
+        # Очередь истечения: (время создания, ключ) в порядке создания.
+        self._expiry: deque[tuple[float, tuple]] = deque()
         # Последняя активность входа: {data_type: monotonic}
         self._last_seen: dict[str, float] = {}
+        # Кэш маски ожидаемых входов и момент, до которого она верна.
+        self._eff_mask = self._primary_bit
+        self._eff_valid_until = -math.inf
 
         self._drop_count = 0
         self._merge_count = 0
+        self._left_join_count = 0
+        self._wait_counts = [0] * (len(JOIN_WAIT_BOUNDS_MS) + 1)
+        self._wait_sum_ms = 0.0
+        self._wait_max_ms = 0.0
         self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
-    def _effective_required(self, now: float) -> set[str]:
-        """Набор реально ожидаемых входов: primary + недавно активные второстепенные.
+    def _effective_mask(self, now: float) -> int:
+        """Маска реально ожидаемых входов: primary + недавно активные второстепенные.
 
         Неактивный второстепенный вход (фильтр молчит / нет маршрута) исключается,
-        чтобы primary не ждал его каждый кадр (auto-passthrough).
+        чтобы primary не ждал его каждый кадр (auto-passthrough). Пересчёт — только
+        когда истёк срок кэша (ближайший активный вход стал неактивным) или кэш
+        сброшен в on_item (пришёл вход, которого в маске нет).
         """
-        eff = {self._primary}
-        for dt in self._required:
+        if now <= self._eff_valid_until:
+            return self._eff_mask
+        mask = self._primary_bit
+        valid_until = math.inf
+        for dt, bit in self._bits.items():
             if dt == self._primary:
                 continue
             last = self._last_seen.get(dt, -math.inf)
             if now - last <= self._inactive_sec:
-                eff.add(dt)
-        return eff
+                mask |= bit
+                valid_until = min(valid_until, last + self._inactive_sec)
+        self._eff_mask = mask
+        self._eff_valid_until = valid_until
+        return mask
+
+    def _record_wait(self, wait_ms: float) -> None:
+        """Учесть ожидание набора (first item → emit) в гистограмме. Под локом."""
+        self._wait_counts[bisect.bisect_left(JOIN_WAIT_BOUNDS_MS, wait_ms)] += 1
+        self._wait_sum_ms += wait_ms
+        if wait_ms > self._wait_max_ms:
+            self._wait_max_ms = wait_ms
 
     def _merge(self, by_type: dict[str, dict]) -> dict:
         """Слить items по data_type в один. primary первым (его скаляры приоритетны);
@@ -125,40 +174,52 @@ class JoinInspectorManager:
         # camera_id обычно есть: source-плагины ставят его, overlay-плагины переносят
         # (см. line_filter). camera_id=None (одна камера / нет тега) → прежнее поведение.
         key = (item.get("camera_id"), seq_id)
-        now = time.monotonic()
+        bit = self._bits.get(data_type, 0)
         ready: dict | None = None
         with self._lock:
+            # now под локом: порядок _expiry совпадает с порядком времён создания.
+            now = time.monotonic()
             self._last_seen[data_type] = now
-            if key not in self._buffer:
-                self._buffer[key] = {}
+            if bit and not bit & self._eff_mask:
+                self._eff_valid_until = -math.inf  # вход снова активен — пересчитать маску
+            by_type = self._buffer.get(key)
+            if by_type is None:
+                by_type = self._buffer[key] = {}
+                self._masks[key] = 0
                 self._timestamps[key] = now
-            if data_type in self._buffer[key]:
+                self._expiry.append((now, key))
+            elif data_type in by_type:
                 self._log_debug(f"JoinInspectorManager: дубликат data_type='{data_type}' для {key}, перезапись")
-            self._buffer[key][data_type] = item
+            by_type[data_type] = item
+            mask = self._masks[key] | bit
+            self._masks[key] = mask
 
-            eff = self._effective_required(now)
-            if eff.issubset(set(self._buffer[key].keys())):
-                ready = self._merge(self._buffer[key])
+            eff = self._effective_mask(now)
+            if mask & eff == eff:
+                ready = self._merge(by_type)
                 self._merge_count += 1
-                self._buffer.pop(key, None)
-                self._timestamps.pop(key, None)
+                self._record_wait((now - self._timestamps[key]) * 1000.0)
+                del self._buffer[key], self._masks[key], self._timestamps[key]
 
         if ready is not None:
             self._on_ready([ready])
 
     def check_timeouts(self) -> None:
         """Left-join по истечении окна + TTL-выселение. Вызывать периодически."""
-        now = time.monotonic()
         emit: list[dict] = []
         with self._lock:
-            for key in list(self._timestamps.keys()):
-                elapsed = now - self._timestamps[key]
-                if elapsed <= self._timeout_sec:
-                    continue
+            now = time.monotonic()
+            expiry = self._expiry
+            while expiry and now - expiry[0][0] > self._timeout_sec:
+                created, key = expiry.popleft()
+                if self._timestamps.get(key) != created:
+                    continue  # набор уже слит (или ключ пересоздан позже) — запись устарела
                 by_type = self._buffer.get(key, {})
                 if self._primary in by_type:
                     # Left-join: primary есть — эмитим, что собрано (без second-входов).
                     emit.append(self._merge(by_type))
+                    self._left_join_count += 1
+                    self._record_wait((now - created) * 1000.0)
                     self._log_debug(f"JoinInspectorManager: left-join flush {key}, got={sorted(by_type.keys())}")
                 else:
                     # Нет primary — рисовать не на чем, дроп.
@@ -168,6 +229,7 @@ class JoinInspectorManager:
                         f"'{self._primary}', got={sorted(by_type.keys())})"
                     )
                 self._buffer.pop(key, None)
+                self._masks.pop(key, None)
                 self._timestamps.pop(key, None)
 
         for merged in emit:
@@ -187,3 +249,32 @@ class JoinInspectorManager:
     def merge_count(self) -> int:
         """Сколько наборов успешно слито (телеметрия)."""
         return self._merge_count
+
+    @property
+    def join_wait_histogram(self) -> dict[str, Any]:
+        """Гистограмма ожидания набора (first item → merge / left-join), мс.
+
+        ``counts[i]`` — ожиданий ≤ ``bounds_ms[i]`` (и больше предыдущей границы);
+        последний элемент ``counts`` — больше последней границы.
+        """
+        with self._lock:
+            counts = list(self._wait_counts)
+            total_ms, max_ms = self._wait_sum_ms, self._wait_max_ms
+        count = sum(counts)
+        return {
+            "bounds_ms": list(JOIN_WAIT_BOUNDS_MS),
+            "counts": counts,
+            "count": count,
+            "mean_ms": total_ms / count if count else 0.0,
+            "max_ms": max_ms,
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Телеметрия буфера: pending/merge/left-join/drop + гистограмма ожидания."""
+        return {
+            "pending": self.pending_count,
+            "merged": self._merge_count,
+            "left_joined": self._left_join_count,
+            "dropped": self._drop_count,
+            "join_wait_ms": self.join_wait_histogram,
+        }
@@ -173,3 +173,59 @@ class TestP2CameraSeparation:
         assert len(results) == 1
         assert results[0][0]["frame"] == "F"
         assert results[0][0]["overlay"] == [{"z": 1}]
+
+
+class TestExpiryQueue:
+    """Истечение по монотонной очереди: голова просрочена → снимаем, живой ключ → стоп."""
+
+    def test_only_expired_prefix_flushed(self):
+        results = []
+        m = _mgr(results)
+        m.on_item({"data_type": "overlay", "seq_id": 0, "overlay": []})  # активируем overlay
+        m.on_item({"data_type": "frame", "seq_id": 1, "frame": "old"})
+        time.sleep(0.07)
+        m.on_item({"data_type": "overlay", "seq_id": 2, "overlay": []})  # ещё не истёк
+        m.check_timeouts()
+        assert [r[0]["frame"] for r in results] == ["old"]
+        assert m.pending_count == 1
+        assert m.drop_count == 1  # seq 0: overlay без frame
+
+    def test_merged_key_not_flushed_again(self):
+        """Слитый набор остаётся в очереди, но check_timeouts его пропускает."""
+        results = []
+        m = _mgr(results)
+        m.on_item({"data_type": "overlay", "seq_id": 4, "overlay": []})
+        m.on_item({"data_type": "frame", "seq_id": 4, "frame": "F"})
+        assert len(results) == 1
+        time.sleep(0.07)
+        m.check_timeouts()
+        assert len(results) == 1
+        assert m.drop_count == 0
+
+    def test_reactivated_input_awaited_again(self):
+        """Неактивный вход, пришедший снова, сразу возвращается в ожидаемый набор."""
+        results = []
+        m = _mgr(results, inactive_sec=0.05)
+        m.on_item({"data_type": "frame", "seq_id": 1, "frame": "F"})
+        assert len(results) == 1  # overlay не приходил → не ждём
+        m.on_item({"data_type": "overlay", "seq_id": 2, "overlay": [{"x": 1}]})
+        m.on_item({"data_type": "frame", "seq_id": 2, "frame": "F2"})
+        assert results[-1][0]["overlay"] == [{"x": 1}]
+
+
+class TestStats:
+    def test_wait_histogram_and_counters(self):
+        results = []
+        m = _mgr(results)
+        m.on_item({"data_type": "overlay", "seq_id": 1, "overlay": []})
+        m.on_item({"data_type": "frame", "seq_id": 1, "frame": "F"})  # merge почти сразу
+        m.on_item({"data_type": "frame", "seq_id": 2, "frame": "F"})  # ждёт overlay → left-join
+        time.sleep(0.07)
+        m.check_timeouts()
+        stats = m.get_stats()
+        assert (stats["merged"], stats["left_joined"], stats["dropped"], stats["pending"]) == (1, 1, 0, 0)
+        hist = stats["join_wait_ms"]
+        assert hist["count"] == 2
+        assert len(hist["counts"]) == len(hist["bounds_ms"]) + 1
+        assert hist["counts"][0] == 1  # merge ≤ 1 мс
+        assert hist["max_ms"] > 50.0  # left-join ждал окно
@@ -7,6 +7,10 @@ DeviceManager; логика НЕ расползается по плагину.
 (ответ сразу, TCP-connect в supervisor-воркере). Быстрые register-операции
 (2–50 мс) допустимы в командном потоке. Блокирующее >100 мс — в воркере.
 
+Опрос устройств (``device_runtime``): ``reactor`` (дефолт) — все устройства в
+одном DeviceReactor-воркере (asyncio, дедлайны per-device, блокирующие tick —
+в ограниченном пуле); ``threads`` — прежний поток ``dev_<id>`` на устройство.
+
 State-пути (Р8):
     devices.registry.<id>       = {id, name, kind, ...}
     devices.state.<id>.conn     = "disconnected"|"connecting"|"connected"|"error"
@@ -34,10 +38,14 @@ from multiprocess_framework.modules.process_module.plugins import (
 
 from Services.device_hub import DeviceHubError
 from Services.device_hub.manager import DeviceManager
+from Services.device_hub.reactor import DeviceReactor
 from Services.device_hub.registry.store import RegistryStore
 
 from .registers import DeviceHubRegisters
 
+# Имя «воркера» устройства в reactor-режиме (в _device_workers вместо имени потока).
+_REACTOR_PREFIX = "reactor:"
+
 # Корень проекта — для резолва относительных путей
 _PROJECT_ROOT = Path(__file__).resolve().parents[4]
 
@@ -62,6 +70,12 @@ def _resolve_registry_path(raw_path: str) -> Path:
     return _PROJECT_ROOT / raw_path
 
 
+def _poll_interval(driver: Any) -> float:
+    """Период опроса устройства: ``params.poll_interval_s`` (дефолт 0.5 с)."""
+    interval = (getattr(driver.entry, "params", {}) or {}).get("poll_interval_s", 0.5)
+    return float(interval)
+
+
 @register_plugin(
     "device_hub",
     category="hub",
@@ -180,6 +194,13 @@ class DeviceHubPlugin(ProcessModulePlugin):
         # Без desired=True supervisor НЕ создаёт воркер и драйвер НЕ реконнектит.
         self._desired_connected: dict[str, bool] = {}
 
+        # Будильник supervisor'а: connect/disconnect обрабатываются сразу, а не
+        # на следующем витке supervisor_interval_s.
+        self._supervisor_wake = threading.Event()
+        # reactor-режим: один event loop на все устройства (создаётся в start()).
+        self._reactor: DeviceReactor | None = None
+        self._tick_seq: dict[str, int] = {}
+
         # Публикация начального реестра
         self._publish_full_registry()
         self._update_counters()
@@ -210,7 +231,21 @@ class DeviceHubPlugin(ProcessModulePlugin):
         for entry in self._manager.snapshot_registry():
             if entry.enabled and (entry.auto_connect or entry.id in recipe_ids):
                 self._desired_connected[entry.id] = True
-                self._conn_queue.put(("connect", entry.id))
+                self._enqueue_conn("connect", entry.id)
+
+        # Reactor-worker: опрос всех устройств в одном event loop
+        if self._reg.device_runtime == "reactor":
+            self._reactor = DeviceReactor(
+                on_tick=self._on_reactor_tick,
+                on_error=self._on_tick_error,
+                blocking_workers=self._reg.blocking_workers,
+            )
+            ctx.worker_manager.create_worker(
+                "device_reactor",
+                self._reactor.run,
+                ThreadConfig(execution_mode=ExecutionMode.LOOP),
+                auto_start=True,
+            )
 
         # Supervisor-worker (LOOP)
         cfg = ThreadConfig(execution_mode=ExecutionMode.LOOP)
@@ -227,13 +262,7 @@ class DeviceHubPlugin(ProcessModulePlugin):
         # Остановить и удалить per-device воркеры (remove_worker освобождает имена)
         with self._workers_lock:
             for dev_id, wname in list(self._device_workers.items()):
-                try:
-                    if ctx.worker_manager is not None:
-                        remove_fn = getattr(ctx.worker_manager, "remove_worker", None)
-                        if remove_fn:
-                            remove_fn(wname)
-                except Exception:  # no-health: defensive teardown воркеров на shutdown
-                    pass
+                self._release_worker(dev_id, wname)
             self._device_workers.clear()
 
         # Disconnect всех + сохранить
@@ -250,13 +279,22 @@ class DeviceHubPlugin(ProcessModulePlugin):
             if pause_event.is_set():
                 time.sleep(0.1)
                 continue
-            time.sleep(self._reg.supervisor_interval_s)
+            # Будит connect/disconnect-команда; таймаут — страховочный виток.
+            self._supervisor_wake.wait(self._reg.supervisor_interval_s)
+            self._supervisor_wake.clear()
 
             # 1. Разобрать очередь connect/disconnect
             self._process_conn_queue()
 
             # 2. Для connected-драйверов без воркера — создать per-device воркер
             self._ensure_device_workers()
+            if self._reactor is not None:
+                self._reg.reactor_overruns = self._reactor.stats()["overruns"]
+
+    def _enqueue_conn(self, op: str, dev_id: str) -> None:
+        """Поставить connect/disconnect в очередь supervisor'а и разбудить его."""
+        self._conn_queue.put((op, dev_id))
+        self._supervisor_wake.set()
 
     def _process_conn_queue(self) -> None:
         """Обработать все ожидающие connect/disconnect запросы."""
@@ -318,13 +356,8 @@ class DeviceHubPlugin(ProcessModulePlugin):
             for dev_id in list(self._device_workers):
                 if not self._desired_connected.get(dev_id, False):
                     wname = self._device_workers.pop(dev_id, None)
-                    if wname and self._ctx and self._ctx.worker_manager:
-                        remove_fn = getattr(self._ctx.worker_manager, "remove_worker", None)
-                        if remove_fn:
-                            try:
-                                remove_fn(wname)
-                            except Exception:  # no-health: defensive остановка воркера (desired=False)
-                                pass
+                    if wname:
+                        self._release_worker(dev_id, wname)
 
             # Создать воркеры для desired=True без существующего воркера
             for dev_id in list(self._desired_connected):
@@ -337,15 +370,18 @@ class DeviceHubPlugin(ProcessModulePlugin):
                 if driver is None:
                     continue
 
+                if self._reactor is not None:
+                    self._reactor.add(dev_id, driver, _poll_interval(driver))
+                    self._device_workers[dev_id] = f"{_REACTOR_PREFIX}{dev_id}"
+                    continue
+
                 wname = f"dev_{dev_id}"
 
                 def make_tick_fn(did: str, drv: Any) -> Any:
-                    """Замыкание для per-device tick."""
+                    """Замыкание для per-device tick (device_runtime=threads)."""
 
                     def tick_loop(stop_evt: threading.Event, pause_evt: threading.Event) -> None:
-                        interval = getattr(drv.entry, "params", {}).get("poll_interval_s", 0.5)
-                        if isinstance(interval, str):
-                            interval = float(interval)
+                        interval = _poll_interval(drv)
                         tick_n = 0
                         while not stop_evt.is_set():
                             if pause_evt.is_set():
@@ -353,35 +389,9 @@ class DeviceHubPlugin(ProcessModulePlugin):
                                 continue
                             try:
                                 tick_n += 1
-                                snapshot = drv.tick(stop_evt)
-                                if snapshot is not None:
-                                    self._publish_state(f"devices.state.{did}.status", snapshot)
-                                    self._publish_state(f"devices.state.{did}.stats", drv.stats)
-                                # conn каждый тик: иначе одноразовая дельта при connect
-                                # дедуплицируется StateStore, и поздние подписчики (список,
-                                # страница добавления) видят stale «disconnected». ts меняется
-                                # → дельта проходит. quality снапшота отражает живость чтений.
-                                if getattr(drv, "is_connected", False):
-                                    conn = "error" if (snapshot or {}).get("quality") == "bad" else "connected"
-                                elif getattr(drv, "reconnect_exhausted", False):
-                                    # Драйвер исчерпал попытки и «сдался» — ждёт ручного
-                                    # «Подключить». Отдельное состояние для GUI (не спам).
-                                    conn = "failed"
-                                else:
-                                    conn = "disconnected"
-                                self._publish_state(f"devices.state.{did}.conn", {"conn": conn, "ts": tick_n})
-                                # io_peek для панели «Вход/Выход» (если драйвер
-                                # накапливает wire-обмен — robot/generic_modbus).
-                                io = getattr(drv, "last_io", None)
-                                if io and (io.get("input") or io.get("output")):
-                                    self._publish_state(
-                                        f"devices.state.{did}.io_peek",
-                                        {"method": "modbus", **io},
-                                    )
-                            except Exception as exc:
-                                if self._ctx:
-                                    self._ctx.health.report_error(exc, context=f"device_hub.tick.{did}", throttle=30.0)
-                                self._publish_state(f"devices.state.{did}.last_error", str(exc))
+                                self._publish_tick(did, drv, drv.tick(stop_evt), tick_n)
+                            except Exception as exc:  # no-health: report_error в _on_tick_error
+                                self._on_tick_error(did, exc)
                             time.sleep(interval)
 
                     return tick_loop
@@ -407,6 +417,62 @@ class DeviceHubPlugin(ProcessModulePlugin):
                         self._ctx.health.report_error(exc, context="device_hub.create_worker")
                         self._ctx.log_error(f"DeviceHubPlugin: не удалось создать воркер {wname}: {exc}")
 
+    def _publish_tick(self, did: str, drv: Any, snapshot: dict | None, tick_n: int) -> None:
+        """Опубликовать результат тика: status/stats, conn, io_peek."""
+        if snapshot is not None:
+            self._publish_state(f"devices.state.{did}.status", snapshot)
+            self._publish_state(f"devices.state.{did}.stats", drv.stats)
+        # conn каждый тик: иначе одноразовая дельта при connect
+        # дедуплицируется StateStore, и поздние подписчики (список,
+        # страница добавления) видят stale «disconnected». ts меняется
+        # → дельта проходит. quality снапшота отражает живость чтений.
+        if getattr(drv, "is_connected", False):
+            conn = "error" if (snapshot or {}).get("quality") == "bad" else "connected"
+        elif getattr(drv, "reconnect_exhausted", False):
+            # Драйвер исчерпал попытки и «сдался» — ждёт ручного
+            # «Подключить». Отдельное состояние для GUI (не спам).
+            conn = "failed"
+        else:
+            conn = "disconnected"
+        self._publish_state(f"devices.state.{did}.conn", {"conn": conn, "ts": tick_n})
+        # io_peek для панели «Вход/Выход» (если драйвер
+        # накапливает wire-обмен — robot/generic_modbus).
+        io = getattr(drv, "last_io", None)
+        if io and (io.get("input") or io.get("output")):
+            self._publish_state(
+                f"devices.state.{did}.io_peek",
+                {"method": "modbus", **io},
+            )
+
+    def _on_reactor_tick(self, did: str, drv: Any, snapshot: dict | None) -> None:
+        """Колбэк DeviceReactor (поток event loop'а)."""
+        tick_n = self._tick_seq.get(did, 0) + 1
+        self._tick_seq[did] = tick_n
+        self._publish_tick(did, drv, snapshot, tick_n)
+
+    def _on_tick_error(self, did: str, exc: Exception) -> None:
+        """Сбой тика устройства: health (throttled) + last_error; опрос продолжается."""
+        if self._ctx:
+            self._ctx.health.report_error(exc, context=f"device_hub.tick.{did}", throttle=30.0)
+        self._publish_state(f"devices.state.{did}.last_error", str(exc))
+
+    def _release_worker(self, dev_id: str, wname: str) -> None:
+        """Снять устройство с опроса: reactor.remove или remove_worker потока."""
+        if wname.startswith(_REACTOR_PREFIX):
+            if self._reactor is not None:
+                self._reactor.remove(dev_id)
+            # Счётчик тиков — вместе со слотом: иначе копится по всем устройствам,
+            # когда-либо стоявшим на опросе, а повторный add продолжил бы старую нумерацию.
+            self._tick_seq.pop(dev_id, None)
+            return
+        if self._ctx and self._ctx.worker_manager:
+            remove_fn = getattr(self._ctx.worker_manager, "remove_worker", None)
+            if remove_fn:
+                try:
+                    remove_fn(wname)
+                except Exception:  # no-health: defensive остановка воркера при disconnect/remove
+                    pass
+
     def _stop_device_worker(self, dev_id: str) -> None:
         """Остановить и ПОЛНОСТЬЮ удалить per-device воркер из WorkerManager.
 
@@ -417,13 +483,8 @@ class DeviceHubPlugin(ProcessModulePlugin):
         """
         with self._workers_lock:
             wname = self._device_workers.pop(dev_id, None)
-        if wname and self._ctx and self._ctx.worker_manager:
-            remove_fn = getattr(self._ctx.worker_manager, "remove_worker", None)
-            if remove_fn:
-                try:
-                    remove_fn(wname)
-                except Exception:  # no-health: defensive остановка воркера при disconnect/remove
-                    pass
+        if wname:
+            self._release_worker(dev_id, wname)
 
     # ------------------------------------------------------------------ #
     # State-публикация
@@ -548,7 +609,7 @@ class DeviceHubPlugin(ProcessModulePlugin):
                 for dev_id in upserted_ids:
                     self._desired_connected[dev_id] = True
             for dev_id in upserted_ids:
-                self._conn_queue.put(("connect", dev_id))
+                self._enqueue_conn("connect", dev_id)
         return {"status": "ok", "results": results, "count": len(results)}
 
     def cmd_device_sync_set(self, data: dict) -> dict:
@@ -611,7 +672,7 @@ class DeviceHubPlugin(ProcessModulePlugin):
                 for dev_id in new_ids:
                     self._desired_connected[dev_id] = True
             for dev_id in new_ids:
-                self._conn_queue.put(("connect", dev_id))
+                self._enqueue_conn("connect", dev_id)
 
         return {
             "status": "ok",
@@ -668,7 +729,7 @@ class DeviceHubPlugin(ProcessModulePlugin):
         # НР-1: выставляем desired перед постановкой в очередь
         with self._workers_lock:
             self._desired_connected[dev_id] = True
-        self._conn_queue.put(("connect", dev_id))
+        self._enqueue_conn("connect", dev_id)
         return {"status": "ok", "conn": "connecting"}
 
     def cmd_device_disconnect(self, data: dict) -> dict:
@@ -683,7 +744,7 @@ class DeviceHubPlugin(ProcessModulePlugin):
         # НР-1: desired=False — supervisor НЕ пересоздаст воркер
         with self._workers_lock:
             self._desired_connected[dev_id] = False
-        self._conn_queue.put(("disconnect", dev_id))
+        self._enqueue_conn("disconnect", dev_id)
         return {"status": "ok", "conn": "disconnecting"}
 
     # ------------------------------------------------------------------ #
@@ -6,7 +6,7 @@ config-виджета в инспекторе Pipeline/Plugins.
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from multiprocess_framework.modules.process_module.plugins import (
     FieldMeta,
@@ -36,9 +36,28 @@ class DeviceHubRegisters(SchemaBase):
         ),
     ] = 0.2
 
+    device_runtime: Annotated[
+        Literal["reactor", "threads"],
+        FieldMeta(
+            "Опрос устройств",
+            info="reactor — один event loop на все устройства; threads — поток на устройство",
+        ),
+    ] = "reactor"
+
+    blocking_workers: Annotated[
+        int,
+        FieldMeta(
+            "Потоков для блокирующих драйверов",
+            info="Пул reactor'а для sync tick() (robot/vfd/hikvision)",
+            min=1,
+            max=64,
+        ),
+    ] = 8
+
     # --- Телеметрия (readonly) ---
     devices_total: Annotated[int, FieldMeta("Устройств всего", readonly=True)] = 0
     devices_connected: Annotated[int, FieldMeta("Подключено", readonly=True)] = 0
     commands_ok: Annotated[int, FieldMeta("Команд OK", readonly=True)] = 0
     commands_err: Annotated[int, FieldMeta("Команд ERR", readonly=True)] = 0
     last_error: Annotated[str, FieldMeta("Последняя ошибка", readonly=True)] = ""
+    reactor_overruns: Annotated[int, FieldMeta("Пропущенных тиков", readonly=True)] = 0
@@ -61,6 +61,9 @@ def make_ctx(
     cfg = config or {}
     if tmp_registry is not None:
         cfg["registry_path"] = str(tmp_registry)
+    # Дефолт — как у плагина (reactor); тесты, проверяющие поток-на-устройство
+    # (dev_<id>), задают device_runtime="threads" явно.
+    cfg.setdefault("device_runtime", "reactor")
     ctx.config = cfg
     ctx.registers = None  # локальный register
     ctx.state_proxy = state_proxy or MagicMock()
@@ -72,6 +75,19 @@ def make_ctx(
     return ctx
 
 
+@pytest.fixture(params=["reactor", "threads"])
+def device_runtime(request: pytest.FixtureRequest) -> str:
+    """Оба режима опроса устройств: тесты жизненного цикла гоняются на каждом."""
+    return request.param
+
+
+def is_polled(plugin: Any, ctx: Any, dev_id: str) -> bool:
+    """Устройство на опросе: слот reactor'а или поток ``dev_<id>`` (threads)."""
+    if plugin._reactor is not None:
+        return dev_id in plugin._reactor
+    return f"dev_{dev_id}" in ctx.worker_manager.workers
+
+
 @pytest.fixture
 def sim_core() -> RobotSimCore:
     return RobotSimCore()
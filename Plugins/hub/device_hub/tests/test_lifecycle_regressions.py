@@ -20,7 +20,7 @@ from unittest.mock import MagicMock, patch
 
 from Plugins.hub.device_hub.plugin import DeviceHubPlugin
 
-from .conftest import make_ctx
+from .conftest import is_polled, make_ctx
 
 
 # ------------------------------------------------------------------ #
@@ -32,6 +32,7 @@ def _make_plugin(
     tmp_path: Path,
     devices: list[dict] | None = None,
     recipe_devices: list[dict] | None = None,
+    runtime: str = "reactor",
 ) -> tuple[DeviceHubPlugin, MagicMock]:
     """Создать сконфигурированный и запущенный плагин с tmp-реестром."""
     registry_file = tmp_path / "devices.yaml"
@@ -41,7 +42,7 @@ def _make_plugin(
         data = {"version": 1, "devices": devices}
         registry_file.write_text(yaml.dump(data, allow_unicode=True), encoding="utf-8")
 
-    config: dict = {"registry_path": str(registry_file)}
+    config: dict = {"registry_path": str(registry_file), "device_runtime": runtime}
     if recipe_devices:
         config["recipe_devices"] = recipe_devices
 
@@ -60,9 +61,9 @@ def _make_plugin(
 class TestReconnectWorkerLifecycle:
     """Б-1: connect → disconnect → connect — воркер НЕ осиротевает."""
 
-    def test_disconnect_removes_worker_name(self, tmp_path: Path) -> None:
+    def test_disconnect_removes_worker_name(self, tmp_path: Path, device_runtime: str) -> None:
         """После disconnect имя per-device воркера освобождено в FakeWorkerManager."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "robot_1",
@@ -87,7 +88,7 @@ class TestReconnectWorkerLifecycle:
 
         plugin._ensure_device_workers()
         assert "robot_1" in plugin._device_workers
-        assert "dev_robot_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "robot_1")
 
         # Disconnect (через cmd — ставит desired=False)
         plugin.cmd_device_disconnect({"device_id": "robot_1"})
@@ -95,11 +96,11 @@ class TestReconnectWorkerLifecycle:
 
         # Воркер удалён из FakeWorkerManager (имя свободно)
         assert "robot_1" not in plugin._device_workers
-        assert "dev_robot_1" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "robot_1")
 
-    def test_reconnect_after_disconnect_creates_new_worker(self, tmp_path: Path) -> None:
+    def test_reconnect_after_disconnect_creates_new_worker(self, tmp_path: Path, device_runtime: str) -> None:
         """connect → disconnect → connect: повторный create_worker успешен."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "robot_1",
@@ -122,14 +123,14 @@ class TestReconnectWorkerLifecycle:
             plugin.cmd_device_connect({"device_id": "robot_1"})
             plugin._process_conn_queue()
         plugin._ensure_device_workers()
-        assert "dev_robot_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "robot_1")
 
         # Disconnect (через cmd — desired=False)
         plugin.cmd_device_disconnect({"device_id": "robot_1"})
         plugin._process_conn_queue()
         # _ensure_device_workers тоже остановит воркер при desired=False
         plugin._ensure_device_workers()
-        assert "dev_robot_1" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "robot_1")
 
         # Повторный connect + воркер (через cmd — desired=True)
         mock_driver.desired_connected = True
@@ -138,7 +139,7 @@ class TestReconnectWorkerLifecycle:
             plugin._process_conn_queue()
         plugin._ensure_device_workers()
         # Воркер снова создан (имя было освобождено remove_worker)
-        assert "dev_robot_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "robot_1")
         assert "robot_1" in plugin._device_workers
 
 
@@ -150,10 +151,10 @@ class TestReconnectWorkerLifecycle:
 class TestInitialConnectFailWorker:
     """Б-2: первый connect падает — воркер всё равно создаётся для reconnect."""
 
-    def test_worker_created_for_failed_connect(self, tmp_path: Path) -> None:
+    def test_worker_created_for_failed_connect(self, tmp_path: Path, device_runtime: str) -> None:
         """Если connect вернул False, драйвер создан — _ensure создаёт воркер
         (при desired=True, tick сам сделает reconnect)."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "robot_1",
@@ -180,7 +181,7 @@ class TestInitialConnectFailWorker:
         # -> _ensure_device_workers создаёт воркер для reconnect
         plugin._ensure_device_workers()
         assert "robot_1" in plugin._device_workers
-        assert "dev_robot_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "robot_1")
 
 
 # ------------------------------------------------------------------ #
@@ -191,7 +192,7 @@ class TestInitialConnectFailWorker:
 class TestRecipeDevicesAutoConnect:
     """н1: устройства из рецепта ставятся в connect-очередь при start()."""
 
-    def test_recipe_devices_in_conn_queue(self, tmp_path: Path) -> None:
+    def test_recipe_devices_in_conn_queue(self, tmp_path: Path, device_runtime: str) -> None:
         """start() с recipe_devices → они в connect-очереди и desired=True."""
         recipe = [
             {
@@ -201,7 +202,7 @@ class TestRecipeDevicesAutoConnect:
                 "transport": {"type": "tcp", "host": "1.2.3.4", "port": 502, "unit_id": 1},
             }
         ]
-        plugin, ctx = _make_plugin(tmp_path, recipe_devices=recipe)
+        plugin, ctx = _make_plugin(tmp_path, recipe_devices=recipe, runtime=device_runtime)
 
         # Проверяем что robot_recipe в connect-очереди
         queued_ops: list[tuple[str, str]] = []
@@ -213,7 +214,7 @@ class TestRecipeDevicesAutoConnect:
         # НР-1: desired=True проставлено для recipe-устройств
         assert plugin._desired_connected.get("robot_recipe") is True
 
-    def test_recipe_device_without_auto_connect_still_queued(self, tmp_path: Path) -> None:
+    def test_recipe_device_without_auto_connect_still_queued(self, tmp_path: Path, device_runtime: str) -> None:
         """Рецептное устройство без auto_connect=True всё равно подключается (Р11)."""
         recipe = [
             {
@@ -224,7 +225,7 @@ class TestRecipeDevicesAutoConnect:
                 "transport": {"type": "bridge", "bridge": "robot_main"},
             }
         ]
-        plugin, ctx = _make_plugin(tmp_path, recipe_devices=recipe)
+        plugin, ctx = _make_plugin(tmp_path, recipe_devices=recipe, runtime=device_runtime)
 
         queued_ops: list[tuple[str, str]] = []
         while not plugin._conn_queue.empty():
@@ -242,9 +243,9 @@ class TestRecipeDevicesAutoConnect:
 class TestDeviceRemoveStopsWorker:
     """н2: удаление устройства останавливает+удаляет per-device воркер."""
 
-    def test_remove_stops_worker(self, tmp_path: Path) -> None:
+    def test_remove_stops_worker(self, tmp_path: Path, device_runtime: str) -> None:
         """device_remove останавливает воркер, имя освобождается."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "dev_1",
@@ -264,19 +265,19 @@ class TestDeviceRemoveStopsWorker:
         plugin._desired_connected["dev_1"] = True
 
         plugin._ensure_device_workers()
-        assert "dev_dev_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "dev_1")
 
         # Удаляем (cmd_device_remove ставит desired=False)
         result = plugin.cmd_device_remove({"device_id": "dev_1"})
         assert result["status"] == "ok"
 
         # Воркер удалён
-        assert "dev_dev_1" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "dev_1")
         assert "dev_1" not in plugin._device_workers
 
-    def test_remove_then_readd_same_id(self, tmp_path: Path) -> None:
+    def test_remove_then_readd_same_id(self, tmp_path: Path, device_runtime: str) -> None:
         """После remove того же id — upsert+connect+worker работает."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
 
         # Добавить + имитировать воркер (desired=True)
         plugin.cmd_device_upsert(
@@ -320,7 +321,7 @@ class TestDeviceRemoveStopsWorker:
 
         # Воркер создаётся снова (имя свободно)
         plugin._ensure_device_workers()
-        assert "dev_dev_1" in ctx.worker_manager.workers
+        assert is_polled(plugin, ctx, "dev_1")
 
 
 # ------------------------------------------------------------------ #
@@ -331,9 +332,9 @@ class TestDeviceRemoveStopsWorker:
 class TestDesiredStateDisconnect:
     """НР-1: desired-state — disconnect не самоотменяется."""
 
-    def test_disconnect_stays_disconnected_after_ensure_iterations(self, tmp_path: Path) -> None:
+    def test_disconnect_stays_disconnected_after_ensure_iterations(self, tmp_path: Path, device_runtime: str) -> None:
         """disconnect → 5 итераций _ensure_device_workers → воркер НЕ возвращается."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "robot_1",
@@ -364,13 +365,13 @@ class TestDesiredStateDisconnect:
             plugin._ensure_device_workers()
 
         assert "robot_1" not in plugin._device_workers
-        assert "dev_robot_1" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "robot_1")
         # desired_connected остался False
         assert plugin._desired_connected.get("robot_1") is False
 
-    def test_desired_false_stops_existing_worker(self, tmp_path: Path) -> None:
+    def test_desired_false_stops_existing_worker(self, tmp_path: Path, device_runtime: str) -> None:
         """desired=False при живом воркере -> _ensure останавливает воркер."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "dev_x",
@@ -395,7 +396,7 @@ class TestDesiredStateDisconnect:
 
         plugin._ensure_device_workers()
         assert "dev_x" not in plugin._device_workers
-        assert "dev_dev_x" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "dev_x")
 
 
 # ------------------------------------------------------------------ #
@@ -406,9 +407,9 @@ class TestDesiredStateDisconnect:
 class TestRemoveEnsureRace:
     """НР-3: remove + ensure не создаёт зомби-воркер."""
 
-    def test_remove_then_ensure_no_zombie_worker(self, tmp_path: Path) -> None:
+    def test_remove_then_ensure_no_zombie_worker(self, tmp_path: Path, device_runtime: str) -> None:
         """remove убирает desired -> ensure не создаёт воркер на удалённый драйвер."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         plugin.cmd_device_upsert(
             {
                 "id": "dev_z",
@@ -432,11 +433,11 @@ class TestRemoveEnsureRace:
         # _ensure_device_workers НЕ должен создать воркер (desired удалён)
         plugin._ensure_device_workers()
         assert "dev_z" not in plugin._device_workers
-        assert "dev_dev_z" not in ctx.worker_manager.workers
+        assert not is_polled(plugin, ctx, "dev_z")
 
-    def test_ensure_skips_missing_driver(self, tmp_path: Path) -> None:
+    def test_ensure_skips_missing_driver(self, tmp_path: Path, device_runtime: str) -> None:
         """desired=True но драйвер отсутствует в _drivers -> ensure пропускает."""
-        plugin, ctx = _make_plugin(tmp_path)
+        plugin, ctx = _make_plugin(tmp_path, runtime=device_runtime)
         # desired есть, но драйвера нет (удалён remove)
         plugin._desired_connected["phantom"] = True
 
@@ -454,8 +455,9 @@ class TestCreateWorkerFalse:
 
     def test_create_worker_false_not_recorded(self, tmp_path: Path) -> None:
         """create_worker->False: _device_workers остаётся без записи,
-        retry на следующей итерации."""
-        plugin, ctx = _make_plugin(tmp_path)
+        retry на следующей итерации. Только threads: reactor не создаёт
+        worker на устройство."""
+        plugin, ctx = _make_plugin(tmp_path, runtime="threads")
         plugin.cmd_device_upsert(
             {
                 "id": "dev_f",
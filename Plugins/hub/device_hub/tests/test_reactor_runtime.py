@@ -0,0 +1,84 @@
+"""device_runtime=reactor: один worker на все устройства, публикация тиков, disconnect."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from Plugins.hub.device_hub.plugin import DeviceHubPlugin
+
+from .conftest import make_ctx
+
+
+class _Driver:
+    """Минимальный блокирующий драйвер для reactor-режима."""
+
+    def __init__(self) -> None:
+        self.entry = MagicMock(params={"poll_interval_s": 0.02})
+        self.is_connected = True
+        self.desired_connected = True
+        self.stats = {"tx_ok": 0}
+        self.ticks = 0
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+    def tick(self, stop_event: Any = None) -> dict:
+        self.ticks += 1
+        return {"quality": "good"}
+
+
+def _start(tmp_path: Path) -> tuple[DeviceHubPlugin, MagicMock]:
+    registry = tmp_path / "devices.yaml"
+    ctx = make_ctx({"device_runtime": "reactor"}, tmp_registry=registry)
+    plugin = DeviceHubPlugin()
+    plugin.configure(ctx)
+    plugin.start(ctx)
+    plugin.cmd_device_upsert({"id": "plc_1", "name": "PLC", "kind": "generic_modbus", "transport": {"type": "tcp"}})
+    with patch("Services.device_hub.manager.DeviceManager.connect", return_value=True):
+        plugin.cmd_device_connect({"device_id": "plc_1"})
+        plugin._process_conn_queue()
+    return plugin, ctx
+
+
+def test_single_reactor_worker_instead_of_thread_per_device(tmp_path: Path) -> None:
+    plugin, ctx = _start(tmp_path)
+    driver = _Driver()
+    plugin._manager._drivers["plc_1"] = driver
+    plugin._ensure_device_workers()
+
+    assert "device_reactor" in ctx.worker_manager.workers
+    assert not [name for name in ctx.worker_manager.workers if name.startswith("dev_")]
+    assert plugin._device_workers == {"plc_1": "reactor:plc_1"}
+
+    stop = threading.Event()
+    worker = threading.Thread(target=ctx.worker_manager.workers["device_reactor"]["fn"], args=(stop, threading.Event()))
+    worker.start()
+    try:
+        time.sleep(0.15)
+    finally:
+        stop.set()
+        worker.join(timeout=3.0)
+    assert driver.ticks >= 3
+    conn_calls = [c for c in ctx.state_proxy.set.call_args_list if c.args[0] == "devices.state.plc_1.conn"]
+    assert conn_calls[-1].args[1]["conn"] == "connected"
+
+
+def test_disconnect_removes_device_from_reactor(tmp_path: Path) -> None:
+    plugin, ctx = _start(tmp_path)
+    driver = _Driver()
+    plugin._manager._drivers["plc_1"] = driver
+    plugin._ensure_device_workers()
+    assert "plc_1" in plugin._reactor
+    plugin._on_reactor_tick("plc_1", driver, {"quality": "good"})
+    assert plugin._tick_seq == {"plc_1": 1}
+
+    plugin.cmd_device_disconnect({"device_id": "plc_1"})
+    assert plugin._supervisor_wake.is_set()  # supervisor разбужен сразу
+    plugin._process_conn_queue()
+    assert "plc_1" not in plugin._reactor
+    assert "plc_1" not in plugin._device_workers
+    assert plugin._tick_seq == {}
@@ -0,0 +1,179 @@
+"""Бенчмарк circle_detector: search_mode full vs tracked (латентность и точность).
+
+Гоняет один и тот же поток кадров через два экземпляра плагина — ``full`` (Хаф по
+всему кадру) и ``tracked`` (пирамида + ROI-трекинг) — и сравнивает:
+
+* латентность ``process()`` на кадр (mean / p95);
+* точность: доля эталонных кругов, найденных режимом (центр ближе ``--tol`` px),
+  средние ошибки центра и радиуса, лишние круги. Эталон синтетики — истинные
+  круги (оцениваются оба режима); у записи истины нет — эталоном служит full;
+* статистику tracked: полные проходы vs ROI-проходы.
+
+Кадры — из записи ``frame_record`` (``--record``, тот же формат, что у
+frame_replay) или синтетические (движущиеся круги на шумном фоне).
+
+Запуск::
+
+    python -m Plugins.processing.circle_detector.benchmark --record data/rec/line1.frec
+    python -m Plugins.processing.circle_detector.benchmark --frames 120 --size 3840x2160
+    python -m Plugins.processing.circle_detector.benchmark --set param2=25 --set coarse_levels=2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from multiprocess_framework.modules.process_module.plugins import PluginContext
+from Plugins.processing.circle_detector.plugin import CircleDetectorPlugin
+
+_DEFAULTS: Dict[str, Any] = {"min_dist": 100, "min_radius": 30, "max_radius": 150, "draw_circles": False}
+
+
+def _ctx(config: Dict[str, Any]) -> PluginContext:
+    """PluginContext для запуска плагина вне процесса (локальный register, без IPC)."""
+    noop = lambda *a, **k: None  # noqa: E731
+    return PluginContext(SimpleNamespace(name="bench", log_info=noop, log_error=noop), config=config)
+
+
+Frame = Tuple[np.ndarray, Optional[List[dict]]]
+
+
+def synthetic_frames(count: int, width: int, height: int, circles: int = 6, seed: int = 0) -> Iterator[Frame]:
+    """(кадр, истинные круги): круги разного радиуса плывут по шумному фону, не перекрываясь."""
+    rng = np.random.default_rng(seed)
+    # Круг на свою полосу по X — пересечений нет, как у бутылок на конвейере.
+    lane = width / circles
+    radius = rng.integers(max(20, height // 30), max(30, min(lane / 3, height / 8)), circles)
+    pos = np.column_stack([(np.arange(circles) + 0.5) * lane, rng.uniform(radius, height - radius)])
+    vel = np.column_stack([rng.uniform(-1, 1, circles), rng.uniform(2, 6, circles)])
+    for _ in range(count):
+        frame = np.full((height, width, 3), 40, np.uint8)
+        frame += rng.integers(0, 24, frame.shape, dtype=np.uint8)
+        truth = []
+        for (x, y), r in zip(pos, radius):
+            cv2.circle(frame, (int(round(x)), int(round(y))), int(r), (220, 220, 220), -1)
+            truth.append({"center": [int(round(x)), int(round(y))], "radius": int(r)})
+        yield frame, truth
+        pos += vel
+        # Ушёл за нижний край — въезжает сверху (новый круг для re-acquire).
+        wrapped = pos[:, 1] > height + radius
+        pos[wrapped, 1] = -radius[wrapped]
+
+
+def recorded_frames(path: str, limit: int, camera: Optional[str]) -> Iterator[Frame]:
+    """(кадр, None) из записи frame_record (опционально одной камеры)."""
+    from multiprocess_framework.modules.process_module.generic.frame_record import FrameRecordReader
+
+    with FrameRecordReader(path) as reader:
+        for i, (_meta, frame, _t) in enumerate(reader.iter_frames([camera] if camera else None)):
+            if limit and i >= limit:
+                break
+            yield frame, None
+
+
+def _match(reference: List[dict], found: List[dict], tol: float) -> tuple:
+    """(совпало, сумма ошибок центра, сумма ошибок радиуса, лишних) ``found`` против эталона."""
+    hits, center_err, radius_err = 0, 0.0, 0.0
+    free = list(found)
+    for ref in reference:
+        best = min(free, key=lambda d: math.dist(d["center"], ref["center"]), default=None)
+        if best is None or math.dist(best["center"], ref["center"]) > tol:
+            continue
+        free.remove(best)
+        hits += 1
+        center_err += math.dist(best["center"], ref["center"])
+        radius_err += abs(best["radius"] - ref["radius"])
+    return hits, center_err, radius_err, len(free)
+
+
+def run(frames: Iterator[Frame], config: Dict[str, Any], tol: float) -> Dict[str, Any]:
+    """Прогнать кадры через full и tracked; вернуть латентности, точность и статистику."""
+    plugins = {mode: CircleDetectorPlugin() for mode in ("full", "tracked")}
+    for mode, plugin in plugins.items():
+        plugin.configure(_ctx({**config, "search_mode": mode}))
+    lat: Dict[str, List[float]] = {mode: [] for mode in plugins}
+    acc = {mode: {"reference": 0, "hits": 0, "center_err": 0.0, "radius_err": 0.0, "extra": 0} for mode in plugins}
+    reference_name = "truth"
+    for frame, truth in frames:
+        item = {"frame": frame, "camera_id": "bench"}
+        outs = {}
+        for mode, plugin in plugins.items():
+            t0 = time.perf_counter()
+            outs[mode] = plugin.process([item])[0]["detections"]
+            lat[mode].append((time.perf_counter() - t0) * 1000.0)
+        if truth is None:
+            reference_name, truth = "full", outs["full"]
+        for mode in plugins if reference_name == "truth" else ("tracked",):
+            hits, c_err, r_err, extra = _match(truth, outs[mode], tol)
+            totals = acc[mode]
+            totals["reference"] += len(truth)
+            totals["hits"] += hits
+            totals["center_err"] += c_err
+            totals["radius_err"] += r_err
+            totals["extra"] += extra
+    return {
+        "latency_ms": lat,
+        "reference": reference_name,
+        "accuracy": {mode: totals for mode, totals in acc.items() if totals["reference"]},
+        "stats": plugins["tracked"].get_search_stats({}),
+    }
+
+
+def _parse_set(values: List[str]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for item in values:
+        key, _, raw = item.partition("=")
+        try:
+            out[key] = json.loads(raw)
+        except ValueError:  # no-health: не JSON — строковое значение поля
+            out[key] = raw
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", help="файл записи frame_record; без него — синтетика")
+    parser.add_argument("--camera", help="camera_id из записи (по умолчанию все кадры подряд)")
+    parser.add_argument("--frames", type=int, default=60, help="сколько кадров (0 = вся запись)")
+    parser.add_argument("--size", default="2048x1536", help="размер синтетического кадра WxH")
+    parser.add_argument("--tol", type=float, default=5.0, help="допуск совпадения центров, px")
+    parser.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE", help="поле register")
+    args = parser.parse_args(argv)
+
+    config = {**_DEFAULTS, **_parse_set(args.set)}
+    if args.record:
+        frames = recorded_frames(args.record, args.frames, args.camera)
+    else:
+        width, _, height = args.size.partition("x")
+        frames = synthetic_frames(args.frames or 60, int(width), int(height))
+    result = run(frames, config, args.tol)
+
+    print(f"reference: {result['reference']}, tol {args.tol:g}px")
+    print(f"{'mode':<9}{'mean ms':>10}{'p95 ms':>10}{'recall':>9}{'extra':>7}{'ctr err':>9}{'r err':>7}")
+    for mode, values in result["latency_ms"].items():
+        if not values:
+            continue
+        row = f"{mode:<9}{np.mean(values):>10.2f}{np.percentile(values, 95):>10.2f}"
+        acc = result["accuracy"].get(mode)
+        if acc:
+            hits = max(1, acc["hits"])
+            row += (
+                f"{100.0 * acc['hits'] / acc['reference']:>8.1f}%{acc['extra']:>7}"
+                f"{acc['center_err'] / hits:>9.2f}{acc['radius_err'] / hits:>7.2f}"
+            )
+        print(row)
+    stats = result["stats"]
+    print(f"tracked: frames={stats['frames']} full_passes={stats['full_passes']} roi_passes={stats['roi_passes']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,12 +7,17 @@ Processing-плагин: process(items) → items с найденными окр
 список детекций вида {"center": [x, y], "radius": r} и опционально рисует
 окружности на кадре.
 
+search_mode=tracked — coarse-to-fine поиск (tracking.py): Хаф на уровне пирамиды
++ уточнение в ROI, далее только окна вокруг предсказанных позиций; выход тот же.
+
 V3_MY_PURE: plugin самодостаточен — создаёт локальный register
 если RegistersManager недоступен. Все параметры ВСЕГДА через self._reg.
 """
 
 from __future__ import annotations
 
+import time
+
 import cv2
 import numpy as np
 
@@ -25,6 +30,10 @@ from multiprocess_framework.modules.process_module.plugins import Port
 from multiprocess_framework.modules.process_module.plugins import register_plugin
 
 from .registers import CircleDetectorRegisters
+from .tracking import Circle, CircleTracker
+
+# Период сброса статистики поиска в readonly-поля register (не на каждый кадр).
+_STATS_PERIOD_SEC = 1.0
 
 
 @register_plugin(
@@ -56,6 +65,8 @@ class CircleDetectorPlugin(ProcessModulePlugin):
         "set_mode": "set_mode",
         "set_radius_range": "set_radius_range",
         "toggle_draw_circles": "toggle_draw_circles",
+        "set_search_params": "set_search_params",
+        "get_search_stats": "get_search_stats",
     }
 
     register_class = CircleDetectorRegisters
@@ -64,12 +75,16 @@ class CircleDetectorPlugin(ProcessModulePlugin):
         """Настройка: register managed (GUI) или локальный (defaults)."""
         self._ctx = ctx
         self._reg = self._init_register(ctx)
+        # Трекер на камеру: в одном процессе детектор может обслуживать несколько потоков.
+        self._trackers: dict = {}
+        self._stats_at = time.monotonic()
 
         ctx.log_info(
             f"CircleDetectorPlugin: mode={self._reg.mode}, blur={self._reg.blur_method}"
             f"({self._reg.blur_ksize}), dp={self._reg.dp}, min_dist={self._reg.min_dist}, "
             f"param1={self._reg.param1}, param2={self._reg.param2}, "
-            f"radius=[{self._reg.min_radius}, {self._reg.max_radius}], draw={self._reg.draw_circles}"
+            f"radius=[{self._reg.min_radius}, {self._reg.max_radius}], draw={self._reg.draw_circles}, "
+            f"search={self._reg.search_mode}"
         )
 
     # --- Обработка ---
@@ -86,12 +101,12 @@ class CircleDetectorPlugin(ProcessModulePlugin):
         if src is None:
             return None
 
-        gray = self._to_gray(src)
-        gray = self._apply_blur(gray)
-
-        method, args = self._safe_hough_args()
         try:
-            circles = cv2.HoughCircles(gray, method, **args)
+            if self._reg.search_mode == "tracked":
+                circles = self._detect_tracked(src, item.get("camera_id"))
+            else:
+                self._trackers.clear()
+                circles = self._hough(src)
         except Exception as exc:
             # HoughCircles на вырожденном содержимом (полностью белый/чёрный кадр,
             # degenerate-аккумулятор) кидает НЕ только cv2.error, но и generic C++
@@ -99,14 +114,13 @@ class CircleDetectorPlugin(ProcessModulePlugin):
             # необработанное исключение уходит в PipelineExecutor → circuit breaker
             # (5 подряд → детекция стоит 60с). Плагин самодостаточен: вернуть [] детекций.
             self._ctx.health.report_error(exc, context="circle_detector.hough", throttle=30.0)
-            self._ctx.log_error(f"CircleDetectorPlugin: HoughCircles failed ({args}): {exc}")
+            self._ctx.log_error(f"CircleDetectorPlugin: HoughCircles failed ({self._safe_hough_args()[1]}): {exc}")
+            tracker = self._trackers.get(item.get("camera_id"))
+            if tracker is not None:
+                tracker.reset()
             return self._finish(item, [])
 
-        detections: list[dict] = []
-        if circles is not None:
-            # HoughCircles → ndarray формы (1, N, 3): [x, y, r]
-            for x, y, r in np.around(circles[0]).astype(int):
-                detections.append({"center": [int(x), int(y)], "radius": int(r)})
+        detections = [{"center": [int(round(x)), int(round(y))], "radius": int(round(r))} for x, y, r in circles]
 
         # Рисуем только на 3-канальном кадре (на бинарной маске цветной круг бессмыслен).
         # На КОПИИ, не на src: src может быть SHM-буфером / общим кадром для других веток
@@ -129,6 +143,67 @@ class CircleDetectorPlugin(ProcessModulePlugin):
             out.pop(self._reg.input_key, None)
         return out
 
+    # --- Поиск ---
+
+    def _hough(self, img: np.ndarray, scale: float = 1.0, **overrides: float) -> list[Circle]:
+        """gray → blur → HoughCircles по ``img``: ``[(x, y, r), ...]`` в координатах img.
+
+        ``overrides`` — kwargs HoughCircles поверх register (окна трекинга сужают
+        радиусы и minDist). ``scale`` > 1 — img уменьшен (уровень пирамиды): ядро
+        сглаживания и порог голосов gradient (∝ длине окружности) делятся на scale.
+        """
+        gray = self._apply_blur(self._to_gray(img), scale)
+        method, args = self._safe_hough_args()
+        args.update(overrides)
+        if scale > 1.0 and method == cv2.HOUGH_GRADIENT:
+            args["param2"] = max(1.0, args["param2"] / scale)
+        circles = cv2.HoughCircles(gray, method, **args)
+        if circles is None:
+            return []
+        # HoughCircles → ndarray формы (1, N, 3): [x, y, r], по убыванию голосов
+        return [(float(x), float(y), float(r)) for x, y, r in circles[0]]
+
+    def _detect_tracked(self, src: np.ndarray, camera_id: object) -> list[Circle]:
+        """search_mode=tracked: coarse-to-fine поиск с трекингом по окнам (на камеру)."""
+        tracker = self._trackers.get(camera_id)
+        if tracker is None:
+            tracker = self._trackers[camera_id] = CircleTracker()
+        _method, args = self._safe_hough_args()
+        reg = self._reg
+        circles = tracker.detect(
+            src,
+            lambda img, min_r, max_r, min_dist, scale: self._hough(
+                img, scale, minRadius=min_r, maxRadius=max_r, minDist=min_dist
+            ),
+            levels=int(reg.coarse_levels),
+            margin=float(reg.roi_margin),
+            reacquire_every=int(reg.reacquire_every),
+            max_missed=int(reg.max_missed),
+            min_radius=args["minRadius"],
+            max_radius=args["maxRadius"],
+            min_dist=args["minDist"],
+        )
+        now = time.monotonic()
+        if now - self._stats_at >= _STATS_PERIOD_SEC:
+            self._stats_at = now
+            self._publish_search_stats()
+        return circles
+
+    def _search_stats(self) -> dict:
+        """Сумма статистики трекеров всех камер."""
+        total = {"frames": 0, "full_passes": 0, "roi_passes": 0, "tracks": 0}
+        for tracker in self._trackers.values():
+            for key in total:
+                total[key] += tracker.stats[key]
+        return total
+
+    def _publish_search_stats(self) -> None:
+        """Статистика поиска → readonly-поля register (видны в GUI)."""
+        stats = self._search_stats()
+        self._reg.full_passes = stats["full_passes"]
+        self._reg.roi_passes = stats["roi_passes"]
+        self._reg.tracked_circles = stats["tracks"]
+
     # --- Вспомогательные ---
 
     @staticmethod
@@ -140,12 +215,15 @@ class CircleDetectorPlugin(ProcessModulePlugin):
             return frame[:, :, 0]
         return frame
 
-    def _apply_blur(self, gray: np.ndarray) -> np.ndarray:
-        """Сглаживание по выбранному методу. Ядро приводится к нечётному ≥ 1."""
+    def _apply_blur(self, gray: np.ndarray, scale: float = 1.0) -> np.ndarray:
+        """Сглаживание по выбранному методу. Ядро приводится к нечётному ≥ 1.
+
+        ``scale`` > 1 — кадр уменьшен: ядро уменьшается так же (та же сила в px исходника).
+        """
         method = self._reg.blur_method
         if method == "none":
             return gray
-        k = int(self._reg.blur_ksize)
+        k = int(int(self._reg.blur_ksize) / scale)
         if k < 1:
             k = 1
         if k % 2 == 0:
@@ -273,3 +351,23 @@ class CircleDetectorPlugin(ProcessModulePlugin):
         """Переключить отрисовку окружностей."""
         self._reg.draw_circles = not self._reg.draw_circles
         return {"status": "ok", "draw_circles": self._reg.draw_circles}
+
+    def set_search_params(self, data: dict) -> dict:
+        """Переключить стратегию поиска (full/tracked) и параметры трекинга."""
+        rejected = self._apply_fields(
+            data, ("search_mode", "coarse_levels", "roi_margin", "reacquire_every", "max_missed")
+        )
+        self._trackers.clear()
+        return {
+            "status": "ok" if not rejected else "partial",
+            "rejected": rejected,
+            "search_mode": self._reg.search_mode,
+            "coarse_levels": self._reg.coarse_levels,
+            "roi_margin": self._reg.roi_margin,
+            "reacquire_every": self._reg.reacquire_every,
+            "max_missed": self._reg.max_missed,
+        }
+
+    def get_search_stats(self, data: dict) -> dict:
+        """Статистика tracked-поиска: кадры, полные проходы, ROI-проходы, живые треки."""
+        return {"status": "ok", "search_mode": self._reg.search_mode, **self._search_stats()}
@@ -28,6 +28,13 @@ DetectMode = Literal["gradient", "gradient_alt"]
 #   none     — без сглаживания (для уже чистых кадров)
 BlurMethod = Literal["median", "gaussian", "none"]
 
+# Стратегия поиска по кадру:
+#   full    — HoughCircles по всему кадру на каждом кадре (точно, дорого на 4K)
+#   tracked — coarse-to-fine: Хаф на уменьшенном уровне пирамиды + уточнение в ROI
+#             полного разрешения, далее только ROI вокруг предсказанных позиций
+#             и периодический полный re-acquire (tracking.py)
+SearchMode = Literal["full", "tracked"]
+
 
 @register_schema("CircleDetectorRegistersV1")
 class CircleDetectorRegisters(SchemaBase):
@@ -147,6 +154,59 @@ class CircleDetectorRegisters(SchemaBase):
         ),
     ] = 0
 
+    # --- Coarse-to-fine / ROI-трекинг (search_mode=tracked) ---
+    search_mode: Annotated[
+        SearchMode,
+        FieldMeta(
+            "Search Mode",
+            info=(
+                "full — Хаф по всему кадру каждый кадр; tracked — пирамида + уточнение в ROI, "
+                "далее только окна вокруг предсказанных позиций (периодический полный re-acquire)"
+            ),
+            widget="combo",
+        ),
+    ] = "full"
+    coarse_levels: Annotated[
+        int,
+        FieldMeta(
+            "Coarse Levels",
+            info="Уровень пирамиды для полного прохода: кадр уменьшается в 2^N раз по оси (0 = без пирамиды)",
+            min=0,
+            max=3,
+        ),
+    ] = 1
+    roi_margin: Annotated[
+        float,
+        FieldMeta(
+            "ROI Margin",
+            info="Запас окна поиска вокруг предсказанной позиции в долях радиуса",
+            min=0.05,
+            max=3.0,
+            transfer_k=100.0,
+            round_k=2,
+        ),
+    ] = 0.5
+    reacquire_every: Annotated[
+        int,
+        FieldMeta(
+            "Re-acquire Every",
+            info="Полный проход каждые N кадров (новые круги в кадре); при потере всех треков — сразу",
+            min=1,
+            max=1000,
+            unit="frames",
+        ),
+    ] = 30
+    max_missed: Annotated[
+        int,
+        FieldMeta(
+            "Max Missed",
+            info="Сколько кадров подряд трек может не найтись в своём окне, прежде чем его сбросить",
+            min=0,
+            max=30,
+            unit="frames",
+        ),
+    ] = 2
+
     # --- Отрисовка ---
     draw_circles: Annotated[
         bool,
@@ -179,3 +239,8 @@ class CircleDetectorRegisters(SchemaBase):
             info="Отмечать центр найденной окружности точкой",
         ),
     ] = True
+
+    # --- Статистика поиска (readonly) ---
+    full_passes: Annotated[int, FieldMeta("Полных проходов", readonly=True)] = 0
+    roi_passes: Annotated[int, FieldMeta("ROI-проходов", readonly=True)] = 0
+    tracked_circles: Annotated[int, FieldMeta("Треков", readonly=True)] = 0
@@ -381,3 +381,64 @@ class TestInputKey:
         color = np.zeros((200, 200, 3), dtype=np.uint8)
         result = plugin.process([{"frame": color, "mask": self._mask_with_circle()}])
         assert "mask" in result[0]  # не дропнута
+
+
+class TestTrackedSearch:
+    """search_mode=tracked: пирамида + ROI-уточнение, трекинг по окнам, re-acquire."""
+
+    _CFG = {"param2": 25, "min_dist": 50, "min_radius": 20, "max_radius": 60, "draw_circles": False}
+
+    @staticmethod
+    def _scene(cx: int, cy: int = 200, r: int = 40) -> np.ndarray:
+        return _frame_with_circle(h=400, w=640, cx=cx, cy=cy, r=r)
+
+    def _plugin(self, **overrides) -> CircleDetectorPlugin:
+        plugin = CircleDetectorPlugin()
+        plugin.configure(_make_mock_ctx({**self._CFG, "search_mode": "tracked", **overrides}))
+        return plugin
+
+    def test_follows_moving_circle_with_roi_passes(self):
+        """Первый кадр — полный проход, дальше круг находится только ROI-проходами."""
+        plugin = self._plugin()
+        for step in range(6):
+            cx = 200 + 8 * step
+            (det,) = plugin.process([{"frame": self._scene(cx)}])[0]["detections"]
+            assert abs(det["center"][0] - cx) <= 3 and abs(det["center"][1] - 200) <= 3
+            assert abs(det["radius"] - 40) <= 4
+            assert isinstance(det["radius"], int)
+        stats = plugin.get_search_stats({})
+        assert stats["frames"] == 6 and stats["full_passes"] == 1
+        assert stats["roi_passes"] == 6  # уточнение на acquire + по окну на каждом следующем кадре
+
+    def test_reacquire_period_and_lost_track(self):
+        """Полный проход каждые reacquire_every кадров и сразу после потери всех треков."""
+        plugin = self._plugin(reacquire_every=3, max_missed=0)
+        for _ in range(4):
+            plugin.process([{"frame": self._scene(300)}])
+        assert plugin.get_search_stats({})["full_passes"] == 2
+
+        blank = np.zeros((400, 640, 3), dtype=np.uint8)
+        assert plugin.process([{"frame": blank}])[0]["detections"] == []  # трек потерян
+        plugin.process([{"frame": self._scene(300)}])
+        assert plugin.get_search_stats({})["full_passes"] == 3
+
+    def test_trackers_are_per_camera_and_stats_reach_register(self, monkeypatch):
+        from Plugins.processing.circle_detector import plugin as plugin_module
+
+        monkeypatch.setattr(plugin_module, "_STATS_PERIOD_SEC", 0.0)
+        plugin = self._plugin()
+        plugin.process([{"frame": self._scene(200), "camera_id": 0}, {"frame": self._scene(400), "camera_id": 1}])
+        out = plugin.process([{"frame": self._scene(204), "camera_id": 0}, {"frame": self._scene(404), "camera_id": 1}])
+        assert [abs(o["detections"][0]["center"][0] - cx) <= 3 for o, cx in zip(out, (204, 404))] == [True, True]
+        assert set(plugin._trackers) == {0, 1}
+        assert plugin._reg.full_passes == 2 and plugin._reg.tracked_circles == 2
+        assert plugin._reg.roi_passes == plugin.get_search_stats({})["roi_passes"]
+
+    def test_cmd_set_search_params_resets_tracks(self):
+        plugin = self._plugin()
+        plugin.process([{"frame": self._scene(300)}])
+        resp = plugin.set_search_params({"search_mode": "full", "coarse_levels": 9, "reacquire_every": 10})
+        assert resp["status"] == "partial" and resp["rejected"] == ["coarse_levels"]
+        assert plugin._reg.search_mode == "full" and plugin._reg.reacquire_every == 10
+        assert plugin._trackers == {}
+        assert len(plugin.process([{"frame": self._scene(300)}])[0]["detections"]) == 1
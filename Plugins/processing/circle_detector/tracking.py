@@ -0,0 +1,200 @@
+"""Coarse-to-fine поиск окружностей с ROI-трекингом между кадрами.
+
+Полный Хаф по кадру 4K — десятки мс: аккумулятор и Canny по всем пикселям, хотя
+круги (бутылки на конвейере) занимают доли процента кадра и между соседними
+кадрами смещаются на единицы пикселей. Здесь:
+
+- **полный проход** (acquire) — Хаф на уменьшенном уровне пирамиды (в 2^L раз
+  по каждой оси → в 4^L меньше работы), затем уточнение каждого кандидата
+  Хафом в маленьком ROI полного разрешения (точность как у полного Хафа);
+- **трекинг** — на следующих кадрах Хаф только в ROI вокруг предсказанной
+  позиции (последняя + скорость), без прохода по всему кадру;
+- **re-acquire** — полный проход каждые ``reacquire_every`` кадров (новые круги
+  в кадре) и сразу, если все треки потеряны.
+
+Модуль не знает про register/плагин: сам Хаф (gray → blur → HoughCircles с
+клампингом параметров) передаётся колбэком ``find`` — тот же, что у полного режима.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Circle = Tuple[float, float, float]
+
+# find(img, min_r, max_r, min_dist, scale) → [(x, y, r), ...] в координатах img.
+# scale — во сколько раз img меньше исходника (для пересчёта порога голосов).
+FindFn = Callable[[np.ndarray, int, int, float, float], List[Circle]]
+
+# Допуск радиуса при уточнении: ±25% от оценки (плюс шаг уровня пирамиды).
+_RADIUS_SLACK = 0.25
+
+
+@dataclass
+class _Track:
+    x: float
+    y: float
+    r: float
+    vx: float = 0.0
+    vy: float = 0.0
+    missed: int = 0
+
+
+class CircleTracker:
+    """Состояние coarse-to-fine поиска одного потока кадров (одной камеры).
+
+    Статистика ``stats``: ``frames``, ``full_passes`` (Хаф по всему кадру/уровню
+    пирамиды), ``roi_passes`` (Хаф в ROI), ``tracks`` (живые треки сейчас).
+    """
+
+    def __init__(self) -> None:
+        self._tracks: List[_Track] = []
+        self._since_full = 0
+        self.stats: Dict[str, int] = {"frames": 0, "full_passes": 0, "roi_passes": 0, "tracks": 0}
+
+    def reset(self) -> None:
+        """Сбросить треки — следующий кадр пойдёт полным проходом."""
+        self._tracks = []
+        self._since_full = 0
+
+    def detect(
+        self,
+        src: np.ndarray,
+        find: FindFn,
+        *,
+        levels: int,
+        margin: float,
+        reacquire_every: int,
+        max_missed: int,
+        min_radius: int,
+        max_radius: int,
+        min_dist: float,
+    ) -> List[Circle]:
+        """Окружности кадра ``src`` (координаты полного разрешения)."""
+        self.stats["frames"] += 1
+        limits = (min_radius, max_radius)
+        if not self._tracks or self._since_full >= max(1, reacquire_every):
+            found = self._acquire(src, find, levels, margin, limits, min_dist)
+        else:
+            found = self._follow(src, find, margin, max_missed, limits, min_dist)
+        self.stats["tracks"] = len(self._tracks)
+        return found
+
+    # --- Проходы ---
+
+    def _acquire(
+        self,
+        src: np.ndarray,
+        find: FindFn,
+        levels: int,
+        margin: float,
+        limits: Tuple[int, int],
+        min_dist: float,
+    ) -> List[Circle]:
+        """Полный проход: Хаф на уровне пирамиды → уточнение кандидатов в ROI."""
+        self.stats["full_passes"] += 1
+        self._since_full = 1
+        scale = float(2 ** max(0, levels))
+        h, w = src.shape[:2]
+        small_w, small_h = int(w // scale), int(h // scale)
+        min_r, max_r = limits
+
+        if scale == 1.0 or min(small_w, small_h) < 8:
+            # Без пирамиды полный Хаф уже в полном разрешении — уточнять нечего.
+            found = find(src, min_r, max_r, min_dist, 1.0)
+            self._tracks = [_Track(x, y, r) for x, y, r in found]
+            return found
+
+        small = cv2.resize(src, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        coarse = find(
+            small,
+            int(min_r // scale),
+            int(math.ceil(max_r / scale)) if max_r > 0 else 0,
+            max(1.0, min_dist / scale),
+            scale,
+        )
+        tracks: List[_Track] = []
+        for cx, cy, cr in coarse:
+            hit = self._refine(src, find, cx * scale, cy * scale, cr * scale, margin * cr * scale, scale, limits)
+            if hit is not None:
+                tracks.append(_Track(*hit))
+        self._tracks = _dedupe(tracks, min_dist)
+        return [(t.x, t.y, t.r) for t in self._tracks]
+
+    def _follow(
+        self,
+        src: np.ndarray,
+        find: FindFn,
+        margin: float,
+        max_missed: int,
+        limits: Tuple[int, int],
+        min_dist: float,
+    ) -> List[Circle]:
+        """Трекинг: Хаф только в ROI вокруг предсказанной позиции каждого трека."""
+        self._since_full += 1
+        alive: List[_Track] = []
+        for track in self._tracks:
+            # x, y — последняя подтверждённая позиция; за пропуски трек «уехал» дальше.
+            steps = track.missed + 1
+            px, py = track.x + track.vx * steps, track.y + track.vy * steps
+            # Окно растёт с пропусками: трек мог уйти дальше предсказания.
+            slack = margin * track.r * steps + math.hypot(track.vx, track.vy) * 0.5
+            hit = self._refine(src, find, px, py, track.r, slack, 1.0, limits)
+            if hit is None:
+                track.missed += 1
+                if track.missed <= max_missed:
+                    alive.append(track)
+                continue
+            x, y, r = hit
+            track.vx, track.vy = (x - track.x) / steps, (y - track.y) / steps
+            track.x, track.y, track.r, track.missed = x, y, r, 0
+            alive.append(track)
+        self._tracks = _dedupe(alive, min_dist)
+        return [(t.x, t.y, t.r) for t in self._tracks if t.missed == 0]
+
+    def _refine(
+        self,
+        src: np.ndarray,
+        find: FindFn,
+        x: float,
+        y: float,
+        r: float,
+        slack: float,
+        scale: float,
+        limits: Tuple[int, int],
+    ) -> Optional[Circle]:
+        """Хаф в ROI полного разрешения вокруг (x, y): сильнейший круг окна или None."""
+        min_r, max_r = limits
+        r_lo = max(min_r, int(r * (1 - _RADIUS_SLACK) - scale))
+        r_hi = int(math.ceil(r * (1 + _RADIUS_SLACK) + scale))
+        if max_r > 0:
+            r_hi = min(r_hi, max_r)
+        if r_hi <= r_lo:
+            return None
+        reach = r_hi + max(slack, 2.0 * scale) + 2
+        h, w = src.shape[:2]
+        x0, y0 = max(0, int(x - reach)), max(0, int(y - reach))
+        x1, y1 = min(w, int(math.ceil(x + reach)) + 1), min(h, int(math.ceil(y + reach)) + 1)
+        if x1 - x0 < 8 or y1 - y0 < 8:
+            return None
+        self.stats["roi_passes"] += 1
+        # minDist = размер окна → Хаф отдаёт один, самый сильный круг окна.
+        found = find(src[y0:y1, x0:x1], r_lo, r_hi, float(max(x1 - x0, y1 - y0)), 1.0)
+        if not found:
+            return None
+        fx, fy, fr = found[0]
+        return fx + x0, fy + y0, fr
+
+
+def _dedupe(tracks: List[_Track], min_dist: float) -> List[_Track]:
+    """Слить треки, сошедшиеся на одном круге (центры ближе ``min_dist``)."""
+    kept: List[_Track] = []
+    for track in sorted(tracks, key=lambda t: t.missed):
+        if all(math.hypot(track.x - k.x, track.y - k.y) >= min_dist for k in kept):
+            kept.append(track)
+    return kept
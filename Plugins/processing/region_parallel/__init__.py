@@ -0,0 +1 @@
+"""RegionParallelPlugin — регионы кадра параллельно в одном процессе + склейка."""
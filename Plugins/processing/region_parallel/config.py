@@ -0,0 +1,28 @@
+"""Конфиг RegionParallelPlugin — identity + register_bindings.
+
+V3_MY_PURE: все параметры живут в registers.py.
+Config содержит только identity для discovery и привязку к register-классам.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from multiprocess_framework.modules.process_module.plugins import register_schema
+from multiprocess_framework.modules.process_module.plugins import SchemaBase
+from multiprocess_framework.modules.process_module.plugins import PluginConfig
+
+from .registers import RegionParallelRegisters
+
+
+@register_schema("RegionParallelPluginConfigV1")
+class RegionParallelConfig(PluginConfig):
+    """Конфиг плагина параллельных регионов — identity + register binding.
+
+    Все параметры (регионы, шаги, пул, склейка) — в RegionParallelRegisters.
+    """
+
+    plugin_class: str = "Plugins.processing.region_parallel.plugin.RegionParallelPlugin"
+
+    # Привязка к register-классам
+    register_bindings: ClassVar[list[type[SchemaBase]]] = [RegionParallelRegisters]
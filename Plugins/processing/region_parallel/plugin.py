@@ -0,0 +1,276 @@
+"""RegionParallelPlugin -- регионы кадра параллельно в одном процессе + склейка.
+
+Processing-плагин (1:1): заменяет связку ``region_split → обработка → stitcher``,
+когда регионы не нужно разносить по процессам. Вместо N копий-кропов, N пересылок
+через SHM и fan-in буфера InspectorManager:
+
+    кадр → [регион_0: шаг1 → шаг2 ...]   ┐
+         → [регион_1: шаг1 → шаг2 ...]   ├ ChainThreadPool (RegionParallelRunnable)
+         → [default:  шаг1 → шаг2 ...]   ┘
+         → склейка выходов на место в canvas → кадр
+
+Каждый регион получает read-only срез-view кадра (без копии) и СВОИ экземпляры
+sub-плагинов (состояние трекеров/счётчиков не делится между регионами).
+Порядок наложения — как у stitcher: default (фон) первым, регионы поверх.
+
+frame_trace: ветвь каждого региона несёт свой trace (fork_trace), на выходе —
+critical-path trace + ``trace_branches`` (как у stitcher), в каждой ветви
+дополнительно ``region_ms`` — чистое время цепочки региона в пуле.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+
+from multiprocess_framework.modules.chain_module import (
+    ChainResult,
+    ChainRunnable,
+    ChainThreadPool,
+    RegionBranch,
+    RegionParallelRunnable,
+    RunnableStep,
+)
+from multiprocess_framework.modules.process_module.generic import frame_trace
+from multiprocess_framework.modules.process_module.generic.plugin_operation_step import PipelineStepNode
+from multiprocess_framework.modules.process_module.plugins import (
+    PluginContext,
+    ProcessModulePlugin,
+    SubPluginContext,
+    for_each,
+)
+from multiprocess_framework.modules.process_module.plugins import Port
+from multiprocess_framework.modules.process_module.plugins import register_plugin
+
+from .registers import RegionParallelRegisters
+
+logger = logging.getLogger(__name__)
+
+# Прямоугольник default-региона: клампится к кадру → весь кадр любого размера.
+_FULL_FRAME = (0, 0, 1 << 30, 1 << 30)
+
+
+class _PluginStep:
+    """``IExecutionStep``: один sub-плагин в цепочке региона (items → process → items)."""
+
+    def __init__(self, plugin: ProcessModulePlugin, health) -> None:
+        self._plugin = plugin
+        self._health = health
+
+    def execute(self, data: list[dict], context) -> list[dict]:
+        try:
+            result = self._plugin.process(data)
+        except Exception as exc:
+            # Ошибка кормит health процесса; on_error решает ChainRunnable.
+            self._health.report_error(exc, context="region_parallel.step", throttle=30.0)
+            raise
+        if result is None:
+            return data  # как chain_executor: None → шаг пропущен
+        return result if isinstance(result, list) else [result]
+
+    def configure(self, params: dict) -> None:
+        return None
+
+
+class _RegionChain:
+    """``IRunnableChain`` региона: срез кадра → item → sub-плагины → кадр региона.
+
+    ``last_item`` — выходной item последнего прогона (trace ветви для fan-in);
+    сбрасывается плагином перед каждым кадром.
+    """
+
+    def __init__(self, steps: list[RunnableStep]) -> None:
+        self._runnable = ChainRunnable(steps)
+        self.last_item: dict | None = None
+
+    def execute(self, payload, metadata: dict | None = None) -> ChainResult:
+        metadata = metadata or {}
+        height, width = payload.shape[:2]
+        item = {
+            **metadata,
+            "frame": payload,
+            "width": width,
+            "height": height,
+            # Независимый trace ветви: process-спаны шагов не попадают в соседние регионы.
+            **frame_trace.fork_trace(metadata),
+        }
+        result = self._runnable.execute([item], metadata)
+        items = result.frame or []
+        self.last_item = items[0] if items else None
+        result.frame = self.last_item.get("frame") if self.last_item else None
+        return result
+
+
+@register_plugin(
+    "region_parallel",
+    category="processing",
+    description="Регионы кадра параллельно в одном процессе + склейка",
+)
+class RegionParallelPlugin(ProcessModulePlugin):
+    """Параллельная обработка регионов кадра на пуле потоков + склейка на место."""
+
+    name = "region_parallel"
+    category = "processing"
+    register_class = RegionParallelRegisters
+
+    inputs = [
+        Port(name="frame", dtype="image/bgr", shape="(H, W, 3)", description="Входной BGR-кадр"),
+    ]
+    outputs = [
+        Port(name="frame", dtype="image/bgr", shape="(H, W, 3)", description="Склеенный кадр"),
+    ]
+
+    commands = {}
+
+    # --- Жизненный цикл ---
+
+    def configure(self, ctx: PluginContext) -> None:
+        """Настройка: собрать цепочку sub-плагинов на каждый регион."""
+        self._ctx = ctx
+        self._reg = self._init_register(ctx)
+
+        self._plugins: list[tuple[ProcessModulePlugin, dict]] = []  # (sub-плагин, config) для shutdown
+        self._chains: dict[str, _RegionChain] = {}
+        self._branches: list[RegionBranch] = []
+        self._pool: ChainThreadPool | None = None
+        self._runnable: RegionParallelRunnable | None = None
+
+        if self._reg.default_region:
+            self._add_region(self._reg.default_region.get("name", "default"), _FULL_FRAME, self._reg.default_region)
+        for region in self._reg.regions:
+            rect = (region.get("x", 0), region.get("y", 0), region.get("width", 0), region.get("height", 0))
+            self._add_region(region.get("name", ""), rect, region)
+
+        ctx.log_info(
+            f"RegionParallelPlugin: regions={[b.name for b in self._branches]}, "
+            f"max_workers={self._reg.max_workers}, in_place={self._reg.in_place}"
+        )
+
+    def start(self, ctx: PluginContext) -> None:
+        """Запуск: пул регионов (worker_module, как у ParallelChainRunnable)."""
+        workers = max(1, min(self._reg.max_workers, len(self._branches)))
+        self._pool = ChainThreadPool(max_workers=workers, step_timeout=self._reg.step_timeout)
+        self._runnable = RegionParallelRunnable(self._branches, self._pool, in_place=self._reg.in_place)
+        ctx.log_info(f"RegionParallelPlugin: пул запущен, max_workers={workers}")
+
+    def shutdown(self, ctx: PluginContext) -> None:
+        """Остановка: пул + все sub-плагины всех регионов."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._runnable = None
+        for plugin, config in self._plugins:
+            try:
+                plugin.shutdown(
+                    SubPluginContext(
+                        config=config,
+                        log_info=self._ctx.log_info,
+                        log_error=self._ctx.log_error,
+                        health=self._ctx.health,
+                    )
+                )
+            except Exception:  # no-health: defensive teardown — sub-plugin мог не реализовать shutdown
+                pass
+
+    # --- Сборка регионов ---
+
+    def _add_region(self, name: str, rect: tuple, region: dict) -> None:
+        """Ветвь региона: свои экземпляры шагов (region.steps, ``[]`` — без обработки; иначе общие steps)."""
+        if not name or name in self._chains:
+            self._ctx.log_error(f"RegionParallelPlugin: регион без имени или дубль '{name}' — пропущен")
+            return
+        steps = []
+        for index, step_cfg in enumerate(region["steps"] if "steps" in region else self._reg.steps):
+            step = self._init_step(name, index, step_cfg)
+            if step is not None:
+                steps.append(step)
+        chain = _RegionChain(steps)
+        self._chains[name] = chain
+        self._branches.append(RegionBranch(name=name, rect=rect, chain=chain))
+
+    def _init_step(self, region: str, index: int, step_cfg: dict) -> RunnableStep | None:
+        """Sub-плагин шага (формат chain_executor) → RunnableStep цепочки региона."""
+        plugin_class_path = step_cfg.get("plugin_class", "")
+        step_name = step_cfg.get("plugin_name") or plugin_class_path.rsplit(".", 1)[-1] or f"step_{index}"
+        sub_config = step_cfg.get("config", {})
+        if not plugin_class_path:
+            self._ctx.log_error(f"RegionParallelPlugin[{region}]: шаг без plugin_class — пропущен")
+            return None
+        try:
+            module_path, class_name = plugin_class_path.rsplit(".", 1)
+            plugin_cls = getattr(importlib.import_module(module_path), class_name)
+            # Sub-плагины идут мимо PluginOrchestrator.boot() — трассировку ставим сами.
+            frame_trace.install_tracing(plugin_cls)
+            plugin = plugin_cls()
+            plugin.configure(
+                SubPluginContext(
+                    process_name=f"{region}/{step_name}",
+                    config=sub_config,
+                    log_info=self._ctx.log_info,
+                    log_error=self._ctx.log_error,
+                    health=self._ctx.health,
+                )
+            )
+            plugin._trace_node = self._trace_node
+        except Exception as exc:
+            self._ctx.health.report_error(exc, context="region_parallel.init_step")
+            logger.error(f"RegionParallelPlugin[{region}]: ошибка инициализации шага '{step_name}': {exc}")
+            return None
+        self._plugins.append((plugin, sub_config))
+        return RunnableStep(
+            node=PipelineStepNode(node_id=f"{region}/{step_name}", operation_ref=plugin_class_path),
+            operation=_PluginStep(plugin, self._ctx.health),
+            on_error=self._reg.on_error,
+        )
+
+    # --- Обработка ---
+
+    @for_each
+    def process(self, item: dict) -> dict | None:
+        """Регионы кадра параллельно → склеенный кадр (метаданные item сохраняются)."""
+        frame = item.get("frame")
+        if frame is None or self._runnable is None:
+            return item
+
+        for chain in self._chains.values():
+            chain.last_item = None
+        metadata = {key: value for key, value in item.items() if key != "frame"}
+        metadata["canvas_width"], metadata["canvas_height"] = frame.shape[1], frame.shape[0]
+        result = self._runnable.execute(frame, metadata)
+
+        if result.context.timeouts:
+            self._ctx.health.report_error(
+                TimeoutError(f"регионы не уложились в {self._reg.step_timeout}s: {result.context.timeouts}"),
+                context="region_parallel.timeout",
+                throttle=30.0,
+            )
+        out = {**item, "frame": result.frame}
+        if result.failed:
+            out["inspection_status"] = "not_inspected"
+        self._merge_trace(out, result)
+        return out
+
+    def _merge_trace(self, out: dict, result: ChainResult) -> None:
+        """Fan-in trace как у stitcher + ``region_ms`` каждой ветви. No-op для нетрассируемого кадра."""
+        if not frame_trace.is_traced(out):
+            return
+        done = [self._chains[b["branch"]].last_item for b in result.branches if not b["failed"]]
+        done = [it for it in done if it is not None]
+        trace, branches, chosen = frame_trace.merge_trace(done)
+        if not (trace or branches):
+            return
+        region_ms = {b["branch"]: b["ms"] for b in result.branches}
+        for entry in branches:
+            entry["region_ms"] = region_ms.get(entry["branch"], 0.0)
+        out["trace"] = trace
+        out["trace_branches"] = branches
+        # ms merge-спана — накладные fan-out/fan-in сверх самой медленной ветви
+        # (очередь пула + склейка): аналог ожидания fan-in буфера у stitcher.
+        slowest = max(region_ms.values(), default=0.0)
+        frame_trace.record_merge(
+            out,
+            node=self._trace_node or self.name,
+            branches=len(done),
+            chosen=chosen,
+            ms=max(0.0, result.processing_time * 1000.0 - slowest),
+        )
@@ -0,0 +1,76 @@
+"""RegionParallelRegisters — все параметры region_parallel плагина.
+
+V3_MY_PURE: register = единый источник параметров + FieldMeta.
+Plugin всегда работает через self._reg (managed или локальный).
+
+Регионы — в формате region_split, шаги — в формате chain_executor: связка
+``region_split → обработка → stitcher`` переносится в один процесс без правки
+описаний регионов и шагов.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from multiprocess_framework.modules.process_module.plugins import register_schema
+from multiprocess_framework.modules.process_module.plugins import FieldMeta
+from multiprocess_framework.modules.process_module.plugins import SchemaBase
+
+
+# Ошибка шага в цепочке региона:
+#   skip        — шаг пропускается, регион идёт дальше по цепочке
+#   fail_region — цепочка региона прерывается, в кадре остаются исходные пиксели региона
+StepOnError = Literal["skip", "fail_region"]
+
+
+@register_schema("RegionParallelRegistersV1")
+class RegionParallelRegisters(SchemaBase):
+    """Все параметры region_parallel — регионы, цепочки шагов, пул, склейка."""
+
+    # --- Регионы ---
+    regions: Annotated[
+        list[dict],
+        FieldMeta(
+            "Regions",
+            info='Регионы: [{"name": "r0", "x": 0, "y": 0, "width": 320, "height": 240, "steps": [...]}]; '
+            "без steps — общие steps, steps: [] — регион без обработки",
+        ),
+    ] = []
+    default_region: Annotated[
+        dict,
+        FieldMeta(
+            "Default Region",
+            info='Полный кадр как фон (накладывается первым): {"name": "default", "steps": [...]}; пусто — без фона',
+        ),
+    ] = {}
+
+    # --- Цепочка ---
+    steps: Annotated[
+        list[dict],
+        FieldMeta(
+            "Steps",
+            info='Шаги цепочки региона: [{"plugin_class": "full.path.Plugin", "plugin_name": "...", "config": {...}}]',
+        ),
+    ] = []
+    on_error: Annotated[
+        StepOnError,
+        FieldMeta("On Error", info="Ошибка шага: skip (шаг пропущен) или fail_region (регион остаётся исходным)"),
+    ] = "skip"
+
+    # --- Пул и склейка ---
+    max_workers: Annotated[
+        int,
+        FieldMeta("Max Workers", info="Потоков пула регионов (применяется при старте)", min=1, max=64),
+    ] = 4
+    step_timeout: Annotated[
+        float,
+        FieldMeta("Timeout", info="Бюджет ожидания всех регионов кадра, с", min=0.1),
+    ] = 10.0
+    in_place: Annotated[
+        bool,
+        FieldMeta(
+            "In Place",
+            info="Склеивать прямо во входной кадр (без canvas-буфера). Только если кадр не читает "
+            "никто другой (не SHM-view кольца с другими потребителями)",
+        ),
+    ] = False
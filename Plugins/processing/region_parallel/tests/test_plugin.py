@@ -0,0 +1,106 @@
+"""Тесты RegionParallelPlugin: паритет с region_split → stitcher, trace, ошибки шагов."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from multiprocess_framework.modules.process_module.generic import frame_trace
+from Plugins.processing.negative.plugin import NegativePlugin
+from Plugins.processing.region_parallel.plugin import RegionParallelPlugin
+from Plugins.processing.region_split.plugin import RegionSplitPlugin
+from Plugins.processing.stitcher.plugin import StitcherPlugin
+
+NEGATIVE = {"plugin_class": "Plugins.processing.negative.plugin.NegativePlugin", "plugin_name": "neg"}
+REGIONS = [
+    {"name": "left", "x": 10, "y": 10, "width": 40, "height": 30},
+    {"name": "right", "x": 70, "y": 40, "width": 60, "height": 60},  # выходит за кадр — клампится
+]
+
+
+def _make_mock_ctx(config: dict | None = None) -> MagicMock:
+    """Создать mock PluginContext."""
+    ctx = MagicMock()
+    ctx.config = config or {}
+    ctx.log_info = MagicMock()
+    ctx.log_error = MagicMock()
+    ctx.command_manager = MagicMock()
+    return ctx
+
+
+def _frame() -> np.ndarray:
+    return np.random.default_rng(1).integers(0, 256, (80, 100, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def make_plugin():
+    plugins = []
+
+    def _make(config: dict) -> tuple[RegionParallelPlugin, MagicMock]:
+        plugin = RegionParallelPlugin()
+        ctx = _make_mock_ctx(config)
+        plugin.configure(ctx)
+        plugin.start(ctx)
+        plugins.append((plugin, ctx))
+        return plugin, ctx
+
+    yield _make
+    for plugin, ctx in plugins:
+        plugin.shutdown(ctx)
+
+
+def test_matches_region_split_negative_stitcher(make_plugin):
+    frame = _frame()
+    default = {"name": "default", "steps": []}
+    plugin, _ = make_plugin({"regions": REGIONS, "default_region": default, "steps": [NEGATIVE]})
+    out = plugin.process([{"frame": frame, "camera_id": 0, "seq_id": 3}])[0]
+
+    split = RegionSplitPlugin()
+    split.configure(_make_mock_ctx({"regions": REGIONS, "default_region": default}))
+    negative = NegativePlugin()
+    negative.configure(_make_mock_ctx())
+    regions = split.process([{"frame": frame, "camera_id": 0, "seq_id": 3}])
+    processed = [r if "default" in r["region_name"] else negative.process([r])[0] for r in regions]
+    stitcher = StitcherPlugin()
+    stitcher.configure(_make_mock_ctx())
+    expected = stitcher.process(processed)[0]["frame"]
+
+    np.testing.assert_array_equal(out["frame"], expected)
+    assert out["seq_id"] == 3
+    assert "inspection_status" not in out
+
+
+def test_each_region_gets_own_step_instances(make_plugin):
+    plugin, _ = make_plugin({"regions": REGIONS, "steps": [NEGATIVE]})
+
+    instances = [p for p, _ in plugin._plugins]
+    assert len(instances) == 2 and instances[0] is not instances[1]
+    assert [b.name for b in plugin._branches] == ["left", "right"]
+
+
+def test_trace_branches_carry_region_latency(make_plugin, monkeypatch):
+    monkeypatch.setattr(frame_trace, "_ENABLED", True)
+    plugin, _ = make_plugin({"regions": REGIONS, "steps": [NEGATIVE]})
+    parent = [{"kind": "transport", "from": "camera", "to": "proc", "ms": 1.0}]
+
+    out = plugin.process([{"frame": _frame(), "trace": parent}])[0]
+
+    assert {b["branch"] for b in out["trace_branches"]} == {"left", "right"}
+    assert all(b["region_ms"] >= 0 and b["spans"] == 2 for b in out["trace_branches"])
+    assert out["trace"][0] == parent[0]
+    assert out["trace"][-1]["kind"] == "merge" and out["trace"][-1]["branches"] == 2
+    assert parent == [{"kind": "transport", "from": "camera", "to": "proc", "ms": 1.0}]
+
+
+def test_failing_step_reports_health_and_keeps_source(make_plugin):
+    plugin, ctx = make_plugin({"regions": REGIONS[:1], "steps": [NEGATIVE], "on_error": "fail_region"})
+    frame = _frame()
+
+    step = plugin._plugins[0][0]
+    step.process = MagicMock(side_effect=RuntimeError("boom"))
+    out = plugin.process([{"frame": frame}])[0]
+
+    np.testing.assert_array_equal(out["frame"], frame)
+    assert ctx.health.report_error.call_args.kwargs["context"] == "region_parallel.step"
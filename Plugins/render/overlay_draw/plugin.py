@@ -5,12 +5,24 @@ JoinInspectorManager по seq_id+data_type — см. Этап 1). Здесь —
 разворачивает семантику vline в отрезки «от края до края», рисует пунктирные границы
 полосы, точки и подписи. Цвет резолвится по таблице (per-shape → group → type → дефолт).
 
-Stateless (слияние сделал Join) → thread_safe=True. Кадр не мутируется (рисуем на копии).
+Слои: статика (vlines, явные и пунктирные линии) растеризуется один раз в слой цветов
++ маску покрытия и кэшируется по (размер кадра, статическая часть overlay, стиль из
+register); на кадр — один векторный перенос покрытых пикселей. Динамика (точки, подписи)
+рисуется каждый кадр поверх. Время отрисовки — в readonly-полях register.
+
+Слияние сделал Join, кэш слоёв потокобезопасен → thread_safe=True. Кадр не мутируется
+(рисуем на копии).
 """
 
 from __future__ import annotations
 
+import math
+import threading
+import time
+from typing import Any
+
 import cv2
+import numpy as np
 
 from multiprocess_framework.modules.process_module.plugins import (
     PluginContext,
@@ -23,6 +35,18 @@ from multiprocess_framework.modules.process_module.plugins import (
 from .geometry import vline_segments
 from .registers import OverlayDrawRegisters
 
+# Ключи overlay со статикой (геометрия, не зависящая от кадра) — уходят в кэш слоя.
+_STATIC_KEYS = ("vlines", "lines", "dashed_lines")
+
+# Поля register, влияющие на вид статики (смена → пересборка слоя).
+_STYLE_FIELDS = ("color_table", "default_line_color", "default_thickness", "dash_len", "gap_len")
+
+# Слоёв в кэше: по одному на камеру/overlay, пока их немного.
+_MAX_LAYERS = 8
+
+# Период сброса статистики отрисовки в readonly-поля register.
+_STATS_PERIOD_SEC = 1.0
+
 
 @register_plugin("overlay_draw", category="rendering", description="Рисует overlay (линии/полосы/точки) на кадре")
 class OverlayDrawPlugin(ProcessModulePlugin):
@@ -47,6 +71,12 @@ class OverlayDrawPlugin(ProcessModulePlugin):
     def configure(self, ctx: PluginContext) -> None:
         self._ctx = ctx
         self._reg: OverlayDrawRegisters = self._init_register(ctx)
+        # ключ → (индексы покрытых пикселей, их значения) — см. _static_layer
+        self._layers: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self._draw_sum = 0.0
+        self._draw_count = 0
+        self._stats_at = time.monotonic()
         ctx.log_info(f"OverlayDrawPlugin: color_table={len(self._reg.color_table)} строк")
 
     # --- Резолв стиля: per-shape color → group → type → дефолт ---
@@ -80,8 +110,6 @@ class OverlayDrawPlugin(ProcessModulePlugin):
         }
 
     def _draw_dashed(self, canvas, p1, p2, color, thickness) -> None:
-        import math
-
         x1, y1 = p1
         x2, y2 = p2
         length = math.hypot(x2 - x1, y2 - y1)
@@ -105,9 +133,70 @@ class OverlayDrawPlugin(ProcessModulePlugin):
         frame = item.get("frame")
         if frame is None:
             return None
+        t0 = time.perf_counter()
         overlay = item.get("overlay") or {}
         canvas = frame.copy()
-        h, w = frame.shape[:2]
+
+        # Статика: закэшированный слой → покрытые пиксели одним векторным переносом.
+        layer = self._static_layer(overlay, frame)
+        if layer is not None:
+            idx, values = layer
+            _flat(canvas)[idx] = values
+
+        # Динамика: точки + подписи — каждый кадр.
+        for pt in overlay.get("points", []):
+            st = self._resolve(pt, "point")
+            xy = _pt(pt["xy"])
+            cv2.circle(canvas, xy, st["radius"], st["color"], -1)
+            label = pt.get("label")
+            if label and self._reg.show_labels:
+                cv2.putText(
+                    canvas,
+                    str(label),
+                    (xy[0] + 6, xy[1] - 6),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.4,
+                    st["color"],
+                    1,
+                    cv2.LINE_AA,
+                )
+
+        self._account(time.perf_counter() - t0)
+        return {**item, "frame": canvas}
+
+    # --- Статический слой ---
+
+    def _static_layer(self, overlay: dict, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """(индексы покрытых пикселей, их значения) статики для кадра этой формы; None — статики нет."""
+        static = tuple(overlay.get(k) or () for k in _STATIC_KEYS)
+        if not any(static):
+            return None
+        style = tuple(getattr(self._reg, f) for f in _STYLE_FIELDS)
+        key = (frame.shape, frame.dtype.str, repr(static), repr(style))
+        layer = self._layers.get(key)
+        if layer is not None:
+            return layer
+
+        # Растеризация: цвета — на нулевом холсте, покрытие — той же геометрией в маску.
+        colors = np.zeros_like(frame)
+        mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+        self._draw_static(colors, overlay)
+        self._draw_static(mask, overlay, solid=255)
+        idx = np.flatnonzero(mask)
+        layer = (idx, _flat(colors)[idx])
+        with self._lock:
+            if len(self._layers) >= _MAX_LAYERS:
+                self._layers.pop(next(iter(self._layers)))
+            self._layers[key] = layer
+            self._reg.static_rebuilds += 1
+        return layer
+
+    def _draw_static(self, canvas: np.ndarray, overlay: dict, solid: int | None = None) -> None:
+        """vlines + явные линии + пунктир. ``solid`` — рисовать маску (все фигуры этим значением)."""
+        h, w = canvas.shape[:2]
+
+        def color(style: dict) -> Any:
+            return style["color"] if solid is None else solid
 
         # vlines: семантика линии → центральная линия + 2 пунктирные границы полосы.
         for vl in overlay.get("vlines", []):
@@ -121,40 +210,38 @@ class OverlayDrawPlugin(ProcessModulePlugin):
             )
             line_style = self._resolve(vl, "line")
             if central:
-                cv2.line(canvas, _pt(central[0]), _pt(central[1]), line_style["color"], line_style["thickness"])
+                cv2.line(canvas, _pt(central[0]), _pt(central[1]), color(line_style), line_style["thickness"])
             dash_style = self._resolve({"type": "dashed", "group": vl.get("group")}, "dashed")
             for edge in (plus, minus):
                 if edge:
-                    self._draw_dashed(canvas, edge[0], edge[1], dash_style["color"], dash_style["thickness"])
+                    self._draw_dashed(canvas, edge[0], edge[1], color(dash_style), dash_style["thickness"])
 
         # Явные линии (p1/p2).
         for ln in overlay.get("lines", []):
             st = self._resolve(ln, "line")
-            cv2.line(canvas, _pt(ln["p1"]), _pt(ln["p2"]), st["color"], st["thickness"])
+            cv2.line(canvas, _pt(ln["p1"]), _pt(ln["p2"]), color(st), st["thickness"])
         for ln in overlay.get("dashed_lines", []):
             st = self._resolve(ln, "dashed")
-            self._draw_dashed(canvas, ln["p1"], ln["p2"], st["color"], st["thickness"])
+            self._draw_dashed(canvas, ln["p1"], ln["p2"], color(st), st["thickness"])
 
-        # Точки + подписи.
-        for pt in overlay.get("points", []):
-            st = self._resolve(pt, "point")
-            xy = _pt(pt["xy"])
-            cv2.circle(canvas, xy, st["radius"], st["color"], -1)
-            label = pt.get("label")
-            if label and self._reg.show_labels:
-                cv2.putText(
-                    canvas,
-                    str(label),
-                    (xy[0] + 6, xy[1] - 6),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.4,
-                    st["color"],
-                    1,
-                    cv2.LINE_AA,
-                )
+    # --- Статистика ---
 
-        return {**item, "frame": canvas}
+    def _account(self, elapsed: float) -> None:
+        """Накопить время отрисовки; раз в секунду — среднее в register."""
+        with self._lock:
+            self._draw_sum += elapsed
+            self._draw_count += 1
+            now = time.monotonic()
+            if now - self._stats_at < _STATS_PERIOD_SEC:
+                return
+            self._reg.draw_ms = round(self._draw_sum / self._draw_count * 1000.0, 3)
+            self._draw_sum, self._draw_count, self._stats_at = 0.0, 0, now
 
 
 def _pt(p) -> tuple[int, int]:
     return (int(round(p[0])), int(round(p[1])))
+
+
+def _flat(img: np.ndarray) -> np.ndarray:
+    """Вид на пиксели построчно: (H*W, C) для цветного кадра, (H*W,) для одноканального."""
+    return img.reshape(-1, img.shape[2]) if img.ndim == 3 else img.reshape(-1)
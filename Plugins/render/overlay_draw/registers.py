@@ -90,3 +90,7 @@ class OverlayDrawRegisters(SchemaBase):
             info="Рисовать подписи точек (label)",
         ),
     ] = True
+
+    # --- Статистика отрисовки (readonly) ---
+    draw_ms: Annotated[float, FieldMeta("Отрисовка, мс", readonly=True, unit="ms")] = 0.0
+    static_rebuilds: Annotated[int, FieldMeta("Пересборок статики", readonly=True)] = 0
@@ -96,3 +96,51 @@ class TestColorResolution:
         f = _frame()
         out = p.process([{"frame": f, "overlay": {"points": [{"xy": [50, 50], "type": "point"}]}}])
         assert tuple(out[0]["frame"][50, 50]) == (10, 20, 30)
+
+
+class TestStaticLayer:
+    """Статика (vlines/линии/пунктир) кэшируется слоем; точки — каждый кадр."""
+
+    _OVERLAY = {
+        "vlines": [{"cx": 320, "cy": 240, "angle": 20, "zone_width": 60}],
+        "dashed_lines": [{"p1": [10, 400], "p2": [600, 420]}],
+    }
+
+    def test_layer_reused_until_overlay_or_style_changes(self):
+        p = _make_plugin()
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            f = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+            p.process([{"frame": f, "overlay": {**self._OVERLAY, "points": [{"xy": [50, 60], "label": "a"}]}}])
+        assert p._reg.static_rebuilds == 1
+
+        p._reg.dash_len = 20  # стиль статики из register → слой пересобран
+        out = p.process([{"frame": _frame(), "overlay": self._OVERLAY}])[0]["frame"]
+        assert p._reg.static_rebuilds == 2
+        fresh = _make_plugin(dash_len=20).process([{"frame": _frame(), "overlay": self._OVERLAY}])[0]["frame"]
+        assert np.array_equal(out, fresh)
+
+        moved = {"vlines": [{"cx": 100, "cy": 240, "angle": 20, "zone_width": 60}]}
+        p.process([{"frame": _frame(), "overlay": moved}])
+        assert p._reg.static_rebuilds == 3
+
+    def test_points_drawn_over_static_and_gray_frames(self):
+        p = _make_plugin()
+        overlay = {"lines": [{"p1": [0, 100], "p2": [639, 100]}], "points": [{"xy": [100, 100], "color": [9, 9, 9]}]}
+        out = p.process([{"frame": _frame(), "overlay": overlay}])[0]["frame"]
+        assert tuple(out[100, 100]) == (9, 9, 9)  # точка поверх линии
+        assert tuple(out[100, 300]) == (0, 255, 0)  # линия по type из color_table
+
+        gray = np.zeros((100, 100), dtype=np.uint8)
+        out = p.process(
+            [{"frame": gray, "overlay": {"lines": [{"p1": [0, 50], "p2": [99, 50], "color": [200, 0, 0]}]}}]
+        )
+        assert out[0]["frame"].shape == (100, 100) and out[0]["frame"][50, 50] == 200
+
+    def test_draw_time_reaches_register(self, monkeypatch):
+        from Plugins.render.overlay_draw import plugin as plugin_module
+
+        monkeypatch.setattr(plugin_module, "_STATS_PERIOD_SEC", 0.0)
+        p = _make_plugin()
+        p.process([{"frame": _frame(), "overlay": self._OVERLAY}])
+        assert p._reg.draw_ms > 0
@@ -3,12 +3,22 @@
 Processing-плагин: process(items) → items — объединяет кадры в сетку/side-by-side/PiP.
 Работает с ПОЛНЫМ списком items (batch), без @for_each.
 
+Раскладка (прямоугольники тайлов + способ масштабирования каждого) и выходные
+холсты живут между батчами и пересобираются только при смене layout-регистров,
+числа или размеров входов. Тайл масштабируется сразу в своё окно холста
+(``cv2.resize(..., dst=view)``); тайл, чей кадр-источник не менялся с прошлого
+композита в этот холст, не перерисовывается. Холстов два (по очереди): выход
+батча валиден, пока не собран следующий-через-один — держать дольше = копировать.
+
 V3_MY_PURE: plugin самодостаточен — создаёт локальный register
 если RegistersManager недоступен. Все параметры ВСЕГДА через self._reg.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any
+
 import cv2
 import numpy as np
 
@@ -21,6 +31,38 @@ from multiprocess_framework.modules.process_module.plugins import register_plugi
 
 from .registers import RendererCompositorRegisters
 
+# Холстов в ротации: выход предыдущего батча не перезаписывается следующим.
+_OUTPUT_BUFFERS = 2
+
+# Способ переноса кадра в тайл (считается при сборке раскладки). _CONVERT — кадр
+# не uint8 / не 1–3 канала: resize и присваивание срезу с приведением типа (как до
+# кэша раскладки) — np.copyto/cv2 dst= на таком кадре падают или пишут мимо тайла.
+_COPY, _RESIZE, _GRAY, _CONVERT = "copy", "resize", "gray", "convert"
+
+# Регистры, от которых зависит раскладка (смена любого → пересборка).
+_LAYOUT_FIELDS = ("layout_mode", "grid_cols", "grid_rows", "output_width", "output_height", "pip_scale", "pip_position")
+
+Rect = tuple[int, int, int, int]  # x, y, w, h
+
+
+@dataclass
+class _Canvas:
+    """Выходной холст + ключи кадров, нарисованных в каждом тайле."""
+
+    buf: np.ndarray
+    keys: list[Any]
+
+
+@dataclass
+class _Layout:
+    """Раскладка: ключ, тайлы (в z-порядке), способ переноса и холсты."""
+
+    key: tuple
+    rects: list[Rect]
+    modes: list[str]
+    canvases: list[_Canvas]
+    turn: int = 0
+
 
 @register_plugin(
     "renderer_compositor",
@@ -63,6 +105,7 @@ class RendererCompositorPlugin(ProcessModulePlugin):
         """Настройка: register managed (GUI) или локальный (defaults)."""
         self._ctx = ctx
         self._reg = self._init_register(ctx)
+        self._layout: _Layout | None = None
 
         ctx.log_info(
             f"RendererCompositorPlugin: layout={self._reg.layout_mode}, "
@@ -79,25 +122,27 @@ class RendererCompositorPlugin(ProcessModulePlugin):
         с одним item содержащим составной кадр.
         """
         # Извлечь валидные кадры из всех items
-        frames = [item["frame"] for item in items if item.get("frame") is not None]
+        sources = [item for item in items if item.get("frame") is not None]
 
-        if not frames:
+        if not sources:
             # Нет кадров — вернуть входные items без изменений
             return items
 
-        # Compositing по выбранному layout
-        if self._reg.layout_mode == "side_by_side":
-            composite = self._compose_side_by_side(frames)
-        elif self._reg.layout_mode == "pip":
-            composite = self._compose_pip(frames)
-        else:
-            # По умолчанию — grid
-            composite = self._compose_grid(frames)
+        frames = [item["frame"] for item in sources]
+        layout = self._layout_for(frames)
+        canvas = layout.canvases[layout.turn]
+        layout.turn = (layout.turn + 1) % len(layout.canvases)
+        self._render(canvas, layout, sources)
 
         # Текстовый overlay при необходимости
         if self._reg.overlay_enabled:
-            self._add_overlay(composite, len(frames))
+            rect = self._add_overlay(canvas.buf, len(frames))
+            # Под текстом тайлы испорчены — при следующем композите в этот холст перерисовать
+            for i, tile in enumerate(layout.rects):
+                if _overlaps(tile, rect):
+                    canvas.keys[i] = None
 
+        composite = canvas.buf
         # Возвращаем один item с составным кадром
         # Оба ключа для совместимости с pipeline
         return [
@@ -108,9 +153,62 @@ class RendererCompositorPlugin(ProcessModulePlugin):
             }
         ]
 
+    # --- Раскладка и рендер ---
+
+    def _layout_for(self, frames: list[np.ndarray]) -> _Layout:
+        """Текущая раскладка; пересобирается при смене регистров, числа или размеров входов."""
+        reg = self._reg
+        shapes = tuple((f.shape, f.dtype) for f in frames)
+        key = (tuple(getattr(reg, name) for name in _LAYOUT_FIELDS), shapes)
+        layout = self._layout
+        if layout is not None and layout.key == key:
+            return layout
+
+        if reg.layout_mode == "side_by_side":
+            rects = self._side_by_side_rects(len(frames))
+        elif reg.layout_mode == "pip":
+            rects = self._pip_rects(len(frames))
+        else:
+            # По умолчанию — grid
+            rects = self._grid_rects(len(frames))
+        modes = [_transfer_mode(shape, dtype, rect) for (shape, dtype), rect in zip(shapes, rects)]
+        canvases = [
+            _Canvas(buf=np.zeros((reg.output_height, reg.output_width, 3), dtype=np.uint8), keys=[None] * len(rects))
+            for _ in range(_OUTPUT_BUFFERS)
+        ]
+        layout = _Layout(key=key, rects=rects, modes=modes, canvases=canvases)
+        self._layout = layout
+        return layout
+
+    def _render(self, canvas: _Canvas, layout: _Layout, sources: list[dict]) -> None:
+        """Перенести кадры в тайлы холста, пропуская тайлы с тем же кадром-источником.
+
+        Тайлы идут в z-порядке (PiP поверх основного): перерисованный тайл
+        заставляет перерисовать и все следующие, что его перекрывают.
+        """
+        repainted: list[Rect] = []
+        for i, (rect, mode, item) in enumerate(zip(layout.rects, layout.modes, sources)):
+            key = _frame_key(item)
+            if key is not None and canvas.keys[i] == key and not any(_overlaps(rect, r) for r in repainted):
+                continue
+            x, y, w, h = rect
+            view = canvas.buf[y : y + h, x : x + w]
+            frame = item["frame"]
+            if mode == _COPY:
+                np.copyto(view, frame)
+            elif mode == _RESIZE:
+                cv2.resize(frame, (w, h), dst=view)
+            elif mode == _GRAY:
+                cv2.cvtColor(cv2.resize(frame, (w, h)), cv2.COLOR_GRAY2BGR, dst=view)
+            else:
+                resized = cv2.resize(frame, (w, h))
+                view[...] = resized[..., None] if resized.ndim == 2 else resized[..., :3]
+            canvas.keys[i] = key
+            repainted.append(rect)
+
     # --- Layout-методы ---
 
-    def _compose_grid(self, frames: list[np.ndarray]) -> np.ndarray:
+    def _grid_rects(self, count: int) -> list[Rect]:
         """Grid layout: NxM ячеек.
 
         Распределяет кадры по ячейкам сетки grid_cols × grid_rows.
@@ -118,76 +216,47 @@ class RendererCompositorPlugin(ProcessModulePlugin):
         """
         grid_cols = max(1, self._reg.grid_cols)
         grid_rows = max(1, self._reg.grid_rows)
-        canvas = np.zeros(
-            (self._reg.output_height, self._reg.output_width, 3), dtype=np.uint8
-        )
         cell_w = self._reg.output_width // grid_cols
         cell_h = self._reg.output_height // grid_rows
+        # Ячейки заполнены — остальные кадры пропускаем
+        count = min(count, grid_cols * grid_rows)
+        return [((i % grid_cols) * cell_w, (i // grid_cols) * cell_h, cell_w, cell_h) for i in range(count)]
 
-        for i, frame in enumerate(frames):
-            if i >= grid_cols * grid_rows:
-                # Ячейки заполнены — остальные кадры пропускаем
-                break
-            row = i // grid_cols
-            col = i % grid_cols
-            resized = cv2.resize(frame, (cell_w, cell_h))
-            y0 = row * cell_h
-            x0 = col * cell_w
-            canvas[y0 : y0 + cell_h, x0 : x0 + cell_w] = resized
-
-        return canvas
-
-    def _compose_side_by_side(self, frames: list[np.ndarray]) -> np.ndarray:
+    def _side_by_side_rects(self, count: int) -> list[Rect]:
         """Side-by-side layout: кадры расположены горизонтально.
 
         Каждый кадр масштабируется до output_height, ширина делится поровну.
         """
-        n = len(frames)
-        cell_w = self._reg.output_width // max(n, 1)
-
-        # Масштабируем каждый кадр до размера ячейки
-        resized = [cv2.resize(f, (cell_w, self._reg.output_height)) for f in frames]
-
-        # Создаём canvas и размещаем кадры горизонтально
-        canvas = np.zeros(
-            (self._reg.output_height, self._reg.output_width, 3), dtype=np.uint8
-        )
-        x = 0
-        for r in resized:
-            w = r.shape[1]
-            canvas[:, x : x + w] = r
-            x += w
+        cell_w = self._reg.output_width // max(count, 1)
+        return [(i * cell_w, 0, cell_w, self._reg.output_height) for i in range(count)]
 
-        return canvas
-
-    def _compose_pip(self, frames: list[np.ndarray]) -> np.ndarray:
+    def _pip_rects(self, count: int) -> list[Rect]:
         """Picture-in-Picture layout.
 
         Первый кадр — основной (полный размер), остальные — мини-окна в углу.
         Поддерживает до 4 PiP-окон, позиция задаётся pip_position.
         """
+        out_w, out_h = self._reg.output_width, self._reg.output_height
         # Основной кадр занимает весь output
-        main = cv2.resize(frames[0], (self._reg.output_width, self._reg.output_height))
-        canvas = main.copy()
+        rects: list[Rect] = [(0, 0, out_w, out_h)]
 
-        pip_w = int(self._reg.output_width * self._reg.pip_scale)
-        pip_h = int(self._reg.output_height * self._reg.pip_scale)
+        pip_w = int(out_w * self._reg.pip_scale)
+        pip_h = int(out_h * self._reg.pip_scale)
 
-        # Словарь допустимых позиций PiP-окна
+        # Словарь допустимых позиций PiP-окна (окно не выходит за холст)
+        right, bottom = max(0, out_w - pip_w - 10), max(0, out_h - pip_h - 10)
         positions = {
-            "top_right": (self._reg.output_width - pip_w - 10, 10),
-            "top_left": (10, 10),
-            "bottom_right": (self._reg.output_width - pip_w - 10, self._reg.output_height - pip_h - 10),
-            "bottom_left": (10, self._reg.output_height - pip_h - 10),
+            "top_right": (right, min(10, bottom)),
+            "top_left": (min(10, right), min(10, bottom)),
+            "bottom_right": (right, bottom),
+            "bottom_left": (min(10, right), bottom),
         }
+        pip_w, pip_h = min(pip_w, out_w), min(pip_h, out_h)
 
         pos_keys = list(positions.keys())
 
-        # Размещаем дополнительные кадры как PiP
-        for i, frame in enumerate(frames[1:], 1):
-            if i > 4:
-                # Максимум 4 PiP-окна
-                break
+        # Максимум 4 PiP-окна
+        for i in range(1, min(count, 5)):
             # Первое дополнительное — в заданную позицию, остальные — по кругу
             if i == 1:
                 pos_key = self._reg.pip_position
@@ -195,18 +264,17 @@ class RendererCompositorPlugin(ProcessModulePlugin):
                     pos_key = "top_right"
             else:
                 pos_key = pos_keys[(i - 1) % len(pos_keys)]
-
             x0, y0 = positions[pos_key]
-            pip_frame = cv2.resize(frame, (pip_w, pip_h))
-            canvas[y0 : y0 + pip_h, x0 : x0 + pip_w] = pip_frame
+            rects.append((x0, y0, pip_w, pip_h))
 
-        return canvas
+        return rects
 
     # --- Overlay ---
 
-    def _add_overlay(self, canvas: np.ndarray, source_count: int) -> None:
-        """Добавить текстовый overlay с количеством источников."""
+    def _add_overlay(self, canvas: np.ndarray, source_count: int) -> Rect:
+        """Добавить текстовый overlay с количеством источников; вернуть его прямоугольник."""
         text = f"Sources: {source_count}"
+        (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, self._reg.overlay_font_scale, 1)
         cv2.putText(
             canvas,
             text,
@@ -216,6 +284,8 @@ class RendererCompositorPlugin(ProcessModulePlugin):
             (255, 255, 255),
             1,
         )
+        # Запас в пару px: сглаживание краёв глифов выходит за getTextSize
+        return 8, 23 - text_h, text_w + 4, text_h + baseline + 4
 
     # --- Команды ---
 
@@ -243,3 +313,29 @@ class RendererCompositorPlugin(ProcessModulePlugin):
             f"RendererCompositorPlugin: overlay → {self._reg.overlay_enabled}"
         )
         return {"status": "ok", "overlay_enabled": self._reg.overlay_enabled}
+
+
+def _frame_key(item: dict) -> tuple | None:
+    """Идентичность кадра-источника: (источник, frame_id, timestamp).
+
+    Без frame_id/timestamp кадр нельзя отличить от перезаписанного на месте
+    буфера — такой тайл перерисовывается всегда (None).
+    """
+    if item.get("frame_id") is None and item.get("timestamp") is None:
+        return None
+    return item.get("camera_id", item.get("sender")), item.get("frame_id"), item.get("timestamp")
+
+
+def _transfer_mode(shape: tuple, dtype: np.dtype, rect: Rect) -> str:
+    """Как перенести кадр в тайл uint8-BGR холста: копия, resize, resize + GRAY→BGR или с приведением."""
+    gray = len(shape) == 2 or shape[2] == 1
+    if dtype != np.uint8 or not (gray or shape[2] == 3):
+        return _CONVERT
+    if gray:
+        return _GRAY
+    return _COPY if shape[:2] == (rect[3], rect[2]) else _RESIZE
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    """Пересекаются ли прямоугольники (x, y, w, h)."""
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
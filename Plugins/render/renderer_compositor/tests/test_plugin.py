@@ -390,3 +390,75 @@ class TestCommands:
         assert plugin._reg.grid_cols == 4
         assert plugin._reg.grid_rows == 2  # не изменился
         assert plugin._reg.layout_mode == "grid"  # не изменился
+
+
+class TestPersistentLayout:
+    """Раскладка и холсты между батчами: resize в окно, пропуск неизменных тайлов."""
+
+    _CFG = {"grid_cols": 2, "grid_rows": 2, "output_width": 400, "output_height": 200}
+
+    @staticmethod
+    def _items(frames, ids):
+        return [{"frame": f, "frame_id": fid, "camera_id": i} for i, (f, fid) in enumerate(zip(frames, ids))]
+
+    def test_unchanged_tiles_skipped_and_output_matches_fresh_render(self, monkeypatch):
+        from Plugins.render.renderer_compositor import plugin as plugin_module
+
+        calls = []
+        real_resize = plugin_module.cv2.resize
+        monkeypatch.setattr(plugin_module.cv2, "resize", lambda *a, **k: calls.append(1) or real_resize(*a, **k))
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 255, (50, 80, 3), dtype=np.uint8) for _ in range(4)]
+        plugin = _make_plugin(self._CFG)
+
+        plugin.process(self._items(frames, [0, 0, 0, 0]))
+        plugin.process(self._items(frames, [0, 0, 0, 0]))  # второй холст ротации — рисуется впервые
+        calls.clear()
+        frames[2] = rng.integers(0, 255, (50, 80, 3), dtype=np.uint8)
+        out = plugin.process(self._items(frames, [0, 0, 1, 0]))[0]["frame"]
+
+        # Тайл 0 под overlay-текстом перерисован, тайл 2 — новый кадр; 1 и 3 пропущены
+        assert len(calls) == 2
+        fresh = _make_plugin(self._CFG).process(self._items(frames, [0, 0, 1, 0]))[0]["frame"]
+        assert np.array_equal(out, fresh)
+
+    def test_buffers_rotate_and_rebuild_on_register_or_shape_change(self):
+        plugin = _make_plugin({**self._CFG, "overlay_enabled": False})
+        frames = [_colored_frame(50, 80, color=(10, 20, 30))] * 4
+        outs = [plugin.process(self._items(frames, [n] * 4))[0]["frame"] for n in range(3)]
+        assert outs[0] is outs[2] and outs[0] is not outs[1]
+
+        plugin.set_layout({"grid_cols": 4, "grid_rows": 1})
+        rebuilt = plugin.process(self._items(frames, [9] * 4))[0]["frame"]
+        assert rebuilt is not outs[0] and rebuilt is not outs[1]
+        assert np.all(rebuilt[:, :, 0] == 10)  # 4 тайла по 100px покрывают весь холст
+
+        small = plugin.process(self._items([_colored_frame(20, 20)] * 2, [10, 10]))[0]["frame"]
+        assert small[:, 200:].max() == 0  # меньше входов → свободные ячейки чистые
+
+    def test_gray_and_same_size_inputs(self):
+        plugin = _make_plugin({**self._CFG, "overlay_enabled": False})
+        gray = np.full((30, 30), 77, dtype=np.uint8)
+        exact = _colored_frame(100, 200, color=(1, 2, 3))  # ровно размер ячейки → копия без resize
+        out = plugin.process([{"frame": gray}, {"frame": exact}])[0]["frame"]
+        assert (out[50, 100] == 77).all()
+        assert (out[0:100, 200:400] == (1, 2, 3)).all()
+
+    def test_non_uint8_and_extra_channel_inputs_cast_like_before(self):
+        """float32 / BGRA / float-gray: приведение при присваивании тайлу, а не TypeError или запись мимо."""
+        plugin = _make_plugin({**self._CFG, "overlay_enabled": False})
+        exact_float = np.full((100, 200, 3), 40.0, dtype=np.float32)  # размер ячейки, но не uint8
+        small_float = np.full((30, 30, 3), 90.7, dtype=np.float32)
+        bgra = np.full((50, 50, 4), (5, 6, 7, 255), dtype=np.uint8)
+        gray_float = np.full((20, 20), 120.0, dtype=np.float64)
+        items = [{"frame": f} for f in (exact_float, small_float, bgra, gray_float)]
+        out = plugin.process(items)[0]["frame"]
+        assert out.dtype == np.uint8
+        assert (out[0:100, 0:200] == 40).all()
+        assert (out[0:100, 200:400] == 90).all()
+        assert (out[100:200, 0:200] == (5, 6, 7)).all()
+        assert (out[100:200, 200:400] == 120).all()
+
+        # Смена dtype того же shape пересобирает режимы переноса
+        again = plugin.process([{"frame": np.full((100, 200, 3), 9, dtype=np.uint8)}])[0]["frame"]
+        assert (again[0:100, 0:200] == 9).all()
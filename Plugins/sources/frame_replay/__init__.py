@@ -0,0 +1 @@
+"""FrameReplayPlugin — реплей записи кадрового потока (frame_record) с исходными метаданными."""
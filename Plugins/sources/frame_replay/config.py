@@ -0,0 +1,23 @@
+"""Конфиг FrameReplayPlugin — identity + register_bindings.
+
+V3_MY_PURE: все параметры живут в registers.py.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from multiprocess_framework.modules.process_module.plugins import register_schema
+from multiprocess_framework.modules.process_module.plugins import SchemaBase
+from multiprocess_framework.modules.process_module.plugins import PluginConfig
+
+from .registers import FrameReplayRegisters
+
+
+@register_schema("FrameReplayPluginConfigV1")
+class FrameReplayPluginConfig(PluginConfig):
+    """Конфиг плагина реплея записи кадров — identity + register binding."""
+
+    plugin_class: str = "Plugins.sources.frame_replay.plugin.FrameReplayPlugin"
+
+    register_bindings: ClassVar[list[type[SchemaBase]]] = [FrameReplayRegisters]
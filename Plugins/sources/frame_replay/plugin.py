@@ -0,0 +1,167 @@
+"""FrameReplayPlugin -- реплей записи кадрового потока (frame_record) в пайплайн.
+
+Source-плагин: produce() отдаёт следующий записанный кадр с ИСХОДНЫМИ метаданными
+item'а (camera_id/seq_id/frame_id/region_name/...) и в исходном порядке — включая
+чередование нескольких камер, которое видел процесс-источник при записи. Запись
+делает send-tap GenericProcess (секция ``frame_record`` процесса, формат —
+``multiprocess_framework.modules.process_module.generic.frame_record``).
+
+Темп:
+  * ``pacing=original`` — produce() спит до момента кадра (исходный интервал ÷ speed),
+    как CapturePlugin блокируется на чтении камеры. source_target_fps процесса надо
+    задать не ниже исходного FPS, иначе SourceProducer сам притормозит поток.
+  * ``pacing=asap`` — без пауз: замер пропускной способности рецепта на реальных данных.
+
+``rebase_timestamps`` (дефолт вкл): ``timestamp`` — время реплея (lag-алерты и
+latency считаются честно), исходные ``timestamp``/``capture_ts`` — в ``recorded_*``.
+Выкл — поля item'а побитово как в записи (воспроизведение инцидента).
+
+V3_MY_PURE: plugin самодостаточен — все параметры ВСЕГДА через self._reg.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from multiprocess_framework.modules.process_module.generic.frame_record import FrameRecordReader
+from multiprocess_framework.modules.process_module.plugins import (
+    PluginContext,
+    Port,
+    ProcessModulePlugin,
+    register_plugin,
+)
+
+from .registers import FrameReplayRegisters
+
+# Максимальный сон одного produce() при pacing=original: кадр «не пора» → спим (не
+# дольше этого) и отдаём [], кадр уходит следующим вызовом (отзывчивость на stop).
+_MAX_SLEEP_SEC = 0.2
+
+
+@register_plugin(
+    "frame_replay",
+    category="source",
+    description="Реплей записи кадров (frame_record) с исходными метаданными и темпом",
+)
+class FrameReplayPlugin(ProcessModulePlugin):
+    """Проигрывает файл записи кадров как источник.
+
+    Lifecycle:
+        configure() -- открыть запись, построить порядок кадров
+        produce()   -- вернуть следующий кадр (с паузой по исходному темпу)
+        shutdown()  -- закрыть файл
+    """
+
+    name = "frame_replay"
+    category = "source"
+
+    inputs = []
+    outputs = [
+        Port(name="frame", dtype="image/bgr", shape="(H, W, 3)", description="Записанный кадр"),
+    ]
+    commands = {
+        "rewind": "_cmd_rewind",
+        "get_stats": "_cmd_get_stats",
+    }
+    register_class = FrameReplayRegisters
+
+    def configure(self, ctx: PluginContext) -> None:
+        """Открыть запись (ошибка открытия — в лог, источник молчит)."""
+        self._ctx = ctx
+        self._reg = self._init_register(ctx)
+        self._lock = threading.Lock()
+        self._reader: FrameRecordReader | None = None
+        self._order: list[int] = []
+        self._pos = 0
+        self._played = 0
+        self._loops = 0
+        self._clock_start: float | None = None
+        self._t_first = 0.0
+        if not self._reg.path:
+            ctx.log_error("FrameReplayPlugin: path записи не задан — источник молчит")
+            return
+        try:
+            self._reader = FrameRecordReader(self._reg.path)
+        except (OSError, ValueError) as exc:
+            ctx.health.report_error(exc, context="frame_replay.open")
+            ctx.log_error(f"FrameReplayPlugin: не удалось открыть запись {self._reg.path!r}: {exc}")
+            return
+        wanted = set(self._reg.camera_ids)
+        self._order = [i for i, row in enumerate(self._reader.index) if not wanted or row[2] in wanted]
+        ctx.log_info(
+            f"FrameReplayPlugin: {self._reg.path} — {len(self._order)}/{len(self._reader)} кадров, "
+            f"камеры {self._reader.camera_ids}, pacing={self._reg.pacing}"
+            + (" (запись оборвана)" if self._reader.truncated else "")
+        )
+
+    def shutdown(self, ctx: PluginContext) -> None:
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        ctx.log_info(f"FrameReplayPlugin: shutdown, проиграно кадров: {self._played}")
+
+    def produce(self) -> list[dict]:
+        """Следующий кадр записи (или [] — конец записи / ещё не время кадра)."""
+        wait = self._time_to_next()
+        if wait is None:
+            return []
+        # Сон — вне lock (команды rewind/get_stats идут из system-потока).
+        if wait > _MAX_SLEEP_SEC:
+            time.sleep(_MAX_SLEEP_SEC)
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        with self._lock:
+            if self._reader is None or self._pos >= len(self._order):
+                return []
+            item, frame, _t = self._reader.read(self._order[self._pos])
+            self._pos += 1
+            self._played += 1
+
+        if self._reg.rebase_timestamps:
+            for key in ("timestamp", "capture_ts"):
+                if key in item:
+                    item[f"recorded_{key}"] = item.pop(key)
+            item["timestamp"] = time.monotonic()
+        item["frame"] = frame
+        return [item]
+
+    def _time_to_next(self) -> float | None:
+        """Секунд до следующего кадра по исходному темпу (0 — asap); None — кадров нет."""
+        with self._lock:
+            if self._reader is None or not self._order:
+                return None
+            if self._pos >= len(self._order):
+                if not self._reg.loop:
+                    return None
+                self._pos = 0
+                self._loops += 1
+                self._clock_start = None
+            t_rec = float(self._reader.index[self._order[self._pos]][1] or 0.0)
+            if self._clock_start is None:
+                self._clock_start = time.monotonic()
+                self._t_first = t_rec
+            if self._reg.pacing != "original":
+                return 0.0
+            return self._clock_start + (t_rec - self._t_first) / self._reg.speed - time.monotonic()
+
+    def _cmd_rewind(self, data: dict) -> dict:
+        """Начать запись сначала (темп отсчитывается заново)."""
+        with self._lock:
+            self._pos = 0
+            self._clock_start = None
+        return {"status": "ok", "position": 0, "total": len(self._order)}
+
+    def _cmd_get_stats(self, data: dict) -> dict:
+        with self._lock:
+            return {
+                "status": "ok",
+                "path": self._reg.path,
+                "position": self._pos,
+                "total": len(self._order),
+                "played": self._played,
+                "loops": self._loops,
+                "truncated": bool(self._reader is not None and self._reader.truncated),
+            }
@@ -0,0 +1,69 @@
+"""FrameReplayRegisters — параметры реплея записи кадров.
+
+V3_MY_PURE: register = единый источник параметров + FieldMeta.
+Plugin всегда работает через self._reg (managed или локальный).
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+from typing import Literal
+
+from multiprocess_framework.modules.process_module.plugins import register_schema
+from multiprocess_framework.modules.process_module.plugins import FieldMeta
+from multiprocess_framework.modules.process_module.plugins import SchemaBase
+
+
+@register_schema("FrameReplayRegistersV1")
+class FrameReplayRegisters(SchemaBase):
+    """Параметры реплея — файл записи, темп, фильтр камер, зацикливание."""
+
+    path: Annotated[
+        str,
+        FieldMeta(
+            "Record Path",
+            info="Файл записи (секция frame_record процесса-источника)",
+        ),
+    ] = ""
+
+    pacing: Annotated[
+        Literal["original", "asap"],
+        FieldMeta(
+            "Pacing",
+            info="original — исходные интервалы между кадрами (÷ speed); asap — без пауз (замер пропускной)",
+        ),
+    ] = "original"
+
+    speed: Annotated[
+        float,
+        FieldMeta(
+            "Speed",
+            info="Множитель темпа для pacing=original (2.0 — вдвое быстрее записи)",
+            min=0.01,
+            max=100.0,
+        ),
+    ] = 1.0
+
+    camera_ids: Annotated[
+        list[int],
+        FieldMeta(
+            "Camera IDs",
+            info="Проигрывать только эти камеры (пусто — все, с исходным чередованием)",
+        ),
+    ] = []
+
+    loop: Annotated[
+        bool,
+        FieldMeta(
+            "Loop",
+            info="По концу записи начать сначала (иначе источник замолкает)",
+        ),
+    ] = False
+
+    rebase_timestamps: Annotated[
+        bool,
+        FieldMeta(
+            "Rebase Timestamps",
+            info="timestamp = время реплея (исходный — в recorded_timestamp); выкл — побитово исходные поля",
+        ),
+    ] = True
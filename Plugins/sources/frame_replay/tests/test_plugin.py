@@ -0,0 +1,107 @@
+"""Тесты FrameReplayPlugin: порядок и метаданные записи, фильтр камер, темп, loop."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from multiprocess_framework.modules.process_module.generic.frame_record import FrameRecordTap
+from Plugins.sources.frame_replay.plugin import FrameReplayPlugin
+
+
+def _make_mock_ctx(config: dict | None = None) -> MagicMock:
+    ctx = MagicMock()
+    ctx.config = config or {}
+    ctx.registers = None
+    ctx.log_info = MagicMock()
+    ctx.log_error = MagicMock()
+    return ctx
+
+
+def _record(path, frames: int = 4, interval: float = 0.0) -> list[dict]:
+    """Записать чередование двух камер через send-tap (как GenericProcess)."""
+    tap = FrameRecordTap(str(path))
+    items = []
+    for seq in range(1, frames + 1):
+        for cam in (0, 1):
+            item = {
+                "frame": np.full((2, 3, 3), seq * 10 + cam, dtype=np.uint8),
+                "camera_id": cam,
+                "seq_id": seq,
+                "frame_id": seq,
+                "timestamp": 50.0 + seq,
+                "capture_ts": 1000.0 + seq,
+                "data_type": "frame",
+            }
+            items.append(item)
+            tap.on_send({"type": "data", "data": item})
+        if interval:
+            time.sleep(interval)
+    tap.close()
+    return items
+
+
+def _drain(plugin: FrameReplayPlugin, limit: int = 100) -> list[dict]:
+    out: list[dict] = []
+    for _ in range(limit):
+        got = plugin.produce()
+        if not got:
+            break
+        out.extend(got)
+    return out
+
+
+def test_replays_in_recorded_order_with_metadata(tmp_path):
+    path = tmp_path / "rec.frec"
+    recorded = _record(path)
+    plugin = FrameReplayPlugin()
+    plugin.configure(_make_mock_ctx({"path": str(path), "pacing": "asap", "rebase_timestamps": False}))
+    played = _drain(plugin)
+    assert [(i["camera_id"], i["seq_id"]) for i in played] == [(i["camera_id"], i["seq_id"]) for i in recorded]
+    np.testing.assert_array_equal(played[5]["frame"], recorded[5]["frame"])
+    assert played[5]["timestamp"] == recorded[5]["timestamp"]
+    assert played[5]["capture_ts"] == recorded[5]["capture_ts"]
+
+
+def test_rebase_moves_recorded_timestamps(tmp_path):
+    path = tmp_path / "rec.frec"
+    _record(path, frames=1)
+    plugin = FrameReplayPlugin()
+    plugin.configure(_make_mock_ctx({"path": str(path), "pacing": "asap"}))
+    item = plugin.produce()[0]
+    assert item["recorded_timestamp"] == 51.0
+    assert item["recorded_capture_ts"] == 1001.0
+    assert "capture_ts" not in item  # SourceProducer поставит время реплея
+    assert item["timestamp"] > 51.0
+
+
+def test_camera_filter_and_loop(tmp_path):
+    path = tmp_path / "rec.frec"
+    _record(path, frames=2)
+    plugin = FrameReplayPlugin()
+    plugin.configure(_make_mock_ctx({"path": str(path), "pacing": "asap", "camera_ids": [1], "loop": True}))
+    played = [plugin.produce()[0] for _ in range(5)]
+    assert [i["seq_id"] for i in played] == [1, 2, 1, 2, 1]
+    assert {i["camera_id"] for i in played} == {1}
+    assert plugin._cmd_get_stats({})["loops"] == 2
+
+
+def test_original_pacing_waits_between_frames(tmp_path):
+    path = tmp_path / "rec.frec"
+    _record(path, frames=2, interval=0.05)
+    plugin = FrameReplayPlugin()
+    plugin.configure(_make_mock_ctx({"path": str(path), "pacing": "original"}))
+    t0 = time.monotonic()
+    played = _drain(plugin)
+    assert len(played) == 4
+    assert time.monotonic() - t0 >= 0.04
+
+
+def test_missing_file_logs_and_stays_silent(tmp_path):
+    plugin = FrameReplayPlugin()
+    ctx = _make_mock_ctx({"path": str(tmp_path / "nope.frec")})
+    plugin.configure(ctx)
+    assert plugin.produce() == []
+    ctx.log_error.assert_called_once()
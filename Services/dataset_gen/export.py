@@ -5,7 +5,8 @@
     ├── images/
     │   ├── 000/00000.png ...   # подкаталог на класс (индекс), кадры внутри
     │   └── 001/...
-    └── labels.csv | labels.json | labels.parquet
+    ├── labels.csv | labels.json | labels.parquet
+    └── shards/         # опционально (shard_size=N): memmap-шарды + индекс меток, см. shards.py
 
 `export_splits` формирует несколько наборов (train/val/test) в подкаталогах,
 каждый — той же структуры; для синтетики «утечка» между сплитами исключается
@@ -14,6 +15,20 @@
 В файле меток поле filename — путь относительно каталога набора (POSIX-слэши).
 parquet требует pyarrow (опционально, через pyarrow напрямую — pandas не нужен);
 csv/json — stdlib.
+
+Параллельный экспорт (workers > 0) и per-sample сиды:
+    при заданном seed каждый сэмпл генерируется собственным rng из
+    (seed, class_index, i) — как SyntheticDataset из (seed, idx). Результат
+    побайтно одинаков при любом числе воркеров и порядке их завершения.
+    Воркеры — процессы (ProcessPoolExecutor): на POSIX через fork, загруженный
+    SpriteCatalog делится copy-on-write без копирования; на Windows (spawn)
+    движок пикается один раз на воркер (initializer), а не на задачу.
+    Воркеры кодируют и пишут PNG сами, родитель собирает метки В ПОРЯДКЕ
+    индексов (упорядоченный map) и дописывает их в журнал labels.partial.jsonl.
+
+Возобновление (resume=True): журнал хранит заголовок с параметрами и по строке
+на готовый сэмпл; после прерывания экспорт продолжается с первого отсутствующего
+индекса. Журнал удаляется после записи итогового файла меток.
 """
 
 from __future__ import annotations
@@ -21,14 +36,17 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
 
 import cv2
 import numpy as np
 
 from Services.dataset_gen.core.catalog import imwrite_unicode
 from Services.dataset_gen.interfaces import SampleGenerator
+from Services.dataset_gen.shards import ShardWriter
 
 LabelsFormat = Literal["csv", "json", "parquet"]
 
@@ -44,6 +62,10 @@ _LABEL_FIELDS = (
     "angle_valid",
 )
 
+_JOURNAL_NAME = "labels.partial.jsonl"
+
+SeedLike = int | Sequence[int]
+
 
 def export_dataset(
     generator: SampleGenerator,
@@ -53,39 +75,239 @@ def export_dataset(
     labels_format: LabelsFormat = "csv",
     rng: np.random.Generator | None = None,
     progress_cb: Callable[[int, int], None] | None = None,
+    seed: SeedLike | None = None,
+    workers: int = 0,
+    resume: bool = False,
+    shard_size: int | None = None,
 ) -> Path:
     """Сгенерировать и сохранить датасет на диск.
 
+    Режимы:
+      - seed=None — последовательный проход общим rng (исторический режим);
+      - seed задан — per-sample rng из (seed, class_index, i): детерминизм
+        не зависит от workers; workers > 0 — пул процессов, resume —
+        продолжение прерванного экспорта по журналу.
+
+    shard_size=N дополнительно пишет кадры в упакованные memmap-шарды по N
+    кадров (out_dir/shards/, см. shards.py) — для обучения без PNG-декода.
+
     Pre:
       - frames_per_class ≥ 1; labels_format ∈ {csv, json, parquet}
+      - workers ≥ 0; workers > 0 и resume требуют seed
     Post:
       - создано frames_per_class * num_classes изображений;
-        файл меток содержит по строке на изображение;
+        файл меток содержит по строке на изображение в порядке (класс, i);
         возвращён путь к файлу меток
 
-    progress_cb(done, total) — опциональный колбэк прогресса.
+    progress_cb(done, total) — опциональный колбэк прогресса (вызывается
+    в вызывающем потоке; при resume done стартует с уже готовых сэмплов).
     """
+    if workers < 0:
+        raise ValueError(f"workers должен быть >= 0, получено {workers}")
+    if seed is None and (workers > 0 or resume):
+        raise ValueError("workers > 0 и resume требуют seed (per-sample детерминизм)")
+
     out = Path(out_dir)
     images_dir = out / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
+    for class_index in range(generator.num_classes):
+        (images_dir / f"{class_index:03d}").mkdir(exist_ok=True)
 
     total = frames_per_class * generator.num_classes
+    shards = None
+    if shard_size is not None:
+        shards = ShardWriter.create(out, total, shard_size, _probe_frame_shape(generator), resume=resume)
+        if not shards.reused:
+            # шарды выделены заново (нули) — строки журнала без пикселей в шардах,
+            # resume начнёт с нуля, а не пропустит «готовые» сэмплы
+            (out / _JOURNAL_NAME).unlink(missing_ok=True)
+    writer = _SampleWriter(generator, out, image_format, frames_per_class, shards)
+    if seed is None:
+        rows = _export_sequential(writer, rng, progress_cb, total)
+    else:
+        rows = _export_seeded(writer, _seed_entropy(seed), progress_cb, total, workers, resume)
+
+    if shards is not None:
+        shards.finalize(rows)
+    _write_class_registry(out, generator)
+    labels_path = _write_labels(out, rows, labels_format)
+    (out / _JOURNAL_NAME).unlink(missing_ok=True)
+    return labels_path
+
+
+def _export_sequential(
+    writer: _SampleWriter,
+    rng: np.random.Generator | None,
+    progress_cb: Callable[[int, int], None] | None,
+    total: int,
+) -> list[dict[str, Any]]:
+    """Исторический режим: один rng на весь набор, строго по порядку."""
     rows: list[dict[str, Any]] = []
-    done = 0
-    for class_index in range(generator.num_classes):
-        class_dir = images_dir / f"{class_index:03d}"
-        class_dir.mkdir(exist_ok=True)
-        for i in range(frames_per_class):
-            frame, label = generator.generate_sample(class_index, rng)
-            rel = f"images/{class_index:03d}/{i:05d}.{image_format}"
-            imwrite_unicode(out / rel, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-            rows.append({"filename": rel, **label.to_dict()})
+    for class_index in range(writer.generator.num_classes):
+        for i in range(writer.frames_per_class):
+            rows.append(writer.write(class_index, i, rng))
+            if progress_cb is not None:
+                progress_cb(len(rows), total)
+    return rows
+
+
+def _export_seeded(
+    writer: _SampleWriter,
+    entropy: tuple[int, ...],
+    progress_cb: Callable[[int, int], None] | None,
+    total: int,
+    workers: int,
+    resume: bool,
+) -> list[dict[str, Any]]:
+    """Per-sample режим: задачи по линейному индексу, метки — упорядоченным журналом."""
+    frames_per_class = writer.frames_per_class
+    header = {
+        "seed": list(entropy),
+        "frames_per_class": frames_per_class,
+        "num_classes": writer.generator.num_classes,
+        "image_format": writer.image_format,
+        "shard_size": writer.shards.shard_size if writer.shards is not None else None,
+    }
+    journal_path = writer.out / _JOURNAL_NAME
+    rows = _read_journal(journal_path, header, writer.out) if resume else []
+
+    done = len(rows)
+    if progress_cb is not None and done:
+        progress_cb(done, total)
+    pending = [(k // frames_per_class, k % frames_per_class) for k in range(done, total)]
+    writer.entropy = entropy
+
+    with journal_path.open("a" if rows else "w", encoding="utf-8") as journal:
+        if not rows:
+            journal.write(json.dumps(header) + "\n")
+            journal.flush()
+        for row in _run_tasks(writer, pending, workers):
+            rows.append(row)
+            journal.write(json.dumps(row, ensure_ascii=False) + "\n")
+            journal.flush()
             done += 1
             if progress_cb is not None:
                 progress_cb(done, total)
+    return rows
 
-    _write_class_registry(out, generator)
-    return _write_labels(out, rows, labels_format)
+
+_Task = tuple[int, int]  # (class_index, i)
+
+
+def _run_tasks(writer: _SampleWriter, tasks: list[_Task], workers: int) -> Iterable[dict[str, Any]]:
+    """Выполнить задачи в процессе или пулом; результаты — строго в порядке tasks."""
+    if workers == 0 or len(tasks) <= 1:
+        return map(writer, tasks)
+    return _run_pool(writer, tasks, workers)
+
+
+def _run_pool(writer: _SampleWriter, tasks: list[_Task], workers: int) -> Iterator[dict[str, Any]]:
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+    chunksize = max(1, min(32, len(tasks) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=(writer,)) as pool:
+        yield from pool.map(_worker_task, tasks, chunksize=chunksize)
+
+
+class _SampleWriter:
+    """Запись одного сэмпла: кадр → PNG (+ слот шарда) → строка меток.
+
+    Пикается в воркер целиком (генератор + параметры) один раз через initializer.
+    """
+
+    def __init__(
+        self,
+        generator: SampleGenerator,
+        out: Path,
+        image_format: str,
+        frames_per_class: int,
+        shards: ShardWriter | None = None,
+    ) -> None:
+        self.generator = generator
+        self.out = out
+        self.image_format = image_format
+        self.frames_per_class = frames_per_class
+        self.shards = shards
+        self.entropy: tuple[int, ...] = ()  # per-sample режим: база сида (seed[, name_seed])
+
+    def write(self, class_index: int, i: int, rng: np.random.Generator | None) -> dict[str, Any]:
+        frame, label = self.generator.generate_sample(class_index, rng)
+        rel = f"images/{class_index:03d}/{i:05d}.{self.image_format}"
+        imwrite_unicode(self.out / rel, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        if self.shards is not None:
+            self.shards.write(class_index * self.frames_per_class + i, frame)
+        return {"filename": rel, **label.to_dict()}
+
+    def __call__(self, task: _Task) -> dict[str, Any]:
+        """Per-sample задача: собственный rng из (entropy, class_index, i)."""
+        class_index, i = task
+        return self.write(class_index, i, np.random.default_rng((*self.entropy, class_index, i)))
+
+
+_WORKER_WRITER: _SampleWriter | None = None
+
+
+def _init_worker(writer: _SampleWriter) -> None:
+    """Initializer процесса пула: writer (и каталог внутри генератора) — на весь срок воркера."""
+    global _WORKER_WRITER
+    _WORKER_WRITER = writer
+    # параллелизм — на уровне процессов; внутренний пул OpenCV дал бы oversubscription
+    cv2.setNumThreads(1)
+
+
+def _worker_task(task: _Task) -> dict[str, Any]:
+    assert _WORKER_WRITER is not None, "воркер пула не инициализирован"
+    return _WORKER_WRITER(task)
+
+
+def _probe_frame_shape(generator: SampleGenerator) -> tuple[int, ...]:
+    """Форма кадра для выделения шардов: один пробный сэмпл отдельным rng
+    (поток случайности экспорта не затрагивается)."""
+    frame, _ = generator.generate_sample(0, np.random.default_rng(0))
+    return tuple(frame.shape)
+
+
+def _seed_entropy(seed: SeedLike) -> tuple[int, ...]:
+    if isinstance(seed, (int, np.integer)):
+        return (int(seed),)
+    return tuple(int(s) for s in seed)
+
+
+def _read_journal(path: Path, header: dict[str, Any], out: Path) -> list[dict[str, Any]]:
+    """Готовые строки из журнала прерванного экспорта (упорядоченный префикс).
+
+    Оборванная последняя строка или отсутствующий файл изображения обрезают
+    префикс — такие сэмплы будут сгенерированы заново (тем же сидом).
+    Pre:
+      - заголовок журнала совпадает с параметрами текущего экспорта
+    """
+    if not path.is_file():
+        return []
+    with path.open(encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return []
+    try:
+        saved = json.loads(lines[0])
+    except json.JSONDecodeError:
+        return []
+    if saved != header:
+        raise ValueError(f"Журнал {path} от другого экспорта: {saved} != {header}; удалите его или смените out_dir")
+    rows: list[dict[str, Any]] = []
+    for line in lines[1:]:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            break
+        if not (out / row["filename"]).is_file():
+            break
+        rows.append(row)
+    # переписать журнал обрезанным префиксом — дальше он только дописывается
+    with path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return rows
 
 
 def _name_seed(name: str) -> int:
@@ -112,13 +334,20 @@ def export_splits(
     labels_format: LabelsFormat = "csv",
     seed: int = 0,
     progress_cb: Callable[[int, int], None] | None = None,
+    workers: int = 0,
+    resume: bool = False,
+    shard_size: int | None = None,
 ) -> dict[str, Path]:
     """Сформировать несколько наборов (train/val/test) в подкаталогах.
 
     splits — имя набора → кадров на класс, например {"train": 300, "val": 50}.
-    Каждый набор генерируется собственным rng, производным от seed и ИМЕНИ
-    сплита (а не от позиции в dict) — наборы не пересекаются и воспроизводимы
-    независимо от порядка ключей: переставить train/val не меняет данные.
+    Сид привязан к ИМЕНИ сплита (а не к позиции в dict) — наборы не пересекаются
+    и воспроизводимы независимо от порядка ключей:
+      - workers=0 и resume=False — исторический режим: общий rng набора из
+        (seed, _name_seed(name)); тот же seed даёт те же данные, что и раньше;
+      - workers > 0 или resume — per-sample rng из (seed, _name_seed(name), c, i):
+        данные не зависят от числа воркеров, но ОТЛИЧАЮТСЯ от исторического режима.
+    workers/resume/shard_size — см. export_dataset.
 
     Pre:
       - splits не пуст, значения ≥ 1
@@ -129,16 +358,21 @@ def export_splits(
     if not splits:
         raise ValueError("splits пуст — нечего экспортировать")
     result: dict[str, Path] = {}
+    per_sample = workers > 0 or resume
     for name, frames in splits.items():
-        rng = np.random.default_rng((seed, _name_seed(name)))
+        split_seed = (seed, _name_seed(name))
         result[name] = export_dataset(
             generator,
             Path(out_dir) / name,
             frames_per_class=frames,
             image_format=image_format,
             labels_format=labels_format,
-            rng=rng,
+            rng=None if per_sample else np.random.default_rng(split_seed),
             progress_cb=progress_cb,
+            seed=split_seed if per_sample else None,
+            workers=workers,
+            resume=resume,
+            shard_size=shard_size,
         )
     return result
 
@@ -0,0 +1,186 @@
+"""Упакованный формат датасета: uint8-шарды .npy (memmap) + структурный индекс меток.
+
+Опциональный выход export_dataset (shard_size=N) рядом с PNG и labels.*:
+обучение читает кадры срезами memmap вместо PNG-декода на каждый доступ.
+
+Структура:
+    out_dir/shards/
+    ├── meta.json          # версия, count, shard_size, image_shape, список шардов, complete
+    ├── images_00000.npy   # (n, H, W, 3) uint8 RGB, n ≤ shard_size
+    ├── images_00001.npy
+    └── index.npy          # SHARD_INDEX_DTYPE, по записи на сэмпл (порядок = labels.*)
+
+Сэмпл k (линейный индекс: class_index * frames_per_class + i) лежит в шарде
+k // shard_size по смещению k % shard_size. Файлы шардов выделяются целиком
+при создании (open_memmap), поэтому воркеры экспорта пишут в свои слоты
+независимо, а resume переоткрывает их без пересоздания. meta.json с
+complete=true пишется последним — признак целостного набора для читателя.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+SHARDS_DIRNAME = "shards"
+SHARDS_VERSION = 1
+
+#: компактный индекс меток: где лежит кадр + таргеты обучения (без строк)
+SHARD_INDEX_DTYPE = np.dtype(
+    [
+        ("shard", "<u4"),
+        ("offset", "<u4"),
+        ("class_index", "<i4"),
+        ("angle_sin", "<f4"),
+        ("angle_cos", "<f4"),
+        ("angle_valid", "?"),
+    ]
+)
+
+
+def _shard_name(shard: int) -> str:
+    return f"images_{shard:05d}.npy"
+
+
+class ShardWriter:
+    """Запись кадров в предвыделенные memmap-шарды по линейному индексу.
+
+    Пикается без открытых memmap (в воркере пула шарды переоткрываются
+    лениво в режиме r+) — массив не копируется через pickle.
+    """
+
+    def __init__(self, root: Path, count: int, shard_size: int, image_shape: tuple[int, int, int]) -> None:
+        self.root = root
+        self.count = count
+        self.shard_size = shard_size
+        self.image_shape = image_shape
+        #: шарды переоткрыты при resume (False — выделены заново, нулями)
+        self.reused = False
+        self._arrays: dict[int, np.ndarray] = {}
+
+    @classmethod
+    def create(
+        cls,
+        out_dir: Path,
+        count: int,
+        shard_size: int,
+        image_shape: Sequence[int],
+        resume: bool = False,
+    ) -> ShardWriter:
+        """Выделить шарды под count кадров (или переоткрыть совместимые при resume).
+
+        Pre:
+          - count ≥ 1, shard_size ≥ 1, image_shape == (H, W, 3)
+        Post:
+          - writer.reused=False — шарды выделены заново (нулями): готовые строки
+            журнала экспорта больше не подкреплены пикселями
+        """
+        if shard_size < 1:
+            raise ValueError(f"shard_size должен быть >= 1, получено {shard_size}")
+        root = Path(out_dir) / SHARDS_DIRNAME
+        root.mkdir(parents=True, exist_ok=True)
+        shape = tuple(int(v) for v in image_shape)
+        writer = cls(root, count, shard_size, shape)  # type: ignore[arg-type]
+        meta = writer._meta(complete=False)
+        meta_path = root / "meta.json"
+        if resume and meta_path.is_file():
+            saved = json.loads(meta_path.read_text(encoding="utf-8"))
+            saved["complete"] = False
+            if saved == meta and all((root / name).is_file() for name in meta["shards"]):
+                writer.reused = True
+                return writer
+        for shard, name in enumerate(meta["shards"]):
+            n = min(shard_size, count - shard * shard_size)
+            arr = np.lib.format.open_memmap(root / name, mode="w+", dtype=np.uint8, shape=(n, *shape))
+            del arr
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        return writer
+
+    def write(self, k: int, frame: np.ndarray) -> None:
+        """Положить кадр k (HxWx3 uint8 RGB) в его слот."""
+        if frame.shape != self.image_shape:
+            raise ValueError(f"Кадр {k}: форма {frame.shape} != {self.image_shape} (шарды — фиксированного размера)")
+        shard, offset = divmod(k, self.shard_size)
+        arr = self._arrays.get(shard)
+        if arr is None:
+            arr = np.load(self.root / _shard_name(shard), mmap_mode="r+")
+            self._arrays[shard] = arr
+        arr[offset] = frame
+
+    def finalize(self, rows: Sequence[dict[str, Any]]) -> Path:
+        """Сбросить шарды, записать index.npy и meta.json(complete=true).
+
+        Pre:
+          - len(rows) == count, rows в порядке линейного индекса
+        """
+        if len(rows) != self.count:
+            raise ValueError(f"Меток {len(rows)}, а шарды выделены под {self.count}")
+        for arr in self._arrays.values():
+            arr.flush()  # type: ignore[attr-defined]
+        self._arrays.clear()
+        index = np.zeros(self.count, dtype=SHARD_INDEX_DTYPE)
+        k = np.arange(self.count)
+        index["shard"] = k // self.shard_size
+        index["offset"] = k % self.shard_size
+        for name in ("class_index", "angle_sin", "angle_cos"):
+            index[name] = [row[name] for row in rows]
+        index["angle_valid"] = [bool(row["angle_valid"]) for row in rows]
+        np.save(self.root / "index.npy", index)
+        (self.root / "meta.json").write_text(json.dumps(self._meta(complete=True)), encoding="utf-8")
+        return self.root
+
+    def _meta(self, complete: bool) -> dict[str, Any]:
+        n_shards = -(-self.count // self.shard_size)
+        return {
+            "version": SHARDS_VERSION,
+            "count": self.count,
+            "shard_size": self.shard_size,
+            "image_shape": list(self.image_shape),
+            "shards": [_shard_name(s) for s in range(n_shards)],
+            "complete": complete,
+        }
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_arrays"] = {}
+        return state
+
+
+def has_shards(split_dir: str | Path) -> bool:
+    """Есть ли в сплите целостный упакованный набор (meta.json с complete=true)."""
+    meta_path = Path(split_dir) / SHARDS_DIRNAME / "meta.json"
+    if not meta_path.is_file():
+        return False
+    return bool(json.loads(meta_path.read_text(encoding="utf-8")).get("complete"))
+
+
+def read_shard_meta(split_dir: str | Path) -> dict[str, Any]:
+    """Прочитать meta.json упакованного набора.
+
+    Post:
+      - версия поддерживается и набор целостный, иначе ValueError
+    """
+    meta_path = Path(split_dir) / SHARDS_DIRNAME / "meta.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("version") != SHARDS_VERSION:
+        raise ValueError(f"Неподдерживаемая версия шардов {meta.get('version')} в {meta_path}")
+    if not meta.get("complete"):
+        raise ValueError(f"Шарды в {meta_path.parent} не завершены (прерванный экспорт — запустите resume)")
+    return meta
+
+
+def read_shard_index(split_dir: str | Path) -> np.ndarray:
+    """Индекс меток (SHARD_INDEX_DTYPE) — целиком в память, он компактный."""
+    index = np.load(Path(split_dir) / SHARDS_DIRNAME / "index.npy")
+    if index.dtype != SHARD_INDEX_DTYPE:
+        raise ValueError(f"index.npy: dtype {index.dtype} != {SHARD_INDEX_DTYPE}")
+    return index
+
+
+def open_shard_images(split_dir: str | Path, meta: dict[str, Any], mmap_mode: str = "r") -> list[np.ndarray]:
+    """Открыть шарды как memmap (без чтения данных); mmap_mode='c' — copy-on-write."""
+    root = Path(split_dir) / SHARDS_DIRNAME
+    return [np.load(root / name, mmap_mode=mmap_mode) for name in meta["shards"]]  # type: ignore[arg-type]
@@ -5,6 +5,8 @@ from __future__ import annotations
 import csv
 import json
 
+import cv2
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -13,6 +15,16 @@ from Services.dataset_gen.export import export_dataset
 from Services.dataset_gen.preview import save_preview_grid
 
 
+def _interrupt_at(n):
+    """progress_cb, прерывающий экспорт после n-го сэмпла (имитация Ctrl+C)."""
+
+    def cb(done, total):
+        if done == n:
+            raise KeyboardInterrupt
+
+    return cb
+
+
 class TestExportCsv:
     def test_images_and_labels_written(self, base_config, tmp_path):
         engine = DatasetEngine(base_config)
@@ -75,6 +87,136 @@ class TestExportSplits:
         train2 = (r2["train"].parent / "images/000/00000.png").read_bytes()
         assert train1 == train2
 
+    def test_without_workers_keeps_historical_split_rng(self, base_config, tmp_path):
+        # без workers/resume данные сплита — как до per-sample сидов (общий rng сплита)
+        from Services.dataset_gen.export import _name_seed, export_splits
+
+        engine = DatasetEngine(base_config)
+        result = export_splits(engine, tmp_path / "ds", splits={"train": 2}, seed=5)
+        legacy = export_dataset(
+            engine, tmp_path / "legacy", frames_per_class=2, rng=np.random.default_rng((5, _name_seed("train")))
+        )
+        assert result["train"].read_text(encoding="utf-8") == legacy.read_text(encoding="utf-8")
+
+    def test_workers_use_per_sample_seeds(self, base_config, tmp_path):
+        from Services.dataset_gen.export import _name_seed, export_splits
+
+        engine = DatasetEngine(base_config)
+        result = export_splits(engine, tmp_path / "ds", splits={"train": 2}, seed=5, workers=2)
+        seeded = export_dataset(engine, tmp_path / "seeded", frames_per_class=2, seed=(5, _name_seed("train")))
+        assert result["train"].read_text(encoding="utf-8") == seeded.read_text(encoding="utf-8")
+
+
+class TestExportSeeded:
+    """Per-sample сиды: данные не зависят от числа воркеров, экспорт возобновляем."""
+
+    @staticmethod
+    def _images(root):
+        return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.glob("images/*/*.png"))}
+
+    def test_parallel_bit_identical_to_inprocess(self, base_config, tmp_path):
+        engine = DatasetEngine(base_config)
+        p0 = export_dataset(engine, tmp_path / "w0", frames_per_class=3, seed=11)
+        p2 = export_dataset(engine, tmp_path / "w2", frames_per_class=3, seed=11, workers=2)
+
+        assert p0.read_text(encoding="utf-8") == p2.read_text(encoding="utf-8")
+        images0 = self._images(tmp_path / "w0")
+        assert len(images0) == 9
+        assert images0 == self._images(tmp_path / "w2")
+        assert not (tmp_path / "w2" / "labels.partial.jsonl").exists()
+
+    def test_resume_after_interrupt(self, base_config, tmp_path):
+        engine = DatasetEngine(base_config)
+        reference = export_dataset(engine, tmp_path / "ref", frames_per_class=3, seed=4)
+
+        out = tmp_path / "ds"
+        with pytest.raises(KeyboardInterrupt):
+            export_dataset(engine, out, frames_per_class=3, seed=4, progress_cb=_interrupt_at(4))
+        assert (out / "labels.partial.jsonl").is_file()
+
+        calls: list[tuple[int, int]] = []
+        labels = export_dataset(
+            engine, out, frames_per_class=3, seed=4, resume=True, progress_cb=lambda d, t: calls.append((d, t))
+        )
+        assert calls[0] == (4, 9)  # 4 сэмпла взяты из журнала
+        assert calls[-1] == (9, 9)
+        assert labels.read_text(encoding="utf-8") == reference.read_text(encoding="utf-8")
+        assert self._images(out) == self._images(tmp_path / "ref")
+
+    def test_resume_rejects_foreign_journal(self, base_config, tmp_path):
+        engine = DatasetEngine(base_config)
+        out = tmp_path / "ds"
+        with pytest.raises(KeyboardInterrupt):
+            export_dataset(engine, out, frames_per_class=2, seed=1, progress_cb=_interrupt_at(1))
+        with pytest.raises(ValueError, match="другого экспорта"):
+            export_dataset(engine, out, frames_per_class=2, seed=2, resume=True)
+
+    def test_workers_require_seed(self, base_config, tmp_path):
+        engine = DatasetEngine(base_config)
+        with pytest.raises(ValueError, match="seed"):
+            export_dataset(engine, tmp_path / "ds", frames_per_class=1, workers=2)
+
+
+class TestExportShards:
+    def test_shards_match_png_and_labels(self, base_config, tmp_path):
+        from Services.dataset_gen.shards import has_shards, open_shard_images, read_shard_index, read_shard_meta
+
+        engine = DatasetEngine(base_config)
+        out = tmp_path / "ds"
+        labels_path = export_dataset(engine, out, frames_per_class=3, seed=2, workers=2, shard_size=4)
+
+        assert has_shards(out)
+        meta = read_shard_meta(out)
+        assert meta["count"] == 9 and len(meta["shards"]) == 3  # 4 + 4 + 1
+        index = read_shard_index(out)
+        images = open_shard_images(out, meta)
+        with labels_path.open(encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for rec, row in zip(index, rows):
+            assert rec["class_index"] == int(row["class_index"])
+            assert rec["angle_valid"] == (row["angle_valid"] == "True")
+            png = cv2.cvtColor(cv2.imread(str(out / row["filename"])), cv2.COLOR_BGR2RGB)
+            assert np.array_equal(images[rec["shard"]][rec["offset"]], png)  # PNG без потерь
+
+    def test_incomplete_shards_not_reported(self, base_config, tmp_path):
+        from Services.dataset_gen.shards import has_shards, read_shard_meta
+
+        engine = DatasetEngine(base_config)
+        out = tmp_path / "ds"
+        with pytest.raises(KeyboardInterrupt):
+            export_dataset(engine, out, frames_per_class=2, seed=1, shard_size=4, progress_cb=_interrupt_at(2))
+        assert not has_shards(out)
+        with pytest.raises(ValueError, match="не завершены"):
+            read_shard_meta(out)
+
+        export_dataset(engine, out, frames_per_class=2, seed=1, shard_size=4, resume=True)
+        assert has_shards(out)
+
+    def test_reallocated_shards_discard_journal(self, base_config, tmp_path):
+        from Services.dataset_gen.shards import open_shard_images, read_shard_index, read_shard_meta
+
+        engine = DatasetEngine(base_config)
+        out = tmp_path / "ds"
+        with pytest.raises(KeyboardInterrupt):
+            export_dataset(engine, out, frames_per_class=2, seed=1, shard_size=4, progress_cb=_interrupt_at(2))
+
+        # другой shard_size → meta не совпала, шарды выделены заново нулями
+        calls: list[tuple[int, int]] = []
+        export_dataset(
+            engine,
+            out,
+            frames_per_class=2,
+            seed=1,
+            shard_size=3,
+            resume=True,
+            progress_cb=lambda d, t: calls.append((d, t)),
+        )
+        assert calls[0] == (1, 6)  # журнал отброшен — генерация с первого сэмпла
+        meta = read_shard_meta(out)
+        images = open_shard_images(out, meta)
+        for rec in read_shard_index(out):
+            assert images[rec["shard"]][rec["offset"]].any()
+
 
 class TestExportParquet:
     def test_parquet_labels_roundtrip(self, base_config, tmp_path):
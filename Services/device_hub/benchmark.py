@@ -0,0 +1,133 @@
+"""Бенчмарк опроса устройств: поток-на-устройство vs DeviceReactor (tags/sec).
+
+Поднимает тестовый Modbus-slave (``Services.modbus.server``) и опрашивает его
+N «устройствами» (у каждого своё TCP-соединение и карта из ``--tags`` регистров)
+двумя способами:
+
+* ``threads`` — прежний runtime: поток на устройство, sync GenericModbusDriver,
+  ``tick(); sleep(interval)``;
+* ``reactor`` — DeviceReactor + GenericModbusDriver с ``async_io`` (async-клиент,
+  слитые чтения, один event loop).
+
+Запуск::
+
+    python -m Services.device_hub.benchmark --devices 1,5,10,20 --tags 20 --seconds 3
+    python -m Services.device_hub.benchmark --stride 2   # теги через регистр — без слияния
+
+Результат — таблица tags/sec и число потоков процесса по каждому N.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from typing import Any
+
+from Services.device_hub.drivers.generic_modbus_driver import GenericModbusDriver
+from Services.device_hub.reactor import DeviceReactor
+from Services.device_hub.registry.entry import DeviceEntry
+
+
+def _protocol(tags: int, stride: int) -> Any:
+    from Services.modbus.core.protocol_file import DeviceProtocol, RegisterMeta
+    from Services.modbus.core.register_map import Reg, RegisterMap
+
+    names = [f"t{i}" for i in range(tags)]
+    return DeviceProtocol(
+        name="bench",
+        kind="generic_modbus",
+        description="",
+        register_map=RegisterMap({n: Reg(i * stride) for i, n in enumerate(names)}),
+        meta={n: RegisterMeta(name=n, kind="reg", access="r") for n in names},
+    )
+
+
+def _drivers(n: int, port: int, tags: int, stride: int, *, async_io: bool) -> list[GenericModbusDriver]:
+    drivers = []
+    for i in range(n):
+        entry = DeviceEntry(
+            id=f"dev{i}",
+            name=f"dev{i}",
+            kind="generic_modbus",
+            transport={"type": "tcp", "host": "127.0.0.1", "port": port, "timeout_sec": 3.0},
+            params={"async_io": async_io},
+        )
+        drv = GenericModbusDriver(entry, _protocol(tags, stride))
+        if not drv.connect():
+            raise RuntimeError(f"dev{i}: нет соединения с 127.0.0.1:{port}")
+        drivers.append(drv)
+    return drivers
+
+
+def _run_threads(drivers: list[GenericModbusDriver], seconds: float, interval: float) -> tuple[int, int]:
+    stop = threading.Event()
+    counts = [0] * len(drivers)
+
+    def loop(idx: int, drv: GenericModbusDriver) -> None:
+        while not stop.is_set():
+            counts[idx] += len((drv.tick(stop) or {}).get("values", {}))
+            time.sleep(interval)
+
+    threads = [threading.Thread(target=loop, args=(i, d), daemon=True) for i, d in enumerate(drivers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    peak = threading.active_count()
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts), peak
+
+
+def _run_reactor(drivers: list[GenericModbusDriver], seconds: float, interval: float) -> tuple[int, int]:
+    total = [0]
+
+    def on_tick(_dev_id: str, _drv: Any, snapshot: dict | None) -> None:
+        total[0] += len((snapshot or {}).get("values", {}))
+
+    reactor = DeviceReactor(on_tick)
+    stop = threading.Event()
+    worker = threading.Thread(target=reactor.run, args=(stop,), daemon=True)
+    worker.start()
+    for drv in drivers:
+        reactor.add(drv.entry.id, drv, interval)
+    time.sleep(seconds)
+    peak = threading.active_count()
+    stop.set()
+    worker.join()
+    return total[0], peak
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Точка входа CLI."""
+    parser = argparse.ArgumentParser(prog="python -m Services.device_hub.benchmark")
+    parser.add_argument("--devices", default="1,5,10,20", help="число устройств через запятую")
+    parser.add_argument("--tags", type=int, default=20, help="регистров на устройство")
+    parser.add_argument("--stride", type=int, default=1, help="шаг адресов тегов (1 — смежные)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="длительность прогона")
+    parser.add_argument("--interval", type=float, default=0.01, help="период опроса устройства, с")
+    parser.add_argument("--port", type=int, default=5030, help="порт тестового slave")
+    args = parser.parse_args(argv)
+
+    from Services.modbus.server import run_test_server
+
+    size = max(300, args.tags * args.stride + 1)
+    threading.Thread(target=run_test_server, kwargs={"port": args.port, "size": size}, daemon=True).start()
+    time.sleep(1.0)
+
+    print(f"\n{'devices':>8} {'mode':>8} {'tags/sec':>10} {'threads':>8}")
+    for n in (int(x) for x in args.devices.split(",")):
+        for mode, runner, async_io in (("threads", _run_threads, False), ("reactor", _run_reactor, True)):
+            drivers = _drivers(n, args.port, args.tags, args.stride, async_io=async_io)
+            try:
+                tags, peak = runner(drivers, args.seconds, args.interval)
+            finally:
+                for drv in drivers:
+                    drv.disconnect()
+            print(f"{n:>8} {mode:>8} {tags / args.seconds:>10,.0f} {peak:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
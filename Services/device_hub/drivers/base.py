@@ -31,6 +31,11 @@ class BaseDeviceDriver(BaseManager, ObservableMixin):
         tick(stop_event) -> dict | None — один шаг поллинга
         call(op, args) -> dict — диспетчер операций
 
+    Опционально: ``async_capable`` + ``tick_async()`` — неблокирующий опрос в
+    event loop DeviceReactor'а (см. GenericModbusDriver).
+    ``slow_tick = True`` — tick штатно блокирует надолго (RobotDriver ждёт
+    условий), DeviceReactor сразу выделяет устройству собственный поток.
+
     Args:
         entry:    DeviceEntry описывающий устройство.
         protocol: DeviceProtocol или None (hikvision).
@@ -39,6 +44,7 @@ class BaseDeviceDriver(BaseManager, ObservableMixin):
     """
 
     kind: str = ""
+    slow_tick: bool = False
 
     def __init__(
         self,
@@ -116,6 +122,16 @@ class BaseDeviceDriver(BaseManager, ObservableMixin):
         """Один шаг поллинга -> snapshot или None."""
         raise NotImplementedError
 
+    @property
+    def async_capable(self) -> bool:
+        """True — драйвер опрашивается ``await tick_async()`` прямо в event loop
+        DeviceReactor'а; иначе блокирующий ``tick()`` уходит в пул потоков."""
+        return False
+
+    async def tick_async(self) -> dict | None:
+        """Async-шаг поллинга (только при ``async_capable``)."""
+        raise NotImplementedError
+
     def call(self, op: str, args: dict) -> dict:
         """Диспетчер операций."""
         return {"status": "error", "message": f"Неизвестная операция: {op!r}"}
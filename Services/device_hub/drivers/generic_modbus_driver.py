@@ -5,10 +5,18 @@
     call: read {name}, write {values} — с валидацией access/min/max из meta.
 
 Транспорт строится через build_transport (tcp/rtu/bridge).
+
+Async-опрос (``params.async_io: true``, только transport tcp): tick выполняет
+DeviceReactor в своём event loop через ``tick_async`` — смежные записи карты
+сливаются в чтения (``plan_reads``), чтения идут через отдельное
+``AsyncModbusTcpClient``-соединение (``params.max_inflight`` — глубина конвейера,
+дефолт 1). Команды read/write по-прежнему — sync-транспорт (mailbox-транзакции
+под Lock ModbusDevice).
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from Services.device_hub.drivers.base import BaseDeviceDriver
@@ -21,6 +29,7 @@ class GenericModbusDriver(BaseDeviceDriver):
         entry:     DeviceEntry с kind=generic_modbus.
         protocol:  DeviceProtocol (обязателен — без него нечего читать).
         transport: Инъекция RegisterTransport для тестов.
+        async_transport: Инъекция async-клиента (корутина ``read_registers``) для тестов.
     """
 
     kind = "generic_modbus"
@@ -31,12 +40,21 @@ class GenericModbusDriver(BaseDeviceDriver):
         protocol: Any = None,
         *,
         transport: Any = None,
+        async_transport: Any = None,
         clock: Any = None,
         sleep: Any = None,
     ) -> None:
         super().__init__(entry, protocol, clock=clock, sleep=sleep)
         self._transport = transport
         self._device: Any = None  # RegisterTransport (ModbusDevice или bridge)
+        self._async_client: Any = async_transport
+        self._async_injected = async_transport is not None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        params = getattr(entry, "params", {}) or {}
+        transport_cfg = getattr(entry, "transport", {}) or {}
+        self._async_io = self._async_injected or (
+            bool(params.get("async_io", False)) and transport_cfg.get("type") == "tcp"
+        )
 
     # ------------------------------------------------------------------ #
     # Соединение
@@ -85,8 +103,13 @@ class GenericModbusDriver(BaseDeviceDriver):
                 self._device.disconnect()
             except Exception:
                 pass
+        self._close_async_client()
         self._last_quality = "bad"
 
+    @property
+    def async_capable(self) -> bool:
+        return self._async_io
+
     # ------------------------------------------------------------------ #
     # Tick
     # ------------------------------------------------------------------ #
@@ -116,14 +139,81 @@ class GenericModbusDriver(BaseDeviceDriver):
         # Теперь good — только полный набор; частичный — "stale" (тот же
         # деградированный код, что у vfd_driver при bridge_alive=False);
         # полный провал/нет r-записей вовсе — "bad".
-        if total == 0 or not values:
-            quality = "bad"
-        elif len(values) == total:
-            quality = "good"
-        else:
-            quality = "stale"
+        return self.snapshot(data={"values": values}, quality=_quality(total, values))
+
+    async def tick_async(self) -> dict | None:
+        """Async-tick (DeviceReactor): слитые чтения r/rw-записей одним проходом.
+
+        Чтения разных блоков ждут ответа одновременно (конвейер при
+        ``max_inflight > 1``); ошибка блока помечает только его записи.
+        """
+        if not self.is_connected or self.protocol is None:
+            return self.snapshot(quality="bad")
+        from Services.modbus.core.read_plan import plan_reads
+
+        rmap = self.protocol.register_map
+        names = [name for name, meta in self.protocol.meta.items() if meta.access in ("r", "rw")]
+        try:
+            client = await self._ensure_async_client()
+        except Exception:
+            self._record_err()
+            return self.snapshot(data={"values": {}}, quality=_quality(len(names), {}))
+
+        spans = plan_reads([("hr", *rmap.span(name)) for name in names])
+        t0 = self._clock()
+        results = await asyncio.gather(
+            *(client.read_registers(span.address, span.count) for span in spans), return_exceptions=True
+        )
+        latency = (self._clock() - t0) * 1000
+        values: dict[str, Any] = {}
+        for span, words in zip(spans, results, strict=True):
+            if isinstance(words, BaseException):
+                # Счёт по записям, как в sync tick(): блок — это несколько имён.
+                for _ in span.members:
+                    self._record_err()  # обрыв — переподключит connect() следующего тика
+                continue
+            for idx in span.members:
+                address, count = rmap.span(names[idx])
+                offset = address - span.address
+                values[names[idx]] = rmap.decode(names[idx], words[offset : offset + count])
+                self._record_ok(latency)
+        ordered = {name: values[name] for name in names if name in values}
+        return self.snapshot(data={"values": ordered}, quality=_quality(len(names), ordered))
+
+    async def _ensure_async_client(self) -> Any:
+        """Async-соединение — лениво, в event loop reactor'а (переподключение после обрыва)."""
+        if self._async_client is None:
+            from Services.modbus.sdk.async_tcp import AsyncModbusTcpClient
 
-        return self.snapshot(data={"values": values}, quality=quality)
+            t = self.entry.transport
+            params = getattr(self.entry, "params", {}) or {}
+            self._async_client = AsyncModbusTcpClient(
+                t.get("host", "127.0.0.1"),
+                int(t.get("port", 502)),
+                unit_id=int(t.get("unit_id", 1)),
+                timeout_sec=float(t.get("timeout_sec", 1.0)),
+                max_inflight=int(params.get("max_inflight", 1)),
+                tcp_nodelay=bool(t.get("tcp_nodelay", True)),
+            )
+        connect = getattr(self._async_client, "connect", None)
+        if connect is not None:
+            await connect()
+        self._async_loop = asyncio.get_running_loop()
+        return self._async_client
+
+    def _close_async_client(self) -> None:
+        """Закрыть async-соединение из любого потока (close — в его event loop)."""
+        client, loop = self._async_client, self._async_loop
+        if self._async_injected or client is None:
+            return
+        self._async_client = None
+        self._async_loop = None
+        if loop is None or getattr(client, "close", None) is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(client.close(), loop)
+        except RuntimeError:  # no-health: loop reactor'а уже остановлен — сокет закроет GC
+            pass
 
     # ------------------------------------------------------------------ #
     # Call
@@ -186,3 +276,12 @@ class GenericModbusDriver(BaseDeviceDriver):
         except Exception as exc:
             self._record_err()
             return {"status": "error", "message": str(exc)}
+
+
+def _quality(total: int, values: dict[str, Any]) -> str:
+    """good — прочитан полный набор r-записей, stale — частично, bad — ничего/нечего."""
+    if total == 0 or not values:
+        return "bad"
+    if len(values) == total:
+        return "good"
+    return "stale"
@@ -44,6 +44,8 @@ class RobotDriver(BaseDeviceDriver):
     """
 
     kind = "robot"
+    # tick ждёт условий робота (_wait_condition) — свой поток в DeviceReactor.
+    slow_tick = True
 
     def __init__(
         self,
@@ -973,6 +975,8 @@ class RobotDriver(BaseDeviceDriver):
             draw_pass_size=int(p.get("draw_pass_size", PTS_MAX)),
             draw_verify=bool(p.get("draw_verify", True)),
             draw_retry=int(p.get("draw_retry", 1)),
+            # Конвейер проходов (второй банк буфера) — только с прошивкой, знающей REG_DRAW_BANK.
+            draw_pipeline=bool(p.get("draw_pipeline", False)),
         )
         return RobotClient(
             config,
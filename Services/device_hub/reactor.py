@@ -0,0 +1,315 @@
+"""DeviceReactor — единый asyncio-runtime опроса устройств (вместо потока на устройство).
+
+Раньше каждое подключённое устройство получало свой поток ``tick_loop`` с
+``time.sleep(poll_interval_s)``: десятки ПЧ/PLC = десятки потоков, дерущихся за
+GIL, дрейф периода (sleep ПОСЛЕ работы) и рваная телеметрия. Reactor — один
+поток с event loop:
+
+* **Дедлайны, а не sleep.** У устройства своя сетка ``t0 + k·interval``; тик
+  стартует в свой дедлайн, длительность тика период не растягивает. Тик,
+  не уложившийся в период, пропускает просроченные слоты (``overruns``) —
+  очередь «догоняющих» тиков не копится.
+* **Async-драйверы** (``async_capable`` + ``async def tick_async()``) исполняются
+  прямо в loop: пока одно устройство ждёт ответа, остальные шлют свои запросы
+  (async-транспорт — ``Services.modbus.sdk.async_tcp``).
+* **Блокирующие драйверы** (обычный ``tick(stop_event)``) — через общий
+  ThreadPoolExecutor ограниченного размера: блокирующий I/O не держит loop, а
+  число потоков не растёт с числом устройств.
+* **Медленные драйверы** (``slow_tick = True`` — робот ждёт условий секундами —
+  или тик дольше ``slow_tick_s``) переезжают на собственный поток: несколько
+  долгих тиков не занимают общий пул и не останавливают опрос остальных.
+* **Один тик устройства за раз.** Отменённая задача не прерывает поток пула,
+  поэтому повторный ``add`` (после ``remove`` или замены) сперва дожидается
+  недоделанного тика прежнего слота и только потом опрашивает драйвер.
+
+Потокобезопасность: ``add``/``remove`` зовутся из любых потоков (supervisor,
+командный поток) — изменения применяет сам loop. Колбэки ``on_tick``/``on_error``
+исполняются в потоке loop'а и должны быть быстрыми (публикация в state).
+
+Класс не зависит от плагина: ``run(stop_event, pause_event)`` — обычная
+worker-функция WorkerManager'а.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+TickCallback = Callable[[str, Any, "dict | None"], None]
+ErrorCallback = Callable[[str, Exception], None]
+
+# Период проверки stop/pause-событий (threading.Event) из loop'а.
+_CONTROL_POLL_S = 0.05
+
+# Блокирующий тик дольше порога -> устройство получает собственный поток.
+_SLOW_TICK_S = 0.5
+
+
+class _DeviceSlot:
+    """Расписание и счётчики одного устройства внутри reactor'а."""
+
+    __slots__ = (
+        "driver",
+        "interval",
+        "stop",
+        "task",
+        "slow",
+        "executor",
+        "ticks",
+        "errors",
+        "overruns",
+        "last_ms",
+        "max_ms",
+        "lag_ms",
+    )
+
+    def __init__(self, driver: Any, interval: float, slow: bool = False) -> None:
+        self.driver = driver
+        self.interval = interval
+        # Собственный stop_event устройства: remove прерывает долгий блокирующий
+        # tick (robot._wait_condition) так же, как раньше remove_worker.
+        self.stop = threading.Event()
+        self.task: asyncio.Task | None = None
+        # Медленное устройство тикает в своём однопоточном executor'е (создаёт loop).
+        self.slow = slow or bool(getattr(driver, "slow_tick", False))
+        self.executor: ThreadPoolExecutor | None = None
+        self.ticks = 0
+        self.errors = 0
+        self.overruns = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.lag_ms = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "interval_s": self.interval,
+            "dedicated_io": self.slow,
+            "ticks": self.ticks,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "tick_ms_last": round(self.last_ms, 3),
+            "tick_ms_max": round(self.max_ms, 3),
+            "start_lag_ms": round(self.lag_ms, 3),
+        }
+
+
+class DeviceReactor:
+    """Планировщик тиков всех устройств в одном event loop.
+
+    Args:
+        on_tick:        ``(dev_id, driver, snapshot)`` после каждого тика.
+        on_error:       ``(dev_id, exc)`` при исключении тика (или колбэка).
+        blocking_workers: Размер общего пула для блокирующих ``tick()``.
+        slow_tick_s:    Блокирующий тик не короче порога переводит устройство
+                        на собственный поток.
+        clock:          Монотонные часы (подменяются в тестах).
+    """
+
+    def __init__(
+        self,
+        on_tick: TickCallback,
+        on_error: ErrorCallback | None = None,
+        *,
+        blocking_workers: int = 8,
+        slow_tick_s: float = _SLOW_TICK_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if blocking_workers < 1:
+            raise ValueError(f"blocking_workers: ожидается >= 1, получено {blocking_workers}")
+        self._on_tick = on_tick
+        self._on_error = on_error
+        self._blocking_workers = blocking_workers
+        self._slow_tick_s = slow_tick_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots: dict[str, _DeviceSlot] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._changed: asyncio.Event | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Незавершённый блокирующий тик по dev_id — переживает remove/замену слота.
+        self._inflight: dict[str, Future] = {}
+
+    # ------------------------------------------------------------------ #
+    # Публичный API (любой поток)
+    # ------------------------------------------------------------------ #
+
+    def add(self, dev_id: str, driver: Any, interval_s: float) -> None:
+        """Поставить устройство на опрос с периодом ``interval_s`` (повторный add — замена)."""
+        if interval_s <= 0:
+            raise ValueError(f"{dev_id}: interval_s должен быть > 0, получено {interval_s}")
+        with self._lock:
+            old = self._slots.get(dev_id)
+            if old is not None:
+                old.stop.set()
+            self._slots[dev_id] = _DeviceSlot(driver, float(interval_s))
+        self._wake()
+
+    def remove(self, dev_id: str) -> bool:
+        """Снять устройство с опроса. True — устройство было в reactor'е."""
+        with self._lock:
+            slot = self._slots.pop(dev_id, None)
+        if slot is None:
+            return False
+        slot.stop.set()
+        self._wake()
+        return True
+
+    def __contains__(self, dev_id: str) -> bool:
+        with self._lock:
+            return dev_id in self._slots
+
+    def device_ids(self) -> list[str]:
+        """Устройства на опросе."""
+        with self._lock:
+            return list(self._slots)
+
+    def stats(self) -> dict[str, Any]:
+        """Счётчики расписания: {devices, overruns, per_device: {id: {...}}}."""
+        with self._lock:
+            per = {dev_id: slot.to_dict() for dev_id, slot in self._slots.items()}
+        return {
+            "devices": len(per),
+            "overruns": sum(s["overruns"] for s in per.values()),
+            "per_device": per,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Worker-функция
+    # ------------------------------------------------------------------ #
+
+    def run(self, stop_event: threading.Event, pause_event: threading.Event | None = None) -> None:
+        """Крутить event loop до ``stop_event`` (блокирует вызывающий поток)."""
+        asyncio.run(self._main(stop_event, pause_event or threading.Event()))
+
+    async def _main(self, stop_event: threading.Event, pause_event: threading.Event) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._executor = ThreadPoolExecutor(self._blocking_workers, thread_name_prefix="device_io")
+        running: dict[str, _DeviceSlot] = {}
+        try:
+            while not stop_event.is_set():
+                self._changed.clear()
+                self._sync_tasks(running, pause_event)
+                try:
+                    await asyncio.wait_for(self._changed.wait(), _CONTROL_POLL_S)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for slot in running.values():
+                slot.stop.set()
+                if slot.task is not None:
+                    slot.task.cancel()
+            await asyncio.gather(*(s.task for s in running.values() if s.task is not None), return_exceptions=True)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._loop = None
+            # Состав устройств переживает рестарт worker'а: свежие слоты (stop не выставлен).
+            with self._lock:
+                self._slots = {k: _DeviceSlot(v.driver, v.interval, v.slow) for k, v in self._slots.items()}
+
+    def _wake(self) -> None:
+        loop, changed = self._loop, self._changed
+        if loop is not None and changed is not None:
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:  # loop уже закрыт — изменения применит следующий run()
+                pass
+
+    def _sync_tasks(self, running: dict[str, _DeviceSlot], pause_event: threading.Event) -> None:
+        """Привести задачи loop'а к составу ``_slots`` (add/remove из других потоков)."""
+        with self._lock:
+            wanted = dict(self._slots)
+        for dev_id, slot in list(running.items()):
+            if wanted.get(dev_id) is not slot:
+                if slot.task is not None:
+                    slot.task.cancel()
+                del running[dev_id]
+        assert self._loop is not None
+        for dev_id, slot in wanted.items():
+            if dev_id not in running:
+                slot.task = self._loop.create_task(self._device_loop(dev_id, slot, pause_event), name=f"dev_{dev_id}")
+                running[dev_id] = slot
+
+    async def _device_loop(self, dev_id: str, slot: _DeviceSlot, pause_event: threading.Event) -> None:
+        """Задача устройства: дождаться тика прежнего слота, затем крутить свою сетку."""
+        assert self._loop is not None
+        driver = slot.driver
+        tick_async = getattr(driver, "tick_async", None)
+        is_async = bool(getattr(driver, "async_capable", False)) and inspect.iscoroutinefunction(tick_async)
+        try:
+            await self._await_inflight(dev_id)
+            await self._tick_loop(dev_id, slot, driver, tick_async if is_async else None, pause_event)
+        finally:
+            if slot.executor is not None:
+                slot.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _tick_loop(
+        self, dev_id: str, slot: _DeviceSlot, driver: Any, tick_async: Any, pause_event: threading.Event
+    ) -> None:
+        """Тики одного устройства по сетке дедлайнов ``t0 + k·interval``."""
+        deadline = self._clock()
+        while not slot.stop.is_set():
+            delay = deadline - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if pause_event.is_set():
+                deadline = self._clock() + slot.interval
+                continue
+            t0 = self._clock()
+            slot.lag_ms = max(0.0, (t0 - deadline) * 1000.0)
+            try:
+                if tick_async is not None:
+                    snapshot = await tick_async()
+                else:
+                    snapshot = await self._tick_blocking(dev_id, slot)
+                if not slot.stop.is_set():
+                    self._on_tick(dev_id, driver, snapshot)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - contain: сбой устройства не роняет reactor
+                slot.errors += 1
+                if self._on_error is not None:
+                    self._on_error(dev_id, exc)
+            slot.ticks += 1
+            now = self._clock()
+            slot.last_ms = (now - t0) * 1000.0
+            slot.max_ms = max(slot.max_ms, slot.last_ms)
+            deadline += slot.interval
+            if deadline <= now:
+                missed = math.floor((now - deadline) / slot.interval) + 1
+                slot.overruns += missed
+                deadline += missed * slot.interval
+
+    async def _tick_blocking(self, dev_id: str, slot: _DeviceSlot) -> dict | None:
+        """Блокирующий tick в пуле; долгий тик переводит устройство на свой поток."""
+        if slot.slow and slot.executor is None:
+            slot.executor = ThreadPoolExecutor(1, thread_name_prefix=f"device_io_{dev_id}")
+        assert self._executor is not None
+        future = (slot.executor or self._executor).submit(slot.driver.tick, slot.stop)
+        with self._lock:
+            self._inflight[dev_id] = future
+        future.add_done_callback(partial(self._forget_inflight, dev_id))
+        t0 = self._clock()
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            if not slot.slow and self._clock() - t0 >= self._slow_tick_s:
+                slot.slow = True
+
+    def _forget_inflight(self, dev_id: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(dev_id) is future:
+                del self._inflight[dev_id]
+
+    async def _await_inflight(self, dev_id: str) -> None:
+        """Дождаться тика прежнего слота ``dev_id`` (поток пула отмена не прерывает)."""
+        with self._lock:
+            future = self._inflight.get(dev_id)
+        if future is not None and not future.done():
+            await asyncio.wait([asyncio.wrap_future(future)])
@@ -241,3 +241,80 @@ class TestGenericModbusCallWrite:
     def test_unknown_op(self, driver) -> None:
         result = driver.call("delete", {})
         assert result["status"] == "error"
+
+
+# ------------------------------------------------------------------ #
+# Async-tick (DeviceReactor, params.async_io)
+# ------------------------------------------------------------------ #
+
+
+class FakeAsyncClient:
+    """Async-клиент поверх FakeRegisterTransport: журнал чтений + сбой по адресу."""
+
+    def __init__(self, regs: FakeRegisterTransport) -> None:
+        self._regs = regs
+        self.reads: list[tuple[int, int]] = []
+        self.fail_address: int | None = None
+
+    async def read_registers(self, address: int, count: int = 1) -> list[int]:
+        self.reads.append((address, count))
+        if address == self.fail_address:
+            raise OSError("fake: нет ответа")
+        return self._regs.read_registers(address, count)
+
+
+def _async_driver(
+    entry, transport, clock, rmap: RegisterMap, meta: dict
+) -> tuple[GenericModbusDriver, FakeAsyncClient]:
+    proto = DeviceProtocol(name="p", kind="generic_modbus", description="", register_map=rmap, meta=meta)
+    client = FakeAsyncClient(transport)
+    d = GenericModbusDriver(entry, proto, transport=transport, async_transport=client, clock=clock.clock)
+    d.connect()
+    return d, client
+
+
+def test_async_tick_coalesces_adjacent_reads(entry, transport, clock) -> None:
+    import asyncio
+
+    rmap = RegisterMap({"a": Reg(0x10), "b": Reg(0x11), "c": Reg(0x12, scale=10), "far": Reg(0x40)})
+    meta = {n: RegisterMeta(name=n, kind="reg", access="r") for n in ("a", "b", "c", "far")}
+    transport._regs.update({0x10: 1, 0x11: 2, 0x12: 35, 0x40: 9})
+    d, client = _async_driver(entry, transport, clock, rmap, meta)
+    assert d.async_capable
+    snap = asyncio.run(d.tick_async())
+    assert snap["values"] == {"a": 1, "b": 2, "c": 3.5, "far": 9}
+    assert snap["quality"] == "good"
+    assert sorted(client.reads) == [(0x10, 3), (0x40, 1)]
+
+
+def test_async_tick_failed_span_is_stale(entry, transport, clock) -> None:
+    import asyncio
+
+    rmap = RegisterMap({"a": Reg(0x10), "far": Reg(0x40)})
+    meta = {n: RegisterMeta(name=n, kind="reg", access="r") for n in ("a", "far")}
+    d, client = _async_driver(entry, transport, clock, rmap, meta)
+    client.fail_address = 0x40
+    snap = asyncio.run(d.tick_async())
+    assert snap["values"] == {"a": 0}
+    assert snap["quality"] == "stale"
+    assert d.stats["tx_err"] == 1
+
+
+def test_async_tick_counts_per_record_like_sync_tick(entry, transport, clock) -> None:
+    """tx_ok/tx_err — по записям, как в sync tick(): упавший слитый блок = все его имена."""
+    import asyncio
+
+    rmap = RegisterMap({"a": Reg(0x10), "b": Reg(0x11), "c": Reg(0x12), "far": Reg(0x40)})
+    meta = {n: RegisterMeta(name=n, kind="reg", access="r") for n in ("a", "b", "c", "far")}
+    d, client = _async_driver(entry, transport, clock, rmap, meta)
+    client.fail_address = 0x10
+    asyncio.run(d.tick_async())
+    assert (d.stats["tx_ok"], d.stats["tx_err"]) == (1, 3)
+
+
+def test_async_io_requires_tcp_param(transport, clock) -> None:
+    tcp = DeviceEntry(id="x", name="x", kind="generic_modbus", transport={"type": "tcp"}, params={"async_io": True})
+    rtu = DeviceEntry(id="y", name="y", kind="generic_modbus", transport={"type": "rtu"}, params={"async_io": True})
+    assert GenericModbusDriver(tcp, _make_protocol()).async_capable is True
+    assert GenericModbusDriver(rtu, _make_protocol()).async_capable is False
+    assert GenericModbusDriver(tcp, _make_protocol(), transport=transport).async_capable is True
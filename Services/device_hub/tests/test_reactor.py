@@ -0,0 +1,221 @@
+"""Тесты DeviceReactor: дедлайны, блокирующие и async-драйверы, remove, изоляция сбоев."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from Services.device_hub.reactor import DeviceReactor
+
+
+class BlockingDriver:
+    """Sync-драйвер: tick блокирует поток на ``work_s`` (как Modbus-чтение)."""
+
+    def __init__(self, work_s: float = 0.0, fail: bool = False) -> None:
+        self.work_s = work_s
+        self.fail = fail
+        self.threads: set[str] = set()
+        self.stop_seen: list[threading.Event] = []
+
+    def tick(self, stop_event: Any = None) -> dict:
+        self.threads.add(threading.current_thread().name)
+        self.stop_seen.append(stop_event)
+        if self.fail:
+            raise RuntimeError("fake: устройство не отвечает")
+        time.sleep(self.work_s)
+        return {"quality": "good"}
+
+
+class AsyncDriver:
+    """Async-драйвер: tick_async ждёт «ответа» ``work_s`` не блокируя loop."""
+
+    async_capable = True
+
+    def __init__(self, work_s: float = 0.0) -> None:
+        self.work_s = work_s
+        self.ticks = 0
+
+    def tick(self, stop_event: Any = None) -> dict:  # pragma: no cover - не должен вызываться
+        raise AssertionError("async-драйвер опрашивается tick_async")
+
+    async def tick_async(self) -> dict:
+        self.ticks += 1
+        await asyncio.sleep(self.work_s)
+        return {"quality": "good"}
+
+
+class _Running:
+    """Reactor в фоновом потоке на время теста."""
+
+    def __init__(self, reactor: DeviceReactor) -> None:
+        self.reactor = reactor
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=reactor.run, args=(self.stop, threading.Event()), daemon=True)
+
+    def __enter__(self) -> DeviceReactor:
+        self.thread.start()
+        return self.reactor
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop.set()
+        self.thread.join(timeout=3.0)
+        assert not self.thread.is_alive()
+
+
+def _collect() -> tuple[list[tuple[str, dict | None]], Any]:
+    seen: list[tuple[str, dict | None]] = []
+    return seen, lambda dev_id, _drv, snap: seen.append((dev_id, snap))
+
+
+def test_async_devices_wait_concurrently() -> None:
+    """20 устройств × 50 мс «RTT» за период 0.1 с: все успевают — ожидания перекрываются."""
+    seen, on_tick = _collect()
+    drivers = [AsyncDriver(work_s=0.05) for _ in range(20)]
+    with _Running(DeviceReactor(on_tick)) as reactor:
+        for i, drv in enumerate(drivers):
+            reactor.add(f"d{i}", drv, 0.1)
+        time.sleep(0.55)
+        stats = reactor.stats()
+    assert all(drv.ticks >= 4 for drv in drivers)
+    assert stats["devices"] == 20
+
+
+def test_blocking_drivers_share_bounded_pool() -> None:
+    seen, on_tick = _collect()
+    drivers = [BlockingDriver(work_s=0.01) for _ in range(6)]
+    with _Running(DeviceReactor(on_tick, blocking_workers=2)) as reactor:
+        for i, drv in enumerate(drivers):
+            reactor.add(f"b{i}", drv, 0.05)
+        time.sleep(0.3)
+    threads = set().union(*(drv.threads for drv in drivers))
+    assert len(threads) <= 2
+    assert all(name.startswith("device_io") for name in threads)
+    assert {dev_id for dev_id, _ in seen} == {f"b{i}" for i in range(6)}
+
+
+class SlowDriver(BlockingDriver):
+    """Драйвер с заявленным долгим tick (как робот)."""
+
+    slow_tick = True
+
+
+def test_slow_drivers_do_not_starve_shared_pool() -> None:
+    """Два «робота» с тиком 0.3 с и пул на 1 поток: PLC опрашиваются по своему периоду."""
+    seen, on_tick = _collect()
+    robots = [SlowDriver(work_s=0.3) for _ in range(2)]
+    plcs = [BlockingDriver(work_s=0.005) for _ in range(3)]
+    with _Running(DeviceReactor(on_tick, blocking_workers=1)) as reactor:
+        for i, drv in enumerate(robots):
+            reactor.add(f"robot{i}", drv, 0.05)
+        for i, drv in enumerate(plcs):
+            reactor.add(f"plc{i}", drv, 0.05)
+        time.sleep(0.5)
+        per = reactor.stats()["per_device"]
+    assert all(len(drv.threads) == 1 and next(iter(drv.threads)).startswith("device_io_robot") for drv in robots)
+    assert all(per[f"plc{i}"]["ticks"] >= 6 for i in range(3))
+    assert per["robot0"]["dedicated_io"] and not per["plc0"]["dedicated_io"]
+
+
+def test_long_tick_moves_device_to_own_thread() -> None:
+    seen, on_tick = _collect()
+    drv = BlockingDriver(work_s=0.06)
+    with _Running(DeviceReactor(on_tick, slow_tick_s=0.05)) as reactor:
+        reactor.add("d", drv, 0.02)
+        time.sleep(0.3)
+        per = reactor.stats()["per_device"]["d"]
+    assert per["dedicated_io"]
+    assert any(name.startswith("device_io_d") for name in drv.threads)
+
+
+class CountingDriver:
+    """Блокирующий драйвер, считающий одновременные tick()."""
+
+    def __init__(self, work_s: float) -> None:
+        self.work_s = work_s
+        self.active = 0
+        self.max_active = 0
+        self.ticks = 0
+        self._lock = threading.Lock()
+
+    def tick(self, stop_event: Any = None) -> dict:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.work_s)  # не реагирует на stop_event, как зависший Modbus-read
+        with self._lock:
+            self.active -= 1
+            self.ticks += 1
+        return {"quality": "good"}
+
+
+def test_readd_waits_for_inflight_tick() -> None:
+    """remove()+add() во время тика: новый слот не стартует, пока старый tick не вернулся."""
+    seen, on_tick = _collect()
+    drv = CountingDriver(work_s=0.15)
+    with _Running(DeviceReactor(on_tick)) as reactor:
+        reactor.add("d", drv, 0.01)
+        time.sleep(0.05)
+        reactor.remove("d")
+        reactor.add("d", drv, 0.01)
+        time.sleep(0.4)
+    assert drv.ticks >= 2
+    assert drv.max_active == 1
+
+
+def test_deadline_grid_does_not_drift() -> None:
+    """Тик 30 мс при периоде 50 мс: период держится (sleep ПОСЛЕ работы дал бы 80 мс)."""
+    seen, on_tick = _collect()
+    with _Running(DeviceReactor(on_tick)) as reactor:
+        reactor.add("d", AsyncDriver(work_s=0.03), 0.05)
+        time.sleep(0.52)
+        per = reactor.stats()["per_device"]["d"]
+    assert per["ticks"] >= 9
+    assert per["overruns"] == 0
+
+
+def test_overrun_skips_missed_slots() -> None:
+    seen, on_tick = _collect()
+    with _Running(DeviceReactor(on_tick)) as reactor:
+        reactor.add("slow", AsyncDriver(work_s=0.12), 0.05)
+        time.sleep(0.5)
+        per = reactor.stats()["per_device"]["slow"]
+    assert per["overruns"] >= per["ticks"] - 1 >= 2
+    assert per["ticks"] <= 5
+
+
+def test_remove_stops_device_and_sets_its_stop_event() -> None:
+    seen, on_tick = _collect()
+    drv = BlockingDriver()
+    with _Running(DeviceReactor(on_tick)) as reactor:
+        reactor.add("r", drv, 0.02)
+        time.sleep(0.1)
+        assert reactor.remove("r") is True
+        assert reactor.remove("r") is False
+        time.sleep(0.05)
+        count = len(seen)
+        time.sleep(0.1)
+        assert len(seen) == count
+        assert "r" not in reactor
+    assert drv.stop_seen[0].is_set()
+
+
+def test_tick_error_contained_and_reported() -> None:
+    seen, on_tick = _collect()
+    errors: list[tuple[str, Exception]] = []
+    with _Running(DeviceReactor(on_tick, lambda d, e: errors.append((d, e)))) as reactor:
+        reactor.add("bad", BlockingDriver(fail=True), 0.03)
+        reactor.add("ok", AsyncDriver(), 0.03)
+        time.sleep(0.2)
+        per = reactor.stats()["per_device"]
+    assert errors and errors[0][0] == "bad"
+    assert per["bad"]["errors"] >= 2
+    assert any(dev_id == "ok" for dev_id, _ in seen)
+
+
+def test_invalid_interval_rejected() -> None:
+    with pytest.raises(ValueError):
+        DeviceReactor(lambda *_: None).add("x", AsyncDriver(), 0)
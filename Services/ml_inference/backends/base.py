@@ -56,6 +56,13 @@ class BaseInferenceBackend(ABC):
         Имена соответствуют выходам ONNX-сессии / конвенции TorchScript.
         """
 
+    def input_buffer(self, shape: tuple[int, ...], dtype: type = np.float32) -> np.ndarray | None:
+        """Переиспользуемый буфер входа под препроцессинг (``preprocess(out=...)``).
+
+        None (база) — backend не держит буфер, препроцессинг аллоцирует тензор сам.
+        """
+        return None
+
     @abstractmethod
     def unload(self) -> None:
         """Освободить ресурсы (память/GPU)."""
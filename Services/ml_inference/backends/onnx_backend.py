@@ -3,12 +3,30 @@
 Graceful import: модуль импортируется без onnxruntime, но создание backend без
 установленного рантайма бросит понятную ошибку (см. ONNX_AVAILABLE).
 CPU/CUDA выбирается через execution providers.
+
+Профили сессии (``SessionProfile``, именованные — ``SESSION_PROFILES``):
+
+- уровень оптимизации графа и режим исполнения (sequential/parallel);
+- кэш оптимизированной модели: первая загрузка пишет оптимизированный граф в
+  ``optimized_cache_dir``, следующие грузят его с выключенной оптимизацией —
+  старт без повторного прохода оптимизатора. Ключ кэша — путь/mtime/размер весов,
+  версия onnxruntime, уровень и providers (оптимизированный граф привязан к ним);
+- IO binding: вход биндится без копии, выходы пишутся в предвыделенные numpy-буферы,
+  переиспользуемые между вызовами (аллокаций на инференс — ноль со стороны выходов).
+
+Пулы потоков — лимиты CPU-placement процесса (``thread_cap``), их передаёт движок.
 """
 
 from __future__ import annotations
 
 import gc
+import hashlib
 import logging
+import os
+import platform
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 
 import numpy as np
 
@@ -25,6 +43,111 @@ except ImportError:  # pragma: no cover — зависит от окружени
     ort = None  # type: ignore[assignment]
     ONNX_AVAILABLE = False
 
+#: ONNX-тип тензора → numpy dtype (для предвыделения выходов под IO binding).
+_ORT_DTYPES: dict[str, type] = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(double)": np.float64,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+    "tensor(int8)": np.int8,
+    "tensor(uint8)": np.uint8,
+    "tensor(bool)": np.bool_,
+}
+
+_GRAPH_LEVELS = ("disable", "basic", "extended", "all")
+
+
+@dataclass(frozen=True)
+class SessionProfile:
+    """Настройки ``InferenceSession`` поверх лимитов потоков процесса.
+
+    Attributes:
+        graph_optimization: disable | basic | extended | all.
+        execution_mode: sequential (один запрос — минимум latency) | parallel
+            (ветви графа параллельно в inter-op пуле).
+        optimized_cache_dir: каталог кэша оптимизированной модели; None — без кэша,
+            "" — ``<каталог весов>/.ort_cache`` (каталог весов только для чтения —
+            ``<tmp>/ml_inference/ort_cache``).
+        io_binding: инференс через IO binding в предвыделенные буферы.
+        allow_spinning: spin-wait потоков пула; None — дефолт рантайма. False
+            отдаёт ядра соседним процессам хоста между инференсами.
+    """
+
+    graph_optimization: str = "all"
+    execution_mode: str = "sequential"
+    optimized_cache_dir: str | None = None
+    io_binding: bool = False
+    allow_spinning: bool | None = None
+
+
+#: Именованные профили: ``default`` — прежнее поведение (дефолты рантайма).
+SESSION_PROFILES: dict[str, SessionProfile] = {
+    "default": SessionProfile(),
+    "latency": SessionProfile(optimized_cache_dir="", io_binding=True),
+    "throughput": SessionProfile(
+        execution_mode="parallel", optimized_cache_dir="", io_binding=True, allow_spinning=False
+    ),
+}
+
+
+def resolve_profile(profile: str | SessionProfile | None) -> SessionProfile:
+    """Имя/объект профиля → ``SessionProfile`` (None → default)."""
+    if profile is None:
+        return SESSION_PROFILES["default"]
+    if isinstance(profile, SessionProfile):
+        resolved = profile
+    else:
+        if profile not in SESSION_PROFILES:
+            raise ValueError(f"неизвестный профиль сессии: {profile!r} (есть: {sorted(SESSION_PROFILES)})")
+        resolved = SESSION_PROFILES[profile]
+    if resolved.graph_optimization not in _GRAPH_LEVELS:
+        raise ValueError(
+            f"graph_optimization: ожидается одно из {_GRAPH_LEVELS}, получено {resolved.graph_optimization!r}"
+        )
+    if resolved.execution_mode not in ("sequential", "parallel"):
+        raise ValueError(f"execution_mode: sequential|parallel, получено {resolved.execution_mode!r}")
+    return resolved
+
+
+def optimized_cache_path(
+    weights: Path, profile: SessionProfile, providers: list[str], runtime_version: str
+) -> Path | None:
+    """Путь кэша оптимизированной модели (None — кэш выключен профилем).
+
+    Имя содержит хэш всего, от чего зависит оптимизированный граф: смена весов,
+    версии рантайма, архитектуры, уровня или providers даёт новый файл, а не чужой кэш.
+    """
+    if profile.optimized_cache_dir is None or profile.graph_optimization == "disable":
+        return None
+    stat = weights.stat()
+    key = "|".join(
+        (
+            str(weights.resolve()),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            runtime_version,
+            platform.machine(),
+            profile.graph_optimization,
+            ",".join(providers),
+        )
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    directory = Path(profile.optimized_cache_dir) if profile.optimized_cache_dir else _default_cache_dir(weights)
+    return directory / f"{weights.stem}.{digest}.onnx"
+
+
+def _default_cache_dir(weights: Path) -> Path:
+    """``.ort_cache`` рядом с весами; каталог весов только для чтения — общий tmp-кэш.
+
+    Ключ кэша содержит полный путь весов, поэтому общий каталог не смешивает модели.
+    """
+    local = weights.parent / ".ort_cache"
+    probe = local if local.is_dir() else weights.parent
+    if os.access(probe, os.W_OK):
+        return local
+    return Path(tempfile.gettempdir()) / "ml_inference" / "ort_cache"
+
 
 def _providers_for(device: str) -> list[str]:
     """Список execution providers под устройство (с fallback на CPU)."""
@@ -41,15 +164,36 @@ class ONNXRuntimeBackend(BaseInferenceBackend):
 
     InferenceSession НЕ thread-safe при некоторых конфигурациях — вызывать infer()
     последовательно (плагин помечен thread_safe=False).
+
+    ``intra_op_threads``/``inter_op_threads`` — размеры пулов сессии. onnxruntime
+    env-лимиты не читает и по умолчанию берёт все ядра машины, поэтому лимит из
+    CPU-placement процесса передаётся сюда явно (None — дефолт рантайма).
+
+    С IO binding (``profile.io_binding``) выходы ``infer`` — предвыделенные буферы,
+    переиспользуемые между вызовами: валидны до следующего ``infer``.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        intra_op_threads: int | None = None,
+        inter_op_threads: int | None = None,
+        profile: str | SessionProfile | None = None,
+    ) -> None:
         super().__init__()
         if not ONNX_AVAILABLE:
             raise RuntimeError("onnxruntime не установлен. Установите: pip install '.[ml]'")
+        self._intra_op_threads = intra_op_threads
+        self._inter_op_threads = inter_op_threads
+        self._profile = resolve_profile(profile)
         self._session: ort.InferenceSession | None = None
         self._input_name: str = ""
         self._output_names: list[str] = []
+        self._output_dtypes: list[type | None] = []
+        self._binding = None
+        self._bound_shape: tuple[int, ...] | None = None
+        self._output_buffers: dict[str, np.ndarray] = {}
+        self._input_buffer: np.ndarray | None = None
+        self._cache_path: Path | None = None
 
     @property
     def active_providers(self) -> list[str]:
@@ -58,39 +202,171 @@ class ONNXRuntimeBackend(BaseInferenceBackend):
             return []
         return list(self._session.get_providers())
 
+    @property
+    def profile(self) -> SessionProfile:
+        return self._profile
+
+    @property
+    def optimized_cache(self) -> Path | None:
+        """Файл кэша оптимизированной модели текущей сессии (None — не используется)."""
+        return self._cache_path
+
+    def _session_options(self, level: str) -> ort.SessionOptions:
+        profile = self._profile
+        options = ort.SessionOptions()
+        if self._intra_op_threads:
+            options.intra_op_num_threads = self._intra_op_threads
+        if self._inter_op_threads:
+            options.inter_op_num_threads = self._inter_op_threads
+        options.graph_optimization_level = {
+            "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        }[level]
+        options.execution_mode = (
+            ort.ExecutionMode.ORT_PARALLEL if profile.execution_mode == "parallel" else ort.ExecutionMode.ORT_SEQUENTIAL
+        )
+        if profile.allow_spinning is not None:
+            flag = "1" if profile.allow_spinning else "0"
+            options.add_session_config_entry("session.intra_op.allow_spinning", flag)
+            options.add_session_config_entry("session.inter_op.allow_spinning", flag)
+        return options
+
     def load(self, spec: ModelSpec, device: str = "cpu") -> None:
-        """Создать InferenceSession из весов .onnx."""
-        path = str(spec.weights_path)
-        self._session = ort.InferenceSession(path, providers=_providers_for(device))
-        self._input_name = self._session.get_inputs()[0].name
-        self._output_names = [o.name for o in self._session.get_outputs()]
+        """Создать InferenceSession из весов .onnx (через кэш оптимизированной модели)."""
+        weights = Path(spec.weights_path)
+        providers = _providers_for(device)
+        self._session = self._create_session(weights, providers)
+        inputs = self._session.get_inputs()
+        outputs = self._session.get_outputs()
+        self._input_name = inputs[0].name
+        self._output_names = [o.name for o in outputs]
+        self._output_dtypes = [_ORT_DTYPES.get(o.type) for o in outputs]
+        self._reset_binding()
         self._spec = spec
         self._device = device
         logger.info(
-            "ONNXBackend: загружена %s (%s, providers=%s, outputs=%s)",
+            "ONNXBackend: загружена %s (%s, providers=%s, outputs=%s, profile=%s, cache=%s)",
             spec.name,
             device,
             self._session.get_providers(),
             self._output_names,
+            self._profile,
+            self._cache_path,
         )
 
+    def _create_session(self, weights: Path, providers: list[str]) -> ort.InferenceSession:
+        """Сессия из кэша оптимизированной модели; промах — оптимизация с записью кэша."""
+        level = self._profile.graph_optimization
+        try:
+            cache = optimized_cache_path(weights, self._profile, providers, ort.__version__)
+        except OSError:
+            cache = None
+        self._cache_path = None
+        if cache is not None and cache.is_file():
+            try:
+                session = ort.InferenceSession(
+                    str(cache), sess_options=self._session_options("disable"), providers=providers
+                )
+                self._cache_path = cache
+                return session
+            except Exception as exc:  # noqa: BLE001 — битый/чужой кэш: пересоздать из весов
+                logger.warning("ONNXBackend: кэш %s не загрузился (%s) — оптимизирую заново", cache, exc)
+        options = self._session_options(level)
+        if cache is not None:
+            try:
+                cache.parent.mkdir(parents=True, exist_ok=True)
+                # Атомарно: рантайм пишет во временный файл, rename — после успешной сессии.
+                tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+                options.optimized_model_filepath = str(tmp)
+                session = ort.InferenceSession(str(weights), sess_options=options, providers=providers)
+                os.replace(tmp, cache)
+                self._cache_path = cache
+                return session
+            except Exception as exc:  # noqa: BLE001 — кэш — оптимизация старта, не условие загрузки
+                logger.warning("ONNXBackend: кэш оптимизированной модели не записан (%s)", exc)
+                options = self._session_options(level)
+        return ort.InferenceSession(str(weights), sess_options=options, providers=providers)
+
+    def input_buffer(self, shape: tuple[int, ...], dtype: type = np.float32) -> np.ndarray | None:
+        """Переиспользуемый буфер входа (препроцессинг пишет в него, ``infer`` биндит без копии).
+
+        None — IO binding выключен профилем (вход аллоцирует препроцессинг).
+        """
+        if not self._profile.io_binding or self._session is None:
+            return None
+        buf = self._input_buffer
+        if buf is None or buf.shape != tuple(shape) or buf.dtype != dtype:
+            buf = self._input_buffer = np.empty(shape, dtype=dtype)
+        return buf
+
     def infer(self, tensor: np.ndarray) -> dict[str, np.ndarray]:
         """Прогнать тензор → выходы сети по именам (logits[, angle], ...)."""
         if self._session is None:
             raise RuntimeError("ONNXBackend: модель не загружена")
+        if self._profile.io_binding and None not in self._output_dtypes:
+            return self._infer_bound(tensor)
         outputs = self._session.run(None, {self._input_name: tensor})
+        return self._name_outputs(np.asarray(o) for o in outputs)
+
+    def _infer_bound(self, tensor: np.ndarray) -> dict[str, np.ndarray]:
+        """IO binding: вход без копии, выходы — в предвыделенные буферы.
+
+        Формы выходов (в т.ч. динамические оси) узнаются первым прогоном с
+        аллокацией рантайма; буферы пересоздаются только при смене формы входа.
+        """
+        session = self._session
+        tensor = np.ascontiguousarray(tensor)
+        if self._binding is None:
+            self._binding = session.io_binding()
+        binding = self._binding
+        binding.bind_cpu_input(self._input_name, tensor)
+        if tensor.shape != self._bound_shape:
+            for name in self._output_names:
+                binding.bind_output(name, "cpu")
+            session.run_with_iobinding(binding)
+            first = binding.copy_outputs_to_cpu()
+            self._output_buffers = {}
+            for name, out in zip(self._output_names, first):
+                buf = np.empty_like(out)
+                binding.bind_output(
+                    name=name,
+                    device_type="cpu",
+                    device_id=0,
+                    element_type=buf.dtype.type,
+                    shape=buf.shape,
+                    buffer_ptr=buf.ctypes.data,
+                )
+                np.copyto(buf, out)
+                self._output_buffers[name] = buf
+            self._bound_shape = tensor.shape
+        else:
+            session.run_with_iobinding(binding)
+        return self._name_outputs(self._output_buffers[name] for name in self._output_names)
+
+    def _name_outputs(self, outputs) -> dict[str, np.ndarray]:
         # имена выходов уникальны у нашего экспорта; для сторонних конвертеров с
         # пустыми/дублирующими именами — fallback на out_<i> (без молчаливой коллизии)
         result: dict[str, np.ndarray] = {}
         for i, (name, o) in enumerate(zip(self._output_names, outputs)):
             key = name if name and name not in result else f"out_{i}"
-            result[key] = np.asarray(o)
+            result[key] = o
         return result
 
+    def _reset_binding(self) -> None:
+        self._binding = None
+        self._bound_shape = None
+        self._output_buffers = {}
+        self._input_buffer = None
+
     def unload(self) -> None:
         """Освободить сессию."""
+        self._reset_binding()
         self._session = None
         self._input_name = ""
         self._output_names = []
+        self._output_dtypes = []
+        self._cache_path = None
         self._spec = None
         gc.collect()
@@ -33,12 +33,19 @@ except ImportError:  # pragma: no cover — зависит от окружени
 
 
 class TorchBackend(BaseInferenceBackend):
-    """Инференс через PyTorch."""
+    """Инференс через PyTorch.
 
-    def __init__(self) -> None:
+    ``num_threads``/``interop_threads`` — лимиты пулов torch (CPU-placement процесса).
+    Пулы процесс-глобальные; inter-op задаётся только до первой параллельной работы —
+    отказ логируется и не мешает загрузке.
+    """
+
+    def __init__(self, num_threads: int | None = None, interop_threads: int | None = None) -> None:
         super().__init__()
         if not TORCH_AVAILABLE:
             raise RuntimeError("torch не установлен. Установите: pip install '.[ml-torch]'")
+        self._num_threads = num_threads
+        self._interop_threads = interop_threads
         self._model = None
 
     def load(self, spec: ModelSpec, device: str = "cpu") -> None:
@@ -50,6 +57,7 @@ class TorchBackend(BaseInferenceBackend):
         dev = device if (device == "cuda" and torch.cuda.is_available()) else "cpu"
         if device == "cuda" and dev == "cpu":
             logger.warning("TorchBackend: CUDA недоступна, fallback на CPU")
+        self._apply_thread_caps()
         path = str(spec.weights_path)
         try:
             # nosec B614 — jit.load загружает TorchScript и НЕ исполняет произвольный
@@ -67,6 +75,15 @@ class TorchBackend(BaseInferenceBackend):
         self._device = dev
         logger.info("TorchBackend: загружена %s (%s)", spec.name, dev)
 
+    def _apply_thread_caps(self) -> None:
+        if self._num_threads and torch.get_num_threads() != self._num_threads:
+            torch.set_num_threads(self._num_threads)
+        if self._interop_threads and torch.get_num_interop_threads() != self._interop_threads:
+            try:
+                torch.set_num_interop_threads(self._interop_threads)
+            except RuntimeError as exc:  # пул уже поднят — размер не меняется
+                logger.warning("TorchBackend: inter-op потоки не ограничены: %s", exc)
+
     def infer(self, tensor: np.ndarray) -> dict[str, np.ndarray]:
         """Прогнать тензор → выходы по именам.
 
@@ -0,0 +1,142 @@
+"""Бенчмарк ONNX-инференса по профилям сессии: старт, throughput, аллокации/инференс.
+
+Для каждого профиля (``SESSION_PROFILES``) поднимает ``InferenceEngine`` на модели и меряет:
+
+* ``load_ms`` — холодная загрузка (оптимизация графа, запись кэша) и повторная
+  (из кэша оптимизированной модели, если профиль его включает);
+* ``infer/s`` — ``engine.predict`` на одном кадре (препроцессинг + инференс + постобработка);
+* ``KiB/инф`` и ``блоков/инф`` — Python/numpy-аллокации на инференс через
+  ``AllocProfiler`` (tracemalloc; арена onnxruntime в C++ не видна — только то,
+  что аллоцирует наш путь: тензор входа, выходы, временные массивы).
+
+Запуск::
+
+    python -m Services.ml_inference.benchmark --models-dir data/models --model resnet18
+    python -m Services.ml_inference.benchmark --iters 500      # синтетическая conv-модель (нужен onnx)
+
+Без ``--model`` собирается синтетическая модель (Conv→Relu→GlobalAveragePool→Gemm, вход
+1x3x224x224) во временном каталоге.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from multiprocess_framework.modules.process_module.generic.alloc_profile import AllocProfiler
+from multiprocess_framework.modules.process_module.lifecycle.cpu_placement import thread_cap
+from Services.ml_inference.backends.onnx_backend import SESSION_PROFILES
+from Services.ml_inference.engine import InferenceEngine
+
+
+def _synthetic_model(directory: Path) -> str:
+    """Conv-классификатор со случайными весами + sidecar; возвращает id модели."""
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(0)
+    weights = [
+        numpy_helper.from_array(rng.standard_normal((32, 3, 3, 3)).astype(np.float32), "conv_w"),
+        numpy_helper.from_array(np.zeros(32, dtype=np.float32), "conv_b"),
+        numpy_helper.from_array(rng.standard_normal((10, 32)).astype(np.float32), "fc_w"),
+        numpy_helper.from_array(np.zeros(10, dtype=np.float32), "fc_b"),
+    ]
+    nodes = [
+        helper.make_node("Conv", ["input", "conv_w", "conv_b"], ["c"], pads=[1, 1, 1, 1]),
+        helper.make_node("Relu", ["c"], ["r"]),
+        helper.make_node("GlobalAveragePool", ["r"], ["p"]),
+        helper.make_node("Flatten", ["p"], ["f"], axis=1),
+        helper.make_node("Gemm", ["f", "fc_w", "fc_b"], ["logits"], transB=1),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "bench_clf",
+        [helper.make_tensor_value_info("input", TensorProto.FLOAT, [1, 3, 224, 224])],
+        [helper.make_tensor_value_info("logits", TensorProto.FLOAT, [1, 10])],
+        initializer=weights,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 10
+    onnx.save(model, str(directory / "bench.onnx"))
+    (directory / "bench.yaml").write_text(
+        "name: bench\nbackend: onnx\nweights: bench.onnx\ninput_size: [224, 224]\noutput_name: logits\n",
+        encoding="utf-8",
+    )
+    return "bench"
+
+
+def _run_profile(models_dir: str, model: str, profile: str, iters: int) -> dict:
+    caps = {name: thread_cap(name) for name in ("onnx_intra_op", "onnx_inter_op")}
+    engine = InferenceEngine(models_dir, {k: v for k, v in caps.items() if v}, session_profile=profile)
+    frame = np.random.default_rng(1).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+
+    t0 = time.perf_counter()
+    engine.load_model(model)
+    cold_ms = (time.perf_counter() - t0) * 1000
+    engine.unload()
+    t0 = time.perf_counter()
+    engine.load_model(model)
+    warm_ms = (time.perf_counter() - t0) * 1000
+
+    for _ in range(10):
+        engine.predict(frame)
+    t0 = time.perf_counter()
+    for _ in range(iters):
+        engine.predict(frame)
+    per_s = iters / (time.perf_counter() - t0)
+
+    prof = AllocProfiler()
+    prof.start()
+    try:
+        engine.predict(frame)
+        prof.mark()
+        for _ in range(iters):
+            engine.predict(frame)
+        allocs = prof.per_frame(iters)
+    finally:
+        prof.stop()
+    engine.unload()
+    return {
+        "profile": profile,
+        "cold_ms": cold_ms,
+        "warm_ms": warm_ms,
+        "per_s": per_s,
+        "kib": allocs["bytes_per_frame"] / 1024,
+        "blocks": allocs["blocks_per_frame"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: прогнать профили и напечатать таблицу."""
+    parser = argparse.ArgumentParser(prog="python -m Services.ml_inference.benchmark")
+    parser.add_argument("--models-dir", help="каталог моделей (sidecar .yaml); без него — синтетическая модель")
+    parser.add_argument("--model", default="", help="id модели в каталоге")
+    parser.add_argument("--iters", type=int, default=300, help="инференсов на замер")
+    parser.add_argument("--profiles", default=",".join(SESSION_PROFILES), help="профили через запятую")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="ml_bench_") as tmp:
+        models_dir, model = args.models_dir, args.model
+        if not models_dir or not model:
+            models_dir, model = tmp, _synthetic_model(Path(tmp))
+        print(
+            f"{'профиль':<12} {'load хол.,мс':>13} {'load пов.,мс':>13} {'инф/с':>9} {'KiB/инф':>9} {'блоков/инф':>11}"
+        )
+        for profile in args.profiles.split(","):
+            if models_dir == tmp:  # холодный старт каждого профиля — без кэша предыдущего
+                shutil.rmtree(Path(tmp) / ".ort_cache", ignore_errors=True)
+            row = _run_profile(models_dir, model, profile.strip(), max(1, args.iters))
+            print(
+                f"{row['profile']:<12} {row['cold_ms']:>13.1f} {row['warm_ms']:>13.1f} "
+                f"{row['per_s']:>9.1f} {row['kib']:>9.1f} {row['blocks']:>11.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -66,6 +66,7 @@ def preprocess(
     *,
     keep_aspect: bool | None = None,
     resize_policy: str | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """BGR-кадр → нормализованный float32-тензор по ModelSpec.
 
@@ -74,6 +75,8 @@ def preprocess(
       - stretch      — растянуть до квадрата (диск-кроп уже квадратный);
       - center_crop  — cover-resize + центральный кроп.
     keep_aspect оставлен для обратной совместимости (True→letterbox, False→stretch).
+    out — предвыделенный float32-тензор итоговой формы (буфер backend под IO binding):
+    результат пишется в него без промежуточной копии и он же возвращается.
 
     Returns:
         np.float32 батч-тензор (1, C, H, W) для NCHW или (1, H, W, C) для NHWC.
@@ -116,14 +119,22 @@ def preprocess(
     if spec.color == "RGB":
         img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
-    # Нормализация в float32.
-    img = img.astype(np.float32) / 255.0
+    # Нормализация в float32 — in-place, без временных массивов на кадр.
+    img = img.astype(np.float32)
     mean = np.array(spec.normalize.mean, dtype=np.float32)
     std = np.array(spec.normalize.std, dtype=np.float32)
-    img = (img - mean) / std
+    img /= 255.0
+    img -= mean
+    img /= std
 
     # Layout + batch.
     if spec.layout == "NCHW":
         img = np.transpose(img, (2, 0, 1))  # HWC → CHW
+    if out is not None:
+        expected = (1, *img.shape)
+        if out.shape != expected or out.dtype != np.float32:
+            raise ValueError(f"preprocess: out {out.shape}/{out.dtype}, ожидается {expected}/float32")
+        np.copyto(out[0], img)
+        return out
     tensor = np.expand_dims(img, axis=0)  # → (1, ...)
     return np.ascontiguousarray(tensor, dtype=np.float32)
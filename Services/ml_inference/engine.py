@@ -24,29 +24,43 @@ from Services.ml_inference.core.registry import ModelRegistry
 logger = logging.getLogger(__name__)
 
 
-def _make_backend(backend_type: str) -> BaseInferenceBackend:
-    """Фабрика backend по типу из ModelSpec (понятная ошибка если библиотека не стоит)."""
+def _make_backend(
+    backend_type: str, thread_caps: dict[str, int] | None = None, session_profile: str | None = None
+) -> BaseInferenceBackend:
+    """Фабрика backend по типу из ModelSpec (понятная ошибка если библиотека не стоит).
+
+    ``thread_caps`` — лимиты пулов (``onnx_intra_op``, ``onnx_inter_op``, ``torch``,
+    ``torch_interop``); отсутствующий ключ — дефолт библиотеки. ``session_profile`` —
+    имя профиля сессии ONNX (``SESSION_PROFILES``); torch его игнорирует.
+    """
+    caps = thread_caps or {}
     if backend_type == "onnx":
         if not ONNX_AVAILABLE:
             raise RuntimeError("backend 'onnx' недоступен: pip install '.[ml]'")
-        return ONNXRuntimeBackend()
+        return ONNXRuntimeBackend(caps.get("onnx_intra_op"), caps.get("onnx_inter_op"), profile=session_profile)
     if backend_type == "torch":
         if not TORCH_AVAILABLE:
             raise RuntimeError("backend 'torch' недоступен: pip install '.[ml-torch]'")
-        return TorchBackend()
+        return TorchBackend(caps.get("torch"), caps.get("torch_interop"))
     raise ValueError(f"неизвестный backend: {backend_type}")
 
 
 class InferenceEngine:
     """Высокоуровневый движок инференса для одной модели за раз."""
 
-    def __init__(self, models_dir: str) -> None:
+    def __init__(
+        self, models_dir: str, thread_caps: dict[str, int] | None = None, session_profile: str | None = None
+    ) -> None:
         self._registry = ModelRegistry(models_dir)
+        self._thread_caps = dict(thread_caps or {})
+        #: профиль сессии ONNX для следующих load_model (SESSION_PROFILES); None — default
+        self.session_profile = session_profile
         self._registry.scan()
         self._backend: BaseInferenceBackend | None = None
         self._spec: ModelSpec | None = None
         self._labels: list[str] | None = None
         self._device: str = "cpu"
+        self._input_shape: tuple[int, ...] = ()
         #: метки, для которых уже залогирован fallback симметрии (анти-спам в predict)
         self._warned_symmetry: set[str] = set()
 
@@ -86,13 +100,15 @@ class InferenceEngine:
             raise ValueError(f"модель не найдена в каталоге: {model_id}")
 
         self.unload()
-        backend = _make_backend(spec.backend)
+        backend = _make_backend(spec.backend, self._thread_caps, self.session_profile)
         backend.load(spec, device=device)
         backend.warmup()
         self._backend = backend
         self._spec = spec
         self._labels = spec.load_labels()
         self._device = device
+        h, w = spec.input_size
+        self._input_shape = (1, 3, h, w) if spec.layout == "NCHW" else (1, h, w, 3)
         self._warned_symmetry = set()
         self._check_symmetry_coverage(spec)
         logger.info("InferenceEngine: модель '%s' готова (%s)", model_id, device)
@@ -147,7 +163,8 @@ class InferenceEngine:
         """
         if not self.is_ready or self._spec is None or self._backend is None:
             return []
-        tensor = preprocess(frame, self._spec)
+        # IO binding: препроцессинг пишет прямо в буфер входа backend'а (None — свой тензор).
+        tensor = preprocess(frame, self._spec, out=self._backend.input_buffer(self._input_shape))
         outputs = self._backend.infer(tensor)
         logits = outputs.get(self._spec.output_name)
         if logits is None:  # одноголовая модель / иное имя — берём первый выход
@@ -29,3 +29,4 @@ class MLInferenceConfig(PluginConfig):
     device: str = "cpu"
     confidence_threshold: float = 0.5
     top_k: int = 5
+    session_profile: str = "default"
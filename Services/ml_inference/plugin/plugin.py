@@ -17,6 +17,7 @@ import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from multiprocess_framework.modules.process_module.lifecycle import thread_cap
 from multiprocess_framework.modules.process_module.plugins import (
     PluginContext,
     Port,
@@ -109,7 +110,9 @@ class MLInferencePlugin(ProcessModulePlugin):
         self._state_proxy = ctx.state_proxy
 
         models_dir = ctx.config.get("models_dir") or str(_DEFAULT_MODELS_DIR)
-        self._engine = InferenceEngine(models_dir)
+        # Лимиты пулов из CPU-placement процесса (onnxruntime env не читает).
+        caps = {name: thread_cap(name) for name in ("onnx_intra_op", "onnx_inter_op", "torch", "torch_interop")}
+        self._engine = InferenceEngine(models_dir, {k: v for k, v in caps.items() if v})
         # Сериализует доступ к движку: predict() (поток pipeline_executor) против
         # load/unload из команд (поток message_processor) — иначе гонка по сессии.
         self._engine_lock = threading.Lock()
@@ -230,6 +233,8 @@ class MLInferencePlugin(ProcessModulePlugin):
         self._reg.model = model
         if "device" in data:
             self._reg.device = data["device"]
+        if "session_profile" in data:
+            self._reg.session_profile = data["session_profile"]
         self._load_selected_model()
         return {"status": "ok", "loaded_model": self._reg.loaded_model, "error": self._reg.last_error}
 
@@ -268,6 +273,7 @@ class MLInferencePlugin(ProcessModulePlugin):
                 self._reg.loaded_model = ""
                 return
             try:
+                self._engine.session_profile = self._reg.session_profile
                 self._engine.load_model(self._reg.model, device=self._reg.device)
                 self._reg.loaded_model = self._engine.current_model or self._reg.model
                 # фактические providers (показывает молчаливый CPU-fallback при device=cuda)
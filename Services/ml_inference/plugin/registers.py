@@ -56,6 +56,14 @@ class MLInferenceRegisters(SchemaBase):
             max=60,
         ),
     ] = 1
+    session_profile: Annotated[
+        Literal["default", "latency", "throughput"],
+        FieldMeta(
+            "Профиль сессии ONNX",
+            info="default — дефолты рантайма; latency — кэш оптимизированной модели + IO binding; "
+            "throughput — то же + parallel-исполнение без spin-wait. Применяется при загрузке модели",
+        ),
+    ] = "default"
 
     # --- Отрисовка ---
     draw_overlay: Annotated[
@@ -0,0 +1,103 @@
+"""Тесты профилей сессии ONNXRuntimeBackend: кэш оптимизированной модели + IO binding."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from Services.ml_inference.backends.onnx_backend import (
+    SESSION_PROFILES,
+    SessionProfile,
+    optimized_cache_path,
+    resolve_profile,
+)
+
+ort = pytest.importorskip("onnxruntime")
+
+from Services.ml_inference.backends.onnx_backend import ONNXRuntimeBackend  # noqa: E402
+from Services.ml_inference.core.preprocess import preprocess  # noqa: E402
+from Services.ml_inference.core.registry import ModelRegistry  # noqa: E402
+from Services.ml_inference.engine import InferenceEngine  # noqa: E402
+
+
+def _spec(models_dir: Path):
+    reg = ModelRegistry(str(models_dir))
+    reg.scan()
+    return reg.get("dummy")
+
+
+def test_resolve_profile_by_name_and_validation():
+    assert resolve_profile(None) is SESSION_PROFILES["default"]
+    assert resolve_profile("latency").io_binding is True
+    with pytest.raises(ValueError):
+        resolve_profile("turbo")
+    with pytest.raises(ValueError):
+        resolve_profile(SessionProfile(graph_optimization="max"))
+
+
+def test_cache_key_tracks_weights_and_runtime(dummy_models_dir: Path):
+    weights = dummy_models_dir / "dummy.onnx"
+    profile = SESSION_PROFILES["latency"]
+    path = optimized_cache_path(weights, profile, ["CPUExecutionProvider"], "1.0")
+    assert path.parent == dummy_models_dir / ".ort_cache"
+    assert path != optimized_cache_path(weights, profile, ["CPUExecutionProvider"], "2.0")
+    assert path != optimized_cache_path(weights, profile, ["CUDAExecutionProvider"], "1.0")
+    assert optimized_cache_path(weights, SESSION_PROFILES["default"], [], "1.0") is None
+
+
+def test_read_only_weights_dir_uses_tmp_cache(dummy_models_dir: Path, monkeypatch):
+    import tempfile
+
+    from Services.ml_inference.backends import onnx_backend
+
+    monkeypatch.setattr(onnx_backend.os, "access", lambda _path, _mode: False)
+    path = optimized_cache_path(dummy_models_dir / "dummy.onnx", SESSION_PROFILES["latency"], [], "1.0")
+    assert path.parent == Path(tempfile.gettempdir()) / "ml_inference" / "ort_cache"
+
+
+def test_second_load_uses_optimized_cache(dummy_models_dir: Path):
+    spec = _spec(dummy_models_dir)
+    first = ONNXRuntimeBackend(profile="latency")
+    first.load(spec)
+    cache = first.optimized_cache
+    assert cache is not None and cache.is_file()
+
+    second = ONNXRuntimeBackend(profile="latency")
+    second.load(spec)
+    assert second.optimized_cache == cache
+    tensor = np.random.default_rng(0).random((1, 3, 224, 224), dtype=np.float32)
+    assert np.allclose(first.infer(tensor)["logits"], second.infer(tensor)["logits"])
+
+
+def test_io_binding_reuses_output_buffers_and_matches_run(dummy_models_dir: Path):
+    spec = _spec(dummy_models_dir)
+    plain = ONNXRuntimeBackend(profile="default")
+    bound = ONNXRuntimeBackend(profile=SessionProfile(io_binding=True))
+    plain.load(spec)
+    bound.load(spec)
+
+    rng = np.random.default_rng(1)
+    first_out = None
+    for _ in range(3):
+        tensor = rng.random((1, 3, 224, 224), dtype=np.float32)
+        out = bound.infer(tensor)["logits"]
+        assert np.allclose(out, plain.infer(tensor)["logits"])
+        first_out = out if first_out is None else first_out
+        assert out is first_out  # тот же предвыделенный буфер
+
+
+def test_engine_preprocesses_into_backend_input_buffer(dummy_models_dir: Path):
+    engine = InferenceEngine(str(dummy_models_dir), session_profile="latency")
+    engine.load_model("dummy")
+    frame = np.full((100, 120, 3), 200, dtype=np.uint8)
+    preds = engine.predict(frame, top_k=3)
+
+    baseline = InferenceEngine(str(dummy_models_dir), session_profile="default")
+    baseline.load_model("dummy")
+    assert [p["label"] for p in preds] == [p["label"] for p in baseline.predict(frame, top_k=3)]
+
+    buf = engine._backend.input_buffer((1, 3, 224, 224))
+    assert buf is not None
+    assert np.array_equal(buf, preprocess(frame, _spec(dummy_models_dir)))
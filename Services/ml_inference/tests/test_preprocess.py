@@ -86,3 +86,13 @@ def test_stretch_square_no_warn(caplog):
     with caplog.at_level(logging.WARNING, logger="Services.ml_inference.core.preprocess"):
         preprocess(frame, spec)
     assert not [r for r in caplog.records if "stretch" in r.message]
+
+
+def test_out_buffer_written_in_place():
+    spec = _spec(input_size=(32, 32))
+    frame = np.random.default_rng(0).integers(0, 255, (40, 50, 3), dtype=np.uint8)
+    out = np.empty((1, 3, 32, 32), dtype=np.float32)
+    assert preprocess(frame, spec, out=out) is out
+    assert np.array_equal(out, preprocess(frame, spec))
+    with pytest.raises(ValueError):
+        preprocess(frame, spec, out=np.empty((1, 32, 32, 3), dtype=np.float32))
@@ -34,6 +34,7 @@ _LAZY = {
     "build_dataloaders": ("Services.ml_train.data", "build_dataloaders"),
     "ExportedDataset": ("Services.ml_train.data", "ExportedDataset"),
     "FolderDataset": ("Services.ml_train.data", "FolderDataset"),
+    "ShardDataset": ("Services.ml_train.data", "ShardDataset"),
     "export_onnx": ("Services.ml_train.export", "export_onnx"),
     "load_checkpoint": ("Services.ml_train.export", "load_checkpoint"),
 }
@@ -68,7 +68,8 @@ class DataConfig(BaseModel):
     """Источник данных и DataLoader.
 
     - synthetic: generator_preset (YAML GeneratorConfig dataset_gen), генерация на лету
-    - exported: root с train/val[/test] (export_splits) либо один набор с labels.csv
+    - exported: root с train/val[/test] (export_splits) либо один набор с labels.csv;
+      shards=True — читать memmap-шарды сплита (export shard_size), если они есть
     - folder: root с подпапками-классами (Good/Bad/Neutral; вложенность допустима)
     """
 
@@ -77,6 +78,7 @@ class DataConfig(BaseModel):
     samples_per_epoch: int = Field(default=6600, ge=1)  # synthetic: train-сэмплов на эпоху
     val_samples: int = Field(default=990, ge=1)  # synthetic: объём валидации
     root: str | None = None  # exported/folder
+    shards: bool = True  # exported: memmap-шарды вместо PNG-декода (если экспортированы)
     val_split: float = Field(default=0.15, gt=0.0, lt=1.0)  # если нет готового val
     image_size: tuple[int, int] = (128, 128)  # (H, W); exported/folder ресайзятся
     batch_size: int = Field(default=64, ge=1)
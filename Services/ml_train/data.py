@@ -3,7 +3,9 @@
 Три источника (config.data.source):
 - synthetic — генерация на лету через Services.dataset_gen (SyntheticDataset);
 - exported  — датасет, сохранённый export_dataset/export_splits
-              (images/{class:03d}/ + labels.csv|json);
+              (images/{class:03d}/ + labels.csv|json); если сплит экспортирован
+              с shard_size, кадры читаются из memmap-шардов (ShardDataset)
+              без PNG-декода;
 - folder    — подпапки-классы с картинками (формат старого keras-кода:
               Good/Bad/Neutral), вложенные подпапки допустимы.
 
@@ -24,6 +26,7 @@ import numpy as np
 import torch
 from torch.utils.data import DataLoader, Dataset, Subset
 
+from Services.dataset_gen.shards import has_shards, open_shard_images, read_shard_index, read_shard_meta
 from Services.ml_train.config import DataConfig
 
 _IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".webp"}
@@ -93,6 +96,52 @@ class ExportedDataset(Dataset):
         return image, target
 
 
+class ShardDataset(Dataset):
+    """Упакованный сплит dataset_gen (shards/): memmap uint8-шарды + структурный индекс.
+
+    Кадр — срез memmap (RGB HWC), без декода и cvtColor; единственная копия —
+    приведение к float в тензор. Шарды открываются лениво один раз на процесс:
+    memmap не пикается в воркеры DataLoader (pickle скопировал бы весь массив),
+    каждый воркер открывает их при первом __getitem__ и держит до конца.
+
+    Pre: в split_dir лежит shards/ с complete=true (export_dataset shard_size=N).
+    """
+
+    def __init__(self, split_dir: str | Path, transform=None) -> None:
+        self.root = Path(split_dir)
+        self.transform = transform
+        self.meta = read_shard_meta(self.root)
+        self.index = read_shard_index(self.root)
+        if len(self.index) == 0:
+            raise ValueError(f"Пустой датасет: {self.root}")
+        self._images: list[np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_images"] = None
+        return state
+
+    def __getitem__(self, idx: int) -> tuple[torch.Tensor, dict[str, torch.Tensor]]:
+        if self._images is None:
+            # copy-on-write: writeable-view для torch.from_numpy без копии и без записи на диск
+            self._images = open_shard_images(self.root, self.meta, mmap_mode="c")
+        rec = self.index[idx]
+        rgb = self._images[int(rec["shard"])][int(rec["offset"])]
+        image = torch.from_numpy(rgb).permute(2, 0, 1).float() / 255.0
+        if self.transform is not None:
+            image = self.transform(image)
+        target = _make_target(
+            int(rec["class_index"]),
+            float(rec["angle_sin"]),
+            float(rec["angle_cos"]),
+            bool(rec["angle_valid"]),
+        )
+        return image, target
+
+
 class FolderDataset(Dataset):
     """Подпапки-классы (Good/Bad/Neutral, ...); метки угла отсутствуют (angle_valid=False).
 
@@ -239,28 +288,35 @@ def _synthetic_counts(length: int, num_classes: int) -> np.ndarray:
     return counts
 
 
+def _exported_split(split_dir: Path, transform, config: DataConfig) -> ExportedDataset | ShardDataset:
+    """Сплит exported-источника: memmap-шарды, если есть и разрешены, иначе PNG."""
+    if config.shards and has_shards(split_dir):
+        return ShardDataset(split_dir, transform=transform)
+    return ExportedDataset(split_dir, transform=transform)
+
+
 def _build_exported(config: DataConfig) -> DataBundle:
     root = Path(str(config.root))
     train_tf = build_transforms(config, train=True, resize=True)
     eval_tf = build_transforms(config, train=False, resize=True)
 
     if (root / "train").is_dir():
-        train_ds = ExportedDataset(root / "train", transform=train_tf)
+        train_ds: Dataset = _exported_split(root / "train", train_tf, config)
         if (root / "val").is_dir():
-            val_ds: Dataset = ExportedDataset(root / "val", transform=eval_tf)
+            val_ds: Dataset = _exported_split(root / "val", eval_tf, config)
         else:
             train_ds, val_ds = _random_split_two_views(
-                ExportedDataset(root / "train", transform=train_tf),
-                ExportedDataset(root / "train", transform=eval_tf),
+                _exported_split(root / "train", train_tf, config),
+                _exported_split(root / "train", eval_tf, config),
                 config.val_split,
                 config.seed,
             )
-        test_ds = ExportedDataset(root / "test", transform=eval_tf) if (root / "test").is_dir() else None
+        test_ds = _exported_split(root / "test", eval_tf, config) if (root / "test").is_dir() else None
         label_rows = _read_label_rows(root / "train")
     else:
         train_ds, val_ds = _random_split_two_views(
-            ExportedDataset(root, transform=train_tf),
-            ExportedDataset(root, transform=eval_tf),
+            _exported_split(root, train_tf, config),
+            _exported_split(root, eval_tf, config),
             config.val_split,
             config.seed,
         )
@@ -273,7 +329,9 @@ def _build_exported(config: DataConfig) -> DataBundle:
     # ошибкой — иначе IndexError в confusion_matrix посреди валидации
     for split_name, ds in (("val", val_ds), ("test", test_ds)):
         if isinstance(ds, ExportedDataset):
-            _check_class_bounds(ds.rows, len(class_names), split_name)
+            _check_class_bounds([int(r["class_index"]) for r in ds.rows], len(class_names), split_name)
+        elif isinstance(ds, ShardDataset):
+            _check_class_bounds(ds.index["class_index"], len(class_names), split_name)
     return DataBundle(
         train_loader=_loader(train_ds, config, shuffle=True),
         val_loader=_loader(val_ds, config, shuffle=False),
@@ -348,9 +406,9 @@ def _as_bool(value: Any) -> bool:
     return str(value).strip().lower() == "true"
 
 
-def _check_class_bounds(rows: list[dict[str, Any]], num_classes: int, split_name: str) -> None:
+def _check_class_bounds(class_indices: Any, num_classes: int, split_name: str) -> None:
     """Pre-условие согласованности сплитов: class_index < числа классов train."""
-    max_index = max(int(r["class_index"]) for r in rows)
+    max_index = int(max(class_indices))
     if max_index >= num_classes:
         raise ValueError(
             f"Сплит '{split_name}' содержит class_index={max_index}, а в train классов {num_classes} — "
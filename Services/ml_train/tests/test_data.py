@@ -1,6 +1,7 @@
 """Источники данных: exported (формат dataset_gen) и folder. Требует torch."""
 
 import csv
+import pickle
 
 import numpy as np
 import pytest
@@ -13,6 +14,7 @@ from Services.ml_train.config import DataConfig  # noqa: E402
 from Services.ml_train.data import (  # noqa: E402
     ExportedDataset,
     FolderDataset,
+    ShardDataset,
     build_dataloaders,
 )
 
@@ -63,6 +65,45 @@ def test_exported_dataset_sample_contract(tmp_path):
     assert bool(target2["angle_valid"]) is False
 
 
+def test_shard_dataset_matches_png(tmp_path):
+    """Шарды экспорта дают те же тензоры, что PNG-путь; работают в воркерах DataLoader."""
+    from torch.utils.data import DataLoader
+
+    from Services.dataset_gen.export import export_dataset
+
+    export_dataset(_StubGenerator(), tmp_path / "ds", frames_per_class=3, seed=0, shard_size=4)
+    png_ds, shard_ds = ExportedDataset(tmp_path / "ds"), ShardDataset(tmp_path / "ds")
+    assert len(shard_ds) == len(png_ds) == 9
+    for idx in (0, 4, 8):
+        image, target = shard_ds[idx]
+        ref_image, ref_target = png_ds[idx]
+        assert torch.equal(image, ref_image)
+        assert {k: v.tolist() for k, v in target.items()} == pytest.approx(
+            {k: v.tolist() for k, v in ref_target.items()}
+        )
+
+    loader = DataLoader(shard_ds, batch_size=3, num_workers=2)
+    batches = list(loader)
+    assert sum(b[0].shape[0] for b in batches) == 9
+    # memmap не уходит в pickle (воркеры открывают шарды сами)
+    assert pickle.loads(pickle.dumps(shard_ds))._images is None
+
+
+def test_build_dataloaders_prefers_shards(tmp_path):
+    from Services.dataset_gen.export import export_splits
+
+    export_splits(_StubGenerator(), tmp_path / "ds", splits={"train": 4, "val": 2}, shard_size=8)
+    cfg = DataConfig(source="exported", root=str(tmp_path / "ds"), image_size=(24, 24), batch_size=4)
+    bundle = build_dataloaders(cfg)
+    assert isinstance(bundle.train_loader.dataset, ShardDataset)
+    assert bundle.class_names == ["a", "b", "c"]
+    images, _ = next(iter(bundle.train_loader))
+    assert images.shape == (4, 3, 24, 24)
+
+    bundle_png = build_dataloaders(cfg.model_copy(update={"shards": False}))
+    assert isinstance(bundle_png.train_loader.dataset, ExportedDataset)
+
+
 def test_folder_dataset(tmp_path):
     for name, color in [("Bad", 30), ("Good", 120), ("Neutral", 200)]:
         for i in range(3):
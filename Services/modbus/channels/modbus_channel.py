@@ -191,4 +191,5 @@ class ModbusChannel(MessageChannel):
             "rx": self._rx,
             "tx": self._tx,
             "device": self._device.get_status(),
+            "poll": self._poller.stats(),
         }
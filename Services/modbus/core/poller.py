@@ -4,15 +4,25 @@
 через ModbusDevice, возвращая срез значений. Сам цикл/таймер не держит — его
 обеспечивает worker плагина (или вызывающий код). Это сохраняет core свободным
 от потоковой инфраструктуры и легко тестируемым.
+
+Проход опроса планируется (``core/read_plan.py``): блоки одного типа, лежащие
+рядом (зазор ``<= max_gap``), читаются ОДНИМ запросом в пределах лимита PDU
+(125 регистров / 2000 бит) и нарезаются обратно по блокам. Блок с ``every=N``
+опрашивается раз в N проходов (медленные теги не занимают шину каждый цикл).
+Счётчики round-trip'ов/ошибок/RTT — ``ModbusPoller.stats()``.
 """
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from Services.modbus.core.device import ModbusDevice
+from Services.modbus.core.read_plan import MAX_READ_BITS, MAX_READ_REGISTERS, ReadSpan, plan_reads
+from Services.modbus.sdk.errors import ModbusExceptionResponseError
 
 
 class RegisterKind(str, Enum):
@@ -33,16 +43,20 @@ class RegisterBlock:
         kind:    Тип блока (holding/input/coils/discrete).
         address: Начальный адрес.
         count:   Количество регистров/битов.
+        every:   Период опроса в проходах: 1 — каждый проход, N — раз в N проходов.
     """
 
     name: str
     kind: RegisterKind
     address: int
     count: int = 1
+    every: int = 1
 
     def __post_init__(self) -> None:
         if not isinstance(self.kind, RegisterKind):
             self.kind = RegisterKind(str(self.kind).lower())
+        if self.every < 1:
+            raise ValueError(f"RegisterBlock({self.name!r}): every >= 1, получено {self.every}")
 
 
 _READERS = {
@@ -53,43 +67,190 @@ _READERS = {
 }
 
 
+#: Exception-коды «диапазон не существует» (illegal data address / value): слитое
+#: чтение задело несуществующие адреса — делить навсегда. Прочие сбои (таймаут,
+#: обрыв, device failure) преходящи — слитое чтение повторяется в следующем проходе.
+_SPLIT_CODES = frozenset({2, 3})
+
+
+_PDU_LIMITS = {
+    RegisterKind.HOLDING: MAX_READ_REGISTERS,
+    RegisterKind.INPUT: MAX_READ_REGISTERS,
+    RegisterKind.COILS: MAX_READ_BITS,
+    RegisterKind.DISCRETE: MAX_READ_BITS,
+}
+
+
+def _is_range_rejection(exc: Exception) -> bool:
+    """Устройство отвергло диапазон (exception-ответ illegal address/value), а не сбой связи."""
+    return isinstance(exc, ModbusExceptionResponseError) and exc.code in _SPLIT_CODES
+
+
 class ModbusPoller:
-    """Опрашивает заданные блоки регистров одним проходом."""
+    """Опрашивает заданные блоки регистров одним проходом.
+
+    Args:
+        device:   Устройство (все чтения — через его Lock и телеметрию).
+        blocks:   Блоки опроса.
+        max_gap:  Допустимая «дыра» между блоками одного типа, которую выгоднее
+                  прочитать лишним, чем делать отдельный round-trip (0 — сливать
+                  только смежные). Дыра читается с устройства — задавайте её только
+                  в пределах реально существующих регистров.
+        coalesce: False — поштучное чтение блоков (прежнее поведение).
+        clock:    Часы для замера RTT (подменяются в тестах).
+    """
 
-    def __init__(self, device: ModbusDevice, blocks: list[RegisterBlock]) -> None:
+    def __init__(
+        self,
+        device: ModbusDevice,
+        blocks: list[RegisterBlock],
+        *,
+        max_gap: int = 0,
+        coalesce: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if max_gap < 0:
+            raise ValueError(f"max_gap: ожидается >= 0, получено {max_gap}")
         self._device = device
         self._blocks = list(blocks)
+        self._max_gap = max_gap
+        self._coalesce = coalesce
+        self._clock = clock
+        self._cycle = 0
+        # План на набор блоков, due в проходе (набор повторяется с периодом НОК(every)).
+        self._plans: dict[tuple[int, ...], list[ReadSpan]] = {}
+        # Слитые чтения, которые устройство отвергло exception-ответом illegal
+        # address/value, а поблочно отдало (дыра попала на несуществующие адреса) —
+        # дальше читаются поблочно.
+        self._split: set[tuple[RegisterKind, int, int]] = set()
+        self._stats = {"cycles": 0, "reads": 0, "read_errors": 0, "blocks_read": 0, "block_errors": 0}
+        self._rtt_last = 0.0
+        self._rtt_sum = 0.0
+        self._rtt_max = 0.0
 
     @property
     def blocks(self) -> list[RegisterBlock]:
         """Список опрашиваемых блоков."""
         return list(self._blocks)
 
+    def plan(self, indices: list[int] | None = None) -> list[ReadSpan]:
+        """План чтений для блоков ``indices`` (по умолчанию — всех).
+
+        ``ReadSpan.group`` — RegisterKind, ``members`` — индексы в ``blocks``.
+        """
+        due = tuple(range(len(self._blocks)) if indices is None else sorted(indices))
+        plan = self._plans.get(due)
+        if plan is None:
+            if self._coalesce:
+                ranges = [(self._blocks[i].kind, self._blocks[i].address, self._blocks[i].count) for i in due]
+                plan = plan_reads(ranges, max_gap=self._max_gap, max_count=_PDU_LIMITS)
+                for span in plan:
+                    span.members = [due[m] for m in span.members]
+            else:
+                plan = [
+                    ReadSpan(self._blocks[i].kind, self._blocks[i].address, self._blocks[i].count, [i]) for i in due
+                ]
+            self._plans[due] = plan
+        return plan
+
     def poll_once(self) -> dict[str, Any]:
-        """Прочитать все блоки. Возвращает {name: values | {"error": msg}}.
+        """Прочитать блоки, due в этом проходе. Возвращает {name: values | {"error": msg}}.
 
-        Ошибка чтения отдельного блока не прерывает опрос остальных — она
-        фиксируется в результате этого блока и в телеметрии устройства.
+        В результат попадают только блоки, опрошенные в этом проходе (блок с
+        ``every=N`` — в проходах 0, N, 2N, ...). Ошибка чтения отдельного блока не
+        прерывает опрос остальных — она фиксируется в результате этого блока и в
+        телеметрии устройства. Ошибка слитого чтения не «заражает» соседей: его
+        блоки перечитываются поштучно. Делится слитое чтение навсегда только по
+        exception-ответу illegal address/value; после преходящего сбоя (таймаут,
+        обрыв) оно повторяется целиком в следующем проходе.
         """
+        cycle = self._cycle
+        self._cycle += 1
+        self._stats["cycles"] += 1
+        due = [i for i, b in enumerate(self._blocks) if cycle % b.every == 0]
         result: dict[str, Any] = {}
-        for block in self._blocks:
-            reader = getattr(self._device, _READERS[block.kind])
+        for span in self.plan(due):
+            key = (span.group, span.address, span.count)
+            if len(span.members) > 1 and key not in self._split:
+                try:
+                    values = self._read(span.group, span.address, span.count)
+                except Exception as exc:  # noqa: BLE001 - изоляция блоков: fallback поблочно
+                    if self._read_members(span.members, result) and _is_range_rejection(exc):
+                        self._split.add(key)
+                    continue
+                for i in span.members:
+                    block = self._blocks[i]
+                    offset = block.address - span.address
+                    result[block.name] = values[offset : offset + block.count]
+                self._stats["blocks_read"] += len(span.members)
+            else:
+                self._read_members(span.members, result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Счётчики опроса устройства (Dict at Boundary).
+
+        ``reads`` — round-trip'ы (успешные + ошибочные), ``blocks_read`` — блоки,
+        получившие значения; их отношение — выигрыш слияния. RTT — по успешным и
+        ошибочным чтениям, мс.
+        """
+        reads = self._stats["reads"]
+        return {
+            **self._stats,
+            "split_spans": len(self._split),
+            "rtt_ms_last": round(self._rtt_last * 1000.0, 3),
+            "rtt_ms_avg": round(self._rtt_sum / reads * 1000.0, 3) if reads else 0.0,
+            "rtt_ms_max": round(self._rtt_max * 1000.0, 3),
+        }
+
+    # ------------------------------------------------------------------ #
+    # Внутреннее
+    # ------------------------------------------------------------------ #
+
+    def _read_members(self, members: list[int], result: dict[str, Any]) -> bool:
+        """Поблочное чтение. Возвращает True, если хоть один блок прочитан."""
+        any_ok = False
+        for i in members:
+            block = self._blocks[i]
             try:
-                result[block.name] = reader(block.address, block.count)
+                result[block.name] = self._read(block.kind, block.address, block.count)
             except Exception as exc:  # noqa: BLE001 - изоляция блоков
                 result[block.name] = {"error": str(exc)}
-        return result
+                self._stats["block_errors"] += 1
+                continue
+            self._stats["blocks_read"] += 1
+            any_ok = True
+        return any_ok
+
+    def _read(self, kind: RegisterKind, address: int, count: int) -> list:
+        reader = getattr(self._device, _READERS[kind])
+        t0 = self._clock()
+        try:
+            return reader(address, count)
+        except Exception:
+            self._stats["read_errors"] += 1
+            raise
+        finally:
+            rtt = self._clock() - t0
+            self._stats["reads"] += 1
+            self._rtt_last = rtt
+            self._rtt_sum += rtt
+            self._rtt_max = max(self._rtt_max, rtt)
 
     @classmethod
-    def from_specs(cls, device: ModbusDevice, specs: list[dict[str, Any]]) -> "ModbusPoller":
-        """Создать poller из списка dict-описаний (Dict at Boundary / YAML)."""
+    def from_specs(cls, device: ModbusDevice, specs: list[dict[str, Any]], **kwargs: Any) -> "ModbusPoller":
+        """Создать poller из списка dict-описаний (Dict at Boundary / YAML).
+
+        ``kwargs`` — опции планировщика (``max_gap``, ``coalesce``).
+        """
         blocks = [
             RegisterBlock(
                 name=s["name"],
                 kind=s.get("kind", "holding"),
                 address=int(s["address"]),
                 count=int(s.get("count", 1)),
+                every=int(s.get("every", 1)),
             )
             for s in specs
         ]
-        return cls(device, blocks)
+        return cls(device, blocks, **kwargs)
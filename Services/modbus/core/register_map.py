@@ -18,6 +18,7 @@
 
     MAP.read(transport, "encoder")            -> int
     MAP.read(transport, "status")             -> {"running": 0, "out_freq_hz": 50.0, ...}
+    MAP.read_many(transport, ["encoder", "status"])  -> {имя: значение} слитыми чтениями
     MAP.write_ops({"freq_cmd": 50.0, ...})    -> ops для RegisterTransport.transaction()
 
 Масштабирование: новый регистр устройства = одна строка в карте. Encode/decode —
@@ -33,6 +34,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Union
 
+from Services.modbus.core.read_plan import plan_reads
 from Services.modbus.sdk.datatypes import (
     WordOrder,
     decode_int16,
@@ -127,6 +129,15 @@ def _decode_word(raw: int, *, scale: float, signed: bool) -> int | float:
     return value / scale if scale != 1.0 else value
 
 
+def _entry_count(entry: Entry) -> int:
+    """Число слов записи карты."""
+    if isinstance(entry, Reg):
+        return 1
+    if isinstance(entry, RegDW):
+        return 2
+    return entry.count
+
+
 def _encode_word(value: float, *, scale: float, signed: bool) -> int:
     """Закодировать одно слово: масштаб + знак (в u16-представление)."""
     raw = round(value * scale)
@@ -169,6 +180,15 @@ class RegisterMap:
     def __contains__(self, name: str) -> bool:
         return name in self._entries
 
+    def span(self, name: str) -> tuple[int, int]:
+        """(адрес, число слов) записи — для собственного планирования чтений (async I/O)."""
+        entry = self.entry(name)
+        return entry.address, _entry_count(entry)
+
+    def decode(self, name: str, words: list[int]) -> int | float | dict | list[int]:
+        """Раскодировать слова записи, прочитанные вызывающим (напр. async-клиентом)."""
+        return self._decode(self.entry(name), words)
+
     # ------------------------------------------------------------------ #
     # Чтение
     # ------------------------------------------------------------------ #
@@ -182,23 +202,46 @@ class RegisterMap:
             RegBlock -> dict {field: value} при fields, иначе сырой list[int].
         """
         entry = self.entry(name)
+        return self._decode(entry, transport.read_registers(entry.address, _entry_count(entry)))
+
+    def read_many(
+        self, transport: "RegisterTransport", names: list[str], *, max_gap: int = 0
+    ) -> dict[str, int | float | dict | list[int]]:
+        """Прочитать несколько записей минимальным числом запросов.
+
+        Смежные записи (зазор ``<= max_gap`` регистров) читаются одним
+        ``read_registers`` в пределах лимита PDU (125) и раскодируются по месту —
+        телеметрия из десятка тегов = один round-trip вместо десятка. Дыра читается
+        с устройства: задавайте ``max_gap`` только внутри реально существующей
+        области регистров. Ошибка чтения пробрасывается (как у ``read``).
+
+        Returns:
+            {имя: значение} в порядке ``names``; значения — как у ``read``.
+        """
+        entries = [self.entry(name) for name in names]
+        spans = plan_reads([("hr", e.address, _entry_count(e)) for e in entries], max_gap=max_gap)
+        decoded: dict[int, int | float | dict | list[int]] = {}
+        for span in spans:
+            words = transport.read_registers(span.address, span.count)
+            for idx in span.members:
+                entry = entries[idx]
+                offset = entry.address - span.address
+                decoded[idx] = self._decode(entry, words[offset : offset + _entry_count(entry)])
+        return {name: decoded[idx] for idx, name in enumerate(names)}
+
+    def _decode(self, entry: Entry, words: list[int]) -> int | float | dict | list[int]:
+        """Раскодировать слова записи (Reg — 1 слово, RegDW — 2, RegBlock — count)."""
         if isinstance(entry, Reg):
-            raw = transport.read_registers(entry.address, 1)[0]
-            return _decode_word(raw, scale=entry.scale, signed=entry.signed)
+            return _decode_word(words[0], scale=entry.scale, signed=entry.signed)
         if isinstance(entry, RegDW):
-            regs = transport.read_registers(entry.address, 2)
             decode = decode_int32 if entry.signed else decode_uint32
-            value = decode(regs, self._word_order)
+            value = decode(words, self._word_order)
             return value / entry.scale if entry.scale != 1.0 else value
-        return self._read_block(transport, entry)
-
-    def _read_block(self, transport: "RegisterTransport", block: RegBlock) -> dict | list[int]:
-        words = transport.read_registers(block.address, block.count)
-        if not block.fields:
+        if not entry.fields:
             return words
         return {
             f.name: _decode_word(raw, scale=f.scale, signed=f.signed)
-            for f, raw in zip(block.fields, words, strict=True)
+            for f, raw in zip(entry.fields, words, strict=True)
         }
 
     # ------------------------------------------------------------------ #
@@ -4,6 +4,7 @@ from Services.modbus.sdk.client import MODBUS_AVAILABLE, ModbusSdkClient
 from Services.modbus.sdk.errors import (
     ModbusConnectionError,
     ModbusDriverError,
+    ModbusExceptionResponseError,
     ModbusIOError,
     ModbusNotAvailableError,
 )
@@ -15,4 +16,5 @@ __all__ = [
     "ModbusNotAvailableError",
     "ModbusConnectionError",
     "ModbusIOError",
+    "ModbusExceptionResponseError",
 ]
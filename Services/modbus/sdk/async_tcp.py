@@ -0,0 +1,241 @@
+"""Асинхронный Modbus-TCP клиент (asyncio, stdlib) с конвейером запросов.
+
+Sync-клиент (``sdk/client.py``) — один запрос за раз: следующий уходит только
+после ответа на предыдущий, поэтому N тегов = N × RTT. Modbus-TCP (MBAP) несёт
+transaction id в каждом кадре — ответ сопоставляется с запросом по нему, и
+несколько запросов могут быть «в полёте» одновременно на одном соединении
+(конвейер). Этот клиент так и работает: ``read_*``/``write_*`` — корутины,
+одновременные вызовы уходят в сокет сразу, ответы разбирает одна фоновая задача
+чтения. Глубина конвейера ограничена ``max_inflight``. Дефолт 1 — строго
+последовательный обмен: многие slave'ы (включая pymodbus-сервер ``server/``)
+обрабатывают один запрос на соединение и молча теряют лишние. Включайте >1 только
+для устройств, которые документированно держат очередь (шлюзы, часть PLC: 4–16).
+Параллелизм без конвейера даёт сам reactor: десятки устройств — десятки
+соединений, ожидающих ответа одновременно в одном event loop.
+
+Без pymodbus: кадры MBAP/PDU собираются ``struct``'ом — клиент работает в любом
+окружении, где есть asyncio. Ошибки — та же иерархия ``ModbusDriverError``:
+обрыв/отказ соединения → ``ModbusConnectionError`` (все запросы в полёте падают
+разом), exception-ответ устройства и таймаут → ``ModbusIOError``.
+
+Клиент не thread-safe: все вызовы — из одного event loop (reactor устройства).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import struct
+import time
+from typing import Any
+
+from Services.modbus.sdk.errors import ModbusConnectionError, ModbusExceptionResponseError, ModbusIOError
+
+# MBAP: transaction id, protocol id (0), length (unit + PDU), unit id.
+_MBAP = struct.Struct(">HHHB")
+
+_FC_READ_COILS = 1
+_FC_READ_DISCRETE = 2
+_FC_READ_HOLDING = 3
+_FC_READ_INPUT = 4
+_FC_WRITE_REGISTER = 6
+_FC_WRITE_REGISTERS = 16
+
+
+class AsyncModbusTcpClient:
+    """Modbus-TCP master на asyncio с конвейером запросов по transaction id.
+
+    Пример::
+
+        client = AsyncModbusTcpClient("192.168.1.10", unit_id=1, max_inflight=4)
+        await client.connect()
+        a, b = await asyncio.gather(client.read_holding(0, 10), client.read_input(100, 4))
+        await client.close()
+
+    Args:
+        host:         IP/hostname устройства.
+        port:         TCP-порт.
+        unit_id:      Адрес ведомого (unit / device_id).
+        timeout_sec:  Таймаут ответа на один запрос.
+        max_inflight: Максимум запросов «в полёте» на соединении (>= 1).
+        tcp_nodelay:  Отключить Нейгла (мелкие кадры уходят без задержки).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        *,
+        unit_id: int = 1,
+        timeout_sec: float = 1.0,
+        max_inflight: int = 1,
+        tcp_nodelay: bool = True,
+    ) -> None:
+        if max_inflight < 1:
+            raise ValueError(f"max_inflight: ожидается >= 1, получено {max_inflight}")
+        self._host = host
+        self._port = port
+        self._unit = unit_id
+        self._timeout = timeout_sec
+        self._max_inflight = max_inflight
+        self._nodelay = tcp_nodelay
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._rx_task: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._tid = 0
+        self._stats = {"requests": 0, "errors": 0, "timeouts": 0, "inflight_max": 0}
+        self._rtt_sum = 0.0
+
+    # ------------------------------------------------------------------ #
+    # Соединение
+    # ------------------------------------------------------------------ #
+
+    @property
+    def connected(self) -> bool:
+        """True, если соединение открыто и задача чтения жива."""
+        return self._writer is not None and self._rx_task is not None and not self._rx_task.done()
+
+    async def connect(self) -> None:
+        """Открыть соединение (на живом — no-op; после обрыва — переподключение)."""
+        if self.connected:
+            return
+        if self._writer is not None:  # мёртвое соединение после обрыва
+            self._writer.close()
+            self._writer = None
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), self._timeout
+            )
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise ModbusConnectionError(f"{self._host}:{self._port}: {exc or 'таймаут connect'}") from exc
+        sock = self._writer.get_extra_info("socket")
+        if self._nodelay and sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._slots = asyncio.Semaphore(self._max_inflight)
+        self._rx_task = asyncio.get_running_loop().create_task(self._rx_loop())
+
+    async def close(self) -> None:
+        """Закрыть соединение; запросы в полёте падают ModbusConnectionError."""
+        writer, self._writer = self._writer, None
+        if self._rx_task is not None:
+            self._rx_task.cancel()
+            try:
+                await self._rx_task
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001 - teardown
+                pass
+            self._rx_task = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+        self._fail_pending(ModbusConnectionError("соединение закрыто"))
+
+    # ------------------------------------------------------------------ #
+    # Чтение / запись
+    # ------------------------------------------------------------------ #
+
+    async def read_holding(self, address: int, count: int = 1) -> list[int]:
+        """Читать holding-регистры (FC=03)."""
+        return _registers(await self._request(_FC_READ_HOLDING, struct.pack(">HH", address, count)), count)
+
+    async def read_input(self, address: int, count: int = 1) -> list[int]:
+        """Читать input-регистры (FC=04)."""
+        return _registers(await self._request(_FC_READ_INPUT, struct.pack(">HH", address, count)), count)
+
+    async def read_coils(self, address: int, count: int = 1) -> list[bool]:
+        """Читать coils (FC=01)."""
+        return _bits(await self._request(_FC_READ_COILS, struct.pack(">HH", address, count)), count)
+
+    async def read_discrete_inputs(self, address: int, count: int = 1) -> list[bool]:
+        """Читать discrete inputs (FC=02)."""
+        return _bits(await self._request(_FC_READ_DISCRETE, struct.pack(">HH", address, count)), count)
+
+    async def read_registers(self, address: int, count: int = 1) -> list[int]:
+        """Alias read_holding (как у ModbusDevice / RegisterTransport)."""
+        return await self.read_holding(address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        """Записать один holding-регистр (FC=06)."""
+        await self._request(_FC_WRITE_REGISTER, struct.pack(">HH", address, value & 0xFFFF))
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        """Записать блок holding-регистров (FC=16)."""
+        words = [v & 0xFFFF for v in values]
+        body = struct.pack(f">HHB{len(words)}H", address, len(words), 2 * len(words), *words)
+        await self._request(_FC_WRITE_REGISTERS, body)
+
+    def stats(self) -> dict[str, Any]:
+        """Счётчики клиента: запросы, ошибки, таймауты, пик конвейера, средний RTT (мс)."""
+        done = self._stats["requests"]
+        return {**self._stats, "rtt_ms_avg": round(self._rtt_sum / done * 1000.0, 3) if done else 0.0}
+
+    # ------------------------------------------------------------------ #
+    # Внутреннее
+    # ------------------------------------------------------------------ #
+
+    async def _request(self, function_code: int, body: bytes) -> bytes:
+        """Отправить PDU и дождаться ответа с тем же transaction id."""
+        if not self.connected or self._slots is None:
+            raise ModbusConnectionError(f"{self._host}:{self._port}: не подключён")
+        async with self._slots:
+            self._tid = self._tid % 0xFFFF + 1
+            tid = self._tid
+            fut: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._pending[tid] = fut
+            self._stats["inflight_max"] = max(self._stats["inflight_max"], len(self._pending))
+            pdu = bytes((function_code,)) + body
+            t0 = time.perf_counter()
+            try:
+                assert self._writer is not None
+                self._writer.write(_MBAP.pack(tid, 0, len(pdu) + 1, self._unit) + pdu)
+                response = await asyncio.wait_for(fut, self._timeout)
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                self._stats["errors"] += 1
+                raise ModbusIOError(f"FC{function_code}: нет ответа за {self._timeout} с (tid={tid})") from None
+            except ModbusConnectionError:
+                self._stats["errors"] += 1
+                raise
+            finally:
+                self._pending.pop(tid, None)
+            self._stats["requests"] += 1
+            self._rtt_sum += time.perf_counter() - t0
+        if response[0] & 0x80:
+            self._stats["errors"] += 1
+            code = response[1] if len(response) > 1 else 0
+            raise ModbusExceptionResponseError(f"FC{function_code}: exception-ответ устройства, код {code}", code)
+        return response
+
+    async def _rx_loop(self) -> None:
+        """Разбор входящих кадров: ответ -> future запроса с тем же tid."""
+        assert self._reader is not None
+        try:
+            while True:
+                header = await self._reader.readexactly(_MBAP.size)
+                tid, _proto, length, _unit = _MBAP.unpack(header)
+                pdu = await self._reader.readexactly(length - 1)
+                fut = self._pending.get(tid)
+                if fut is not None and not fut.done():
+                    fut.set_result(pdu)
+        except (asyncio.IncompleteReadError, OSError) as exc:
+            self._fail_pending(ModbusConnectionError(f"{self._host}:{self._port}: соединение потеряно ({exc})"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        for fut in self._pending.values():
+            if not fut.done():
+                fut.set_exception(exc)
+
+
+def _registers(pdu: bytes, count: int) -> list[int]:
+    """Ответ FC03/04: [fc, byte_count, words...] -> list[int]."""
+    return list(struct.unpack_from(f">{count}H", pdu, 2))
+
+
+def _bits(pdu: bytes, count: int) -> list[bool]:
+    """Ответ FC01/02: [fc, byte_count, packed bits (LSB first)...] -> list[bool]."""
+    data = pdu[2:]
+    return [bool(data[i // 8] >> (i % 8) & 1) for i in range(count)]
@@ -22,6 +22,7 @@ from loguru import logger
 from Services.modbus.core.config import ModbusConfig, TransportType
 from Services.modbus.sdk.errors import (
     ModbusConnectionError,
+    ModbusExceptionResponseError,
     ModbusIOError,
     ModbusNotAvailableError,
 )
@@ -170,6 +171,9 @@ class ModbusSdkClient:
             result = method(*args, slave=unit, **kwargs)
         if result is None or result.isError():
             logger.warning(f"[MODBUS {tag}] ERR {method_name} @{addr} unit={unit} → {result!r}")
+            code = getattr(result, "exception_code", None)
+            if isinstance(code, int):
+                raise ModbusExceptionResponseError(f"{method_name} -> exception-ответ устройства: {result}", code)
             raise ModbusIOError(f"{method_name} -> ошибка устройства: {result}")
         # RX в консоль — только при MODBUS_WIRE_LOG=1.
         if _WIRE_VERBOSE:
@@ -27,3 +27,16 @@ class ModbusConnectionError(ModbusDriverError):
 
 class ModbusIOError(ModbusDriverError):
     """Ошибка операции чтения/записи (таймаут, exception-ответ устройства)."""
+
+
+class ModbusExceptionResponseError(ModbusIOError):
+    """Устройство ответило exception-кадром (FC | 0x80) — запрос отвергнут, связь жива.
+
+    Attributes:
+        code: Modbus exception code (1 — illegal function, 2 — illegal data address,
+              3 — illegal data value, 4 — device failure, ...).
+    """
+
+    def __init__(self, message: str, code: int) -> None:
+        super().__init__(message)
+        self.code = code
@@ -0,0 +1,169 @@
+"""Тесты AsyncModbusTcpClient: кадры MBAP, конвейер по tid, ошибки, sim-сервер."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import pytest
+
+from Services.modbus.sdk.async_tcp import AsyncModbusTcpClient
+from Services.modbus.sdk.errors import ModbusConnectionError, ModbusIOError
+
+
+class PipelinedSlave:
+    """Мини-slave на asyncio: копит ``batch`` запросов и отвечает в ОБРАТНОМ порядке.
+
+    holding[i] = i; адрес >= 1000 — exception-ответ (код 2); ``drop`` — закрыть
+    соединение вместо ответа.
+    """
+
+    def __init__(self, batch: int = 1) -> None:
+        self.batch = batch
+        self.drop = False
+        self.writes: list[tuple[int, list[int]]] = []
+        self.server: asyncio.base_events.Server | None = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        queue: list[bytes] = []
+        try:
+            while True:
+                tid, _, length, unit = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                if self.drop:
+                    writer.close()
+                    return
+                queue.append(self._frame(tid, unit, self._respond(pdu)))
+                if len(queue) >= self.batch:
+                    for frame in reversed(queue):
+                        writer.write(frame)
+                    queue.clear()
+                    await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _respond(self, pdu: bytes) -> bytes:
+        fc = pdu[0]
+        address, count = struct.unpack_from(">HH", pdu, 1)
+        if address >= 1000:
+            return bytes((fc | 0x80, 2))
+        if fc in (3, 4):
+            return struct.pack(f">BB{count}H", fc, 2 * count, *range(address, address + count))
+        if fc in (1, 2):
+            bits = [(address + i) % 2 for i in range(count)]
+            packed = bytes(sum(b << j for j, b in enumerate(bits[k : k + 8])) for k in range(0, count, 8))
+            return bytes((fc, len(packed))) + packed
+        if fc == 16:
+            self.writes.append((address, list(struct.unpack_from(f">{count}H", pdu, 6))))
+        return pdu[:5]
+
+    @staticmethod
+    def _frame(tid: int, unit: int, pdu: bytes) -> bytes:
+        return struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu
+
+
+def _run(coro_fn) -> None:
+    asyncio.run(coro_fn())
+
+
+def test_pipelined_requests_matched_by_transaction_id() -> None:
+    async def main() -> None:
+        slave = PipelinedSlave(batch=4)
+        port = await slave.start()
+        client = AsyncModbusTcpClient("127.0.0.1", port, max_inflight=4)
+        await client.connect()
+        results = await asyncio.gather(*(client.read_holding(10 * i, 2) for i in range(8)))
+        assert results == [[10 * i, 10 * i + 1] for i in range(8)]
+        assert client.stats()["inflight_max"] == 4
+        await client.close()
+        await slave.stop()
+
+    _run(main)
+
+
+def test_bits_writes_and_exception_response() -> None:
+    async def main() -> None:
+        slave = PipelinedSlave()
+        port = await slave.start()
+        client = AsyncModbusTcpClient("127.0.0.1", port)
+        await client.connect()
+        assert await client.read_coils(0, 10) == [False, True] * 5
+        await client.write_registers(5, [1, 0x1FFFF])
+        assert slave.writes == [(5, [1, 0xFFFF])]
+        with pytest.raises(ModbusIOError, match="код 2") as rejected:
+            await client.read_input(1000, 1)
+        assert rejected.value.code == 2  # exception-ответ отличим от сбоя связи
+        assert client.stats()["errors"] == 1
+        await client.close()
+        await slave.stop()
+
+    _run(main)
+
+
+def test_connection_loss_fails_inflight_and_reconnects() -> None:
+    async def main() -> None:
+        slave = PipelinedSlave()
+        port = await slave.start()
+        client = AsyncModbusTcpClient("127.0.0.1", port, timeout_sec=2.0)
+        await client.connect()
+        slave.drop = True
+        with pytest.raises(ModbusConnectionError):
+            await client.read_holding(0, 1)
+        assert not client.connected
+        slave.drop = False
+        await client.connect()
+        assert await client.read_holding(3, 1) == [3]
+        await client.close()
+        await slave.stop()
+
+    _run(main)
+
+
+def test_timeout_and_refused_connect() -> None:
+    async def main() -> None:
+        slave = PipelinedSlave(batch=2)  # ответ только на пару — одиночный запрос зависнет
+        port = await slave.start()
+        client = AsyncModbusTcpClient("127.0.0.1", port, timeout_sec=0.1)
+        await client.connect()
+        with pytest.raises(ModbusIOError, match="нет ответа"):
+            await client.read_holding(0, 1)
+        assert client.stats()["timeouts"] == 1
+        await client.close()
+        await slave.stop()
+        with pytest.raises(ModbusConnectionError):
+            await AsyncModbusTcpClient("127.0.0.1", port, timeout_sec=0.5).connect()
+
+    _run(main)
+
+
+def test_real_sim_server_roundtrip() -> None:
+    """Последовательный обмен с pymodbus-slave (server/sim_server.py)."""
+    pytest.importorskip("pymodbus")
+
+    import threading
+    import time
+
+    from Services.modbus.server import run_test_server
+
+    port = 5095
+    threading.Thread(target=run_test_server, kwargs={"port": port, "size": 300}, daemon=True).start()
+    time.sleep(1.0)
+
+    async def main() -> None:
+        client = AsyncModbusTcpClient("127.0.0.1", port, timeout_sec=3.0)
+        await client.connect()
+        await client.write_registers(20, [7, 8, 9])
+        values = await asyncio.gather(*(client.read_holding(20 + i, 1) for i in range(3)))
+        assert values == [[7], [8], [9]]
+        await client.close()
+
+    _run(main)
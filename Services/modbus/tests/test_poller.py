@@ -1,10 +1,14 @@
-"""Тесты ModbusPoller — опрос блоков и изоляция ошибок."""
+"""Тесты ModbusPoller — опрос блоков, слияние чтений, период опроса и изоляция ошибок."""
 
 from __future__ import annotations
 
+import pytest
+
 from Services.modbus.core.device import ModbusDevice
 from Services.modbus.core.poller import ModbusPoller, RegisterBlock, RegisterKind
 
+from Services.modbus.sdk.errors import ModbusExceptionResponseError
+
 from .conftest import FakeSdkClient
 
 
@@ -52,3 +56,132 @@ def test_from_specs_builds_blocks(device: ModbusDevice) -> None:
     )
     assert poller.blocks[0].count == 4
     assert poller.blocks[0].kind is RegisterKind.HOLDING
+
+
+def test_adjacent_blocks_coalesced_into_one_read(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    fake_client.holding = {i: i * 10 for i in range(20)}
+    device.connect()
+    poller = ModbusPoller(
+        device,
+        [
+            RegisterBlock("b", RegisterKind.HOLDING, 4, 2),
+            RegisterBlock("a", RegisterKind.HOLDING, 0, 4),
+            RegisterBlock("far", RegisterKind.HOLDING, 10, 1),
+            RegisterBlock("in", RegisterKind.INPUT, 4, 1),
+        ],
+    )
+    result = poller.poll_once()
+    assert result == {"a": [0, 10, 20, 30], "b": [40, 50], "far": [100], "in": [0]}
+    assert fake_client.calls == [
+        ("read_holding", (0, 6)),
+        ("read_holding", (10, 1)),
+        ("read_input", (4, 1)),
+    ]
+    stats = poller.stats()
+    assert stats["reads"] == 3 and stats["blocks_read"] == 4
+
+
+def test_max_gap_and_pdu_limit(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    device.connect()
+    blocks = [
+        RegisterBlock("a", RegisterKind.HOLDING, 0, 100),
+        RegisterBlock("b", RegisterKind.HOLDING, 103, 2),  # дыра 3 — сливается при max_gap=3
+        RegisterBlock("c", RegisterKind.HOLDING, 105, 30),  # 0..135 > 125 — отдельное чтение
+    ]
+    poller = ModbusPoller(device, blocks, max_gap=3)
+    poller.poll_once()
+    assert fake_client.calls == [("read_holding", (0, 105)), ("read_holding", (105, 30))]
+
+
+def test_every_polls_slow_blocks_less_often(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    device.connect()
+    poller = ModbusPoller.from_specs(
+        device,
+        [
+            {"name": "fast", "address": 0, "count": 1},
+            {"name": "slow", "address": 1, "count": 1, "every": 3},
+        ],
+    )
+    seen = [sorted(poller.poll_once()) for _ in range(4)]
+    assert seen == [["fast", "slow"], ["fast"], ["fast"], ["fast", "slow"]]
+    assert poller.stats()["reads"] == 4  # fast+slow смежные — один запрос в проходах 0 и 3
+
+
+def test_failed_merged_read_falls_back_and_splits(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    device.connect()
+    original = fake_client.read_holding
+
+    def read_holding(address: int, count: int) -> list[int]:
+        if count > 2:  # «дыра» 2..3 на устройстве не существует
+            raise ModbusExceptionResponseError("fake: illegal data address", 2)
+        return original(address, count)
+
+    fake_client.read_holding = read_holding  # type: ignore[method-assign]
+    poller = ModbusPoller(
+        device,
+        [RegisterBlock("a", RegisterKind.HOLDING, 0, 2), RegisterBlock("b", RegisterKind.HOLDING, 4, 1)],
+        max_gap=2,
+    )
+    assert poller.poll_once() == {"a": [0, 0], "b": [0]}
+    assert poller.stats()["split_spans"] == 1
+    calls_before = len(fake_client.calls)
+    poller.poll_once()
+    assert len(fake_client.calls) - calls_before == 2  # дальше — сразу поблочно
+    assert poller.stats()["read_errors"] == 1
+
+
+def test_transient_merged_failure_does_not_split(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    device.connect()
+    poller = ModbusPoller(
+        device,
+        [RegisterBlock("a", RegisterKind.HOLDING, 0, 2), RegisterBlock("b", RegisterKind.HOLDING, 2, 1)],
+    )
+    fake_client.fail_next_op = True  # таймаут/обрыв на слитом чтении
+    assert poller.poll_once() == {"a": [0, 0], "b": [0]}  # проход спасён поблочно
+    assert poller.stats()["split_spans"] == 0
+    calls_before = len(fake_client.calls)
+    poller.poll_once()
+    assert len(fake_client.calls) - calls_before == 1  # слитое чтение снова одним запросом
+
+
+def test_coalesce_disabled_reads_per_block(device: ModbusDevice, fake_client: FakeSdkClient) -> None:
+    device.connect()
+    poller = ModbusPoller(
+        device,
+        [RegisterBlock("a", RegisterKind.HOLDING, 0, 1), RegisterBlock("b", RegisterKind.HOLDING, 1, 1)],
+        coalesce=False,
+    )
+    poller.poll_once()
+    assert len(fake_client.calls) == 2
+
+
+def test_real_sim_server_coalesced_poll() -> None:
+    """Слитый опрос против тестового slave (server/sim_server.py)."""
+    pytest.importorskip("pymodbus")
+
+    import threading
+    import time
+
+    from Services.modbus.core.config import ModbusConfig
+    from Services.modbus.server import run_test_server
+
+    port = 5097
+    threading.Thread(
+        target=run_test_server,
+        kwargs={"host": "127.0.0.1", "port": port, "size": 300},
+        daemon=True,
+    ).start()
+    time.sleep(1.0)
+
+    device = ModbusDevice(ModbusConfig(host="127.0.0.1", port=port, unit_id=1, timeout_sec=3))
+    assert device.connect()
+    try:
+        device.write_registers(10, [1, 2, 3, 4, 5, 6])
+        specs = [{"name": f"tag{i}", "address": 10 + i, "count": 1} for i in range(6)]
+        poller = ModbusPoller.from_specs(device, specs)
+        result = poller.poll_once()
+    finally:
+        device.disconnect()
+    assert [result[f"tag{i}"] for i in range(6)] == [[1], [2], [3], [4], [5], [6]]
+    stats = poller.stats()
+    assert stats["reads"] == 1 and stats["blocks_read"] == 6 and stats["rtt_ms_last"] > 0
@@ -0,0 +1,35 @@
+"""Тесты планировщика слитых чтений (core/read_plan.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from Services.modbus.core.read_plan import MAX_READ_REGISTERS, plan_reads
+
+
+def test_overlapping_and_adjacent_merge() -> None:
+    spans = plan_reads([("hr", 10, 2), ("hr", 0, 4), ("hr", 4, 6), ("hr", 1, 1)])
+    assert [(s.address, s.count, s.members) for s in spans] == [(0, 12, [1, 3, 2, 0])]
+
+
+def test_groups_never_merge() -> None:
+    spans = plan_reads([("hr", 0, 1), ("ir", 1, 1)])
+    assert [(s.group, s.address) for s in spans] == [("hr", 0), ("ir", 1)]
+
+
+def test_limit_splits_spans() -> None:
+    ranges = [("hr", i * 25, 25) for i in range(11)]  # 275 регистров подряд
+    spans = plan_reads(ranges)
+    assert [s.count for s in spans] == [125, 125, 25]
+    assert all(s.count <= MAX_READ_REGISTERS for s in spans)
+
+
+def test_per_group_limits_and_gap() -> None:
+    ranges = [("coils", 0, 1000), ("coils", 1500, 400), ("hr", 0, 1), ("hr", 10, 1)]
+    spans = plan_reads(ranges, max_gap=500, max_count={"coils": 2000, "hr": 125})
+    assert [(s.group, s.address, s.count) for s in spans] == [("coils", 0, 1900), ("hr", 0, 11)]
+
+
+def test_negative_gap_rejected() -> None:
+    with pytest.raises(ValueError):
+        plan_reads([], max_gap=-1)
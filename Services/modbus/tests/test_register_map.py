@@ -19,12 +19,14 @@ class StubTransport:
     def __init__(self, holding: dict[int, int] | None = None) -> None:
         self.holding: dict[int, int] = dict(holding or {})
         self.transactions: list[list[tuple]] = []
+        self.reads: list[tuple[int, int]] = []
 
     @property
     def is_connected(self) -> bool:
         return True
 
     def read_registers(self, address: int, count: int = 1) -> list[int]:
+        self.reads.append((address, count))
         return [self.holding.get(address + i, 0) for i in range(count)]
 
     def transaction(self, ops: list[tuple]) -> bool:
@@ -121,6 +123,37 @@ def test_block_without_fields_reads_raw_list(transport: StubTransport) -> None:
     assert rmap.read(transport, "echo") == [7, 8, 9]
 
 
+# --- read_many: слитые чтения ---
+
+
+def test_read_many_coalesces_adjacent_entries(transport: StubTransport) -> None:
+    rmap = RegisterMap(
+        {
+            "flag": Reg(0x1100),
+            "encoder": RegDW(0x1101, signed=True),
+            "status": RegBlock(0x1103, fields=(Field("running"), Field("freq", scale=100))),
+            "far": Reg(0x1200),
+        }
+    )
+    transport.holding.update({0x1100: 1, 0x1101: 0xFFFF, 0x1102: 0xFFFE, 0x1103: 1, 0x1104: 5000, 0x1200: 9})
+    values = rmap.read_many(transport, ["far", "status", "flag", "encoder"])
+    assert list(values) == ["far", "status", "flag", "encoder"]
+    assert values["flag"] == 1
+    assert values["encoder"] == rmap.read(transport, "encoder")
+    assert values["status"] == {"running": 1, "freq": 50.0}
+    assert values["far"] == 9
+    assert transport.reads[:2] == [(0x1100, 5), (0x1200, 1)]
+
+
+def test_read_many_gap_tolerance(transport: StubTransport) -> None:
+    rmap = RegisterMap({"a": Reg(0), "b": Reg(3)})
+    rmap.read_many(transport, ["a", "b"])
+    assert transport.reads == [(0, 1), (3, 1)]
+    transport.reads.clear()
+    assert rmap.read_many(transport, ["a", "b"], max_gap=2) == {"a": 0, "b": 0}
+    assert transport.reads == [(0, 4)]
+
+
 def test_block_count_derived_from_fields() -> None:
     block = RegBlock(0x1300, fields=(Field("a"), Field("b")))
     assert block.count == 2
@@ -20,7 +20,7 @@ from Services.modbus import MODBUS_AVAILABLE as ROBOT_AVAILABLE
 
 from Services.robot_comm.core.client import RobotClient
 from Services.robot_comm.core.config import RobotConfig
-from Services.robot_comm.core.datatypes import DrawPoint, JobEcho, RobotPosition, Telemetry
+from Services.robot_comm.core.datatypes import DrawPoint, DrawStats, JobEcho, RobotPosition, Telemetry
 from Services.robot_comm.core.registers import build_register_map
 from Services.robot_comm.errors import RobotCommError, RobotJobError, RobotNotConnectedError
 from Services.robot_comm.interfaces import DeviceTransport, RobotClientProtocol
@@ -32,6 +32,7 @@ __all__ = [
     "Telemetry",
     "JobEcho",
     "DrawPoint",
+    "DrawStats",
     "RobotClientProtocol",
     "DeviceTransport",
     "RobotCommError",
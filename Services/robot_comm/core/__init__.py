@@ -2,7 +2,7 @@
 
 from Services.robot_comm.core.client import RobotClient
 from Services.robot_comm.core.config import RobotConfig
-from Services.robot_comm.core.datatypes import DrawPoint, JobEcho, RobotPosition, Telemetry
+from Services.robot_comm.core.datatypes import DrawPoint, DrawStats, JobEcho, RobotPosition, Telemetry
 from Services.robot_comm.core.registers import build_register_map
 
 __all__ = [
@@ -12,5 +12,6 @@ __all__ = [
     "Telemetry",
     "JobEcho",
     "DrawPoint",
+    "DrawStats",
     "build_register_map",
 ]
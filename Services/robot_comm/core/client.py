@@ -22,6 +22,7 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
@@ -30,6 +31,7 @@ from Services.modbus import ModbusDevice
 from Services.robot_comm.core.config import RobotConfig
 from Services.robot_comm.core.datatypes import (
     DrawPoint,
+    DrawStats,
     JobEcho,
     RobotPosition,
     Telemetry,
@@ -43,6 +45,8 @@ from Services.robot_comm.core.registers import (
     MODE_MANUAL,
     MODE_RETURN,
     MODE_TOOLCHANGE,
+    PTS_BANK_MAX,
+    PTS_BANK_REGS,
     PTS_MAX,
     REG_PTS_BASE,
     SERVO_OFF,
@@ -77,6 +81,55 @@ _POLL_FAST_S = 0.01
 _POLL_SLOW_S = 0.05
 
 
+class _DrawTimeline:
+    """Отметки одного рисунка: заливка, маркеры и завершения проходов → DrawStats.
+
+    ``started()`` — маркер прохода записан, ``completed()`` — ПК увидел завершение
+    самого старого незавершённого прохода. В конвейере маркер следующего прохода
+    пишется ДО завершения текущего, поэтому старты копятся в очереди.
+    """
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self._clock = clock
+        self._t0 = clock()
+        self._starts: deque[float] = deque()
+        self._last_done: float | None = None
+        self.upload_s = 0.0
+        self.draw_s = 0.0
+        self.gaps: list[float] = []
+
+    def uploaded(self, t_start: float) -> None:
+        self.upload_s += self._clock() - t_start
+
+    def started(self) -> None:
+        now = self._clock()
+        if self._starts:
+            self.gaps.append(0.0)  # предыдущий проход ещё идёт — робот ждать не будет
+        elif self._last_done is not None:
+            self.gaps.append(now - self._last_done)
+        self._starts.append(now)
+
+    def completed(self) -> None:
+        now = self._clock()
+        start = self._starts.popleft() if self._starts else now
+        if self._last_done is not None:
+            start = max(start, self._last_done)
+        self.draw_s += now - start
+        self._last_done = now
+
+    def result(self, mode: str, passes: int, points: int) -> DrawStats:
+        return DrawStats(
+            mode=mode,
+            passes=passes,
+            points=points,
+            total_s=round(self._clock() - self._t0, 6),
+            upload_s=round(self.upload_s, 6),
+            draw_s=round(self.draw_s, 6),
+            idle_s=round(sum(self.gaps), 6),
+            idle_gaps_s=tuple(round(g, 6) for g in self.gaps),
+        )
+
+
 class RobotClient:
     """Клиент робота: CVT pick-place + рисование + конфиг + телеметрия.
 
@@ -110,6 +163,7 @@ class RobotClient:
         self._on_progress = on_progress
         self._clock = clock
         self._sleep = sleep
+        self._last_draw: DrawStats | None = None
 
     # ------------------------------------------------------------------ #
     # Соединение / статус
@@ -496,6 +550,11 @@ class RobotClient:
         """Индекс текущей точки прохода."""
         return int(self._map.read(self._device, "draw_prog"))
 
+    @property
+    def last_draw_stats(self) -> DrawStats | None:
+        """Тайминг последнего ``draw()`` (заливка / рисование / простой), None — ещё не рисовали."""
+        return self._last_draw
+
     def draw_abort(self) -> bool:
         """Прервать рисование (перо вверх, домой)."""
         return self._write_map({"draw_abort": 1})
@@ -522,7 +581,7 @@ class RobotClient:
         потребить и САМА обнулить прошивка/sim (финал прохода или idle-ветка DRAW).
         Обнуление здесь могло бы отменить ещё не обработанный аборт.
         """
-        return self._write_map({"draw_flag": 0, "draw_count": 0, "draw_prog": 0, "draw_done_n": 0})
+        return self._write_map({"draw_flag": 0, "draw_count": 0, "draw_bank": 0, "draw_prog": 0, "draw_done_n": 0})
 
     def draw_circle(self, cx: float, cy: float, r: float, timeout: float = DRAW_TIMEOUT_S) -> bool:
         """Круг родным MCircle робота: центр + радиус, одной командой (гладко)."""
@@ -561,16 +620,45 @@ class RobotClient:
           штриха, иначе после заезда домой робот чертил бы линию «от дома» и линии
           терялись бы. Между проходами — ожидание завершения (_run_batch);
         - WRITE_CHUNK=30 регистров (10 точек) на один write при заливке буфера прохода.
+
+        ``draw_pipeline`` в конфиге — конвейер (_draw_pipelined): проходы ≤ PTS_BANK_MAX,
+        следующий заливается во второй банк и ставится в очередь прошивки, пока робот
+        рисует текущий. Тайминг рисунка (заливка / рисование / простой) —
+        ``last_draw_stats`` и ``timing`` в событии ``done``.
         """
         pts = [p if isinstance(p, DrawPoint) else DrawPoint(*p) for p in points]
         if not pts:
             raise RobotJobError("Пустой путь рисования")
+        pipeline = bool(self._cfg.draw_pipeline)
         # Размер прохода — конфигурируемый (мельче = больше пакетов, каждый с обратной
         # связью). Зажимаем в [3, PTS_MAX]: PTS_MAX — потолок буфера прошивки; нижний
         # предел 3 нужен для overlap-возобновления длинного штриха (подвод + сегмент).
-        limit = max(3, min(int(self._cfg.draw_pass_size), PTS_MAX))
+        # В конвейере потолок — банк (полбуфера).
+        limit = max(3, min(int(self._cfg.draw_pass_size), PTS_BANK_MAX if pipeline else PTS_MAX))
         passes = split_draw_passes(pts, limit)
         total = len(pts)
+        timeline = _DrawTimeline(self._clock)
+        if pipeline:
+            ok = self._draw_pipelined(passes, timeout, should_abort, timeline)
+        else:
+            ok = self._draw_sequential(passes, timeout, should_abort, timeline)
+        self._last_draw = timeline.result("pipelined" if pipeline else "sequential", len(passes), total)
+        if ok:
+            self._emit_progress(
+                {"stage": "done", "passes": len(passes), "total": total, "timing": self._last_draw.to_dict()}
+            )
+        return ok
+
+    # --- внутреннее рисование ---
+
+    def _draw_sequential(
+        self,
+        passes: list[list[DrawPoint]],
+        timeout: float,
+        should_abort: Callable[[], bool] | None,
+        timeline: _DrawTimeline,
+    ) -> bool:
+        """Проход за проходом: заливка → маркер → ожидание завершения → следующая заливка."""
         for n, batch in enumerate(passes, start=1):
             if should_abort is not None and should_abort():
                 self._emit_progress({"stage": "aborted", "pass": n, "passes": len(passes)})
@@ -578,15 +666,103 @@ class RobotClient:
             self._emit_progress({"stage": "batch", "pass": n, "passes": len(passes), "size": len(batch)})
             # home=True только на ПОСЛЕДНЕМ проходе: робот поднимается +1 см и едет домой в
             # конце рисунка; между проходами он ждёт на месте (перо вверх).
-            if not self._run_batch(batch, timeout, home=(n == len(passes))):
+            if not self._run_batch(batch, timeout, home=(n == len(passes)), timeline=timeline):
                 return False
-        self._emit_progress({"stage": "done", "passes": len(passes), "total": total})
         return True
 
-    # --- внутреннее рисование ---
+    def _draw_pipelined(
+        self,
+        passes: list[list[DrawPoint]],
+        timeout: float,
+        should_abort: Callable[[], bool] | None,
+        timeline: _DrawTimeline,
+    ) -> bool:
+        """Конвейер: проход N+1 заливается в свободный банк, пока робот рисует проход N.
+
+        Проход i живёт в банке ``i % 2``. Порядок для каждого прохода (flag — последним):
+          1. банк свободен: проход i-2 (тот же банк) завершён — по счётчику draw_pass_n,
+             он же сверяется read-back ACK своего банка;
+          2. заливка точек в банк;
+          3. прошивка приняла проход i-1 (draw_flag→0): прошивка защёлкивает
+             type/count/bank/home ДО сброса flag, поэтому новые значения их не портят;
+          4. type/count/bank/home + draw_flag=1 одной транзакцией — задание в очереди,
+             прошивка возьмёт его в цикле сразу после завершения текущего прохода.
+        Проходы с расхождением verify после опустошения конвейера перерисовываются
+        последовательно (_run_batch; overdraw, как у обычного повтора).
+        """
+        base = int(self._map.read(self._device, "draw_pass_n"))
+        last = len(passes) - 1
+        failed: list[int] = []
+        waited = 0  # проходов, завершение которых уже увидели
+
+        def wait_done(upto: int) -> bool:
+            nonlocal waited
+            while waited <= upto:
+                k = waited
+                if not self._poll_until(
+                    lambda: (int(self._map.read(self._device, "draw_pass_n")) - base) & 0xFFFF > k,
+                    timeout,
+                    _POLL_SLOW_S,
+                ):
+                    self._emit_progress({"stage": "timeout", "timeout_s": timeout, "pass": k + 1})
+                    return False
+                timeline.completed()
+                waited += 1
+                if self._cfg.draw_verify:
+                    executed = int(self._map.read(self._device, "draw_done_n_alt" if k % 2 else "draw_done_n"))
+                    if executed != len(passes[k]):
+                        self._emit_progress(
+                            {"stage": "verify_mismatch", "expected": len(passes[k]), "executed": executed, "attempt": 1}
+                        )
+                        failed.append(k)
+            return True
+
+        for i, batch in enumerate(passes):
+            if should_abort is not None and should_abort():
+                self._emit_progress({"stage": "aborted", "pass": i + 1, "passes": len(passes)})
+                return False
+            self._emit_progress(
+                {"stage": "batch", "pass": i + 1, "passes": len(passes), "size": len(batch), "bank": i % 2}
+            )
+            if i >= 2 and not wait_done(i - 2):
+                return False
+            if not self._upload_points(batch, bank=i % 2, timeline=timeline):
+                return False
+            if i >= 1 and not self._poll_until(self.draw_accepted, _ACCEPT_S, _POLL_FAST_S):
+                self._emit_progress({"stage": "not_accepted", "pass": i})
+                return False
+            ok = self._write_map(
+                {
+                    "draw_type": DRAW_TYPE_POLYLINE,
+                    "draw_count": len(batch),
+                    "draw_bank": i % 2,
+                    "draw_home": 1 if i == last else 0,
+                    "draw_flag": 1,  # маркер — последним
+                }
+            )
+            if not ok:
+                return False
+            timeline.started()
+        if not wait_done(last):
+            return False
+        if not failed:
+            return True
+        retries = max(0, int(self._cfg.draw_retry))
+        if retries == 0:
+            self._emit_progress({"stage": "verify_failed", "expected": len(passes[failed[0]])})
+            return False
+        for j, k in enumerate(failed):
+            self._emit_progress({"stage": "batch_redo", "pass": k + 1, "passes": len(passes), "size": len(passes[k])})
+            if not self._run_batch(
+                passes[k], timeout, home=(j == len(failed) - 1), attempts=retries, timeline=timeline
+            ):
+                return False
+        return True
 
-    def _upload_points(self, pts: list[DrawPoint]) -> bool:
-        """Залить точки в буфер чанками по WRITE_CHUNK регистров."""
+    def _upload_points(self, pts: list[DrawPoint], *, bank: int = 0, timeline: _DrawTimeline | None = None) -> bool:
+        """Залить точки в буфер (банк ``bank``) чанками по WRITE_CHUNK регистров."""
+        t0 = self._clock()
+        base = REG_PTS_BASE + bank * PTS_BANK_REGS
         regs: list[int] = []
         for p in pts:
             regs += [
@@ -596,11 +772,21 @@ class RobotClient:
             ]
         for offset in range(0, len(regs), WRITE_CHUNK):
             chunk = regs[offset : offset + WRITE_CHUNK]
-            if not self._device.transaction([("wm", REG_PTS_BASE + offset, chunk)]):
+            if not self._device.transaction([("wm", base + offset, chunk)]):
                 return False
+        if timeline is not None:
+            timeline.uploaded(t0)
         return True
 
-    def _run_batch(self, batch: list[DrawPoint], timeout: float, *, home: bool = False) -> bool:
+    def _run_batch(
+        self,
+        batch: list[DrawPoint],
+        timeout: float,
+        *,
+        home: bool = False,
+        attempts: int | None = None,
+        timeline: _DrawTimeline | None = None,
+    ) -> bool:
         """Один проход: залить буфер, запустить, дождаться завершения, СВЕРИТЬ факт.
 
         ``home``: True на последнем проходе рисунка — прошивка после прохода поднимает перо
@@ -609,8 +795,9 @@ class RobotClient:
         Read-back ACK (draw_verify): прошивка пишет в ``draw_done_n`` реально выполненное
         число точек (пост-усечённое — execute_path молча уменьшает count при коротком
         чтении буфера). Если оно != размеру пачки → проход перезаливаем и повторяем до
-        ``draw_retry`` раз; устойчивое расхождение → False (рисунок прерывается, точки
-        НЕ теряются молча).
+        ``draw_retry`` раз (``attempts`` — явное число попыток, для перерисовки после
+        конвейера); устойчивое расхождение → False (рисунок прерывается, точки НЕ
+        теряются молча).
 
         ВНИМАНИЕ (честно): расхождение бывает лишь при сбое шины (короткое чтение). Повтор
         перезаливает ВСЮ пачку и рисует её ЗАНОВО, т.е. уже выполненный префикс будет
@@ -619,9 +806,10 @@ class RobotClient:
         бывает только на деградировавшем транспорте; на нормальном пути verify==count и
         повтора нет. Факт повтора виден в on_progress (stage=verify_mismatch).
         """
-        attempts = (1 + max(0, int(self._cfg.draw_retry))) if self._cfg.draw_verify else 1
+        if attempts is None:
+            attempts = (1 + max(0, int(self._cfg.draw_retry))) if self._cfg.draw_verify else 1
         for attempt in range(1, attempts + 1):
-            if not self._upload_points(batch):
+            if not self._upload_points(batch, timeline=timeline):
                 return False
             ok = self._write_map(
                 {
@@ -633,8 +821,12 @@ class RobotClient:
             )
             if not ok:
                 return False
+            if timeline is not None:
+                timeline.started()
             if not self._wait_draw_done(timeout):
                 return False
+            if timeline is not None:
+                timeline.completed()
             if not self._cfg.draw_verify:
                 return True
             executed = int(self._map.read(self._device, "draw_done_n"))
@@ -42,6 +42,11 @@ class RobotConfig:
                      точек) и сверять с размером пачки. Расхождение = тихое усечение
                      в прошивке → повтор/аборт, точки не теряются молча.
         draw_retry:  Сколько раз повторить проход при расхождении verify до аборта.
+        draw_pipeline: Конвейерное рисование: следующий проход заливается во второй
+                     банк буфера, пока робот рисует текущий, и ставится в очередь
+                     прошивки — робот не простаивает на заливке. Проход ≤ PTS_BANK_MAX
+                     (полбуфера). Требует прошивку с банками (REG_DRAW_BANK); выкл —
+                     прежний последовательный обмен байт-в-байт.
     """
 
     host: str = "192.168.1.7"
@@ -55,6 +60,7 @@ class RobotConfig:
     draw_pass_size: int = PTS_MAX
     draw_verify: bool = True
     draw_retry: int = 1
+    draw_pipeline: bool = False
 
     # ------------------------------------------------------------------ #
     # Dict at Boundary
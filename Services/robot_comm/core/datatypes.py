@@ -79,6 +79,35 @@ class DrawPoint:
         return asdict(self)
 
 
+@dataclass(slots=True, frozen=True)
+class DrawStats:
+    """Тайминг последнего рисунка глазами ПК (RobotClient.last_draw_stats).
+
+    Отметки — по моментам, когда ПК записал маркер прохода и когда увидел его
+    завершение (точность — шаг поллинга):
+
+    - ``upload_s``: суммарное время заливки точек в буфер;
+    - ``draw_s``: робот занят проходами (от старта/завершения предыдущего до завершения);
+    - ``idle_s``: робот ждал ПК между проходами — сумма ``idle_gaps_s`` (от завершения
+      прохода до маркера следующего; в конвейере маркер уже стоит → 0).
+    """
+
+    mode: str
+    passes: int
+    points: int
+    total_s: float
+    upload_s: float
+    draw_s: float
+    idle_s: float
+    idle_gaps_s: tuple[float, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Сериализовать в dict."""
+        data = asdict(self)
+        data["idle_gaps_s"] = list(self.idle_gaps_s)
+        return data
+
+
 # Буфер робота на ОДИН проход (= PTS_MAX в registers.py и в cvt_universal_full.lua).
 # Путь длиннее рисуется несколькими проходами; здесь дефолт для split_draw_passes.
 DEFAULT_PASS_LIMIT = 100
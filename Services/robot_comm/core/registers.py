@@ -43,6 +43,12 @@ REG_PTS_BASE = 0x1420
 PTS_MAX = 100  # точек на один проход (батч) — дальше второй проход
 WRITE_CHUNK = 30  # регистров за один write_registers (10 точек) — робот не тянет больше
 REGS_PER_POINT = 3  # x, y, pen
+# Конвейерное рисование (RobotConfig.draw_pipeline): тот же буфер делится на ДВА банка по
+# PTS_BANK_MAX точек. Пока робот рисует проход из одного банка, ПК заливает следующий в
+# другой — адресное пространство прошивки не растёт. Банк k начинается с
+# REG_PTS_BASE + k * PTS_BANK_REGS.
+PTS_BANK_MAX = PTS_MAX // 2
+PTS_BANK_REGS = PTS_BANK_MAX * REGS_PER_POINT
 
 DRAW_TYPE_POLYLINE = 0
 DRAW_TYPE_CIRCLE = 1
@@ -92,6 +98,16 @@ REG_DRAW_TRAVEL = 0x1415
 # Ускорение рисования AccL/DecL, мм/с² (выше = резче на изгибах → выше реальная скорость
 # плотных линий; перо рисования ставит его, финал прохода возвращает боевое для CVT).
 REG_DRAW_ACCEL = 0x1416
+# Конвейер проходов (пара к execute_path/motion_body в Lua):
+# - DRAW_BANK: банк точек задания (0/1); прошивка защёлкивает его при приёме вместе с
+#   type/count/home и сбрасывает в 0 — последовательный ПК банк не пишет вовсе;
+# - DRAW_PASS_N: счётчик завершённых проходов (mod 65536), растёт в конце КАЖДОГО прохода —
+#   по нему ПК видит завершение, даже если следующий проход стартовал в тот же цикл и
+#   busy не успел упасть;
+# - DRAW_DONE_N_ALT: read-back ACK для банка 1 (банк 0 — прежний REG_DRAW_DONE_N).
+REG_DRAW_BANK = 0x1417
+REG_DRAW_PASS_N = 0x1418
+REG_DRAW_DONE_N_ALT = 0x1419
 
 # ⚠️ Командные блоки режимов — в свободной дыре 0x1340..0x13FF (между CONFIG 0x130B и
 # DRAW 0x1400), НИЖЕ буфера точек рисования 0x1420..0x154B. Раньше стояли на 0x1500/0x1510 —
@@ -209,6 +225,9 @@ def build_register_map(word_order: str = "little") -> RegisterMap:
             "draw_prog": Reg(REG_DRAW_PROG),
             "draw_abort": Reg(REG_DRAW_ABORT),
             "draw_done_n": Reg(REG_DRAW_DONE_N),  # read-back ACK: реально выполнено точек
+            "draw_bank": Reg(REG_DRAW_BANK),  # банк точек задания (конвейер)
+            "draw_pass_n": Reg(REG_DRAW_PASS_N),  # счётчик завершённых проходов
+            "draw_done_n_alt": Reg(REG_DRAW_DONE_N_ALT),  # read-back ACK банка 1
             "circ_cx": Reg(0x1406, scale=XY_SCALE, signed=True),
             "circ_cy": Reg(0x1407, scale=XY_SCALE, signed=True),
             "circ_r": Reg(0x1408, scale=XY_SCALE),
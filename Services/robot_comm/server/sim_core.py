@@ -7,7 +7,9 @@
 - cfg_flag=1  -> применить конфиг (flag->0);
 - vfd_flag=1  -> обновить зеркало ПЧ 0x1210+ (hb++), flag->0 — ВКЛЮЧАЯ
   заморозку зеркала без команд (как в реальном Lua, ревью п.1);
-- draw_flag=1 -> busy=1, prog++ по тикам, через draw_ticks busy->0;
+- draw_flag=1 -> защёлка type/count/bank/home, flag->0, busy=1, prog++ по тикам,
+  через draw_ticks busy->0, draw_pass_n++, done_n банка; задание, поставленное в
+  очередь во время прохода (конвейер), стартует на следующем тике;
 - man_flag=1  -> man_busy=1, free=0, через manual_ticks man_busy->0, free->1,
   поза обновляется (как реальный MovL в Lua);
 - stop/servo  -> мгновенная реакция;
@@ -21,17 +23,25 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Callable
 
 from Services.robot_comm.core.registers import (
+    PTS_BANK_MAX,
+    PTS_BANK_REGS,
+    PTS_MAX,
+    REGS_PER_POINT,
     REG_CFG_BASE,
     REG_CFG_FLAG,
     REG_DRAW_ABORT,
+    REG_DRAW_BANK,
     REG_DRAW_BUSY,
     REG_DRAW_COUNT,
     REG_DRAW_DONE_N,
+    REG_DRAW_DONE_N_ALT,
     REG_DRAW_FLAG,
     REG_DRAW_HOME,
+    REG_DRAW_PASS_N,
     REG_DRAW_PROG,
     REG_ENC,
     REG_FREE,
@@ -49,6 +59,7 @@ from Services.robot_comm.core.registers import (
     REG_PLACE_X,
     REG_PLACE_Y,
     REG_PLACE_Z,
+    REG_PTS_BASE,
     REG_RET_BUSY,
     REG_RET_FLAG,
     REG_RET_X,
@@ -83,6 +94,9 @@ _TLM_HB, _TLM_SERVO = 8, 9
 _SIM_CURRENT_RAW = 150  # 15.0 А (scale 10)
 _SIM_DCBUS_RAW = 5400  # 540.0 В (scale 10)
 
+# Сколько последних проходов помнит draw_log (TCP-сим крутится часами).
+_DRAW_LOG_MAX = 1024
+
 
 def _s16(v: int) -> float:
     """Конвертировать unsigned 16-bit значение в signed, делить на XY_SCALE."""
@@ -132,6 +146,12 @@ class RobotSimCore:
         self._accept_countdown: int | None = None
         self._job_countdown: int | None = None
         self._draw_countdown: int | None = None
+        # Защёлкнутое при приёме задание рисования: (bank, count, home, снимок регистров банка).
+        self._draw_job: tuple[int, int, int, list[int]] | None = None
+        # Принятые проходы: точки (x, y, pen) в сырых регистрах — для сверки в тестах.
+        self.draw_log: deque[list[tuple[int, int, int]]] = deque(maxlen=_DRAW_LOG_MAX)
+        # Сколько раз буфер ИСПОЛНЯЕМОГО прохода перезаписали на лету (должно быть 0).
+        self.draw_overwrites = 0
         self._ret_countdown: int | None = None
         self._tool_countdown: int | None = None
         self._man_countdown: int | None = None
@@ -343,25 +363,50 @@ class RobotSimCore:
             # Заезд домой по REG_DRAW_HOME (паритет с idle-DRAW abort веткой прошивки):
             # прошивка потребляет флаг и едет домой; здесь моделируем потребление флага.
             self.regs[REG_DRAW_HOME] = 0
+            self.regs[REG_DRAW_BANK] = 0
             self._draw_countdown = None
+            self._draw_job = None
             return
         if self.regs[REG_DRAW_FLAG] == 1 and self._draw_countdown is None:
+            # Защёлка ДО сброса flag (паритет с motion_body): flag→0 означает, что
+            # параметры прочитаны — конвейер ПК может сразу писать следующее задание.
+            bank = 1 if self.regs[REG_DRAW_BANK] == 1 else 0
+            count = min(self.regs[REG_DRAW_COUNT], PTS_BANK_MAX if bank else PTS_MAX)
+            start = REG_PTS_BASE + bank * PTS_BANK_REGS
+            snapshot = self.read(start, count * REGS_PER_POINT)
+            self._draw_job = (bank, count, self.regs[REG_DRAW_HOME], snapshot)
+            self.draw_log.append([tuple(snapshot[i : i + 3]) for i in range(0, len(snapshot), 3)])  # type: ignore[misc]
+            self.regs[REG_DRAW_BANK] = 0  # банк потреблён: последовательный ПК его не пишет
             self.regs[REG_DRAW_FLAG] = 0
             self.regs[REG_DRAW_BUSY] = 1
             self.regs[REG_DRAW_PROG] = 0
             self._draw_countdown = self._draw_ticks
-            self._emit("[DRAW] проход начат")
+            self._emit(f"[DRAW] проход начат (банк {bank}, {count} точек)")
         elif self._draw_countdown is not None:
             self.regs[REG_DRAW_PROG] += 1
             self._draw_countdown -= 1
             if self._draw_countdown <= 0:
-                self.regs[REG_DRAW_BUSY] = 0
-                # Read-back ACK: эхо реально выполненного числа точек = заявленному count
-                # (паритет с прошивкой). Тест может переопределить, чтобы проверить retry.
-                self.regs[REG_DRAW_DONE_N] = self.regs[REG_DRAW_COUNT]
-                prog = self.regs[REG_DRAW_PROG]
-                self._draw_countdown = None
-                self._emit(f"[DRAW] проход завершён ({prog} точек)")
+                self._finish_draw_pass()
+
+    def _finish_draw_pass(self) -> None:
+        """Конец прохода: busy→0, read-back ACK банка, draw_pass_n++."""
+        assert self._draw_job is not None
+        bank, count, _home, snapshot = self._draw_job
+        start = REG_PTS_BASE + bank * PTS_BANK_REGS
+        if self.read(start, len(snapshot)) != snapshot:
+            # Настоящая прошивка читает пачку в начале прохода, но перезапись банка до
+            # завершения — нарушение протокола ПК (конвейер обязан ждать draw_pass_n).
+            self.draw_overwrites += 1
+            self._emit(f"[DRAW] ⚠ буфер банка {bank} перезаписан во время прохода")
+        self.regs[REG_DRAW_BUSY] = 0
+        # Read-back ACK: эхо реально выполненного числа точек = защёлкнутому count
+        # (паритет с прошивкой). Тест может переопределить, чтобы проверить retry.
+        self.regs[REG_DRAW_DONE_N_ALT if bank else REG_DRAW_DONE_N] = count
+        self.regs[REG_DRAW_PASS_N] = (self.regs[REG_DRAW_PASS_N] + 1) & 0xFFFF
+        prog = self.regs[REG_DRAW_PROG]
+        self._draw_countdown = None
+        self._draw_job = None
+        self._emit(f"[DRAW] проход завершён ({prog} точек)")
 
     def _handle_return(self) -> None:
         """RETURN (mode=3): ret_flag 1->0 (приём) -> ret_busy 1 (старт) -> ret_busy 0 (готово).
@@ -615,6 +615,109 @@ def test_draw_home_after_sets_flag(bot: RobotClient, transport: FakeRobotTranspo
     assert ("w", REG_DRAW_HOME, 1) in transport.transactions[-1]
 
 
+# --- конвейерное рисование (draw_pipeline): два банка буфера ---
+
+
+def _portrait(strokes: int = 12, length: int = 20) -> list[DrawPoint]:
+    path: list[DrawPoint] = []
+    for s in range(strokes):
+        path.append(DrawPoint(float(s), 0.0, 0))
+        path += [DrawPoint(float(s), float(i), 1) for i in range(1, length)]
+    return path
+
+
+def _raw(batch: list[DrawPoint]) -> list[tuple[int, int, int]]:
+    return [(round(p.x_mm * XY_SCALE) & 0xFFFF, round(p.y_mm * XY_SCALE) & 0xFFFF, p.pen) for p in batch]
+
+
+def test_draw_pipelined_alternates_banks_marker_last(core: RobotSimCore, transport, clock) -> None:
+    """Конвейер: проходы чередуют банки, маркер — последним, sim исполнил ровно залитое."""
+    from Services.robot_comm.core.datatypes import split_draw_passes
+    from Services.robot_comm.core.registers import PTS_BANK_MAX, REG_DRAW_BANK
+
+    bot = _make_client(transport, clock, draw_pipeline=True)
+    path = _portrait()
+    assert bot.draw(path)
+
+    jobs = [ops for ops in transport.transactions if ops[-1] == ("w", REG_DRAW_FLAG, 1)]
+    banks = [dict((a, v) for _k, a, v in ops)[REG_DRAW_BANK] for ops in jobs]
+    assert banks == [i % 2 for i in range(len(jobs))]
+    passes = split_draw_passes(path, PTS_BANK_MAX)
+    assert list(core.draw_log) == [_raw(b) for b in passes]
+    assert core.draw_overwrites == 0  # исполняемый банк на лету не трогали
+
+
+class _SlowLink(FakeRobotTransport):
+    """Фейк-робот в «реальном» времени часов теста: Motion-цикл тикает раз в ``tick_s``,
+    каждая запись по линии стоит ``write_s`` (заливка буфера — не бесплатна)."""
+
+    def __init__(self, clock, *, tick_s: float = 0.01, write_s: float = 0.005) -> None:
+        super().__init__(RobotSimCore(draw_ticks=20), ticks_per_read=0)
+        self._clock, self._tick_s, self._write_s = clock, tick_s, write_s
+        self._robot_t = clock.t
+
+    def _advance(self) -> None:
+        while self._clock.t - self._robot_t >= self._tick_s:
+            self._robot_t += self._tick_s
+            self.core.tick()
+
+    def read_registers(self, address: int, count: int = 1) -> list[int]:
+        self._advance()
+        return super().read_registers(address, count)
+
+    def transaction(self, ops: list[tuple]) -> bool:
+        self._clock.sleep(self._write_s)
+        self._advance()
+        return super().transaction(ops)
+
+
+def test_draw_pipelined_queues_next_pass_while_drawing(clock) -> None:
+    """Маркер следующего прохода ставится ДО завершения текущего → простоев нет, рисунок быстрее."""
+    path = _portrait()
+    seq = _make_client(_SlowLink(clock), clock, draw_pass_size=50)
+    assert seq.draw(path)
+    sequential = seq.last_draw_stats
+
+    pipe = _make_client(_SlowLink(clock), clock, draw_pipeline=True)
+    progress: list[dict] = []
+    pipe._on_progress = progress.append
+    assert pipe.draw(path)
+    pipelined = pipe.last_draw_stats
+
+    assert sequential.mode == "sequential" and pipelined.mode == "pipelined"
+    assert sequential.passes == pipelined.passes > 2
+    assert sequential.idle_s > 0 and all(g > 0 for g in sequential.idle_gaps_s)
+    assert pipelined.idle_s == 0.0 and len(pipelined.idle_gaps_s) == pipelined.passes - 1
+    assert pipelined.total_s < sequential.total_s
+    assert progress[-1]["stage"] == "done" and progress[-1]["timing"]["mode"] == "pipelined"
+
+
+def test_draw_pipelined_redraws_pass_on_verify_mismatch(clock) -> None:
+    """Расхождение ACK в конвейере → проход перерисовывается последовательно после опустошения."""
+    from Services.robot_comm.core.registers import REG_DRAW_DONE_N_ALT
+
+    class _ShortAltAckSim(RobotSimCore):
+        """Sim, занижающий ACK первого прохода из банка 1."""
+
+        def _finish_draw_pass(self) -> None:
+            bank = self._draw_job[0]
+            super()._finish_draw_pass()
+            if bank == 1 and not getattr(self, "_shorted", False):
+                self._shorted = True
+                self.regs[REG_DRAW_DONE_N_ALT] -= 1
+
+    core = _ShortAltAckSim()
+    bot = _make_client(FakeRobotTransport(core), clock, draw_pipeline=True)
+    progress: list[dict] = []
+    bot._on_progress = progress.append
+    assert bot.draw(_portrait(strokes=6))
+    stages = [p["stage"] for p in progress]
+    assert stages.count("verify_mismatch") == 1
+    redo = [p for p in progress if p["stage"] == "batch_redo"]
+    assert [r["pass"] for r in redo] == [2]
+    assert core.draw_log[-1] == core.draw_log[1]  # перерисован именно второй проход
+
+
 # --- RETURN: возврат буквы на ленту ---
 
 
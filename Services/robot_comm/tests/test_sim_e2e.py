@@ -92,3 +92,42 @@ def test_toolchange_over_tcp(bot: RobotClient) -> None:
     bot.set_mode("toolchange")
     assert bot.do_toolchange(2) is True
     assert bot.tool_current() == 2
+
+
+def test_pipelined_draw_over_tcp() -> None:
+    """Конвейер против TCP sim_robot: портрет целиком, без простоев робота и без порчи буфера.
+
+    Выигрыш по времени на localhost мал (заливка — доли мс); он проверяется детерминированно
+    в test_client.py (_SlowLink). Здесь — протокол на реальном сокете и pymodbus.
+    """
+    from Services.robot_comm.core.datatypes import DrawPoint
+    from Services.robot_comm.server.sim_core import RobotSimCore
+    from Services.robot_comm.server.sim_robot import SimRobotServer
+
+    core = RobotSimCore(draw_ticks=10)  # ~0.1 с на проход при тике 10 мс
+    server = SimRobotServer("127.0.0.1", _free_port(), core=core)
+    server.start()
+    time.sleep(0.5)
+    path: list[DrawPoint] = []
+    for s in range(16):
+        path.append(DrawPoint(float(s), 0.0, 0))
+        path += [DrawPoint(float(s), float(i), 1) for i in range(1, 25)]
+    stats = {}
+    try:
+        for pipeline in (False, True):
+            client = RobotClient(
+                RobotConfig(host=server.host, port=server.port, draw_pass_size=50, draw_pipeline=pipeline)
+            )
+            assert client.connect()
+            try:
+                assert client.draw(path)
+                stats[pipeline] = client.last_draw_stats
+            finally:
+                client.disconnect()
+    finally:
+        server.stop()
+    sequential, pipelined = stats[False], stats[True]
+    assert sequential.passes == pipelined.passes == 8
+    assert core.draw_overwrites == 0
+    assert pipelined.idle_s == 0.0 < sequential.idle_s
+    assert list(core.draw_log)[-8:] == list(core.draw_log)[:8]  # оба режима исполнили одни и те же проходы
@@ -23,7 +23,7 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from backend_ctl.mcp_errors import BackendUnavailable
 from backend_ctl.mcp_tools import (
@@ -33,7 +33,7 @@ from backend_ctl.mcp_tools import (
     _UNCAPPED_TOOLS,
     build_registry,
 )
-from backend_ctl.recorder import MODE_REPLAY, RecordingError
+from backend_ctl.recorder import MODE_REPLAY, VERSION, VERSION_CHUNKED, RecordingError
 
 # ---------------------------------------------------------------------------
 # Flight recorder: session-owned диспетчеризация + offline-реплей
@@ -49,6 +49,15 @@ _DEFAULT_RECORD_DIR = "./backend_ctl_records"
 
 #: Допустимое имя записи: буквы/цифры/._- (без разделителей путей и '..').
 _SAFE_NAME_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+#: Расширения файлов записи: v1 JSONL и v2 сжатые чанки с индексом (record_chunks).
+RECORD_SUFFIX_JSONL: str = ".jsonl"
+RECORD_SUFFIX_CHUNKED: str = ".bctl"
+_RECORD_SUFFIXES: Tuple[str, ...] = (RECORD_SUFFIX_JSONL, RECORD_SUFFIX_CHUNKED)
+#: record_start format → (версия записи, расширение файла).
+_RECORD_FORMATS: Dict[str, Tuple[int, str]] = {
+    "jsonl": (VERSION, RECORD_SUFFIX_JSONL),
+    "chunked": (VERSION_CHUNKED, RECORD_SUFFIX_CHUNKED),
+}
 
 #: Зарезервированные имена устройств Windows. Они проходят проверку символов, но ОС
 #: резолвит их в устройство мимо каталога: "NUL" глотает запись (success без файла),
@@ -59,7 +68,7 @@ _RESERVED_DEVICE_NAMES: frozenset = frozenset(
 )
 
 
-def resolve_record_path(name: Any, *, create_dir: bool = False) -> str:
+def resolve_record_path(name: Any, *, create_dir: bool = False, suffix: str = RECORD_SUFFIX_JSONL) -> str:
     """Имя записи → путь в BACKEND_CTL_RECORD_DIR (валидация: без разделителей/'..').
 
     Агент передаёт ИМЯ, а не путь — сервер удерживает файлы в отведённом каталоге:
@@ -70,6 +79,8 @@ def resolve_record_path(name: Any, *, create_dir: bool = False) -> str:
     Args:
         create_dir: создать каталог записей. Только для пишущих инструментов —
             read-инструмент (record_load) не должен создавать каталог побочным эффектом.
+        suffix: расширение, добавляемое к имени без известного расширения
+            (``.jsonl`` — v1, ``.bctl`` — v2 чанковый формат).
 
     Raises:
         ValueError: имя пустое, содержит разделители/'..'/недопустимые символы,
@@ -88,7 +99,7 @@ def resolve_record_path(name: Any, *, create_dir: bool = False) -> str:
             "(запись ушла бы в устройство, а не в файл). Выбери другое имя, например "
             f"{name}_rec."
         )
-    filename = name if name.endswith(".jsonl") else f"{name}.jsonl"
+    filename = name if name.endswith(_RECORD_SUFFIXES) else f"{name}{suffix}"
     base = os.path.abspath(os.environ.get(_RECORD_DIR_ENV) or _DEFAULT_RECORD_DIR)
     if create_dir:
         os.makedirs(base, exist_ok=True)
@@ -107,7 +118,7 @@ class _ArgError(Exception):
     """Ошибка разбора аргумента record-инструмента → обучающий error-dict, не сырой ValueError."""
 
 
-def _resolve_or_error(name: Any, *, create_dir: bool = False) -> str:
+def _resolve_or_error(name: Any, *, create_dir: bool = False, suffix: str = RECORD_SUFFIX_JSONL) -> str:
     """Резолв имени записи в путь; ошибка валидации ИЛИ файловой системы → :class:`_ArgError`.
 
     OSError ловится наравне с ValueError: ``create_dir=True`` делает mkdir, и
@@ -117,7 +128,7 @@ def _resolve_or_error(name: Any, *, create_dir: bool = False) -> str:
     сеть ни при чём. Агент получал ложную диагностику вместо имени нечитаемого пути.
     """
     try:
-        return resolve_record_path(name, create_dir=create_dir)
+        return resolve_record_path(name, create_dir=create_dir, suffix=suffix)
     except ValueError as exc:
         raise _ArgError(str(exc)) from exc
     except OSError as exc:
@@ -136,13 +147,27 @@ def _int_arg_or_error(value: Any, field: str) -> Optional[int]:
         raise _ArgError(f"{field} должно быть целым числом, получено {value!r}") from exc
 
 
+def _float_arg_or_error(value: Any, field: str) -> Optional[float]:
+    """``None`` → None; иначе float(value) или обучающая :class:`_ArgError`."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise _ArgError(f"{field} должно быть числом (unix ts), получено {value!r}") from exc
+
+
 def _record_start(session: Any, args: Dict[str, Any]) -> Any:
+    fmt = args.get("format", "jsonl")
+    if fmt not in _RECORD_FORMATS:
+        return {"success": False, "error": f"format должен быть одним из {sorted(_RECORD_FORMATS)}, получено {fmt!r}"}
+    version, suffix = _RECORD_FORMATS[fmt]
     try:
-        path = _resolve_or_error(args.get("name"), create_dir=True)
+        path = _resolve_or_error(args.get("name"), create_dir=True, suffix=suffix)
         max_events = _int_arg_or_error(args.get("max_events"), "max_events")
     except _ArgError as exc:
         return {"success": False, "error": str(exc)}
-    return session.start_recording(path, max_events=max_events)
+    return session.start_recording(path, max_events=max_events, version=version)
 
 
 def _record_stop(session: Any, args: Dict[str, Any]) -> Any:
@@ -164,14 +189,20 @@ def _record_dump(session: Any, args: Dict[str, Any]) -> Any:
 def _record_load(session: Any, args: Dict[str, Any]) -> Any:
     try:
         path = _resolve_or_error(args.get("name"))
+        if not os.path.exists(path):
+            # Имя без расширения: v1 (.jsonl) не найден — пробуем v2 (.bctl).
+            chunked = _resolve_or_error(args.get("name"), suffix=RECORD_SUFFIX_CHUNKED)
+            path = chunked if os.path.exists(chunked) else path
         ring_maxlen = _int_arg_or_error(args.get("ring_maxlen"), "ring_maxlen")
+        start_ts = _float_arg_or_error(args.get("from_ts"), "from_ts")
+        end_ts = _float_arg_or_error(args.get("to_ts"), "to_ts")
     except _ArgError as exc:
         return {"success": False, "error": str(exc)}
     position = args.get("position", "end")
     if position not in ("end", "start"):
         return {"success": False, "error": f"position должна быть 'end' или 'start', получено {position!r}"}
     try:
-        return session.load_replay(path, position=position, ring_maxlen=ring_maxlen)
+        return session.load_replay(path, position=position, ring_maxlen=ring_maxlen, start_ts=start_ts, end_ts=end_ts)
     except (RecordingError, FileNotFoundError) as exc:
         return {"success": False, "error": str(exc)}
 
@@ -442,6 +442,43 @@ class BackendDriver(_TransportMixin, _EventChannelMixin):
         args = {"process": process} if process else {}
         return self.send_command(pm_name, "supervision.status", args, timeout=timeout)
 
+    def perf_probes(
+        self,
+        process: Optional[str] = None,
+        *,
+        pm_name: str = "ProcessManager",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Перцентили perf-проб (``perf.probes`` в ProcessManager): p50/p99/p99.9/max/mean/count.
+
+        ``processes`` — по процессам (воркеры слиты), ``stages`` — по всей системе.
+        Всё — с момента сброса (``perf.reset`` процессу), без окна: PM сливает
+        лог-бакетные гистограммы из heartbeat'ов. Пусто без ``FW_PERF_PROBES=1``.
+        ``process`` фильтрует один процесс.
+        """
+        args = {"process": process} if process else {}
+        return self.send_command(pm_name, "perf.probes", args, timeout=timeout)
+
+    def boot_report(
+        self,
+        process: Optional[str] = None,
+        *,
+        top: Optional[int] = None,
+        pm_name: str = "ProcessManager",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Профиль холодного старта (``boot.report`` в ProcessManager).
+
+        ``system`` — ready/first_frame всей системы и критический процесс,
+        ``processes`` — time-to-ready/first-frame и фазы boot по процессам,
+        ``imports`` — самые дорогие модули по сумме собственного времени импорта.
+        Сохранённый ответ — вход CLI ``boot_profile --baseline`` (регрессии сборки).
+        """
+        args: Dict[str, Any] = {"process": process} if process else {}
+        if top:
+            args["top"] = int(top)
+        return self.send_command(pm_name, "boot.report", args, timeout=timeout)
+
     def process_restart_verified(
         self,
         process: str,
@@ -155,9 +155,12 @@ class DriverSession:
         *,
         max_events: Optional[int] = None,
         max_bytes: Optional[int] = None,
+        version: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Начать запись потока событий текущего live-driver'а в ``path``.
 
+        ``version`` — формат записи (None → v1 JSONL; 2 → сжатые чанки с индексом).
+
         В replay-режиме запись не имеет смысла (нет живого потока) — обучающий отказ.
         Уже идёт запись — отказ (одна запись = один файл).
         """
@@ -175,6 +178,8 @@ class DriverSession:
                 kwargs["max_events"] = int(max_events)
             if max_bytes is not None:
                 kwargs["max_bytes"] = int(max_bytes)
+            if version is not None:
+                kwargs["version"] = int(version)
             recorder = Recorder(drv, path, **kwargs)
             out = recorder.start()
             # Ссылку публикуем только на успешном старте: неудачно стартовавший Recorder
@@ -218,16 +223,26 @@ class DriverSession:
         *,
         position: str = "end",
         ring_maxlen: Optional[int] = None,
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Загрузить запись в offline-реплей (detached driver); перевести сессию в replay.
 
+        ``start_ts``/``end_ts`` — окно записи: v2 читает только чанки окна, стартовое
+        состояние свёрнуто на start_ts (см. :func:`load_recording`).
+
         Активная запись сначала должна быть остановлена (одна активность на сессию).
         Реплей ничего не пишет и не коннектится — session-локальный режим.
         """
         with self._lifecycle_lock:
             if self._recorder is not None and self._recorder.active:
                 return {"success": False, "error": "идёт запись — сначала record_stop() перед загрузкой реплея"}
-            recording = load_recording(path)  # RecordingError ловит сервер (обучающий текст)
+            # RecordingError ловит сервер (обучающий текст). Окно передаётся только когда
+            # задано — полная загрузка зовёт load_recording(path) прежней формы.
+            if start_ts is None and end_ts is None:
+                recording = load_recording(path)
+            else:
+                recording = load_recording(path, start_ts=start_ts, end_ts=end_ts)
             self._replay = ReplayPlayer(recording, position=position, ring_maxlen=ring_maxlen)
             self._mode = MODE_REPLAY
             # Квиесцировать live-driver (Task 2.1, находка C-3): в replay-режиме ensure()
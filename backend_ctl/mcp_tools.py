@@ -25,7 +25,7 @@ from backend_ctl.capability_render import FORMATS, render_concise, render_help
 from backend_ctl.conditions import DEFAULT_AWAIT_TIMEOUT
 from backend_ctl.driver import BackendDriver
 from backend_ctl.events import ALL_PLANE, PLANES, page_with_reset_retry
-from backend_ctl.recorder import DEFAULT_MAX_EVENTS
+from backend_ctl.recorder import DEFAULT_CHUNKED_MAX_EVENTS, DEFAULT_MAX_EVENTS
 
 #: Handler инструмента: (driver, arguments) → JSON-сериализуемый результат.
 ToolHandler = Callable[[BackendDriver, Dict[str, Any]], Any]
@@ -169,6 +169,14 @@ def _supervision_status(drv: BackendDriver, args: Dict[str, Any]) -> Any:
     return _jsonable(drv.supervision_status(args.get("process"), **_kw_timeout(args)))
 
 
+def _perf_probes(drv: BackendDriver, args: Dict[str, Any]) -> Any:
+    return _jsonable(drv.perf_probes(args.get("process"), **_kw_timeout(args)))
+
+
+def _boot_report(drv: BackendDriver, args: Dict[str, Any]) -> Any:
+    return _jsonable(drv.boot_report(args.get("process"), top=args.get("top"), **_kw_timeout(args)))
+
+
 def _process_restart_verified(drv: BackendDriver, args: Dict[str, Any]) -> Any:
     kw: Dict[str, Any] = {}
     if args.get("wait") is not None:
@@ -495,6 +503,35 @@ TOOLS: List[ToolSpec] = [
         ),
         _supervision_status,
     ),
+    ToolSpec(
+        "perf_probes",
+        "Перцентили perf-проб этапов кадра (capture/send/receive/restore): p50/p99/p99.9/max/mean/count "
+        "с момента сброса, по процессам и по всей системе — PM сливает гистограммы из heartbeat "
+        "(точный p99, без окна). Пусто, если процессы запущены без FW_PERF_PROBES=1. "
+        "process — сузить до одного. Read-only.",
+        _obj(
+            {
+                "process": {"type": "string", "description": "Сузить до одного процесса. Опц."},
+                "timeout": _TIMEOUT,
+            }
+        ),
+        _perf_probes,
+    ),
+    ToolSpec(
+        "boot_report",
+        "Профиль холодного старта: время каждого процесса до ready и до первого кадра, фазы boot "
+        "(spawn/class_import/shm_attach/config/managers/plugins/plugin:<name>.load…) и самые дорогие "
+        "импорты по процессам — PM склеивает отчёты из heartbeat. process — сузить до одного, "
+        "top — строк импортов. Read-only.",
+        _obj(
+            {
+                "process": {"type": "string", "description": "Сузить до одного процесса. Опц."},
+                "top": {"type": "integer", "description": "Строк в таблице импортов (дефолт 30). Опц."},
+                "timeout": _TIMEOUT,
+            }
+        ),
+        _boot_report,
+    ),
     ToolSpec(
         "send_command",
         "Прямая команда процессу (та же форма, что GUI через CommandSender) + ожидание ответа. "
@@ -1011,15 +1048,26 @@ TOOLS: List[ToolSpec] = [
         "состояния + JSONL-ленту событий; позже record_load грузит запись в тот же read-model "
         "БЕЗ живой системы. name — имя записи (не путь; резолвится в BACKEND_CTL_RECORD_DIR). "
         "Пиши только то, на что подписан (watch_like_gui/state_subscribe) — без подписок лента пуста "
-        "(вернётся hint). max_events — лимит (по достижении авто-стоп, файл валиден). read-only: "
+        "(вернётся hint). max_events — лимит (по достижении авто-стоп, файл валиден). format='chunked' — "
+        "сжатые чанки с индексом (.bctl) для многочасовой записи: record_load читает окно from_ts..to_ts "
+        "без разбора всего файла. read-only: "
         "запись — локальный наблюдатель, бэкенд не мутируется. ПРЕДУПРЕЖДЕНИЕ: запись содержит "
         "состояние системы (пути/конфиги) — не прикладывай к публичным issue.",
         _obj(
             {
-                "name": {"type": "string", "description": "Имя записи (без разделителей/'..'); .jsonl добавится."},
+                "name": {
+                    "type": "string",
+                    "description": "Имя записи (без разделителей/'..'); .jsonl (или .bctl для chunked) добавится.",
+                },
                 "max_events": {
                     "type": "integer",
-                    "description": f"Лимит событий (по умолчанию {DEFAULT_MAX_EVENTS}); при достижении авто-стоп.",
+                    "description": f"Лимит событий (по умолчанию {DEFAULT_MAX_EVENTS}, chunked — "
+                    f"{DEFAULT_CHUNKED_MAX_EVENTS}); при достижении авто-стоп.",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["jsonl", "chunked"],
+                    "description": "'jsonl' (дефолт): v1 построчно; 'chunked': v2 сжатые чанки + индекс.",
                 },
             },
             ["name"],
@@ -1047,7 +1095,8 @@ TOOLS: List[ToolSpec] = [
         "events_page/await_condition/state_get/system_overview отвечают ПО ЗАПИСИ; прочие (write/IPC) "
         "требуют record_unload. position='end' (дефолт) — сразу финальное состояние; 'start' — только "
         "снимок, playhead двигается await_condition'ами (тайм-трэвел). name — имя записи в "
-        "BACKEND_CTL_RECORD_DIR. read-only.",
+        "BACKEND_CTL_RECORD_DIR. from_ts/to_ts — окно (unix ts): грузятся только события окна, "
+        "стартовое состояние свёрнуто на from_ts (у chunked-записи читаются только нужные чанки). read-only.",
         _obj(
             {
                 "name": {"type": "string", "description": "Имя записи в BACKEND_CTL_RECORD_DIR (без разделителей)."},
@@ -1060,6 +1109,8 @@ TOOLS: List[ToolSpec] = [
                     "type": "integer",
                     "description": "Потолок колец событий реплея (опц.; по умолчанию min(события, 10000)).",
                 },
+                "from_ts": {"type": "number", "description": "Начало окна реплея (unix ts, опц.)."},
+                "to_ts": {"type": "number", "description": "Конец окна реплея (unix ts, опц.)."},
             },
             ["name"],
         ),
@@ -1127,6 +1178,8 @@ TOOL_SAFETY: Dict[str, str] = {
     "introspect_memory": SAFETY_READ,
     "introspect_telemetry": SAFETY_READ,
     "supervision_status": SAFETY_READ,
+    "perf_probes": SAFETY_READ,
+    "boot_report": SAFETY_READ,
     "register_snapshot": SAFETY_READ,
     "register_rollback_log": SAFETY_READ,
     "state_get": SAFETY_READ,
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+"""record_chunks.py — v2-формат flight recorder'а: сжатые чанки + разреженный индекс.
+
+v1 (JSONL, :mod:`backend_ctl.recorder`) разбирается целиком до первого события и
+упирается в лимиты 100k событий / 200 МБ. v2 — бинарный контейнер блоков, который
+пишется потоково и читается с произвольного места:
+
+  * ``MAGIC`` (8 байт), затем блоки ``<BI``: вид блока (u8) + длина полезной нагрузки (u32);
+  * ``HEADER`` — zlib(JSON) того же header'а, что у v1 (``version: 2``);
+  * ``CHUNK`` — префикс ``<IQQdd`` (count, first_seq, last_seq, first_ts, last_ts) +
+    zlib(NDJSON строк ``{"seq", "ts", "event"[, "pre_header"]}``) — формы строки v1;
+  * ``KEYFRAME`` — zlib(JSON) ``{"ts", "seq", "values"}``: свёрнутое state-дерево
+    (плоские dotted-пути) на момент после события ``seq``; раз в ``keyframe_every`` чанков;
+  * ``FOOTER`` — zlib(JSON) footer'а v1;
+  * ``INDEX`` — zlib(JSON) ``{"chunks": [[offset, first_seq, last_seq, first_ts, last_ts, count]],
+    "keyframes": [[offset, ts, seq]]}`` + трейлер ``<Q`` (смещение INDEX) + ``INDEX_MAGIC``.
+
+Чтение окна ``[start_ts, end_ts]`` — трейлер → индекс → только чанки, пересекающие окно,
+плюс ближайший keyframe до окна и чанки между ними (свёртка состояния к start_ts).
+Файл без трейлера (crash) индексируется сканом заголовков блоков: полезная нагрузка
+чанков при этом не распаковывается, оборванный хвостовой блок = ``truncated``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend_ctl.events import MISSING_MARKER
+
+#: Сигнатура v2-файла (первые 8 байт) и трейлера индекса (последние 8 байт).
+MAGIC: bytes = b"BCTLREC\x02"
+INDEX_MAGIC: bytes = b"BCTLIDX\x02"
+
+BLOCK_HEADER: int = 1
+BLOCK_CHUNK: int = 2
+BLOCK_KEYFRAME: int = 3
+BLOCK_FOOTER: int = 4
+BLOCK_INDEX: int = 5
+
+_BLOCK = struct.Struct("<BI")
+_CHUNK_PREFIX = struct.Struct("<IQQdd")
+_TRAILER = struct.Struct("<Q8s")
+
+#: Событий в чанке до принудительного сброса (компромисс сжатие ↔ гранулярность seek).
+DEFAULT_CHUNK_EVENTS: int = 1024
+#: Максимальный возраст несброшенного чанка: при crash теряется не больше ~секунды ленты.
+DEFAULT_CHUNK_MAX_AGE_S: float = 1.0
+#: Keyframe состояния раз в N чанков: окно читает ≤ N чанков «разгона» до start_ts.
+DEFAULT_KEYFRAME_EVERY: int = 32
+#: Уровень zlib: 6 — дефолт zlib, ~5-10x на JSON-ленте при десятках МБ/с.
+DEFAULT_COMPRESS_LEVEL: int = 6
+
+_STATE_CHANGED: str = "state.changed"
+
+
+def is_chunked_recording(path: str) -> bool:
+    """Файл начинается сигнатурой v2 (иначе — v1 JSONL или чужой файл)."""
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def fold_state_event(values: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Применить дельты ``state.changed`` к плоскому state-дереву (для keyframe/разгона).
+
+    Та же wire-форма, что читает read-model: ``data.deltas[].path/new_value``;
+    маркер удаления узла снимает всё поддерево и оставляет на пути tombstone
+    (сам маркер) — применяющий keyframe поверх снимка header'а обязан удалить путь.
+    """
+    if event.get("command") != _STATE_CHANGED:
+        return
+    data = event.get("data")
+    deltas = data.get("deltas") if isinstance(data, dict) else None
+    if not isinstance(deltas, list):
+        return
+    for delta in deltas:
+        if not isinstance(delta, dict):
+            continue
+        path = delta.get("path")
+        if not isinstance(path, str):
+            continue
+        value = delta.get("new_value")
+        if value == MISSING_MARKER:
+            prefix = path + "."
+            for key in [k for k in values if k.startswith(prefix)]:
+                del values[key]
+            values[path] = MISSING_MARKER
+        else:
+            values[path] = value
+
+
+def _pack_json(obj: Any, level: int) -> bytes:
+    return zlib.compress(json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8"), level)
+
+
+def _inflate(payload: bytes, where: str) -> bytes:
+    """zlib-распаковка блока; битое сжатие → RecordingError с местом, а не голый zlib.error."""
+    try:
+        return zlib.decompress(payload)
+    except zlib.error as exc:
+        from backend_ctl.recorder import RecordingError
+
+        raise RecordingError(f"{where}: повреждённый сжатый блок ({exc})") from exc
+
+
+def _unpack_json(payload: bytes, where: str = "v2-запись") -> Any:
+    return json.loads(_inflate(payload, where).decode("utf-8"))
+
+
+# --------------------------------------------------------------------------- #
+#  ChunkedRecordWriter — тот же интерфейс, что recorder.RecordWriter           #
+# --------------------------------------------------------------------------- #
+
+
+class ChunkedRecordWriter:
+    """Пишет v2-запись: header → чанки (+keyframes) → footer → индекс-трейлер.
+
+    Интерфейс совпадает с :class:`backend_ctl.recorder.RecordWriter` (write_header /
+    write_event / flush / write_footer / close / bytes_written) — :class:`Recorder`
+    и :func:`dump_recording` выбирают writer по версии, остальная механика общая.
+    Не потокобезопасен: единственный писатель — writer-поток Recorder'а.
+
+    ``flush()`` сбрасывает чанк только когда он полон или старше ``chunk_max_age_s`` —
+    writer-поток зовёт flush после каждого батча, и чанк на батч убил бы сжатие.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        chunk_events: int = DEFAULT_CHUNK_EVENTS,
+        chunk_max_age_s: float = DEFAULT_CHUNK_MAX_AGE_S,
+        keyframe_every: int = DEFAULT_KEYFRAME_EVERY,
+        level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> None:
+        from backend_ctl.recorder import RecordingError
+
+        self._path = path
+        try:
+            self._fh = open(path, "wb")
+        except OSError as exc:
+            raise RecordingError(
+                f"не удалось открыть файл записи {path!r} на запись ({exc.__class__.__name__}: {exc})"
+            ) from exc
+        self._fh.write(MAGIC)
+        self._bytes = len(MAGIC)
+        self._chunk_events = max(1, int(chunk_events))
+        self._chunk_max_age_s = float(chunk_max_age_s)
+        self._keyframe_every = max(1, int(keyframe_every))
+        self._level = int(level)
+
+        self._rows: List[bytes] = []
+        self._first: Optional[Tuple[int, float]] = None
+        self._last: Tuple[int, float] = (0, 0.0)
+        self._opened_at = 0.0
+        self._state: Dict[str, Any] = {}
+        self._kf_state: Dict[str, Any] = {}  # состояние на конец чанка, за которым следует keyframe
+        self._chunks: List[List[Any]] = []
+        self._keyframes: List[List[Any]] = []
+        self._closed = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def bytes_written(self) -> int:
+        """Байты на диске + несжатый буфер текущего чанка (верхняя оценка для max_bytes)."""
+        return self._bytes + sum(len(r) for r in self._rows)
+
+    def _write_block(self, kind: int, payload: bytes) -> int:
+        offset = self._bytes
+        self._fh.write(_BLOCK.pack(kind, len(payload)))
+        self._fh.write(payload)
+        self._bytes += _BLOCK.size + len(payload)
+        return offset
+
+    def write_header(self, header: Dict[str, Any]) -> None:
+        self._write_block(BLOCK_HEADER, _pack_json(header, self._level))
+        self._fh.flush()
+
+    def write_event(self, seq: int, ts: float, event: Dict[str, Any], *, pre_header: bool = False) -> None:
+        """Добавить событие в текущий чанк (форма строки — как у v1)."""
+        row: Dict[str, Any] = {"seq": seq, "ts": ts, "event": event}
+        if pre_header:
+            row["pre_header"] = True
+        if not self._rows:
+            self._first = (seq, ts)
+            self._opened_at = time.monotonic()
+        self._rows.append(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8"))
+        self._last = (seq, ts)
+        fold_state_event(self._state, event)
+        if len(self._rows) >= self._chunk_events:
+            self._flush_chunk()
+
+    def _flush_chunk(self) -> None:
+        if not self._rows or self._first is None:
+            return
+        if self._chunks and len(self._chunks) % self._keyframe_every == 0:
+            # Keyframe ПЕРЕД чанком: состояние после последнего уже записанного события.
+            prev_last_seq, prev_last_ts = self._chunks[-1][2], self._chunks[-1][4]
+            kf_offset = self._write_block(
+                BLOCK_KEYFRAME,
+                _pack_json({"ts": prev_last_ts, "seq": prev_last_seq, "values": self._kf_state}, self._level),
+            )
+            self._keyframes.append([kf_offset, prev_last_ts, prev_last_seq])
+        body = zlib.compress(b"\n".join(self._rows), self._level)
+        prefix = _CHUNK_PREFIX.pack(len(self._rows), self._first[0], self._last[0], self._first[1], self._last[1])
+        offset = self._write_block(BLOCK_CHUNK, prefix + body)
+        self._chunks.append([offset, self._first[0], self._last[0], self._first[1], self._last[1], len(self._rows)])
+        if len(self._chunks) % self._keyframe_every == 0:
+            # снимок только под ближайший keyframe (пишется перед следующим чанком)
+            self._kf_state = dict(self._state)
+        self._rows = []
+        self._first = None
+        self._fh.flush()
+
+    def flush(self) -> None:
+        if self._closed or not self._rows:
+            return
+        if time.monotonic() - self._opened_at >= self._chunk_max_age_s:
+            self._flush_chunk()
+
+    def write_footer(self, footer: Dict[str, Any]) -> None:
+        """Дописать остаток чанка, footer и индекс-трейлер; flush + fsync."""
+        if self._closed:
+            return
+        self._flush_chunk()
+        self._write_block(BLOCK_FOOTER, _pack_json(footer, self._level))
+        self._write_index()
+        self._fh.flush()
+        try:
+            os.fsync(self._fh.fileno())
+        except OSError:
+            pass  # fsync недоступен (напр. спец-ФС) — не роняем запись
+
+    def _write_index(self) -> None:
+        index_offset = self._write_block(
+            BLOCK_INDEX, _pack_json({"chunks": self._chunks, "keyframes": self._keyframes}, self._level)
+        )
+        self._fh.write(_TRAILER.pack(index_offset, INDEX_MAGIC))
+        self._bytes += _TRAILER.size
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._flush_chunk()
+        finally:
+            self._fh.close()
+
+
+# --------------------------------------------------------------------------- #
+#  ChunkedRecordReader — потоковое чтение и seek по индексу                    #
+# --------------------------------------------------------------------------- #
+
+
+def _keyframe_ts(entry: List[Any]) -> float:
+    """Ключ бисекции keyframe-индекса; keyframe без ts (битый скан) — «после всех»."""
+    return float(entry[1]) if entry[1] is not None else float("inf")
+
+
+def _chunk_last_seq(entry: List[Any]) -> int:
+    return int(entry[2])
+
+
+class ChunkedRecordReader:
+    """Читатель v2-записи: header/footer/индекс сразу, чанки — по запросу.
+
+    Индекс берётся из трейлера; без трейлера (обрыв записи) — сканом заголовков
+    блоков (без распаковки чанков). Используется :func:`recorder.load_recording`
+    и напрямую для потоковых потребителей (:meth:`iter_events`).
+    """
+
+    def __init__(self, path: str) -> None:
+        from backend_ctl.recorder import RecordingError
+
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            if self._fh.read(len(MAGIC)) != MAGIC:
+                raise RecordingError(f"{path!r} — не v2-запись bctl-record (нет сигнатуры)")
+            kind, payload = self._read_block_at(len(MAGIC))
+            if kind != BLOCK_HEADER or payload is None:
+                raise RecordingError(f"{path!r}: v2-запись без header-блока")
+            self.header: Dict[str, Any] = _unpack_json(payload, repr(path))
+            self.footer: Optional[Dict[str, Any]] = None
+            self.truncated = False
+            self.chunks: List[List[Any]] = []
+            self.keyframes: List[List[Any]] = []
+            if not self._load_trailer_index():
+                self._scan_index()
+        except BaseException:
+            self._fh.close()
+            raise
+
+    # ---- блоки ----
+
+    def _read_block_at(self, offset: int) -> Tuple[int, Optional[bytes]]:
+        """(вид, полезная нагрузка) блока по смещению; payload=None — блок оборван."""
+        self._fh.seek(offset)
+        head = self._fh.read(_BLOCK.size)
+        if len(head) < _BLOCK.size:
+            return 0, None
+        kind, length = _BLOCK.unpack(head)
+        payload = self._fh.read(length)
+        if len(payload) < length:
+            return kind, None
+        return kind, payload
+
+    def _load_trailer_index(self) -> bool:
+        size = os.fstat(self._fh.fileno()).st_size
+        if size < len(MAGIC) + _TRAILER.size:
+            return False
+        self._fh.seek(size - _TRAILER.size)
+        index_offset, magic = _TRAILER.unpack(self._fh.read(_TRAILER.size))
+        if magic != INDEX_MAGIC:
+            return False
+        kind, payload = self._read_block_at(index_offset)
+        if kind != BLOCK_INDEX or payload is None:
+            return False
+        index = _unpack_json(payload, repr(self.path))
+        self.chunks = index.get("chunks") or []
+        self.keyframes = index.get("keyframes") or []
+        # footer — блок перед индексом; ищем коротким сканом от последнего чанка
+        start = self.chunks[-1][0] if self.chunks else len(MAGIC)
+        self.footer = self._find_footer(start, index_offset)
+        self.truncated = self.footer is None
+        return True
+
+    def _find_footer(self, start: int, end: int) -> Optional[Dict[str, Any]]:
+        offset = start
+        while offset < end:
+            self._fh.seek(offset)
+            head = self._fh.read(_BLOCK.size)
+            if len(head) < _BLOCK.size:
+                return None
+            kind, length = _BLOCK.unpack(head)
+            if kind == BLOCK_FOOTER:
+                payload = self._fh.read(length)
+                return _unpack_json(payload, repr(self.path)) if len(payload) == length else None
+            offset += _BLOCK.size + length
+        return None
+
+    def _scan_index(self) -> None:
+        """Восстановить индекс без трейлера: пройти заголовки блоков до обрыва."""
+        size = os.fstat(self._fh.fileno()).st_size
+        offset = len(MAGIC)
+        while offset < size:
+            self._fh.seek(offset)
+            head = self._fh.read(_BLOCK.size)
+            if len(head) < _BLOCK.size:
+                break
+            kind, length = _BLOCK.unpack(head)
+            if offset + _BLOCK.size + length > size:
+                break  # оборванный хвостовой блок (crash посреди записи)
+            if kind == BLOCK_CHUNK:
+                count, first_seq, last_seq, first_ts, last_ts = _CHUNK_PREFIX.unpack(self._fh.read(_CHUNK_PREFIX.size))
+                self.chunks.append([offset, first_seq, last_seq, first_ts, last_ts, count])
+            elif kind == BLOCK_KEYFRAME:
+                kf = _unpack_json(self._fh.read(length), repr(self.path))
+                self.keyframes.append([offset, kf.get("ts"), kf.get("seq")])
+            elif kind == BLOCK_FOOTER:
+                self.footer = _unpack_json(self._fh.read(length), repr(self.path))
+            offset += _BLOCK.size + length
+        self.truncated = self.footer is None
+
+    def _chunk_rows(self, offset: int) -> List[Dict[str, Any]]:
+        kind, payload = self._read_block_at(offset)
+        if kind != BLOCK_CHUNK or payload is None:
+            return []
+        body = _inflate(payload[_CHUNK_PREFIX.size :], f"{self.path!r} @{offset}")
+        return [json.loads(line) for line in body.split(b"\n") if line]
+
+    # ---- публичное чтение ----
+
+    @property
+    def total_events(self) -> int:
+        return sum(int(c[5]) for c in self.chunks)
+
+    @property
+    def time_range(self) -> Tuple[Optional[float], Optional[float]]:
+        if not self.chunks:
+            return None, None
+        return float(self.chunks[0][3]), float(self.chunks[-1][4])
+
+    def iter_events(self, start_ts: Optional[float] = None, end_ts: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """События окна ``[start_ts, end_ts]`` — распаковываются только пересекающие чанки."""
+        for offset, _fs, _ls, first_ts, last_ts, _n in self.chunks:
+            if start_ts is not None and last_ts < start_ts:
+                continue
+            if end_ts is not None and first_ts > end_ts:
+                break
+            for row in self._chunk_rows(offset):
+                ts = row.get("ts")
+                if start_ts is not None and isinstance(ts, (int, float)) and ts < start_ts:
+                    continue
+                if end_ts is not None and isinstance(ts, (int, float)) and ts > end_ts:
+                    return
+                yield row
+
+    def state_at(self, ts: float) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Свёрнутое state-дерево на момент ``ts`` (до первого события окна).
+
+        Ближайший keyframe до ts (бисекция по индексу, распаковывается один) + дельты
+        чанков от него до ts. Возвращает (values | None — нет ни keyframe, ни
+        state-событий до ts; число свёрнутых событий).
+        """
+        values: Dict[str, Any] = {}
+        base_seq = 0
+        have = False
+        pos = bisect.bisect_left(self.keyframes, ts, key=_keyframe_ts)
+        for kf_offset, _kf_ts, kf_seq in reversed(self.keyframes[:pos]):
+            kind, payload = self._read_block_at(kf_offset)
+            if kind == BLOCK_KEYFRAME and payload is not None:
+                kf = _unpack_json(payload, f"{self.path!r} @{kf_offset}")
+                values, base_seq, have = dict(kf.get("values") or {}), int(kf_seq or 0), True
+                break
+        folded = 0
+        start = bisect.bisect_right(self.chunks, base_seq, key=_chunk_last_seq)
+        for offset, _fs, _ls, first_ts, _lt, _n in self.chunks[start:]:
+            if first_ts >= ts:
+                break
+            for row in self._chunk_rows(offset):
+                row_ts = row.get("ts")
+                if int(row.get("seq") or 0) <= base_seq:
+                    continue
+                if isinstance(row_ts, (int, float)) and row_ts >= ts:
+                    break
+                event = row.get("event")
+                if isinstance(event, dict):
+                    fold_state_event(values, event)
+                    folded += 1
+        return (values if have or folded else None), folded
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> ChunkedRecordReader:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+__all__ = [
+    "MAGIC",
+    "INDEX_MAGIC",
+    "DEFAULT_CHUNK_EVENTS",
+    "DEFAULT_KEYFRAME_EVERY",
+    "ChunkedRecordWriter",
+    "ChunkedRecordReader",
+    "fold_state_event",
+    "is_chunked_recording",
+]
@@ -23,6 +23,11 @@ read-model / второго классификатора не появляетс
 
 Файл без footer = запись оборвана жёстко (crash) — при загрузке это честно
 сообщается (``truncated: true``), но грузится всё разобранное.
+
+Для многочасовых записей есть v2 (``version=2``, :mod:`backend_ctl.record_chunks`):
+те же header/строки/footer, но в сжатых чанках с индекс-трейлером — загрузка окна
+``[start_ts, end_ts]`` читает только нужные чанки. :func:`load_recording` различает
+форматы по сигнатуре файла; v1 грузится как раньше.
 """
 
 from __future__ import annotations
@@ -34,6 +39,14 @@ import threading
 import time
 from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
+from backend_ctl.events import MISSING_MARKER
+from backend_ctl.record_chunks import (
+    ChunkedRecordReader,
+    ChunkedRecordWriter,
+    fold_state_event,
+    is_chunked_recording,
+)
+
 # --------------------------------------------------------------------------- #
 #  Константы формата                                                          #
 # --------------------------------------------------------------------------- #
@@ -42,11 +55,17 @@ from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 FORMAT: str = "bctl-record"
 #: Версия формата. Незнакомая версия при загрузке → обучающий отказ (не тихий разбор).
 VERSION: int = 1
+#: Версия сжатого чанкового формата с индексом (record_chunks): seek по времени.
+VERSION_CHUNKED: int = 2
+SUPPORTED_VERSIONS: Tuple[int, ...] = (VERSION, VERSION_CHUNKED)
 
 #: Лимит событий по умолчанию: по достижении запись авто-останавливается (reason="limit").
 DEFAULT_MAX_EVENTS: int = 100_000
 #: Мягкий лимит размера файла (~200 МБ): та же авто-остановка (файл валиден).
 DEFAULT_MAX_BYTES: int = 200 * 1024 * 1024
+#: Лимиты v2: чанки сжаты (~5-10x), файл читается окном — рассчитано на запись смены.
+DEFAULT_CHUNKED_MAX_EVENTS: int = 20_000_000
+DEFAULT_CHUNKED_MAX_BYTES: int = 4 * 1024 * 1024 * 1024
 #: Ёмкость очереди writer'а: переполнение видимо в footer.dropped, не тихая потеря.
 DEFAULT_QUEUE_MAXLEN: int = 50_000
 #: Дефолтный потолок колец detached-driver'а при реплее (переопределяемо ring_maxlen).
@@ -146,6 +165,15 @@ class RecordWriter:
             self._fh.close()
 
 
+def open_record_writer(path: str, version: int = VERSION) -> Any:
+    """Writer под версию формата: v1 — :class:`RecordWriter`, v2 — ChunkedRecordWriter."""
+    if version == VERSION:
+        return RecordWriter(path)
+    if version == VERSION_CHUNKED:
+        return ChunkedRecordWriter(path)
+    raise RecordingError(f"неизвестная версия записи {version!r}: ожидаю одну из {SUPPORTED_VERSIONS}")
+
+
 # --------------------------------------------------------------------------- #
 #  Recorder — подписчик hub'а + writer-поток                                  #
 # --------------------------------------------------------------------------- #
@@ -178,7 +206,9 @@ def _collect_state(drv: Any) -> Any:
     return drv.send_command("ProcessManager", "state.get_subtree", {"path": ""})
 
 
-def collect_header(drv: Any, created_ts: float, *, subscribed_ts: Optional[float] = None) -> Dict[str, Any]:
+def collect_header(
+    drv: Any, created_ts: float, *, subscribed_ts: Optional[float] = None, version: int = VERSION
+) -> Dict[str, Any]:
     """Снимок системы для строки-header (best-effort по секциям).
 
     Переиспользуется :class:`Recorder` (старт записи) и :func:`dump_recording`
@@ -191,7 +221,7 @@ def collect_header(drv: Any, created_ts: float, *, subscribed_ts: Optional[float
     """
     header: Dict[str, Any] = {
         "format": FORMAT,
-        "version": VERSION,
+        "version": version,
         "created_ts": created_ts,
         "endpoint": {
             "host": _safe_section("host", lambda: drv.host),
@@ -223,7 +253,8 @@ class Recorder:
     ``footer.dropped`` — не тихая потеря.
 
     Лимиты (``max_events`` / ``max_bytes``): по достижении запись авто-останавливается
-    с ``reason="limit"`` (файл валиден). :meth:`stop` идемпотентна и вызывается на
+    с ``reason="limit"`` (файл валиден). None — дефолт версии формата: у v2
+    (``version=VERSION_CHUNKED``) потолки рассчитаны на многочасовую запись. :meth:`stop` идемпотентна и вызывается на
     всех путях завершения (stop/limit/disconnect).
     """
 
@@ -232,17 +263,26 @@ class Recorder:
         drv: Any,
         path: str,
         *,
-        max_events: int = DEFAULT_MAX_EVENTS,
-        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_events: Optional[int] = None,
+        max_bytes: Optional[int] = None,
         queue_maxlen: int = DEFAULT_QUEUE_MAXLEN,
+        version: int = VERSION,
     ) -> None:
+        if version not in SUPPORTED_VERSIONS:
+            raise RecordingError(f"неизвестная версия записи {version!r}: ожидаю одну из {SUPPORTED_VERSIONS}")
+        chunked = version == VERSION_CHUNKED
+        if max_events is None:
+            max_events = DEFAULT_CHUNKED_MAX_EVENTS if chunked else DEFAULT_MAX_EVENTS
+        if max_bytes is None:
+            max_bytes = DEFAULT_CHUNKED_MAX_BYTES if chunked else DEFAULT_MAX_BYTES
         self._drv = drv
         self._path = path
+        self._version = version
         self._max_events = max(1, int(max_events))
         self._max_bytes = max(1, int(max_bytes))
         self._max_queue = max(1, int(queue_maxlen))
 
-        self._writer: Optional[RecordWriter] = None
+        self._writer: Optional[Any] = None
         self._listener: Optional[Callable[[Dict[str, Any]], None]] = None
         self._thread: Optional[threading.Thread] = None
 
@@ -311,7 +351,7 @@ class Recorder:
             self._header_ready_ts = float(header.get("header_ready_ts") or time.time())
             self._subscriptions = list(header.get("subscriptions") or [])
 
-            self._writer = RecordWriter(self._path)
+            self._writer = open_record_writer(self._path, self._version)
             self._writer.write_header(header)
 
             self._thread = threading.Thread(target=self._writer_loop, name="bctl-recorder", daemon=True)
@@ -332,7 +372,7 @@ class Recorder:
 
     def _collect_header(self) -> Dict[str, Any]:
         """Снимок системы для строки-header (делегат :func:`collect_header`)."""
-        return collect_header(self._drv, self._created_ts, subscribed_ts=self._subscribed_ts)
+        return collect_header(self._drv, self._created_ts, subscribed_ts=self._subscribed_ts, version=self._version)
 
     def _detach_listener(self) -> None:
         """Снять подписку с hub'а, идемпотентно. Teardown не роняем."""
@@ -388,7 +428,7 @@ class Recorder:
     def _writer_loop(self) -> None:
         """Сливать очередь в файл до стопа; при лимите — остаток в dropped (не тихо).
 
-        Единственный писатель файла (RecordWriter не потокобезопасен) и единственный
+        Единственный писатель файла (writer не потокобезопасен) и единственный
         владелец :meth:`_finalize` — footer/close случаются строго здесь, не в stop().
         """
         assert self._writer is not None
@@ -500,7 +540,7 @@ class Recorder:
         }
 
 
-def dump_recording(drv: Any, path: str, *, ring_limit: int = 500) -> Dict[str, Any]:
+def dump_recording(drv: Any, path: str, *, ring_limit: int = 500, version: int = VERSION) -> Dict[str, Any]:
     """One-shot дамп чёрного ящика: header-снимок + текущее arrival-кольцо (§5.3).
 
     EventHub — always-on чёрный ящик в пределах maxlen; дамп = тот же writer-код на
@@ -509,9 +549,9 @@ def dump_recording(drv: Any, path: str, *, ring_limit: int = 500) -> Dict[str, A
     ``reason="dump"`` в footer сигналит, что это снимок, а не хронированная запись.
     """
     dump_ts = time.time()
-    writer = RecordWriter(path)
+    writer = open_record_writer(path, version)
     try:
-        writer.write_header(collect_header(drv, dump_ts))
+        writer.write_header(collect_header(drv, dump_ts, version=version))
         seq = 0
         cursor: Optional[str] = None
         # Пройти всё arrival-кольцо страницами до исчерпания (курсорное чтение B.1).
@@ -551,6 +591,10 @@ class Recording:
 
     ``truncated=True`` — файл без footer (жёсткий обрыв записи, crash): грузится всё
     разобранное, но честно помечается. Создаётся через :func:`load_recording`.
+
+    Загрузка окном (``start_ts``/``end_ts``): ``events`` — только события окна,
+    ``keyframe`` — свёрнутое state-дерево (плоские пути) на начало окна, ``window`` —
+    границы окна и сколько событий до него свёрнуто (None — запись загружена целиком).
     """
 
     def __init__(
@@ -562,6 +606,8 @@ class Recording:
         truncated: bool,
         path: str,
         skipped_malformed: int = 0,
+        keyframe: Optional[Dict[str, Any]] = None,
+        window: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.header = header
         self.events = events
@@ -572,14 +618,21 @@ class Recording:
         # (оборванный хвост). truncated=False + skipped_malformed>0 → файл завершён чисто,
         # но внутри есть потерянные строки — честный отдельный сигнал.
         self.skipped_malformed = skipped_malformed
+        self.keyframe = keyframe
+        self.window = window
 
     @property
     def snapshot(self) -> Dict[str, Any]:
         return self.header.get("snapshot") or {}
 
 
-def load_recording(path: str) -> Recording:
-    """Разобрать JSONL-запись; провалидировать формат/версию; определить обрыв.
+def load_recording(path: str, *, start_ts: Optional[float] = None, end_ts: Optional[float] = None) -> Recording:
+    """Разобрать запись; провалидировать формат/версию; определить обрыв.
+
+    v2 (сигнатура ``record_chunks.MAGIC``) грузится окном ``[start_ts, end_ts]``
+    через индекс — читаются только чанки окна и «разгон» от ближайшего keyframe.
+    v1 (JSONL) разбирается целиком, окно применяется фильтром после разбора
+    (состояние до окна сворачивается из отброшенных событий — семантика та же).
 
     Raises:
         RecordingError: файл не bctl-record или незнакомая версия формата
@@ -592,6 +645,8 @@ def load_recording(path: str) -> Recording:
     # FileNotFoundError оставляем как есть (документированный контракт функции), прочие
     # файловые беды (нет прав, путь — каталог, битая кодировка) → RecordingError с путём:
     # иначе голый OSError выдавал себя за обрыв связи и сбрасывал driver (Task 1.4).
+    if is_chunked_recording(path):
+        return _load_chunked(path, start_ts, end_ts)
     try:
         with open(path, encoding="utf-8") as fh:
             raw_lines = [stripped for raw in fh if (stripped := raw.strip())]
@@ -633,7 +688,92 @@ def load_recording(path: str) -> Recording:
 
     footer = lines[-1] if isinstance(lines[-1], dict) and lines[-1].get("footer") else None
     events = [ln for ln in lines[1:] if isinstance(ln, dict) and "event" in ln]
-    return Recording(header, events, footer, truncated=footer is None, path=path, skipped_malformed=skipped_malformed)
+    keyframe: Optional[Dict[str, Any]] = None
+    window: Optional[Dict[str, Any]] = None
+    if start_ts is not None or end_ts is not None:
+        keyframe, events, folded = _window_events(events, start_ts, end_ts)
+        window = {"start_ts": start_ts, "end_ts": end_ts, "folded": folded}
+    return Recording(
+        header,
+        events,
+        footer,
+        truncated=footer is None,
+        path=path,
+        skipped_malformed=skipped_malformed,
+        keyframe=keyframe,
+        window=window,
+    )
+
+
+def _row_ts(row: Dict[str, Any]) -> Optional[float]:
+    ts = row.get("ts")
+    return float(ts) if isinstance(ts, (int, float)) else None
+
+
+def _window_events(
+    events: List[Dict[str, Any]], start_ts: Optional[float], end_ts: Optional[float]
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], int]:
+    """Окно над уже разобранной v1-лентой: (свёрнутое состояние до окна, события окна, свёрнуто)."""
+    values: Dict[str, Any] = {}
+    folded = 0
+    window: List[Dict[str, Any]] = []
+    for row in events:
+        ts = _row_ts(row)
+        if start_ts is not None and ts is not None and ts < start_ts:
+            event = row.get("event")
+            if isinstance(event, dict):
+                fold_state_event(values, event)
+                folded += 1
+            continue
+        if end_ts is not None and ts is not None and ts > end_ts:
+            break
+        window.append(row)
+    return (values if folded else None), window, folded
+
+
+def _load_chunked(path: str, start_ts: Optional[float], end_ts: Optional[float]) -> Recording:
+    """v2: header/footer/индекс из файла, события — только чанки окна (seek по индексу)."""
+    try:
+        reader = ChunkedRecordReader(path)
+    except (OSError, ValueError) as exc:
+        if isinstance(exc, RecordingError):
+            raise
+        raise RecordingError(f"не удалось прочитать файл записи {path!r} ({exc.__class__.__name__}: {exc})") from exc
+    with reader:
+        header = reader.header
+        if not isinstance(header, dict) or header.get("format") != FORMAT:
+            raise RecordingError(
+                f"{path!r} — не запись bctl-record (format={header.get('format')!r}). "
+                "Ожидаю файл, созданный record_start/record_dump."
+            )
+        if header.get("version") != VERSION_CHUNKED:
+            raise RecordingError(
+                f"незнакомая версия записи {header.get('version')!r} в v2-контейнере "
+                f"(поддерживается {VERSION_CHUNKED}). Обнови инструмент или пересними запись."
+            )
+        keyframe: Optional[Dict[str, Any]] = None
+        window: Optional[Dict[str, Any]] = None
+        folded = 0
+        if start_ts is not None:
+            keyframe, folded = reader.state_at(float(start_ts))
+        events = list(reader.iter_events(start_ts, end_ts))
+        if start_ts is not None or end_ts is not None:
+            window = {
+                "start_ts": start_ts,
+                "end_ts": end_ts,
+                "folded": folded,
+                "chunks_total": len(reader.chunks),
+                "events_total": reader.total_events,
+            }
+        return Recording(
+            header,
+            events,
+            reader.footer,
+            truncated=reader.truncated,
+            path=path,
+            keyframe=keyframe,
+            window=window,
+        )
 
 
 def _flatten_tree(tree: Any, prefix: str = "") -> Dict[str, Any]:
@@ -701,6 +841,10 @@ class ReplayPlayer:
         # Часы реплея: до первого события — created_ts header'а; при прокрутке —
         # ts текущего события (инъектируется в read-model, см. now()).
         self._clock_ts: float = float(recording.header.get("created_ts") or 0.0)
+        window = recording.window or {}
+        if isinstance(window.get("start_ts"), (int, float)):
+            # Окно: стартовое состояние — на start_ts, история копится от него.
+            self._clock_ts = max(self._clock_ts, float(window["start_ts"]))
 
         endpoint = recording.header.get("endpoint") or {}
         host = endpoint.get("host") if isinstance(endpoint.get("host"), str) else "127.0.0.1"
@@ -749,6 +893,13 @@ class ReplayPlayer:
             history = telemetry.get("history") or {}
             if isinstance(history, dict):
                 model.import_history(history)
+            # 4. Окно записи: состояние, свёрнутое до start_ts (keyframe + дельты), —
+            # поверх снимка header'а; tombstone удаляет путь, попавший в снимок.
+            keyframe = self.recording.keyframe or {}
+            for path, value in keyframe.items():
+                if value == MISSING_MARKER:
+                    model.ingest(path, None, deleted=True)
+            model.prime({p: v for p, v in keyframe.items() if v != MISSING_MARKER})
 
     # ---- Прокрутка ленты (playhead) ----
 
@@ -850,6 +1001,8 @@ class ReplayPlayer:
             "total": self.total,
             "truncated": self.recording.truncated,
             "skipped_malformed": self.recording.skipped_malformed,
+            "version": self.recording.header.get("version"),
+            "window": self.recording.window,
         }
 
     def await_condition(
@@ -928,6 +1081,8 @@ def replay_await_condition(
 __all__ = [
     "FORMAT",
     "VERSION",
+    "VERSION_CHUNKED",
+    "SUPPORTED_VERSIONS",
     "MODE_LIVE",
     "MODE_REPLAY",
     "DEFAULT_MAX_EVENTS",
@@ -938,6 +1093,7 @@ __all__ = [
     "REASON_DISCONNECT",
     "REASON_DUMP",
     "RecordWriter",
+    "open_record_writer",
     "Recorder",
     "collect_header",
     "dump_recording",
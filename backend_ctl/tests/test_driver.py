@@ -1305,6 +1305,46 @@ class TestSupervisionStatus:
         assert calls == [("ProcessManager", "supervision.status", {"process": "camera"})]
 
 
+class TestPerfProbes:
+    """perf_probes(process?) шлёт perf.probes в ProcessManager."""
+
+    def test_sends_perf_probes_command(self, monkeypatch) -> None:
+        d = BackendDriver()
+        calls: List[tuple] = []
+
+        def fake_send(target, command, args=None, *, timeout=None):
+            calls.append((target, command, args))
+            return {"success": True, "processes": {}, "stages": {}}
+
+        monkeypatch.setattr(d, "send_command", fake_send)
+        d.perf_probes()
+        d.perf_probes("camera")
+        assert calls == [
+            ("ProcessManager", "perf.probes", {}),
+            ("ProcessManager", "perf.probes", {"process": "camera"}),
+        ]
+
+
+class TestBootReport:
+    """boot_report(process?, top?) шлёт boot.report в ProcessManager."""
+
+    def test_sends_boot_report_command(self, monkeypatch) -> None:
+        d = BackendDriver()
+        calls: List[tuple] = []
+
+        def fake_send(target, command, args=None, *, timeout=None):
+            calls.append((target, command, args))
+            return {"success": True, "system": {}, "processes": [], "imports": [], "roots": []}
+
+        monkeypatch.setattr(d, "send_command", fake_send)
+        d.boot_report()
+        d.boot_report("detector", top=5)
+        assert calls == [
+            ("ProcessManager", "boot.report", {}),
+            ("ProcessManager", "boot.report", {"process": "detector", "top": 5}),
+        ]
+
+
 class TestImportRetargetsSubscriber:
     """Ревью-фикс #1: import пере-нацеливает свой subscriber на текущую сессию, чтобы
     ключ durable-намарения совпадал с ним и последующий untail реально снимал его
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""Тесты v2-формата записи (record_chunks): сжатые чанки + индекс + seek по времени.
+
+Контракт: v2 пишется тем же Recorder'ом (``version=2``), грузится тем же
+:func:`load_recording`; окно ``[start_ts, end_ts]`` читает только чанки окна,
+стартовое состояние свёрнуто на start_ts (keyframe + дельты). Обрыв без трейлера
+индексируется сканом блоков. v1 JSONL грузится как раньше (в т.ч. окном).
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from backend_ctl.driver import BackendDriver
+from backend_ctl.events import MISSING_MARKER
+from backend_ctl.record_chunks import (
+    MAGIC,
+    ChunkedRecordReader,
+    ChunkedRecordWriter,
+    fold_state_event,
+    is_chunked_recording,
+)
+from backend_ctl.recorder import (
+    FORMAT,
+    VERSION_CHUNKED,
+    Recorder,
+    RecordingError,
+    ReplayPlayer,
+    load_recording,
+)
+
+
+def _state_push(path: str, value: Any) -> Dict[str, Any]:
+    return {"command": "state.changed", "data": {"deltas": [{"path": path, "new_value": value}]}}
+
+
+def _write_chunked(path: str, rows: List[Dict[str, Any]], *, footer: bool = True, **kwargs: Any) -> None:
+    """Записать v2-файл напрямую writer'ом (детерминированные ts, без потоков)."""
+    writer = ChunkedRecordWriter(path, **kwargs)
+    writer.write_header({"format": FORMAT, "version": VERSION_CHUNKED, "created_ts": 1000.0, "snapshot": {}})
+    for seq, row in enumerate(rows, start=1):
+        writer.write_event(seq, row["ts"], row["event"])
+    if footer:
+        writer.write_footer({"footer": True, "events_written": len(rows), "dropped": 0, "reason": "stopped"})
+    writer.close()
+
+
+def _fps_rows(n: int, start_ts: float = 1000.0) -> List[Dict[str, Any]]:
+    return [{"ts": start_ts + i, "event": _state_push("processes.cam.state.fps", float(i))} for i in range(n)]
+
+
+# --------------------------------------------------------------------------- #
+#  Формат и индекс                                                            #
+# --------------------------------------------------------------------------- #
+
+
+def test_round_trip_full_load(tmp_path: Path) -> None:
+    path = str(tmp_path / "r.bctl")
+    _write_chunked(path, _fps_rows(50), chunk_events=8)
+    assert is_chunked_recording(path)
+    rec = load_recording(path)
+    assert rec.truncated is False
+    assert [e["seq"] for e in rec.events] == list(range(1, 51))
+    assert rec.footer is not None and rec.footer["reason"] == "stopped"
+    assert rec.window is None and rec.keyframe is None
+
+
+def test_compresses_repetitive_stream(tmp_path: Path) -> None:
+    path = tmp_path / "big.bctl"
+    _write_chunked(str(path), _fps_rows(5000))
+    raw = sum(len(str(r)) for r in _fps_rows(5000))
+    assert path.stat().st_size * 4 < raw
+
+
+def test_window_reads_only_overlapping_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = str(tmp_path / "w.bctl")
+    _write_chunked(path, _fps_rows(400), chunk_events=10, keyframe_every=4)
+    decoded: List[int] = []
+    orig = ChunkedRecordReader._chunk_rows
+
+    def spy(self: ChunkedRecordReader, offset: int) -> List[Dict[str, Any]]:
+        decoded.append(offset)
+        return orig(self, offset)
+
+    monkeypatch.setattr(ChunkedRecordReader, "_chunk_rows", spy)
+    rec = load_recording(path, start_ts=1300.0, end_ts=1309.0)
+    assert [e["ts"] for e in rec.events] == [1300.0 + i for i in range(10)]
+    # 40 чанков в файле; окно (1 чанк) + разгон от keyframe (< keyframe_every чанков)
+    assert len(decoded) <= 1 + 4
+    assert rec.window is not None and rec.window["chunks_total"] == 40
+
+
+def test_window_keyframe_carries_state_before_window(tmp_path: Path) -> None:
+    path = str(tmp_path / "k.bctl")
+    rows = _fps_rows(100)
+    rows.insert(5, {"ts": 1004.5, "event": _state_push("processes.cam.state.mode", "run")})
+    rows.insert(7, {"ts": 1005.5, "event": _state_push("processes.old", MISSING_MARKER)})
+    _write_chunked(path, rows, chunk_events=7, keyframe_every=2)
+    rec = load_recording(path, start_ts=1080.0)
+    assert rec.keyframe is not None
+    assert rec.keyframe["processes.cam.state.fps"] == 79.0
+    assert rec.keyframe["processes.cam.state.mode"] == "run"
+    assert rec.keyframe["processes.old"] == MISSING_MARKER
+    assert rec.events[0]["ts"] == 1080.0
+
+
+def test_state_at_decodes_single_keyframe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = str(tmp_path / "s.bctl")
+    _write_chunked(path, _fps_rows(400), chunk_events=10, keyframe_every=2)
+    reads: List[int] = []
+    orig = ChunkedRecordReader._read_block_at
+
+    def spy(self: ChunkedRecordReader, offset: int) -> Any:
+        reads.append(offset)
+        return orig(self, offset)
+
+    with ChunkedRecordReader(path) as reader:
+        assert len(reader.keyframes) == 19
+        monkeypatch.setattr(ChunkedRecordReader, "_read_block_at", spy)
+        values, folded = reader.state_at(1355.0)
+    assert values == {"processes.cam.state.fps": 354.0}
+    # один keyframe (ts 1339) + разгон чанками 1340..1349 и 1350..1354
+    assert len(reads) == 3 and folded == 15
+
+
+def test_corrupt_chunk_raises_recording_error(tmp_path: Path) -> None:
+    path = tmp_path / "c.bctl"
+    _write_chunked(str(path), _fps_rows(30), chunk_events=10)
+    with ChunkedRecordReader(str(path)) as reader:
+        offset = reader.chunks[1][0]
+    data = bytearray(path.read_bytes())
+    body = offset + 5 + 28  # заголовок блока <BI + префикс чанка <IQQdd
+    data[body : body + 16] = b"\x00" * 16
+    path.write_bytes(bytes(data))
+    with pytest.raises(RecordingError, match="повреждённый сжатый блок"):
+        load_recording(str(path))
+
+
+def test_replay_window_primes_state_at_start(tmp_path: Path) -> None:
+    path = str(tmp_path / "p.bctl")
+    _write_chunked(path, _fps_rows(200), chunk_events=16, keyframe_every=2)
+    player = ReplayPlayer(load_recording(path, start_ts=1150.0, end_ts=1160.0), position="start")
+    assert player.state_get("processes.cam.state.fps")["value"] == 149.0
+    assert player.total == 11
+    player.pump(player.total)
+    assert player.state_get("processes.cam.state.fps")["value"] == 160.0
+    assert player.status()["window"]["start_ts"] == 1150.0
+
+
+def test_fold_state_event_tombstones_subtree() -> None:
+    values = {"a.b": 1, "a.c": 2, "ab": 3}
+    fold_state_event(values, _state_push("a", MISSING_MARKER))
+    assert values == {"a": MISSING_MARKER, "ab": 3}
+    fold_state_event(values, {"command": "log", "data": {}})
+    assert values == {"a": MISSING_MARKER, "ab": 3}
+
+
+# --------------------------------------------------------------------------- #
+#  Обрыв записи                                                                #
+# --------------------------------------------------------------------------- #
+
+
+def test_truncated_file_rebuilds_index_by_scan(tmp_path: Path) -> None:
+    path = tmp_path / "t.bctl"
+    _write_chunked(str(path), _fps_rows(30), footer=False, chunk_events=10)
+    # хвост оборван посреди блока (crash во время записи)
+    data = path.read_bytes()
+    path.write_bytes(data + b"\x02\xff\xff\x00\x00partial")
+    rec = load_recording(str(path))
+    assert rec.truncated is True
+    assert len(rec.events) == 30
+
+
+def test_rejects_foreign_header_in_container(tmp_path: Path) -> None:
+    path = str(tmp_path / "x.bctl")
+    writer = ChunkedRecordWriter(path)
+    writer.write_header({"format": "something-else", "version": 2})
+    writer.close()
+    with pytest.raises(RecordingError, match="не запись bctl-record"):
+        load_recording(path)
+
+
+def test_reader_rejects_non_v2_file(tmp_path: Path) -> None:
+    path = tmp_path / "v1.jsonl"
+    path.write_text('{"format": "bctl-record", "version": 1}\n', encoding="utf-8")
+    assert not is_chunked_recording(str(path))
+    with pytest.raises(RecordingError, match="не v2-запись"):
+        ChunkedRecordReader(str(path))
+    assert MAGIC not in path.read_bytes()
+
+
+# --------------------------------------------------------------------------- #
+#  Recorder + v1 совместимость                                                 #
+# --------------------------------------------------------------------------- #
+
+
+def test_recorder_writes_chunked_version(tmp_path: Path) -> None:
+    path = str(tmp_path / "live.bctl")
+    drv = BackendDriver("127.0.0.1", 8765)
+    rec = Recorder(drv, path, version=VERSION_CHUNKED)
+    rec.start()
+    for v in range(20):
+        drv._emit_event(_state_push("processes.cam.state.fps", float(v)))
+    deadline = time.monotonic() + 2.0
+    while rec._events_written < 20 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    rec.stop()
+    loaded = load_recording(path)
+    assert loaded.header["version"] == VERSION_CHUNKED
+    assert len(loaded.events) == 20
+    assert loaded.footer is not None and loaded.footer["events_written"] == 20
+
+
+def test_recorder_rejects_unknown_version(tmp_path: Path) -> None:
+    with pytest.raises(RecordingError, match="неизвестная версия"):
+        Recorder(BackendDriver("127.0.0.1", 8765), str(tmp_path / "r"), version=7)
+
+
+def test_v1_window_folds_state_and_filters(tmp_path: Path) -> None:
+    path = str(tmp_path / "v1.jsonl")
+    drv = BackendDriver("127.0.0.1", 8765)
+    rec = Recorder(drv, path)
+    rec.start()
+    for v in range(5):
+        drv._emit_event(_state_push("processes.cam.state.fps", float(v)))
+    deadline = time.monotonic() + 2.0
+    while rec._events_written < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    rec.stop()
+    full = load_recording(path)
+    cut = full.events[3]["ts"]
+    windowed = load_recording(path, start_ts=cut)
+    assert [e["seq"] for e in windowed.events] == [e["seq"] for e in full.events if e["ts"] >= cut]
+    assert windowed.window is not None and windowed.window["folded"] == 5 - len(windowed.events)
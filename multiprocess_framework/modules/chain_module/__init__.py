@@ -20,11 +20,15 @@
         ChainRunnable       — последовательная цепочка
         DagRunnable         — DAG с ветвлениями/слияниями
         ParallelChainRunnable — параллельные бандлы через ChainThreadPool
+        RegionParallelRunnable — регионы кадра параллельно (срезы-view) + склейка на место
+        RegionBranch        — ветвь региона: rect + под-цепочка + on_error
+        StealingDagRunnable — DAG без barrier'ов: нода в пул по готовности входов
         IRunnableChain      — Protocol для всех исполнителей
 
     Thread pool:
         ChainThreadPool     — пул параллельных бандлов (фасад над worker_module)
         WorkerPoolExecutor  — примитив пула поверх worker_module (N LOOP-воркеров)
+        WorkStealingPool    — per-worker деки + work stealing + affinity (для StealingDagRunnable)
 
     Graph utilities:
         topological_sort    — алгоритм Кана (Kahn's)
@@ -58,8 +62,11 @@ from .core import (
     IRunnableChain,
     DagRunnable,
     ParallelChainRunnable,
+    RegionBranch,
+    RegionParallelRunnable,
+    StealingDagRunnable,
 )
-from .thread_pool import ChainThreadPool, WorkerPoolExecutor
+from .thread_pool import ChainThreadPool, WorkerPoolExecutor, WorkStealingPool
 from .graph import topological_sort, is_nonlinear_graph, detect_parallel_bundles
 from .worker_pool import WorkerTaskRequest, WorkerTaskResponse, WorkerPoolDispatcher
 from .metrics import LatencyTracker
@@ -83,9 +90,13 @@ __all__ = [
     "IRunnableChain",
     "DagRunnable",
     "ParallelChainRunnable",
+    "RegionBranch",
+    "RegionParallelRunnable",
+    "StealingDagRunnable",
     # Thread pool
     "ChainThreadPool",
     "WorkerPoolExecutor",
+    "WorkStealingPool",
     # Graph
     "topological_sort",
     "is_nonlinear_graph",
@@ -6,6 +6,8 @@ from .error_policy import apply_on_error_policy
 from .chain import ChainRunnable, IRunnableChain
 from .dag import DagRunnable
 from .parallel import ParallelChainRunnable
+from .regions import RegionBranch, RegionParallelRunnable
+from .stealing import StealingDagRunnable
 
 __all__ = [
     "ChainContext",
@@ -16,4 +18,7 @@ __all__ = [
     "IRunnableChain",
     "DagRunnable",
     "ParallelChainRunnable",
+    "RegionBranch",
+    "RegionParallelRunnable",
+    "StealingDagRunnable",
 ]
@@ -0,0 +1,296 @@
+"""RegionParallelRunnable — параллельные под-цепочки регионов одного кадра.
+
+Intra-process аналог связки ``region_split → обработка → stitcher``: вместо
+нарезки кадра на копии и пересылки каждой через SHM/InspectorManager регионы
+исполняются на ``ChainThreadPool`` внутри процесса:
+
+- каждая ветвь получает **срез-view** исходного кадра (``frame[y1:y2, x1:x2]``,
+  без копии) с ``writeable=False`` — ветви читают общий буфер конкурентно, запись
+  в чужой (и свой) вход ловится numpy/cv2 сразу, а не портит соседний регион;
+- выход ветви пишется **на место** в canvas (порядок ветвей = порядок наложения,
+  как у stitcher: первой — фон/default-регион, остальные поверх);
+- canvas — новый буфер (источник копируется, только если первая ветвь не
+  покрывает кадр целиком) или сам входной кадр при ``in_place=True``;
+- латентность каждой ветви (чистое исполнение под-цепочки, perf_counter) —
+  в ``ChainResult.branches``: ``[{"branch": name, "ms": float, "failed": bool}]``.
+
+Ошибки: исключение/timeout ветви — ``apply_on_error_policy`` с ``on_error``
+ветви; упавшая ветвь (в т.ч. ``fail_level="region"`` самой под-цепочки) в canvas
+не пишется — в её прямоугольнике остаётся то, что под ней (источник или ветви
+ниже), остальные регионы склеиваются как обычно. ``fail_camera`` проставляет ``failed``/``fail_level`` всего результата.
+
+Ветвь, истёкшая по timeout, продолжает исполняться в пуле (поток не прервать).
+Пока её задача жива, ветвь на следующих кадрах пропускается с warning (её
+под-цепочка/плагин не исполняются на двух потоках сразу), а склейка идёт в
+новый canvas даже при ``in_place=True`` — живая ветвь ещё читает свой view.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from .context import ChainContext
+from .error_policy import apply_on_error_policy
+from .result import ChainResult, RunnableStep
+
+Box = tuple[int, int, int, int]  # x1, y1, x2, y2 — уже склампленные к кадру
+
+_BUSY = object()  # outcome ветви, чья прошлая задача ещё исполняется в пуле
+
+
+@dataclass
+class RegionBranch:
+    """Ветвь региона: прямоугольник кадра + своя под-цепочка.
+
+    ``rect`` — ``(x, y, width, height)`` в координатах кадра; клампится к его
+    границам на каждом кадре (регион целиком вне кадра — ветвь пропускается).
+    ``chain`` — любой ``IRunnableChain``: ``execute(view, metadata) → ChainResult``,
+    где ``ChainResult.frame`` — выход региона того же shape, что и view.
+    """
+
+    name: str
+    rect: tuple[int, int, int, int]
+    chain: Any  # IRunnableChain
+    on_error: str = "fail_region"
+
+
+@dataclass
+class RegionNode:
+    """Дескриптор ноды ветви (``IStepNode``) — для on_error-политики и логов пула."""
+
+    node_id: str
+    operation_ref: str
+    inputs: list = field(default_factory=list)
+
+
+class _RegionOperation:
+    """``IExecutionStep`` ветви: прогон под-цепочки + замер её латентности."""
+
+    def __init__(self, branch: RegionBranch) -> None:
+        self._branch = branch
+
+    def execute(self, data: Any, context: Any) -> tuple[ChainResult, float]:
+        view, metadata = data
+        t0 = time.perf_counter()
+        result = self._branch.chain.execute(view, metadata)
+        return result, (time.perf_counter() - t0) * 1000.0
+
+    def configure(self, params: dict) -> None:
+        return None
+
+
+def _clamp(rect: tuple[int, int, int, int], width: int, height: int) -> Box | None:
+    x, y, w, h = (int(v) for v in rect)
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(width, x + w), min(height, y + h)
+    if x2 <= x1 or y2 <= y1:
+        return None
+    return x1, y1, x2, y2
+
+
+class RegionParallelRunnable:
+    """Регионы кадра параллельно на ``ChainThreadPool`` + склейка на место.
+
+    Args:
+        branches: Ветви в порядке наложения (первая — фон).
+        pool: ``ChainThreadPool`` (или совместимый ``submit``/``collect_results``).
+        in_place: Склеивать прямо во входной кадр (без canvas-буфера). Только
+            если кадр принадлежит вызывающему (не SHM-view чужого кольца).
+            Ветвь, вернувшая свой же view, при этом не копируется вовсе.
+        timeout: Общий бюджет ожидания ветвей (секунды); None — ``pool.step_timeout``.
+    """
+
+    def __init__(
+        self,
+        branches: list[RegionBranch],
+        pool: Any,  # ChainThreadPool — через Any, как в ParallelChainRunnable
+        in_place: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        self._branches = branches
+        self._pool = pool
+        self._in_place = in_place
+        self._timeout = timeout
+        self._inflight: dict[str, Any] = {}  # имя ветви → handle задачи пула, истёкшей по timeout
+        self._steps = [
+            RunnableStep(
+                node=RegionNode(node_id=b.name, operation_ref=f"region:{b.name}"),
+                operation=_RegionOperation(b),
+                on_error=b.on_error,
+            )
+            for b in branches
+        ]
+
+    @property
+    def branches(self) -> list[RegionBranch]:
+        return list(self._branches)
+
+    def execute(
+        self,
+        frame: np.ndarray,
+        metadata: dict[str, Any] | None = None,
+    ) -> ChainResult:
+        """Исполнить ветви регионов параллельно и склеить выходы в один кадр.
+
+        Args:
+            frame: Исходный кадр (H, W[, C]); ветви получают его read-only срезы.
+            metadata: Метаданные кадра. Каждая ветвь получает их копию с
+                ``region_id``/``region_name`` и ``original_x/y/width/height``.
+
+        Returns:
+            ChainResult: ``frame`` — склеенный canvas, детекции/маски/контуры и
+            warnings/errors ветвей, ``branches`` — латентность каждой ветви.
+        """
+        metadata = metadata or {}
+        context = ChainContext(
+            camera_id=metadata.get("camera_id", ""),
+            region_id=metadata.get("region_id", ""),
+            seq_id=metadata.get("seq_id", 0),
+        )
+        result = ChainResult(frame=frame, context=context)
+        t_start = time.perf_counter()
+
+        height, width = frame.shape[:2]
+        jobs: list[tuple[RunnableStep, Box, np.ndarray]] = []
+        for branch, step in zip(self._branches, self._steps):
+            box = _clamp(branch.rect, width, height)
+            if box is None:
+                context.warnings.append(f"Регион '{branch.name}' вне кадра {width}x{height} — пропущен")
+                continue
+            x1, y1, x2, y2 = box
+            view = frame[y1:y2, x1:x2]
+            view.flags.writeable = False  # флаг только этого view — источник не трогаем
+            jobs.append((step, box, view))
+
+        if not jobs:
+            result.processing_time = time.perf_counter() - t_start
+            return result
+
+        payloads = [
+            (
+                view,
+                {
+                    **metadata,
+                    "region_id": step.node.node_id,
+                    "region_name": step.node.node_id,
+                    "original_x": box[0],
+                    "original_y": box[1],
+                    "original_width": box[2] - box[0],
+                    "original_height": box[3] - box[1],
+                },
+            )
+            for step, box, view in jobs
+        ]
+        steps = [step for step, _, _ in jobs]
+        busy = self._busy_branches()
+        if len(jobs) == 1 and not busy:
+            # Одна ветвь — без overhead пула (как одиночный шаг ParallelChainRunnable).
+            try:
+                outcomes: list[tuple[Any, Any]] = [(steps[0], steps[0].operation.execute(payloads[0], context))]
+            except Exception as exc:  # noqa: BLE001 — политика ошибок ниже, как для ветвей пула
+                outcomes = [(steps[0], exc)]
+        else:
+            outcomes = self._run_on_pool(steps, payloads, busy, context)
+
+        alive = bool(self._busy_branches())
+        result.frame = self._join(frame, jobs, outcomes, context, result, in_place=self._in_place and not alive)
+        result.processing_time = time.perf_counter() - t_start
+        return result
+
+    def _busy_branches(self) -> set[str]:
+        """Ветви, чья истёкшая по timeout задача ещё исполняется в пуле."""
+        for name in [n for n, handle in self._inflight.items() if handle.done()]:
+            del self._inflight[name]
+        return set(self._inflight)
+
+    def _run_on_pool(
+        self,
+        steps: list[RunnableStep],
+        payloads: list[tuple[np.ndarray, dict[str, Any]]],
+        busy: set[str],
+        context: ChainContext,
+    ) -> list[tuple[Any, Any]]:
+        """Отправить свободные ветви в пул; занятые — ``_BUSY`` без повторного submit."""
+        outcomes: list[tuple[Any, Any]] = [(step, _BUSY) for step in steps]
+        submitted: list[tuple[int, Any]] = []
+        for index, (step, payload) in enumerate(zip(steps, payloads)):
+            name = step.node.node_id
+            if name in busy:
+                context.warnings.append(f"Регион '{name}': прошлый прогон ещё исполняется (timeout) — пропущен")
+                continue
+            submitted.append((index, self._pool.submit(step.operation, payload, context)))
+        if submitted:
+            collected = self._pool.collect_results(
+                [handle for _, handle in submitted], [steps[i] for i, _ in submitted], timeout=self._timeout
+            )
+            for (index, handle), outcome in zip(submitted, collected):
+                outcomes[index] = outcome
+                if not handle.done():
+                    self._inflight[steps[index].node.node_id] = handle
+        return outcomes
+
+    def _join(
+        self,
+        frame: np.ndarray,
+        jobs: list[tuple[RunnableStep, Box, np.ndarray]],
+        outcomes: list[tuple[Any, Any]],
+        context: ChainContext,
+        result: ChainResult,
+        in_place: bool,
+    ) -> np.ndarray:
+        """Склеить выходы ветвей в canvas в порядке ветвей (первая — фон).
+
+        ``in_place=False`` при живой ветви пула — запись во ``frame`` испортила бы её вход.
+        """
+        # Первая ветвь покрывает кадр — копия источника не нужна, canvas заполнит она
+        # (а упадёт — вернём источник в её прямоугольник).
+        covering = jobs[0][1] == (0, 0, frame.shape[1], frame.shape[0])
+        if in_place:
+            canvas = frame
+        elif covering:
+            canvas = np.empty_like(frame)
+        else:
+            canvas = frame.copy()
+        backfill = covering and canvas is not frame
+
+        for index, ((step, (x1, y1, x2, y2), view), (_, outcome)) in enumerate(zip(jobs, outcomes)):
+            name = step.node.node_id
+            ok = False
+            ms = 0.0
+            if outcome is _BUSY:
+                pass  # warning уже в context, ветвь не исполнялась — в её прямоугольнике источник
+            elif isinstance(outcome, BaseException):
+                if isinstance(outcome, TimeoutError):
+                    context.timeouts.append(name)
+                apply_on_error_policy(step, outcome, context, result)
+            else:
+                sub, ms = outcome
+                result.detections.extend(sub.detections)
+                result.masks.extend(sub.masks)
+                result.contours.extend(sub.contours)
+                context.warnings.extend(sub.context.warnings)
+                context.errors.extend(sub.context.errors)
+                context.timeouts.extend(sub.context.timeouts)
+                result.skipped_nodes.extend(f"{name}/{node}" for node in sub.skipped_nodes)
+                out = sub.frame
+                if sub.failed:
+                    if sub.fail_level == "camera":
+                        result.failed, result.fail_level = True, "camera"
+                elif not isinstance(out, np.ndarray) or out.shape != view.shape:
+                    got = getattr(out, "shape", type(out).__name__)
+                    context.warnings.append(f"Регион '{name}': выход {got} ≠ {view.shape} — оставлен источник")
+                else:
+                    ok = True
+                    if out is not view or canvas is not frame:
+                        canvas[y1:y2, x1:x2] = out
+            if not ok and backfill and index == 0:
+                canvas[y1:y2, x1:x2] = view
+            result.branches.append({"branch": name, "ms": round(ms, 3), "failed": not ok})
+        return canvas
+
+
+__all__ = ["RegionBranch", "RegionNode", "RegionParallelRunnable"]
@@ -27,6 +27,12 @@ class ChainResult:
     skipped_nodes: list[str] = field(default_factory=list)
     failed: bool = False
     fail_level: str | None = None  # "region" | "camera" | None
+    # Сводка по ветвям fan-out исполнителя (RegionParallelRunnable):
+    # [{"branch": name, "ms": float, "failed": bool}]. Пусто у остальных.
+    branches: list[dict] = field(default_factory=list)
+    # Тайминги нод планировщика (StealingDagRunnable):
+    # {node_id: {"wait_ms", "exec_ms", "worker", "stolen"}}. Пусто у остальных.
+    node_timings: dict[str, dict] = field(default_factory=dict)
 
 
 @dataclass
@@ -0,0 +1,227 @@
+"""StealingDagRunnable — DAG без barrier'ов уровней на ``WorkStealingPool``.
+
+``ParallelChainRunnable`` исполняет бандлы-уровни с barrier: уровень ждёт самый
+медленный свой шаг, латентность кадра = сумма максимумов уровней. Здесь нода
+уходит в пул, как только готовы ЕЁ входы (счётчик незавершённых родителей
+обнулился) — широкий DAG (несколько детекторов по одному кадру) упирается в
+critical path, а не в сумму уровней.
+
+Семантика данных — как у ``DagRunnable``: порты (``port_data``), виртуальный
+источник ``"frame"``, ``execute_dag``/legacy ``execute``, выход — выход
+последнего шага списка. Планирование:
+
+- affinity: ``IStepNodeWithWorker.worker_id`` → фиксированный воркер пула
+  (разные worker_id — по кругу по воркерам; нода исполняется только им);
+- остальные ноды — в дек воркера, исполнившего родителя (вход горячий в кэше),
+  свободные воркеры крадут;
+- завершения принимает вызывающий поток (одна очередь, без опроса) — граф
+  зависимостей и ``port_data`` меняет только он, локов нет;
+- тайминги каждой ноды — ``ChainResult.node_timings``:
+  ``{node_id: {"wait_ms", "exec_ms", "worker", "stolen"}}``.
+
+Ошибки — ``apply_on_error_policy``: ``skip`` — выход ноды пуст, потомки
+исполняются (входы ``None``, как в ``DagRunnable``); ``fail_*`` — новые ноды не
+выпускаются, ещё не начатые снимаются из деков, начатые дорабатывают. Нет ни
+одного завершения за ``step_timeout`` — все исполняющиеся ноды → timeout.
+"""
+
+from __future__ import annotations
+
+import queue
+import time
+from typing import Any
+
+import numpy as np
+
+from .context import ChainContext
+from .dag import _execute_dag_default
+from .error_policy import apply_on_error_policy
+from .result import ChainResult, RunnableStep, _collect_side_results, _is_cross_process
+
+_FRAME_SOURCE = "frame"
+
+
+class _NodeOperation:
+    """``IExecutionStep`` ноды: входы портов → выходы портов (в т.ч. cross-process)."""
+
+    def __init__(self, step: RunnableStep) -> None:
+        self.step = step
+
+    def execute(self, data: Any, context: Any) -> tuple[dict[str, Any], list[dict]]:
+        inputs, frame, metadata = data
+        step = self.step
+        if _is_cross_process(step):
+            response = step.execute_remote(
+                frame=inputs.get("in", frame),
+                context=context,
+                input_shm_name=metadata.get("input_shm_name", ""),
+                input_shm_index=metadata.get("input_shm_index", 0),
+            )
+            return {"out": inputs.get("in", frame)}, list(getattr(response, "detections", None) or [])
+        return _execute_dag_default(step.operation, inputs, context), []
+
+    def configure(self, params: dict) -> None:
+        return None
+
+
+class StealingDagRunnable:
+    """Исполняемый DAG с выпуском нод по готовности входов (work-stealing пул).
+
+    Args:
+        steps: Шаги в топологическом порядке; выход DAG — выход последнего.
+        pool: ``WorkStealingPool``.
+        node_inputs: Карта входов ``{node_id: [conn, ...]}``; None — ``step.node.inputs``.
+        step_timeout: Максимум без единого завершения ноды (секунды); None — ``pool.step_timeout``.
+    """
+
+    def __init__(
+        self,
+        steps: list[RunnableStep],
+        pool: Any,  # WorkStealingPool
+        node_inputs: dict[str, list[Any]] | None = None,
+        step_timeout: float | None = None,
+    ) -> None:
+        self._steps = steps
+        self._pool = pool
+        self._step_timeout = step_timeout if step_timeout is not None else pool.step_timeout
+        self._ops = {step.node.node_id: _NodeOperation(step) for step in steps}
+        if node_inputs is None:
+            node_inputs = {step.node.node_id: list(step.node.inputs) for step in steps}
+        self._inputs: dict[str, list[Any]] = {nid: list(node_inputs.get(nid, [])) for nid in self._ops}
+        active = set(self._ops)
+        self._parents: dict[str, set[str]] = {
+            nid: {conn.source for conn in conns if conn.source in active and conn.source != nid}
+            for nid, conns in self._inputs.items()
+        }
+        self._children: dict[str, list[str]] = {nid: [] for nid in self._ops}
+        for nid, parents in self._parents.items():
+            for parent in parents:
+                self._children[parent].append(nid)
+        # worker_id → индекс воркера: стабильно (sorted), по кругу по пулу.
+        worker_ids = sorted({wid for step in steps if (wid := getattr(step.node, "worker_id", None)) is not None})
+        slots = {wid: i % pool.max_workers for i, wid in enumerate(worker_ids)}
+        self._affinity: dict[str, int | None] = {
+            step.node.node_id: slots.get(getattr(step.node, "worker_id", None)) for step in steps
+        }
+
+    @property
+    def steps(self) -> list[RunnableStep]:
+        return list(self._steps)
+
+    def execute(
+        self,
+        frame: np.ndarray,
+        metadata: dict[str, Any] | None = None,
+    ) -> ChainResult:
+        """Исполнить DAG: ноды уходят в пул по готовности своих входов.
+
+        Args:
+            frame: Входной кадр (источник ``"frame"`` и вход нод без входов).
+            metadata: Метаданные — camera_id, region_id, seq_id и т.д.
+
+        Returns:
+            ChainResult с выходом последнего шага, детекциями, диагностикой и
+            ``node_timings`` (ожидание в деке / исполнение каждой ноды).
+        """
+        metadata = metadata or {}
+        context = ChainContext(
+            camera_id=metadata.get("camera_id", ""),
+            region_id=metadata.get("region_id", ""),
+            seq_id=metadata.get("seq_id", 0),
+        )
+        result = ChainResult(frame=frame, context=context)
+        t_start = time.perf_counter()
+        if not self._steps:
+            return result
+
+        port_data: dict[str, dict[str, Any]] = {_FRAME_SOURCE: {"out": frame}}
+        pending = {nid: len(parents) for nid, parents in self._parents.items()}
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        in_flight: dict[Any, str] = {}  # StealTask → node_id
+        stopped = False
+
+        def release(node_id: str, hint: int | None) -> None:
+            inputs = self._gather(node_id, port_data, frame)
+            task = self._pool.submit(
+                self._ops[node_id],
+                (inputs, frame, metadata),
+                context,
+                affinity=self._affinity[node_id],
+                hint=hint,
+                on_done=done.put,
+            )
+            in_flight[task] = node_id
+
+        for node_id, count in pending.items():
+            if count == 0:
+                release(node_id, None)
+
+        while in_flight:
+            try:
+                task = done.get(timeout=self._step_timeout)
+            except queue.Empty:
+                self._expire(in_flight, context, result)
+                break
+            node_id = in_flight.pop(task)
+            step = self._ops[node_id].step
+            result.node_timings[node_id] = {
+                "wait_ms": round(task.wait_ms, 3),
+                "exec_ms": round(task.exec_ms, 3),
+                "worker": task.worker,
+                "stolen": task.stolen,
+            }
+            if task.error is not None:
+                port_data[node_id] = {}
+                if apply_on_error_policy(step, task.error, context, result, node_id=node_id):
+                    stopped = True
+                    for queued in [t for t in in_flight if self._pool.cancel(t)]:
+                        in_flight.pop(queued)
+            else:
+                outputs, detections = task.value
+                port_data[node_id] = outputs
+                result.detections.extend(detections)
+                _collect_side_results(step.operation, result)
+            if stopped:
+                continue
+            for child in self._children[node_id]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    release(child, task.worker)
+
+        final = port_data.get(self._steps[-1].node.node_id)
+        if final:
+            if final.get("out") is not None:
+                result.frame = final["out"]
+            else:
+                result.frame = next((v for v in final.values() if isinstance(v, np.ndarray)), result.frame)
+        result.processing_time = time.perf_counter() - t_start
+        return result
+
+    def _gather(self, node_id: str, port_data: dict[str, dict[str, Any]], frame: Any) -> dict[str, Any]:
+        """Входы ноды из ``port_data`` (как ``DagRunnable``: нет входов — кадр в ``in``)."""
+        conns = self._inputs[node_id]
+        if not conns:
+            return {"in": frame}
+        inputs: dict[str, Any] = {}
+        for conn in conns:
+            source = port_data.get(conn.source)
+            inputs[conn.input_port] = source.get(conn.output_port) if source is not None else None
+        return inputs
+
+    def _expire(self, in_flight: dict[Any, str], context: ChainContext, result: ChainResult) -> None:
+        """Нет прогресса за ``step_timeout``: снять не начатые, исполняющиеся — в timeouts."""
+        for task, node_id in in_flight.items():
+            if self._pool.cancel(task):
+                continue
+            step = self._ops[node_id].step
+            context.timeouts.append(node_id)
+            apply_on_error_policy(
+                step,
+                TimeoutError(f"Timeout {self._step_timeout}s для {step.node.operation_ref}"),
+                context,
+                result,
+                node_id=node_id,
+            )
+
+
+__all__ = ["StealingDagRunnable"]
@@ -0,0 +1,220 @@
+"""Тесты RegionParallelRunnable — регионы кадра параллельно + склейка на место."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from multiprocess_framework.modules.chain_module import (
+    ChainRunnable,
+    ChainThreadPool,
+    RegionBranch,
+    RegionParallelRunnable,
+)
+
+from .conftest import BrightenOperation, FailingOperation, SlowOp, make_step
+
+
+@pytest.fixture
+def pool():
+    p = ChainThreadPool(max_workers=3, step_timeout=2.0)
+    yield p
+    p.shutdown()
+
+
+@pytest.fixture
+def source() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 200, (60, 80, 3), dtype=np.uint8)
+
+
+def _branch(name, rect, *ops, on_error="fail_region", step_on_error="fail_region"):
+    steps = [make_step(f"{name}_{i}", op, on_error=step_on_error) for i, op in enumerate(ops)]
+    return RegionBranch(name=name, rect=rect, chain=ChainRunnable(steps), on_error=on_error)
+
+
+class _Barrier:
+    """Операция-барьер: проходит, только когда все ветви вошли (доказательство параллельности)."""
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = threading.Barrier(parties, timeout=2.0)
+        self.seen: list[np.ndarray] = []
+
+    def execute(self, data, context):
+        self.seen.append(data)
+        self._barrier.wait()
+        return data
+
+    def configure(self, params):
+        pass
+
+
+class TestRegionParallel:
+    def test_matches_stitched_sequential_result(self, pool, source):
+        runner = RegionParallelRunnable(
+            [
+                _branch("default", (0, 0, 80, 60), BrightenOperation(1)),
+                _branch("left", (5, 5, 30, 20), BrightenOperation(20)),
+                _branch("right", (40, 30, 60, 60), BrightenOperation(40)),  # клампится к кадру
+            ],
+            pool,
+        )
+        result = runner.execute(source, {"camera_id": "cam0", "seq_id": 7})
+
+        expected = np.clip(source.astype(int) + 1, 0, 255).astype(np.uint8)
+        expected[5:25, 5:35] = np.clip(source[5:25, 5:35].astype(int) + 20, 0, 255)
+        expected[30:60, 40:80] = np.clip(source[30:60, 40:80].astype(int) + 40, 0, 255)
+        np.testing.assert_array_equal(result.frame, expected)
+        assert result.frame is not source
+        assert not result.failed
+        assert [b["branch"] for b in result.branches] == ["default", "left", "right"]
+        assert all(b["ms"] >= 0 and not b["failed"] for b in result.branches)
+
+    def test_branches_run_concurrently_on_zero_copy_views(self, pool, source):
+        barrier = _Barrier(3)
+        runner = RegionParallelRunnable(
+            [_branch(f"r{i}", (i * 20, 0, 20, 20), barrier) for i in range(3)],
+            pool,
+        )
+        result = runner.execute(source)
+
+        assert not result.failed, result.context.errors
+        for view in barrier.seen:
+            assert np.shares_memory(view, source)
+            assert not view.flags.writeable
+        assert source.flags.writeable
+
+    def test_failed_region_keeps_source_pixels(self, pool, source):
+        runner = RegionParallelRunnable(
+            [
+                _branch("default", (0, 0, 80, 60), FailingOperation()),
+                _branch("roi", (10, 10, 20, 20), BrightenOperation(10)),
+            ],
+            pool,
+        )
+        result = runner.execute(source)
+
+        expected = source.copy()
+        expected[10:30, 10:30] = np.clip(source[10:30, 10:30].astype(int) + 10, 0, 255)
+        np.testing.assert_array_equal(result.frame, expected)
+        assert [b["failed"] for b in result.branches] == [True, False]
+        assert result.context.errors
+        assert not result.failed
+
+    def test_timeout_applies_branch_policy(self, source):
+        pool = ChainThreadPool(max_workers=2, step_timeout=0.2)
+        try:
+            runner = RegionParallelRunnable(
+                [
+                    _branch("fast", (0, 0, 10, 10), BrightenOperation(5)),
+                    RegionBranch("slow", (20, 20, 10, 10), ChainRunnable([make_step("s", SlowOp(1.0))]), "fail_camera"),
+                ],
+                pool,
+            )
+            result = runner.execute(source)
+        finally:
+            pool.shutdown(wait=False)
+
+        assert result.context.timeouts == ["slow"]
+        assert result.failed and result.fail_level == "camera"
+        np.testing.assert_array_equal(result.frame[20:30, 20:30], source[20:30, 20:30])
+
+    def test_timed_out_branch_is_not_resubmitted_while_alive(self, source):
+        gate = threading.Event()
+        calls: list[int] = []
+
+        class Gated:
+            def execute(self, data, context):
+                calls.append(1)
+                gate.wait(5.0)
+                return data
+
+            def configure(self, params):
+                pass
+
+        pool = ChainThreadPool(max_workers=2, step_timeout=0.1)
+        try:
+            runner = RegionParallelRunnable(
+                [_branch("fast", (0, 0, 10, 10), BrightenOperation(5)), _branch("hung", (20, 20, 10, 10), Gated())],
+                pool,
+            )
+            first = runner.execute(source)
+            second = runner.execute(source)
+            gate.set()
+            for _ in range(100):
+                if not runner._busy_branches():
+                    break
+                threading.Event().wait(0.01)
+            third = runner.execute(source)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+        assert first.context.timeouts == ["hung"]
+        assert any("hung" in w and "пропущен" in w for w in second.context.warnings)
+        assert [b["failed"] for b in second.branches] == [False, True]
+        np.testing.assert_array_equal(second.frame[20:30, 20:30], source[20:30, 20:30])
+        assert [b["failed"] for b in third.branches] == [False, False]
+        assert len(calls) == 2  # второй кадр не запустил ветвь параллельно зависшей
+
+    def test_in_place_falls_back_to_copy_while_branch_alive(self, source):
+        gate = threading.Event()
+
+        class Gated:
+            def execute(self, data, context):
+                gate.wait(5.0)
+                return data
+
+            def configure(self, params):
+                pass
+
+        original = source.copy()
+        pool = ChainThreadPool(max_workers=2, step_timeout=0.1)
+        try:
+            runner = RegionParallelRunnable(
+                [_branch("a", (0, 0, 40, 60), BrightenOperation(3)), _branch("hung", (40, 0, 40, 60), Gated())],
+                pool,
+                in_place=True,
+            )
+            result = runner.execute(source)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+        assert result.frame is not source
+        np.testing.assert_array_equal(source, original)  # живая ветвь читала неиспорченный вход
+        np.testing.assert_array_equal(result.frame[:, :40], np.clip(original[:, :40].astype(int) + 3, 0, 255))
+
+    def test_in_place_joins_into_source(self, pool, source):
+        original = source.copy()
+        runner = RegionParallelRunnable(
+            [_branch("a", (0, 0, 40, 60), BrightenOperation(3)), _branch("b", (40, 0, 40, 60))],
+            pool,
+            in_place=True,
+        )
+        result = runner.execute(source)
+
+        assert result.frame is source
+        np.testing.assert_array_equal(source[:, :40], np.clip(original[:, :40].astype(int) + 3, 0, 255))
+        np.testing.assert_array_equal(source[:, 40:], original[:, 40:])
+
+    def test_shape_mismatch_and_out_of_frame_are_warnings(self, pool, source):
+        class Shrink:
+            def execute(self, data, context):
+                return data[::2, ::2]
+
+            def configure(self, params):
+                pass
+
+        runner = RegionParallelRunnable(
+            [_branch("small", (0, 0, 20, 20), Shrink()), _branch("gone", (500, 500, 10, 10))],
+            pool,
+        )
+        result = runner.execute(source)
+
+        np.testing.assert_array_equal(result.frame, source)
+        assert [b["branch"] for b in result.branches] == ["small"]
+        assert any("gone" in w for w in result.context.warnings)
+        assert any("small" in w for w in result.context.warnings)
@@ -0,0 +1,222 @@
+"""Тесты WorkStealingPool + StealingDagRunnable — выпуск нод по готовности входов."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+
+from multiprocess_framework.modules.chain_module.core.dag import DagRunnable
+from multiprocess_framework.modules.chain_module.core.stealing import StealingDagRunnable
+from multiprocess_framework.modules.chain_module.thread_pool.stealing_pool import WorkStealingPool
+
+from .conftest import (
+    BrightenOperation,
+    DetectionOperation,
+    FailingOperation,
+    FakeConnection,
+    FakeNode,
+    PassthroughOperation,
+    RunnableStep,
+    SlowOp,
+)
+
+
+def dag_step(node_id: str, operation=None, on_error: str = "skip", inputs=None, worker_id=None) -> RunnableStep:
+    node = FakeNode(node_id=node_id, inputs=inputs or [], worker_id=worker_id)
+    return RunnableStep(node=node, operation=operation or PassthroughOperation(), on_error=on_error)
+
+
+class SumOperation:
+    """DAG-native операция: сумма входов ``a`` и ``b``."""
+
+    def execute_dag(self, inputs: dict[str, Any], context: Any) -> dict[str, Any]:
+        return {"out": (inputs["a"].astype(np.int32) + inputs["b"]).clip(0, 255).astype(np.uint8)}
+
+    def execute(self, data: Any, context: Any) -> Any:
+        return data
+
+    def configure(self, params: dict) -> None:
+        pass
+
+
+class ThreadRecorder:
+    """Запоминает поток, исполнивший операцию."""
+
+    def __init__(self) -> None:
+        self.threads: list[int] = []
+
+    def execute(self, data: Any, context: Any) -> Any:
+        self.threads.append(threading.get_ident())
+        return data
+
+    def configure(self, params: dict) -> None:
+        pass
+
+
+@pytest.fixture
+def pool():
+    p = WorkStealingPool(max_workers=2, step_timeout=5.0)
+    yield p
+    p.shutdown(wait=False)
+
+
+def diamond() -> list[RunnableStep]:
+    return [
+        dag_step("a", BrightenOperation(10)),
+        dag_step("b", BrightenOperation(5), inputs=[FakeConnection("a")]),
+        dag_step("c", BrightenOperation(7), inputs=[FakeConnection("a")]),
+        dag_step(
+            "sum",
+            SumOperation(),
+            inputs=[FakeConnection("b", input_port="a"), FakeConnection("c", input_port="b")],
+        ),
+    ]
+
+
+class TestStealingDagRunnable:
+    def test_matches_dag_runnable(self, pool, frame, metadata):
+        steps = diamond()
+        expected = DagRunnable(
+            steps=steps,
+            topology=[s.node.node_id for s in steps],
+            node_inputs={s.node.node_id: s.node.inputs for s in steps},
+        ).execute(frame, metadata)
+
+        result = StealingDagRunnable(steps, pool).execute(frame, metadata)
+
+        np.testing.assert_array_equal(result.frame, expected.frame)
+        assert result.frame.mean() == pytest.approx(32.0)
+        assert result.context.seq_id == 42
+        assert result.failed is False
+
+    def test_node_timings_for_every_node(self, pool, frame):
+        result = StealingDagRunnable(diamond(), pool).execute(frame)
+
+        assert set(result.node_timings) == {"a", "b", "c", "sum"}
+        for timing in result.node_timings.values():
+            assert timing["wait_ms"] >= 0.0 and timing["exec_ms"] >= 0.0
+            assert timing["worker"] in (0, 1)
+
+    def test_fast_node_not_held_by_slow_sibling(self, pool, frame):
+        # Уровень 1: slow (0.3 с) и fast; fast_child зависит только от fast.
+        # Barrier-исполнитель держал бы fast_child до конца slow.
+        steps = [
+            dag_step("slow", SlowOp(0.3)),
+            dag_step("fast", PassthroughOperation()),
+            dag_step("fast_child", PassthroughOperation(), inputs=[FakeConnection("fast")]),
+            dag_step("join", PassthroughOperation(), inputs=[FakeConnection("slow"), FakeConnection("fast_child")]),
+        ]
+        runnable = StealingDagRunnable(steps, pool)
+        t0 = time.perf_counter()
+        result = runnable.execute(frame)
+        elapsed = time.perf_counter() - t0
+
+        timings = result.node_timings
+        assert timings["fast_child"]["wait_ms"] < 150.0
+        assert timings["slow"]["exec_ms"] >= 250.0
+        assert elapsed < 0.6
+
+    def test_worker_id_pins_node_to_one_worker(self, frame):
+        recorder = ThreadRecorder()
+        steps = [dag_step("pinned", recorder, worker_id="gpu0")]
+        p = WorkStealingPool(max_workers=3, step_timeout=5.0)
+        try:
+            runnable = StealingDagRunnable(steps, p)
+            workers = {runnable.execute(frame).node_timings["pinned"]["worker"] for _ in range(10)}
+        finally:
+            p.shutdown(wait=False)
+
+        assert len(workers) == 1
+        assert len(set(recorder.threads)) == 1
+        assert p.stats()["pinned"] == 10
+
+    def test_idle_worker_steals_free_nodes(self, pool, frame):
+        # Все корни кладутся в дек воркера 0 — воркер 1 обязан красть.
+        steps = [dag_step(f"n{i}", SlowOp(0.02)) for i in range(6)]
+        original = pool.submit
+
+        def submit_to_zero(*args, **kwargs):
+            kwargs["hint"] = 0
+            return original(*args, **kwargs)
+
+        pool.submit = submit_to_zero
+        result = StealingDagRunnable(steps, pool).execute(frame)
+
+        assert {t["worker"] for t in result.node_timings.values()} == {0, 1}
+        assert any(t["stolen"] for t in result.node_timings.values())
+        assert pool.stats()["stolen"] >= 1
+
+    def test_detections_collected(self, pool, frame):
+        steps = [dag_step("det", DetectionOperation([{"box": [1, 2, 3, 4]}]))]
+        result = StealingDagRunnable(steps, pool).execute(frame)
+        assert result.detections == [{"box": [1, 2, 3, 4]}]
+
+    def test_empty_steps(self, pool, frame):
+        result = StealingDagRunnable([], pool).execute(frame)
+        np.testing.assert_array_equal(result.frame, frame)
+        assert result.node_timings == {}
+
+
+class TestStealingDagOnError:
+    def test_skip_runs_children(self, pool, frame):
+        steps = [
+            dag_step("bad", FailingOperation(), on_error="skip"),
+            dag_step("other", BrightenOperation(5)),
+        ]
+        result = StealingDagRunnable(steps, pool).execute(frame)
+
+        assert result.skipped_nodes == ["bad"]
+        assert result.frame.mean() == pytest.approx(5.0)
+        assert result.failed is False
+
+    def test_fail_chain_stops_descendants(self, pool, frame):
+        child = ThreadRecorder()
+        steps = [
+            dag_step("bad", FailingOperation(), on_error="fail_region"),
+            dag_step("child", child, inputs=[FakeConnection("bad")]),
+        ]
+        result = StealingDagRunnable(steps, pool).execute(frame)
+
+        assert result.failed is True
+        assert child.threads == []
+        assert "child" not in result.node_timings
+
+    def test_timeout_without_progress(self, frame):
+        p = WorkStealingPool(max_workers=1, step_timeout=0.1)
+        try:
+            steps = [dag_step("hang", SlowOp(0.5), on_error="fail_region")]
+            result = StealingDagRunnable(steps, p).execute(frame)
+        finally:
+            p.shutdown(wait=False)
+
+        assert result.context.timeouts == ["hang"]
+        assert result.failed is True
+
+
+class TestWorkStealingPool:
+    def test_cancel_only_queued(self):
+        p = WorkStealingPool(max_workers=1, step_timeout=5.0)
+        try:
+            running = p.submit(SlowOp(0.2), None, None)
+            time.sleep(0.05)  # воркер взял running; дек владельца — LIFO
+            queued = p.submit(PassthroughOperation(), "x", None)
+            assert p.cancel(queued) is True
+            assert p.cancel(running) is False
+            assert running.result(timeout=2.0) is None
+        finally:
+            p.shutdown(wait=False)
+
+    def test_result_raises_operation_error(self, pool):
+        task = pool.submit(FailingOperation(), None, None)
+        with pytest.raises(RuntimeError, match="намеренная ошибка"):
+            task.result(timeout=2.0)
+
+    def test_submit_after_shutdown_raises(self):
+        p = WorkStealingPool(max_workers=1)
+        p.shutdown(wait=True)
+        with pytest.raises(RuntimeError):
+            p.submit(PassthroughOperation(), None, None)
@@ -1,6 +1,7 @@
 """thread_pool — пул параллельного исполнения шагов поверх worker_module."""
 
 from .pool import ChainThreadPool
+from .stealing_pool import StealTask, WorkStealingPool
 from .worker_pool_executor import WorkerPoolExecutor
 
-__all__ = ["ChainThreadPool", "WorkerPoolExecutor"]
+__all__ = ["ChainThreadPool", "StealTask", "WorkStealingPool", "WorkerPoolExecutor"]
@@ -0,0 +1,328 @@
+"""WorkStealingPool — пул с per-worker деками и work stealing поверх worker_module.
+
+Планировщик для ``StealingDagRunnable`` (ADR-CHN-011). В отличие от
+``WorkerPoolExecutor`` (одна общая ``queue.Queue``) у каждого воркера свои деки:
+
+- **pinned** — задачи с affinity (``IStepNodeWithWorker.worker_id`` → индекс
+  воркера): исполняет только владелец, украсть нельзя;
+- **free** — остальные. Задача кладётся в дек воркера-подсказки (``hint`` —
+  обычно воркер, исполнивший родителя: вход ноды ещё горячий в его кэше).
+  Владелец берёт СВЕЖУЮ (LIFO — локальность), вор — САМУЮ СТАРУЮ (FIFO —
+  дольше всех ждёт, ближе к critical path).
+
+Порядок выбора воркера: свой pinned → свой free → кража у соседей по кругу.
+Нечего брать — ждёт на своём ``Condition`` (общий лок пула), submit будит
+владельца дека, а для free-задачи — ещё и одного простаивающего вора.
+
+Один лок на пул, а не lock-free деки: под GIL честный Chase–Lev выигрыша не
+даёт, а критическая секция — пара операций над ``deque``. Воркеры — LOOP-воркеры
+``WorkerManager`` (ADR-CHN-009: своего поток-пула из stdlib в chain_module нет).
+
+``cpus`` (опционально) — закрепить воркер i за ядром ``cpus[i % len(cpus)]``
+(``os.sched_setaffinity(0, ...)`` на Linux действует на вызывающий ПОТОК): pinned-
+ноды всегда на одном ядре, его кэш переиспользуется кадр за кадром. Обычно —
+ядра из ``placement.cpus`` процесса.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable
+
+from ...base_manager import BaseManager, ObservableMixin
+from ...worker_module import ExecutionMode, IWorkerManager, ThreadConfig, WorkerManager
+
+
+class StealTask:
+    """Задача пула: операция + payload + тайминги постановки/старта/конца.
+
+    ``on_done(task)`` вызывается воркером после исполнения (успех или
+    исключение) — через него ``StealingDagRunnable`` узнаёт о готовности ноды без
+    опроса. ``result(timeout)`` — для ожидания одной задачи напрямую.
+    """
+
+    __slots__ = (
+        "_operation",
+        "_payload",
+        "_context",
+        "_on_done",
+        "_event",
+        "value",
+        "error",
+        "affinity",
+        "worker",
+        "stolen",
+        "submitted",
+        "started",
+        "finished",
+        "_state",
+    )
+
+    def __init__(
+        self,
+        operation: Any,
+        payload: Any,
+        context: Any,
+        affinity: int | None,
+        on_done: Callable[[StealTask], None] | None,
+    ) -> None:
+        self._operation = operation
+        self._payload = payload
+        self._context = context
+        self._on_done = on_done
+        self._event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        self.affinity = affinity
+        self.worker = -1
+        self.stolen = False
+        self.submitted = time.perf_counter()
+        self.started = 0.0
+        self.finished = 0.0
+        self._state = "queued"  # queued → running → done | cancelled (переходы под локом пула)
+
+    @property
+    def wait_ms(self) -> float:
+        """Ожидание в деке: от постановки до старта исполнения."""
+        return (self.started - self.submitted) * 1000.0 if self.started else 0.0
+
+    @property
+    def exec_ms(self) -> float:
+        """Чистое время исполнения операции."""
+        return (self.finished - self.started) * 1000.0 if self.finished else 0.0
+
+    def _run(self) -> None:
+        """Исполнить операцию (воркер пула). Исключение — в ``error``, как у ``_PoolTask`` (H2)."""
+        self.started = time.perf_counter()
+        try:
+            self.value = self._operation.execute(self._payload, self._context)
+        except BaseException as exc:  # noqa: BLE001 — политика ошибок решается вызывающим
+            self.error = exc
+        finally:
+            self.finished = time.perf_counter()
+            self._state = "done"
+            self._event.set()
+            if self._on_done is not None:
+                self._on_done(self)
+
+    def result(self, timeout: float | None = None) -> Any:
+        """Дождаться результата. ``TimeoutError`` при истечении, иначе значение/исключение."""
+        if not self._event.wait(timeout):
+            raise TimeoutError(f"Task did not complete within {timeout}s")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class WorkStealingPool(BaseManager, ObservableMixin):
+    """Пул LOOP-воркеров с per-worker деками, affinity и work stealing.
+
+    Args:
+        max_workers: Количество воркеров (и пар деков).
+        step_timeout: Бюджет ожидания прогресса исполнителя (секунды).
+        logger: LoggerManager или ObservableMixin-совместимый объект.
+        worker_manager: Внешний WorkerManager (None → собственный).
+        cpus: Ядра для закрепления воркеров (None — без закрепления).
+        manager_name: Имя менеджера (для именования потоков/логов).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        step_timeout: float = 10.0,
+        logger: Any = None,
+        worker_manager: IWorkerManager | None = None,
+        cpus: list[int] | None = None,
+        manager_name: str = "WorkStealingPool",
+    ) -> None:
+        BaseManager.__init__(self, manager_name=manager_name)
+        ObservableMixin.__init__(self, managers={"logger": logger})
+
+        self._max_workers = max(1, max_workers)
+        self._step_timeout = step_timeout
+        self._cpus = list(cpus or [])
+        self._lock = threading.Lock()
+        self._wake = [threading.Condition(self._lock) for _ in range(self._max_workers)]
+        self._pinned: list[deque[StealTask]] = [deque() for _ in range(self._max_workers)]
+        self._free: list[deque[StealTask]] = [deque() for _ in range(self._max_workers)]
+        self._idle: set[int] = set()
+        self._next_hint = 0
+        self._stopping = False
+        self._drain = True
+        self._shutdown = False
+        self._stats = {"executed": 0, "stolen": 0, "pinned": 0}
+
+        self._name_prefix = f"{manager_name}_{uuid.uuid4().hex[:8]}"
+        self._owns_manager = worker_manager is None
+        self._worker_manager: IWorkerManager = worker_manager or WorkerManager(manager_name=f"{manager_name}Workers")
+        self._worker_manager.initialize()
+
+        self._worker_names: list[str] = []
+        config = ThreadConfig(execution_mode=ExecutionMode.LOOP)
+        for index in range(self._max_workers):
+            name = f"{self._name_prefix}_steal_{index}"
+            loop = functools.partial(self._worker_loop, index)
+            if not self._worker_manager.create_worker(name, loop, config, auto_start=True):
+                raise RuntimeError(
+                    f"WorkStealingPool: не удалось создать воркер '{name}' (WorkerManager.create_worker вернул False)"
+                )
+            self._worker_names.append(name)
+
+    # ------------------------------------------------------------------
+    # Воркер
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self, index: int, stop_event: threading.Event, pause_event: threading.Event) -> None:
+        """Тело LOOP-воркера: свой pinned → свой free → кража; пусто — ждать на своём Condition."""
+        self._pin(index)
+        while not stop_event.is_set():
+            task = self._take(index)
+            if task is None:
+                break
+            task._run()
+
+    def _pin(self, index: int) -> None:
+        if not self._cpus or not hasattr(os, "sched_setaffinity"):
+            return
+        cpu = self._cpus[index % len(self._cpus)]
+        try:
+            os.sched_setaffinity(0, {cpu})  # Linux: pid 0 = вызывающий поток
+        except OSError as exc:
+            self._log_warning(f"WorkStealingPool: воркер {index} не закреплён за ядром {cpu}: {exc}")
+
+    def _take(self, index: int) -> StealTask | None:
+        """Следующая задача воркера ``index`` (блокирующе). None — пул останавливается."""
+        with self._lock:
+            while True:
+                if self._stopping and not self._drain:
+                    return None
+                task = self._pop(index)
+                if task is not None:
+                    return task
+                if self._stopping:
+                    return None  # drain: своё и чужое free разобрано
+                self._idle.add(index)
+                self._wake[index].wait()
+                self._idle.discard(index)
+
+    def _pop(self, index: int) -> StealTask | None:
+        """Выбрать задачу под локом: pinned → свой free (LIFO) → кража (FIFO)."""
+        if self._pinned[index]:
+            task = self._pinned[index].popleft()
+        elif self._free[index]:
+            task = self._free[index].pop()
+        else:
+            task = None
+            for offset in range(1, self._max_workers):
+                victim = self._free[(index + offset) % self._max_workers]
+                if victim:
+                    task = victim.popleft()
+                    task.stolen = True
+                    self._stats["stolen"] += 1
+                    break
+            if task is None:
+                return None
+        task._state = "running"
+        task.worker = index
+        self._stats["executed"] += 1
+        return task
+
+    # ------------------------------------------------------------------
+    # Публичный контракт
+    # ------------------------------------------------------------------
+
+    def initialize(self) -> bool:
+        self.is_initialized = True
+        return True
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def step_timeout(self) -> float:
+        return self._step_timeout
+
+    def submit(
+        self,
+        operation: Any,
+        payload: Any,
+        context: Any,
+        affinity: int | None = None,
+        hint: int | None = None,
+        on_done: Callable[[StealTask], None] | None = None,
+    ) -> StealTask:
+        """Поставить операцию в дек воркера.
+
+        Args:
+            affinity: Индекс воркера, который ОБЯЗАН исполнить задачу (pinned, не
+                крадётся); берётся по модулю ``max_workers``.
+            hint: Предпочтительный воркер для free-задачи (его дек); None — по кругу.
+            on_done: Колбэк воркера после исполнения задачи.
+        """
+        if self._shutdown:
+            raise RuntimeError("WorkStealingPool: submit после shutdown")
+        task = StealTask(operation, payload, context, affinity, on_done)
+        with self._lock:
+            if affinity is not None:
+                owner = affinity % self._max_workers
+                self._pinned[owner].append(task)
+                self._stats["pinned"] += 1
+                self._wake[owner].notify()
+                return task
+            if hint is None:
+                hint = self._next_hint
+                self._next_hint = (self._next_hint + 1) % self._max_workers
+            owner = hint % self._max_workers
+            self._free[owner].append(task)
+            self._wake[owner].notify()
+            # Владелец может быть занят — будим простаивающего вора.
+            thief = next((i for i in self._idle if i != owner), None)
+            if thief is not None:
+                self._wake[thief].notify()
+        return task
+
+    def cancel(self, task: StealTask) -> bool:
+        """Снять ещё не начатую задачу из дека. True — снята (не исполнится, ``on_done`` не будет)."""
+        with self._lock:
+            if task._state != "queued":
+                return False
+            for bucket in (*self._pinned, *self._free):
+                try:
+                    bucket.remove(task)
+                except ValueError:
+                    continue
+                task._state = "cancelled"
+                return True
+        return False
+
+    def stats(self) -> dict[str, int]:
+        """Счётчики: ``executed`` (взято воркерами), ``stolen`` (из них украдено), ``pinned``."""
+        with self._lock:
+            return dict(self._stats)
+
+    def shutdown(self, wait: bool = True) -> bool:
+        """Остановить воркеры. ``wait=True`` — дорабатывают всё поставленное, иначе бросают очередь."""
+        with self._lock:
+            if self._shutdown:
+                return True
+            self._shutdown = True
+            self._stopping = True
+            self._drain = wait
+            for cond in self._wake:
+                cond.notify_all()
+        for name in self._worker_names:
+            self._worker_manager.remove_worker(name)
+        self._worker_names.clear()
+        if self._owns_manager:
+            self._worker_manager.shutdown()
+        self.is_initialized = False
+        return True
+
+
+__all__ = ["StealTask", "WorkStealingPool"]
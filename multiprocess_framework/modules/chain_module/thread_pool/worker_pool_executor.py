@@ -86,6 +86,7 @@ class _PoolTask:
         ``None`` как «успех» (H2).
         """
         if self._cancelled:
+            self._event.set()  # снята с очереди без исполнения — для done() она завершена
             return
         try:
             self._value = self._operation.execute(self._payload, self._context)
@@ -98,6 +99,10 @@ class _PoolTask:
         """Пометить отменённой: ещё не начатая задача не исполнится (H1)."""
         self._cancelled = True
 
+    def done(self) -> bool:
+        """Операция завершена (или отменённая задача снята с очереди) — больше не исполняется."""
+        return self._event.is_set()
+
     def result(self, timeout: float | None = None) -> Any:
         """Дождаться результата. ``_PoolTimeout`` при истечении, иначе значение/исключение."""
         if not self._event.wait(timeout):
@@ -40,6 +40,7 @@ class ChannelRegistry:
     ) -> None:
         self._channels: Dict[str, IChannel] = {}
         self._lock = threading.RLock()
+        self._version = 0  # растёт на каждом register/unregister/clear — ключ кэшей поверх реестра
 
         self._log_warning = log_warning or (lambda msg: None)
         self._log_error   = log_error   or (lambda msg: None)
@@ -65,6 +66,7 @@ class ChannelRegistry:
             if channel.name in self._channels:
                 self._log_warning(f"[ChannelRegistry] channel '{channel.name}' replaced")
             self._channels[channel.name] = channel
+            self._version += 1
         self._log_debug(
             f"[ChannelRegistry] channel '{channel.name}' registered "
             f"(type={channel.channel_type})"
@@ -77,6 +79,7 @@ class ChannelRegistry:
             if name not in self._channels:
                 return False
             del self._channels[name]
+            self._version += 1
         self._log_debug(f"[ChannelRegistry] channel '{name}' unregistered")
         return True
 
@@ -84,6 +87,11 @@ class ChannelRegistry:
     # Access
     # ------------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Номер изменения реестра: другой номер — набор каналов мог измениться."""
+        return self._version
+
     def get(self, name: str) -> Optional[IChannel]:
         """Получить канал по имени или None."""
         with self._lock:
@@ -109,6 +117,7 @@ class ChannelRegistry:
         with self._lock:
             channels = list(self._channels.values())
             self._channels.clear()
+            self._version += 1
         return channels
 
     # ------------------------------------------------------------------
@@ -85,6 +85,19 @@ class TestRegistration:
         reg = _make_registry()
         assert reg.unregister("nonexistent") is False
 
+    def test_version_changes_on_every_mutation(self):
+        reg = _make_registry()
+        seen = [reg.version]
+        reg.register(_MockChannel("a"))
+        seen.append(reg.version)
+        reg.unregister("missing")  # не найден — набор каналов не изменился
+        assert reg.version == seen[-1]
+        reg.unregister("a")
+        seen.append(reg.version)
+        reg.clear()
+        seen.append(reg.version)
+        assert len(set(seen)) == 4
+
     def test_len(self):
         reg = _make_registry()
         assert len(reg) == 0
@@ -238,6 +238,14 @@ _FLAG_LIST: Tuple[FeatureFlag, ...] = (
         default=False,
         doc="Рестарт процесса по деградации health-статуса (опц., поверх авто-рестарта).",
     ),
+    FeatureFlag(
+        "FW_CPU_AFFINITY",
+        default=False,
+        doc="Автоплан CPU-размещения: процессам без явного extras.placement чертёж "
+        "(build_configs) раздаёт ядра по ролям — камеры / обработка / GUI — с лимитом "
+        "нативных пулов (OMP/MKL/OpenBLAS/cv2/torch/ONNX) по размеру среза. Явный "
+        "placement работает и без флага. Default OFF (пиннинг зависит от железа стенда).",
+    ),
 )
 
 #: Реестр: имя флага → декларация. Единственный источник правды.
@@ -11,6 +11,12 @@
 - По полю "strategy" в сообщении
 - Если ключ не найден в обработчиках - проверка сценариев
 - По умолчанию используется EXACT_MATCH
+
+Авто-поиск (EXACT → FALLBACK → PATTERN) мемоизируется по ключу: результат,
+включая «не найдено», кладётся в ``_resolve_memo`` и сбрасывается при любом
+изменении состава обработчиков (register / unregister / overwrite / shutdown).
+Мемо хранит сами HandlerInfo, поэтому update_handler_* (правка на месте) его
+не инвалидируют. Счётчики попаданий и времени разрешения — ``get_lookup_stats()``.
 """
 
 from typing import Dict, Any, Callable, Optional, List, TYPE_CHECKING
@@ -30,6 +36,14 @@ from ..strategies import (
 )
 from ...base_manager import BaseManager, ObservableMixin
 
+# Потолок мемо разрешения ключей: ключи приходят из сообщений, и поток
+# уникальных неизвестных команд не должен раздувать память. При переполнении
+# мемо просто сбрасывается — рабочий набор ключей наберётся заново.
+_RESOLVE_MEMO_MAX = 4096
+
+# Маркер «ключа нет в мемо» (None в мемо — закэшированное «не найдено»).
+_UNRESOLVED = object()
+
 
 class Dispatcher(BaseManager, ObservableMixin):
     """
@@ -115,6 +129,18 @@ class Dispatcher(BaseManager, ObservableMixin):
 
         self._scenario_mgr = ScenarioManager()
 
+        # Мемо авто-поиска: ключ → HandlerInfo | None. Поколение защищает от записи
+        # результата, вычисленного до инвалидации (register из другого потока).
+        self._resolve_memo: Dict[str, Optional[HandlerInfo]] = {}
+        self._resolve_generation = 0
+        self._lookup_stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "resolve_ns_total": 0,
+            "resolve_ns_max": 0,
+        }
+
     @property
     def default_strategy(self) -> DispatchStrategy:
         """Стратегия по умолчанию для регистрации и диспетчеризации без явного поля strategy."""
@@ -166,6 +192,7 @@ class Dispatcher(BaseManager, ObservableMixin):
                     storage.clear()
 
             self._scenario_mgr.clear()
+            self._invalidate_lookup()
 
             # Очищаем стратегии
             self._strategies.clear()
@@ -259,6 +286,7 @@ class Dispatcher(BaseManager, ObservableMixin):
             )
 
             if result:
+                self._invalidate_lookup()
                 self._log_info(f"Handler '{key}' registered successfully", module="dispatcher")
                 self._record_metric("dispatcher.handler.registration.success", tags={"key": key})
             else:
@@ -282,6 +310,15 @@ class Dispatcher(BaseManager, ObservableMixin):
 
         return strategy_impl.find_handler(key, storage)
 
+    def _invalidate_lookup(self) -> None:
+        """Сбросить мемо авто-поиска и индекс паттернов (состав обработчиков изменился)."""
+        self._resolve_generation += 1
+        self._resolve_memo.clear()
+        self._lookup_stats["invalidations"] += 1
+        pattern = self._strategies.get(DispatchStrategy.PATTERN_MATCH)
+        if isinstance(pattern, PatternMatchStrategy):
+            pattern.invalidate()
+
     def _find_handler(self, key: str) -> Optional[HandlerInfo]:
         """
         Поиск обработчика по всем стратегиям.
@@ -291,7 +328,39 @@ class Dispatcher(BaseManager, ObservableMixin):
         2. FALLBACK_MATCH
         3. PATTERN_MATCH
         4. CHAIN_MATCH (сценарии)
+
+        Результат шагов 1–3 мемоизируется по ключу. Сценарии в мемо не попадают:
+        проверка имени — один dict-lookup, а сценарии меняются и через ScenarioBuilder.
         """
+        handler = self._resolve_memo.get(key, _UNRESOLVED)
+        if handler is _UNRESOLVED:
+            generation = self._resolve_generation
+            t0 = time.perf_counter_ns()
+            handler = self._resolve_handler(key)
+            elapsed = time.perf_counter_ns() - t0
+            stats = self._lookup_stats
+            stats["misses"] += 1
+            stats["resolve_ns_total"] += elapsed
+            if elapsed > stats["resolve_ns_max"]:
+                stats["resolve_ns_max"] = elapsed
+            if generation == self._resolve_generation:
+                if len(self._resolve_memo) >= _RESOLVE_MEMO_MAX:
+                    self._resolve_memo.clear()
+                self._resolve_memo[key] = handler
+        else:
+            self._lookup_stats["hits"] += 1
+
+        if handler is None and self._scenario_mgr.has_scenario(key):
+            # Возвращаем специальный маркер для сценария
+            return HandlerInfo(
+                key=key,
+                handler=lambda x: x,  # Заглушка, реальное выполнение в dispatch
+                metadata={"is_scenario": True},
+            )
+        return handler
+
+    def _resolve_handler(self, key: str) -> Optional[HandlerInfo]:
+        """Поиск без мемо: EXACT → FALLBACK → PATTERN."""
         # 1. EXACT_MATCH
         handler = self._find_handler_in_strategy(key, DispatchStrategy.EXACT_MATCH)
         if handler:
@@ -303,20 +372,7 @@ class Dispatcher(BaseManager, ObservableMixin):
             return handler
 
         # 3. PATTERN_MATCH
-        handler = self._find_handler_in_strategy(key, DispatchStrategy.PATTERN_MATCH)
-        if handler:
-            return handler
-
-        # 4. Проверка сценариев
-        if self._scenario_mgr.has_scenario(key):
-            # Возвращаем специальный маркер для сценария
-            return HandlerInfo(
-                key=key,
-                handler=lambda x: x,  # Заглушка, реальное выполнение в dispatch
-                metadata={"is_scenario": True},
-            )
-
-        return None
+        return self._find_handler_in_strategy(key, DispatchStrategy.PATTERN_MATCH)
 
     def dispatch(self, message: Dict[str, Any], key_field: str = "command", data_field: str = "data") -> Any:
         """
@@ -566,14 +622,7 @@ class Dispatcher(BaseManager, ObservableMixin):
         tags: List[str] = None,
     ) -> bool:
         """Принудительная перезапись обработчика."""
-        # Удаляем из всех стратегий
-        for strategy, storage in self._handlers_storage.items():
-            if strategy == DispatchStrategy.EXACT_MATCH and key in storage:
-                del storage[key]
-            elif strategy == DispatchStrategy.PATTERN_MATCH:
-                storage[:] = [h for h in storage if h.key != key]
-            elif strategy == DispatchStrategy.FALLBACK_MATCH and key in storage:
-                del storage[key]
+        self.unregister_handler(key)
 
         # Регистрируем в default_strategy
         return self.register_handler(
@@ -585,6 +634,44 @@ class Dispatcher(BaseManager, ObservableMixin):
             tags=tags,
         )
 
+    def unregister_handler(self, key: str) -> bool:
+        """Удалить обработчик с ключом ``key`` из всех стратегий.
+
+        Returns:
+            True если хоть один обработчик был удалён
+        """
+        removed = False
+        for strategy, storage in self._handlers_storage.items():
+            if strategy in (DispatchStrategy.EXACT_MATCH, DispatchStrategy.FALLBACK_MATCH) and key in storage:
+                del storage[key]
+                removed = True
+            elif strategy == DispatchStrategy.PATTERN_MATCH:
+                kept = [h for h in storage if h.key != key]
+                removed = removed or len(kept) != len(storage)
+                storage[:] = kept
+        if removed:
+            self._invalidate_lookup()
+            self._record_metric("dispatcher.handler.unregistered", tags={"key": key})
+        return removed
+
+    def get_lookup_stats(self) -> Dict[str, Any]:
+        """Счётчики авто-поиска: попадания/промахи мемо и время разрешения промаха (мкс)."""
+        stats = self._lookup_stats
+        misses = stats["misses"]
+        lookups = stats["hits"] + misses
+        pattern = self._strategies.get(DispatchStrategy.PATTERN_MATCH)
+        return {
+            "hits": stats["hits"],
+            "misses": misses,
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            "invalidations": stats["invalidations"],
+            "memo_size": len(self._resolve_memo),
+            "resolve_us_avg": round(stats["resolve_ns_total"] / misses / 1000.0, 3) if misses else 0.0,
+            "resolve_us_max": round(stats["resolve_ns_max"] / 1000.0, 3),
+            "pattern_count": len(self._handlers_storage[DispatchStrategy.PATTERN_MATCH]),
+            "pattern_combined": bool(isinstance(pattern, PatternMatchStrategy) and pattern.combined),
+        }
+
     def get_handler_info(self, key: str) -> Optional[Dict]:
         """Получение информации о конкретном обработчике."""
         handler_info = self._find_handler(key)
@@ -1,8 +1,16 @@
 """
 Стратегия сопоставления по регулярным выражениям.
+
+Паттерны компилируются один раз: стратегия держит индекс хранилища —
+скомпилированные паттерны в порядке регистрации и, если паттерны без групп,
+одну общую альтернацию ``(p0)|(p1)|...`` (ветвь — по ``lastindex``). Альтернация перебирает ветви
+слева направо, поэтому побеждает первый подходящий паттерн — тот же результат,
+что у прежнего цикла ``re.fullmatch`` по списку, но за один вызов движка.
+Индекс строится лениво и сбрасывается ``invalidate()`` (Dispatcher зовёт его
+при любом изменении состава хранилища).
 """
 import re
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 
 from .base_strategy import BaseStrategy
 from ..types.types import HandlerInfo
@@ -15,7 +23,48 @@ class PatternMatchStrategy(BaseStrategy):
     Обработчики регистрируются с regex паттернами в качестве ключей.
     Поиск происходит по первому подходящему паттерну.
     """
-    
+
+    def __init__(
+        self,
+        dispatcher_name: str,
+        warn_log: Optional[Callable[[str], None]] = None,
+        err_log: Optional[Callable[[str], None]] = None,
+    ):
+        super().__init__(dispatcher_name, warn_log=warn_log, err_log=err_log)
+        # (хранилище, его длина, общая альтернация | None, [(паттерн, HandlerInfo)])
+        self._index: Optional[Tuple[List[HandlerInfo], int, Optional["re.Pattern[str]"], list]] = None
+
+    @property
+    def combined(self) -> bool:
+        """True, если текущий индекс ищет одной общей альтернацией."""
+        return self._index is not None and self._index[2] is not None
+
+    def invalidate(self) -> None:
+        """Сбросить индекс — следующий поиск перестроит его по хранилищу."""
+        self._index = None
+
+    def _get_index(self, handlers_storage: List[HandlerInfo]) -> tuple:
+        index = self._index
+        # Длина — дешёвая страховка от изменений хранилища в обход invalidate().
+        if index is not None and index[0] is handlers_storage and index[1] == len(handlers_storage):
+            return index
+        compiled = []
+        for handler_info in handlers_storage:
+            try:
+                compiled.append((re.compile(handler_info.key), handler_info))
+            except re.error:
+                continue  # Пропускаем невалидные паттерны
+        combined = None
+        # Группы в паттернах сбили бы нумерацию ветвей (и обратные ссылки) — тогда цикл.
+        if len(compiled) > 1 and all(pattern.groups == 0 for pattern, _ in compiled):
+            try:
+                combined = re.compile("|".join(f"({pattern.pattern})" for pattern, _ in compiled))
+            except re.error:
+                combined = None  # например, глобальные флаги (?i) не в начале выражения
+        index = (handlers_storage, len(handlers_storage), combined, compiled)
+        self._index = index
+        return index
+
     def register_handler(
         self,
         key: str,
@@ -47,6 +96,7 @@ class PatternMatchStrategy(BaseStrategy):
                 tags=set(tags) if tags else set()
             )
             handlers_storage.append(handler_info)
+            self._index = None
             return True
         except Exception as e:
             self._err_log(f"PatternMatchStrategy {self.dispatcher_name}: Failed to register handler '{key}': {e}")
@@ -54,12 +104,15 @@ class PatternMatchStrategy(BaseStrategy):
     
     def find_handler(self, key: str, handlers_storage: List[HandlerInfo]) -> Optional[HandlerInfo]:
         """Поиск обработчика по первому подходящему паттерну."""
-        for handler_info in handlers_storage:
-            try:
-                if re.fullmatch(handler_info.key, key):
-                    return handler_info
-            except re.error:
-                continue  # Пропускаем невалидные паттерны
+        if not handlers_storage:
+            return None
+        _, _, combined, compiled = self._get_index(handlers_storage)
+        if combined is not None:
+            match = combined.fullmatch(key)
+            return compiled[match.lastindex - 1][1] if match else None
+        for pattern, handler_info in compiled:
+            if pattern.fullmatch(key):
+                return handler_info
         return None
     
     def get_all_handlers(self, handlers_storage: List[HandlerInfo]) -> List[Dict]:
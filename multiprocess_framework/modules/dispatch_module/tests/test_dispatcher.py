@@ -7,6 +7,7 @@
 - Работа со сценариями
 - overwrite_handler
 - Явный запрос стратегии "chain" в сообщении
+- Мемо авто-поиска и его инвалидация
 - Интеграция с ObservableMixin
 """
 
@@ -412,6 +413,45 @@ class TestDispatcher(unittest.TestCase):
         self.assertEqual(len(result["stages"]), 2)
         self.assertIn("final_error", result)
 
+    # ------------------------------------------------------------------
+    # Мемо авто-поиска (_find_handler)
+    # ------------------------------------------------------------------
+
+    def test_lookup_memo_counts_hits_and_misses(self):
+        """Повторный ключ (в т.ч. ненайденный) берётся из мемо."""
+        self.dispatcher.register_handler(r"cmd_\d+", lambda d: "p", strategy=DispatchStrategy.PATTERN_MATCH)
+
+        for _ in range(3):
+            self.assertEqual(self.dispatcher.dispatch({"command": "cmd_7", "data": {}}), "p")
+            self.dispatcher.dispatch({"command": "unknown", "data": {}})
+
+        stats = self.dispatcher.get_lookup_stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 4)
+        self.assertEqual(stats["memo_size"], 2)
+        self.assertGreater(stats["resolve_us_max"], 0.0)
+
+    def test_lookup_memo_invalidated_on_register_and_unregister(self):
+        """Закэшированное «не найдено» и найденный обработчик сбрасываются при смене состава."""
+        self.assertEqual(self.dispatcher.dispatch({"command": "late", "data": {}})["status"], "error")
+
+        self.dispatcher.register_handler("late", lambda d: "exact")
+        self.assertEqual(self.dispatcher.dispatch({"command": "late", "data": {}}), "exact")
+
+        self.dispatcher.register_handler("la.*", lambda d: "pattern", strategy=DispatchStrategy.PATTERN_MATCH)
+        self.assertTrue(self.dispatcher.unregister_handler("late"))
+        self.assertEqual(self.dispatcher.dispatch({"command": "late", "data": {}}), "pattern")
+
+        self.assertTrue(self.dispatcher.unregister_handler("la.*"))
+        self.assertFalse(self.dispatcher.unregister_handler("la.*"))
+        self.assertEqual(self.dispatcher.dispatch({"command": "late", "data": {}})["status"], "error")
+
+    def test_scenario_created_after_miss_is_found(self):
+        """Сценарий не мемоизируется: создание после промаха сразу видно get_handler_info."""
+        self.assertIsNone(self.dispatcher.get_handler_info("flow"))
+        self.dispatcher.create_scenario("flow")
+        self.assertEqual(self.dispatcher.get_handler_info("flow")["metadata"], {"is_scenario": True})
+
 
 if __name__ == "__main__":
     unittest.main()
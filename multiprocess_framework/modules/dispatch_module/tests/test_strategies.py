@@ -104,6 +104,39 @@ class TestPatternMatchStrategy(unittest.TestCase):
         self.assertIsNotNone(found)
         self.assertEqual(found.key, r"process_\d+")
 
+    def test_combined_index_keeps_first_match_order(self):
+        """Общая альтернация возвращает первый по порядку регистрации паттерн, как цикл."""
+        for pattern in (r"cam_\d", r"cam_\d+", r"cam_.*", r"other"):
+            self.strategy.register_handler(pattern, lambda d: d, handlers_storage=self.storage)
+
+        self.assertEqual(self.strategy.find_handler("cam_1", self.storage).key, r"cam_\d")
+        self.assertTrue(self.strategy.combined)
+        self.assertEqual(self.strategy.find_handler("cam_12", self.storage).key, r"cam_\d+")
+        self.assertEqual(self.strategy.find_handler("cam_x", self.storage).key, r"cam_.*")
+        self.assertIsNone(self.strategy.find_handler("nope", self.storage))
+
+    def test_patterns_with_groups_use_per_pattern_search(self):
+        """Паттерн с группами/обратной ссылкой не сливается в альтернацию, поиск остаётся верным."""
+        self.strategy.register_handler(r"(a+)-\1", lambda d: d, handlers_storage=self.storage)
+        self.strategy.register_handler(r"a+-a+", lambda d: d, handlers_storage=self.storage)
+
+        self.assertEqual(self.strategy.find_handler("aa-aa", self.storage).key, r"(a+)-\1")
+        self.assertFalse(self.strategy.combined)
+        self.assertEqual(self.strategy.find_handler("a-aa", self.storage).key, r"a+-a+")
+
+    def test_index_rebuilt_after_register_and_invalidate(self):
+        """Индекс перестраивается после новой регистрации и после invalidate()."""
+        self.strategy.register_handler(r"[xy]\d", lambda d: d, handlers_storage=self.storage)
+        self.assertIsNone(self.strategy.find_handler("z1", self.storage))
+
+        self.strategy.register_handler(r"[xz]\d", lambda d: d, handlers_storage=self.storage)
+        self.assertEqual(self.strategy.find_handler("z1", self.storage).key, r"[xz]\d")
+        self.assertEqual(self.strategy.find_handler("x1", self.storage).key, r"[xy]\d")
+
+        self.storage.reverse()  # состав тот же, порядок другой — нужен явный сброс
+        self.strategy.invalidate()
+        self.assertEqual(self.strategy.find_handler("x1", self.storage).key, r"[xz]\d")
+
 
 class TestFallbackMatchStrategy(unittest.TestCase):
     """Тесты для FallbackMatchStrategy."""
@@ -28,6 +28,7 @@ from .channels.log_channel import (
     get_registered_sink_types,
 )
 from .channels.router_push_channel import RouterPushChannel
+from .channels.structured_channel import StructuredChannel, read_records
 from .log_enums import LEVEL_ORDER, level_rank
 from .adapters.logger_adapter import LoggerAdapter
 from .adapters.std_facade import StdLoggerFacade, get_std_logger
@@ -49,6 +50,8 @@ __all__ = [
     "register_sink_factory",
     "get_registered_sink_types",
     "RouterPushChannel",
+    "StructuredChannel",
+    "read_records",
     "LEVEL_ORDER",
     "level_rank",
     "LoggerAdapter",
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Микробенчмарк log(): µs на вызов в вызывающем потоке, sync vs async (ADR-LOG-004).
+
+Сценарии (каналы — дефолтный конфиг LoggerManager во временном каталоге):
+
+* ``sync`` — ``async_enabled=False``: слияние контекстов, ``LogRecord``/``to_dict``,
+  tap и раздача по каналам (BatchBuffer → файлы) — на вызывающем потоке;
+* ``async`` — ``async_enabled=True``: вызывающий только кладёт запись в кольцо,
+  остальное — фоновый писатель;
+* ``async+structured`` — то же + канал ``type: structured`` (binary) в BUSINESS.
+
+Вызовы идут с темпом ``--rate`` (записей/с, как пер-кадровый лог конвейера), а
+не в плотном цикле: на 1 CPU плотный цикл меряет скорость писателя, а не цену
+вызова. ``µs/call`` — только время ``log()``; ``drain ms`` — дописывание хвоста
+на ``flush()``; ``dropped`` — потери кольца (``get_stats()["messages_dropped"]``).
+
+Запуск::
+
+    python -m multiprocess_framework.modules.logger_module.benchmark
+    python -m multiprocess_framework.modules.logger_module.benchmark --n 5000 --rate 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from typing import Any, Dict
+
+from multiprocess_framework.modules.logger_module import LoggerManager, LogLevel
+
+
+def _run(config: Dict[str, Any], n: int, rate: float) -> Dict[str, float]:
+    mgr = LoggerManager(manager_name="LogBench", config=config)
+    mgr.initialize()
+    period = 1.0 / rate if rate > 0 else 0.0
+    spent = 0.0
+    next_at = time.perf_counter()
+    for i in range(n):
+        t0 = time.perf_counter()
+        mgr.business(LogLevel.INFO, "frame processed", module="processor", seq_id=i, camera_id="c1")
+        spent += time.perf_counter() - t0
+        if period:
+            next_at += period
+            while time.perf_counter() < next_at:
+                time.sleep(0)
+    t0 = time.perf_counter()
+    mgr.flush()
+    drain_ms = (time.perf_counter() - t0) * 1000
+    stats = mgr.get_stats()
+    mgr.shutdown()
+    return {"us": spent / n * 1e6, "drain_ms": drain_ms, "dropped": stats.get("messages_dropped", 0)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: прогнать сценарии и напечатать таблицу µs/вызов."""
+    parser = argparse.ArgumentParser(prog="python -m multiprocess_framework.modules.logger_module.benchmark")
+    parser.add_argument("--n", type=int, default=3000, help="вызовов log() на сценарий")
+    parser.add_argument("--rate", type=float, default=1000.0, help="записей/с (0 — плотный цикл)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="log_bench_") as tmp:
+        base = {"log_directory": tmp}
+        structured = {
+            **base,
+            "async_enabled": True,
+            "channels": {
+                "business_file": {"type": "file", "file_path": "business.log"},
+                "structured": {"type": "structured", "codec": "binary", "file_path": "business.slog"},
+            },
+            "scopes": {"BUSINESS": {"min_level": "INFO", "channels": ["business_file", "structured"]}},
+        }
+        scenarios = {
+            "sync": base,
+            "async": {**base, "async_enabled": True},
+            "async+structured": structured,
+        }
+        print(f"{'сценарий':<18} {'µs/call':>9} {'drain ms':>9} {'dropped':>8}")
+        for name, config in scenarios.items():
+            row = _run(config, max(1, args.n), args.rate)
+            print(f"{name:<18} {row['us']:>9.2f} {row['drain_ms']:>9.1f} {row['dropped']:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
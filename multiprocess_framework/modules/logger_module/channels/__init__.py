@@ -4,6 +4,7 @@
 """
 
 from .log_channel import LogChannel, FileChannel, ConsoleChannel, HttpChannel, create_channel
+from .structured_channel import StructuredChannel, read_records
 
 __all__ = [
     "LogChannel",
@@ -11,5 +12,7 @@ __all__ = [
     "ConsoleChannel",
     "HttpChannel",
     "create_channel",
+    "StructuredChannel",
+    "read_records",
 ]
 
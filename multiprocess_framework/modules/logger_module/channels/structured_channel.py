@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+StructuredChannel — структурный sink записей для офлайн-разбора (ADR-LOG-004).
+
+Текстовые каналы (``file``/``console``) теряют структуру: ``extra`` не попадает
+в строку, а обратный разбор формата ``%(asctime)s ...`` хрупок. Канал
+``type: structured`` пишет запись целиком (``LogRecord.to_dict()``) в одном из
+кодеков (``LoggerChannelSchema.codec``):
+
+- ``ndjson`` — строка JSON на запись (читается ``jq``/pandas без нашего кода);
+- ``binary`` — компактные кадры: файл начинается с ``MAGIC``, далее на запись::
+
+      !IdBHHI  payload_len | timestamp | level | len(scope) | len(module) | len(message)
+      scope | module | message   (utf-8)
+      extra                      (компактный JSON, остаток payload)
+
+  ``level`` — ранг из ``LEVEL_ORDER`` (1 байт вместо строки).
+
+Неподдерживаемые JSON значения в ``extra`` пишутся через ``repr`` (запись не
+теряется из-за одного поля). Декодер — :func:`read_records` (автоопределение
+кодека по ``MAGIC``) и CLI::
+
+    python -m multiprocess_framework.modules.logger_module.channels.structured_channel logs/app.slog
+    python -m multiprocess_framework.modules.logger_module.channels.structured_channel \\
+        --min-level WARNING --module camera logs/*.slog
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from ..configs.logger_manager_config import LoggerChannelSchema
+from ..log_enums import LEVEL_ORDER, level_rank
+from .log_channel import LogChannel, register_sink_factory
+
+MAGIC = b"MLOGB1\n"
+_FRAME = struct.Struct("!IdBHHI")
+_BODY_HEAD = _FRAME.size - 4  # всё после payload_len
+
+#: Период сброса файлового буфера на диск, сек (между сбросами запись копится в памяти).
+FLUSH_INTERVAL = 0.5
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=repr)
+
+
+def encode_binary(record: Dict[str, Any]) -> bytes:
+    """Запись (``LogRecord.to_dict()``) → один бинарный кадр."""
+    scope = str(record.get("scope", "")).encode("utf-8")
+    module = str(record.get("module", "")).encode("utf-8")
+    message = str(record.get("message", "")).encode("utf-8")
+    extra = _dumps(record.get("extra") or {}).encode("utf-8")
+    payload_len = _BODY_HEAD + len(scope) + len(module) + len(message) + len(extra)
+    head = _FRAME.pack(
+        payload_len,
+        float(record.get("timestamp", 0.0)),
+        level_rank(record.get("level")),
+        len(scope),
+        len(module),
+        len(message),
+    )
+    return b"".join((head, scope, module, message, extra))
+
+
+def _decode_binary(data: bytes) -> Iterator[Dict[str, Any]]:
+    offset = len(MAGIC)
+    while offset + _FRAME.size <= len(data):
+        payload_len, ts, level, n_scope, n_module, n_message = _FRAME.unpack_from(data, offset)
+        end = offset + 4 + payload_len
+        if end > len(data):
+            break  # недописанный хвост (процесс упал посреди кадра)
+        pos = offset + _FRAME.size
+        scope = data[pos : pos + n_scope].decode("utf-8")
+        pos += n_scope
+        module = data[pos : pos + n_module].decode("utf-8")
+        pos += n_module
+        message = data[pos : pos + n_message].decode("utf-8")
+        pos += n_message
+        yield {
+            "timestamp": ts,
+            "level": LEVEL_ORDER[level] if level < len(LEVEL_ORDER) else str(level),
+            "scope": scope,
+            "message": message,
+            "module": module,
+            "extra": json.loads(data[pos:end]) if end > pos else {},
+        }
+        offset = end
+
+
+def read_records(path: Any) -> Iterator[Dict[str, Any]]:
+    """Прочитать файл структурного канала (кодек — по ``MAGIC``) в dict-записи."""
+    data = Path(path).read_bytes()
+    if data.startswith(MAGIC):
+        yield from _decode_binary(data)
+        return
+    for line in data.decode("utf-8").splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
+class StructuredChannel(LogChannel):
+    """Канал ``structured``: запись целиком в NDJSON или бинарные кадры (см. модуль)."""
+
+    def __init__(self, config: LoggerChannelSchema):
+        super().__init__(config)
+        self.codec = config.codec
+        suffix = ".slog" if self.codec == "binary" else ".ndjson"
+        self.file_path = Path(config.file_path or f"logs/{config.name}{suffix}")
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.file_path, "ab")  # noqa: SIM115 — живёт до close()
+        if self.codec == "binary" and self._fh.tell() == 0:
+            self._fh.write(MAGIC)
+        self._last_flush = time.monotonic()
+
+    def write(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            if self.codec == "binary":
+                self._fh.write(encode_binary(record))
+            else:
+                self._fh.write(_dumps(record).encode("utf-8") + b"\n")
+            now = time.monotonic()
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self._fh.flush()
+                self._last_flush = now
+            return {"status": "success", "channel": self.name}
+        except Exception as e:
+            return {"status": "error", "error": str(e), "channel": self.name}
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            self._fh.close()
+        except Exception:  # nosec B110 — закрытие файла на shutdown: ошибка не критична
+            pass
+        self._fh = None
+
+
+register_sink_factory("structured", StructuredChannel)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: декодировать файлы структурного канала в NDJSON (stdout) с фильтрами."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Декодировать structured-лог (ndjson/binary) в NDJSON")
+    parser.add_argument("files", nargs="+", help="файлы канала type: structured")
+    parser.add_argument("--min-level", default="DEBUG", help="порог уровня (DEBUG…CRITICAL)")
+    parser.add_argument("--module", default="", help="только записи этого модуля")
+    args = parser.parse_args(argv)
+    threshold = level_rank(args.min_level)
+    for name in args.files:
+        for record in read_records(name):
+            if level_rank(record.get("level")) < threshold:
+                continue
+            if args.module and record.get("module") != args.module:
+                continue
+            sys.stdout.write(_dumps(record) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
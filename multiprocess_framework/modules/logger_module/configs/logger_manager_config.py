@@ -7,7 +7,7 @@ LoggerManagerConfig — SchemaBase / ChannelRoutingConfig для LoggerManager.
 
 from __future__ import annotations
 
-from typing import Annotated, Dict, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
 from pydantic import Field
 
@@ -34,6 +34,8 @@ class LoggerChannelSchema(SchemaBase):
     file_path: Optional[str] = None
     url: Optional[str] = None
     headers: Dict[str, str] = Field(default_factory=dict)
+    # Только для type: structured — ndjson (строка JSON на запись) или binary (кадры, ADR-LOG-004).
+    codec: Literal["ndjson", "binary"] = "ndjson"
 
 
 class LoggerScopeSchema(SchemaBase):
@@ -89,6 +91,20 @@ class LoggerManagerConfig(ChannelRoutingConfig):
     enable_batching: bool = True
     batch_size: int = 100
     batch_interval: float = 1.0
+    async_enabled: Annotated[
+        bool,
+        FieldMeta(
+            "Асинхронный log(): вызывающий поток только кладёт запись в кольцо, сборку и "
+            "раздачу по каналам делает фоновый писатель (ADR-LOG-004)"
+        ),
+    ] = False
+    async_capacity: Annotated[int, FieldMeta("Ёмкость кольца записей (степень двойки)")] = 8192
+    async_overflow: Annotated[
+        Literal["drop", "block"],
+        FieldMeta("Кольцо полно: drop — отбросить запись, block — ждать до async_block_timeout"),
+    ] = "drop"
+    async_block_timeout: float = 0.05
+    async_interval: Annotated[float, FieldMeta("Период опроса кольца писателем, сек")] = 0.02
 
     modules: Annotated[
         Dict[str, LoggerModuleSchema],
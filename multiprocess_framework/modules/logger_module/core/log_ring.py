@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+LogRing — предвыделенное кольцо записей асинхронного логгера (ADR-LOG-004).
+
+Вызывающий поток (``LoggerCore.log`` при ``async_enabled``) делает только захват
+фиксированной стоимости: кортеж ссылок ``(ts, scope, level, message, module,
+ctx_var, thread_ctx, extra)`` кладётся в слот кольца. Слияние контекстов,
+``LogRecord``/``to_dict``, tap'ы и раздача по каналам — в фоновом писателе
+(:class:`AsyncLogWriter`).
+
+Кольцо — список слотов фиксированной ёмкости (степень двойки), выделенный один
+раз. Проверка «полно», выдача номера слота и запись слота — один шаг под коротким
+локом производителей (несколько операций над int и одно присваивание элемента
+списка). Без этого вытесненный между claim и store производитель мог записать
+свой старый номер поверх слота, уже выданного следующему кругу кольца, и
+читатель навсегда останавливался на «недописанном» слоте. Единственный читатель
+(писатель-поток) лока не берёт: всё, что ниже ``_claimed``, уже записано.
+
+Переполнение:
+
+- ``drop`` — запись отбрасывается сразу (``dropped``), вызывающий не ждёт;
+- ``block`` — вызывающий ждёт освобождения до ``block_timeout`` секунд
+  (``backpressure_waits``), затем отбрасывает.
+
+Непрочитанный слот никогда не перезаписывается: потеря возможна только в
+``dropped``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+
+def _pow2(n: int) -> int:
+    size = 16
+    while size < n:
+        size <<= 1
+    return size
+
+
+class LogRing:
+    """Кольцо захваченных записей: много производителей, один читатель.
+
+    Args:
+        capacity: Ёмкость (округляется вверх до степени двойки, минимум 16).
+        overflow: ``"drop"`` или ``"block"`` (см. модульный docstring).
+        block_timeout: Предел ожидания места при ``overflow="block"``, сек.
+    """
+
+    def __init__(self, capacity: int = 8192, overflow: str = "drop", block_timeout: float = 0.05) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self._capacity = _pow2(max(1, int(capacity)))
+        self._mask = self._capacity - 1
+        self._slots: List[Optional[tuple]] = [None] * self._capacity
+        self._put_lock = threading.Lock()  # claim + store одним шагом (см. модульный docstring)
+        self._claimed = 0  # следующий номер; все слоты ниже него записаны
+        self._read = 0
+        self._overflow = overflow
+        self._block_timeout = max(0.0, float(block_timeout))
+        self._space = threading.Event()
+        self._wake = threading.Event()
+        self._wake_at = self._capacity // 2
+        self.dropped = 0
+        self.backpressure_waits = 0
+        self.high_water = 0
+        self.consumed = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def pending(self) -> int:
+        return max(0, self._claimed - self._read)
+
+    def put(self, entry: tuple) -> bool:
+        """Положить запись. False — отброшена (кольцо полно)."""
+        deadline = 0.0
+        while True:
+            with self._put_lock:
+                seq = self._claimed
+                if seq - self._read < self._capacity:
+                    self._slots[seq & self._mask] = entry
+                    self._claimed = seq + 1
+                    break
+            if self._overflow != "block":
+                self.dropped += 1
+                return False
+            if not deadline:
+                deadline = time.monotonic() + self._block_timeout
+                self.backpressure_waits += 1
+            if not self._wait_space(deadline):
+                self.dropped += 1
+                return False
+        depth = seq + 1 - self._read
+        if depth > self.high_water:
+            self.high_water = depth
+        if depth >= self._wake_at:
+            self._wake.set()
+        return True
+
+    def _wait_space(self, deadline: float) -> bool:
+        """Ждать места до ``deadline``; повтор claim — в :meth:`put`."""
+        self._wake.set()
+        while self._claimed - self._read >= self._capacity:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._space.clear()
+            self._space.wait(min(remaining, 0.005))
+        return True
+
+    def drain(self, handle: Callable[[tuple], Any], limit: int = 0) -> int:
+        """Прочитать опубликованные записи по порядку и отдать ``handle``.
+
+        Вызывается ТОЛЬКО из одного потока-читателя. ``limit`` > 0 — не больше
+        стольких записей за вызов. Возвращает число обработанных записей.
+        """
+        slots, mask = self._slots, self._mask
+        done = 0
+        while not limit or done < limit:
+            read = self._read
+            if read >= self._claimed:
+                break
+            entry = slots[read & mask]
+            slots[read & mask] = None
+            self._read = read + 1
+            try:
+                handle(entry)
+            finally:
+                done += 1
+        if done:
+            self.consumed += done
+            self._space.set()
+        return done
+
+    def wait(self, timeout: float) -> None:
+        """Ждать сигнала «кольцо наполовину полно» или ``timeout``."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self._capacity,
+            "overflow": self._overflow,
+            "pending": self.pending,
+            "high_water": self.high_water,
+            "consumed": self.consumed,
+            "dropped": self.dropped,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+class AsyncLogWriter:
+    """Фоновый поток-писатель: опустошает :class:`LogRing` через ``handle``.
+
+    Просыпается раз в ``interval`` секунд или раньше — когда кольцо заполнено
+    наполовину (сигнал производителя) либо по :meth:`flush`.
+
+    Args:
+        ring: Кольцо записей.
+        handle: Обработчик одной захваченной записи (сборка + раздача по каналам).
+        interval: Период опроса кольца, сек.
+    """
+
+    def __init__(self, ring: LogRing, handle: Callable[[tuple], Any], interval: float = 0.02) -> None:
+        self._ring = ring
+        self._handle = handle
+        self._interval = max(0.001, float(interval))
+        self._lock = threading.Lock()  # сериализует drain: поток-писатель vs flush()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.errors = 0
+
+    @property
+    def ring(self) -> LogRing:
+        return self._ring
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="async-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Остановить поток и дописать всё, что осталось в кольце."""
+        self._stop.set()
+        self._ring.wake()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Синхронно опустошить кольцо в вызывающем потоке (под локом читателя)."""
+        with self._lock:
+            return self._ring.drain(self._safe_handle)
+
+    def _safe_handle(self, entry: tuple) -> None:
+        try:
+            self._handle(entry)
+        except Exception:
+            self.errors += 1
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._ring.wait(self._interval)
+            self.flush()
@@ -38,6 +38,7 @@ from ..configs.logger_manager_config import (
 from .log_config import LogLevel, LogScope
 from ..log_enums import level_rank
 from .log_types import LogRecord
+from .log_ring import AsyncLogWriter, LogRing
 from ..channels.log_channel import create_channel, LogChannel
 from .log_paths import resolve_log_file_path
 
@@ -115,6 +116,12 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
             "module_files_created": 0,
         }
 
+        # Async-пайплайн (ADR-LOG-004): кольцо + фоновый писатель. _ring ≠ None только
+        # пока писатель запущен (initialize … shutdown) — до этого log() синхронный.
+        self._ring: Optional[LogRing] = None
+        self._async_writer: Optional[AsyncLogWriter] = None
+        self._async_stats: Optional[Dict[str, Any]] = None  # снимок счётчиков остановленного писателя
+
         self._setup_channels()
         self._setup_batcher()
 
@@ -130,6 +137,7 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
             # Инстанс остаётся в базе (его использует ErrorManager) — базу не трогаем.
             if self._buffer:
                 self._buffer.start()
+            self._start_async()
             self.is_initialized = True
             self.info("LoggerManager initialized", module="logger_manager")
             return True
@@ -140,6 +148,7 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
     def shutdown(self) -> bool:
         try:
             self.info("LoggerManager shutting down", module="logger_manager")
+            self._stop_async()
             self.flush()
             if self._buffer:
                 self._buffer.stop()
@@ -231,8 +240,9 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
     def _setup_channel(self, channel_name: str, channel_config: LoggerChannelSchema):
         try:
             cfg = channel_config
-            if channel_config.type == "file":
-                fb = f"logs/{channel_name}.log"
+            if channel_config.type in ("file", "structured"):
+                suffix = ".log" if channel_config.type == "file" else ".slog"
+                fb = f"logs/{channel_name}{suffix}"
                 cfg = channel_config.model_copy(
                     update={
                         "file_path": self._resolved_file_path(
@@ -291,6 +301,37 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
         else:
             self._buffer = None
 
+    def _start_async(self) -> None:
+        """Поднять кольцо и фонового писателя, если ``async_enabled`` (ADR-LOG-004)."""
+        if not self.config.async_enabled or self._async_writer is not None:
+            return
+        ring = LogRing(
+            capacity=self.config.async_capacity,
+            overflow=self.config.async_overflow,
+            block_timeout=self.config.async_block_timeout,
+        )
+        writer = AsyncLogWriter(ring, self._emit_captured, interval=self.config.async_interval)
+        writer.start()
+        self._async_writer = writer
+        self._ring = ring
+
+    def _stop_async(self) -> None:
+        """Вернуть log() в синхронный режим, остановить писателя и дописать кольцо."""
+        writer = self._async_writer
+        if writer is None:
+            return
+        self._ring = None
+        self._async_writer = None
+        try:
+            writer.stop()
+        except Exception as e:
+            self._fallback_log("ERROR", f"async log writer stop failed: {e}")
+        self._async_stats = self._async_stats_of(writer)
+
+    @staticmethod
+    def _async_stats_of(writer: AsyncLogWriter) -> Dict[str, Any]:
+        return {**writer.ring.stats, "writer_errors": writer.errors, "running": writer.running}
+
     def _rebuild_from_config(self, config: Dict[str, Any]) -> None:
         """Хук CRM.reconfigure: пересобрать каналы из нового конфига + сбросить кэш.
 
@@ -334,12 +375,15 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
             except Exception as e:
                 self._fallback_log("ERROR", f"buffer stop failed: {e}")
             self._buffer = None
+        self._stop_async()
 
         # 4. Воссоздать каналы и батчер из нового конфига.
         self._setup_channels()
         self._setup_batcher()
-        if self.is_initialized and self._buffer is not None:
-            self._buffer.start()
+        if self.is_initialized:
+            if self._buffer is not None:
+                self._buffer.start()
+            self._start_async()
 
         # 5. Сбросить кэш решений should_log (критический баг — раньше не сбрасывался).
         self.invalidate_decision_cache()
@@ -404,6 +448,36 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
             self.stats["messages_skipped"] += 1
             return
 
+        ring = self._ring
+        if ring is not None:
+            # Async-режим: только захват ссылок фиксированной стоимости; слияние
+            # контекстов, LogRecord и раздача по каналам — в фоновом писателе.
+            ring.put((time.time(), scope, level, message, module, log_context.get(), self._get_thread_context(), extra))
+            return
+
+        self._emit_record(
+            time.time(),
+            scope,
+            level,
+            message,
+            module,
+            {**log_context.get(), **self._get_thread_context(), **extra},
+        )
+
+    def _emit_record(
+        self,
+        timestamp: float,
+        scope: LogScope,
+        level: LogLevel,
+        message: str,
+        module: str,
+        context: Dict[str, Any],
+    ) -> None:
+        """Собрать запись и раздать её tap'ам и каналам scope (sync-путь и async-писатель).
+
+        ``to_dict()`` — ровно один раз: один и тот же dict уходит в tap'ы и во все
+        каналы (каналы запись не мутируют).
+        """
         scope_config = self._scope_schema(scope)
         channels = scope_config.channels or self._channel_registry.names()
 
@@ -411,34 +485,32 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
             channels = list(channels)
             channels.append(f"module_{module}")
 
-        context = {
-            **log_context.get(),
-            **self._get_thread_context(),
-            **extra,
-        }
-
-        record = LogRecord(
-            timestamp=time.time(),
+        record_dict = LogRecord(
+            timestamp=timestamp,
             level=level,
             scope=scope,
             message=message,
             module=module,
             extra=context,
-        )
+        ).to_dict()
 
         if self._tap_sinks:
-            self._emit_to_taps(record.to_dict(), level)
+            self._emit_to_taps(record_dict, level)
 
         if self._buffer:
             for ch_name in channels:
-                self._buffer.enqueue(ch_name, record.to_dict())
+                self._buffer.enqueue(ch_name, record_dict)
             self.stats["messages_batched"] += 1
         else:
-            self._write_record_to_channels(record, channels)
+            self._write_record_to_channels(record_dict, channels)
+
+    def _emit_captured(self, entry: tuple) -> None:
+        """Обработчик AsyncLogWriter: захваченная в ``log()`` запись → ``_emit_record``."""
+        timestamp, scope, level, message, module, ctx_var, thread_ctx, extra = entry
+        self._emit_record(timestamp, scope, level, message, module, {**ctx_var, **thread_ctx, **extra})
 
-    def _write_record_to_channels(self, record: LogRecord, channel_names: List[str]) -> None:
+    def _write_record_to_channels(self, record_dict: Dict[str, Any], channel_names: List[str]) -> None:
         """Write log record directly to named channels (no buffer)."""
-        record_dict = record.to_dict()
         for ch_name in channel_names:
             ch = self._channel_registry.get(ch_name)
             if ch is None:
@@ -628,6 +700,15 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
                 }
             )
 
+        # Async-пайплайн: потери и backpressure видны всегда, в т.ч. после остановки писателя.
+        writer = self._async_writer
+        async_stats = self._async_stats_of(writer) if writer is not None else self._async_stats
+        base_stats["async_enabled"] = self.config.async_enabled
+        if async_stats is not None:
+            base_stats["async_stats"] = async_stats
+            base_stats["messages_dropped"] = async_stats["dropped"]
+            base_stats["backpressure_waits"] = async_stats["backpressure_waits"]
+
         return base_stats
 
     # =========================================================================
@@ -635,6 +716,8 @@ class LoggerCore(ChannelRoutingManager, ILoggerManager):
     # =========================================================================
 
     def flush(self):
+        if self._async_writer is not None:
+            self._async_writer.flush()
         if self._buffer:
             self._buffer.flush()
 
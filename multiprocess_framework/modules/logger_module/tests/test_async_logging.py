@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""Тесты async-пайплайна логгера и структурного sink'а (ADR-LOG-004).
+
+- LogRing: порядок FIFO, drop при переполнении, block с таймаутом, поздний store;
+- LoggerManager(async_enabled): log() только кладёт в кольцо, писатель собирает
+  запись с контекстом вызывающего, flush/shutdown дописывают, потери — в get_stats;
+- StructuredChannel: ndjson/binary round-trip через read_records + CLI-фильтр.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from multiprocess_framework.modules.logger_module import LogLevel, StructuredChannel, read_records
+from multiprocess_framework.modules.logger_module.channels import structured_channel
+from multiprocess_framework.modules.logger_module.channels.log_channel import create_channel
+from multiprocess_framework.modules.logger_module.configs.logger_manager_config import LoggerChannelSchema
+from multiprocess_framework.modules.logger_module.core.log_ring import AsyncLogWriter, LogRing
+from multiprocess_framework.modules.logger_module.core.logger_core import log_context
+from multiprocess_framework.modules.logger_module.core.logger_manager import LoggerManager
+
+
+class _CollectSink:
+    def __init__(self, name: str = "collect") -> None:
+        self._name = name
+        self.records: list = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def write(self, data: dict) -> dict:
+        self.records.append(data)
+        return {"status": "success", "channel": self._name}
+
+    def close(self) -> None:
+        pass
+
+
+def _async_manager(tmp_path, **overrides) -> LoggerManager:
+    config = {"async_enabled": True, "async_interval": 60.0, "log_directory": str(tmp_path), **overrides}
+    mgr = LoggerManager(manager_name="AsyncTest", config=config)
+    mgr.initialize()
+    return mgr
+
+
+class TestLogRing:
+    def test_fifo_and_capacity_rounding(self) -> None:
+        ring = LogRing(capacity=20)
+        assert ring.capacity == 32
+        for i in range(10):
+            assert ring.put((i,))
+        got: list = []
+        assert ring.drain(lambda e: got.append(e[0])) == 10
+        assert got == list(range(10))
+        assert ring.pending == 0
+
+    def test_drop_when_full(self) -> None:
+        ring = LogRing(capacity=16, overflow="drop")
+        accepted = sum(ring.put((i,)) for i in range(20))
+        assert accepted == 16
+        assert ring.stats["dropped"] == 4
+        assert ring.stats["high_water"] == 16
+        got: list = []
+        ring.drain(lambda e: got.append(e[0]))
+        assert got == list(range(16))  # drop-new: старые записи целы
+
+    def test_block_waits_for_reader(self) -> None:
+        ring = LogRing(capacity=16, overflow="block", block_timeout=2.0)
+        for i in range(16):
+            ring.put((i,))
+        reader = threading.Timer(0.05, lambda: ring.drain(lambda e: None, limit=4))
+        reader.start()
+        assert ring.put(("late",))  # дождался места, не отброшен
+        reader.join()
+        assert ring.stats["backpressure_waits"] == 1
+        assert ring.stats["dropped"] == 0
+
+    def test_block_times_out_then_drops(self) -> None:
+        ring = LogRing(capacity=16, overflow="block", block_timeout=0.01)
+        for i in range(16):
+            ring.put((i,))
+        assert not ring.put(("late",))
+        assert ring.stats["dropped"] == 1
+
+    def test_late_store_cannot_overwrite_next_lap(self) -> None:
+        """Производитель вытеснен между claim и store: соседний не занимает слот
+        следующего круга, читатель не встаёт навсегда, потерь нет."""
+        ring = LogRing(capacity=16)
+        for i in range(15):
+            ring.put((i,))
+        in_store, resume = threading.Event(), threading.Event()
+
+        class _SlowSlots(list):
+            def __setitem__(self, index, value):
+                if value == ("A",):
+                    in_store.set()
+                    resume.wait(5.0)
+                super().__setitem__(index, value)
+
+        ring._slots = _SlowSlots(ring._slots)
+        a = threading.Thread(target=ring.put, args=(("A",),))
+        b = threading.Thread(target=ring.put, args=(("B",),))
+        a.start()
+        assert in_store.wait(5.0)
+        b.start()
+        got: list = []
+        assert ring.drain(lambda e: got.append(e[0])) == 15  # недописанный слот не читается
+        b.join(0.05)
+        assert b.is_alive()  # соседний производитель ждёт, а не берёт слот поверх
+        resume.set()
+        a.join(5.0)
+        b.join(5.0)
+        assert ring.drain(lambda e: got.append(e[0])) == 2
+        for i in range(40):
+            assert ring.put((100 + i,))
+            ring.drain(lambda e: got.append(e[0]))
+        assert got == list(range(15)) + ["A", "B"] + [100 + i for i in range(40)]
+        assert ring.pending == 0 and ring.stats["dropped"] == 0
+
+    def test_concurrent_producers_never_stall_reader(self) -> None:
+        ring = LogRing(capacity=16, overflow="drop")
+        stop = threading.Event()
+        got: list = []
+
+        def reader() -> None:
+            while not stop.is_set():
+                ring.drain(lambda e: got.append(e))
+
+        def producer(tag: int) -> None:
+            for i in range(2000):
+                ring.put((tag, i))
+
+        threads = [threading.Thread(target=producer, args=(t,)) for t in range(4)]
+        r = threading.Thread(target=reader)
+        r.start()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stop.set()
+        r.join()
+        ring.drain(lambda e: got.append(e))
+        assert len(got) + ring.stats["dropped"] == 8000
+        assert ring.pending == 0
+        for tag in range(4):
+            seqs = [i for t, i in got if t == tag]
+            assert seqs == sorted(seqs)  # FIFO внутри производителя
+
+    def test_rejects_unknown_policy(self) -> None:
+        with pytest.raises(ValueError):
+            LogRing(overflow="spin")
+
+    def test_writer_errors_counted_not_raised(self) -> None:
+        ring = LogRing(capacity=16)
+        writer = AsyncLogWriter(ring, lambda e: 1 / 0)
+        ring.put((0,))
+        assert writer.flush() == 1
+        assert writer.errors == 1
+
+
+class TestAsyncLogger:
+    def test_log_is_deferred_until_flush(self, tmp_path) -> None:
+        mgr = _async_manager(tmp_path)
+        sink = _CollectSink()
+        mgr.add_log_tap(sink, min_level="INFO")
+        try:
+            mgr.info("frame done", module="processor", seq_id=7)
+            assert sink.records == []  # вызывающий поток только положил запись в кольцо
+            mgr.flush()
+            [record] = [r for r in sink.records if r["message"] == "frame done"]
+            assert record["level"] == "INFO"
+            assert record["extra"]["seq_id"] == 7
+        finally:
+            mgr.shutdown()
+
+    def test_context_captured_on_caller_thread(self, tmp_path) -> None:
+        mgr = _async_manager(tmp_path)
+        sink = _CollectSink()
+        mgr.add_log_tap(sink, min_level="INFO")
+        try:
+            token = log_context.set({"trace_id": "t-1"})
+            mgr.push_context(camera="c1")
+            mgr.info("ctx", module="processor")
+            mgr.pop_context()
+            log_context.reset(token)
+            mgr.flush()
+            [record] = [r for r in sink.records if r["message"] == "ctx"]
+            assert record["extra"] == {"trace_id": "t-1", "camera": "c1"}
+        finally:
+            mgr.shutdown()
+
+    def test_shutdown_drains_ring(self, tmp_path) -> None:
+        mgr = _async_manager(tmp_path)
+        sink = _CollectSink()
+        mgr.add_log_tap(sink, min_level="INFO")
+        for i in range(50):
+            mgr.info(f"m{i}", module="processor")
+        mgr.shutdown()
+        messages = [r["message"] for r in sink.records if r["message"].startswith("m")]
+        assert messages == [f"m{i}" for i in range(50)]
+
+    def test_drops_reported_in_stats(self, tmp_path) -> None:
+        mgr = _async_manager(tmp_path, async_capacity=16)
+        try:
+            for i in range(40):
+                mgr.info(f"m{i}", module="processor")
+            stats = mgr.get_stats()
+            assert stats["async_enabled"] is True
+            assert stats["messages_dropped"] > 0
+            assert stats["async_stats"]["high_water"] == 16
+            assert stats["backpressure_waits"] == 0
+        finally:
+            mgr.shutdown()
+        assert mgr.get_stats()["async_stats"]["running"] is False  # счётчики живут и после остановки
+
+    def test_sync_mode_unchanged(self, tmp_path) -> None:
+        mgr = LoggerManager(manager_name="SyncTest", config={"log_directory": str(tmp_path)})
+        mgr.initialize()
+        sink = _CollectSink()
+        mgr.add_log_tap(sink, min_level="INFO")
+        try:
+            mgr.info("now", module="processor")
+            assert [r["message"] for r in sink.records] == ["now"]
+            assert mgr.get_stats()["async_enabled"] is False
+            assert "async_stats" not in mgr.get_stats()
+        finally:
+            mgr.shutdown()
+
+    def test_reconfigure_switches_mode(self, tmp_path) -> None:
+        mgr = _async_manager(tmp_path)
+        sink = _CollectSink()
+        mgr.add_log_tap(sink, min_level="INFO")
+        try:
+            mgr.reconfigure({"async_enabled": False, "log_directory": str(tmp_path)})
+            mgr.info("sync again", module="processor")
+            assert sink.records[-1]["message"] == "sync again"
+            mgr.reconfigure({"async_enabled": True, "async_interval": 60.0, "log_directory": str(tmp_path)})
+            mgr.info("async again", module="processor")
+            assert sink.records[-1]["message"] != "async again"
+            mgr.flush()
+            assert sink.records[-1]["message"] == "async again"
+        finally:
+            mgr.shutdown()
+
+
+_RECORD = {
+    "timestamp": 1700000000.25,
+    "level": "WARNING",
+    "scope": "business",
+    "message": "кадр пропущен",
+    "module": "camera",
+    "extra": {"seq_id": 3, "shape": (480, 640)},
+}
+
+
+class TestStructuredChannel:
+    @pytest.mark.parametrize("codec", ["ndjson", "binary"])
+    def test_roundtrip(self, tmp_path, codec: str) -> None:
+        path = tmp_path / f"s.{codec}"
+        channel = create_channel("s", LoggerChannelSchema(type="structured", codec=codec, file_path=str(path)))
+        assert isinstance(channel, StructuredChannel)
+        channel.write(_RECORD)
+        channel.write({**_RECORD, "level": "INFO", "extra": {"obj": object()}})
+        channel.close()
+        first, second = list(read_records(path))
+        assert first == {**_RECORD, "extra": {"seq_id": 3, "shape": [480, 640]}}
+        assert second["level"] == "INFO"
+        assert second["extra"]["obj"].startswith("<object")  # не-JSON значение — через repr
+
+    def test_binary_appends_and_skips_torn_tail(self, tmp_path) -> None:
+        path = tmp_path / "s.slog"
+        cfg = LoggerChannelSchema(type="structured", codec="binary", file_path=str(path))
+        for _ in range(2):  # повторное открытие дописывает без второго MAGIC
+            channel = create_channel("s", cfg)
+            channel.write(_RECORD)
+            channel.close()
+        with open(path, "ab") as fh:
+            fh.write(structured_channel.encode_binary(_RECORD)[:-3])
+        assert len(list(read_records(path))) == 2
+
+    def test_cli_filters(self, tmp_path, capsys) -> None:
+        path = tmp_path / "s.slog"
+        channel = create_channel("s", LoggerChannelSchema(type="structured", codec="binary", file_path=str(path)))
+        channel.write(_RECORD)
+        channel.write({**_RECORD, "level": "DEBUG"})
+        channel.write({**_RECORD, "module": "robot"})
+        channel.close()
+        assert structured_channel.main(["--min-level", "INFO", "--module", "camera", str(path)]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["level"] for line in lines] == ["WARNING"]
+
+    def test_logger_writes_structured_channel(self, tmp_path) -> None:
+        path = tmp_path / "all.ndjson"
+        config = {
+            "log_directory": str(tmp_path),
+            "channels": {"structured": {"type": "structured", "file_path": str(path)}},
+            "scopes": {"BUSINESS": {"min_level": "INFO", "channels": ["structured"]}},
+        }
+        mgr = LoggerManager(manager_name="StructTest", config={**config, "async_enabled": True})
+        mgr.initialize()
+        mgr.business(LogLevel.INFO, "picked", module="robot", part=5)
+        mgr.shutdown()
+        records = [r for r in read_records(path) if r["message"] == "picked"]
+        assert records and records[0]["extra"]["part"] == 5
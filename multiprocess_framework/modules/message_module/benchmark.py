@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Микробенчмарк IPC-сообщения: µs на сообщение до/после hot path (ADR-MSG-011).
+
+Сценарии:
+
+* ``build`` — только объект: ``Message.from_dict`` (Pydantic) vs ``Message.from_trusted``,
+  оба + ``to_dict()`` (как приёмник data-плоскости);
+* ``queue`` — QueueChannel поверх ``multiprocessing.Queue``: send → poll → сборка
+  Message на приёме (``from_dict`` до / ``from_trusted`` после);
+* ``socket`` — SocketChannel (граница): клиент шлёт N сообщений, приём валидирует
+  ``from_dict``; newline-JSON (до) vs wire-кадры ``wire="binary"`` (после). Кадр
+  ndarray в newline-JSON — только base64-строкой (до) против сырого буфера (после).
+
+Запуск::
+
+    python -m multiprocess_framework.modules.message_module.benchmark
+    python -m multiprocess_framework.modules.message_module.benchmark --n 5000 --only queue
+
+Результат — таблица µs/сообщение по сценариям.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import multiprocessing as mp
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from multiprocess_framework.modules.message_module import Message
+from multiprocess_framework.modules.message_module.core import wire
+
+# Типичный билет data-плоскости: кадр в SHM, в сообщении — только дескриптор.
+_TICKET: Dict[str, Any] = {
+    "type": "data",
+    "channel": "data",
+    "sender": "camera",
+    "targets": ["detector"],
+    "data_type": "frame",
+    "data": {"frame_shm": {"name": "cam_ring", "index": 3}, "camera_id": "c1", "seq_id": 12},
+    "metadata": {"trace_id": "t-1"},
+}
+
+
+def _per_msg(fn: Callable[[], Any], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def bench_build(n: int) -> List[tuple]:
+    return [
+        ("build", "from_dict + to_dict", _per_msg(lambda: Message.from_dict(_TICKET).to_dict(), n)),
+        ("build", "from_trusted + to_dict", _per_msg(lambda: Message.from_trusted(_TICKET).to_dict(), n)),
+    ]
+
+
+def bench_queue(n: int) -> List[tuple]:
+    from multiprocess_framework.modules.router_module.channels import QueueChannel
+
+    channel = QueueChannel("bench_data", mp.Queue())
+    rows = []
+    for label, build in (("from_dict", Message.from_dict), ("from_trusted", Message.from_trusted)):
+        sent = Message.from_dict(_TICKET)
+
+        def roundtrip() -> None:
+            channel.send(sent.to_dict())
+            got: List[Dict[str, Any]] = []
+            while not got:
+                got = channel.poll(timeout=0.1)
+            build(got[0])
+
+        roundtrip()  # прогрев feeder-потока очереди
+        rows.append(("queue", f"send → poll → {label}", _per_msg(roundtrip, n)))
+    channel.close()
+    return rows
+
+
+def _socket_run(
+    mode: str, payloads: List[bytes], expect: int, unpack: Callable[[Dict[str, Any]], Any] | None = None
+) -> float:
+    from multiprocess_framework.modules.router_module.channels import SocketChannel
+
+    done = threading.Event()
+    count = [0]
+
+    def on_inbound(msg: Dict[str, Any]) -> None:
+        Message.from_dict(msg)  # граница — полная валидация в обоих режимах
+        if unpack is not None:
+            unpack(msg)
+        count[0] += 1
+        if count[0] == expect:
+            done.set()
+
+    channel = SocketChannel("bench", host="127.0.0.1", port=0, on_inbound=on_inbound, wire=mode)
+    channel.start()
+    try:
+        client = socket.create_connection((channel.host, channel.port))
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        start = time.perf_counter()
+        for payload in payloads:
+            client.sendall(payload)
+        done.wait(120.0)
+        elapsed = time.perf_counter() - start
+        client.close()
+    finally:
+        channel.close()
+    return elapsed / expect * 1e6
+
+
+def bench_socket(n: int) -> List[tuple]:
+    line = (json.dumps(_TICKET) + "\n").encode("utf-8")
+    frame = wire.encode(_TICKET, codec="json")
+    rows = [
+        ("socket", "ticket, newline-JSON", _socket_run("json", [line] * n, n)),
+        ("socket", "ticket, wire binary", _socket_run("binary", [frame] * n, n)),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        return rows
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    frames = max(10, n // 50)
+    # До: кадр в newline-JSON только base64-строкой (+ декод на приёме).
+    b64 = {**_TICKET, "data": {"frame": base64.b64encode(image.tobytes()).decode("ascii"), "seq_id": 1}}
+    line = (json.dumps(b64) + "\n").encode("utf-8")
+
+    def from_b64(msg: Dict[str, Any]) -> Any:
+        return np.frombuffer(base64.b64decode(msg["data"]["frame"]), dtype=np.uint8).reshape(image.shape)
+
+    payload = wire.encode({**_TICKET, "data": {"frame": image, "seq_id": 1}}, codec="json")
+    rows.append(("socket", "480x640x3, newline-JSON base64", _socket_run("json", [line] * frames, frames, from_b64)))
+    rows.append(("socket", "480x640x3, wire binary", _socket_run("binary", [payload] * frames, frames)))
+    return rows
+
+
+_SCENARIOS = {"build": bench_build, "queue": bench_queue, "socket": bench_socket}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: прогнать сценарии и напечатать таблицу µs/сообщение."""
+    parser = argparse.ArgumentParser(prog="python -m multiprocess_framework.modules.message_module.benchmark")
+    parser.add_argument("--n", type=int, default=20000, help="сообщений на сценарий")
+    parser.add_argument("--only", choices=sorted(_SCENARIOS), help="один сценарий")
+    args = parser.parse_args(argv)
+
+    names = [args.only] if args.only else list(_SCENARIOS)
+    print(f"{'сценарий':<8} {'вариант':<32} {'µs/msg':>10}")
+    for name in names:
+        for scenario, label, us in _SCENARIOS[name](args.n):
+            print(f"{scenario:<8} {label:<32} {us:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,11 +3,13 @@
 Основные классы модуля Message.
 """
 
+from . import wire
 from .message import Message
 from ..types import MessageValidationError
 
 __all__ = [
     'Message',
     'MessageValidationError',
+    'wire',
 ]
 
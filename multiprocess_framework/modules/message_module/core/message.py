@@ -4,6 +4,10 @@ Message — IPC value object на базе SchemaBase (Pydantic v2).
 
 Единственный класс для создания, валидации и сериализации сообщений.
 Публичный API: Message.create(), to_dict(), from_dict(), MessageAdapter.
+
+Hot path (ADR-MSG-011): ``Message.from_trusted(dict)`` собирает сообщение БЕЗ
+Pydantic-валидации — для билетов доверенных внутренних отправителей (очереди
+процессов). Полная валидация (``create``/``from_dict``) остаётся на границах.
 """
 
 import json
@@ -44,6 +48,9 @@ except ImportError:
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
+# type (строка) → поля, исключаемые из to_dict; без MessageType(...) на каждый вызов.
+_TYPE_EXCLUDE: Dict[str, Set[str]] = {t.value: set(f) for t, f in MESSAGE_TYPE_EXCLUDE_FIELDS.items() if f}
+
 
 class Message(SchemaBase):
     """IPC value object: все поля через Pydantic, FieldMeta для документации."""
@@ -114,6 +121,10 @@ class Message(SchemaBase):
     @model_validator(mode="after")
     def _auto_fill_and_type_defaults(self) -> "Message":
         """Автозаполнение id, timestamp. Применение type-specific defaults."""
+        return self._auto_fill()
+
+    def _auto_fill(self) -> "Message":
+        """Общая часть валидатора и ``from_trusted``: id, timestamp, type-defaults."""
         if isinstance(self.type, MessageType):
             object.__setattr__(self, "type", self.type.value)
 
@@ -289,30 +300,34 @@ class Message(SchemaBase):
         include_fields: Optional[Set[str]] = None,
     ) -> Dict[str, Any]:
         """Конвертирует в dict (ADR-008 Dict at Boundary)."""
-        data = self.model_dump()
-
-        try:
-            msg_type = MessageType(self.type)
-            type_exclude = MESSAGE_TYPE_EXCLUDE_FIELDS.get(msg_type, set())
-            if exclude_fields:
-                exclude_fields = exclude_fields | type_exclude
-            else:
-                exclude_fields = type_exclude
-        except ValueError:
-            pass
-
-        if exclude_none:
-            data = {k: v for k, v in data.items() if v is not None}
-
-        data = {k: v for k, v in data.items() if not (isinstance(v, (list, dict)) and not v)}
-
-        if exclude_fields:
-            data = {k: v for k, v in data.items() if k not in exclude_fields}
-
-        if include_fields:
-            data = {k: v for k, v in data.items() if k in include_fields}
-
-        return data
+        if self.__dict__.get("_msg_trusted"):
+            # from_trusted: значения — plain-данные из dict, model_dump (обход
+            # схемы сериализатором) не нужен; форма та же — поля, затем extra.
+            fields = type(self).model_fields
+            data = {k: v for k, v in self.__dict__.items() if k in fields}
+            if self.__pydantic_extra__:
+                data.update(self.__pydantic_extra__)
+        else:
+            data = self.model_dump()
+
+        type_exclude = _TYPE_EXCLUDE.get(self.type)
+        if type_exclude:
+            exclude_fields = exclude_fields | type_exclude if exclude_fields else type_exclude
+
+        # Один проход вместо цепочки dict-comprehension'ов (горячий путь).
+        out: Dict[str, Any] = {}
+        for k, v in data.items():
+            if v is None:
+                if exclude_none:
+                    continue
+            elif isinstance(v, (list, dict)) and not v:
+                continue
+            if exclude_fields and k in exclude_fields:
+                continue
+            if include_fields and k not in include_fields:
+                continue
+            out[k] = v
+        return out
 
     def to_json(
         self,
@@ -380,6 +395,54 @@ class Message(SchemaBase):
 
         return cls.model_validate(data)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Message":
+        """Собрать из dict БЕЗ Pydantic-валидации (hot path, ADR-MSG-011).
+
+        Только для билетов доверенных внутренних отправителей (очереди процессов
+        фреймворка): типы полей не проверяются и не приводятся, контейнеры не
+        копируются. Автозаполнение id/timestamp и type-defaults — как у валидатора.
+        Внешний ввод (сокет, файлы) — через ``from_dict``.
+        """
+        static, factories = cls._trusted_defaults()
+        values = static.copy()
+        for name, factory in factories:
+            if name not in data:
+                values[name] = factory()
+        extra: Dict[str, Any] = {}
+        fields_set = set()
+        for key, value in data.items():
+            if key in values:
+                values[key] = value
+                fields_set.add(key)
+            else:
+                extra[key] = value
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_extra__", extra)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        instance._auto_fill()
+        values["_msg_schema"] = None
+        values["_msg_schema_info"] = None
+        values["_msg_schema_validated"] = False
+        values["_msg_trusted"] = True
+        return instance
+
+    @classmethod
+    def _trusted_defaults(cls) -> Tuple[Dict[str, Any], Tuple[Tuple[str, Any], ...]]:
+        """({поле: default} в порядке объявления, ((поле, default_factory), ...)); кэш per class."""
+        cached = cls.__dict__.get("_trusted_defaults_cache")
+        if cached is None:
+            fields = cls.model_fields
+            static = {name: info.default for name, info in fields.items()}
+            factories = tuple(
+                (name, info.default_factory) for name, info in fields.items() if info.default_factory is not None
+            )
+            cached = (static, factories)
+            type.__setattr__(cls, "_trusted_defaults_cache", cached)
+        return cached
+
     @classmethod
     def from_json(cls, json_str: str) -> "Message":
         """Из JSON."""
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+wire — компактный бинарный кадр сообщения (ADR-MSG-011).
+
+Кадр = фиксированный заголовок + таблица длин буферов + тело + сырые буферы::
+
+    !2sBBHQ  magic b"MW" | version | codec | n_buffers | payload_len
+    !{n}Q    длины out-of-band буферов
+    body     тело кодека
+    buf_0 .. buf_{n-1}
+
+``payload_len`` — всё после заголовка: потоковому читателю достаточно прочитать
+``HEADER_SIZE`` байт, чтобы знать, сколько дочитать (``frame_size``).
+
+Кодеки:
+
+- ``CODEC_PICKLE`` — pickle protocol 5 с out-of-band буферами (ndarray/bytes идут
+  сырыми байтами без копии в тело). Только доверенные внутрихостовые каналы:
+  ``decode`` отказывает без ``allow_pickle=True``.
+- ``CODEC_JSON`` — JSON-тело + ndarray/bytes сырыми буферами (в теле — ссылка
+  ``{"__ndarray__": i, "dtype", "shape"}`` / ``{"__bytes__": i}``). Безопасен на
+  границе (сокет): декодирование не исполняет код.
+
+ndarray при декодировании — read-only view над буфером кадра (без копии).
+"""
+
+import json
+import pickle
+import struct
+from typing import Any, Callable, Dict, List, Union
+
+from ..types import MessageValidationError
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+MAGIC = b"MW"
+VERSION = 1
+CODEC_PICKLE = 1
+CODEC_JSON = 2
+
+_HEADER = struct.Struct("!2sBBHQ")
+HEADER_SIZE = _HEADER.size
+
+_CODECS = {"pickle": CODEC_PICKLE, "json": CODEC_JSON}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def encode_parts(message: Dict[str, Any], codec: str = "pickle") -> List[Buffer]:
+    """
+    Закодировать dict сообщения в список частей кадра (для ``sendmsg``/``b"".join``).
+
+    Буферы ndarray/bytes отдаются как есть (memoryview), без копии в тело.
+
+    Args:
+        message: Словарь сообщения (``Message.to_dict()``)
+        codec: ``"pickle"`` (доверенный хост) или ``"json"`` (граница)
+
+    Returns:
+        [заголовок+таблица длин, тело, буфер_0, ...]
+    """
+    codec_id = _CODECS.get(codec)
+    if codec_id is None:
+        raise MessageValidationError(f"Неизвестный wire-кодек: {codec!r}")
+    buffers: List[memoryview] = []
+    if codec_id == CODEC_PICKLE:
+        body = pickle.dumps(message, protocol=5, buffer_callback=lambda pb: buffers.append(pb.raw()))
+    else:
+        try:
+            body = json.dumps(
+                message, ensure_ascii=False, separators=(",", ":"), default=_json_default(buffers)
+            ).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            raise MessageValidationError(f"wire json encode: {exc}") from exc
+    lengths = [b.nbytes for b in buffers]
+    payload_len = 8 * len(lengths) + len(body) + sum(lengths)
+    head = _HEADER.pack(MAGIC, VERSION, codec_id, len(lengths), payload_len)
+    if lengths:
+        head += struct.pack(f"!{len(lengths)}Q", *lengths)
+    return [head, body, *buffers]
+
+
+def encode(message: Dict[str, Any], codec: str = "pickle") -> bytes:
+    """Закодировать dict сообщения в один кадр ``bytes`` (см. ``encode_parts``)."""
+    return b"".join(encode_parts(message, codec))
+
+
+def frame_size(header: Buffer) -> int:
+    """
+    Полная длина кадра по первым ``HEADER_SIZE`` байтам.
+
+    Raises:
+        MessageValidationError: Чужой magic или неподдерживаемая версия
+    """
+    return HEADER_SIZE + _unpack_header(header)[4]
+
+
+def _unpack_header(header: Buffer) -> tuple:
+    fields = _HEADER.unpack_from(header)
+    if fields[0] != MAGIC:
+        raise MessageValidationError(f"wire: неверный magic {bytes(fields[0])!r}")
+    if fields[1] != VERSION:
+        raise MessageValidationError(f"wire: неподдерживаемая версия {fields[1]}")
+    return fields
+
+
+def decode(frame: Buffer, allow_pickle: bool = False) -> Dict[str, Any]:
+    """
+    Декодировать кадр в dict сообщения.
+
+    Args:
+        frame: Кадр целиком (bytes/bytearray/memoryview)
+        allow_pickle: Разрешить ``CODEC_PICKLE`` — только для доверенных каналов
+
+    Returns:
+        Словарь сообщения (собрать ``Message.from_trusted``/``Message.from_dict``)
+
+    Raises:
+        MessageValidationError: Битый кадр, чужой кодек или pickle без разрешения
+    """
+    view = memoryview(frame)
+    if view.nbytes < HEADER_SIZE:
+        raise MessageValidationError("wire: кадр короче заголовка")
+    _magic, _version, codec_id, n_buffers, payload_len = _unpack_header(view)
+    if view.nbytes != HEADER_SIZE + payload_len:
+        raise MessageValidationError(f"wire: длина кадра {view.nbytes}, в заголовке {HEADER_SIZE + payload_len}")
+    if 8 * n_buffers > payload_len:
+        raise MessageValidationError("wire: таблица буферов больше кадра")
+    offset = HEADER_SIZE
+    lengths = struct.unpack_from(f"!{n_buffers}Q", view, offset) if n_buffers else ()
+    offset += 8 * n_buffers
+    body_len = payload_len - 8 * n_buffers - sum(lengths)
+    if body_len < 0:
+        raise MessageValidationError("wire: длины буферов больше кадра")
+    body = view[offset : offset + body_len]
+    offset += body_len
+    buffers: List[memoryview] = []
+    for length in lengths:
+        buffers.append(view[offset : offset + length])
+        offset += length
+
+    if codec_id == CODEC_PICKLE:
+        if not allow_pickle:
+            raise MessageValidationError("wire: pickle-кодек запрещён на недоверенном канале")
+        message = pickle.loads(body, buffers=buffers)
+    elif codec_id == CODEC_JSON:
+        try:
+            # Без буферов ссылок нет — object_hook (и его вызов на каждый dict) не нужен.
+            hook = _object_hook(buffers) if buffers else None
+            message = json.loads(body.tobytes(), object_hook=hook)
+        except (KeyError, TypeError, ValueError, UnicodeDecodeError) as exc:
+            raise MessageValidationError(f"wire json decode: {exc}") from exc
+    else:
+        raise MessageValidationError(f"wire: неизвестный кодек {codec_id}")
+    if not isinstance(message, dict):
+        raise MessageValidationError("wire: тело кадра — не dict")
+    return message
+
+
+def _json_default(buffers: List[memoryview]) -> Callable[[Any], Any]:
+    """``default`` для json.dumps: ndarray/bytes → ссылка на буфер.
+
+    Зовётся только для не-JSON объектов — остальное дерево кодирует C-энкодер.
+    """
+
+    def default(value: Any) -> Any:
+        if isinstance(value, (bytes, bytearray)):
+            buffers.append(memoryview(value))
+            return {"__bytes__": len(buffers) - 1}
+        if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TypeError("ndarray dtype=object не сериализуется в wire json")
+            array = np.ascontiguousarray(value)
+            buffers.append(memoryview(array).cast("B"))
+            return {"__ndarray__": len(buffers) - 1, "dtype": array.dtype.str, "shape": list(array.shape)}
+        raise TypeError(f"{type(value).__name__} не сериализуется в wire json")
+
+    return default
+
+
+def _object_hook(buffers: List[memoryview]) -> Callable[[Dict[str, Any]], Any]:
+    """``object_hook`` для json.loads: ссылки → ndarray (view над кадром) / bytes."""
+
+    def hook(value: Dict[str, Any]) -> Any:
+        if "__ndarray__" in value:
+            if not NUMPY_AVAILABLE:
+                raise ValueError("ndarray в кадре, но numpy не установлен")
+            buf = buffers[_ref_index(value["__ndarray__"], buffers)]
+            return np.frombuffer(buf, dtype=np.dtype(value["dtype"])).reshape(value["shape"])
+        if "__bytes__" in value:
+            return bytes(buffers[_ref_index(value["__bytes__"], buffers)])
+        return value
+
+    return hook
+
+
+def _ref_index(index: Any, buffers: List[memoryview]) -> int:
+    if not isinstance(index, int) or not 0 <= index < len(buffers):
+        raise ValueError(f"ссылка на несуществующий буфер: {index!r}")
+    return index
+
+
+__all__ = [
+    "CODEC_JSON",
+    "CODEC_PICKLE",
+    "HEADER_SIZE",
+    "decode",
+    "encode",
+    "encode_parts",
+    "frame_size",
+]
@@ -622,3 +622,64 @@ class TestExtraFields:
         assert msg.custom_field == "value"
         d = msg.to_dict()
         assert d.get("custom_field") == "value"
+
+
+class TestFromTrusted:
+    """Hot path без Pydantic-валидации (ADR-MSG-011)."""
+
+    DATA = {
+        "type": "data",
+        "sender": "camera",
+        "targets": ["detector"],
+        "data_type": "frame",
+        "data": {"seq": 7},
+        "metadata": {"trace": "t1"},
+        "custom_field": "value",
+    }
+
+    def test_to_dict_same_as_validated(self):
+        trusted = Message.from_trusted(dict(self.DATA)).to_dict()
+        validated = Message.from_dict(dict(self.DATA)).to_dict()
+        for d in (trusted, validated):
+            assert d.pop("id").startswith("dat_")
+            d.pop("timestamp")
+        assert trusted == validated
+        assert list(trusted) == list(validated)
+
+    def test_auto_fill_and_type_defaults(self):
+        msg = Message.from_trusted({"type": "command", "sender": "s", "command": "ping"})
+        assert msg.id.startswith("cmd_")
+        assert msg.timestamp > 0
+        assert msg.targets == []
+        assert msg.get("custom_field") is None
+
+    def test_explicit_id_kept_and_extra_accessible(self):
+        msg = Message.from_trusted({**self.DATA, "id": "dat_00000001", "timestamp": 1.5})
+        assert msg.id == "dat_00000001"
+        assert msg.timestamp == 1.5
+        assert msg.custom_field == "value"
+        assert msg["data"] == {"seq": 7}
+
+    def test_mutation_after_build_reflected_in_to_dict(self):
+        msg = Message.from_trusted(dict(self.DATA))
+        msg.set_priority(Priority.HIGH).add_metadata("k", 1)
+        msg.extra2 = 2
+        d = msg.to_dict()
+        assert d["priority"] == "high"
+        assert d["metadata"] == {"trace": "t1", "k": 1}
+        assert d["extra2"] == 2
+
+    def test_no_validation(self):
+        # Доверенный путь не проверяет типы — это контракт, а не баг.
+        msg = Message.from_trusted({"type": "general", "targets": "not-a-list"})
+        assert msg.targets == "not-a-list"
+        with pytest.raises(Exception):
+            Message.from_dict({"type": "general", "targets": "not-a-list"})
+
+    def test_pickle_and_clone(self):
+        import pickle
+
+        msg = Message.from_trusted(dict(self.DATA))
+        restored = pickle.loads(pickle.dumps(msg))
+        assert restored.to_dict() == msg.to_dict()
+        assert msg.clone().data == {"seq": 7}
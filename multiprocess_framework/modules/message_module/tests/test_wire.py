@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Тесты бинарного кадра сообщения (core/wire.py, ADR-MSG-011).
+"""
+
+import numpy as np
+import pytest
+
+from ..core import wire
+from ..core.message import Message
+from ..types import MessageValidationError
+
+
+def _frame_message():
+    return {
+        "type": "data",
+        "sender": "camera",
+        "targets": ["detector"],
+        "data": {"frame": np.arange(24, dtype=np.uint8).reshape(2, 4, 3), "seq": 3},
+        "blob": b"\x00\x01\x02",
+    }
+
+
+class TestRoundtrip:
+    @pytest.mark.parametrize("codec", ["pickle", "json"])
+    def test_ndarray_and_bytes(self, codec):
+        frame = wire.encode(_frame_message(), codec=codec)
+        decoded = wire.decode(frame, allow_pickle=True)
+
+        arr = decoded["data"]["frame"]
+        assert isinstance(arr, np.ndarray)
+        assert arr.dtype == np.uint8 and arr.shape == (2, 4, 3)
+        assert np.array_equal(arr, _frame_message()["data"]["frame"])
+        assert decoded["blob"] == b"\x00\x01\x02"
+        assert decoded["data"]["seq"] == 3
+
+    @pytest.mark.parametrize("codec", ["pickle", "json"])
+    def test_buffers_out_of_band(self, codec):
+        parts = wire.encode_parts(_frame_message(), codec=codec)
+        # [заголовок, тело, буфер ndarray, ...]: пиксели не копируются в тело.
+        assert len(parts) >= 3
+        assert any(bytes(p) == bytes(range(24)) for p in parts[2:])
+
+    def test_json_ndarray_is_view_over_frame(self):
+        decoded = wire.decode(wire.encode(_frame_message(), codec="json"))
+        arr = decoded["data"]["frame"]
+        assert arr.base is not None
+        assert not arr.flags.writeable
+
+    def test_non_contiguous_array(self):
+        src = np.arange(12, dtype=np.int32).reshape(3, 4)[:, ::2]
+        decoded = wire.decode(wire.encode({"a": src}, codec="json"))
+        assert np.array_equal(decoded["a"], src)
+
+    def test_message_to_trusted(self):
+        msg = Message.from_trusted({"type": "data", "sender": "s", "data": {"seq": 1}})
+        restored = Message.from_trusted(wire.decode(wire.encode(msg.to_dict()), allow_pickle=True))
+        assert restored.to_dict() == msg.to_dict()
+
+
+class TestFraming:
+    def test_frame_size_from_header(self):
+        frame = wire.encode({"a": 1}, codec="json")
+        assert wire.frame_size(frame[: wire.HEADER_SIZE]) == len(frame)
+
+    def test_pickle_rejected_by_default(self):
+        frame = wire.encode({"a": 1}, codec="pickle")
+        with pytest.raises(MessageValidationError):
+            wire.decode(frame)
+
+    def test_bad_magic(self):
+        frame = bytearray(wire.encode({"a": 1}, codec="json"))
+        frame[0:2] = b"XX"
+        with pytest.raises(MessageValidationError):
+            wire.decode(bytes(frame))
+
+    def test_truncated(self):
+        frame = wire.encode({"a": 1}, codec="json")
+        with pytest.raises(MessageValidationError):
+            wire.decode(frame[:-1])
+
+    @pytest.mark.parametrize(
+        "ref",
+        [{"__ndarray__": 5, "dtype": "|u1", "shape": [1]}, {"__ndarray__": 0, "dtype": "bogus", "shape": [1]}],
+    )
+    def test_bad_buffer_reference(self, ref):
+        frame = wire.encode({"a": ref, "b": b"x"}, codec="json")
+        with pytest.raises(MessageValidationError):
+            wire.decode(frame)
+
+    def test_non_dict_body(self):
+        frame = wire.encode({"a": 1}, codec="json")
+        body = b"[1]"
+        head = wire._HEADER.pack(wire.MAGIC, wire.VERSION, wire.CODEC_JSON, 0, len(body))
+        with pytest.raises(MessageValidationError):
+            wire.decode(head + body)
+        assert wire.decode(frame) == {"a": 1}
+
+    def test_unknown_codec(self):
+        with pytest.raises(MessageValidationError):
+            wire.encode({"a": 1}, codec="msgpack")
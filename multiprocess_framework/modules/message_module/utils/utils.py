@@ -5,29 +5,33 @@
 Внутренние функции, используемые внутри модуля.
 """
 
-import uuid
+import random
+
+_PREFIX = {
+    "general": "gen",
+    "command": "cmd",
+    "log": "log",
+    "system": "sys",
+    "broadcast": "brd",
+    "data": "dat",
+    "request": "req",
+    "response": "res",
+    "event": "evt",
+}
 
 
 def generate_message_id(msg_type: str) -> str:
     """
     Генерирует уникальный ID для сообщения.
 
+    32 случайных бита — как прежний ``uuid4().hex[:8]``, но без syscall
+    ``os.urandom`` на каждое сообщение (hot path). ``random`` пересевается в
+    дочернем процессе после fork — ID разных процессов не совпадают.
+
     Args:
         msg_type: Тип сообщения
 
     Returns:
         Уникальный ID
     """
-    prefix_map = {
-        "general": "gen",
-        "command": "cmd",
-        "log": "log",
-        "system": "sys",
-        "broadcast": "brd",
-        "data": "dat",
-        "request": "req",
-        "response": "res",
-        "event": "evt",
-    }
-    prefix = prefix_map.get(msg_type, "msg")
-    return f"{prefix}_{uuid.uuid4().hex[:8]}"
+    return f"{_PREFIX.get(msg_type, 'msg')}_{random.getrandbits(32):08x}"
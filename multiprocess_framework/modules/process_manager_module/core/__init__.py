@@ -2,12 +2,15 @@
 Core компоненты Process Manager Module.
 """
 
+from .process_placement import PlacedProcess, partition_cpus
 from .process_priority import ProcessPriority
 from .process_registry import ProcessRegistry
 from .process_status import ProcessStatusMonitor
 from .restart_policy import RestartPolicy
 
 __all__ = [
+    "PlacedProcess",
+    "partition_cpus",
     "ProcessRegistry",
     "ProcessPriority",
     "ProcessStatusMonitor",
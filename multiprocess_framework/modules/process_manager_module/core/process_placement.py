@@ -0,0 +1,131 @@
+"""
+CPU-размещение процессов ОС: раздел ядер по ролям + env-лимиты на спавне.
+
+Отвечает за родительскую сторону ``placement`` (секция конфига процесса, см.
+``process_module/lifecycle/cpu_placement.py``):
+
+- ``PlacedProcess`` — ``Process``, который на время ``start()`` ставит env-лимиты
+  нативных пулов (OMP/MKL/OpenBLAS/OpenCV): spawn-ребёнок наследует окружение.
+  PM спавнит детей только через него (и без placement): лок окружения держит
+  каждый спавн, поэтому лимиты одного не достаются другому;
+- ``partition_cpus`` — автоплан: раздел ядер между камерами, обработкой и GUI;
+- ``placement_of`` — секция placement из proc_dict.
+
+Affinity ставит сам ребёнок (runner, до импорта класса процесса) — родителю pid
+для этого не нужен, а ребёнок пиннится раньше, чем поднимет хоть один пул.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from multiprocessing import Process
+from typing import Any, Dict, Iterator, List, Optional
+
+# os.environ — общий для всех потоков PM: рестарты идут из потока монитора, boot и
+# hot-apply — из командного. Лок не даёт двум спавнам перемешать лимиты друг друга.
+_ENV_LOCK = threading.Lock()
+
+ROLE_CAMERA = "camera"
+ROLE_PROCESSING = "processing"
+ROLE_GUI = "gui"
+
+
+def placement_of(proc_dict: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Секция ``config.placement`` proc_dict (пустой dict — размещение не задано)."""
+    config = (proc_dict or {}).get("config") or {}
+    return dict(config.get("placement") or {}) if isinstance(config, Mapping) else {}
+
+
+@contextmanager
+def scoped_environ(env: Mapping[str, str]) -> Iterator[None]:
+    """Временно выставить ``env`` в ``os.environ`` (под общим локом), затем вернуть как было.
+
+    Пустой ``env`` тоже берёт лок: спавн без лимитов иначе унаследовал бы чужие,
+    выставленные параллельным спавном соседа.
+    """
+    with _ENV_LOCK:
+        saved = {key: os.environ.get(key) for key in env}
+        os.environ.update(env)
+        try:
+            yield
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+class PlacedProcess(Process):
+    """``Process`` с env-лимитами нативных пулов на время ``start()``.
+
+    Лимиты должны действовать ДО импорта numpy в ребёнке (OpenBLAS читает env
+    один раз при загрузке), а numpy грузится раньше любого кода процесса —
+    поэтому только через наследуемое окружение спавна.
+    """
+
+    def __init__(self, *args: Any, spawn_env: Optional[Mapping[str, str]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.spawn_env: Dict[str, str] = dict(spawn_env or {})
+
+    def start(self) -> None:
+        with scoped_environ(self.spawn_env):
+            super().start()
+
+
+def available_cpus() -> List[int]:
+    """Ядра, доступные текущему процессу (affinity PM, иначе все)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def partition_cpus(roles: Mapping[str, str], cpus: Optional[Sequence[int]] = None) -> Dict[str, Dict[str, Any]]:
+    """Раздел ядер между процессами по ролям: ``{process: {"cpus": [...]}}``.
+
+    Роли: ``camera`` (источники кадров), ``gui``, остальное — ``processing``.
+    Раскладка: камеры — младшие ядра (четверть с округлением вверх, не больше ядра
+    на камеру), GUI — одно старшее ядро, обработка — всё между ними. Группа получает
+    свой пул, только
+    если остаётся хотя бы одно ядро остальным; иначе делит пул с обработкой. Внутри
+    пула процессы получают непересекающиеся срезы; процессов больше, чем ядер, —
+    по одному ядру по кругу. Лимит потоков процесса = размер его среза
+    (``resolve_thread_caps``).
+    """
+    pool = sorted({int(c) for c in cpus}) if cpus else available_cpus()
+    by_role: Dict[str, List[str]] = {ROLE_CAMERA: [], ROLE_PROCESSING: [], ROLE_GUI: []}
+    for name, role in roles.items():
+        by_role[role if role in by_role else ROLE_PROCESSING].append(name)
+    cameras, processing, gui = by_role[ROLE_CAMERA], by_role[ROLE_PROCESSING], by_role[ROLE_GUI]
+
+    gui_pool: List[int] = []
+    if gui and (cameras or processing) and len(pool) >= 3:
+        gui_pool, pool = pool[-1:], pool[:-1]
+    camera_pool: List[int] = []
+    if cameras and processing and len(pool) >= 2:
+        take = min(len(cameras), -(-len(pool) // 4), len(pool) - 1)
+        camera_pool, pool = pool[:take], pool[take:]
+
+    plan: Dict[str, Dict[str, Any]] = {}
+    for names, own in ((cameras, camera_pool), (processing, pool), (gui, gui_pool)):
+        for name, chunk in zip(names, _split(own or pool, len(names))):
+            plan[name] = {"cpus": chunk}
+    return plan
+
+
+def _split(pool: List[int], count: int) -> List[List[int]]:
+    """``count`` срезов пула: непересекающиеся при count ≤ len(pool), иначе по ядру по кругу."""
+    if count <= 0:
+        return []
+    if count > len(pool):
+        return [[pool[i % len(pool)]] for i in range(count)]
+    size, extra = divmod(len(pool), count)
+    out, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        out.append(pool[start:end])
+        start = end
+    return out
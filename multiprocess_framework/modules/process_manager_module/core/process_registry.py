@@ -9,7 +9,9 @@ from typing import Any, Callable, Dict, List, Optional
 
 from multiprocessing import Event, Process
 
+from ...process_module.lifecycle.cpu_placement import placement_env
 from .bundle_contract import build_bundle
+from .process_placement import PlacedProcess, placement_of
 from ..runner import run_process_function
 
 
@@ -171,12 +173,18 @@ class ProcessRegistry:
                 routing_meta=routing_meta,
             )
 
-            process = Process(
+            process_kwargs: Dict[str, Any] = dict(
                 target=run_process_function,
                 # system_stop_event — отдельным аргументом (inheritance), НЕ в bundle custom.
                 args=(class_path, name, stop_event, bundle, self._system_stop_event),
                 name=name,
             )
+            # CPU-размещение: env-лимиты нативных пулов должны быть в окружении спавна
+            # (numpy/OpenBLAS в ребёнке грузится раньше кода процесса). PlacedProcess —
+            # и без placement (пустой env): его start() тоже берёт лок окружения, иначе
+            # спавн из потока монитора унаследовал бы лимиты параллельного спавна соседа.
+            spawn_env = placement_env(placement_of(process_config))
+            process = PlacedProcess(spawn_env=spawn_env, **process_kwargs)
             if self.logger:
                 self.logger._log_info(f"Process '{name}' created (priority: {priority})")
             return process
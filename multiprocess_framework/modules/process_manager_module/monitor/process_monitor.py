@@ -15,6 +15,7 @@ from multiprocessing import Event
 from typing import Any
 
 from ...config_module.feature_flags import is_enabled
+from ...process_module.lifecycle import boot_profile
 from ...process_module.health.schema import HealthField, HealthStatus, health_path
 from ...worker_module import ThreadConfig, ThreadPriority
 from ..core.alert_rules import (
@@ -107,6 +108,11 @@ class ProcessMonitor:
         # Ключ — имя процесса, значение — dict[worker_name, worker_status_dict]
         self._workers_status: dict[str, dict] = {}
 
+        # Профили холодного старта (boot_profile, ADR-PM-023): последний отчёт
+        # процесса из heartbeat. Рестарт перезаписывает — видно время до кадра
+        # после рестарта.
+        self._boot_profiles: dict[str, dict] = {}
+
         # Время первого появления процесса в статусе "running" — для uptime.
         # Сбрасывается при остановке/удалении процесса.
         self._first_seen: dict[str, float] = {}
@@ -272,6 +278,9 @@ class ProcessMonitor:
         workers = msg.get("workers_status")
         if workers and isinstance(workers, dict):
             self._workers_status[sender] = workers
+        boot = msg.get("boot_profile")
+        if isinstance(boot, dict):
+            self._boot_profiles[sender] = boot
 
         # Обрабатываем статус из heartbeat (paused / running)
         reported_status = msg.get("status")
@@ -1469,6 +1478,7 @@ class ProcessMonitor:
         self._last_heartbeat.pop(process_name, None)
         self._restart_history.pop(process_name, None)
         self._workers_status.pop(process_name, None)
+        self._boot_profiles.pop(process_name, None)
         self._first_seen.pop(process_name, None)
         self._running_since.pop(process_name, None)
         self.previous_states.pop(process_name, None)
@@ -1607,6 +1617,63 @@ class ProcessMonitor:
             "failed_processes": [n for n, st in previous_snapshot.items() if st.get("status") == "failed"],
         }
 
+    def get_perf_probes(self, process: str | None = None) -> dict[str, Any]:
+        """Перцентили perf-проб из последних heartbeat'ов, слитые гистограммами (ADR-PM-022).
+
+        Воркер с ``FW_PERF_PROBES=1`` несёт в статусе ``perf_probes.<stage>.hist`` —
+        лог-бакетную гистограмму с момента сброса. Слияние — сложение счётчиков,
+        поэтому p99 процесса/системы точный, а не «максимум p99 воркеров».
+
+        Returns:
+            ``{"processes": {proc: {stage: summary}}, "stages": {stage: summary}}`` —
+            по процессам (воркеры слиты) и по всей системе; ``summary`` — форма
+            ``LatencyHistogram.summary()``. ``process`` — только этот процесс.
+        """
+        # Лениво: пакет generic на импорте монитора тянул бы GenericProcess/PipelineExecutor
+        # в каждый процесс (ProcessManagerProcess импортируется раннером).
+        from ...process_module.generic.latency_histogram import LatencyHistogram
+
+        workers_snapshot = dict(self._workers_status)  # A-11: снимок против записи из heartbeat
+        per_process: dict[str, dict[str, LatencyHistogram]] = {}
+        system: dict[str, LatencyHistogram] = {}
+        for name, workers in workers_snapshot.items():
+            if process and name != process:
+                continue
+            for worker in (workers or {}).values():
+                probes = worker.get("perf_probes") if isinstance(worker, dict) else None
+                if not isinstance(probes, dict):
+                    continue
+                for stage, stats in probes.items():
+                    hist = LatencyHistogram.decode(stats.get("hist") if isinstance(stats, dict) else None)
+                    if not hist.count:
+                        continue
+                    per_process.setdefault(name, {}).setdefault(stage, LatencyHistogram()).merge(hist)
+                    system.setdefault(stage, LatencyHistogram()).merge(hist)
+        return {
+            "processes": {
+                name: {stage: hist.summary() for stage, hist in stages.items()} for name, stages in per_process.items()
+            },
+            "stages": {stage: hist.summary() for stage, hist in system.items()},
+        }
+
+    def get_boot_report(self, process: str | None = None, top: int = 30) -> dict[str, Any]:
+        """Склейка профилей холодного старта процессов (ADR-PM-023).
+
+        Дочерний процесс шлёт ``boot_profile`` в heartbeat при каждом изменении
+        (фазы boot, ``ready``, ``first_frame``, импорты); свой профиль PM берёт
+        локально. Форма — ``boot_profile.merge_reports``: ``system`` (ось по
+        wall-часам и критический процесс), ``processes`` (по time-to-first-frame),
+        ``imports`` (модули по сумме собственного времени по процессам), ``roots``.
+        ``process`` — только этот процесс.
+        """
+        reports = dict(self._boot_profiles)  # A-11: снимок против записи из heartbeat
+        own = boot_profile.report()
+        if own is not None:
+            reports.setdefault(own["process"], own)
+        if process:
+            reports = {name: rep for name, rep in reports.items() if name == process}
+        return boot_profile.merge_reports(reports.values(), top=top)
+
     def get_supervision_snapshot(self) -> dict[str, dict[str, Any]]:
         """Per-process срез для supervision-ручки (D.1b): статус, последний exitcode,
         число рестартов в окне.
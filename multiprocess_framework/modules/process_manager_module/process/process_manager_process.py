@@ -321,6 +321,16 @@ class ProcessManagerProcess(ProcessModule):
             "process.status": (self._cmd_process_status, "Статус именованного процесса"),
             "system.shutdown": (self._cmd_system_shutdown, "Завершить систему"),
             "system.stats": (self._cmd_system_stats, "Статистика системы"),
+            "perf.probes": (
+                self._cmd_perf_probes,
+                "Перцентили perf-проб (p50/p99/p99.9/max с момента сброса) по процессам и системе "
+                "— слияние гистограмм из heartbeat; опц. data.process",
+            ),
+            "boot.report": (
+                self._cmd_boot_report,
+                "Профиль холодного старта: фазы boot, time-to-ready/first-frame и тяжёлые импорты "
+                "по процессам — склейка отчётов из heartbeat; опц. data.process, data.top",
+            ),
             "supervision.status": (
                 self._cmd_supervision_status,
                 "Supervision-снимок: epoch + per-process incarnation/restart_count/last_exit/"
@@ -331,6 +341,10 @@ class ProcessManagerProcess(ProcessModule):
             "topology.apply": (self._cmd_topology_apply, "Применить топологию процессов"),
             "topology.get": (self._cmd_topology_get, "Получить текущую топологию"),
             "topology.diff": (self._cmd_topology_diff, "Вычислить diff топологии (dry-run)"),
+            "topology.place": (
+                self._cmd_topology_place,
+                "Dry-run: cost-based размещение плагинов по процессам + diff предложенной топологии",
+            ),
             "wire.setup": (self._cmd_wire_setup, "Настроить wire-канал (SHM + routes)"),
             "wire.teardown": (self._cmd_wire_teardown, "Разобрать wire-канал"),
             "wire.status": (self._cmd_wire_status, "Статусы wire-каналов"),
@@ -503,6 +517,29 @@ class ProcessManagerProcess(ProcessModule):
         stats["processes"] = self.get_all_processes_status()
         return stats
 
+    def _cmd_perf_probes(self, data=None, **kwargs) -> dict:
+        """Перцентили perf-проб по процессам и системе (``ProcessMonitor.get_perf_probes``).
+
+        Опц. фильтр ``data["process"]``. Пусто, пока процессы не запущены с
+        ``FW_PERF_PROBES=1``. Сброс счёта — команда ``perf.reset`` самому процессу.
+        """
+        args = data if isinstance(data, dict) else {}
+        if not hasattr(self, "_process_monitor"):
+            return {"success": False, "reason": "ProcessMonitor не инициализирован"}
+        return {"success": True, **self._process_monitor.get_perf_probes(args.get("process"))}
+
+    def _cmd_boot_report(self, data=None, **kwargs) -> dict:
+        """Профиль холодного старта системы (``ProcessMonitor.get_boot_report``).
+
+        Опц. ``data["process"]`` (один процесс) и ``data["top"]`` (строк импортов).
+        Ответ целиком — вход CLI ``boot_profile`` (сравнение с baseline сборки).
+        """
+        args = data if isinstance(data, dict) else {}
+        if not hasattr(self, "_process_monitor"):
+            return {"success": False, "reason": "ProcessMonitor не инициализирован"}
+        report = self._process_monitor.get_boot_report(args.get("process"), top=int(args.get("top") or 30))
+        return {"success": True, **report}
+
     def _cmd_supervision_status(self, data=None, **kwargs) -> dict:
         """Supervision-снимок (D.1b): epoch топологии + per-process incarnation,
         restart_count, last_exit, status, pid, started_at, manual_restarts.
@@ -593,6 +630,36 @@ class ProcessManagerProcess(ProcessModule):
             return {"error": "TopologyManager not initialized"}
         return self._topology_manager.diff(td)
 
+    def _cmd_topology_place(self, data=None, **kwargs) -> dict:
+        """Dry-run: предложить слияние процессов (``propose_placement``) и показать diff.
+
+        Параметры в data: ``topology_dict`` (рецепт или чертёж), ``cores`` (дефолт —
+        ``os.cpu_count()``), ``plugin_cost_ms``, ``payload_bytes``, ``pinned``,
+        ``balance_tolerance``, ``max_process_ms``. Ничего не применяет: ответ — план,
+        предложенный ``topology_dict`` и ``diff`` относительно текущей топологии (если
+        TopologyManager сконфигурирован).
+        """
+        args = _merge_cmd_args(data, kwargs)
+        if not (td := args.get("topology_dict")):
+            return {"error": "topology_dict required"}
+        options = {
+            key: args[key]
+            for key in ("plugin_cost_ms", "payload_bytes", "pinned", "balance_tolerance", "max_process_ms")
+            if args.get(key) is not None
+        }
+        # Лениво: пакет topology тянет process_module.generic (GenericProcessConfig) —
+        # импорт PM-процесса идёт из раннера каждого дочернего процесса.
+        from ..topology.placement import propose_topology_dict
+
+        try:
+            plan, proposed = propose_topology_dict(td, cores=int(args.get("cores") or os.cpu_count() or 1), **options)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        result = {"success": True, "plan": plan.to_dict(), "topology_dict": proposed}
+        if self._topology_manager is not None:
+            result["diff"] = self._topology_manager.diff(proposed)
+        return result
+
     # -------------------------------------------------------------------------
     # Wire commands — runtime-настройка SHM-каналов между процессами
     # -------------------------------------------------------------------------
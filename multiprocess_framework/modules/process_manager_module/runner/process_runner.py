@@ -10,6 +10,7 @@ import traceback
 from multiprocessing import Event
 from typing import Any, Dict, Optional, Union
 
+from multiprocess_framework.modules.process_module.lifecycle import boot_profile
 from multiprocess_framework.modules.shared_resources_module import SharedResourcesManager
 
 from .class_loader import _ProcessLogger, _load_process_class
@@ -94,6 +95,37 @@ def _attach_stop_event_to_process_data(
     custom["stop_event"] = stop_event
 
 
+def _apply_placement(proc_dict: Optional[Dict[str, Any]], log: _ProcessLogger) -> None:
+    """Применить ``config.placement`` к текущему процессу; сбой — warning, не отказ старта."""
+    from ..core.process_placement import placement_of
+
+    placement = placement_of(proc_dict)
+    if not placement:
+        return
+    try:
+        from multiprocess_framework.modules.process_module.lifecycle.cpu_placement import apply_placement
+
+        report = apply_placement(placement)
+    except Exception as e:  # noqa: BLE001 — размещение не критично для старта процесса
+        log.warning(f"CPU placement не применён: {e}")
+        return
+    for warning in report.get("warnings", ()):
+        log.warning(f"CPU placement: {warning}")
+    log.info(f"CPU placement: cpus={report.get('cpus')} caps={report.get('caps')}")
+
+
+def _request_alloc_soak(proc_dict: Optional[Dict[str, Any]], log: _ProcessLogger) -> None:
+    """``config.alloc_soak`` → запрос soak-профиля аллокаций (стартует на boot плагинов)."""
+    config = (proc_dict or {}).get("config") or {}
+    options = config.get("alloc_soak") if isinstance(config, dict) else None
+    if not options:
+        return
+    from multiprocess_framework.modules.process_module.generic import alloc_soak
+
+    alloc_soak.request(options)
+    log.info(f"alloc soak запрошен: {options}")
+
+
 def run_process_function(
     class_path: str,
     process_name: str,
@@ -135,15 +167,26 @@ def run_process_function(
     except Exception:  # noqa: BLE001 — реестр не критичен
         pass
 
+    # Профиль холодного старта: фазы boot и импорты до первого кадра (ADR-PM-023).
+    boot_profile.start(process_name)
+
     try:
         log.info("Process starting...")
 
-        process_class = _load_process_class(class_path, log)
+        # CPU-размещение ДО импорта класса процесса: affinity и лимиты пулов должны
+        # действовать раньше, чем плагины поднимут cv2/torch/onnxruntime.
+        if isinstance(shared_resources_or_bundle, dict):
+            _apply_placement(shared_resources_or_bundle.get("config"), log)
+            _request_alloc_soak(shared_resources_or_bundle.get("config"), log)
+
+        with boot_profile.phase("class_import"):
+            process_class = _load_process_class(class_path, log)
         if process_class is None:
             return
 
         if isinstance(shared_resources_or_bundle, dict):
-            shared_resources = _build_shared_resources_from_bundle(process_name, shared_resources_or_bundle)
+            with boot_profile.phase("shm_attach"):
+                shared_resources = _build_shared_resources_from_bundle(process_name, shared_resources_or_bundle)
         else:
             shared_resources = shared_resources_or_bundle or SharedResourcesManager()
             process_data = shared_resources.get_process_data(process_name)
@@ -168,11 +211,12 @@ def run_process_function(
             elif process_data.custom:
                 process_config = process_data.custom.get("process_config", process_data.custom.copy())
 
-        process_instance = process_class(
-            name=process_name,
-            shared_resources=shared_resources,
-            config=process_config,
-        )
+        with boot_profile.phase("construct"):
+            process_instance = process_class(
+                name=process_name,
+                shared_resources=shared_resources,
+                config=process_config,
+            )
 
         if hasattr(process_instance, "initialize"):
             try:
@@ -181,6 +225,7 @@ def run_process_function(
                     _update_process_state(shared_resources, process_name, "error")
                     return
                 log.info("Process initialized")
+                boot_profile.mark("ready")
             except Exception as init_err:
                 log.error(f"Process initialization error: {init_err}")
                 traceback.print_exc()
@@ -225,3 +270,4 @@ def run_process_function(
                     process_instance.stop()
             except Exception as e:
                 log.error(f"Error during cleanup: {e}")
+        boot_profile.stop()
@@ -13,6 +13,8 @@ import time
 from unittest.mock import MagicMock
 from multiprocessing import Event
 
+import pytest
+
 from ..core.restart_policy import RestartPolicy
 from ..monitor.process_monitor import ProcessMonitor
 
@@ -1343,3 +1345,78 @@ class TestPreviousStatesConcurrency:
         finally:
             stop.set()
             writer.join(timeout=self._WRITER_MAX_SECONDS + 2.0)
+
+
+class TestPerfProbesMerge:
+    """ADR-PM-022: PM сливает гистограммы perf-проб из heartbeat'ов воркеров."""
+
+    @staticmethod
+    def _probes(values: list) -> dict:
+        from multiprocess_framework.modules.process_module.generic.latency_histogram import LatencyHistogram
+
+        hist = LatencyHistogram()
+        for v in values:
+            hist.record(v)
+        return {"send": {**hist.summary(), "hist": hist.encode()}}
+
+    def test_merges_workers_and_processes(self) -> None:
+        monitor = ProcessMonitor(_make_mock_process_manager())
+        fast = [0.5] * 990
+        slow = [20.0] * 10
+        for sender, workers in (
+            ("cam0", {"w1": {"perf_probes": self._probes(fast)}, "w2": {"status": "running"}}),
+            ("cam1", {"w1": {"perf_probes": self._probes(slow)}}),
+        ):
+            monitor._on_heartbeat_received({"sender": sender, "timestamp": 1.0, "workers_status": workers})
+
+        res = monitor.get_perf_probes()
+        assert res["processes"]["cam0"]["send"]["max_ms"] == 0.5
+        system = res["stages"]["send"]
+        assert system["count"] == 1000
+        assert system["p50_ms"] == pytest.approx(0.5, rel=0.02)
+        assert system["p999_ms"] == pytest.approx(20.0, rel=0.02)  # хвост виден только после слияния
+        assert system["max_ms"] == 20.0
+
+        only = monitor.get_perf_probes("cam1")
+        assert list(only["processes"]) == ["cam1"]
+        assert only["stages"]["send"]["count"] == 10
+
+
+class TestBootReportMerge:
+    """ADR-PM-023: PM копит boot-профили из heartbeat и склеивает их в отчёт системы."""
+
+    @staticmethod
+    def _boot(process: str, created: float, first_frame: float, cv2_ms: float) -> dict:
+        return {
+            "process": process,
+            "pid": 1,
+            "created": created,
+            "phases": [["spawn", 0.0, 400.0], ["plugin:grab.load", 500.0, cv2_ms]],
+            "marks": {"runner": 400.0, "ready": first_frame - 100.0, "first_frame": first_frame},
+            "first_frame_by": "grab",
+            "time_to_ready_ms": first_frame - 100.0,
+            "time_to_first_frame_ms": first_frame,
+            "imports": {"count": 1, "total_ms": cv2_ms, "preloaded": 300, "self": [["cv2", cv2_ms, cv2_ms, "x"]]},
+        }
+
+    def test_heartbeat_boot_profiles_merged_latest_wins(self) -> None:
+        monitor = ProcessMonitor(_make_mock_process_manager())
+        monitor._on_heartbeat_received(
+            {"sender": "cam0", "timestamp": 1.0, "boot_profile": self._boot("cam0", 10.0, 1500.0, 200.0)}
+        )
+        monitor._on_heartbeat_received(
+            {"sender": "cam1", "timestamp": 1.0, "boot_profile": self._boot("cam1", 10.2, 900.0, 150.0)}
+        )
+        monitor._on_heartbeat_received({"sender": "cam1", "timestamp": 2.0})  # heartbeat без профиля не стирает
+
+        report = monitor.get_boot_report()
+        assert [p["process"] for p in report["processes"]] == ["cam0", "cam1"]
+        assert report["system"]["critical"] == "cam0"
+        assert report["imports"][0] == ["cv2", 2, 350.0, 200.0]
+
+        # Рестарт: свежий профиль заменяет прежний.
+        monitor._on_heartbeat_received(
+            {"sender": "cam0", "timestamp": 3.0, "boot_profile": self._boot("cam0", 20.0, 700.0, 5.0)}
+        )
+        only = monitor.get_boot_report("cam0")
+        assert [p["time_to_first_frame_ms"] for p in only["processes"]] == [700.0]
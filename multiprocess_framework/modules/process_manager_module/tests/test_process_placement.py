@@ -0,0 +1,145 @@
+"""CPU-размещение процессов: раздел ядер по ролям, env на спавне, автоплан чертежа."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import threading
+
+from ..core.process_placement import PlacedProcess, partition_cpus, placement_of, scoped_environ
+from ..runner import process_runner
+from ..topology import SystemBlueprint, plan_cpu_affinity, process_roles
+
+_APP = "multiprocess_prototype.generic_process_app.GenericProcessApp"
+
+
+def _proc(name: str, *plugins: str, **fields) -> dict:
+    return {"process_name": name, "process_class": _APP, "plugins": [{"plugin_name": p} for p in plugins], **fields}
+
+
+def _blueprint(**camera_fields) -> SystemBlueprint:
+    return SystemBlueprint.model_validate(
+        {
+            "processes": [
+                _proc("camera_0", "capture", chain_targets=["detector"], **camera_fields),
+                _proc("camera_1", "capture", chain_targets=["detector"]),
+                _proc("detector", "hsv_mask", chain_targets=["painter", "gui"]),
+                _proc("painter", "contour_draw"),
+                _proc("gui", "display", protected=True),
+            ],
+        }
+    )
+
+
+def _read_env(queue) -> None:
+    queue.put(os.environ.get("OMP_NUM_THREADS"))
+
+
+def test_partition_splits_cameras_processing_and_gui():
+    roles = {"cam_0": "camera", "cam_1": "camera", "det": "processing", "draw": "processing", "gui": "gui"}
+    plan = partition_cpus(roles, range(8))
+    assert plan == {
+        "cam_0": {"cpus": [0]},
+        "cam_1": {"cpus": [1]},
+        "det": {"cpus": [2, 3, 4]},
+        "draw": {"cpus": [5, 6]},
+        "gui": {"cpus": [7]},
+    }
+
+
+def test_partition_on_small_machine_shares_cores():
+    roles = {"cam": "camera", "a": "processing", "b": "processing", "c": "processing", "gui": "gui"}
+    plan = partition_cpus(roles, [0, 1])
+    # 2 ядра: GUI своего ядра не получает, камера — одно, обработка — по кругу на оставшемся
+    assert plan["cam"] == {"cpus": [0]}
+    assert [plan[n]["cpus"] for n in ("a", "b", "c")] == [[1], [1], [1]]
+    assert plan["gui"] == {"cpus": [1]}
+    assert partition_cpus({"solo": "gui"}, [0, 1, 2]) == {"solo": {"cpus": [0, 1, 2]}}
+
+
+def test_roles_and_auto_plan_skip_explicit_placement():
+    bp = _blueprint(extras={"placement": {"cpus": [0, 1]}})
+    assert process_roles(bp) == {
+        "camera_0": "camera",
+        "camera_1": "camera",
+        "detector": "processing",
+        "painter": "processing",
+        "gui": "gui",
+    }
+    plan = plan_cpu_affinity(bp, cpus=range(6))
+    assert "camera_0" not in plan
+    # ядра 0-1 заняты явным placement → автоплан раскладывает 2..5
+    assert plan == {
+        "camera_1": {"cpus": [2]},
+        "detector": {"cpus": [3]},
+        "painter": {"cpus": [4]},
+        "gui": {"cpus": [5]},
+    }
+
+
+def test_build_configs_applies_plan_only_under_flag(monkeypatch):
+    bp = _blueprint(extras={"placement": {"cpus": [0], "cv2_threads": 1}})
+    configs = {cfg.process_name: cfg for cfg in bp.build_configs()}
+    assert configs["camera_0"].placement == {"cpus": [0], "cv2_threads": 1}
+    assert configs["detector"].placement == {}
+
+    monkeypatch.setenv("FW_CPU_AFFINITY", "1")
+    configs = {cfg.process_name: cfg for cfg in bp.build_configs()}
+    assert configs["camera_0"].placement == {"cpus": [0], "cv2_threads": 1}
+    assert all(configs[name].placement.get("cpus") for name in ("camera_1", "detector", "painter", "gui"))
+    _name, proc_dict = configs["detector"].build()
+    assert placement_of(proc_dict) == configs["detector"].placement
+
+
+def test_scoped_environ_restores_previous_values(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "8")
+    monkeypatch.delenv("OPENCV_FOR_THREADS_NUM", raising=False)
+    with scoped_environ({"OMP_NUM_THREADS": "2", "OPENCV_FOR_THREADS_NUM": "1"}):
+        assert os.environ["OMP_NUM_THREADS"] == "2"
+    assert os.environ["OMP_NUM_THREADS"] == "8"
+    assert "OPENCV_FOR_THREADS_NUM" not in os.environ
+
+
+def test_spawn_without_caps_waits_for_env_lock():
+    """Спавн без placement (пустой env) не стартует посреди чужого scoped_environ."""
+    started = threading.Event()
+
+    def spawn_plain() -> None:
+        with scoped_environ({}):
+            started.set()
+
+    with scoped_environ({"OMP_NUM_THREADS": "2"}):
+        worker = threading.Thread(target=spawn_plain)
+        worker.start()
+        assert not started.wait(0.1)
+    assert started.wait(5)
+    worker.join(timeout=5)
+
+
+def test_placed_process_child_inherits_caps():
+    queue = mp.Queue()
+    proc = PlacedProcess(target=_read_env, args=(queue,), spawn_env={"OMP_NUM_THREADS": "3"})
+    proc.start()
+    try:
+        assert queue.get(timeout=30) == "3"
+    finally:
+        proc.join(timeout=30)
+    assert os.environ.get("OMP_NUM_THREADS") != "3"
+
+
+def test_runner_applies_placement_before_class_import(monkeypatch):
+    calls, logs = [], []
+
+    def fake_apply(placement):
+        calls.append(placement)
+        return {"cpus": [1], "caps": {"blas": 1}, "warnings": ["ядра [9] недоступны процессу — пропущены"]}
+
+    from multiprocess_framework.modules.process_module.lifecycle import cpu_placement
+
+    monkeypatch.setattr(cpu_placement, "apply_placement", fake_apply)
+    log = type("L", (), {"info": lambda s, m: logs.append(m), "warning": lambda s, m: logs.append(m)})()
+
+    process_runner._apply_placement({"config": {"placement": {"cpus": [1, 9]}}}, log)
+    process_runner._apply_placement({"config": {}}, log)
+    assert calls == [{"cpus": [1, 9]}]
+    assert logs[0].startswith("CPU placement: ядра [9]")
@@ -315,6 +315,50 @@ class TestRunProcessFunction:
 
             assert ready_event.is_set(), "ready_event должен быть выставлен после успешного initialize()"
 
+    def test_boot_profile_records_phases_and_ready(self, monkeypatch) -> None:
+        """ADR-PM-023: раннер размечает фазы boot и ready; на выходе профиль снят."""
+        from multiprocess_framework.modules.process_module.lifecycle import boot_profile
+
+        stop_event = Event()
+        stop_event.set()
+        bundle = {"queues": {}, "config": {}, "custom": {}}
+        seen: dict = {}
+        real_stop = boot_profile.stop
+
+        def capture_and_stop() -> None:
+            seen.update(boot_profile.report() or {})
+            real_stop()
+
+        monkeypatch.setattr(boot_profile, "stop", capture_and_stop)
+        with patch(
+            "multiprocess_framework.modules.process_manager_module.runner.process_runner._load_process_class"
+        ) as mock_load:
+            mock_instance = MagicMock()
+            mock_instance.initialize.return_value = True
+            mock_instance.should_stop.return_value = True
+            mock_load.return_value = MagicMock(return_value=mock_instance)
+
+            run_process_function("fake.module.FakeClass", "TestProcess", stop_event, bundle)
+
+        assert seen["process"] == "TestProcess"
+        assert [row[0] for row in seen["phases"]] == ["spawn", "class_import", "shm_attach", "construct"]
+        assert seen["time_to_ready_ms"] is not None
+        assert boot_profile.get_profile() is None
+
+    def test_runner_import_does_not_pull_generic_process(self) -> None:
+        """Импорт раннера (вход spawn каждого процесса) не тянет process_module.generic:
+        его стоимость легла бы в непрозрачный ``spawn`` до ``boot_profile.start()``."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import multiprocess_framework.modules.process_manager_module.runner.process_runner\n"
+            "print('multiprocess_framework.modules.process_module.generic' in sys.modules)"
+        )
+        out = subprocess.check_output([sys.executable, "-c", code], text=True).strip()
+        assert out.splitlines()[-1] == "False"
+
     def test_ready_event_not_set_on_init_failure(self) -> None:
         """Ф3.2: провал initialize() → ready_event НЕ выставляется (ранний return)."""
         stop_event = Event()
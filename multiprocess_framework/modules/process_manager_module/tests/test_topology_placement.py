@@ -0,0 +1,143 @@
+"""propose_placement: cost-based слияние процессов SystemBlueprint + dry-run topology.place."""
+
+from __future__ import annotations
+
+import pytest
+
+from ..process.process_manager_process import ProcessManagerProcess
+from ..process.topology_manager import TopologyManager
+from ..topology import SystemBlueprint, propose_placement, propose_topology_dict
+
+_APP = "multiprocess_prototype.generic_process_app.GenericProcessApp"
+_FRAME = 640 * 480 * 3
+
+
+def _proc(name: str, *plugins: str, **fields) -> dict:
+    return {"process_name": name, "process_class": _APP, "plugins": [{"plugin_name": p} for p in plugins], **fields}
+
+
+def _color_inspect() -> dict:
+    """Форма рецепта color_inspect: камера → детектор → художник/modbus, камера → saver."""
+    return {
+        "name": "color_inspect",
+        "processes": [
+            _proc("camera_0", "capture", priority="high", chain_targets=["detector", "saver"]),
+            _proc("detector", "hsv_mask", "contour_finder", chain_targets=["painter", "modbus_sink"]),
+            _proc("painter", "contour_draw", chain_targets=["gui"]),
+            _proc("modbus_sink", "modbus_sink", priority="low"),
+            _proc("saver", "frame_saver", priority="low"),
+        ],
+        "wires": [
+            {"source": "camera_0.capture.frame", "target": "detector.hsv_mask.frame"},
+            {"source": "camera_0.capture.frame", "target": "saver.frame_saver.frame"},
+            {"source": "detector.contour_finder.frame", "target": "painter.contour_draw.frame"},
+            {"source": "detector.contour_finder.contours", "target": "painter.contour_draw.contours"},
+            {"source": "detector.contour_finder.detections", "target": "modbus_sink.modbus_sink.data"},
+        ],
+    }
+
+
+_COSTS = {
+    "camera_0": 2.0,
+    "detector.hsv_mask": 1.5,
+    "detector.contour_finder": 2.5,
+    "painter.contour_draw": 0.3,
+    "modbus_sink.modbus_sink": 0.1,
+    "saver": 1.0,
+}
+_PAYLOADS = {
+    "camera_0.capture.frame": _FRAME,
+    "detector.contour_finder.frame": _FRAME,
+    "detector.contour_finder.contours": 1000,
+    "detector.contour_finder.detections": 100,
+}
+
+
+def test_cheap_processes_merge_into_neighbours():
+    bp = SystemBlueprint.model_validate(_color_inspect())
+    plan = propose_placement(bp, cores=4, plugin_cost_ms=_COSTS, payload_bytes=_PAYLOADS)
+
+    assert plan.groups == {"camera_0": ["camera_0", "saver"], "detector": ["detector", "painter", "modbus_sink"]}
+    assert plan.capacity_ms == pytest.approx(5.0)
+    assert plan.loads_ms == pytest.approx({"camera_0": 3.0, "detector": 4.4})
+    assert (plan.crossings_before, plan.crossings_after) == (4, 1)
+    assert plan.crossing_bytes_before == 3 * _FRAME + 1100
+    assert plan.crossing_bytes_after == _FRAME
+    assert plan.warnings == []
+
+    out = plan.blueprint
+    assert out.check_structure() == []
+    detector = next(p for p in out.processes if p.process_name == "detector")
+    assert [p["plugin_name"] for p in detector.plugins] == ["hsv_mask", "contour_finder", "contour_draw", "modbus_sink"]
+    assert detector.chain_targets == ["gui"]
+    camera = next(p for p in out.processes if p.process_name == "camera_0")
+    assert camera.chain_targets == ["detector"] and camera.priority == "high"
+    assert {w.target for w in out.wires} >= {"detector.contour_draw.frame", "camera_0.frame_saver.frame"}
+    # вход не изменён
+    assert [p.process_name for p in bp.processes][-1] == "saver"
+
+
+def test_capacity_keeps_heavy_processes_apart():
+    bp = SystemBlueprint.model_validate(_color_inspect())
+    plan = propose_placement(bp, cores=4, plugin_cost_ms=_COSTS, payload_bytes=_PAYLOADS, max_process_ms=4.0)
+    assert "painter" not in plan.groups["detector"]
+    assert plan.renames["saver"] == "camera_0"
+
+
+def test_pinned_and_inspector_processes_stay_alone():
+    raw = _color_inspect()
+    raw["processes"][2]["inspector"] = {"mode": "join", "inputs": ["frame"], "primary": "frame"}
+    plan = propose_placement(
+        SystemBlueprint.model_validate(raw), cores=4, plugin_cost_ms=_COSTS, payload_bytes=_PAYLOADS, pinned=["saver"]
+    )
+    assert plan.groups["painter"] == ["painter"]
+    assert plan.groups["saver"] == ["saver"]
+
+
+def test_merge_never_closes_a_cycle_or_joins_two_sources():
+    raw = {
+        "processes": [_proc("a", "pa"), _proc("b", "pb"), _proc("c", "pc"), _proc("cam_1", "cap")],
+        "wires": [
+            {"source": "a.pa.out", "target": "b.pb.in"},
+            {"source": "b.pb.out", "target": "c.pc.in"},
+            {"source": "a.pa.out", "target": "c.pc.in2"},
+            {"source": "cam_1.cap.frame", "target": "c.pc.in3"},
+        ],
+    }
+    plan = propose_placement(SystemBlueprint.model_validate(raw), cores=1, balance_tolerance=10.0, pinned=["b"])
+    # a+c в обход закреплённого b дали бы цикл a→b→a; a+{cam_1,c} — два источника
+    assert plan.groups == {"a": ["a"], "b": ["b"], "cam_1": ["cam_1", "c"]}
+    assert any("бюджета ядер" in w for w in plan.warnings)
+
+
+def test_topology_dict_keeps_recipe_wrapper_and_extra_keys():
+    bp = _color_inspect()
+    bp["displays"] = [{"node_id": "painter.contour_draw.frame", "display_id": "main"}]
+    recipe = {"name": "color_inspect", "version": 3, "blueprint": bp}
+
+    plan, proposed = propose_topology_dict(recipe, cores=4, plugin_cost_ms=_COSTS, payload_bytes=_PAYLOADS)
+    assert proposed["version"] == 3
+    assert proposed["blueprint"]["displays"] == bp["displays"]
+    assert [p["process_name"] for p in proposed["blueprint"]["processes"]] == ["camera_0", "detector"]
+    assert plan.renames["painter"] == "detector"
+
+
+def test_topology_place_command_is_dry_run():
+    diffs = []
+    tm = TopologyManager(
+        diff_fn=lambda cur, new: diffs.append(new) or {"has_changes": True},
+        commands_fn=lambda diff, new: [{"cmd": "process.stop", "process_name": "painter"}],
+    )
+    pmp = ProcessManagerProcess.__new__(ProcessManagerProcess)
+    pmp._topology_manager = tm
+
+    result = pmp._cmd_topology_place(
+        data={"topology_dict": _color_inspect(), "cores": 4, "plugin_cost_ms": _COSTS, "payload_bytes": _PAYLOADS}
+    )
+    assert result["success"] is True
+    assert result["plan"]["crossings_after"] == 1
+    assert result["diff"]["commands_count"] == 1
+    assert diffs == [result["topology_dict"]]
+    assert tm.current_topology is None  # ничего не применено
+
+    assert pmp._cmd_topology_place(data={}) == {"error": "topology_dict required"}
@@ -9,8 +9,22 @@ C6 шаг (c): `SystemBlueprint`/`ProcessConfig`/`Wire` — чертёж ВСЕ
 `GenericProcessConfig`/`PluginConfig` (per-process конфиг) ОСТАЮТСЯ в `process_module`;
 `build_configs()` возвращает их (process_manager_module → process_module, framework-
 internal L9→L8, разрешено).
+
+`propose_placement` (placement.py) — cost-based слияние процессов чертежа: меньше
+пересечений границ процессов при сбалансированной нагрузке на бюджет ядер;
+`plan_cpu_affinity` — раздел ядер между процессами по ролям (FW_CPU_AFFINITY).
 """
 
 from .blueprint import ProcessConfig, SystemBlueprint, Wire
+from .placement import PlacementPlan, plan_cpu_affinity, process_roles, propose_placement, propose_topology_dict
 
-__all__ = ["ProcessConfig", "SystemBlueprint", "Wire"]
+__all__ = [
+    "PlacementPlan",
+    "ProcessConfig",
+    "SystemBlueprint",
+    "Wire",
+    "plan_cpu_affinity",
+    "process_roles",
+    "propose_placement",
+    "propose_topology_dict",
+]
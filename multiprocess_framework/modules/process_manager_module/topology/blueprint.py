@@ -270,6 +270,10 @@ class ProcessConfig(SchemaBase):
             base_kwargs["frame_ring_depth"] = int(frame_ring_depth)
         if copy_out_targets:
             base_kwargs["copy_out_targets"] = list(copy_out_targets)
+        # CPU-размещение (ядра + лимиты нативных пулов) — тоже только extras.
+        placement = _pick("placement", {})
+        if placement:
+            base_kwargs["placement"] = dict(placement)
 
         if plugin_configs:
             return GenericProcessConfig.from_plugins(
@@ -417,6 +421,8 @@ class SystemBlueprint(SchemaBase):
 
             src_process, _src_plugin, src_port = src_parts
             tgt_process, tgt_plugin, tgt_port_name = tgt_parts
+            if src_process == tgt_process:
+                continue  # внутрипроцессный wire — не межпроцессный вход (как в check_structure)
 
             tgt_plugin_class = plugin_class_by_addr.get((tgt_process, tgt_plugin), "")
             entry = _find_plugin_entry(tgt_plugin, tgt_plugin_class)
@@ -473,8 +479,22 @@ class SystemBlueprint(SchemaBase):
                 proc.extras = {k: v for k, v in proc.extras.items() if k != "inspector"}
 
     def build_configs(self) -> list[GenericProcessConfig]:
-        """Собрать список GenericProcessConfig для launcher."""
-        return [p.as_generic_config() for p in self.processes]
+        """Собрать список GenericProcessConfig для launcher.
+
+        ``FW_CPU_AFFINITY``: процессам без явного ``extras.placement`` — автоплан ядер
+        по ролям (``plan_cpu_affinity``); флаг off — конфиги бит-в-бит прежние.
+        """
+        configs = [p.as_generic_config() for p in self.processes]
+        from ...config_module.feature_flags import is_enabled
+
+        if is_enabled("FW_CPU_AFFINITY") and any(not cfg.placement for cfg in configs):
+            from .placement import plan_cpu_affinity
+
+            plan = plan_cpu_affinity(self)
+            for cfg in configs:
+                if not cfg.placement and cfg.process_name in plan:
+                    cfg.placement = plan[cfg.process_name]
+        return configs
 
     def shm_names(self) -> list[str]:
         """Все SHM-имена из всех процессов."""
@@ -0,0 +1,455 @@
+"""Cost-based размещение плагинов по процессам поверх SystemBlueprint.
+
+Рецепты раскладывают плагины по процессам вручную, и дешёвый плагин нередко
+живёт в собственном процессе: каждый кадр к нему и от него — полное пересечение
+границы процесса (SHM-слот, сериализация метаданных, пробуждение получателя), при
+том что сама работа плагина стоит доли миллисекунды. Оптимизатор предлагает
+разбиение, которое минимизирует пересечения границ при сбалансированной нагрузке
+на ядра:
+
+* **Единица размещения — цепочка плагинов процесса** (``ProcessConfig.plugins``).
+  Внутрипроцессная цепочка связана auto-wiring'ом, а не wire'ами — разрезать её
+  значит придумывать порты, которых в чертеже нет. Поэтому оптимизатор только
+  СЛИВАЕТ процессы; порядок исполнения слитого процесса — топологический порядок
+  исходных цепочек по wires.
+* **Стоимость** — измеренные ``plugin_cost_ms`` (мс на кадр; ключ ``"proc"`` или
+  ``"proc.plugin"`` — как их видят ``frame_trace.record_process`` /
+  ``CycleMetricsRecorder``), незаданные — ``default_cost_ms``.
+* **Вес ребра** — ``payload_bytes`` порта-источника (``"proc.plugin.port"``),
+  незаданные — ``default_payload_bytes`` (1 = просто считать пересечения).
+* **Бюджет** — ``cores`` ядер: ёмкость процесса ``max(самая дорогая цепочка,
+  total / cores) × balance_tolerance``. Жадно сливается пара соседних процессов,
+  снимающая больше всего байт с границ, пока слияние не выходит за ёмкость.
+
+Слияние запрещено, если: процесс закреплён (``pinned``, ``protected``, явный
+``inspector``, ``depends_on``, ``supervision_group``, ``extras.copy_out_targets`` —
+поля, завязанные на точный состав/имя процесса), различается ``process_class``,
+в одном процессе оказались бы два источника (цепочки без входящих wires) или два
+плагина с одним ``plugin_name``, либо слияние замкнуло бы цикл в графе процессов.
+
+Результат — валидный ``SystemBlueprint`` (имя слитого процесса — имя его
+верхней по потоку цепочки; ``chain_targets``/``depends_on`` переписаны по
+``renames``) и ``PlacementPlan`` со статистикой «до/после». Применять его — дело
+вызывающей стороны: dry-run-превью даёт команда PM ``topology.place``
+(план + ``topology.diff`` предложенного рецепта).
+
+``plan_cpu_affinity`` — раздел ядер между процессами чертежа по ролям (камеры /
+обработка / GUI), см. ``core/process_placement.py``; ``build_configs()`` применяет
+его при ``FW_CPU_AFFINITY``.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..core.process_placement import ROLE_CAMERA, ROLE_GUI, ROLE_PROCESSING, available_cpus, partition_cpus
+from .blueprint import ProcessConfig, SystemBlueprint
+
+_PRIORITY_RANK = {"low": 0, "normal": 1, "high": 2}
+
+
+@dataclass
+class PlacementPlan:
+    """Предложенное размещение и его оценка.
+
+    Attributes:
+        blueprint:  Новый чертёж (валидный SystemBlueprint).
+        groups:     Новый процесс → исходные процессы в порядке исполнения.
+        renames:    Исходный процесс → процесс, в который он попал.
+        loads_ms:   Оценка нагрузки нового процесса, мс на кадр.
+        capacity_ms: Ёмкость процесса, с которой сравнивались слияния.
+        cores:      Бюджет ядер.
+        crossings_before/after: Число межпроцессных рёбер (пар процессов).
+        crossing_bytes_before/after: Байт на кадр через границы процессов.
+        warnings:   Что не удалось уложить в бюджет.
+    """
+
+    blueprint: SystemBlueprint
+    groups: dict[str, list[str]]
+    renames: dict[str, str]
+    loads_ms: dict[str, float]
+    capacity_ms: float
+    cores: int
+    crossings_before: int
+    crossings_after: int
+    crossing_bytes_before: int
+    crossing_bytes_after: int
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """True, если хоть один процесс слит с другим."""
+        return any(len(members) > 1 for members in self.groups.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Сводка плана без чертежа (для ответа команды / лога)."""
+        return {
+            "has_changes": self.has_changes,
+            "groups": {name: list(members) for name, members in self.groups.items()},
+            "renames": dict(self.renames),
+            "loads_ms": {name: round(load, 3) for name, load in self.loads_ms.items()},
+            "capacity_ms": round(self.capacity_ms, 3),
+            "cores": self.cores,
+            "crossings_before": self.crossings_before,
+            "crossings_after": self.crossings_after,
+            "crossing_bytes_before": self.crossing_bytes_before,
+            "crossing_bytes_after": self.crossing_bytes_after,
+            "warnings": list(self.warnings),
+        }
+
+
+@dataclass
+class _Segment:
+    """Исходный процесс как неделимая цепочка плагинов."""
+
+    index: int
+    proc: ProcessConfig
+    cost_ms: float
+    plugin_names: frozenset[str]
+    pinned: bool
+    is_source: bool = False
+
+
+def propose_placement(
+    blueprint: SystemBlueprint,
+    *,
+    cores: int,
+    plugin_cost_ms: Mapping[str, float] | None = None,
+    payload_bytes: Mapping[str, int] | None = None,
+    default_cost_ms: float = 1.0,
+    default_payload_bytes: int = 1,
+    balance_tolerance: float = 1.25,
+    max_process_ms: float | None = None,
+    pinned: Iterable[str] = (),
+) -> PlacementPlan:
+    """Предложить разбиение плагинов чертежа по процессам.
+
+    Args:
+        blueprint:       Исходный чертёж (не мутируется).
+        cores:           Бюджет ядер (>= 1).
+        plugin_cost_ms:  Стоимость: ``{"proc": ms}`` или ``{"proc.plugin": ms}``.
+        payload_bytes:   Размер порта-источника: ``{"proc.plugin.port": bytes}``.
+        default_cost_ms: Стоимость плагина без замера.
+        default_payload_bytes: Размер порта без замера.
+        balance_tolerance: Допустимый перекос нагрузки над средним на ядро.
+        max_process_ms:  Явная ёмкость процесса (перекрывает расчёт по ``cores``).
+        pinned:          Имена процессов, которые нельзя сливать.
+
+    Returns:
+        PlacementPlan с новым чертежом и статистикой «до/после».
+    """
+    if cores < 1:
+        raise ValueError(f"cores: ожидается >= 1, получено {cores}")
+    if balance_tolerance < 1.0:
+        raise ValueError(f"balance_tolerance: ожидается >= 1.0, получено {balance_tolerance}")
+    costs = plugin_cost_ms or {}
+    payloads = payload_bytes or {}
+    pinned_names = set(pinned)
+
+    segments = [
+        _Segment(
+            index=i,
+            proc=proc,
+            cost_ms=_segment_cost(proc, costs, default_cost_ms),
+            plugin_names=frozenset(p.get("plugin_name", "") for p in proc.plugins),
+            pinned=proc.process_name in pinned_names or _is_pinned(proc),
+        )
+        for i, proc in enumerate(blueprint.processes)
+    ]
+    by_name = {seg.proc.process_name: seg.index for seg in segments}
+
+    # Рёбра уровня цепочек: (src, tgt, адрес порта-источника, байт на кадр).
+    seg_edges: list[tuple[int, int, str, int]] = []
+    for wire in blueprint.wires:
+        src, tgt = by_name.get(wire.source.split(".")[0]), by_name.get(wire.target.split(".")[0])
+        if src is None or tgt is None or src == tgt:
+            continue
+        seg_edges.append((src, tgt, wire.source, _payload(wire.source, payloads, default_payload_bytes)))
+    has_input = {tgt for _src, tgt, _addr, _size in seg_edges}
+    for seg in segments:
+        seg.is_source = seg.index not in has_input
+
+    total = sum(seg.cost_ms for seg in segments)
+    biggest = max((seg.cost_ms for seg in segments), default=0.0)
+    capacity = max_process_ms if max_process_ms is not None else max(biggest, total / cores) * balance_tolerance
+
+    group_of = list(range(len(segments)))
+    members: dict[int, list[int]] = {seg.index: [seg.index] for seg in segments}
+    before = _group_edges(group_of, seg_edges)
+
+    while True:
+        edges = _group_edges(group_of, seg_edges)
+        best: tuple[tuple[int, int, float], int, int] | None = None
+        for a, b in {tuple(sorted(pair)) for pair in edges}:
+            if not _can_merge(a, b, members, segments, edges, capacity):
+                continue
+            gain_bytes = _bytes(edges.get((a, b))) + _bytes(edges.get((b, a)))
+            gain_edges = len({(a, b), (b, a)} & edges.keys())
+            load = sum(segments[i].cost_ms for i in members[a] + members[b])
+            score = (gain_bytes, gain_edges, -load)
+            if best is None or score > best[0]:
+                best = (score, a, b)
+        if best is None:
+            break
+        _score, a, b = best
+        keep, drop = min(a, b), max(a, b)
+        members[keep] = members[keep] + members.pop(drop)
+        for i in members[keep]:
+            group_of[i] = keep
+
+    after = _group_edges(group_of, seg_edges)
+    return _build_plan(blueprint, segments, members, after, before, seg_edges, capacity=capacity, cores=cores)
+
+
+def propose_topology_dict(topology_dict: dict[str, Any], **kwargs: Any) -> tuple[PlacementPlan, dict[str, Any]]:
+    """То же для dict'а рецепта/чертежа: вернуть план и предложенный dict той же формы.
+
+    Рецепт v3 (``{"blueprint": {...}, ...}``) остаётся рецептом — заменяется только
+    ``blueprint``; ключи чертежа вне схемы (``displays``/``metadata`` GUI) сохраняются.
+    ``displays[].node_id`` слитых процессов НЕ переписываются — для этого ``renames``.
+    """
+    wrapped = isinstance(topology_dict.get("blueprint"), dict)
+    bp_dict = topology_dict["blueprint"] if wrapped else topology_dict
+    plan = propose_placement(SystemBlueprint.model_validate(bp_dict), **kwargs)
+    new_bp = {**bp_dict, **plan.blueprint.model_dump(mode="json")}
+    return plan, ({**topology_dict, "blueprint": new_bp} if wrapped else new_bp)
+
+
+# --- Вспомогательные функции ---
+
+
+def _is_pinned(proc: ProcessConfig) -> bool:
+    extras = proc.extras or {}
+    return bool(
+        proc.protected
+        or proc.inspector
+        or extras.get("inspector")
+        or proc.depends_on
+        or proc.supervision_group
+        or extras.get("copy_out_targets")
+    )
+
+
+def _segment_cost(proc: ProcessConfig, costs: Mapping[str, float], default_ms: float) -> float:
+    if proc.process_name in costs:
+        return float(costs[proc.process_name])
+    return sum(float(costs.get(f"{proc.process_name}.{p.get('plugin_name', '')}", default_ms)) for p in proc.plugins)
+
+
+def _payload(address: str, payloads: Mapping[str, int], default: int) -> int:
+    if address in payloads:
+        return int(payloads[address])
+    return int(payloads.get(address.rsplit(".", 1)[0], default))
+
+
+def _bytes(ports: dict[str, int] | None) -> int:
+    return sum(ports.values()) if ports else 0
+
+
+def _group_edges(
+    group_of: list[int], seg_edges: list[tuple[int, int, str, int]]
+) -> dict[tuple[int, int], dict[str, int]]:
+    """Рёбра между группами: (src, tgt) → {порт-источник: байт}. Порт считается один раз."""
+    edges: dict[tuple[int, int], dict[str, int]] = {}
+    for src, tgt, addr, size in seg_edges:
+        gs, gt = group_of[src], group_of[tgt]
+        if gs != gt:
+            edges.setdefault((gs, gt), {})[addr] = size
+    return edges
+
+
+def _can_merge(
+    a: int,
+    b: int,
+    members: dict[int, list[int]],
+    segments: list[_Segment],
+    edges: dict[tuple[int, int], dict[str, int]],
+    capacity: float,
+) -> bool:
+    segs = [segments[i] for i in members[a] + members[b]]
+    if any(seg.pinned for seg in segs):
+        return False
+    if len({seg.proc.process_class for seg in segs}) > 1:
+        return False
+    if sum(seg.is_source for seg in segs) > 1:
+        return False
+    if sum(seg.cost_ms for seg in segs) > capacity:
+        return False
+    names = [n for seg in segs for n in seg.plugin_names]
+    if len(names) != len(set(names)):
+        return False
+    # Путь a → … → b через третий процесс: слияние замкнуло бы цикл.
+    return not (_reaches(a, b, edges) or _reaches(b, a, edges))
+
+
+def _reaches(start: int, goal: int, edges: dict[tuple[int, int], dict[str, int]]) -> bool:
+    adjacency: dict[int, list[int]] = {}
+    for src, tgt in edges:
+        adjacency.setdefault(src, []).append(tgt)
+    stack = [n for n in adjacency.get(start, []) if n != goal]
+    seen = set(stack)
+    while stack:
+        node = stack.pop()
+        for nxt in adjacency.get(node, []):
+            if nxt == goal:
+                return True
+            if nxt not in seen:
+                seen.add(nxt)
+                stack.append(nxt)
+    return False
+
+
+def _execution_order(group: list[int], seg_edges: list[tuple[int, int, str, int]]) -> list[int]:
+    """Топологический порядок цепочек внутри группы (при равенстве — исходный порядок)."""
+    inside = set(group)
+    indegree = dict.fromkeys(group, 0)
+    successors: dict[int, set[int]] = {i: set() for i in group}
+    for src, tgt, _addr, _size in seg_edges:
+        if src in inside and tgt in inside and tgt not in successors[src]:
+            successors[src].add(tgt)
+            indegree[tgt] += 1
+    ready = [i for i in group if indegree[i] == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        node = heapq.heappop(ready)
+        order.append(node)
+        for nxt in successors[node]:
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                heapq.heappush(ready, nxt)
+    return order
+
+
+def _chain_targets(proc: ProcessConfig) -> list[str]:
+    if "chain_targets" in proc.model_fields_set:
+        return list(proc.chain_targets)
+    return list((proc.extras or {}).get("chain_targets") or [])
+
+
+def _build_plan(
+    blueprint: SystemBlueprint,
+    segments: list[_Segment],
+    members: dict[int, list[int]],
+    after: dict[tuple[int, int], dict[str, int]],
+    before: dict[tuple[int, int], dict[str, int]],
+    seg_edges: list[tuple[int, int, str, int]],
+    *,
+    capacity: float,
+    cores: int,
+) -> PlacementPlan:
+    orders = {key: _execution_order(group, seg_edges) for key, group in members.items()}
+    renames: dict[str, str] = {}
+    for order in orders.values():
+        anchor = segments[order[0]].proc.process_name
+        for i in order:
+            renames[segments[i].proc.process_name] = anchor
+
+    processes: list[ProcessConfig] = []
+    groups: dict[str, list[str]] = {}
+    loads: dict[str, float] = {}
+    warnings: list[str] = []
+    for key in sorted(orders):
+        procs = [segments[i].proc for i in orders[key]]
+        anchor = procs[0]
+        name = anchor.process_name
+        groups[name] = [p.process_name for p in procs]
+        loads[name] = sum(segments[i].cost_ms for i in orders[key])
+        if loads[name] > capacity:
+            warnings.append(f"'{name}': {loads[name]:.2f} мс на кадр > ёмкости процесса {capacity:.2f} мс")
+
+        data = anchor.model_dump(exclude_unset=True)
+        data["process_name"] = name
+        data["plugins"] = [dict(p) for proc in procs for p in proc.plugins]
+        data["priority"] = max((p.priority for p in procs), key=lambda v: _PRIORITY_RANK.get(v, 1))
+        targets = [renames.get(t, t) for proc in procs for t in _chain_targets(proc)]
+        if any(_chain_targets(proc) for proc in procs):
+            data["chain_targets"] = [t for t in dict.fromkeys(targets) if t != name]
+            data["extras"] = {k: v for k, v in (anchor.extras or {}).items() if k != "chain_targets"}
+        if anchor.depends_on:
+            data["depends_on"] = [d for d in dict.fromkeys(renames.get(d, d) for d in anchor.depends_on) if d != name]
+        processes.append(ProcessConfig.model_validate(data))
+
+    if len(processes) > cores:
+        warnings.append(f"процессов {len(processes)} > бюджета ядер {cores}: ограничения не дают слить больше")
+
+    wires = []
+    for wire in blueprint.wires:
+        data = wire.model_dump(exclude_unset=True)
+        for end in ("source", "target"):
+            proc_name, _, rest = getattr(wire, end).partition(".")
+            data[end] = f"{renames.get(proc_name, proc_name)}.{rest}" if rest else getattr(wire, end)
+        wires.append(data)
+
+    new_bp = SystemBlueprint.model_validate(
+        {**blueprint.model_dump(exclude_unset=True), "processes": processes, "wires": wires}
+    )
+    return PlacementPlan(
+        blueprint=new_bp,
+        groups=groups,
+        renames=renames,
+        loads_ms=loads,
+        capacity_ms=capacity,
+        cores=cores,
+        crossings_before=len(before),
+        crossings_after=len(after),
+        crossing_bytes_before=sum(_bytes(p) for p in before.values()),
+        crossing_bytes_after=sum(_bytes(p) for p in after.values()),
+        warnings=warnings,
+    )
+
+
+def process_roles(blueprint: SystemBlueprint) -> dict[str, str]:
+    """Роль процесса для раздела ядер (``partition_cpus``): camera | gui | processing.
+
+    ``gui`` — protected-процессы и потребители копий кадра (``extras.copy_out_targets``,
+    дефолт framework — ``gui``); ``camera`` — источник: есть исходящие wires/chain_targets
+    и нет входящих; остальное — ``processing``.
+    """
+    names = {proc.process_name for proc in blueprint.processes}
+    copy_out = {"gui"}
+    inbound: set[str] = set()
+    outbound: set[str] = set()
+    for proc in blueprint.processes:
+        copy_out.update((proc.extras or {}).get("copy_out_targets") or ())
+        targets = [t for t in _chain_targets(proc) if t in names and t != proc.process_name]
+        if targets:
+            outbound.add(proc.process_name)
+            inbound.update(targets)
+    for wire in blueprint.wires:
+        src, tgt = wire.source.split(".")[0], wire.target.split(".")[0]
+        if src != tgt:
+            outbound.add(src)
+            inbound.add(tgt)
+
+    roles: dict[str, str] = {}
+    for proc in blueprint.processes:
+        name = proc.process_name
+        if proc.protected or name in copy_out:
+            roles[name] = ROLE_GUI
+        elif name in outbound and name not in inbound:
+            roles[name] = ROLE_CAMERA
+        else:
+            roles[name] = ROLE_PROCESSING
+    return roles
+
+
+def plan_cpu_affinity(blueprint: SystemBlueprint, cpus: Iterable[int] | None = None) -> dict[str, dict[str, Any]]:
+    """Автоплан ``placement`` для процессов чертежа без явного ``extras.placement``.
+
+    Ядра явно размещённых процессов из пула исключаются (если что-то остаётся) —
+    автоплан не садит соседей на их ядра.
+    """
+    pool = sorted(set(cpus)) if cpus is not None else available_cpus()
+    explicit = {
+        proc.process_name: (proc.extras or {}).get("placement")
+        for proc in blueprint.processes
+        if (proc.extras or {}).get("placement")
+    }
+    reserved = {int(c) for placement in explicit.values() for c in placement.get("cpus") or ()}
+    free = [c for c in pool if c not in reserved] or pool
+    roles = {name: role for name, role in process_roles(blueprint).items() if name not in explicit}
+    return partition_cpus(roles, free)
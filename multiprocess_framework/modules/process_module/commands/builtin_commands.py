@@ -916,11 +916,62 @@ class BuiltinCommands:
                 self._cmd_observability_tail_unsubscribe,
                 "Снять подписку на live-хвост наблюдаемости процесса",
             ),
+            (
+                "trace.sample",
+                self._cmd_trace_sample,
+                "Трассировать каждый N-й кадр источников процесса (0 — выключить)",
+            ),
+            (
+                "trace.dump",
+                self._cmd_trace_dump,
+                "Снимок кольца спанов frame_trace процесса (для таймлайна Chrome/Perfetto)",
+            ),
+            (
+                "profile.start",
+                self._cmd_profile_start,
+                "Запустить сэмплирующий профайлер стеков процесса на N секунд (collapsed stacks)",
+            ),
+            (
+                "profile.status",
+                self._cmd_profile_status,
+                "Состояние профайлера стеков: samples, overhead, путь к collapsed-файлу",
+            ),
+            (
+                "profile.stop",
+                self._cmd_profile_stop,
+                "Досрочно остановить профайлер стеков и записать collapsed-файл",
+            ),
+            (
+                "perf.reset",
+                self._cmd_perf_reset,
+                "Сбросить гистограммы perf-проб процесса (p99/max — с момента сброса)",
+            ),
+            (
+                "alloc.start",
+                self._cmd_alloc_start,
+                "Включить soak-профиль аллокаций на кадр по плагинам (tracemalloc)",
+            ),
+            (
+                "alloc.status",
+                self._cmd_alloc_status,
+                "Состояние soak-профиля аллокаций: кадры, прогрев, память tracemalloc",
+            ),
+            (
+                "alloc.dump",
+                self._cmd_alloc_dump,
+                "Отчёт soak-профиля аллокаций процесса (байт/блоков на кадр по владельцам)",
+            ),
+            (
+                "alloc.stop",
+                self._cmd_alloc_stop,
+                "Остановить soak-профиль аллокаций и выключить tracemalloc",
+            ),
         ]
         for name, handler, desc in specs:
             cm.register_command(name, handler, metadata={"description": desc}, tags=["system"])
         self._services._log_debug(
-            "Встроенные команды config.reload / telemetry.reconfigure / logger.sink.* / log.tail.* зарегистрированы",
+            "Встроенные команды config.reload / telemetry.reconfigure / logger.sink.* / log.tail.* / trace.* "
+            "/ profile.* / perf.reset / alloc.* зарегистрированы",
             module="lifecycle",
         )
 
@@ -1155,6 +1206,174 @@ class BuiltinCommands:
         ok = logger.set_sink_enabled(name, enabled)
         return {"success": bool(ok), "sink": name, "enabled": enabled, "process": svc.name}
 
+    def _cmd_trace_sample(self, data=None, **kwargs) -> dict:
+        """Сменить шаг сэмплинга frame_trace: ``every`` = N (каждый N-й кадр), 0 — выкл.
+
+        Действует на источники ЭТОГО процесса (решение о трассировке кадра
+        принимается при рождении в produce); узлы ниже трассируют выбранные кадры
+        без настройки. Без ``every`` — только текущий шаг.
+        """
+        from ..generic import frame_trace
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        if args.get("every") is None:
+            return {"success": True, "every": frame_trace.sample_every(), "process": svc.name}
+        try:
+            every = int(args["every"])
+        except (TypeError, ValueError):
+            return {"success": False, "reason": f"every должен быть целым: {args['every']!r}"}
+        if every < 0:
+            return {"success": False, "reason": "every должен быть ≥ 0"}
+        prev = frame_trace.set_sample_every(every)
+        return {"success": True, "every": every, "previous": prev, "process": svc.name}
+
+    def _cmd_trace_dump(self, data=None, **kwargs) -> dict:
+        """Снимок кольца спанов процесса (``trace_ring.SpanRing.snapshot``).
+
+        ``path`` (каталог) — снимок пишется в ``<path>/<process>-<pid>.trace.json``,
+        в ответе только путь (кольцо в тысячи спанов не гоняем через IPC);
+        без ``path`` — снимок inline в ``dump``. ``clear`` — очистить кольцо.
+        Склейка снимков всех процессов — ``trace_ring.merge_dumps`` / CLI модуля.
+        """
+        import json
+
+        from ..generic.trace_ring import RING
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        dump = RING.snapshot(process=svc.name, clear=bool(args.get("clear", False)))
+        directory = args.get("path")
+        if not directory:
+            return {"success": True, "process": svc.name, "dump": dump}
+        target = os.path.join(str(directory), f"{svc.name}-{dump['pid']}.trace.json")
+        try:
+            os.makedirs(str(directory), exist_ok=True)
+            with open(target, "w", encoding="utf-8") as fh:
+                json.dump(dump, fh)
+        except OSError as exc:
+            return {"success": False, "reason": f"не удалось записать {target}: {exc}"}
+        return {"success": True, "process": svc.name, "path": target, "spans": len(dump["spans"])}
+
+    def _cmd_profile_start(self, data=None, **kwargs) -> dict:
+        """Запустить профайлер стеков процесса (``stack_profiler.StackProfiler``).
+
+        ``seconds`` (дефолт 10, потолок ``MAX_SECONDS``), ``interval_ms``
+        (дефолт 10), ``path`` — каталог collapsed-файла (дефолт — tmp). Профиль
+        идёт в фоне: ответ сразу, файл — по истечении или ``profile.stop``;
+        забрать — ``profile.status`` (путь или ``collapsed`` inline).
+        """
+        from ..generic.stack_profiler import get_profiler
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        try:
+            seconds = float(args.get("seconds") if args.get("seconds") is not None else 10.0)
+            interval_ms = float(args.get("interval_ms") if args.get("interval_ms") is not None else 10.0)
+        except (TypeError, ValueError):
+            return {"success": False, "reason": "seconds/interval_ms должны быть числами"}
+        if seconds <= 0 or interval_ms <= 0:
+            return {"success": False, "reason": "seconds и interval_ms должны быть > 0"}
+        status = get_profiler(svc.name).start(seconds, interval_ms, str(args.get("path") or ""))
+        return {**status, "process": svc.name}
+
+    def _cmd_profile_status(self, data=None, **kwargs) -> dict:
+        """Состояние профайлера стеков; ``collapsed=true`` — стеки inline (без доступа к ФС)."""
+        from ..generic.stack_profiler import get_profiler
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        profiler = get_profiler(svc.name)
+        reply = {"success": True, **profiler.status(), "process": svc.name}
+        if args.get("collapsed"):
+            reply["collapsed"] = profiler.collapsed()
+        return reply
+
+    def _cmd_profile_stop(self, data=None, **kwargs) -> dict:
+        """Досрочно остановить профайлер стеков (collapsed-файл пишется сразу)."""
+        from ..generic.stack_profiler import get_profiler
+
+        svc = self._services
+        return {"success": True, **get_profiler(svc.name).stop(), "process": svc.name}
+
+    def _cmd_perf_reset(self, data=None, **kwargs) -> dict:
+        """Сбросить perf-пробы всех воркеров процесса (``perf_probes.reset_all``).
+
+        Перцентили и ``max`` в heartbeat дальше считаются с момента сброса;
+        слитый вид по системе — ``perf.probes`` в ProcessManager.
+        """
+        from ..generic import perf_probes
+
+        svc = self._services
+        return {"success": True, "reset": perf_probes.reset_all(), "process": svc.name}
+
+    def _cmd_alloc_start(self, data=None, **kwargs) -> dict:
+        """Включить soak-профиль аллокаций процесса (``alloc_soak.AllocSoak``).
+
+        ``nframe`` (глубина traceback, дефолт 16), ``top`` (строк ``sites``),
+        ``warmup`` (кадров до baseline, дефолт 50), ``path`` — каталог отчёта на
+        ``alloc.stop``/shutdown. tracemalloc тормозит процесс — только soak-прогон.
+        """
+        from ..generic import alloc_soak
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        try:
+            nframe = int(args.get("nframe") if args.get("nframe") is not None else alloc_soak.DEFAULT_NFRAME)
+            top = int(args.get("top") if args.get("top") is not None else alloc_soak.DEFAULT_TOP)
+            warmup = int(args.get("warmup") if args.get("warmup") is not None else alloc_soak.DEFAULT_WARMUP)
+        except (TypeError, ValueError):
+            return {"success": False, "reason": "nframe/top/warmup должны быть целыми"}
+        if nframe < 1 or top < 1 or warmup < 0:
+            return {"success": False, "reason": "nframe и top должны быть ≥ 1, warmup ≥ 0"}
+        status = alloc_soak.get_soak(svc.name).start(nframe, top, warmup, str(args.get("path") or ""))
+        return {**status, "process": svc.name}
+
+    def _cmd_alloc_status(self, data=None, **kwargs) -> dict:
+        """Состояние soak-профиля аллокаций процесса."""
+        from ..generic.alloc_soak import get_soak
+
+        svc = self._services
+        return {"success": True, **get_soak(svc.name).status(), "process": svc.name}
+
+    def _cmd_alloc_dump(self, data=None, **kwargs) -> dict:
+        """Отчёт soak-профиля (``AllocSoak.report``); soak продолжается, если не ``stop``.
+
+        ``path`` (каталог) — отчёт пишется в ``<path>/<process>-<pid>.alloc.json``,
+        в ответе только путь; без ``path`` — отчёт inline в ``report``. Склейка
+        отчётов всех процессов и сравнение с прошлой сборкой — CLI ``alloc_soak``.
+        """
+        from ..generic.alloc_soak import get_soak, write_report
+
+        args = self._merge_args(data, kwargs)
+        svc = self._services
+        soak = get_soak(svc.name)
+        report = soak.stop() if args.get("stop") else soak.report()
+        directory = args.get("path")
+        if not directory:
+            return {"success": True, "process": svc.name, "report": report}
+        try:
+            target = write_report(report, str(directory))
+        except OSError as exc:
+            return {"success": False, "reason": f"не удалось записать отчёт в {directory}: {exc}"}
+        return {"success": True, "process": svc.name, "path": target, "frames": report.get("frames", 0)}
+
+    def _cmd_alloc_stop(self, data=None, **kwargs) -> dict:
+        """Остановить soak-профиль; отчёт пишется в каталог из ``alloc.start``, если он задан."""
+        from ..generic.alloc_soak import get_soak, write_report
+
+        svc = self._services
+        soak = get_soak(svc.name)
+        report = soak.stop()
+        reply = {"success": True, "process": svc.name, "frames": report.get("frames", 0)}
+        reply["bytes_per_frame"] = report.get("bytes_per_frame", 0.0)
+        if soak.path and report:
+            try:
+                reply["path"] = write_report(report, soak.path)
+            except OSError as exc:
+                return {"success": False, "reason": f"не удалось записать отчёт в {soak.path}: {exc}"}
+        return reply
+
     def _cmd_log_tail_subscribe(self, data=None, **kwargs) -> dict:
         """Подписать адрес на LogRecord'ы процесса с level ≥ порога (Ф1 Task 1.5).
 
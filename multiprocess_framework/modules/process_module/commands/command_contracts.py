@@ -180,6 +180,61 @@ class HealthReportParams(BaseModel):
     status: Optional[str] = None
 
 
+class TraceSampleParams(BaseModel):
+    """Параметры ``trace.sample`` (шаг сэмплинга frame_trace)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    every: Optional[int] = None
+
+
+class TraceDumpParams(BaseModel):
+    """Параметры ``trace.dump`` (снимок кольца спанов процесса)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    path: Optional[str] = None  # каталог: снимок пишется в файл, в ответе — путь
+    clear: Optional[bool] = None
+
+
+class ProfileStartParams(BaseModel):
+    """Параметры ``profile.start`` (сэмплирующий профайлер стеков процесса)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    seconds: Optional[float] = None
+    interval_ms: Optional[float] = None
+    path: Optional[str] = None  # каталог collapsed-файла; None — tmp
+
+
+class ProfileStatusParams(BaseModel):
+    """Параметры ``profile.status``."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    collapsed: Optional[bool] = None  # вернуть collapsed stacks inline
+
+
+class AllocStartParams(BaseModel):
+    """Параметры ``alloc.start`` (soak-профиль аллокаций на кадр)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    nframe: Optional[int] = None  # глубина traceback аллокации
+    top: Optional[int] = None  # строк sites в отчёте
+    warmup: Optional[int] = None  # кадров прогрева до baseline
+    path: Optional[str] = None  # каталог отчёта на alloc.stop / shutdown
+
+
+class AllocDumpParams(BaseModel):
+    """Параметры ``alloc.dump``."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    path: Optional[str] = None  # каталог: отчёт пишется в файл, в ответе — путь
+    stop: Optional[bool] = None  # остановить soak после снятия отчёта
+
+
 #: Реестр контрактов built-in команд: имя команды → Pydantic-схема параметров.
 #: Наполняется в BuiltinCommands._register_message_guards.
 BUILTIN_COMMAND_CONTRACTS: Dict[str, Type[BaseModel]] = {
@@ -209,6 +264,20 @@ BUILTIN_COMMAND_CONTRACTS: Dict[str, Type[BaseModel]] = {
     "log.tail.unsubscribe": LogTailUnsubscribeParams,
     "observability.tail.subscribe": ObservabilityTailSubscribeParams,
     "observability.tail.unsubscribe": ObservabilityTailUnsubscribeParams,
+    # frame tracing: сэмплинг + снимок кольца спанов (таймлайн Chrome/Perfetto)
+    "trace.sample": TraceSampleParams,
+    "trace.dump": TraceDumpParams,
+    # on-demand профайлер стеков (collapsed stacks для flamegraph)
+    "profile.start": ProfileStartParams,
+    "profile.status": ProfileStatusParams,
+    "profile.stop": NoParams,
+    # гистограммы perf-проб: сброс счёта (слитый вид — perf.probes в ProcessManager)
+    "perf.reset": NoParams,
+    # soak-профиль аллокаций на кадр (склейка отчётов — alloc_soak CLI)
+    "alloc.start": AllocStartParams,
+    "alloc.status": NoParams,
+    "alloc.dump": AllocDumpParams,
+    "alloc.stop": NoParams,
     # health (Ф2 Task 2.1)
     "health.report": HealthReportParams,
     "health.status": NoParams,
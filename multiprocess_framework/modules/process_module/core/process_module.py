@@ -146,30 +146,38 @@ class ProcessModule(BaseManager, ObservableMixin, IProcessModule):
         Returns:
             bool: True если инициализация успешна
         """
+        # Фазы boot — в профиль холодного старта (ADR-PM-023); вне раннера профиля
+        # нет и phase() — no-op. Импорт ленивый: пакет generic импортирует core.
+        from ..lifecycle import boot_profile
+
         try:
             # 1-2. Конфигурация и очереди
-            self._init_configuration()
-            self._init_queues()
+            with boot_profile.phase("config"):
+                self._init_configuration()
+                self._init_queues()
 
             # 3. Инициализация менеджеров через ManagersBundle
-            self._init_managers()
+            with boot_profile.phase("managers"):
+                self._init_managers()
 
             # 4. Инициализация коммуникации
-            self._init_communication()
-
             # 5. Регистрация состояния процесса
-            self._register_process_state()
+            with boot_profile.phase("communication"):
+                self._init_communication()
+                self._register_process_state()
 
             # 6. Воркеры и кастомные менеджеры — до message_processor,
             #    чтобы register_message_handler успел зарегистрироваться
-            self._init_custom_managers()
-            self._init_application_threads()
+            with boot_profile.phase("plugins"):
+                self._init_custom_managers()
+                self._init_application_threads()
 
             # 6b. P4.4.1 (B2): команды НЕ копируются в event_dispatcher — kind-router
             # в receive() диспатчит type=="command" напрямую в CommandManager.
 
             # 7. Системные потоки (message_processor) — после воркеров
-            self._init_system_threads()
+            with boot_profile.phase("threads"):
+                self._init_system_threads()
 
             # 8. Обновляем статус на "ready"
             self.update_process_state(status=ProcessStatus.READY.value)
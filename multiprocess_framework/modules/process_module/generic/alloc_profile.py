@@ -34,15 +34,20 @@ class AllocProfiler:
     только для soak-замеров G.7.
     """
 
-    def __init__(self, *, nframes_top: int = 10) -> None:
+    def __init__(self, *, nframes_top: int = 10, nframe: int = 1) -> None:
         self._nframes_top = max(1, int(nframes_top))
+        self._nframe = max(1, int(nframe))
         self._baseline: Optional[Any] = None
         self._started_here = False
 
     def start(self) -> None:
-        """Включить tracemalloc (если ещё не включён кем-то). Идемпотентно."""
+        """Включить tracemalloc (если ещё не включён кем-то). Идемпотентно.
+
+        ``nframe`` (глубина traceback аллокации) действует только если tracemalloc
+        включает этот профайлер; уже включённый чужой трассировщик не перезапускается.
+        """
         if not tracemalloc.is_tracing():
-            tracemalloc.start()
+            tracemalloc.start(self._nframe)
             self._started_here = True
 
     def mark(self) -> None:
@@ -55,11 +60,8 @@ class AllocProfiler:
         Возвращает ``{bytes_per_frame, blocks_per_frame, total_bytes, total_blocks, top}``,
         где ``top`` — крупнейшие источники аллокаций (файл:строка, +байт). ``frames`` ≥ 1.
         """
-        if self._baseline is None:
-            raise RuntimeError("AllocProfiler.per_frame до mark(): нет baseline-снимка")
         frames = max(1, int(frames))
-        current = tracemalloc.take_snapshot()
-        diff = current.compare_to(self._baseline, "lineno")
+        diff = self.diff("lineno")
         total_bytes = sum(d.size_diff for d in diff)
         total_blocks = sum(d.count_diff for d in diff)
         top: List[Tuple[str, int, int]] = [
@@ -75,6 +77,21 @@ class AllocProfiler:
             "top": top,
         }
 
+    def diff(self, key_type: str = "lineno", filters: Optional[List[Any]] = None) -> List[Any]:
+        """Сырой diff текущего снимка с baseline (``tracemalloc.StatisticDiff``).
+
+        ``key_type="traceback"`` — группировка по полному стеку аллокации (глубина —
+        ``nframe``); ``filters`` — ``tracemalloc.Filter``/``DomainFilter`` к обоим снимкам.
+        """
+        if self._baseline is None:
+            raise RuntimeError("AllocProfiler.diff до mark(): нет baseline-снимка")
+        current = tracemalloc.take_snapshot()
+        baseline = self._baseline
+        if filters:
+            current = current.filter_traces(filters)
+            baseline = baseline.filter_traces(filters)
+        return current.compare_to(baseline, key_type)
+
     def stop(self) -> None:
         """Выключить tracemalloc, ЕСЛИ его включил этот профайлер. Идемпотентно."""
         if self._started_here and tracemalloc.is_tracing():
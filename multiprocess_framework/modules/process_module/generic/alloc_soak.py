@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+"""alloc_soak — soak-режим профиля аллокаций на кадр по плагинам и процессам.
+
+``AllocProfiler`` меряет байт/блоков на кадр только в ручном harness и только для
+одного процесса. Здесь тот же snapshot-diff tracemalloc включается в живом
+процессе пайплайна и раскладывается по владельцам:
+
+- ``plugin:<name>`` — аллокация из кода плагина (ближайший к месту аллокации фрейм
+  в каталоге класса плагина). Шаг processing-цепочки = один плагин
+  (``PipelineStepNode.node_id == plugin.name``), поэтому метка — она же шаг;
+- ``framework:<module>`` / ``service:<name>`` / ``plugins:<package>`` — код
+  фреймворка, сервисов или общий код плагинов (``Plugins/_shared``) без плагина
+  в стеке;
+- ``other`` — stdlib и сторонние пакеты без нашего фрейма в стеке.
+
+Включение (выбранным процессам — не всем):
+
+- ``config.alloc_soak`` процесса в proc_dict (``true`` или ``{nframe, top, warmup,
+  path}``) — раннер процесса вызывает :func:`request` до boot;
+- env ``INSPECTOR_ALLOC_SOAK=1`` (все процессы) или ``=detector,stitcher`` (список
+  имён), каталог отчётов — ``INSPECTOR_ALLOC_SOAK_DIR``;
+- в рантайме — команды ``alloc.start`` / ``alloc.status`` / ``alloc.dump`` / ``alloc.stop``.
+
+Кадры считает наблюдатель вызовов ``frame_trace.set_call_hook``: каждый вызов
+``process`` даёт ``len(batch)`` (или 1) кадров плагину, ``produce`` — 1; кадров
+процесса — максимум по плагинам. Первые ``warmup`` кадров — прогрев (ленивая
+инициализация, кэши), baseline-снимок берётся после него.
+
+Мера — как у ``AllocProfiler``: прирост удерживаемой памяти (байт/блоков) между
+baseline и снимком, делённый на кадры. Аллокации, освобождённые внутри кадра,
+tracemalloc-diff не видит — soak ловит рост/утечки на кадр, а не churn.
+
+Отчёт процесса (:meth:`AllocSoak.report`) — json-safe dict с ``owners``, ``sites``
+(``файл:строка``) и ``stacks`` (collapsed stacks для flamegraph, вес — байт/кадр).
+Склейка отчётов всех процессов, ранжирование и сравнение сборок — CLI::
+
+    python -m multiprocess_framework.modules.process_module.generic.alloc_soak \\
+        -o soak.json --collapsed soak.folded /tmp/soak/*.alloc.json
+    python -m multiprocess_framework.modules.process_module.generic.alloc_soak \\
+        --baseline soak_prev.json --tolerance 0.1 --min-bytes 64 /tmp/soak/*.alloc.json
+
+С ``--baseline`` код выхода 1, если владелец вырос больше допуска (регрессия).
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import frame_trace
+from .alloc_profile import AllocProfiler
+
+#: Дефолты soak-прогона: глубина traceback, строк ``sites``, кадров прогрева.
+DEFAULT_NFRAME = 16
+DEFAULT_TOP = 20
+DEFAULT_WARMUP = 50
+#: Потолок числа стеков в отчёте процесса (крупнейшие по байтам).
+MAX_STACKS = 500
+
+_ENV_SWITCH = "INSPECTOR_ALLOC_SOAK"
+_ENV_DIR = "INSPECTOR_ALLOC_SOAK_DIR"
+
+# Собственные аллокации замера (снимки, счётчики) — не предмет отчёта.
+_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+
+def _area(filename: str) -> Optional[str]:
+    """Владелец по пути файла: framework/service/plugins-пакет; None — чужой код."""
+    parts = filename.replace("\\", "/").split("/")
+    for idx, part in enumerate(parts[:-1]):
+        if part == "multiprocess_framework":
+            if idx + 2 < len(parts) - 1 and parts[idx + 1] == "modules":
+                return f"framework:{parts[idx + 2]}"
+            return "framework"
+        if part == "Services":
+            return f"service:{parts[idx + 1]}" if idx + 1 < len(parts) - 1 else "service"
+        if part == "Plugins":
+            return f"plugins:{parts[idx + 1]}" if idx + 1 < len(parts) - 1 else "plugins"
+    return None
+
+
+def _short(filename: str) -> str:
+    """Путь от корня репозитория (``Plugins/...``), иначе имя файла."""
+    parts = filename.replace("\\", "/").split("/")
+    for idx, part in enumerate(parts):
+        if part in ("multiprocess_framework", "Services", "Plugins"):
+            return "/".join(parts[idx:])
+    return parts[-1]
+
+
+def _site(frame: Any) -> str:
+    return f"{_short(frame.filename)}:{frame.lineno}"
+
+
+class AllocSoak:
+    """Soak-профиль аллокаций процесса: ``start`` → прогрев → baseline → ``report``.
+
+    Args:
+        process: Имя процесса (в отчёте, имени файла и корне стеков).
+    """
+
+    def __init__(self, process: str = "") -> None:
+        self._process = process or f"pid_{os.getpid()}"
+        self._lock = threading.Lock()
+        self._state = "idle"  # idle → warmup → running → done
+        self._profiler: Optional[AllocProfiler] = None
+        self._calls: Dict[str, int] = {}
+        self._dirs: Dict[str, str] = {}
+        self._known: set = set()
+        self._warmup = DEFAULT_WARMUP
+        self._top = DEFAULT_TOP
+        self._path = ""
+        self._started = 0.0
+        self._last: Optional[Dict[str, Any]] = None
+        self._plugin_cls: Optional[type] = None
+
+    # ------------------------------------------------------------------
+    # Управление
+
+    @property
+    def active(self) -> bool:
+        return self._state in ("warmup", "running")
+
+    def start(
+        self,
+        nframe: int = DEFAULT_NFRAME,
+        top: int = DEFAULT_TOP,
+        warmup: int = DEFAULT_WARMUP,
+        path: str = "",
+    ) -> Dict[str, Any]:
+        """Включить tracemalloc и счёт кадров. Повторный ``start`` идущего soak — no-op."""
+        with self._lock:
+            if self.active:
+                return {"success": False, "reason": "alloc soak уже идёт", **self._status()}
+            self._profiler = AllocProfiler(nframes_top=top, nframe=nframe)
+            self._profiler.start()
+            self._calls = {}
+            self._warmup = max(0, int(warmup))
+            self._top = max(1, int(top))
+            self._path = path
+            self._last = None
+            self._state = "warmup"
+            if not self._warmup:
+                self._mark()
+        frame_trace.set_call_hook(self.on_call)
+        return {"success": True, **self.status()}
+
+    def stop(self) -> Dict[str, Any]:
+        """Снять отчёт, выключить наблюдатель и tracemalloc. Без активного soak — последний отчёт."""
+        with self._lock:
+            if not self.active:
+                return self._last or {}
+            report = self._build() if self._state == "running" else self._empty()
+            if frame_trace._CALL_HOOK == self.on_call:
+                frame_trace.set_call_hook(None)
+            self._profiler.stop()
+            self._profiler = None
+            self._state = "done"
+            self._last = report
+            return report
+
+    def report(self) -> Dict[str, Any]:
+        """Отчёт на текущий момент (soak продолжается); после ``stop`` — последний."""
+        with self._lock:
+            if self._state == "running":
+                return self._build()
+            return self._last or self._empty()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._status()
+
+    @property
+    def path(self) -> str:
+        """Каталог отчёта, заданный при ``start`` ("" — не задан)."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Наблюдатель вызовов (поток плагина)
+
+    def on_call(self, plugin: Any, args: tuple) -> None:
+        """Засчитать кадры вызову ``process``/``produce`` плагина (hook ``frame_trace``)."""
+        name = getattr(plugin, "name", None) or type(plugin).__name__
+        items = len(args[0]) if args and isinstance(args[0], list) else 1
+        with self._lock:
+            if not self.active:
+                return
+            if name not in self._known:
+                self._register(plugin, name)
+            count = self._calls.get(name, 0) + items
+            self._calls[name] = count
+            if self._state == "warmup" and count >= self._warmup:
+                self._mark()
+
+    def _mark(self) -> None:
+        self._profiler.mark()
+        self._calls = {}
+        self._started = time.monotonic()
+        self._state = "running"
+
+    def _register(self, plugin: Any, name: str) -> None:
+        """Каталоги классов плагина (до базы) → ``plugin:<name>``."""
+        self._known.add(name)
+        base = self._plugin_base()
+        for cls in type(plugin).__mro__:
+            if cls is base or cls is object:
+                break
+            try:
+                directory = os.path.dirname(os.path.abspath(inspect.getfile(cls))) + os.sep
+            except (TypeError, OSError):
+                continue
+            label = self._dirs.get(directory)
+            if label is None:
+                self._dirs[directory] = f"plugin:{name}"
+            elif f"plugin:{name}" not in label.split("+"):
+                self._dirs[directory] = f"{label}+{name}"  # два плагина в одном пакете
+
+    def _plugin_base(self) -> type:
+        if self._plugin_cls is None:
+            # Lazy: generic не тянет plugins на импорте модуля (как frame_trace.install_tracing).
+            from ..plugins.base import ProcessModulePlugin
+
+            self._plugin_cls = ProcessModulePlugin
+        return self._plugin_cls
+
+    # ------------------------------------------------------------------
+    # Отчёт
+
+    def _owner(self, traceback: Any) -> str:
+        frames = list(traceback)[::-1]  # tracemalloc: от старого к новому — идём от места аллокации
+        for frame in frames:
+            directory = os.path.dirname(frame.filename) + os.sep
+            label = self._dirs.get(directory)
+            if label is not None:
+                return label
+        for frame in frames:
+            label = _area(frame.filename)
+            if label is not None:
+                return label
+        return "other"
+
+    def _frames(self) -> int:
+        return max(self._calls.values(), default=0)
+
+    def _status(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "process": self._process,
+            "frames": self._frames() if self._state == "running" else 0,
+            "warmup": self._warmup,
+            "nframe": tracemalloc.get_traceback_limit() if tracemalloc.is_tracing() else 0,
+            "elapsed_s": round(time.monotonic() - self._started, 3) if self._state == "running" else 0.0,
+            "tracemalloc_kb": tracemalloc.get_tracemalloc_memory() // 1024 if tracemalloc.is_tracing() else 0,
+            "path": self._path,
+        }
+
+    def _empty(self) -> Dict[str, Any]:
+        return {
+            "process": self._process,
+            "pid": os.getpid(),
+            "frames": 0,
+            "duration_s": 0.0,
+            "nframe": 0,
+            "calls": {},
+            "bytes_per_frame": 0.0,
+            "blocks_per_frame": 0.0,
+            "owners": [],
+            "sites": [],
+            "stacks": [],
+        }
+
+    def _build(self) -> Dict[str, Any]:
+        frames = self._frames()
+        per = max(1, frames)
+        owners: Dict[str, List[int]] = {}
+        sites: Dict[tuple, List[int]] = {}
+        stacks: Counter = Counter()
+        total_bytes = total_blocks = 0
+        for stat in self._profiler.diff("traceback", filters=_FILTERS):
+            if not stat.size_diff and not stat.count_diff:
+                continue
+            owner = self._owner(stat.traceback)
+            site = _site(stat.traceback[-1])
+            total_bytes += stat.size_diff
+            total_blocks += stat.count_diff
+            acc = owners.setdefault(owner, [0, 0])
+            acc[0] += stat.size_diff
+            acc[1] += stat.count_diff
+            acc = sites.setdefault((owner, site), [0, 0])
+            acc[0] += stat.size_diff
+            acc[1] += stat.count_diff
+            if stat.size_diff > 0:
+                chain = ";".join(_site(f) for f in stat.traceback)
+                stacks[f"{self._process};[{owner}];{chain}"] += stat.size_diff
+        ranked_sites = sorted(sites.items(), key=lambda kv: kv[1][0], reverse=True)[: self._top]
+        return {
+            "process": self._process,
+            "pid": os.getpid(),
+            "frames": frames,
+            "duration_s": round(time.monotonic() - self._started, 3),
+            "nframe": tracemalloc.get_traceback_limit(),
+            "calls": dict(self._calls),
+            "bytes_per_frame": round(total_bytes / per, 2),
+            "blocks_per_frame": round(total_blocks / per, 3),
+            "owners": [
+                [owner, round(b / per, 2), round(n / per, 3)]
+                for owner, (b, n) in sorted(owners.items(), key=lambda kv: kv[1][0], reverse=True)
+            ],
+            "sites": [[owner, site, round(b / per, 2), round(n / per, 3)] for (owner, site), (b, n) in ranked_sites],
+            "stacks": [[stack, round(b / per, 2)] for stack, b in stacks.most_common(MAX_STACKS)],
+        }
+
+
+def write_report(report: Dict[str, Any], directory: str = "") -> str:
+    """Записать отчёт в ``<directory>/<process>-<pid>.alloc.json`` (дефолт — tmp). Возвращает путь."""
+    directory = directory or os.environ.get(_ENV_DIR) or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.join(directory, f"{report.get('process', 'process')}-{report.get('pid', os.getpid())}.alloc.json")
+    with open(target, "w", encoding="utf-8") as fh:
+        json.dump(report, fh)
+    return target
+
+
+_SOAK: Optional[AllocSoak] = None
+_SOAK_LOCK = threading.Lock()
+_REQUESTED: Optional[Dict[str, Any]] = None
+
+
+def get_soak(process: str = "") -> AllocSoak:
+    """Soak-профиль процесса (один на процесс; создаётся при первом обращении)."""
+    global _SOAK
+    with _SOAK_LOCK:
+        if _SOAK is None:
+            _SOAK = AllocSoak(process=process)
+        return _SOAK
+
+
+def request(options: Any) -> None:
+    """Запросить soak на boot процесса (``config.alloc_soak``: ``True`` или dict параметров ``start``)."""
+    global _REQUESTED
+    if options:
+        _REQUESTED = dict(options) if isinstance(options, dict) else {}
+
+
+def _env_requested(process: str) -> bool:
+    raw = os.environ.get(_ENV_SWITCH, "").strip()
+    if raw.lower() in ("1", "true", "yes", "all"):
+        return True
+    return process in {name.strip() for name in raw.split(",") if name.strip()}
+
+
+def start_requested(process: str) -> Optional[Dict[str, Any]]:
+    """Запустить soak, если он запрошен конфигом процесса или env (зовёт ``PluginOrchestrator.boot``)."""
+    options = _REQUESTED
+    if options is None and not _env_requested(process):
+        return None
+    options = dict(options or {})
+    return get_soak(process).start(
+        nframe=int(options.get("nframe", DEFAULT_NFRAME)),
+        top=int(options.get("top", DEFAULT_TOP)),
+        warmup=int(options.get("warmup", DEFAULT_WARMUP)),
+        path=str(options.get("path") or os.environ.get(_ENV_DIR, "")),
+    )
+
+
+def finish(process: str) -> Optional[str]:
+    """Остановить идущий soak и записать отчёт (зовёт ``PluginOrchestrator.shutdown``). Путь или None."""
+    soak = _SOAK
+    if soak is None or not soak.active:
+        return None
+    report = soak.stop()
+    return write_report(report, soak.path)
+
+
+# ----------------------------------------------------------------------
+# Склейка и сравнение отчётов процессов
+
+
+def _as_merged(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Отчёт процесса → форма склейки (склеенный отчёт возвращается как есть)."""
+    if "processes" in report:
+        return report
+    process = report.get("process", "?")
+    return {
+        "processes": [
+            {
+                "process": process,
+                "pid": report.get("pid"),
+                "frames": report.get("frames", 0),
+                "duration_s": report.get("duration_s", 0.0),
+                "bytes_per_frame": report.get("bytes_per_frame", 0.0),
+                "blocks_per_frame": report.get("blocks_per_frame", 0.0),
+            }
+        ],
+        "owners": [[process, *row] for row in report.get("owners", ())],
+        "sites": [[process, *row] for row in report.get("sites", ())],
+        "stacks": list(report.get("stacks", ())),
+    }
+
+
+def merge_reports(reports: Iterable[Dict[str, Any]], top: int = 50) -> Dict[str, Any]:
+    """Склеить отчёты процессов в один: владельцы и места аллокаций ранжированы по байт/кадр."""
+    merged: Dict[str, Any] = {"processes": [], "owners": [], "sites": [], "stacks": []}
+    for report in reports:
+        part = _as_merged(report)
+        for key in merged:
+            merged[key].extend(part.get(key, ()))
+    merged["processes"].sort(key=lambda p: p.get("bytes_per_frame", 0.0), reverse=True)
+    merged["owners"].sort(key=lambda row: row[2], reverse=True)
+    merged["sites"] = sorted(merged["sites"], key=lambda row: row[3], reverse=True)[: max(1, int(top))]
+    merged["stacks"].sort(key=lambda row: row[1], reverse=True)
+    return merged
+
+
+def collapsed(merged: Dict[str, Any]) -> str:
+    """Collapsed stacks склейки (``flamegraph.pl`` / speedscope): вес — байт/кадр, округлённо."""
+    lines = [f"{stack} {round(weight)}" for stack, weight in merged.get("stacks", ()) if round(weight) > 0]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1, min_bytes: float = 64.0
+) -> List[Dict[str, Any]]:
+    """Регрессии ``current`` против ``baseline``: процесс/владелец вырос > ``tolerance`` и ≥ ``min_bytes`` байт/кадр."""
+
+    def rows(report: Dict[str, Any]) -> Dict[tuple, float]:
+        merged = _as_merged(report)
+        out = {(p["process"], "*"): float(p.get("bytes_per_frame", 0.0)) for p in merged["processes"]}
+        out.update({(row[0], row[1]): float(row[2]) for row in merged["owners"]})
+        return out
+
+    base, new = rows(baseline), rows(current)
+    regressions = []
+    for key, value in new.items():
+        prev = base.get(key, 0.0)
+        if value - prev >= min_bytes and value > prev * (1.0 + tolerance):
+            regressions.append(
+                {
+                    "process": key[0],
+                    "owner": key[1],
+                    "baseline": prev,
+                    "current": value,
+                    "delta": round(value - prev, 2),
+                }
+            )
+    regressions.sort(key=lambda r: r["delta"], reverse=True)
+    return regressions
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: склеить отчёты процессов, напечатать топ мест аллокаций, сравнить с baseline."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Склейка soak-отчётов аллокаций на кадр (alloc.dump) всех процессов")
+    parser.add_argument("reports", nargs="+", help="файлы <process>-<pid>.alloc.json (или склеенный отчёт)")
+    parser.add_argument("-o", "--output", default="", help="записать склеенный отчёт (JSON)")
+    parser.add_argument("--collapsed", default="", help="записать collapsed stacks для flamegraph")
+    parser.add_argument("--top", type=int, default=20, help="строк в таблице мест аллокаций")
+    parser.add_argument("--baseline", default="", help="отчёт прошлой сборки для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="допуск роста (доля)")
+    parser.add_argument("--min-bytes", type=float, default=64.0, help="минимальный рост, байт/кадр")
+    args = parser.parse_args(argv)
+
+    merged = merge_reports((_load(path) for path in args.reports), top=max(args.top, 50))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(merged, fh)
+    if args.collapsed:
+        with open(args.collapsed, "w", encoding="utf-8") as fh:
+            fh.write(collapsed(merged))
+
+    out = sys.stdout
+    for proc in merged["processes"]:
+        out.write(
+            f"{proc['process']}: {proc['frames']} кадров, {proc['bytes_per_frame']:.1f} B/кадр, "
+            f"{proc['blocks_per_frame']:.2f} блоков/кадр\n"
+        )
+    out.write(f"{'B/кадр':>10} {'блоков':>8}  процесс / владелец / место\n")
+    for process, owner, site, bpf, blocks in merged["sites"][: args.top]:
+        out.write(f"{bpf:>10.1f} {blocks:>8.2f}  {process} / {owner} / {site}\n")
+
+    if not args.baseline:
+        return 0
+    regressions = compare(_load(args.baseline), merged, args.tolerance, args.min_bytes)
+    for reg in regressions:
+        out.write(f"РЕГРЕССИЯ {reg['process']} / {reg['owner']}: {reg['baseline']:.1f} → {reg['current']:.1f} B/кадр\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
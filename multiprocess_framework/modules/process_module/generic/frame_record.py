@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+"""frame_record — запись кадрового потока с send-пути роутера и чтение записи.
+
+Зачем: ``frame_saver`` пишет отдельные картинки, ``file_source`` проигрывает видео —
+оба теряют ``seq_id``/``frame_id``/``camera_id``/timestamps и чередование камер,
+которое видел процесс. Для побитового воспроизведения инцидента и замера рецепта на
+реальных данных нужна запись РОВНО того, что ушло в IPC.
+
+:class:`FrameRecordTap` — send-middleware роутера. Регистрируется GenericProcess'ом
+ПЕРЕД ``FrameShmMiddleware.strip_data_frame_on_send`` (кадр ещё в ``msg["data"]``),
+копирует кадр + скалярные метаданные item'а в bounded-очередь; writer-поток пишет
+файл. Hot path — одна копия кадра; переполнение очереди → ``dropped`` (не блокирует
+send). Конфиг процесса — секция ``frame_record: {path, camera_ids, data_types,
+codec, queue_size}`` (пустой ``path`` = выключено, ноль накладных).
+
+Формат файла (append-only, Dict at Boundary для метаданных)::
+
+    MAGIC (8 байт)
+    блок = <kind u8, meta_len u32, payload_len u64> + meta (JSON) + payload
+      HEADER  — {"format", "version", "node", "created_wall", "codec"}
+      FRAME   — {"t", "wall", "shape", "dtype", "codec", "item": {...}} + пиксели
+      INDEX   — {"frames": [[offset, t, camera_id, seq_id], ...]}
+    трейлер <u64 offset INDEX> + INDEX_MAGIC
+
+``t`` — секунды от старта записи по monotonic (темп реплея), ``codec`` —
+``raw`` или ``zlib`` (без потерь). Файл без трейлера (процесс убит) индексируется
+сканом заголовков блоков; оборванный хвостовой кадр отбрасывается.
+
+:class:`FrameRecordReader` — чтение записи (источник ``Plugins.sources.frame_replay``).
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+FORMAT = "fw-frame-record"
+VERSION = 1
+
+MAGIC = b"FWFREC\x01\x00"
+INDEX_MAGIC = b"FWFRIDX\x01"
+
+BLOCK_HEADER = 1
+BLOCK_FRAME = 2
+BLOCK_INDEX = 3
+
+CODECS = ("raw", "zlib")
+
+_BLOCK = struct.Struct("<BIQ")
+_TRAILER = struct.Struct("<Q8s")
+
+# Ключи item'а, которые не пишутся: кадр, служебные поля трассировки, маршрутизация.
+_SKIP_KEYS = frozenset({"frame", "trace", "trace_id", "trace_branches", "target"})
+_SCALARS = (str, int, float, bool, type(None))
+# Ключ кадра для отсечения fan-out повторов одного item'а (последнее — data_type).
+_KEY_FIELDS = ("camera_id", "seq_id", "frame_id", "timestamp", "data_type")
+
+
+def _item_meta(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Скалярные метаданные item'а (camera_id/seq_id/frame_id/timestamp/...)."""
+    return {
+        k: v
+        for k, v in item.items()
+        if isinstance(k, str) and k not in _SKIP_KEYS and not k.startswith("_") and isinstance(v, _SCALARS)
+    }
+
+
+def _frame_key(item: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """Ключ кадра для отсечения fan-out повторов; None — кадр не отличить по метаданным."""
+    key = tuple(item.get(k) for k in _KEY_FIELDS)
+    return None if all(v is None for v in key[:-1]) else key
+
+
+class FrameRecordWriter:
+    """Последовательная запись блоков в файл (не потокобезопасен — один писатель)."""
+
+    def __init__(self, path: str, *, codec: str = "raw", level: int = 1, node: str = "") -> None:
+        if codec not in CODECS:
+            raise ValueError(f"frame_record: codec должен быть одним из {CODECS}, получено {codec!r}")
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._fh = open(path, "wb")
+        self._fh.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._codec = codec
+        self._level = level
+        self._index: List[List[Any]] = []
+        self._closed = False
+        self.path = path
+        self._write_block(
+            BLOCK_HEADER,
+            {"format": FORMAT, "version": VERSION, "node": node, "created_wall": time.time(), "codec": codec},
+            b"",
+        )
+
+    @property
+    def frames_written(self) -> int:
+        return len(self._index)
+
+    @property
+    def bytes_written(self) -> int:
+        return self._offset
+
+    def _write_block(self, kind: int, meta: Dict[str, Any], payload: bytes) -> int:
+        offset = self._offset
+        meta_bytes = json.dumps(meta, ensure_ascii=False, default=str).encode("utf-8")
+        self._fh.write(_BLOCK.pack(kind, len(meta_bytes), len(payload)))
+        self._fh.write(meta_bytes)
+        self._fh.write(payload)
+        self._offset += _BLOCK.size + len(meta_bytes) + len(payload)
+        return offset
+
+    def write_frame(self, frame: np.ndarray, item: Dict[str, Any], t: float, wall: float) -> None:
+        raw = np.ascontiguousarray(frame).tobytes()
+        payload = zlib.compress(raw, self._level) if self._codec == "zlib" else raw
+        meta = {
+            "t": t,
+            "wall": wall,
+            "shape": list(frame.shape),
+            "dtype": str(frame.dtype),
+            "codec": self._codec,
+            "item": item,
+        }
+        offset = self._write_block(BLOCK_FRAME, meta, payload)
+        self._index.append([offset, t, item.get("camera_id"), item.get("seq_id")])
+
+    def flush(self) -> None:
+        if not self._closed:
+            self._fh.flush()
+
+    def close(self) -> None:
+        """Дописать индекс + трейлер и закрыть файл. Идемпотентно."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            index_offset = self._write_block(BLOCK_INDEX, {"frames": self._index}, b"")
+            self._fh.write(_TRAILER.pack(index_offset, INDEX_MAGIC))
+            self._fh.flush()
+        finally:
+            self._fh.close()
+
+
+class FrameRecordTap:
+    """Send-middleware: копия кадра + метаданные → очередь → writer-поток → файл.
+
+    Args:
+        path: файл записи (каталог создаётся).
+        camera_ids: писать только эти камеры (пусто/None — все).
+        data_types: писать item'ы с этими ``data_type`` (дефолт — кадры источника).
+        codec: ``raw`` (быстро, крупно) или ``zlib`` (без потерь, ~в 2-5 раз меньше
+            на реальных кадрах, CPU writer-потока).
+        queue_size: ёмкость очереди кадров; переполнение → ``dropped``.
+        max_bytes: мягкий лимит файла (0 — без лимита); по достижении запись
+            останавливается (файл валиден), ``stopped_reason="limit"``.
+
+    Fan-out: producer шлёт один item нескольким targets; первый send стрипает кадр в
+    SHM, повторные его не видят. При pickle-fallback кадр остаётся в item — повтор
+    отсекается по ключу кадра из метаданных (``camera_id``/``seq_id``/``frame_id``/
+    ``timestamp``/``data_type``), а не по identity массива: ссылка на прошлый кадр
+    держала бы SHM-view/буфер, а источник с одним переиспользуемым буфером терял бы
+    все кадры после первого. Item без этих полей пишется на каждый send.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        camera_ids: Optional[Iterable[Any]] = None,
+        data_types: Optional[Iterable[str]] = ("frame",),
+        codec: str = "raw",
+        queue_size: int = 64,
+        max_bytes: int = 0,
+        node: str = "",
+        log_error: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._writer = FrameRecordWriter(path, codec=codec, node=node)
+        self._camera_ids = frozenset(camera_ids) if camera_ids else None
+        self._data_types = frozenset(data_types) if data_types else None
+        self._max_queue = max(1, int(queue_size))
+        self._max_bytes = max(0, int(max_bytes))
+        self._log_error = log_error or (lambda msg: None)
+
+        self._queue: Deque[Tuple[np.ndarray, Dict[str, Any], float, float]] = collections.deque()
+        self._cond = threading.Condition()
+        self._stop = False
+        self._last_key: Optional[Tuple[Any, ...]] = None
+        self._t0 = time.monotonic()
+        self.dropped = 0
+        self.stopped_reason: Optional[str] = None
+        self._thread = threading.Thread(target=self._writer_loop, name="frame-record", daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        return self._writer.path
+
+    def on_send(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send-middleware: всегда возвращает msg (запись — побочный эффект)."""
+        if self._stop or msg.get("type") != "data":
+            return msg
+        item = msg.get("data")
+        if not isinstance(item, dict):
+            return msg
+        frame = item.get("frame")
+        if frame is None or not hasattr(frame, "shape"):
+            return msg
+        if self._data_types is not None and item.get("data_type") not in self._data_types:
+            return msg
+        if self._camera_ids is not None and item.get("camera_id") not in self._camera_ids:
+            return msg
+        key = _frame_key(item)
+        if key is not None and key == self._last_key:
+            return msg
+        self._last_key = key
+        entry = (np.array(frame, copy=True), _item_meta(item), time.monotonic() - self._t0, time.time())
+        with self._cond:
+            if len(self._queue) >= self._max_queue:
+                self.dropped += 1
+                return msg
+            self._queue.append(entry)
+            self._cond.notify()
+        return msg
+
+    def _writer_loop(self) -> None:
+        writer = self._writer
+        while True:
+            with self._cond:
+                while not self._queue and not self._stop:
+                    self._cond.wait()
+                batch = list(self._queue)
+                self._queue.clear()
+                stop = self._stop
+            for frame, item, t, wall in batch:
+                if self._max_bytes and writer.bytes_written >= self._max_bytes:
+                    with self._cond:
+                        self._stop = True
+                        self.stopped_reason = "limit"
+                        self.dropped += len(self._queue)
+                        self._queue.clear()
+                    break
+                try:
+                    writer.write_frame(frame, item, t, wall)
+                except Exception as exc:  # noqa: BLE001 — запись не роняет процесс
+                    self._log_error(f"FrameRecordTap: ошибка записи кадра: {exc}")
+                    self.dropped += 1
+            writer.flush()
+            if stop or self.stopped_reason is not None:
+                return
+
+    def close(self) -> Dict[str, Any]:
+        """Дослить очередь, дописать индекс и закрыть файл. Идемпотентно."""
+        with self._cond:
+            self._stop = True
+            if self.stopped_reason is None:
+                self.stopped_reason = "stopped"
+            self._cond.notify_all()
+        self._thread.join(timeout=10.0)
+        self._writer.close()
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self._writer.path,
+            "frames_written": self._writer.frames_written,
+            "bytes_written": self._writer.bytes_written,
+            "dropped": self.dropped,
+            "active": not self._stop,
+        }
+
+
+def build_frame_record_tap(
+    cfg: Dict[str, Any], node: str, log_error: Optional[Callable[[str], None]] = None
+) -> Optional[FrameRecordTap]:
+    """Tap по секции ``frame_record`` конфига процесса; пустой ``path`` → None."""
+    path = (cfg or {}).get("path")
+    if not path:
+        return None
+    path = str(path).replace("{node}", node)
+    return FrameRecordTap(
+        path,
+        camera_ids=cfg.get("camera_ids") or None,
+        data_types=cfg.get("data_types") or ("frame",),
+        codec=cfg.get("codec", "raw"),
+        queue_size=cfg.get("queue_size", 64),
+        max_bytes=cfg.get("max_bytes", 0),
+        node=node,
+        log_error=log_error,
+    )
+
+
+class FrameRecordReader:
+    """Чтение записи: индекс сразу (трейлер или скан), кадры — по запросу (seek).
+
+    Attributes:
+        header: HEADER-блок записи.
+        truncated: файл без трейлера (запись оборвана) — индекс восстановлен сканом.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            if self._fh.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path!r}: не запись {FORMAT} (нет сигнатуры)")
+            kind, meta, _ = self._read_block(len(MAGIC), with_payload=False)
+            if kind != BLOCK_HEADER or meta is None or meta.get("version") != VERSION:
+                raise ValueError(f"{path!r}: неподдерживаемый заголовок записи {meta!r}")
+            self.header: Dict[str, Any] = meta
+            self.truncated = False
+            self._index: List[List[Any]] = self._load_index()
+        except BaseException:
+            self._fh.close()
+            raise
+
+    def _read_block(self, offset: int, *, with_payload: bool = True) -> Tuple[int, Optional[Dict[str, Any]], bytes]:
+        self._fh.seek(offset)
+        head = self._fh.read(_BLOCK.size)
+        if len(head) < _BLOCK.size:
+            return 0, None, b""
+        kind, meta_len, payload_len = _BLOCK.unpack(head)
+        meta_bytes = self._fh.read(meta_len)
+        if len(meta_bytes) < meta_len:
+            return kind, None, b""
+        payload = self._fh.read(payload_len) if with_payload else b""
+        if with_payload and len(payload) < payload_len:
+            return kind, None, b""
+        return kind, json.loads(meta_bytes.decode("utf-8")), payload
+
+    def _load_index(self) -> List[List[Any]]:
+        size = os.fstat(self._fh.fileno()).st_size
+        if size >= len(MAGIC) + _TRAILER.size:
+            self._fh.seek(size - _TRAILER.size)
+            index_offset, magic = _TRAILER.unpack(self._fh.read(_TRAILER.size))
+            if magic == INDEX_MAGIC:
+                kind, meta, _ = self._read_block(index_offset, with_payload=False)
+                if kind == BLOCK_INDEX and meta is not None:
+                    return list(meta.get("frames") or [])
+        self.truncated = True
+        return self._scan(size)
+
+    def _scan(self, size: int) -> List[List[Any]]:
+        """Индекс без трейлера: пройти заголовки блоков до оборванного хвоста."""
+        frames: List[List[Any]] = []
+        offset = len(MAGIC)
+        while offset + _BLOCK.size <= size:
+            self._fh.seek(offset)
+            kind, meta_len, payload_len = _BLOCK.unpack(self._fh.read(_BLOCK.size))
+            end = offset + _BLOCK.size + meta_len + payload_len
+            if end > size:
+                break
+            if kind == BLOCK_FRAME:
+                meta = json.loads(self._fh.read(meta_len).decode("utf-8"))
+                item = meta.get("item") or {}
+                frames.append([offset, meta.get("t"), item.get("camera_id"), item.get("seq_id")])
+            offset = end
+        return frames
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def index(self) -> List[List[Any]]:
+        """``[[offset, t, camera_id, seq_id], ...]`` в порядке записи."""
+        return self._index
+
+    @property
+    def camera_ids(self) -> List[Any]:
+        return sorted({row[2] for row in self._index}, key=str)
+
+    def read(self, i: int) -> Tuple[Dict[str, Any], np.ndarray, float]:
+        """(метаданные item'а, кадр, t записи) кадра ``i``."""
+        kind, meta, payload = self._read_block(self._index[i][0])
+        if kind != BLOCK_FRAME or meta is None:
+            raise ValueError(f"{self.path!r}: кадр {i} повреждён")
+        raw = zlib.decompress(payload) if meta.get("codec") == "zlib" else payload
+        frame = np.frombuffer(raw, dtype=np.dtype(meta["dtype"])).reshape(meta["shape"]).copy()
+        return dict(meta.get("item") or {}), frame, float(meta.get("t") or 0.0)
+
+    def iter_frames(
+        self, camera_ids: Optional[Iterable[Any]] = None
+    ) -> Iterator[Tuple[Dict[str, Any], np.ndarray, float]]:
+        wanted = frozenset(camera_ids) if camera_ids else None
+        for i, row in enumerate(self._index):
+            if wanted is None or row[2] in wanted:
+                yield self.read(i)
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> FrameRecordReader:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
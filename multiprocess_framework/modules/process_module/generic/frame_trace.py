@@ -31,6 +31,11 @@
 ``trace_branches`` содержит только агрегаты (без полных спанов), размер
 O(число ветвей) — не растёт от глубины trace.
 
+Intra-process fan-out (``region_parallel``: регионы на пуле потоков одного
+процесса) собирает ту же сводку и дописывает в каждую ветвь ``region_ms`` —
+чистое время цепочки региона в пуле; ``ms`` его merge-спана — накладные
+fan-out/fan-in сверх самой медленной ветви (очередь пула + склейка).
+
 Служебные поля ``_t_send`` / ``_from`` ставятся перед отправкой и снимаются на
 приёме (по ним считается transport-спан); они НЕ накапливаются.
 
@@ -41,25 +46,104 @@ O(число ветвей) — не растёт от глубины trace.
 Гейтится ``INSPECTOR_FRAME_TRACE=1`` — в проде по умолчанию OFF: stamp/record
 становятся no-op (один bool-чек на item на участок, нулевой overhead). Дочерние
 процессы (spawn) наследуют env, если флаг выставлен до запуска ``run.py``.
+
+Сэмплинг (always-on в проде): ``INSPECTOR_FRAME_TRACE_SAMPLE=N`` (или команда
+``trace.sample`` в рантайме) — трассируется каждый N-й кадр. Решение
+принимается один раз, при рождении кадра в ``produce`` источника: выбранный
+кадр получает ``item["trace"] = []``, и дальше по цепочке трассируемость
+определяется ПО САМОМУ ITEM (``is_traced``: есть ключ ``trace``) — узлам ниже
+не нужен ни флаг, ни согласованный N. Остальные кадры — один dict-lookup на
+участок.
+
+Каждый спан трассируемого кадра дополнительно пишется в кольцо процесса
+(``trace_ring.RING``) с абсолютным временем начала — оттуда ``trace.dump``
+отдаёт снимок, а ``trace_ring.merge_dumps`` склеивает снимки всех процессов в
+таймлайн Chrome/Perfetto.
 """
 
 from __future__ import annotations
 
 import functools
+import itertools
 import os
 import time
 import uuid
 
+from .trace_ring import RING
+
 # Читается один раз при импорте. Дочерние spawn-процессы наследуют env.
 # Тесты могут переопределить: frame_trace._ENABLED = True.
 _ENABLED = os.environ.get("INSPECTOR_FRAME_TRACE", "").strip().lower() in ("1", "true", "yes")
 
 
+def _sample_from_env() -> int:
+    raw = os.environ.get("INSPECTOR_FRAME_TRACE_SAMPLE", "").strip()
+    try:
+        return max(0, int(raw)) if raw else 0
+    except ValueError:
+        return 0
+
+
+# 1-из-N кадров источника (0 — сэмплинг выключен). Меняется в рантайме: set_sample_every.
+_SAMPLE_EVERY = _sample_from_env()
+# next() у itertools.count атомарен под GIL — без лока на hot path источника.
+_sample_counter = itertools.count()
+
+# Наблюдатель вызовов плагинов ``hook(plugin, args)`` — зовётся обёрткой ``traced`` ДО
+# тела метода (alloc_soak: счёт кадров по плагинам). None — выключен: одно чтение
+# глобала на вызов.
+_CALL_HOOK = None
+
+
 def enabled() -> bool:
     """Включена ли трассировка кадра (по env INSPECTOR_FRAME_TRACE)."""
     return _ENABLED
 
 
+def is_traced(item: object) -> bool:
+    """Трассируется ли кадр: весь поток (флаг) или кадр выбран сэмплингом."""
+    return isinstance(item, dict) and (_ENABLED or "trace" in item)
+
+
+def sample_every() -> int:
+    """Текущий шаг сэмплинга (0 — выключен)."""
+    return _SAMPLE_EVERY
+
+
+def set_sample_every(n: int) -> int:
+    """Трассировать каждый ``n``-й кадр источников процесса (0 — выключить). Возвращает прежний шаг."""
+    global _SAMPLE_EVERY
+    prev = _SAMPLE_EVERY
+    _SAMPLE_EVERY = max(0, int(n))
+    return prev
+
+
+def set_call_hook(hook) -> object:
+    """Поставить наблюдатель вызовов ``process``/``produce`` (None — снять). Возвращает прежний."""
+    global _CALL_HOOK
+    prev = _CALL_HOOK
+    _CALL_HOOK = hook
+    return prev
+
+
+def maybe_sample(item: dict) -> bool:
+    """Решение сэмплинга для только что рождённого кадра.
+
+    Выбранный кадр получает пустой ``trace`` (маркер трассируемости) и
+    ``trace_id`` (группировка спанов на таймлайне). Возвращает ``is_traced``.
+    """
+    if not isinstance(item, dict):
+        return False
+    if _ENABLED or "trace" in item:
+        return True
+    every = _SAMPLE_EVERY
+    if every <= 0 or next(_sample_counter) % every:
+        return False
+    item["trace"] = []
+    ensure_trace_id(item)
+    return True
+
+
 def noop_log(message: str, **_extra: object) -> None:
     """Общий no-op для дефолтного ``log_debug`` (F6d, ревью 2026-07-13).
 
@@ -113,7 +197,7 @@ def stamp_send(item: dict, node: str) -> None:
     На приёме следующий узел вызовет ``record_transport`` и по ним вычислит
     время передачи. No-op если трассировка выключена.
     """
-    if not _ENABLED or not isinstance(item, dict):
+    if not is_traced(item):
         return
     item["_t_send"] = time.time()
     item["_from"] = node
@@ -125,27 +209,34 @@ def record_transport(item: dict, node: str) -> None:
     Снимает служебные поля (чтобы не уехали на следующий участок). No-op если
     трассировка выключена или item пришёл без отметки отправки.
     """
-    if not _ENABLED or not isinstance(item, dict):
+    if not is_traced(item):
         return
     t_send = item.pop("_t_send", None)
     frm = item.pop("_from", None)
     if not isinstance(t_send, (int, float)):
         return
-    item.setdefault("trace", []).append(
-        {
-            "kind": "transport",
-            "from": frm,
-            "to": node,
-            "ms": round((time.time() - t_send) * 1000.0, 3),
-        }
+    ms = max(0.0, (time.time() - t_send) * 1000.0)
+    item.setdefault("trace", []).append({"kind": "transport", "from": frm, "to": node, "ms": round(ms, 3)})
+    RING.record(
+        time.perf_counter() - ms / 1000.0,
+        ms,
+        "transport",
+        f"{frm} → {node}",
+        item.get("trace_id", ""),
+        {"from": frm, "to": node},
     )
 
 
-def record_process(item: dict, node: str, plugin: str, ms: float) -> None:
-    """Добавить process-спан: обработка ``plugin`` в ``node`` заняла ``ms``."""
-    if not _ENABLED or not isinstance(item, dict):
+def record_process(item: dict, node: str, plugin: str, ms: float, t0: float | None = None) -> None:
+    """Добавить process-спан: обработка ``plugin`` в ``node`` заняла ``ms``.
+
+    ``t0`` — начало обработки (``perf_counter``) для кольца; None — ``сейчас - ms``.
+    """
+    if not is_traced(item):
         return
     item.setdefault("trace", []).append({"kind": "process", "node": node, "plugin": plugin, "ms": round(ms, 3)})
+    start = t0 if t0 is not None else time.perf_counter() - ms / 1000.0
+    RING.record(start, ms, "process", plugin, item.get("trace_id", ""), {"node": node})
 
 
 def record_merge(
@@ -169,7 +260,7 @@ def record_merge(
         ms: время ожидания коллекции в fan-in буфере (мс). ``None`` / ``0``
             если не измеримо.
     """
-    if not _ENABLED or not isinstance(item, dict):
+    if not is_traced(item):
         return
     span: dict = {
         "kind": "merge",
@@ -182,6 +273,14 @@ def record_merge(
     else:
         span["ms"] = 0
     item.setdefault("trace", []).append(span)
+    RING.record(
+        time.perf_counter() - span["ms"] / 1000.0,
+        span["ms"],
+        "merge",
+        f"merge:{node}",
+        item.get("trace_id", ""),
+        {"branches": branches, "chosen": chosen},
+    )
 
 
 def fork_trace(item: dict) -> dict:
@@ -195,16 +294,16 @@ def fork_trace(item: dict) -> dict:
 
         out_item = {**item, "frame": crop, ..., **frame_trace.fork_trace(item)}
 
-    При включённой трассировке возвращает ``{"trace": list(item.get("trace", []))}``.
-    Без флага — пустой dict ``{}`` (нет аллокаций, нет overhead).
+    Для трассируемого кадра (``is_traced``) возвращает ``{"trace": list(item.get("trace", []))}``.
+    Иначе — пустой dict ``{}`` (нет аллокаций, нет overhead).
 
     Args:
         item: входной item (родительский кадр перед fan-out).
 
     Returns:
-        dict с ключом ``"trace"`` при ``_ENABLED``, иначе ``{}``.
+        dict с ключом ``"trace"`` для трассируемого кадра, иначе ``{}``.
     """
-    if not _ENABLED:
+    if not is_traced(item):
         return {}
     return {"trace": list(item.get("trace", []))}
 
@@ -224,7 +323,7 @@ def merge_trace(items: list[dict]) -> tuple[list, list, str]:
         merged["trace_branches"] = branches
         frame_trace.record_merge(merged, node=node, branches=len(items), chosen=chosen, ms=0)
 
-    Без флага возвращает ``([], [], "")`` — нулевой overhead, нет аллокаций.
+    Ни одна ветвь не трассируется — ``([], [], "")``, нет аллокаций.
 
     Args:
         items: коллекция входных item'ов (уже собранная fan-in буфером).
@@ -246,7 +345,7 @@ def merge_trace(items: list[dict]) -> tuple[list, list, str]:
           корректен только на одной машине (monotonic у разных процессов несравним).
         - Clock skew между процессами на одном хосте пренебрежимо мал.
     """
-    if not _ENABLED or not items:
+    if not items or not (_ENABLED or any(isinstance(it, dict) and "trace" in it for it in items)):
         return [], [], ""
 
     # Вычислить суммарную длительность trace каждой ветви
@@ -281,8 +380,12 @@ def traced(fn):
     Универсален: меряет строго вокруг тела метода (start→end через perf_counter),
     делит длительность на размер батча → честное per-item время (а не общий батч
     на каждый item). Узел берёт из ``self._trace_node`` (ставит оркестратор),
-    имя — из ``self.name``. No-op при выключенной трассировке (нулевой overhead,
-    кроме одного bool-чека).
+    имя — из ``self.name``. No-op для нетрассируемых кадров (bool-чек флага +
+    lookup ключа ``trace`` во входе).
+
+    Сэмплинг: у ``produce`` (нет входа — кадр рождается здесь) решение
+    ``maybe_sample`` принимается по каждому выходу. У ``process`` трассируемость
+    берётся со входа: плагин, собравший новый dict, не обрывает трассировку кадра.
 
     Применяется автоматически в ``PluginOrchestrator.boot()`` ко всем забученным
     плагинам (C6 рычаг 2 — см. ``install_tracing``) — отдельно вешать не нужно.
@@ -290,7 +393,11 @@ def traced(fn):
 
     @functools.wraps(fn)
     def wrapper(self, *args, **kwargs):
-        if not _ENABLED:
+        hook = _CALL_HOOK
+        if hook is not None:
+            hook(self, args)
+        traced_in = _ENABLED or (bool(args) and _args_traced(args[0]))
+        if not traced_in and (args or not _SAMPLE_EVERY):
             return fn(self, *args, **kwargs)
         t0 = time.perf_counter()
         result = fn(self, *args, **kwargs)
@@ -299,14 +406,62 @@ def traced(fn):
         node = getattr(self, "_trace_node", "")
         name = getattr(self, "name", "?")
         per = dt_ms / len(out) if out else dt_ms
-        for it in out:
-            record_process(it, node, name, per)
+        # Батч 1:1 без флага — трассируются только выходы сэмплированных входов
+        # (соответствие по позиции, как у PluginRunner._carry_system_fields).
+        inputs = args[0] if args and isinstance(args[0], list) else None
+        positional = not _ENABLED and inputs is not None and len(inputs) == len(out)
+        # Не 1:1 (фильтр, fan-in/fan-out) — выход трассируется, только если сводится
+        # к сэмплированному входу (см. _maps_to_sampled).
+        sampled_ids = _sampled_trace_ids(inputs) if not _ENABLED and inputs is not None and not positional else None
+        for idx, it in enumerate(out):
+            if not isinstance(it, dict):
+                continue
+            if traced_in:
+                if positional and not (isinstance(inputs[idx], dict) and "trace" in inputs[idx]):
+                    continue
+                if sampled_ids is not None and not _maps_to_sampled(it, inputs, sampled_ids):
+                    continue
+                it.setdefault("trace", [])
+            elif not maybe_sample(it):
+                continue
+            record_process(it, node, name, per, t0)
         return result
 
     wrapper._traced = True  # type: ignore[attr-defined]
     return wrapper
 
 
+def _sampled_trace_ids(inputs: list) -> set:
+    """trace_id сэмплированных входов батча."""
+    return {it["trace_id"] for it in inputs if isinstance(it, dict) and "trace" in it and it.get("trace_id")}
+
+
+def _maps_to_sampled(item: dict, inputs: list, sampled_ids: set) -> bool:
+    """Сводится ли выход не-1:1 батча к сэмплированному входу.
+
+    Да — если выход сам несёт ``trace`` (мутация входа на месте / копия входа),
+    его ``trace_id`` принадлежит сэмплированному входу, либо ``trace_id`` нет
+    вовсе, а донор полей ``inputs[0]`` (``PluginRunner._carry_system_fields``)
+    сэмплирован. Выход с ``trace_id`` несэмплированного кадра не трассируется.
+    """
+    if "trace" in item:
+        return True
+    if item.get("trace_id"):
+        return item["trace_id"] in sampled_ids
+    primary = inputs[0] if inputs else None
+    return isinstance(primary, dict) and "trace" in primary
+
+
+def _args_traced(first: object) -> bool:
+    """Есть ли трассируемый кадр во входе ``process`` (item или батч items)."""
+    if isinstance(first, list):
+        for it in first:
+            if isinstance(it, dict) and "trace" in it:
+                return True
+        return False
+    return isinstance(first, dict) and "trace" in first
+
+
 def install_tracing(cls) -> None:
     """Обернуть ``process``/``produce`` класса плагина в ``traced`` (idempotent).
 
@@ -13,7 +13,9 @@ from __future__ import annotations
 import queue
 
 from ..core.process_module import ProcessModule
+from ..lifecycle import boot_profile
 from .data_receiver import DataReceiver
+from .frame_record import build_frame_record_tap
 from ...router_module.middleware.frame_shm_middleware import FrameShmMiddleware
 from .inspector_registry import build_inspector
 from .pipeline_executor import PipelineExecutor
@@ -127,6 +129,14 @@ class GenericProcess(ProcessModule):
             num_consumers=num_consumers,
         )
         if router is not None:
+            # Запись кадрового потока (frame_record.path задан): tap стоит ПЕРЕД strip —
+            # кадр ещё в msg["data"]; пустая секция → tap не создаётся (ноль накладных).
+            self._frame_record_tap = build_frame_record_tap(
+                app_cfg.get("frame_record") or {}, self.name, log_error=self._log_error
+            )
+            if self._frame_record_tap is not None:
+                router.add_send_middleware(self._frame_record_tap.on_send)
+                self._log_info(f"GenericProcess[{self.name}]: запись кадров → {self._frame_record_tap.path}")
             # P3.1.2: Claim Check кадров — забота хаба, а не producer'ов. Регистрируем
             # send-middleware: SourceProducer/PipelineExecutor шлют msg с frame в data,
             # router сам выносит его в SHM (strip_and_write по generic-семантике). Guard
@@ -153,6 +163,9 @@ class GenericProcess(ProcessModule):
         # раз здесь → наблюдение покрывает все плагины процесса.
         self._plugin_runner = PluginRunner(log_error=self._log_error)
         self._attach_io_peek(app_cfg)
+        # boot-профиль: первый непустой выход любого плагина — отметка first_frame.
+        if boot_profile.get_profile() is not None:
+            self._plugin_runner.add_post_hook(boot_profile.on_plugin_output)
 
         # chain_queue: DataReceiver -> PipelineExecutor
         self._chain_queue: queue.Queue = queue.Queue(maxsize=queue_size)
@@ -250,6 +263,18 @@ class GenericProcess(ProcessModule):
                 )
                 self._log_info(f"GenericProcess[{self.name}]: source '{source_plugin.name}' producer started")
 
+    def shutdown(self) -> bool:
+        """Закрыть запись кадров (индекс + трейлер), затем штатный shutdown."""
+        tap = getattr(self, "_frame_record_tap", None)
+        if tap is not None:
+            stats = tap.close()
+            self._log_info(
+                f"GenericProcess[{self.name}]: запись кадров закрыта — {stats['frames_written']} кадров, "
+                f"dropped={stats['dropped']}"
+            )
+            self._frame_record_tap = None
+        return super().shutdown()
+
     def _handle_shm_release(self, msg: dict, shm_middleware) -> None:
         """Ф7 G.5.d-2 (В3): owner-handler release-пачки zero-copy займов.
 
@@ -103,6 +103,16 @@ class GenericProcessConfig(ProcessLaunchConfig):
         ),
     ] = {}
 
+    frame_record: Annotated[
+        dict[str, Any],
+        FieldMeta(
+            "Frame record",
+            info="Запись отправляемых кадров + метаданных в файл для реплея (frame_replay): "
+            "{path, camera_ids, data_types, codec: raw|zlib, queue_size, max_bytes}. "
+            "Пустой path = выключено. {node} в path → имя процесса.",
+        ),
+    ] = {}
+
     lag_alert_threshold_sec: Annotated[
         float,
         FieldMeta("Lag alert threshold", info="Backpressure alert порог (Q6).", min=0.1),
@@ -152,6 +162,18 @@ class GenericProcessConfig(ProcessLaunchConfig):
         ),
     ] = []
 
+    placement: Annotated[
+        dict[str, Any],
+        FieldMeta(
+            "CPU placement",
+            info="Ядра и лимиты нативных пулов потоков процесса: {cpus, threads, blas_threads, "
+            "cv2_threads, torch_threads, torch_interop_threads, onnx_intra_op_threads, "
+            "onnx_inter_op_threads}. Пусто = без пиннинга и лимитов (FW_CPU_AFFINITY → "
+            "автоплан по ролям). Применяет runner до импорта класса процесса "
+            "(lifecycle/cpu_placement.py). В рецепте — extras.placement.",
+        ),
+    ] = {}
+
     @property
     def memory(self) -> dict[str, Any] | None:
         """Агрегация SHM layout из всех плагинов.
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""latency_histogram — лог-бакетная (HDR-style) гистограмма латентности этапа.
+
+Замена окна «последние N замеров + sort» в ``perf_probes``: окно шумит на p99
+(200 замеров — два значения на хвост), теряет хвостовые события старше окна и
+сортирует на каждом чтении. Гистограмма копит ВСЕ замеры с момента сброса в
+постоянной памяти и сливается сложением счётчиков — между воркерами, процессами
+и окнами времени.
+
+Бакеты (как в HdrHistogram): значение — целые микросекунды ``v``;
+``shift = max(0, v.bit_length() - SUB_BITS - 1)``, индекс
+``(shift << SUB_BITS) + (v >> shift)``. До ``2·2**SUB_BITS`` мкс бакет = 1 мкс
+(точно), дальше на каждую степень двойки — ``2**SUB_BITS`` бакетов: относительная
+ошибка ≤ ``2**-SUB_BITS`` (1.6% при ``SUB_BITS=6``). Диапазон — до ``MAX_US``
+(~67 с), больше — в последний бакет (``max`` хранится точно). Память — список из
+``BUCKETS`` счётчиков на этап, независимо от числа замеров.
+
+Компактная форма для heartbeat (:meth:`LatencyHistogram.encode`)::
+
+    {"n": 1200, "sum": 84.2, "min": 0.031, "max": 4.87, "b": [31, 3, 2, 10, ...]}
+
+``b`` — пары ``(шаг индекса, счётчик)`` только непустых бакетов: индекс — нарастающей
+суммой шагов. Этап ~1 мс с разбросом ±10…50% занимает 80–250 бакетов → 0.7–2 КБ
+на heartbeat.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+#: Бит под-бакета: 2**SUB_BITS бакетов на степень двойки (точность ≤ 2**-SUB_BITS).
+SUB_BITS = 6
+#: Верхняя граница диапазона, мкс (больше — в последний бакет).
+MAX_US = 1 << 26
+
+
+def bucket_index(us: int) -> int:
+    """Индекс бакета для значения в целых микросекундах."""
+    if us < 0:
+        us = 0
+    elif us >= MAX_US:
+        us = MAX_US - 1
+    shift = us.bit_length() - SUB_BITS - 1
+    if shift <= 0:
+        return us
+    return (shift << SUB_BITS) + (us >> shift)
+
+
+def bucket_bounds(index: int) -> tuple:
+    """``(нижняя граница, ширина)`` бакета в мкс."""
+    if index < (2 << SUB_BITS):
+        return index, 1
+    shift = (index >> SUB_BITS) - 1
+    return (index - (shift << SUB_BITS)) << shift, 1 << shift
+
+
+BUCKETS = bucket_index(MAX_US - 1) + 1
+
+
+class LatencyHistogram:
+    """Гистограмма замеров (мс) с перцентилями, слиянием и компактной сериализацией.
+
+    Один писатель (поток воркера) — ``record`` без лока; читатель (heartbeat)
+    видит счётчики с точностью до замера в полёте.
+    """
+
+    __slots__ = ("_counts", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        """Добавить замер (миллисекунды)."""
+        self._counts[bucket_index(int(ms * 1000.0))] += 1
+        if not self.count or ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self.count += 1
+        self.total_ms += ms
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Влить ``other`` (сложение счётчиков). Возвращает self."""
+        if not other.count:
+            return self
+        counts = self._counts
+        for idx, n in enumerate(other._counts):
+            if n:
+                counts[idx] += n
+        self.min_ms = other.min_ms if not self.count else min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.count += other.count
+        self.total_ms += other.total_ms
+        return self
+
+    def since(self, earlier: "LatencyHistogram") -> "LatencyHistogram":
+        """Окно между двумя кумулятивными снимками одного источника (``self`` − ``earlier``).
+
+        ``min``/``max`` окна точно не восстановить — берутся границы крайних
+        непустых бакетов (ошибка — ширина бакета).
+        """
+        window = LatencyHistogram()
+        counts = window._counts
+        for idx, (now, before) in enumerate(zip(self._counts, earlier._counts)):
+            if now > before:
+                counts[idx] = now - before
+        window.count = sum(counts)
+        window.total_ms = max(0.0, self.total_ms - earlier.total_ms)
+        filled = [idx for idx, n in enumerate(counts) if n]
+        if filled:
+            low, _ = bucket_bounds(filled[0])
+            high, width = bucket_bounds(filled[-1])
+            window.min_ms = max(low / 1000.0, self.min_ms)
+            window.max_ms = min((high + width - 1) / 1000.0, self.max_ms)
+        return window
+
+    def percentile(self, q: float) -> float:
+        """Значение перцентиля ``q`` (0..1), мс: середина бакета ранга ``ceil(q·n)``."""
+        if not self.count:
+            return 0.0
+        if q >= 1.0:
+            return self.max_ms
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for idx, n in enumerate(self._counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= rank:
+                low, width = bucket_bounds(idx)
+                value = (low + (width - 1) / 2.0) / 1000.0
+                return min(max(value, self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        """p50/p99/p99.9/max/mean/count — форма ``perf_probes.get_stats()``."""
+        return {
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "p999_ms": round(self.percentile(0.999), 3),
+            "max_ms": round(self.max_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "count": self.count,
+        }
+
+    def encode(self) -> Dict[str, Any]:
+        """Компактная json/pickle-safe форма (только непустые бакеты, см. модуль)."""
+        pairs: List[int] = []
+        prev = 0
+        for idx, n in enumerate(self._counts):
+            if n:
+                pairs.append(idx - prev)
+                pairs.append(n)
+                prev = idx
+        return {
+            "n": self.count,
+            "sum": round(self.total_ms, 3),
+            "min": round(self.min_ms, 3),
+            "max": round(self.max_ms, 3),
+            "b": pairs,
+        }
+
+    @classmethod
+    def decode(cls, data: Optional[Dict[str, Any]]) -> "LatencyHistogram":
+        """Обратно из :meth:`encode` (пустой/битый dict → пустая гистограмма)."""
+        hist = cls()
+        if not isinstance(data, dict):
+            return hist
+        pairs = data.get("b") or []
+        idx = 0
+        counts = hist._counts
+        for step, n in zip(pairs[0::2], pairs[1::2]):
+            idx += int(step)
+            if 0 <= idx < BUCKETS:
+                counts[idx] += int(n)
+        hist.count = int(data.get("n", sum(counts)))
+        hist.total_ms = float(data.get("sum", 0.0))
+        hist.min_ms = float(data.get("min", 0.0))
+        hist.max_ms = float(data.get("max", 0.0))
+        return hist
+
+
+def merge_encoded(items: Iterable[Optional[Dict[str, Any]]]) -> LatencyHistogram:
+    """Слить закодированные гистограммы (воркеры/процессы) в одну."""
+    merged = LatencyHistogram()
+    for data in items:
+        merged.merge(LatencyHistogram.decode(data))
+    return merged
+
+
+__all__ = ["BUCKETS", "LatencyHistogram", "bucket_bounds", "bucket_index", "merge_encoded"]
@@ -14,20 +14,27 @@ print и никакого нового IPC-канала — просто доп
 FRAME_TRACE``). Дефолт OFF: ``measure()`` возвращает общий no-op контекст-
 менеджер — НИ ОДНОГО вызова ``time.perf_counter()`` на кадр, только один
 bool-чек. Тесты могут переопределить: ``perf_probes._ENABLED = True``.
+
+Замеры копятся в лог-бакетной гистограмме на этап (``latency_histogram``,
+ADR-PM-022): все замеры с момента сброса в постоянной памяти, p50/p99/p99.9/max
+без сортировки, компактная форма ``hist`` едет в heartbeat и сливается по
+воркерам/процессам (``ProcessMonitor.get_perf_probes``). Сброс —
+:func:`reset_all` (команда ``perf.reset``).
 """
 
 from __future__ import annotations
 
 import time
-from collections import deque
+import weakref
 from typing import Any
 
 from ...config_module.feature_flags import is_enabled
+from .latency_histogram import LatencyHistogram
 
 _ENABLED = is_enabled("FW_PERF_PROBES")
 
-#: Сколько последних замеров держим на этап — компромисс память/точность p99.
-_WINDOW = 200
+# Все пробы процесса (по одной на воркер) — для reset_all без ссылок на воркеров.
+_INSTANCES: "weakref.WeakSet[LatencyProbes]" = weakref.WeakSet()
 
 
 def enabled() -> bool:
@@ -44,7 +51,8 @@ class LatencyProbes:
     """
 
     def __init__(self) -> None:
-        self._samples: dict[str, deque[float]] = {}
+        self._hists: dict[str, LatencyHistogram] = {}
+        _INSTANCES.add(self)
 
     def measure(self, stage: str) -> "_ProbeMeasurement | _NoopMeasurement":
         """Контекст-менеджер вокруг одного замера этапа ``stage``.
@@ -57,38 +65,45 @@ class LatencyProbes:
         return _ProbeMeasurement(self, stage)
 
     def _record(self, stage: str, ms: float) -> None:
-        bucket = self._samples.get(stage)
-        if bucket is None:
-            bucket = deque(maxlen=_WINDOW)
-            self._samples[stage] = bucket
-        bucket.append(ms)
+        hist = self._hists.get(stage)
+        if hist is None:
+            hist = LatencyHistogram()
+            self._hists[stage] = hist
+        hist.record(ms)
+
+    def reset(self) -> None:
+        """Начать счёт заново (max/перцентили — «с момента сброса»).
+
+        Подменяем словарь целиком, а не обнуляем гистограммы: воркер в этот
+        момент может писать в старую — замер уйдёт в неё, а не порвёт новую.
+        """
+        self._hists = {}
 
     def get_stats(self) -> dict[str, dict[str, Any]]:
-        """Снимок p50/p99/count по каждому этапу (для get_cycle_metrics()).
+        """Снимок по каждому этапу (для get_cycle_metrics()).
+
+        ``{stage: {p50_ms, p99_ms, p999_ms, max_ms, mean_ms, count, hist}}`` —
+        всё с момента сброса; ``hist`` — компактная гистограмма
+        (``LatencyHistogram.encode``) для слияния на стороне ProcessManager.
 
         Вызывается ТОЛЬКО когда флаг включён (см. вызывающих в source_producer/
         data_receiver) — при off словарь пуст (замеров нет), лишний вызов сам
         по себе безвреден (пустой dict), но не нужен.
         """
         out: dict[str, dict[str, Any]] = {}
-        for stage, samples in self._samples.items():
-            if not samples:
+        for stage, hist in list(self._hists.items()):
+            if not hist.count:
                 continue
-            ordered = sorted(samples)
-            out[stage] = {
-                "p50_ms": _percentile(ordered, 0.50),
-                "p99_ms": _percentile(ordered, 0.99),
-                "count": len(ordered),
-            }
+            out[stage] = {**hist.summary(), "hist": hist.encode()}
         return out
 
 
-def _percentile(ordered: list[float], q: float) -> float:
-    """Ближайший-ранг перцентиль по уже отсортированному списку."""
-    if not ordered:
-        return 0.0
-    idx = min(len(ordered) - 1, int(len(ordered) * q))
-    return round(ordered[idx], 3)
+def reset_all() -> int:
+    """Сбросить пробы всех воркеров процесса. Возвращает число сброшенных проб."""
+    probes = list(_INSTANCES)
+    for item in probes:
+        item.reset()
+    return len(probes)
 
 
 class _ProbeMeasurement:
@@ -15,7 +15,8 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-from . import frame_trace
+from . import alloc_soak, frame_trace
+from ..lifecycle import boot_profile
 from ..plugins.base import PluginContext, ProcessModulePlugin
 from ..plugins.interfaces import IProcessServices
 from ..plugins.manifest import PLUGIN_API_VERSION, api_version_major_mismatch, check_requires
@@ -74,10 +75,12 @@ class PluginOrchestrator:
             if not resolved_class_path:
                 continue
             try:
-                plugin = self._load_plugin(resolved_class_path, plugin_name)
-                plugin_config = self._extract_plugin_config(pdef)
-                ctx = base_ctx.with_config(plugin_config)
-                plugin.configure_managers(ctx)
+                # boot-профиль: импорт класса плагина (cv2/onnxruntime/torch) — здесь.
+                with boot_profile.phase(f"plugin:{plugin_name}.load"):
+                    plugin = self._load_plugin(resolved_class_path, plugin_name)
+                    plugin_config = self._extract_plugin_config(pdef)
+                    ctx = base_ctx.with_config(plugin_config)
+                    plugin.configure_managers(ctx)
                 self._early_plugins.append((plugin, ctx))
             except Exception as e:
                 self._services.log_error(
@@ -169,7 +172,8 @@ class PluginOrchestrator:
                 # реально вызовется и получит шанс освободить захваченное до броска.
                 self._plugins.append(plugin)
                 self._contexts.append(ctx)
-                plugin._do_configure(ctx)
+                with boot_profile.phase(f"plugin:{plugin.name}.configure"):
+                    plugin._do_configure(ctx)
                 self._services.log_info(
                     f"PluginOrchestrator[{self._services.name}]: '{plugin.name}' "
                     f"[{plugin.category}] {plugin.state.value}"
@@ -182,7 +186,8 @@ class PluginOrchestrator:
         # Фаза 2: READY -> RUNNING (start)
         for plugin, ctx in zip(self._plugins, self._contexts):
             try:
-                plugin._do_start(ctx)
+                with boot_profile.phase(f"plugin:{plugin.name}.start"):
+                    plugin._do_start(ctx)
                 self._services.log_info(
                     f"PluginOrchestrator[{self._services.name}]: '{plugin.name}' {plugin.state.value}"
                 )
@@ -198,8 +203,24 @@ class PluginOrchestrator:
         if registers_manager is not None:
             self._boot_registers(registers_manager)
 
+        # Soak-профиль аллокаций (config.alloc_soak / INSPECTOR_ALLOC_SOAK) — после start,
+        # чтобы аллокации configure/start не попали в замер.
+        soak = alloc_soak.start_requested(self._services.name)
+        if soak is not None:
+            self._services.log_info(
+                f"PluginOrchestrator[{self._services.name}]: alloc soak {soak.get('state')} "
+                f"(warmup={soak.get('warmup')}, nframe={soak.get('nframe')})"
+            )
+
     def shutdown(self) -> None:
         """* -> STOPPED для всех плагинов (в обратном порядке)."""
+        try:
+            report_path = alloc_soak.finish(self._services.name)
+        except OSError as e:
+            self._services.log_error(f"PluginOrchestrator[{self._services.name}]: alloc soak report: {e}")
+        else:
+            if report_path:
+                self._services.log_info(f"PluginOrchestrator[{self._services.name}]: alloc soak report {report_path}")
         for plugin, ctx in reversed(list(zip(self._plugins, self._contexts))):
             try:
                 plugin._do_shutdown(ctx)
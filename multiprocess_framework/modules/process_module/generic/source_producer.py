@@ -94,7 +94,8 @@ class SourceProducer:
         WorkerManager.get_worker_status подмешивает результат в статус воркера →
         heartbeat → ProcessMonitor.state.fps/latency_ms → GUI. При включённых
         perf-пробах (FW_PERF_PROBES=1) дополнительно несёт ``perf_probes``:
-        p50/p99/count по этапам capture/send (HP-1, Ф7 G.1).
+        p50/p99/p99.9/max/count + ``hist`` по этапам capture/send (HP-1, Ф7 G.1,
+        ADR-PM-022).
         """
         metrics = self._cycle_metrics.get_cycle_metrics()
         if perf_probes.enabled():
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""stack_profiler — on-demand сэмплирующий профайлер стеков внутри процесса.
+
+Когда один процесс пайплайна упирается в CPU, py-spy снаружи требует root и
+доступа к хосту. Здесь сэмплер живёт в самом процессе и включается командой
+``profile.start`` (router → CommandManager, как любая built-in команда) на N
+секунд, без рестарта процесса:
+
+    profile.start {"seconds": 10, "interval_ms": 10, "path": "/tmp/prof"}
+    profile.status                      → state/samples/overhead_pct/path
+    profile.stop                        → досрочно, файл пишется сразу
+
+Механика — поток-сэмплер: раз в ``interval`` берёт ``sys._current_frames()``
+(стеки ВСЕХ потоков процесса — воркеров пайплайна, пулов цепочек, а не только
+main, как у signal-сэмплера) и копит счётчики свёрнутых стеков. Результат —
+файл в формате collapsed stacks (``flamegraph.pl`` / speedscope / inferno)::
+
+    thread:pipeline_worker;run (worker.py:40);[plugin:hsv_mask];process (plugin.py:88) 137
+
+Аннотации — псевдо-фреймы перед фреймом-носителем:
+
+- ``[plugin:<name>]`` — фрейм ``process``/``produce`` плагина (``self`` —
+  ``ProcessModulePlugin``), имя — ``plugin.name``;
+- ``[step:<node_id>]`` — фрейм исполнителя chain_module с локальной ``step``
+  (``RunnableStep``): какой шаг цепочки сейчас исполняется.
+
+Overhead ограничен бюджетом ``max_overhead`` (доля одного ядра, дефолт 5%):
+если сэмпл стоил больше ``interval * max_overhead``, пауза до следующего
+растягивается так, чтобы средняя доля времени сэмплера не превышала бюджет.
+Фактическая доля — ``overhead_pct`` в статусе. Глубина стека — ``max_depth``
+(обрезка со стороны корня), длительность — не больше ``MAX_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+#: Потолок длительности одного профиля (секунды).
+MAX_SECONDS = 600.0
+#: Минимальный интервал сэмплирования (секунды).
+MIN_INTERVAL = 0.001
+
+_PLUGIN_METHODS = frozenset({"process", "produce"})
+
+
+class StackProfiler:
+    """Один профиль за раз: ``start`` → поток-сэмплер → collapsed-файл.
+
+    Args:
+        process: Имя процесса (в имени файла и статусе).
+        max_depth: Максимум фреймов на стек.
+        max_overhead: Бюджет сэмплера — доля времени одного ядра (0..1).
+    """
+
+    def __init__(self, process: str = "", max_depth: int = 128, max_overhead: float = 0.05) -> None:
+        self._process = process or f"pid_{os.getpid()}"
+        self._max_depth = max(8, int(max_depth))
+        self._max_overhead = min(1.0, max(0.001, float(max_overhead)))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._counts: Counter[str] = Counter()
+        self._labels: dict[Any, str] = {}
+        self._state = "idle"  # idle → running → done | failed
+        self._path = ""
+        self._error = ""
+        self._samples = 0
+        self._started = 0.0
+        self._elapsed = 0.0
+        self._busy = 0.0
+        self._interval = 0.01
+        self._plugin_cls: type | None = None
+
+    # ------------------------------------------------------------------
+    # Управление
+    # ------------------------------------------------------------------
+
+    def start(self, seconds: float, interval_ms: float = 10.0, path: str = "") -> dict[str, Any]:
+        """Запустить профиль на ``seconds`` секунд. Файл — в каталог ``path`` (дефолт — tmp)."""
+        with self._lock:
+            if self._state == "running":
+                return {"success": False, "reason": "профиль уже идёт", **self._status_locked()}
+            seconds = min(MAX_SECONDS, max(0.05, float(seconds)))
+            self._interval = max(MIN_INTERVAL, float(interval_ms) / 1000.0)
+            directory = path or tempfile.gettempdir()
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            self._path = os.path.join(directory, f"{self._process}-{os.getpid()}-{stamp}.collapsed")
+            self._counts = Counter()
+            self._samples = 0
+            self._busy = 0.0
+            self._elapsed = 0.0
+            self._error = ""
+            self._stop.clear()
+            self._started = time.perf_counter()
+            self._state = "running"
+            self._thread = threading.Thread(
+                target=self._run, args=(seconds,), name=f"stack_profiler_{self._process}", daemon=True
+            )
+            self._thread.start()
+            return {"success": True, **self._status_locked()}
+
+    def stop(self, timeout: float = 5.0) -> dict[str, Any]:
+        """Досрочно остановить профиль (файл пишется) и вернуть статус."""
+        thread = self._thread
+        self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return self.status()
+
+    def status(self) -> dict[str, Any]:
+        """Состояние профиля: state, samples, elapsed_s, overhead_pct, path, top."""
+        with self._lock:
+            return self._status_locked()
+
+    def collapsed(self) -> str:
+        """Текущие счётчики в формате collapsed stacks (в т.ч. идущего профиля)."""
+        with self._lock:
+            counts = list(self._counts.items())
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(counts))
+
+    def _status_locked(self) -> dict[str, Any]:
+        elapsed = self._elapsed if self._state != "running" else time.perf_counter() - self._started
+        return {
+            "state": self._state,
+            "process": self._process,
+            "samples": self._samples,
+            "stacks": len(self._counts),
+            "elapsed_s": round(elapsed, 3),
+            "interval_ms": round(self._interval * 1000.0, 3),
+            "overhead_pct": round(100.0 * self._busy / elapsed, 3) if elapsed > 0 else 0.0,
+            "path": self._path,
+            "error": self._error,
+            "top": _top_frames(self._counts, 5),
+        }
+
+    # ------------------------------------------------------------------
+    # Поток-сэмплер
+    # ------------------------------------------------------------------
+
+    def _run(self, seconds: float) -> None:
+        deadline = self._started + seconds
+        own = threading.get_ident()
+        names: dict[int, str] = {}
+        names_at = 0.0
+        pause = self._interval
+        try:
+            while not self._stop.wait(pause):
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if now - names_at > 1.0:  # новые воркеры появляются редко — без enumerate на каждый сэмпл
+                    names = {t.ident: t.name for t in threading.enumerate() if t.ident is not None}
+                    names_at = now
+                self._sample(own, names)
+                cost = time.perf_counter() - now
+                self._busy += cost
+                # Бюджет: cost / (cost + pause) <= max_overhead.
+                pause = max(self._interval, cost * (1.0 / self._max_overhead - 1.0))
+            state = "done"
+        except Exception as exc:  # no-health: диагностический поток; причина — в status().error
+            self._error = f"{type(exc).__name__}: {exc}"
+            state = "failed"
+        with self._lock:
+            self._elapsed = time.perf_counter() - self._started
+        self._write()
+        with self._lock:
+            self._state = state
+
+    def _sample(self, own: int, names: dict[int, str]) -> None:
+        frames = sys._current_frames()
+        stacks = []
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack = self._stack(frame)
+            stack.append(f"thread:{names.get(ident, ident)}")
+            stack.reverse()
+            stacks.append(";".join(stack))
+        with self._lock:
+            self._counts.update(stacks)
+            self._samples += 1
+
+    def _stack(self, frame: Any) -> list[str]:
+        """Стек от листа к корню (метки фреймов + аннотации), не глубже ``max_depth``."""
+        out: list[str] = []
+        labels = self._labels
+        depth = 0
+        while frame is not None and depth < self._max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                labels[code] = label
+            out.append(label)
+            note = self._annotate(frame, code)
+            if note is not None and (len(out) < 2 or out[-2] != note):
+                out.append(note)
+            frame = frame.f_back
+            depth += 1
+        return out
+
+    def _annotate(self, frame: Any, code: Any) -> str | None:
+        """``[plugin:..]`` / ``[step:..]`` для фрейма-носителя, иначе None."""
+        if code.co_name in _PLUGIN_METHODS or code.co_name == "wrapper":
+            if "self" in code.co_varnames:
+                owner = frame.f_locals.get("self")
+                if isinstance(owner, self._plugin_base()):
+                    return f"[plugin:{getattr(owner, 'name', type(owner).__name__)}]"
+            return None
+        if "step" in code.co_varnames:
+            step = frame.f_locals.get("step")
+            node_id = getattr(getattr(step, "node", None), "node_id", None)
+            if node_id is not None:
+                return f"[step:{node_id}]"
+        return None
+
+    def _plugin_base(self) -> type:
+        if self._plugin_cls is None:
+            # Lazy: generic не тянет plugins на импорте модуля (как frame_trace.install_tracing).
+            from ..plugins.base import ProcessModulePlugin
+
+            self._plugin_cls = ProcessModulePlugin
+        return self._plugin_cls
+
+    def _write(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(self._path, "w", encoding="utf-8") as fh:
+                fh.write(self.collapsed())
+        except OSError as exc:
+            self._error = f"не удалось записать {self._path}: {exc}"
+
+
+def _top_frames(counts: Counter, limit: int) -> list[dict[str, Any]]:
+    """Самые частые листовые фреймы (self-time) — быстрый ответ без открытия файла."""
+    leaves: Counter[str] = Counter()
+    for stack, count in counts.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    total = sum(leaves.values()) or 1
+    return [{"frame": frame, "pct": round(100.0 * n / total, 1)} for frame, n in leaves.most_common(limit)]
+
+
+_PROFILER: StackProfiler | None = None
+_PROFILER_LOCK = threading.Lock()
+
+
+def get_profiler(process: str = "") -> StackProfiler:
+    """Профайлер процесса (один на процесс; создаётся при первом обращении)."""
+    global _PROFILER
+    with _PROFILER_LOCK:
+        if _PROFILER is None:
+            _PROFILER = StackProfiler(process=process)
+        return _PROFILER
+
+
+__all__ = ["MAX_SECONDS", "StackProfiler", "get_profiler"]
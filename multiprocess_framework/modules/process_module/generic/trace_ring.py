@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""trace_ring — per-process кольцо спанов frame_trace + экспорт в Chrome/Perfetto JSON.
+
+``frame_trace`` пишет спаны в ``item["trace"]`` (in-band, едут с кадром) — их
+видно только на выходе цепочки и в логах. Кольцо — out-of-band копия тех же
+спанов С АБСОЛЮТНЫМ ВРЕМЕНЕМ начала: каждый процесс держит последние
+``INSPECTOR_FRAME_TRACE_RING`` спанов (дефолт 8192) и по запросу (команда
+``trace.dump``) отдаёт их снимком. ``merge_dumps`` склеивает снимки всех
+процессов в один таймлайн Chrome Trace Event Format — открывается в
+``ui.perfetto.dev`` / ``chrome://tracing``.
+
+Запись — ``deque(maxlen=N).append`` кортежа: под GIL атомарна, без лока,
+переполнение вытесняет самые старые спаны. Пишутся только спаны
+трассируемых кадров (весь поток при ``INSPECTOR_FRAME_TRACE=1`` или каждый
+N-й кадр при сэмплинге, см. ``frame_trace.set_sample_every``).
+
+Часы: спан фиксирует ``perf_counter`` (монотонный, high-res) — переводы wall-
+часов во время записи не рвут таймлайн. Снимок несёт якорь
+``(wall, perf)``, снятый в момент дампа: ``wall = anchor_wall - (anchor_perf -
+t)``. Так спаны разных процессов сводятся на общую ось wall-часов хоста
+(та же основа, что у transport-спанов и ``capture_ts``).
+
+Формат снимка (plain dict — Dict at Boundary, pickle/json-safe)::
+
+    {"process": "detector", "pid": 4242, "anchor_wall": 1.7e9, "anchor_perf": 812.4,
+     "dropped": 0,
+     "spans": [[t0_perf, ms, kind, name, trace_id, tid, {args}], ...]}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Iterable
+
+_DEFAULT_CAPACITY = 8192
+
+
+def _capacity_from_env() -> int:
+    raw = os.environ.get("INSPECTOR_FRAME_TRACE_RING", "").strip()
+    try:
+        return max(16, int(raw)) if raw else _DEFAULT_CAPACITY
+    except ValueError:
+        return _DEFAULT_CAPACITY
+
+
+class SpanRing:
+    """Кольцо спанов процесса: lock-free append под GIL, снимок по запросу.
+
+    Args:
+        capacity: Сколько последних спанов держать (старые вытесняются).
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._spans: deque[tuple] = deque(maxlen=max(1, int(capacity)))
+        self._written = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._spans.maxlen or 0
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def record(
+        self,
+        t0: float,
+        ms: float,
+        kind: str,
+        name: str,
+        trace_id: str = "",
+        args: dict | None = None,
+    ) -> None:
+        """Записать спан: начало ``t0`` (perf_counter), длительность ``ms``."""
+        self._spans.append((t0, ms, kind, name, trace_id, threading.get_ident(), args or {}))
+        self._written += 1
+
+    def snapshot(self, process: str = "", clear: bool = False) -> dict[str, Any]:
+        """Снимок кольца с якорем часов (см. модульный docstring).
+
+        Args:
+            process: Имя процесса — подпись трека на таймлайне.
+            clear: Очистить кольцо после снимка (следующий дамп — только новое).
+        """
+        spans = list(self._spans)
+        written = self._written
+        if clear:
+            self._spans.clear()
+            self._written = 0
+        return {
+            "process": process or f"pid_{os.getpid()}",
+            "pid": os.getpid(),
+            "anchor_wall": time.time(),
+            "anchor_perf": time.perf_counter(),
+            "dropped": max(0, written - len(spans)),
+            "spans": [list(span) for span in spans],
+        }
+
+    def clear(self) -> None:
+        self._spans.clear()
+        self._written = 0
+
+
+#: Кольцо текущего процесса (spawn-процесс получает своё при импорте модуля).
+RING = SpanRing(_capacity_from_env())
+
+
+def to_chrome_events(dump: dict[str, Any], origin_wall: float = 0.0) -> list[dict[str, Any]]:
+    """Снимок одного процесса → события Chrome Trace (``ph: "X"`` + метаданные трека).
+
+    Args:
+        dump: Результат ``SpanRing.snapshot``.
+        origin_wall: Начало оси (wall, с) — ``ts`` событий отсчитываются от него.
+    """
+    pid = int(dump.get("pid", 0))
+    offset = float(dump["anchor_wall"]) - float(dump["anchor_perf"])
+    events: list[dict[str, Any]] = [
+        {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": dump.get("process", str(pid))}}
+    ]
+    for t0, ms, kind, name, trace_id, tid, args in dump.get("spans", []):
+        event_args = dict(args)
+        if trace_id:
+            event_args["trace_id"] = trace_id
+        events.append(
+            {
+                "ph": "X",
+                "name": name,
+                "cat": kind,
+                "ts": round((t0 + offset - origin_wall) * 1e6, 3),
+                "dur": round(ms * 1000.0, 3),
+                "pid": pid,
+                "tid": tid,
+                "args": event_args,
+            }
+        )
+    return events
+
+
+def merge_dumps(dumps: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Снимки нескольких процессов → один Chrome Trace JSON-объект на общей оси.
+
+    Ось — wall-часы хоста; ноль — начало самого раннего спана (таймлайн
+    открывается с первого события, а не с эпохи). Пустые снимки дают только
+    метаданные трека.
+    """
+    dumps = [d for d in dumps if d]
+    starts = [t0 + float(d["anchor_wall"]) - float(d["anchor_perf"]) for d in dumps for t0, *_ in d.get("spans", [])]
+    origin = min(starts, default=0.0)
+    events: list[dict[str, Any]] = []
+    for dump in dumps:
+        events.extend(to_chrome_events(dump, origin))
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "origin_wall": origin,
+            "processes": [d.get("process", "") for d in dumps],
+            "dropped": sum(int(d.get("dropped", 0)) for d in dumps),
+        },
+    }
+
+
+def write_chrome_trace(path: str, dumps: Iterable[dict[str, Any]]) -> str:
+    """Склеить снимки (``merge_dumps``) и записать JSON-файл. Возвращает путь."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(merge_dumps(dumps), fh)
+    return path
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: склеить файлы-снимки ``trace.dump`` в один таймлайн.
+
+    ``python -m multiprocess_framework.modules.process_module.generic.trace_ring -o timeline.json dumps/*.json``
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Склеить снимки trace.dump в Chrome/Perfetto JSON")
+    parser.add_argument("dumps", nargs="+", help="файлы-снимки (trace.dump с path)")
+    parser.add_argument("-o", "--output", default="timeline.json", help="выходной JSON")
+    args = parser.parse_args(argv)
+    dumps = []
+    for name in args.dumps:
+        with open(name, encoding="utf-8") as fh:
+            dumps.append(json.load(fh))
+    write_chrome_trace(args.output, dumps)
+    print(f"{args.output}: {sum(len(d.get('spans', [])) for d in dumps)} спанов из {len(dumps)} процессов")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
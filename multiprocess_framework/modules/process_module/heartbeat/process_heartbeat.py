@@ -45,6 +45,8 @@ class ProcessHeartbeat:
         # Task 1.2: монотонная метка последней ОТПРАВКИ heartbeat-сообщения. None → ещё
         # не слали (первый тик всегда шлёт — паритет с прежним «send на первой итерации»).
         self._last_heartbeat_sent: float | None = None
+        # Последний опубликованный снапшот CPU-размещения (публикуем только изменения).
+        self._last_placement: dict | None = None
         # PC 1.2: publisher-gate телеметрии. None → гейт неактивен (нет секции
         # telemetry.publish в конфиге) → все метрики каждый тик (обратная совместимость).
         self._telemetry_gate: Any = None
@@ -132,6 +134,10 @@ class ProcessHeartbeat:
                     # (take_dirty) — естественный rate-limit на такт HB.
                     self._publish_health_to_tree()
 
+                    # Фактическое CPU-размещение (affinity, потоки ОС, пулы cv2/torch) —
+                    # только при изменении снапшота.
+                    self._publish_placement_to_tree()
+
                     # Дренаж ObservabilityHub процесса (Ф5.16): log/stats-буфер hub'а
                     # → реальные менеджеры адаптером. error/critical идут мимо буфера
                     # (write-through), здесь их нет. Прецедент — health self-publish 2.1.
@@ -226,6 +232,13 @@ class ProcessHeartbeat:
                 if isinstance(w, dict):
                     w.pop("metrics", None)
             heartbeat_msg["workers_status"] = workers
+        # Профиль холодного старта (ADR-PM-023) — только когда изменился с прошлой
+        # отправки: до первого кадра пару раз, потом heartbeat снова без него.
+        from ..lifecycle.boot_profile import pending_report
+
+        boot = pending_report()
+        if boot is not None:
+            heartbeat_msg["boot_profile"] = boot
         self._services.send_message("ProcessManager", heartbeat_msg)
 
     def _warn_capped_metrics(self, config: Any) -> None:
@@ -600,3 +613,27 @@ class ProcessHeartbeat:
         except Exception as exc:  # noqa: BLE001 — health не критичен для работы процесса
             _log = getattr(self._services, "log_debug", self._services.log_info)
             _log(f"Не удалось self-publish health процесса: {exc}", module="heartbeat")
+
+    def _publish_placement_to_tree(self) -> None:
+        """Опубликовать фактическое CPU-размещение процесса в ``processes.<name>.placement``.
+
+        Снапшот ``placement_snapshot()``: текущая affinity, число потоков ОС и Python,
+        заданные лимиты пулов и размеры пулов загруженных cv2/torch — видно, сработал
+        ли ``placement`` и не расплодила ли библиотека потоки сверх лимита. Шлётся
+        только при изменении (такт heartbeat, не телеметрийный тик).
+        """
+        proxy = getattr(self._services, "_state_proxy", None)
+        if proxy is None:
+            return
+
+        from ..lifecycle.cpu_placement import placement_snapshot
+
+        try:
+            snap = placement_snapshot()
+            if snap == self._last_placement:
+                return
+            proxy.set(f"processes.{self._services.name}.placement", snap)
+            self._last_placement = snap
+        except Exception as exc:  # noqa: BLE001 — размещение не критично для такта HB
+            _log = getattr(self._services, "log_debug", self._services.log_info)
+            _log(f"Не удалось self-publish CPU-размещения: {exc}", module="heartbeat")
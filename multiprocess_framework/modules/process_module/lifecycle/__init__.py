@@ -2,10 +2,16 @@
 Lifecycle компоненты Process Module.
 """
 
+from .cpu_placement import apply_placement, placement_env, placement_snapshot, resolve_thread_caps, thread_cap
 from .gc_discipline import GcDiscipline
 from .process_lifecycle import ProcessLifecycle
 
 __all__ = [
     "ProcessLifecycle",
     "GcDiscipline",
+    "apply_placement",
+    "placement_env",
+    "placement_snapshot",
+    "resolve_thread_caps",
+    "thread_cap",
 ]
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+"""boot_profile — профиль холодного старта процесса: импорты и фазы boot до первого кадра.
+
+Каждый дочерний процесс заново импортирует фреймворк, плагины, numpy/cv2 и
+(опционально) onnxruntime/torch, поднимает менеджеры, SHM и плагины — и только
+потом отдаёт первый кадр. Здесь это раскладывается по времени:
+
+- **фазы** — отрезки boot на оси «мс от создания OS-процесса» (``psutil``
+  ``create_time``). ``spawn`` — от создания до входа в раннер (старт
+  интерпретатора, распаковка bundle, импорт раннера); дальше раннер и
+  ``ProcessModule.initialize`` размечают ``class_import`` / ``shm_attach`` /
+  ``config`` / ``managers`` / ``communication`` / ``plugins`` / ``threads``,
+  оркестратор — ``plugin:<name>.load|configure|start``;
+- **отметки** — ``runner`` / ``ready`` (ready_event) / ``first_frame`` (первый
+  непустой выход ``process``/``produce`` любого плагина, кто — ``first_frame_by``);
+- **импорты** — перехват ``importlib._bootstrap._find_and_load`` (тот же шов, что
+  у ``python -X importtime``): на модуль — собственное и накопленное время, глубина
+  вложенности и фаза, в которой импорт случился. Стек вложенности — на поток.
+  Перехват снимается на ``first_frame`` или через ``READY_GRACE_S`` после ``ready``
+  (GUI, sink'и, device hub кадров не отдают — ``first_frame`` у них не наступает,
+  а ленивые импорты первых команд ещё попадают в профиль). Импорты до входа в раннер (распаковка
+  target'а спавна тянет пакет ``multiprocess_framework``) перехватить нечем — они
+  внутри ``spawn`` одним куском, их число — ``imports.preloaded``; разложить их
+  поможет ``python -X importtime``.
+
+Включено по умолчанию во всех процессах, поднятых раннером (``start`` в
+``run_process_function``), выключается env ``INSPECTOR_BOOT_PROFILE=0``. Вне
+раннера (тесты, in-process ``ProcessModule``) профиля нет и ``phase``/``mark`` —
+no-op. Цена перехвата — в пределах шума замера импорта; отметки — чтение глобала.
+
+Отчёт процесса (:meth:`BootProfile.report`) — json-safe dict; heartbeat несёт его
+ProcessManager'у при каждом изменении (:func:`pending_report`), ``ProcessMonitor``
+склеивает отчёты процессов (:func:`merge_reports`, команда PM ``boot.report``).
+Сравнение со сборкой-baseline — CLI::
+
+    python -m multiprocess_framework.modules.process_module.lifecycle.boot_profile boot.json
+    python -m multiprocess_framework.modules.process_module.lifecycle.boot_profile \\
+        --baseline boot_prev.json --tolerance 0.2 --min-ms 50 boot.json
+
+С ``--baseline`` код выхода 1, если time-to-first-frame процесса, его фаза или
+импорт модуля выросли больше допуска (регрессия).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib._bootstrap as _bootstrap
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+#: Строк импортов в отчёте процесса (по собственному и по накопленному времени).
+TOP_IMPORTS = 25
+#: Потолок хранимых записей импортов (дальше — только счётчики).
+MAX_IMPORTS = 5000
+#: Сколько секунд после ``ready`` держать перехват импортов, если ``first_frame`` не наступил.
+READY_GRACE_S = 10.0
+
+_ENV_SWITCH = "INSPECTOR_BOOT_PROFILE"
+
+_ORIG_FIND_AND_LOAD = getattr(_bootstrap, "_find_and_load", None)
+
+
+class BootProfile:
+    """Фазы, отметки и импорты холодного старта одного процесса (см. модуль)."""
+
+    def __init__(self, process: str, created: Optional[float] = None) -> None:
+        self.process = process
+        self.pid = os.getpid()
+        now = time.time()
+        self.created = created if created is not None and created <= now else now
+        self._t0 = time.perf_counter()
+        self._offset_ms = (now - self.created) * 1000.0
+        self._lock = threading.Lock()
+        self._phases: List[List[Any]] = [["spawn", 0.0, round(self._offset_ms, 2)]]
+        self._marks: Dict[str, float] = {"runner": round(self._offset_ms, 2)}
+        self._first_frame_by = ""
+        self._phase = "runner"
+        self._imports: List[tuple] = []
+        self._import_count = 0
+        self._import_ms = 0.0
+        self._preloaded = len(sys.modules)
+        self._stacks: Dict[int, List[float]] = {}
+        self.revision = 1
+
+    def now_ms(self) -> float:
+        """Мс от создания OS-процесса."""
+        return self._offset_ms + (time.perf_counter() - self._t0) * 1000.0
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Отрезок boot ``name``; импорты внутри помечаются этой фазой."""
+        outer = self._phase
+        self._phase = name
+        start = self.now_ms()
+        try:
+            yield
+        finally:
+            self._phase = outer
+            with self._lock:
+                self._phases.append([name, round(start, 2), round(self.now_ms() - start, 2)])
+                self.revision += 1
+
+    def mark(self, name: str, by: str = "") -> bool:
+        """Отметка ``name`` (первая выигрывает). True — отметка поставлена сейчас."""
+        if name in self._marks:
+            return False
+        with self._lock:
+            if name in self._marks:
+                return False
+            self._marks[name] = round(self.now_ms(), 2)
+            if name == "first_frame":
+                self._first_frame_by = by
+            self.revision += 1
+        return True
+
+    def _record_import(self, name: str, self_ms: float, cum_ms: float, depth: int) -> None:
+        with self._lock:
+            self._import_count += 1
+            if depth == 0:
+                self._import_ms += cum_ms
+            if len(self._imports) < MAX_IMPORTS:
+                self._imports.append((name, self_ms, cum_ms, depth, self._phase))
+            self.revision += 1
+
+    def report(self, top: int = TOP_IMPORTS) -> Dict[str, Any]:
+        """Json-safe отчёт процесса: фазы, отметки, топ импортов."""
+        with self._lock:
+            imports = list(self._imports)
+            phases = [list(row) for row in self._phases]
+            marks = dict(self._marks)
+            count, total = self._import_count, self._import_ms
+        top = max(1, int(top))
+
+        def rows(items: List[tuple]) -> List[List[Any]]:
+            return [[name, round(own, 2), round(cum, 2), phase] for name, own, cum, _, phase in items]
+
+        by_self = sorted(imports, key=lambda row: row[1], reverse=True)[:top]
+        roots = sorted((row for row in imports if row[3] == 0), key=lambda row: row[2], reverse=True)[:top]
+        return {
+            "process": self.process,
+            "pid": self.pid,
+            "created": self.created,
+            "phases": phases,
+            "marks": marks,
+            "first_frame_by": self._first_frame_by,
+            "time_to_ready_ms": marks.get("ready"),
+            "time_to_first_frame_ms": marks.get("first_frame"),
+            "imports": {
+                "count": count,
+                "total_ms": round(total, 2),
+                "preloaded": self._preloaded,
+                "self": rows(by_self),
+                "roots": rows(roots),
+            },
+        }
+
+
+# ----------------------------------------------------------------------
+# Перехват импортов
+
+
+def _timed_find_and_load(name: str, import_: Any) -> Any:
+    profile = _PROFILE
+    if profile is None:
+        return _ORIG_FIND_AND_LOAD(name, import_)
+    stack = profile._stacks.setdefault(threading.get_ident(), [])
+    stack.append(0.0)
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        module = _ORIG_FIND_AND_LOAD(name, import_)
+        ok = True
+        return module
+    finally:
+        cum_ms = (time.perf_counter() - t0) * 1000.0
+        children_ms = stack.pop()
+        if stack:
+            stack[-1] += cum_ms
+        else:
+            profile._stacks.pop(threading.get_ident(), None)  # поток вышел из импорта — запись не копится
+        if ok:
+            profile._record_import(name, cum_ms - children_ms, cum_ms, len(stack))
+
+
+def _install_import_hook() -> bool:
+    if _ORIG_FIND_AND_LOAD is None:
+        return False  # другой рантайм без этого шва — профиль без импортов
+    _bootstrap._find_and_load = _timed_find_and_load
+    return True
+
+
+def _remove_import_hook() -> None:
+    if _ORIG_FIND_AND_LOAD is not None and _bootstrap._find_and_load is _timed_find_and_load:
+        _bootstrap._find_and_load = _ORIG_FIND_AND_LOAD
+
+
+# ----------------------------------------------------------------------
+# Профиль процесса (синглтон) и точки разметки
+
+
+_PROFILE: Optional[BootProfile] = None
+_SENT_REVISION = 0
+_GRACE_TIMER: Optional[threading.Timer] = None
+
+
+def _process_created() -> Optional[float]:
+    try:
+        import psutil
+
+        return psutil.Process().create_time()
+    except Exception:  # noqa: BLE001 — без времени создания ось начинается со входа в раннер
+        return None
+
+
+def start(process: str) -> Optional[BootProfile]:
+    """Начать профиль процесса (раннер, до загрузки класса). None — выключен env."""
+    global _PROFILE, _SENT_REVISION
+    if os.environ.get(_ENV_SWITCH, "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    _PROFILE = BootProfile(process, created=_process_created())
+    _SENT_REVISION = 0
+    _install_import_hook()
+    return _PROFILE
+
+
+def stop() -> None:
+    """Снять перехват импортов и забыть профиль."""
+    global _PROFILE, _GRACE_TIMER
+    timer, _GRACE_TIMER = _GRACE_TIMER, None
+    if timer is not None:
+        timer.cancel()
+    _remove_import_hook()
+    _PROFILE = None
+
+
+def get_profile() -> Optional[BootProfile]:
+    return _PROFILE
+
+
+def phase(name: str) -> Any:
+    """Контекст-менеджер фазы boot; без профиля — no-op."""
+    profile = _PROFILE
+    if profile is None:
+        return contextlib.nullcontext()
+    return profile.phase(name)
+
+
+def mark(name: str, by: str = "") -> None:
+    """Отметка boot (``ready`` / ``first_frame``).
+
+    ``first_frame`` снимает перехват импортов сразу, ``ready`` — через
+    ``READY_GRACE_S`` (процессы без кадров не держат перехват до выхода).
+    """
+    global _GRACE_TIMER
+    profile = _PROFILE
+    if profile is None or not profile.mark(name, by):
+        return
+    if name == "first_frame":
+        _remove_import_hook()
+    elif name == "ready" and _GRACE_TIMER is None:
+        _GRACE_TIMER = threading.Timer(READY_GRACE_S, _remove_import_hook)
+        _GRACE_TIMER.daemon = True
+        _GRACE_TIMER.start()
+
+
+def on_plugin_output(plugin: Any, method: str, inputs: Any, outputs: Any) -> None:
+    """Post-хук ``PluginRunner``: первый непустой выход плагина — ``first_frame``."""
+    profile = _PROFILE
+    if profile is not None and outputs and "first_frame" not in profile._marks:
+        mark("first_frame", by=getattr(plugin, "name", ""))
+
+
+def report(top: int = TOP_IMPORTS) -> Optional[Dict[str, Any]]:
+    profile = _PROFILE
+    return profile.report(top) if profile is not None else None
+
+
+def pending_report() -> Optional[Dict[str, Any]]:
+    """Отчёт, если профиль изменился с прошлой отправки (heartbeat), иначе None."""
+    global _SENT_REVISION
+    profile = _PROFILE
+    if profile is None or profile.revision == _SENT_REVISION:
+        return None
+    _SENT_REVISION = profile.revision
+    return profile.report()
+
+
+# ----------------------------------------------------------------------
+# Склейка и сравнение отчётов процессов
+
+
+def _phase_totals(phases: Iterable[List[Any]]) -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    for name, _start, dur in phases:
+        totals[name] = round(totals.get(name, 0.0) + float(dur), 2)
+    return totals
+
+
+def _as_merged(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Отчёт процесса → форма склейки (склеенный отчёт возвращается как есть)."""
+    if "processes" in report:
+        return report
+    process = report.get("process", "?")
+    imports = report.get("imports") or {}
+    return {
+        "processes": [
+            {
+                "process": process,
+                "pid": report.get("pid"),
+                "created": report.get("created"),
+                "time_to_ready_ms": report.get("time_to_ready_ms"),
+                "time_to_first_frame_ms": report.get("time_to_first_frame_ms"),
+                "first_frame_by": report.get("first_frame_by", ""),
+                "import_ms": imports.get("total_ms", 0.0),
+                "imports": imports.get("count", 0),
+                "phases": _phase_totals(report.get("phases", ())),
+            }
+        ],
+        "imports": [[name, 1, own, cum] for name, own, cum, _phase in imports.get("self", ())],
+        "roots": [[process, name, cum, phase] for name, _own, cum, phase in imports.get("roots", ())],
+    }
+
+
+def _boot_ms(proc: Dict[str, Any]) -> float:
+    ttff = proc.get("time_to_first_frame_ms")
+    return float(ttff if ttff is not None else proc.get("time_to_ready_ms") or 0.0)
+
+
+def merge_reports(reports: Iterable[Dict[str, Any]], top: int = 30) -> Dict[str, Any]:
+    """Склеить отчёты процессов: процессы по time-to-first-frame, импорты — по сумме собственного времени.
+
+    ``system`` — ось всей системы по wall-часам: от создания первого процесса до
+    ``ready`` / ``first_frame`` последнего (``critical`` — кто его держит).
+    """
+    processes: List[Dict[str, Any]] = []
+    imports: Dict[str, List[Any]] = {}
+    roots: List[List[Any]] = []
+    for report in reports:
+        part = _as_merged(report)
+        processes.extend(part.get("processes", ()))
+        roots.extend(part.get("roots", ()))
+        for name, procs, own, cum in part.get("imports", ()):
+            row = imports.setdefault(name, [name, 0, 0.0, 0.0])
+            row[1] += procs
+            row[2] = round(row[2] + own, 2)
+            row[3] = max(row[3], cum)
+    processes.sort(key=_boot_ms, reverse=True)
+    top = max(1, int(top))
+
+    system: Dict[str, Any] = {}
+    created = [p["created"] for p in processes if p.get("created")]
+    if created:
+        origin = min(created)
+        for key, field in (("ready_ms", "time_to_ready_ms"), ("first_frame_ms", "time_to_first_frame_ms")):
+            ends = [(p["created"] - origin) * 1000.0 + p[field] for p in processes if p.get(field) is not None]
+            system[key] = round(max(ends), 2) if ends else None
+        system["critical"] = processes[0]["process"] if processes else ""
+    return {
+        "system": system,
+        "processes": processes,
+        "imports": sorted(imports.values(), key=lambda row: row[2], reverse=True)[:top],
+        "roots": sorted(roots, key=lambda row: row[2], reverse=True)[:top],
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.2, min_ms: float = 50.0
+) -> List[Dict[str, Any]]:
+    """Регрессии ``current`` против ``baseline``: выросло > ``tolerance`` и ≥ ``min_ms`` мс.
+
+    Ключи: ``(процесс, "first_frame")`` (или ``ready`` без кадров), ``(процесс,
+    "phase:<фаза>")`` и ``("*", "import:<модуль>")`` — сумма собственного времени
+    импорта модуля по процессам.
+    """
+
+    def rows(report: Dict[str, Any]) -> Dict[tuple, float]:
+        merged = merge_reports([report], top=10_000)
+        out: Dict[tuple, float] = {}
+        for proc in merged["processes"]:
+            label = "first_frame" if proc.get("time_to_first_frame_ms") is not None else "ready"
+            out[(proc["process"], label)] = _boot_ms(proc)
+            for name, dur in (proc.get("phases") or {}).items():
+                out[(proc["process"], f"phase:{name}")] = float(dur)
+        out.update({("*", f"import:{row[0]}"): float(row[2]) for row in merged["imports"]})
+        return out
+
+    base, new = rows(baseline), rows(current)
+    regressions = []
+    for key, value in new.items():
+        prev = base.get(key, 0.0)
+        if value - prev >= min_ms and value > prev * (1.0 + tolerance):
+            regressions.append(
+                {
+                    "process": key[0],
+                    "item": key[1],
+                    "baseline": prev,
+                    "current": value,
+                    "delta": round(value - prev, 2),
+                }
+            )
+    regressions.sort(key=lambda r: r["delta"], reverse=True)
+    return regressions
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:.0f}" if value is not None else "—"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: склеить boot-отчёты, напечатать процессы и тяжёлые импорты, сравнить с baseline."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Склейка boot-профилей процессов (boot.report / отчёты процессов)")
+    parser.add_argument("reports", nargs="+", help="JSON ответа boot.report (Driver.boot_report) или отчёты процессов")
+    parser.add_argument("-o", "--output", default="", help="записать склеенный отчёт (JSON)")
+    parser.add_argument("--top", type=int, default=15, help="строк в таблице импортов")
+    parser.add_argument("--baseline", default="", help="отчёт прошлой сборки для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="допуск роста (доля)")
+    parser.add_argument("--min-ms", type=float, default=50.0, help="минимальный рост, мс")
+    args = parser.parse_args(argv)
+
+    merged = merge_reports((_load(path) for path in args.reports), top=max(args.top, 30))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(merged, fh)
+
+    out = sys.stdout
+    system = merged["system"]
+    if system:
+        out.write(
+            f"система: ready {_fmt(system.get('ready_ms'))} мс, first_frame {_fmt(system.get('first_frame_ms'))} мс "
+            f"(критический — {system.get('critical')})\n"
+        )
+    out.write(f"{'ready':>7} {'кадр':>7} {'импорт':>7}  процесс / фазы, мс\n")
+    for proc in merged["processes"]:
+        phases = ", ".join(f"{name} {dur:.0f}" for name, dur in (proc.get("phases") or {}).items() if dur >= 1.0)
+        out.write(
+            f"{_fmt(proc.get('time_to_ready_ms')):>7} {_fmt(proc.get('time_to_first_frame_ms')):>7} "
+            f"{proc.get('import_ms', 0.0):>7.0f}  {proc['process']} / {phases}\n"
+        )
+    out.write(f"{'своё мс':>8} {'макс.нак':>8} {'проц.':>5}  модуль\n")
+    for name, procs, own, cum in merged["imports"][: args.top]:
+        out.write(f"{own:>8.1f} {cum:>8.1f} {procs:>5}  {name}\n")
+
+    if not args.baseline:
+        return 0
+    regressions = compare(_load(args.baseline), merged, args.tolerance, args.min_ms)
+    for reg in regressions:
+        out.write(f"РЕГРЕССИЯ {reg['process']} / {reg['item']}: {reg['baseline']:.0f} → {reg['current']:.0f} мс\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
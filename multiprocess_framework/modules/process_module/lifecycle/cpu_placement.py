@@ -0,0 +1,208 @@
+"""CPU-размещение процесса: affinity + лимиты нативных пулов потоков.
+
+Проблема: OpenCV, ONNX Runtime, torch и BLAS под numpy по умолчанию поднимают пул
+«на все ядра» в КАЖДОМ процессе. Топология из 10 процессов на 8 ядрах — это ~80
+нативных потоков, дерущихся за ядра: переключения контекста и хвосты latency.
+
+Секция ``placement`` конфига процесса (``GenericProcessConfig.placement``, в рецепте —
+``extras.placement``)::
+
+    {"cpus": [2, 3], "threads": 2, "cv2_threads": 1, "torch_interop_threads": 1}
+
+* ``cpus`` — набор ядер процесса (``os.sched_setaffinity``; без него — psutil).
+  Пусто → без пиннинга.
+* ``threads`` — базовый лимит нативных пулов; не задан → ``len(cpus)``.
+* ``blas_threads`` / ``cv2_threads`` / ``torch_threads`` / ``torch_interop_threads`` /
+  ``onnx_intra_op_threads`` / ``onnx_inter_op_threads`` — точечные override'ы.
+  Inter-op пулы по умолчанию 1: параллелизм между операторами на пиннутом наборе
+  ядер только отнимает их у intra-op.
+
+Применение в два этапа (старт — spawn):
+
+1. **Родитель** ставит env-лимиты (``placement_env``) на время ``Process.start()`` —
+   ребёнок наследует окружение. Это единственный способ ограничить OpenBLAS: numpy
+   грузится в ребёнке раньше любого кода процесса (импорт runner'а).
+2. **Ребёнок** до импорта класса процесса зовёт ``apply_placement``: affinity,
+   те же env (идемпотентно) и запоминает лимиты. cv2 читает
+   ``OPENCV_FOR_THREADS_NUM`` при импорте, torch intra-op — ``OMP_NUM_THREADS``;
+   ONNX Runtime env не читает — backend берёт ``thread_cap("onnx_intra_op")`` в
+   ``SessionOptions``, torch inter-op — ``thread_cap("torch_interop")``.
+
+Фактическое состояние (affinity, число потоков ОС, пулы загруженных библиотек) —
+``placement_snapshot``; heartbeat публикует его в ``processes.<name>.placement``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Optional
+
+# Лимит → env-переменные, которые его несут (читаются библиотекой при загрузке).
+_ENV_BY_CAP: dict[str, tuple[str, ...]] = {
+    "blas": (
+        "OMP_NUM_THREADS",
+        "OPENBLAS_NUM_THREADS",
+        "MKL_NUM_THREADS",
+        "NUMEXPR_NUM_THREADS",
+        "VECLIB_MAXIMUM_THREADS",
+    ),
+    "cv2": ("OPENCV_FOR_THREADS_NUM",),
+}
+
+# Имя лимита → ключ секции placement с точечным override.
+_CAP_KEYS: dict[str, str] = {
+    "blas": "blas_threads",
+    "cv2": "cv2_threads",
+    "torch": "torch_threads",
+    "torch_interop": "torch_interop_threads",
+    "onnx_intra_op": "onnx_intra_op_threads",
+    "onnx_inter_op": "onnx_inter_op_threads",
+}
+
+# Inter-op пулы: дефолт 1, а не базовый лимит.
+_INTER_OP = frozenset({"torch_interop", "onnx_inter_op"})
+
+# Лимиты, применённые в ЭТОМ процессе (apply_placement); читает thread_cap.
+_applied_caps: dict[str, int] = {}
+_applied_cpus: Optional[list[int]] = None
+
+
+def resolve_thread_caps(placement: Optional[Mapping[str, Any]]) -> dict[str, int]:
+    """Лимиты пулов из секции placement: ``{blas, cv2, torch, ...: n}``.
+
+    Базовый лимит — ``threads``, иначе ``len(cpus)``; нет ни того, ни другого —
+    только явно заданные override'ы. Значения < 1 отбрасываются.
+    """
+    if not placement:
+        return {}
+    base = placement.get("threads") or len(placement.get("cpus") or ()) or None
+    caps: dict[str, int] = {}
+    for cap, key in _CAP_KEYS.items():
+        value = placement.get(key)
+        if value is None and base:
+            value = 1 if cap in _INTER_OP else base
+        if value is not None and int(value) >= 1:
+            caps[cap] = int(value)
+    return caps
+
+
+def placement_env(placement: Optional[Mapping[str, Any]]) -> dict[str, str]:
+    """Env-переменные лимитов для окружения дочернего процесса."""
+    env: dict[str, str] = {}
+    for cap, value in resolve_thread_caps(placement).items():
+        for var in _ENV_BY_CAP.get(cap, ()):
+            env[var] = str(value)
+    return env
+
+
+def apply_placement(placement: Optional[Mapping[str, Any]]) -> dict[str, Any]:
+    """Применить placement к ТЕКУЩЕМУ процессу (ребёнок, до импорта класса процесса).
+
+    Returns:
+        ``{"cpus": [...] | None, "caps": {...}, "warnings": [...]}``; пустой dict,
+        если секции нет. Недоступные ядра и отказ ОС — предупреждения, не ошибка:
+        процесс стартует без пиннинга, но с лимитами потоков.
+    """
+    global _applied_cpus
+    if not placement:
+        return {}
+    warnings: list[str] = []
+    os.environ.update(placement_env(placement))
+    caps = resolve_thread_caps(placement)
+    _applied_caps.clear()
+    _applied_caps.update(caps)
+
+    applied: Optional[list[int]] = None
+    wanted = sorted({int(c) for c in placement.get("cpus") or ()})
+    if wanted:
+        allowed = _current_affinity()
+        cpus = [c for c in wanted if allowed is None or c in allowed]
+        if len(cpus) < len(wanted):
+            warnings.append(f"ядра {sorted(set(wanted) - set(cpus))} недоступны процессу — пропущены")
+        if cpus:
+            error = _set_affinity(cpus)
+            if error:
+                warnings.append(f"affinity {cpus} не применена: {error}")
+            else:
+                applied = cpus
+    _applied_cpus = applied
+    return {"cpus": applied, "caps": caps, "warnings": warnings}
+
+
+def thread_cap(name: str, default: Optional[int] = None) -> Optional[int]:
+    """Лимит пула ``name`` (``"onnx_intra_op"``, ``"torch_interop"``, ...) в этом процессе.
+
+    ``None``/``default`` — лимит не задан (процесс без placement или вне runner'а).
+    """
+    return _applied_caps.get(name, default)
+
+
+def placement_snapshot() -> dict[str, Any]:
+    """Фактическое размещение процесса для телеметрии.
+
+    ``cpus`` — текущая affinity ОС, ``os_threads`` — все потоки процесса (нативные
+    пулы включительно), ``py_threads`` — потоки Python, ``caps`` — заданные лимиты,
+    ``libs`` — размеры пулов уже загруженных cv2/torch (библиотеку не импортирует).
+    """
+    affinity = _current_affinity()
+    snap: dict[str, Any] = {
+        "cpus": sorted(affinity) if affinity is not None else None,
+        "pinned": _applied_cpus is not None,
+        "os_threads": _os_thread_count(),
+        "py_threads": threading.active_count(),
+        "caps": dict(_applied_caps),
+    }
+    libs: dict[str, int] = {}
+    cv2 = sys.modules.get("cv2")
+    if cv2 is not None and hasattr(cv2, "getNumThreads"):
+        libs["cv2"] = int(cv2.getNumThreads())
+    torch = sys.modules.get("torch")
+    if torch is not None and hasattr(torch, "get_num_threads"):
+        libs["torch"] = int(torch.get_num_threads())
+        libs["torch_interop"] = int(torch.get_num_interop_threads())
+    snap["libs"] = libs
+    return snap
+
+
+# --- Платформенные примитивы ---
+
+
+def _current_affinity() -> Optional[set[int]]:
+    if hasattr(os, "sched_getaffinity"):
+        return set(os.sched_getaffinity(0))
+    try:
+        import psutil
+
+        return set(psutil.Process().cpu_affinity())
+    except Exception:  # noqa: BLE001 — нет psutil / не поддерживается (macOS)
+        return None
+
+
+def _set_affinity(cpus: list[int]) -> Optional[str]:
+    """Пиннинг текущего процесса; строка ошибки или None."""
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+            return None
+        import psutil
+
+        psutil.Process().cpu_affinity(cpus)
+        return None
+    except Exception as exc:  # noqa: BLE001 — нет прав / macOS без affinity API
+        return str(exc) or type(exc).__name__
+
+
+def _os_thread_count() -> int:
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        pass
+    try:
+        import psutil
+
+        return int(psutil.Process().num_threads())
+    except Exception:  # noqa: BLE001 — без psutil: хотя бы потоки Python
+        return threading.active_count()
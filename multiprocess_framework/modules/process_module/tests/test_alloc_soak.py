@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""AllocSoak — soak-профиль аллокаций на кадр по плагинам + склейка отчётов процессов."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from multiprocess_framework.modules.process_module.generic import alloc_soak, frame_trace
+from multiprocess_framework.modules.process_module.generic.alloc_soak import AllocSoak
+from multiprocess_framework.modules.process_module.plugins.base import ProcessModulePlugin
+
+
+class LeakyPlugin(ProcessModulePlugin):
+    """Удерживает ~1 КБ на кадр; первый вызов — «ленивая инициализация» на 200 КБ."""
+
+    name = "leaky"
+    category = "processing"
+
+    def __init__(self) -> None:
+        self.held: list = []
+        self.cache = None
+
+    def configure(self, ctx): ...
+    def start(self, ctx): ...
+
+    def process(self, items):
+        if self.cache is None:
+            self.cache = bytearray(200_000)
+        for _ in items if isinstance(items, list) else [items]:
+            self.held.append(bytearray(1000))
+        return items
+
+
+frame_trace.install_tracing(LeakyPlugin)
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setattr(alloc_soak, "_SOAK", None)
+    monkeypatch.setattr(alloc_soak, "_REQUESTED", None)
+    monkeypatch.delenv("INSPECTOR_ALLOC_SOAK", raising=False)
+    yield
+    if alloc_soak._SOAK is not None:
+        alloc_soak._SOAK.stop()
+    frame_trace.set_call_hook(None)
+
+
+def _run(plugin: LeakyPlugin, frames: int, batch: int = 1) -> None:
+    for _ in range(frames // batch):
+        plugin.process([{"frame": 1}] * batch if batch > 1 else {"frame": 1})
+
+
+class TestAllocSoak:
+    def test_attributes_retained_bytes_to_plugin(self) -> None:
+        soak = AllocSoak("preprocessor")
+        plugin = LeakyPlugin()
+        soak.start(nframe=8, warmup=0)
+        _run(plugin, 100)
+        report = soak.stop()
+
+        assert report["frames"] == 100
+        assert report["calls"] == {"leaky": 100}
+        owner, bytes_per_frame, blocks_per_frame = report["owners"][0]
+        assert owner == "plugin:leaky"
+        assert 1000 <= bytes_per_frame < 4000  # + 200 КБ кэша первого вызова / 100 кадров
+        assert blocks_per_frame >= 1
+        assert any(
+            site.startswith("multiprocess_framework/") and "test_alloc_soak.py" in site
+            for _, site, *_ in report["sites"]
+        )
+        assert report["stacks"][0][0].startswith("preprocessor;[plugin:leaky];")
+        json.dumps(report)  # json-safe: уходит через IPC/файл
+
+    def test_warmup_excludes_lazy_init(self) -> None:
+        soak = AllocSoak("preprocessor")
+        plugin = LeakyPlugin()
+        soak.start(warmup=10)
+        _run(plugin, 5)
+        assert soak.status()["state"] == "warmup"
+        _run(plugin, 105)
+        report = soak.stop()
+        assert report["frames"] == 100
+        assert dict((o, b) for o, b, _ in report["owners"])["plugin:leaky"] < 2000  # без 200 КБ кэша
+
+    def test_batch_counts_items(self) -> None:
+        soak = AllocSoak("preprocessor")
+        soak.start(warmup=0)
+        _run(LeakyPlugin(), 30, batch=3)
+        assert soak.report()["frames"] == 30
+        soak.stop()
+
+    def test_stop_removes_hook_and_keeps_last_report(self) -> None:
+        soak = AllocSoak("preprocessor")
+        soak.start(warmup=0)
+        assert soak.start()["success"] is False  # второй start идущего soak — отказ
+        _run(LeakyPlugin(), 10)
+        report = soak.stop()
+        assert frame_trace._CALL_HOOK is None
+        assert soak.status()["state"] == "done"
+        assert soak.report() == report
+        assert soak.stop() == report
+
+    def test_area_labels(self) -> None:
+        assert alloc_soak._area("/r/multiprocess_framework/modules/router_module/x.py") == "framework:router_module"
+        assert alloc_soak._area("/r/Services/camera/grab.py") == "service:camera"
+        assert alloc_soak._area("/r/Plugins/_shared/fanin/m.py") == "plugins:_shared"
+        assert alloc_soak._area("/usr/lib/python3.11/json/encoder.py") is None
+
+
+class TestSwitchOn:
+    def test_env_selects_processes(self, monkeypatch) -> None:
+        monkeypatch.setenv("INSPECTOR_ALLOC_SOAK", "detector, stitcher")
+        assert alloc_soak.start_requested("camera_0") is None
+        status = alloc_soak.start_requested("detector")
+        assert status["success"] is True and status["process"] == "detector"
+
+    def test_config_request_and_finish_writes_report(self, tmp_path) -> None:
+        alloc_soak.request({"warmup": 0, "nframe": 4, "path": str(tmp_path)})
+        status = alloc_soak.start_requested("preprocessor")
+        assert status["state"] == "running" and status["nframe"] == 4
+        _run(LeakyPlugin(), 20)
+        path = alloc_soak.finish("preprocessor")
+        assert path.startswith(str(tmp_path / "preprocessor-"))
+        with open(path, encoding="utf-8") as fh:
+            assert json.load(fh)["frames"] == 20
+        assert alloc_soak.finish("preprocessor") is None  # уже остановлен
+
+
+def _report(process: str, owners: list, frames: int = 100) -> dict:
+    total = sum(row[1] for row in owners)
+    return {
+        "process": process,
+        "pid": 1,
+        "frames": frames,
+        "duration_s": 1.0,
+        "bytes_per_frame": total,
+        "blocks_per_frame": 1.0,
+        "owners": owners,
+        "sites": [[owner, f"{owner}.py:1", b, n] for owner, b, n in owners],
+        "stacks": [[f"{process};[{owner}];{owner}.py:1", b] for owner, b, _ in owners],
+    }
+
+
+class TestMergeAndCompare:
+    def test_merge_ranks_across_processes(self) -> None:
+        merged = alloc_soak.merge_reports(
+            [
+                _report("camera_0", [["plugin:grab", 500.0, 2.0]]),
+                _report("detector", [["plugin:hsv", 2000.0, 9.0], ["framework:router_module", 40.0, 1.0]]),
+            ]
+        )
+        assert [p["process"] for p in merged["processes"]] == ["detector", "camera_0"]
+        assert merged["sites"][0][:3] == ["detector", "plugin:hsv", "plugin:hsv.py:1"]
+        assert alloc_soak.collapsed(merged).splitlines()[0] == "detector;[plugin:hsv];plugin:hsv.py:1 2000"
+        # Склеенный отчёт — снова валидный вход (baseline прошлой сборки).
+        assert alloc_soak.merge_reports([merged])["owners"] == merged["owners"]
+
+    def test_compare_flags_growth_beyond_tolerance(self) -> None:
+        base = _report("detector", [["plugin:hsv", 1000.0, 5.0], ["plugin:blur", 100.0, 1.0]])
+        new = _report("detector", [["plugin:hsv", 1050.0, 5.0], ["plugin:blur", 400.0, 3.0], ["plugin:new", 80.0, 1]])
+        regressions = alloc_soak.compare(base, new, tolerance=0.1, min_bytes=64)
+        assert [(r["owner"], r["delta"]) for r in regressions] == [
+            ("*", 430.0),
+            ("plugin:blur", 300.0),
+            ("plugin:new", 80.0),
+        ]
+
+    def test_cli_merge_and_baseline_exit_code(self, tmp_path, capsys) -> None:
+        paths = []
+        for process, bpf in (("camera_0", 300.0), ("detector", 900.0)):
+            path = tmp_path / f"{process}-1.alloc.json"
+            path.write_text(json.dumps(_report(process, [["plugin:x", bpf, 1.0]])), encoding="utf-8")
+            paths.append(str(path))
+        out = tmp_path / "soak.json"
+        folded = tmp_path / "soak.folded"
+        assert alloc_soak.main(["-o", str(out), "--collapsed", str(folded), *paths]) == 0
+        assert "detector / plugin:x" in capsys.readouterr().out
+        assert len(folded.read_text(encoding="utf-8").splitlines()) == 2
+
+        grown = tmp_path / "detector-2.alloc.json"
+        grown.write_text(json.dumps(_report("detector", [["plugin:x", 2000.0, 1.0]])), encoding="utf-8")
+        assert alloc_soak.main(["--baseline", str(out), paths[0], str(grown)]) == 1
+        assert "РЕГРЕССИЯ detector / plugin:x" in capsys.readouterr().out
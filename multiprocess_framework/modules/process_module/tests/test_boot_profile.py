@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""boot_profile — фазы boot, отметки ready/first_frame и время импортов процесса + склейка отчётов."""
+
+from __future__ import annotations
+
+import importlib
+import importlib._bootstrap as _bootstrap
+import json
+import sys
+import time
+import uuid
+
+import pytest
+
+from multiprocess_framework.modules.process_module.lifecycle import boot_profile
+from multiprocess_framework.modules.process_module.lifecycle.boot_profile import BootProfile
+from multiprocess_framework.modules.process_module.heartbeat.process_heartbeat import ProcessHeartbeat
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.delenv("INSPECTOR_BOOT_PROFILE", raising=False)
+    yield
+    boot_profile.stop()
+
+
+@pytest.fixture
+def slow_package(tmp_path, monkeypatch):
+    """Пакет ``heavy`` (30 мс своих) импортирует ``leaf`` (20 мс) — для проверки self/cum."""
+    name = f"bootpkg_{uuid.uuid4().hex[:8]}"
+    pkg = tmp_path / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "leaf.py").write_text("import time\ntime.sleep(0.02)\n", encoding="utf-8")
+    (pkg / "heavy.py").write_text("import time\ntime.sleep(0.03)\nfrom . import leaf\n", encoding="utf-8")
+    (pkg / "broken.py").write_text("raise ImportError('нет зависимости')\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for mod in [m for m in sys.modules if m.startswith(name)]:
+        del sys.modules[mod]
+
+
+class _Plugin:
+    name = "grab"
+
+
+class TestBootProfile:
+    def test_spawn_phase_and_marks_on_process_axis(self) -> None:
+        profile = BootProfile("detector", created=time.time() - 0.5)
+        with profile.phase("plugins"):
+            with profile.phase("plugin:hsv.load"):
+                time.sleep(0.01)
+        assert profile.mark("ready") is True
+        assert profile.mark("ready") is False  # первая отметка выигрывает
+        report = profile.report()
+
+        spawn = report["phases"][0]
+        assert spawn[0] == "spawn" and spawn[2] == pytest.approx(500, abs=50)
+        names = [row[0] for row in report["phases"]]
+        assert names == ["spawn", "plugin:hsv.load", "plugins"]
+        assert report["time_to_ready_ms"] >= report["marks"]["runner"] + 10
+        assert report["time_to_first_frame_ms"] is None
+        json.dumps(report)
+
+    def test_import_hook_splits_self_and_cumulative_time(self, slow_package) -> None:
+        boot_profile.start("detector")
+        with boot_profile.phase("plugin:hsv.load"):
+            importlib.import_module(f"{slow_package}.heavy")
+            with pytest.raises(ImportError):
+                importlib.import_module(f"{slow_package}.broken")
+        report = boot_profile.report(top=100)
+
+        own = {row[0]: row for row in report["imports"]["self"]}
+        heavy, leaf = own[f"{slow_package}.heavy"], own[f"{slow_package}.leaf"]
+        assert heavy[1] == pytest.approx(30, abs=15) and heavy[2] >= heavy[1] + leaf[1]
+        assert leaf[1] == pytest.approx(20, abs=15)
+        assert heavy[3] == "plugin:hsv.load"
+        assert f"{slow_package}.broken" not in own  # провалившийся импорт не считается
+        # Родительский пакет грузится внутри импорта подмодуля — корень один.
+        assert [row[0] for row in report["imports"]["roots"]] == [f"{slow_package}.heavy"]
+        assert report["imports"]["preloaded"] > 0
+
+    def test_first_frame_marks_plugin_and_removes_hook(self) -> None:
+        boot_profile.start("camera_0")
+        assert _bootstrap._find_and_load is boot_profile._timed_find_and_load
+        boot_profile.on_plugin_output(_Plugin(), "produce", None, [])  # пустой выход — не кадр
+        assert boot_profile.report()["time_to_first_frame_ms"] is None
+        boot_profile.on_plugin_output(_Plugin(), "produce", None, [{"frame": 1}])
+        report = boot_profile.report()
+        assert report["first_frame_by"] == "grab"
+        assert report["time_to_first_frame_ms"] is not None
+        assert _bootstrap._find_and_load is boot_profile._ORIG_FIND_AND_LOAD
+
+    def test_ready_removes_hook_after_grace(self, monkeypatch) -> None:
+        """Процесс без кадров (GUI, sink): перехват снимается через READY_GRACE_S после ready."""
+        monkeypatch.setattr(boot_profile, "READY_GRACE_S", 0.05)
+        boot_profile.start("gui")
+        boot_profile.mark("ready")
+        assert _bootstrap._find_and_load is boot_profile._timed_find_and_load
+        deadline = time.monotonic() + 5.0
+        while _bootstrap._find_and_load is not boot_profile._ORIG_FIND_AND_LOAD and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _bootstrap._find_and_load is boot_profile._ORIG_FIND_AND_LOAD
+        assert boot_profile.report()["time_to_first_frame_ms"] is None
+
+    def test_import_stack_dropped_when_thread_leaves_import(self, slow_package) -> None:
+        boot_profile.start("detector")
+        importlib.import_module(f"{slow_package}.heavy")
+        assert boot_profile.get_profile()._stacks == {}
+
+    def test_pending_report_only_on_change(self) -> None:
+        boot_profile.start("camera_0")
+        assert boot_profile.pending_report()["process"] == "camera_0"
+        assert boot_profile.pending_report() is None
+        boot_profile.mark("ready")
+        assert boot_profile.pending_report()["time_to_ready_ms"] is not None
+
+    def test_disabled_by_env_and_noop_without_profile(self, monkeypatch) -> None:
+        monkeypatch.setenv("INSPECTOR_BOOT_PROFILE", "0")
+        assert boot_profile.start("camera_0") is None
+        assert _bootstrap._find_and_load is boot_profile._ORIG_FIND_AND_LOAD
+        with boot_profile.phase("config"):
+            boot_profile.mark("ready")
+        assert boot_profile.report() is None
+        assert boot_profile.pending_report() is None
+
+
+class _Services:
+    name = "camera_0"
+    worker_manager = None
+
+    def __init__(self) -> None:
+        self.sent: list = []
+
+    def send_message(self, target: str, message: dict) -> bool:
+        self.sent.append((target, message))
+        return True
+
+
+class TestHeartbeatTransport:
+    def test_heartbeat_carries_report_only_when_changed(self) -> None:
+        svc = _Services()
+        hb = ProcessHeartbeat(svc)
+        hb._send_heartbeat({})  # профиля нет — heartbeat как прежде
+        boot_profile.start("camera_0")
+        hb._send_heartbeat({})
+        hb._send_heartbeat({})
+        boot_profile.mark("ready")
+        hb._send_heartbeat({})
+        carried = ["boot_profile" in msg for _, msg in svc.sent]
+        assert carried == [False, True, False, True]
+        assert svc.sent[-1][1]["boot_profile"]["time_to_ready_ms"] is not None
+
+
+def _report(process: str, created: float, ready: float, frame: float | None, imports: list) -> dict:
+    return {
+        "process": process,
+        "pid": 1,
+        "created": created,
+        "phases": [["spawn", 0.0, 300.0], ["plugins", 400.0, ready - 500.0]],
+        "marks": {"runner": 300.0, "ready": ready},
+        "first_frame_by": "grab" if frame is not None else "",
+        "time_to_ready_ms": ready,
+        "time_to_first_frame_ms": frame,
+        "imports": {
+            "count": len(imports),
+            "total_ms": sum(cum for _, _, cum in imports),
+            "preloaded": 400,
+            "self": [[name, own, cum, "plugins"] for name, own, cum in imports],
+            "roots": [[name, own, cum, "plugins"] for name, own, cum in imports],
+        },
+    }
+
+
+class TestMergeAndCompare:
+    def test_merge_orders_processes_and_sums_imports(self) -> None:
+        merged = boot_profile.merge_reports(
+            [
+                _report("camera_0", 100.0, 900.0, 1200.0, [["cv2", 150.0, 180.0]]),
+                _report("detector", 100.5, 2500.0, 3100.0, [["cv2", 160.0, 190.0], ["onnxruntime", 700.0, 900.0]]),
+                _report("gui", 100.2, 1500.0, None, []),
+            ]
+        )
+        assert [p["process"] for p in merged["processes"]] == ["detector", "gui", "camera_0"]
+        assert merged["system"]["critical"] == "detector"
+        assert merged["system"]["first_frame_ms"] == pytest.approx(3600.0)  # 0.5 с позже + 3100 мс
+        assert merged["imports"][0] == ["onnxruntime", 1, 700.0, 900.0]
+        assert merged["imports"][1] == ["cv2", 2, 310.0, 190.0]
+        assert merged["roots"][0] == ["detector", "onnxruntime", 900.0, "plugins"]
+        # Склеенный отчёт — снова валидный вход (baseline прошлой сборки).
+        assert boot_profile.merge_reports([merged])["processes"] == merged["processes"]
+
+    def test_compare_flags_first_frame_phase_and_import_growth(self) -> None:
+        base = _report("detector", 100.0, 2000.0, 2500.0, [["onnxruntime", 700.0, 900.0], ["cv2", 150.0, 180.0]])
+        new = _report("detector", 100.0, 2600.0, 3200.0, [["onnxruntime", 1200.0, 1400.0], ["cv2", 160.0, 190.0]])
+        regressions = boot_profile.compare(base, new, tolerance=0.2, min_ms=50)
+        assert [(r["process"], r["item"], r["delta"]) for r in regressions] == [
+            ("detector", "first_frame", 700.0),
+            ("detector", "phase:plugins", 600.0),
+            ("*", "import:onnxruntime", 500.0),
+        ]
+
+    def test_cli_merge_and_baseline_exit_code(self, tmp_path, capsys) -> None:
+        reply = {"success": True, **boot_profile.merge_reports([_report("detector", 1.0, 900.0, 1000.0, [])])}
+        base = tmp_path / "boot_prev.json"
+        base.write_text(json.dumps(reply), encoding="utf-8")
+        out = tmp_path / "merged.json"
+        assert boot_profile.main(["-o", str(out), str(base)]) == 0
+        assert "критический — detector" in capsys.readouterr().out
+        assert json.loads(out.read_text(encoding="utf-8"))["processes"][0]["process"] == "detector"
+
+        slow = tmp_path / "detector.json"
+        slow.write_text(json.dumps(_report("detector", 1.0, 1500.0, 1700.0, [])), encoding="utf-8")
+        assert boot_profile.main(["--baseline", str(base), str(slow)]) == 1
+        assert "РЕГРЕССИЯ detector / first_frame" in capsys.readouterr().out
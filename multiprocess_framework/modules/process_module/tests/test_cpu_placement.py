@@ -0,0 +1,113 @@
+"""CPU-размещение процесса: лимиты пулов, env, affinity и снапшот для телеметрии."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from ..heartbeat.process_heartbeat import ProcessHeartbeat
+from ..lifecycle import cpu_placement
+from ..lifecycle.cpu_placement import (
+    apply_placement,
+    placement_env,
+    placement_snapshot,
+    resolve_thread_caps,
+    thread_cap,
+)
+
+_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "OPENCV_FOR_THREADS_NUM",
+)
+
+
+@pytest.fixture
+def isolated(monkeypatch):
+    """Env-лимиты, affinity и применённые caps откатываются после теста."""
+    for var in _ENV_VARS:
+        monkeypatch.setenv(var, "0")
+    pinned: list[list[int]] = []
+    monkeypatch.setattr(cpu_placement, "_current_affinity", lambda: {0, 1, 2, 3})
+    monkeypatch.setattr(cpu_placement, "_set_affinity", lambda cpus: pinned.append(cpus))
+    monkeypatch.setattr(cpu_placement, "_applied_caps", {})
+    monkeypatch.setattr(cpu_placement, "_applied_cpus", None)
+    return pinned
+
+
+def test_caps_default_to_cpu_count_with_single_inter_op():
+    assert resolve_thread_caps({"cpus": [2, 3]}) == {
+        "blas": 2,
+        "cv2": 2,
+        "torch": 2,
+        "torch_interop": 1,
+        "onnx_intra_op": 2,
+        "onnx_inter_op": 1,
+    }
+    caps = resolve_thread_caps({"cpus": [0, 1, 2, 3], "threads": 3, "cv2_threads": 1, "onnx_inter_op_threads": 2})
+    assert (caps["blas"], caps["cv2"], caps["onnx_intra_op"], caps["onnx_inter_op"]) == (3, 1, 3, 2)
+    # без базы — только явные override'ы
+    assert resolve_thread_caps({"cv2_threads": 1}) == {"cv2": 1}
+    assert resolve_thread_caps({}) == {} and placement_env(None) == {}
+
+
+def test_env_carries_blas_and_opencv_caps():
+    env = placement_env({"threads": 2, "cv2_threads": 1})
+    assert env["OMP_NUM_THREADS"] == env["OPENBLAS_NUM_THREADS"] == env["MKL_NUM_THREADS"] == "2"
+    assert env["OPENCV_FOR_THREADS_NUM"] == "1"
+    assert not any("ONNX" in key or "TORCH" in key for key in env)
+
+
+def test_apply_pins_allowed_cpus_and_records_caps(isolated):
+    import os
+
+    report = apply_placement({"cpus": [3, 1, 7], "torch_interop_threads": 2})
+    assert isolated == [[1, 3]]
+    assert report["cpus"] == [1, 3]
+    assert report["warnings"] == ["ядра [7] недоступны процессу — пропущены"]
+    assert os.environ["OMP_NUM_THREADS"] == "3"  # база = len(cpus) из запроса
+    assert thread_cap("onnx_intra_op") == 3 and thread_cap("torch_interop") == 2
+    assert thread_cap("missing", 5) == 5
+    assert apply_placement({}) == {}
+
+
+def test_affinity_failure_is_a_warning(isolated, monkeypatch):
+    monkeypatch.setattr(cpu_placement, "_set_affinity", lambda cpus: "Operation not permitted")
+    report = apply_placement({"cpus": [0], "threads": 1})
+    assert report["cpus"] is None
+    assert "не применена" in report["warnings"][0]
+    assert thread_cap("blas") == 1
+
+
+def test_snapshot_reports_affinity_threads_and_loaded_libs(isolated, monkeypatch):
+    fake_cv2 = SimpleNamespace(getNumThreads=lambda: 2)
+    monkeypatch.setitem(sys.modules, "cv2", fake_cv2)
+    monkeypatch.delitem(sys.modules, "torch", raising=False)
+    apply_placement({"cpus": [0, 1]})
+
+    snap = placement_snapshot()
+    assert snap["cpus"] == [0, 1, 2, 3] and snap["pinned"] is True
+    assert snap["os_threads"] >= snap["py_threads"] >= 1
+    assert snap["caps"]["cv2"] == 2
+    assert snap["libs"] == {"cv2": 2}
+
+
+def test_heartbeat_publishes_placement_only_on_change(monkeypatch):
+    sets: list[tuple[str, dict]] = []
+    svc = SimpleNamespace(
+        name="proc",
+        _state_proxy=SimpleNamespace(set=lambda path, value: sets.append((path, value))),
+        log_info=lambda *a, **k: None,
+    )
+    snaps = iter([{"cpus": [0]}, {"cpus": [0]}, {"cpus": [1]}])
+    monkeypatch.setattr(cpu_placement, "placement_snapshot", lambda: next(snaps))
+
+    hb = ProcessHeartbeat(svc)
+    for _ in range(3):
+        hb._publish_placement_to_tree()
+    assert sets == [("processes.proc.placement", {"cpus": [0]}), ("processes.proc.placement", {"cpus": [1]})]
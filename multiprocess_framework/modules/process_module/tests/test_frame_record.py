@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""frame_record: send-tap записи кадров + чтение записи (индекс, обрыв, фильтры)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from multiprocess_framework.modules.process_module.generic.frame_record import (
+    FrameRecordReader,
+    FrameRecordTap,
+    build_frame_record_tap,
+)
+
+
+def _msg(camera_id: int, seq_id: int, *, data_type: str = "frame") -> dict:
+    frame = np.full((4, 6, 3), seq_id % 256, dtype=np.uint8)
+    frame[0, 0, 0] = camera_id
+    item = {
+        "frame": frame,
+        "camera_id": camera_id,
+        "seq_id": seq_id,
+        "frame_id": seq_id,
+        "timestamp": 100.0 + seq_id,
+        "data_type": data_type,
+        "trace": [{"kind": "process"}],
+        "_t_send": 1.0,
+    }
+    return {"target": "proc", "type": "data", "channel": "data", "data": item}
+
+
+@pytest.mark.parametrize("codec", ["raw", "zlib"])
+def test_round_trip_preserves_frames_and_interleaving(tmp_path, codec):
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path), codec=codec)
+    sent = [_msg(cam, seq) for seq in range(1, 6) for cam in (0, 1)]
+    for msg in sent:
+        assert tap.on_send(msg) is msg
+    stats = tap.close()
+    assert stats["frames_written"] == 10 and stats["dropped"] == 0
+
+    with FrameRecordReader(str(path)) as reader:
+        assert reader.truncated is False
+        assert [(row[2], row[3]) for row in reader.index] == [
+            (m["data"]["camera_id"], m["data"]["seq_id"]) for m in sent
+        ]
+        item, frame, t = reader.read(3)
+        np.testing.assert_array_equal(frame, sent[3]["data"]["frame"])
+        assert item == {"camera_id": 1, "seq_id": 2, "frame_id": 2, "timestamp": 102.0, "data_type": "frame"}
+        assert reader.index[0][1] <= t
+
+
+def test_filters_cameras_data_types_and_non_data(tmp_path):
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path), camera_ids=[1])
+    tap.on_send(_msg(0, 1))
+    tap.on_send(_msg(1, 1))
+    tap.on_send(_msg(1, 2, data_type="overlay"))
+    tap.on_send({"type": "command", "data": {"frame": np.zeros((2, 2, 3), np.uint8), "camera_id": 1}})
+    tap.close()
+    with FrameRecordReader(str(path)) as reader:
+        assert [(row[2], row[3]) for row in reader.index] == [(1, 1)]
+
+
+def test_fan_out_records_frame_once(tmp_path):
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path))
+    msg = _msg(0, 1)
+    for target in ("a", "b", "c"):
+        tap.on_send({**msg, "target": target})
+    tap.close()
+    with FrameRecordReader(str(path)) as reader:
+        assert len(reader) == 1
+
+
+def test_reused_frame_buffer_recorded_per_seq_and_not_pinned(tmp_path):
+    """Источник с одним переиспользуемым буфером: каждый seq пишется, тап не держит массив."""
+    import gc
+    import weakref
+
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path))
+    buf = np.zeros((4, 6, 3), dtype=np.uint8)
+    for seq in range(1, 4):
+        buf[...] = seq
+        msg = _msg(0, seq)
+        msg["data"]["frame"] = buf
+        tap.on_send(msg)
+        tap.on_send({**msg, "target": "other"})  # fan-out того же item'а — не дублируется
+    ref = weakref.ref(buf)
+    del buf, msg
+    gc.collect()
+    assert ref() is None
+    tap.close()
+    with FrameRecordReader(str(path)) as reader:
+        assert [row[3] for row in reader.index] == [1, 2, 3]
+        assert int(reader.read(2)[1][0, 0, 0]) == 3
+
+
+def test_frames_without_key_metadata_always_recorded(tmp_path):
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path))
+    frame = np.zeros((2, 2, 3), np.uint8)
+    for _ in range(2):
+        tap.on_send({"type": "data", "data": {"frame": frame, "data_type": "frame"}})
+    tap.close()
+    with FrameRecordReader(str(path)) as reader:
+        assert len(reader) == 2
+
+
+def test_truncated_record_is_indexed_by_scan(tmp_path):
+    path = tmp_path / "rec.frec"
+    tap = FrameRecordTap(str(path))
+    for seq in range(1, 4):
+        tap.on_send(_msg(0, seq))
+    tap.close()
+    data = path.read_bytes()
+    with FrameRecordReader(str(path)) as reader:
+        last_frame_offset = reader.index[-1][0]
+    # процесс убит посреди записи третьего кадра: ни индекса, ни трейлера
+    path.write_bytes(data[: last_frame_offset + 20])
+    with FrameRecordReader(str(path)) as reader:
+        assert reader.truncated is True
+        assert [row[3] for row in reader.index] == [1, 2]
+        assert reader.read(1)[0]["seq_id"] == 2
+
+
+def test_queue_overflow_counts_dropped(tmp_path):
+    tap = FrameRecordTap(str(tmp_path / "rec.frec"))
+    tap._max_queue = 0  # очередь «полна» — send не блокируется, кадр уходит в dropped
+    msg = _msg(0, 1)
+    assert tap.on_send(msg) is msg
+    assert tap.dropped == 1
+    assert tap.close()["frames_written"] == 0
+
+
+def test_build_tap_disabled_without_path(tmp_path):
+    assert build_frame_record_tap({}, "cam") is None
+    tap = build_frame_record_tap({"path": str(tmp_path / "{node}.frec"), "codec": "zlib"}, "camera_0")
+    assert tap is not None and tap.path.endswith("camera_0.frec")
+    tap.close()
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"not a record")
+    with pytest.raises(ValueError, match="нет сигнатуры"):
+        FrameRecordReader(str(path))
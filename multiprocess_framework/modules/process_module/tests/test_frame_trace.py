@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """Тесты frame_trace — пер-сегментная трассировка кадра (in-band)."""
 
+import itertools
+
 import pytest
 
 from multiprocess_framework.modules.process_module.generic import frame_trace
+from multiprocess_framework.modules.process_module.generic.trace_ring import RING
 
 
 @pytest.fixture
@@ -109,6 +112,119 @@ class TestEnabled:
         ]
 
 
+@pytest.fixture
+def sampling(trace_off):
+    """Сэмплинг каждого 2-го кадра при выключенном флаге (счётчик с нуля)."""
+    prev = frame_trace.set_sample_every(2)
+    counter = frame_trace._sample_counter
+    frame_trace._sample_counter = itertools.count()
+    yield
+    frame_trace.set_sample_every(prev)
+    frame_trace._sample_counter = counter
+
+
+class _Source:
+    name = "webcam"
+    _trace_node = "camera_0"
+
+    @frame_trace.traced
+    def produce(self):
+        return [{"frame": "f"}]
+
+
+class _Rebuilder:
+    """Плагин, собирающий выходной item как свежий dict (без trace)."""
+
+    name = "blur"
+    _trace_node = "detector"
+
+    @frame_trace.traced
+    def process(self, items):
+        return [{"frame": it["frame"]} for it in items]
+
+
+class _Filter:
+    """Плагин-фильтр: свежие dict'ы с trace_id входа, часть кадров отброшена (не 1:1)."""
+
+    name = "filter"
+    _trace_node = "detector"
+
+    @frame_trace.traced
+    def process(self, items):
+        return [{"frame": it["frame"], "trace_id": it["trace_id"]} for it in items if it["frame"] != "drop"]
+
+
+class _Merger:
+    """Fan-in N:1: один свежий dict без trace_id (поля наследуются от items[0])."""
+
+    name = "merge"
+    _trace_node = "stitcher"
+
+    @frame_trace.traced
+    def process(self, items):
+        return [{"frames": [it["frame"] for it in items]}]
+
+
+class TestSampling:
+    def test_source_samples_every_nth_frame(self, sampling) -> None:
+        frames = [_Source().produce()[0] for _ in range(4)]
+        assert [frame_trace.is_traced(f) for f in frames] == [True, False, True, False]
+        assert frames[0]["trace"][0]["plugin"] == "webcam"
+        assert frames[0]["trace_id"]
+        assert "trace_id" not in frames[1]
+
+    def test_sampled_frame_traced_downstream_without_flag(self, sampling) -> None:
+        item = _Source().produce()[0]
+        frame_trace.stamp_send(item, "camera_0")
+        frame_trace.record_transport(item, "detector")
+        out = _Rebuilder().process([item])[0]
+        # Новый dict плагина продолжает трассировку: trace со входа не обрывается.
+        assert out["trace"][-1]["plugin"] == "blur"
+        assert [s["kind"] for s in item["trace"]] == ["process", "transport"]
+
+    def test_batch_traces_only_sampled_positions(self, sampling) -> None:
+        out = _Rebuilder().process([{"frame": "a", "trace": []}, {"frame": "b"}])
+        assert "trace" in out[0] and "trace" not in out[1]
+
+    def test_filtered_batch_traces_only_outputs_of_sampled_inputs(self, sampling) -> None:
+        items = [
+            {"frame": "a", "trace_id": "A"},
+            {"frame": "b", "trace_id": "B", "trace": []},
+            {"frame": "drop", "trace_id": "C"},
+        ]
+        out = _Filter().process(items)
+        assert [it["trace_id"] for it in out if "trace" in it] == ["B"]
+
+    def test_fan_in_output_follows_primary_input(self, sampling) -> None:
+        unsampled_first = _Merger().process([{"frame": "a"}, {"frame": "b", "trace": []}])
+        sampled_first = _Merger().process([{"frame": "a", "trace": []}, {"frame": "b"}])
+        assert "trace" not in unsampled_first[0]
+        assert sampled_first[0]["trace"][-1]["plugin"] == "merge"
+
+    def test_unsampled_frame_untouched(self, sampling) -> None:
+        _Source().produce()  # 1-й кадр выбран, 2-й — нет
+        item = _Source().produce()[0]
+        frame_trace.stamp_send(item, "camera_0")
+        out = _Rebuilder().process([item])[0]
+        assert item == {"frame": "f"} and out == {"frame": "f"}
+
+    def test_sampling_off_by_default(self, trace_off) -> None:
+        prev = frame_trace.set_sample_every(0)
+        try:
+            assert all("trace" not in _Source().produce()[0] for _ in range(5))
+        finally:
+            frame_trace.set_sample_every(prev)
+
+    def test_spans_of_traced_frames_reach_ring(self, sampling) -> None:
+        RING.clear()
+        item = _Source().produce()[0]
+        _Source().produce()
+        frame_trace.record_process(item, "detector", "hsv_mask", 1.5)
+        spans = RING.snapshot()["spans"]
+        assert [(s[2], s[3]) for s in spans] == [("process", "webcam"), ("process", "hsv_mask")]
+        assert all(s[4] == item["trace_id"] for s in spans)
+
+
 class TestInstallTracing:
     """C6 рычаг 2: обёртка process/produce на бутe (не в __init_subclass__)."""
 
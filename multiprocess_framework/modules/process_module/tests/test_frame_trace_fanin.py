@@ -7,7 +7,8 @@
 - merge_trace: trace_branches сводка (N записей с total_ms/spans/branch)
 - merge_trace: размер O(глубина одной ветви), не растёт от числа ветвей
 - record_merge: дописывает merge-спан в конец trace
-- no-op без флага: fork_trace/{}, merge_trace/([], [], ""), record_merge/no-op
+- no-op для нетрассируемых кадров (без флага и без ключа trace): fork_trace/{},
+  merge_trace/([], [], ""), record_merge/no-op; кадр с trace (сэмплинг) трассируется
 - edge cases: пустая коллекция, items без trace, все ветви с пустым trace
 """
 
@@ -107,11 +108,18 @@ class TestForkTrace:
         assert len(result["trace"]) == 1, "fork — независимая копия, не ссылка на parent"
 
     def test_fork_trace_noop_without_flag(self, trace_off) -> None:
-        """Без флага fork_trace возвращает {} (нет аллокаций)."""
-        parent = _make_item(spans=[_span(5.0)])
+        """Без флага fork_trace нетрассируемого кадра возвращает {} (нет аллокаций)."""
+        parent = {"frame": "data"}
         result = frame_trace.fork_trace(parent)
         assert result == {}, "no-op без флага: fork_trace -> {}"
 
+    def test_fork_trace_sampled_without_flag(self, trace_off) -> None:
+        """Кадр, выбранный сэмплингом (несёт trace), форкается и без флага."""
+        parent = _make_item(spans=[_span(5.0)])
+        result = frame_trace.fork_trace(parent)
+        assert result == {"trace": [_span(5.0)]}
+        assert result["trace"] is not parent["trace"]
+
     def test_fork_trace_item_without_trace_key(self, trace_on) -> None:
         """fork_trace на item без ключа 'trace' — graceful, возвращает пустой список."""
         parent = {"frame": "data", "seq_id": 42}  # нет trace
@@ -186,8 +194,8 @@ class TestMergeTraceCriticalPath:
         assert len(branches) == 1
 
     def test_merge_trace_noop_without_flag(self, trace_off) -> None:
-        """Без флага merge_trace возвращает ([], [], '') — нулевой overhead."""
-        items = [_make_item(spans=[_span(5.0)]) for _ in range(3)]
+        """Без флага и без trace у ветвей merge_trace возвращает ([], [], '')."""
+        items = [_make_item(region_name=f"r{i}") for i in range(3)]
         result = frame_trace.merge_trace(items)
         assert result == ([], [], ""), f"no-op без флага: {result}"
 
@@ -331,14 +339,13 @@ class TestRecordMerge:
         assert "trace" in item
         assert len(item["trace"]) == 1
 
-    def test_record_merge_noop_without_flag(self, trace_off) -> None:
-        """Без флага record_merge — no-op, trace не меняется."""
+    def test_record_merge_sampled_without_flag(self, trace_off) -> None:
+        """Без флага кадр с trace (сэмплинг) получает merge-спан."""
         item = _make_item(spans=[_span(5.0)])
-        original_trace = list(item["trace"])
 
         frame_trace.record_merge(item, node="stitcher", branches=3, chosen="r0", ms=2.0)
 
-        assert item["trace"] == original_trace, "no-op без флага: trace не изменён"
+        assert item["trace"][-1]["kind"] == "merge"
 
     def test_record_merge_noop_on_item_without_trace(self, trace_off) -> None:
         """Без флага record_merge не создаёт ключ trace."""
@@ -356,13 +363,13 @@ class TestNoopWithoutFlag:
     """Полная no-op семантика без флага."""
 
     def test_fork_trace_returns_empty_dict(self, trace_off) -> None:
-        """fork_trace без флага → {}."""
-        item = _make_item(spans=[_span(5.0)])
+        """fork_trace без флага (кадр не трассируется) → {}."""
+        item = _make_item(region_name="r0")
         assert frame_trace.fork_trace(item) == {}
 
     def test_merge_trace_returns_empty_tuple(self, trace_off) -> None:
-        """merge_trace без флага → ([], [], '')."""
-        items = [_make_item(spans=[_span(i)]) for i in range(3)]
+        """merge_trace без флага (ветви не трассируются) → ([], [], '')."""
+        items = [_make_item(region_name=f"r{i}") for i in range(3)]
         assert frame_trace.merge_trace(items) == ([], [], "")
 
     def test_merge_trace_empty_collection_without_flag(self, trace_off) -> None:
@@ -435,7 +442,7 @@ class TestEdgeCases:
         current_state = frame_trace._ENABLED
 
         # Создаём item и делаем операцию — результат зависит от текущего флага
-        parent = _make_item(spans=[_span(1.0)])
+        parent = _make_item(region_name="root")
         result = frame_trace.fork_trace(parent)
 
         if current_state:
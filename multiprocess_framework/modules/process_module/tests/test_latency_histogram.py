@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""LatencyHistogram — лог-бакетная гистограмма perf-проб (ADR-PM-022)."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+
+import pytest
+
+from multiprocess_framework.modules.process_module.generic.latency_histogram import (
+    BUCKETS,
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+    merge_encoded,
+)
+
+
+def _exact(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]  # ближайший ранг
+
+
+class TestBuckets:
+    def test_index_roundtrip_and_monotonic(self) -> None:
+        prev = -1
+        for us in list(range(0, 5000)) + [10**5, 10**6, 10**7, 6 * 10**7]:
+            idx = bucket_index(us)
+            low, width = bucket_bounds(idx)
+            assert low <= us < low + width
+            assert idx >= prev
+            prev = idx
+
+    def test_relative_error_bound(self) -> None:
+        for us in (150, 999, 12_345, 987_654, 33_000_000):
+            _, width = bucket_bounds(bucket_index(us))
+            assert width / us <= 1 / 64
+
+    def test_out_of_range_clamped(self) -> None:
+        assert bucket_index(-5) == 0
+        assert bucket_index(10**12) == BUCKETS - 1
+
+
+class TestPercentiles:
+    def test_close_to_exact_on_heavy_tail(self) -> None:
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0.0, 1.2) for _ in range(20_000)]  # мс, длинный хвост
+        hist = LatencyHistogram()
+        for v in values:
+            hist.record(v)
+        for q in (0.5, 0.99, 0.999):
+            assert hist.percentile(q) == pytest.approx(_exact(values, q), rel=0.02, abs=0.002)
+        assert hist.summary()["max_ms"] == round(max(values), 3)
+        assert hist.count == len(values)
+
+    def test_empty(self) -> None:
+        assert LatencyHistogram().summary() == {
+            "p50_ms": 0.0,
+            "p99_ms": 0.0,
+            "p999_ms": 0.0,
+            "max_ms": 0.0,
+            "mean_ms": 0.0,
+            "count": 0,
+        }
+
+
+class TestMergeAndWire:
+    def test_encode_decode_roundtrip_is_compact(self) -> None:
+        hist = LatencyHistogram()
+        for v in (0.05, 0.2, 0.2, 1.5, 12.0, 480.0):
+            hist.record(v)
+        wire = json.loads(json.dumps(hist.encode()))
+        assert len(wire["b"]) == 2 * 5  # только непустые бакеты
+        back = LatencyHistogram.decode(wire)
+        assert back.summary() == hist.summary()
+
+    def test_merge_equals_single_histogram(self) -> None:
+        rng = random.Random(3)
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(4000):
+            v = rng.expovariate(2.0)
+            (a if i % 3 else b).record(v)
+            both.record(v)
+        merged = merge_encoded([a.encode(), b.encode(), None])
+        assert merged.summary() == pytest.approx(both.summary(), rel=1e-6)
+
+    def test_since_gives_window_between_snapshots(self) -> None:
+        hist = LatencyHistogram()
+        for _ in range(100):
+            hist.record(1.0)
+        earlier = LatencyHistogram.decode(hist.encode())
+        for _ in range(10):
+            hist.record(40.0)
+        window = hist.since(earlier)
+        assert window.count == 10
+        assert window.percentile(0.5) == pytest.approx(40.0, rel=0.02)
+        assert window.max_ms <= 40.0
@@ -177,3 +177,112 @@ class TestLogTail:
         res = cm.dispatch("log.tail.unsubscribe", {"subscriber": "backend_ctl"})
         assert res["success"] is True
         assert logger.taps == {}
+
+
+class TestTraceCommands:
+    def test_sample_sets_and_reports_step(self) -> None:
+        from multiprocess_framework.modules.process_module.generic import frame_trace
+
+        _svc, cm = _make(logger=_FakeLogger())
+        prev = frame_trace.sample_every()
+        try:
+            res = cm.dispatch("trace.sample", {"every": 50})
+            assert res == {"success": True, "every": 50, "previous": prev, "process": "preprocessor"}
+            assert cm.dispatch("trace.sample", {})["every"] == 50
+            assert cm.dispatch("trace.sample", {"every": -1})["success"] is False
+        finally:
+            frame_trace.set_sample_every(prev)
+
+    def test_dump_inline_and_to_file(self, tmp_path) -> None:
+        import json
+
+        from multiprocess_framework.modules.process_module.generic.trace_ring import RING
+
+        _svc, cm = _make(logger=_FakeLogger())
+        RING.clear()
+        RING.record(1.0, 2.0, "process", "blur", "abc")
+
+        inline = cm.dispatch("trace.dump", {})
+        assert inline["dump"]["process"] == "preprocessor"
+        assert inline["dump"]["spans"][0][3] == "blur"
+
+        res = cm.dispatch("trace.dump", {"path": str(tmp_path), "clear": True})
+        assert res["success"] is True and res["spans"] == 1
+        with open(res["path"], encoding="utf-8") as fh:
+            assert json.load(fh)["spans"][0][4] == "abc"
+        assert len(RING) == 0
+
+
+class TestProfileCommands:
+    def test_start_status_stop(self, tmp_path, monkeypatch) -> None:
+        from multiprocess_framework.modules.process_module.generic import stack_profiler
+
+        monkeypatch.setattr(stack_profiler, "_PROFILER", None)
+        _svc, cm = _make(logger=_FakeLogger())
+
+        started = cm.dispatch("profile.start", {"seconds": 30, "interval_ms": 5, "path": str(tmp_path)})
+        assert started["success"] is True and started["state"] == "running"
+        assert started["process"] == "preprocessor"
+        assert cm.dispatch("profile.start", {"seconds": 1})["success"] is False
+
+        stopped = cm.dispatch("profile.stop", {})
+        assert stopped["state"] == "done"
+        assert stopped["path"].startswith(str(tmp_path / "preprocessor-"))
+
+        status = cm.dispatch("profile.status", {"collapsed": True})
+        assert status["success"] is True and status["samples"] >= 0
+        assert isinstance(status["collapsed"], str)
+
+    def test_start_rejects_bad_args(self, monkeypatch) -> None:
+        from multiprocess_framework.modules.process_module.generic import stack_profiler
+
+        monkeypatch.setattr(stack_profiler, "_PROFILER", None)
+        _svc, cm = _make(logger=_FakeLogger())
+        assert cm.dispatch("profile.start", {"seconds": 0})["success"] is False
+        assert cm.dispatch("profile.start", {"interval_ms": "fast"})["success"] is False
+
+
+class TestAllocCommands:
+    def test_start_dump_stop(self, tmp_path, monkeypatch) -> None:
+        import json
+
+        from multiprocess_framework.modules.process_module.generic import alloc_soak
+
+        monkeypatch.setattr(alloc_soak, "_SOAK", None)
+        _svc, cm = _make(logger=_FakeLogger())
+
+        started = cm.dispatch("alloc.start", {"nframe": 4, "warmup": 0, "path": str(tmp_path)})
+        assert started["success"] is True and started["state"] == "running"
+        assert started["process"] == "preprocessor"
+        assert cm.dispatch("alloc.start", {})["success"] is False
+        assert cm.dispatch("alloc.status", {})["state"] == "running"
+
+        inline = cm.dispatch("alloc.dump", {})
+        assert inline["report"]["process"] == "preprocessor"
+        res = cm.dispatch("alloc.dump", {"path": str(tmp_path / "dumps")})
+        with open(res["path"], encoding="utf-8") as fh:
+            assert json.load(fh)["process"] == "preprocessor"
+
+        stopped = cm.dispatch("alloc.stop", {})
+        assert stopped["path"].startswith(str(tmp_path / "preprocessor-"))
+        assert cm.dispatch("alloc.status", {})["state"] == "done"
+
+    def test_start_rejects_bad_args(self, monkeypatch) -> None:
+        from multiprocess_framework.modules.process_module.generic import alloc_soak
+
+        monkeypatch.setattr(alloc_soak, "_SOAK", None)
+        _svc, cm = _make(logger=_FakeLogger())
+        assert cm.dispatch("alloc.start", {"nframe": 0})["success"] is False
+        assert cm.dispatch("alloc.start", {"warmup": "many"})["success"] is False
+
+
+class TestPerfResetCommand:
+    def test_reset_clears_probe_histograms(self, monkeypatch) -> None:
+        from multiprocess_framework.modules.process_module.generic import perf_probes
+
+        probes = perf_probes.LatencyProbes()
+        probes._record("capture", 12.0)
+        _svc, cm = _make(logger=_FakeLogger())
+        res = cm.dispatch("perf.reset", {})
+        assert res["success"] is True and res["reset"] >= 1
+        assert probes.get_stats() == {}
@@ -92,13 +92,27 @@ class TestEnabled:
         assert stats["capture"]["count"] == 5
         assert stats["send"]["count"] == 3
 
-    def test_window_bounds_memory(self, probes_on) -> None:
-        """Окно ограничено _WINDOW последними замерами — не растёт бесконечно."""
+    def test_histogram_keeps_all_samples_in_constant_memory(self, probes_on) -> None:
+        """Без окна: count — все замеры с момента сброса, память — фиксированные бакеты."""
+        from multiprocess_framework.modules.process_module.generic.latency_histogram import BUCKETS
+
         probes = perf_probes.LatencyProbes()
-        for _ in range(perf_probes._WINDOW + 50):
+        for _ in range(1000):
             with probes.measure("capture"):
                 pass
-        assert probes.get_stats()["capture"]["count"] == perf_probes._WINDOW
+        stats = probes.get_stats()["capture"]
+        assert stats["count"] == 1000
+        assert len(probes._hists["capture"]._counts) == BUCKETS
+        assert stats["p50_ms"] <= stats["p99_ms"] <= stats["p999_ms"] <= stats["max_ms"]
+        assert stats["hist"]["n"] == 1000
+
+    def test_reset_all_restarts_counts(self, probes_on) -> None:
+        probes = perf_probes.LatencyProbes()
+        probes._record("send", 50.0)
+        assert perf_probes.reset_all() >= 1
+        assert probes.get_stats() == {}
+        probes._record("send", 1.0)
+        assert probes.get_stats()["send"]["max_ms"] == 1.0  # max — с момента сброса
 
 
 class TestSourceProducerIntegration:
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""StackProfiler — on-demand сэмплирование стеков процесса в collapsed stacks."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from multiprocess_framework.modules.process_module.generic import stack_profiler
+from multiprocess_framework.modules.process_module.generic.stack_profiler import StackProfiler
+from multiprocess_framework.modules.process_module.plugins.base import ProcessModulePlugin
+
+
+class SpinPlugin(ProcessModulePlugin):
+    """Плагин, крутящий CPU в ``process`` до сигнала."""
+
+    name = "spin_mask"
+    category = "processing"
+
+    def __init__(self, stop: threading.Event) -> None:
+        self._stop_event = stop
+
+    def configure(self, ctx): ...
+    def start(self, ctx): ...
+
+    def process(self, items):
+        while not self._stop_event.is_set():
+            sum(range(200))
+        return items
+
+
+def run_chain(steps, stop: threading.Event) -> None:
+    """Исполнитель-имитация: локальная ``step`` — как в циклах chain_module."""
+    for step in steps:
+        step.operation(stop)
+
+
+def _busy(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+@pytest.fixture
+def stop():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _spawn(target, *args) -> threading.Thread:
+    thread = threading.Thread(target=target, args=args, name=target.__name__, daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_done(prof: StackProfiler, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while prof.status()["state"] == "running" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return prof.status()
+
+
+def test_annotates_plugin_and_chain_step(stop, tmp_path):
+    step = SimpleNamespace(node=SimpleNamespace(node_id="detect_blobs"), operation=_busy)
+    plugin = SpinPlugin(stop)
+    workers = [_spawn(plugin.process, []), _spawn(run_chain, [step], stop)]
+
+    prof = StackProfiler(process="detector")
+    assert prof.start(seconds=0.4, interval_ms=5, path=str(tmp_path))["success"] is True
+    status = _wait_done(prof)
+    stop.set()
+    for worker in workers:
+        worker.join(2.0)
+
+    assert status["state"] == "done"
+    assert status["samples"] > 0
+    assert status["path"].startswith(str(tmp_path)) and status["path"].endswith(".collapsed")
+    text = open(status["path"], encoding="utf-8").read()
+    lines = text.splitlines()
+    assert any("thread:process;" in line and "[plugin:spin_mask];process (" in line for line in lines)
+    assert any("[step:detect_blobs];run_chain (" in line for line in lines)
+    # Формат collapsed: "<frames;...> <count>".
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_stop_early_writes_file_and_second_start_rejected(tmp_path):
+    prof = StackProfiler(process="early")
+    assert prof.start(seconds=30, interval_ms=5, path=str(tmp_path))["success"] is True
+    assert prof.start(seconds=1, path=str(tmp_path))["success"] is False
+    time.sleep(0.05)
+    status = prof.stop()
+    assert status["state"] == "done"
+    assert status["elapsed_s"] < 5.0
+    assert (tmp_path / status["path"].rsplit("/", 1)[1]).exists()
+
+
+def test_overhead_within_budget(stop):
+    # Глубокий стек — дорогой сэмпл; адаптивная пауза держит долю в бюджете.
+    def deep(n: int) -> None:
+        if n:
+            deep(n - 1)
+        else:
+            _busy(stop)
+
+    worker = _spawn(deep, 150)
+    prof = StackProfiler(process="deep", max_overhead=0.05)
+    prof.start(seconds=0.5, interval_ms=1)
+    status = _wait_done(prof)
+    stop.set()
+    worker.join(2.0)
+
+    assert status["samples"] > 0
+    assert status["overhead_pct"] <= 10.0
+    # max_depth обрезает стек: ни одна строка не длиннее depth + аннотации + thread.
+    assert all(line.count(";") <= 128 + 4 for line in prof.collapsed().splitlines())
+
+
+def test_get_profiler_is_process_singleton(monkeypatch):
+    monkeypatch.setattr(stack_profiler, "_PROFILER", None)
+    first = stack_profiler.get_profiler("detector")
+    assert stack_profiler.get_profiler("other") is first
+    assert first.status()["process"] == "detector"
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Тесты trace_ring — кольцо спанов процесса и склейка в Chrome/Perfetto JSON."""
+
+import json
+
+from multiprocess_framework.modules.process_module.generic.trace_ring import (
+    SpanRing,
+    main,
+    merge_dumps,
+)
+
+
+def _dump(process: str, pid: int, anchor_wall: float, anchor_perf: float, spans: list) -> dict:
+    return {
+        "process": process,
+        "pid": pid,
+        "anchor_wall": anchor_wall,
+        "anchor_perf": anchor_perf,
+        "dropped": 0,
+        "spans": spans,
+    }
+
+
+class TestSpanRing:
+    def test_overflow_keeps_newest_and_counts_dropped(self) -> None:
+        ring = SpanRing(capacity=3)
+        for i in range(5):
+            ring.record(float(i), 1.0, "process", f"p{i}")
+        dump = ring.snapshot(process="detector")
+        assert [s[3] for s in dump["spans"]] == ["p2", "p3", "p4"]
+        assert dump["dropped"] == 2
+        assert dump["process"] == "detector"
+
+    def test_snapshot_clear(self) -> None:
+        ring = SpanRing(capacity=4)
+        ring.record(0.0, 1.0, "process", "p")
+        ring.snapshot(clear=True)
+        assert len(ring) == 0 and ring.snapshot()["dropped"] == 0
+
+    def test_snapshot_is_json_safe(self) -> None:
+        ring = SpanRing()
+        ring.record(0.5, 1.0, "transport", "a → b", "tid", {"from": "a", "to": "b"})
+        assert json.loads(json.dumps(ring.snapshot()))["spans"][0][6] == {"from": "a", "to": "b"}
+
+
+class TestMergeDumps:
+    def test_clocks_aligned_across_processes(self) -> None:
+        # Разные perf-эпохи процессов; одинаковый wall-момент начала спана (1000.010).
+        cam = _dump(
+            "camera_0", 1, anchor_wall=1000.0, anchor_perf=50.0, spans=[[50.010, 2.0, "process", "webcam", "t1", 7, {}]]
+        )
+        det = _dump(
+            "detector", 2, anchor_wall=1000.0, anchor_perf=900.0, spans=[[900.012, 1.0, "process", "hsv", "t1", 9, {}]]
+        )
+
+        trace = merge_dumps([cam, det])
+
+        spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert spans["webcam"]["ts"] == 0.0
+        assert abs(spans["hsv"]["ts"] - 2000.0) < 1e-3  # +2 мс на общей оси
+        assert spans["hsv"]["dur"] == 1000.0
+        assert spans["hsv"]["pid"] == 2 and spans["hsv"]["tid"] == 9
+        assert spans["hsv"]["args"]["trace_id"] == "t1"
+        names = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+        assert names == {"camera_0", "detector"}
+        assert trace["otherData"]["processes"] == ["camera_0", "detector"]
+
+    def test_empty_dumps(self) -> None:
+        trace = merge_dumps([_dump("idle", 3, 1.0, 1.0, []), {}])
+        assert [e["ph"] for e in trace["traceEvents"]] == ["M"]
+
+    def test_cli_merges_files(self, tmp_path) -> None:
+        paths = []
+        for i, name in enumerate(("camera_0", "detector")):
+            path = tmp_path / f"{name}.trace.json"
+            path.write_text(json.dumps(_dump(name, i, 10.0, 5.0, [[5.0, 1.0, "process", name, "", 1, {}]])))
+            paths.append(str(path))
+        out = tmp_path / "timeline.json"
+
+        assert main(["-o", str(out), *paths]) == 0
+
+        events = json.loads(out.read_text())["traceEvents"]
+        assert sorted(e["name"] for e in events if e["ph"] == "X") == ["camera_0", "detector"]
@@ -22,6 +22,7 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 from ..._fallback import FallbackLogger
+from ...message_module import Message
 
 # A-4 (bug-hunt 2026-07-20 §5): в модуле не было ни логов, ни счётчиков — потеря
 # ответа driver'у проходила безмолвно. FallbackLogger — стандартный паттерн
@@ -83,6 +84,10 @@ class SocketBridgeAdapter:
             msg.setdefault("reply_to", host)
 
         try:
+            # Граница системы (ADR-MSG-011): внутри процессы собирают билеты без
+            # валидации (Message.from_trusted), поэтому полная Pydantic-валидация
+            # внешнего ввода — здесь, до входа в очереди.
+            Message.from_dict(msg)
             result = self._router.request(msg, timeout=timeout)
         except Exception as exc:  # noqa: BLE001 — граница: любая ошибка → error-ответ driver'у
             result = {"success": False, "error": str(exc)}
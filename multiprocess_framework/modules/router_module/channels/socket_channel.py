@@ -9,7 +9,13 @@ SocketChannel — серверный TCP-канал (сиблинг QueueChannel
 Назначение: внешний тонкий driver (backend_ctl, dev-инструмент) подключается по TCP и
 шлёт те же router-сообщения, что GUI по локальной очереди. Граница — ровно Claude↔driver.
 
-Wire-формат: UTF-8, newline-delimited JSON, только dict. Кадры/SHM через сокет НЕ гоняем.
+Wire-формат (``wire=``):
+  - ``"json"`` (default) — UTF-8, newline-delimited JSON, только dict;
+  - ``"binary"`` — кадры ``message_module.core.wire`` (заголовок с длиной + JSON-тело +
+    ndarray/bytes сырыми буферами, ADR-MSG-011). Кодек всегда JSON: pickle на сокете
+    запрещён (граница, недоверенный peer). Читатель инкрементальный — без O(n²) на
+    склейке крупных сообщений.
+Кадры/SHM через сокет НЕ гоняем.
 
 Направления:
   - INBOUND (driver → система): read-loop читает строки, json.loads → on_inbound(msg).
@@ -28,8 +34,13 @@ import socket
 import threading
 from typing import Any, Callable, Dict, List, Optional
 
+from ...message_module.core import wire
+from ...message_module.types import MessageValidationError
 from .base_channel import MessageChannel
 
+#: Потолок одного binary-кадра: больше — протокольная ошибка, соединение рвём.
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+
 
 class SocketChannel(MessageChannel):
     """Серверный TCP-эндпоинт как IMessageChannel.
@@ -43,6 +54,7 @@ class SocketChannel(MessageChannel):
         log_warning/log_error: инъекция логирования (или от RouterManager при регистрации).
         session_isolation: True → адресная доставка по session (D.1, Вариант A);
             False (default) → broadcast всем подключённым (back-compat).
+        wire: ``"json"`` (default, newline-JSON) или ``"binary"`` (кадры wire, JSON-кодек).
     """
 
     def __init__(
@@ -54,8 +66,12 @@ class SocketChannel(MessageChannel):
         log_warning: Optional[Callable[[str], None]] = None,
         log_error: Optional[Callable[[str], None]] = None,
         session_isolation: bool = False,
+        wire: str = "json",
     ) -> None:
         super().__init__(log_warning=log_warning, log_error=log_error)
+        if wire not in ("json", "binary"):
+            raise ValueError(f"SocketChannel: неизвестный wire-формат {wire!r}")
+        self._binary = wire == "binary"
         self._name = name
         self._host = host
         self._port = port
@@ -165,7 +181,7 @@ class SocketChannel(MessageChannel):
     # ---- IMessageChannel: отправка (OUTBOUND система → driver) ----
 
     def send(self, message: Dict[str, Any]) -> Dict[str, Any]:
-        """Сериализовать dict в newline-JSON и отправить всем клиентам (под Lock).
+        """Сериализовать dict (newline-JSON или wire-кадр) и отправить всем клиентам (под Lock).
 
         Зовётся ТОЛЬКО router'ом через _resolve_channels(channel=name).
 
@@ -173,8 +189,11 @@ class SocketChannel(MessageChannel):
             {"status": "success"|"error", "channel": name, ...}.
         """
         try:
-            line = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
-        except (TypeError, ValueError) as exc:
+            if self._binary:
+                line = wire.encode(message, codec="json")
+            else:
+                line = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+        except (TypeError, ValueError, MessageValidationError) as exc:
             self._log_error(f"[SocketChannel:{self._name}] json encode failed: {exc}")
             return {"status": "error", "reason": str(exc), "channel": self._name}
 
@@ -268,7 +287,7 @@ class SocketChannel(MessageChannel):
             with self._clients_lock:
                 self._clients.append(client)
             threading.Thread(
-                target=self._read_loop,
+                target=self._read_frames if self._binary else self._read_loop,
                 args=(client,),
                 name=f"socket-ch-read-{self._name}",
                 daemon=True,
@@ -297,6 +316,45 @@ class SocketChannel(MessageChannel):
                 self._handle_line(raw, client)
         self._drop_clients([client])
 
+    def _read_frames(self, client: socket.socket) -> None:
+        """Читать wire-кадры: длина из заголовка → дочитать ровно кадр → decode.
+
+        Буфер — bytearray, разбор по смещению, прочитанный префикс срезается раз
+        на recv (линейно по объёму, в отличие от ``bytes +=`` со split). Битый/огромный кадр — протокольная ошибка:
+        лог + разрыв соединения (границу кадров после неё не восстановить).
+        """
+        buf = bytearray()
+        need = 0
+        while self._running:
+            try:
+                chunk = client.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            if not chunk:
+                break
+            buf += chunk
+            pos = 0
+            try:
+                while len(buf) - pos >= wire.HEADER_SIZE:
+                    if not need:
+                        need = wire.frame_size(memoryview(buf)[pos : pos + wire.HEADER_SIZE])
+                        if need > MAX_FRAME_BYTES:
+                            raise MessageValidationError(f"кадр {need} байт больше {MAX_FRAME_BYTES}")
+                    if len(buf) - pos < need:
+                        break
+                    frame = bytes(buf[pos : pos + need])
+                    pos += need
+                    need = 0
+                    self._handle_message(wire.decode(frame), client)
+            except MessageValidationError as exc:
+                self._log_warning(f"[SocketChannel:{self._name}] bad frame, connection dropped: {exc}")
+                break
+            # Прочитанный префикс срезаем один раз на recv, не на каждый кадр.
+            del buf[:pos]
+        self._drop_clients([client])
+
     def _handle_line(self, raw: bytes, client: socket.socket) -> None:
         """Распарсить одну строку wire и вызвать on_inbound (изоляция ошибок).
 
@@ -309,6 +367,10 @@ class SocketChannel(MessageChannel):
         except (ValueError, UnicodeDecodeError) as exc:
             self._log_warning(f"[SocketChannel:{self._name}] bad line skipped: {exc}")
             return
+        self._handle_message(msg, client)
+
+    def _handle_message(self, msg: Any, client: socket.socket) -> None:
+        """Общая часть json/binary: bind session → on_inbound (изоляция ошибок)."""
         if not isinstance(msg, dict):
             self._log_warning(f"[SocketChannel:{self._name}] non-dict message skipped")
             return
@@ -379,6 +441,7 @@ class SocketChannel(MessageChannel):
             "clients": clients,
             "sessions": sessions,
             "session_isolation": self._session_isolation,
+            "wire": "binary" if self._binary else "json",
             "rx": self._rx,
             "tx": self._tx,
         }
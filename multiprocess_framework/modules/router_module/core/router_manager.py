@@ -197,6 +197,10 @@ class RouterManager(ChannelRoutingManager):
         # они едут топологией in-process очередей (модель «трубы», assigned_worker).
         self._worker_handlers: Dict[str, Callable] = {}
 
+        # ADR-MSG-011: кэш имён собственных входных очередей (trusted-сборка билета)
+        # на ((версия реестра каналов, имя процесса), frozenset) — см. _trusted_channels.
+        self._trusted_cache: Optional[tuple] = None
+
         # P0.5: request-response поверх fire-and-forget транспорта.
         # Реестр pending-запросов: correlation_id → _PendingRequest.
         # Заполняется request() на инициаторе, резолвится в receive() при
@@ -896,8 +900,13 @@ class RouterManager(ChannelRoutingManager):
             channel_types=channel_types,
         )
         result = []
+        # ADR-MSG-011: входные очереди процесса (<name>_*, QueueChannel) пишут только
+        # доверенные отправители фреймворка — билет собирается без Pydantic-валидации
+        # (hot path). Всё прочее (сокеты, чужие каналы, роутер без процесса) — from_dict.
+        trusted = self._trusted_channels() if return_messages else frozenset()
 
         for msg_dict in raw:
+            build = Message.from_trusted if msg_dict.get("_source_channel") in trusted else Message.from_dict
             try:
                 processed = self._recv_mw.apply(msg_dict)
                 if processed is None:
@@ -935,14 +944,14 @@ class RouterManager(ChannelRoutingManager):
                 # (proc.worker[.…]) и НЕ data-кадр → доставляем worker-handler'у
                 # (модель «почта»). Кадры остаются на data-пути (трубы).
                 if self._route_to_worker(processed):
-                    result.append(Message.from_dict(processed) if return_messages else processed)
+                    result.append(build(processed) if return_messages else processed)
                     self._inc_stat("received")
                     continue
 
                 # P4.4 (B2): kind-router — регулировщик по виду `type`.
                 self._route_by_kind(processed)
 
-                result.append(Message.from_dict(processed) if return_messages else processed)
+                result.append(build(processed) if return_messages else processed)
                 self._inc_stat("received")
 
             except Exception as e:
@@ -951,6 +960,30 @@ class RouterManager(ChannelRoutingManager):
 
         return result
 
+    def _trusted_channels(self) -> frozenset:
+        """Имена собственных входных очередей процесса — источников trusted-сборки билета.
+
+        Кэш на (версия реестра каналов, имя процесса): register/unregister/clear
+        канала меняют версию, пересчёт — только после изменения набора каналов.
+        """
+        process_name = getattr(self.process, "name", None) if self.process else None
+        key = (self._channel_registry.version, process_name)
+        cached = self._trusted_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        from ..channels.queue_channel import QueueChannel
+
+        trusted: frozenset = frozenset()
+        if process_name:
+            prefix = f"{process_name}_"
+            trusted = frozenset(
+                name
+                for name, ch in self._channel_registry.snapshot().items()
+                if name.startswith(prefix) and isinstance(ch, QueueChannel)
+            )
+        self._trusted_cache = (key, trusted)
+        return trusted
+
     def _route_to_worker(self, processed: Dict[str, Any]) -> bool:
         """P2.2 (Гибрид, control-plane): доставить билет worker-handler'у по адресу.
 
@@ -1310,7 +1343,7 @@ class RouterManager(ChannelRoutingManager):
         return {"router": router_stats}
 
     def get_dispatcher_info(self) -> Dict[str, Any]:
-        """Состояние обоих dispatcher'ов: handlers, scenarios, counts."""
+        """Состояние обоих dispatcher'ов: handlers, scenarios, counts, счётчики поиска (lookup)."""
         ch_h = self.channel_dispatcher.get_all_handlers()
         ch_s = self.channel_dispatcher.get_all_scenarios()
         msg_h = self.event_dispatcher.get_all_handlers()
@@ -1322,12 +1355,14 @@ class RouterManager(ChannelRoutingManager):
                 "handler_count": len(ch_h),
                 "handlers": ch_h,
                 "scenarios": ch_s,
+                "lookup": self.channel_dispatcher.get_lookup_stats(),
             },
             "event_dispatcher": {
                 "name": self.event_dispatcher.manager_name,
                 "handler_count": len(msg_h),
                 "handlers": msg_h,
                 "scenarios": msg_s,
+                "lookup": self.event_dispatcher.get_lookup_stats(),
             },
         }
 
@@ -20,7 +20,7 @@ import unittest
 from queue import Queue
 from types import SimpleNamespace
 from typing import Callable
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from ..core.router_manager import RouterManager, _PendingRequest
 from ..channels.queue_channel import QueueChannel
@@ -318,6 +318,72 @@ class TestChannelTypesFilter(unittest.TestCase):
         self.assertEqual(msgs[0].get("command"), "sys_cmd")
 
 
+# ---------------------------------------------------------------------------
+# ADR-MSG-011: trusted-сборка билета только для своих очередей процесса
+# ---------------------------------------------------------------------------
+
+
+class TestTrustedBuild(unittest.TestCase):
+    def _router(self, process=None) -> RouterManager:
+        router = RouterManager(manager_name="rt", process=process)
+        self.addCleanup(router.shutdown)
+        return router
+
+    @staticmethod
+    def _trusted(msg) -> bool:
+        return bool(msg.__dict__.get("_msg_trusted"))
+
+    def test_own_queue_channel_built_trusted(self):
+        router = self._router(SimpleNamespace(name="proc"))
+        ch, q = _make_channel("proc_data")
+        router.register_channel(ch)
+        router.initialize()
+        q.put({"type": "command", "command": "own"})
+        self.assertTrue(self._trusted(router.receive(timeout=0.1)[0]))
+
+    def test_foreign_channel_validated(self):
+        router = self._router(SimpleNamespace(name="proc"))
+        ch, q = _make_channel("other_data")
+        router.register_channel(ch)
+        router.initialize()
+        q.put({"type": "command", "command": "foreign"})
+        msgs = router.receive(timeout=0.1, input_channels_only=False)
+        self.assertEqual(msgs[0]["command"], "foreign")
+        self.assertFalse(self._trusted(msgs[0]))
+
+    def test_router_without_process_validated(self):
+        router = self._router()
+        ch, q = _make_channel("proc_data")
+        router.register_channel(ch)
+        router.initialize()
+        q.put({"type": "command", "command": "no_process"})
+        self.assertFalse(self._trusted(router.receive(timeout=0.1)[0]))
+
+    def test_own_non_queue_channel_validated(self):
+        """Сокет с именем процесса — внешний ввод, trusted только QueueChannel."""
+        router = self._router(SimpleNamespace(name="proc"))
+        ch, _ = _make_channel("proc_data")
+        snapshot = {"proc_data": ch, "proc_sock": Mock(spec=["poll"])}
+        with patch.object(router._channel_registry, "snapshot", return_value=snapshot):
+            self.assertEqual(router._trusted_channels(), frozenset({"proc_data"}))
+
+    def test_trusted_set_cached_until_channels_change(self):
+        router = self._router(SimpleNamespace(name="proc"))
+        ch, _ = _make_channel("proc_data")
+        router.register_channel(ch)
+        with patch.object(router._channel_registry, "snapshot", wraps=router._channel_registry.snapshot) as snap:
+            self.assertEqual(router._trusted_channels(), frozenset({"proc_data"}))
+            self.assertEqual(router._trusted_channels(), frozenset({"proc_data"}))
+            self.assertEqual(snap.call_count, 1)
+
+            extra, _ = _make_channel("proc_ctrl")
+            router.register_channel(extra)
+            self.assertEqual(router._trusted_channels(), frozenset({"proc_data", "proc_ctrl"}))
+            router.unregister_channel("proc_data")
+            self.assertEqual(router._trusted_channels(), frozenset({"proc_ctrl"}))
+            self.assertEqual(snap.call_count, 3)
+
+
 # ---------------------------------------------------------------------------
 # Тесты register_channel — инъекция логгера
 # ---------------------------------------------------------------------------
@@ -596,7 +662,7 @@ class TestDispatcherInfo(unittest.TestCase):
 
     def test_dispatcher_info_has_required_keys(self):
         info = self.router.get_dispatcher_info()
-        for key in ("name", "handler_count", "handlers", "scenarios"):
+        for key in ("name", "handler_count", "handlers", "scenarios", "lookup"):
             self.assertIn(key, info["channel_dispatcher"], f"missing key: {key}")
             self.assertIn(key, info["event_dispatcher"], f"missing key: {key}")
 
@@ -141,6 +141,16 @@ class TestErrorHandling:
         assert resp["result"]["success"] is False
         assert "boom" in resp["result"]["error"]
 
+    def test_invalid_message_rejected_at_edge(self) -> None:
+        # ADR-MSG-011: внутри процессы собирают билеты без валидации — внешний ввод
+        # валидируется здесь и в систему не попадает.
+        router = FakeRouter()
+        adapter = SocketBridgeAdapter(router, "backend_ctl")
+        adapter.on_inbound(_msg(targets="preprocessor"))
+        assert router.request_calls == []
+        assert router.sent[0]["result"]["success"] is False
+        assert router.sent[0]["request_id"] == "corr-1"
+
     def test_send_error_swallowed(self) -> None:
         router = FakeRouter(send_raises=True)
         adapter = SocketBridgeAdapter(router, "backend_ctl")
@@ -21,6 +21,7 @@ from typing import Any, Dict, List
 
 import pytest
 
+from ...message_module.core import wire
 from ..channels.socket_channel import SocketChannel
 
 
@@ -378,3 +379,64 @@ class TestLifecycle:
         info = channel.get_info()
         for key in ("name", "type", "active", "bound", "host", "port", "clients", "rx", "tx"):
             assert key in info
+
+
+# --- wire="binary" (ADR-MSG-011) ---
+
+
+def _recv_frame(sock: socket.socket, timeout: float = 2.0) -> Dict[str, Any]:
+    """Прочитать один wire-кадр из сокета."""
+    sock.settimeout(timeout)
+    buf = b""
+    need = 0
+    while not need or len(buf) < need:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buf += chunk
+        if not need and len(buf) >= wire.HEADER_SIZE:
+            need = wire.frame_size(buf)
+    return wire.decode(buf[:need])
+
+
+@pytest.fixture
+def bin_channel(inbound: List[Dict[str, Any]]):
+    ch = SocketChannel("backend_ctl", host="127.0.0.1", port=0, on_inbound=inbound.append, wire="binary")
+    assert ch.start() is True
+    yield ch
+    ch.close()
+
+
+class TestBinaryWire:
+    def test_unknown_wire_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            SocketChannel("bc", wire="msgpack")
+
+    def test_inbound_frames_split_across_sends(self, bin_channel: SocketChannel, inbound: List[Dict[str, Any]]) -> None:
+        c = _connect(bin_channel)
+        stream = wire.encode({"a": 1}, codec="json") + wire.encode({"a": 2, "b": b"xyz"}, codec="json")
+        for i in range(0, len(stream), 7):  # кадры режутся на произвольных границах
+            c.sendall(stream[i : i + 7])
+        assert _wait(lambda: len(inbound) == 2)
+        assert inbound == [{"a": 1}, {"a": 2, "b": b"xyz"}]
+        assert bin_channel.get_info()["wire"] == "binary"
+        c.close()
+
+    def test_ndarray_roundtrip(self, bin_channel: SocketChannel, inbound: List[Dict[str, Any]]) -> None:
+        np = pytest.importorskip("numpy")
+        c = _connect(bin_channel)
+        frame = np.arange(480 * 640 * 3, dtype=np.uint8).reshape(480, 640, 3)
+        assert bin_channel.send({"type": "data", "frame": frame})["status"] == "success"
+        out = _recv_frame(c)
+        assert np.array_equal(out["frame"], frame)
+        c.sendall(wire.encode(out, codec="json"))
+        assert _wait(lambda: len(inbound) == 1)
+        assert np.array_equal(inbound[0]["frame"], frame)
+        c.close()
+
+    def test_pickle_frame_drops_connection(self, bin_channel: SocketChannel, inbound: List[Dict[str, Any]]) -> None:
+        c = _connect(bin_channel)
+        c.sendall(wire.encode({"a": 1}, codec="pickle"))
+        assert _wait(lambda: bin_channel.get_info()["clients"] == 0)
+        assert inbound == []
+        c.close()
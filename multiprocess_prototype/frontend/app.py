@@ -282,7 +282,7 @@ def run_gui(process: "GuiProcess") -> None:
     #     запись и late-binding-чтение мирились одним read-model.
     from multiprocess_framework.modules.frontend_module.state import TelemetryViewModel
 
-    from .state.bindings import GuiStateBindings
+    from .state.bindings import DEFAULT_COALESCE_MS, GuiStateBindings
 
     _gui_proxy = getattr(process, "_gui_state_proxy", None)
 
@@ -303,6 +303,8 @@ def run_gui(process: "GuiProcess") -> None:
         # devices.**/calibration.**). refcount в proxy схлопывает дубли.
         ensure_subscription=(_gui_proxy.ensure_subscription if _gui_proxy is not None else None),
         release_subscription=(_gui_proxy.release_subscription if _gui_proxy is not None else None),
+        # Дельты одного кадра (~16 мс) схлопываются: виджет получает последнее значение.
+        coalesce_ms=DEFAULT_COALESCE_MS,
     )
 
     # VM регистрируется вторым потребителем ПОСЛЕ bindings (порядок §11.15:
@@ -929,8 +931,8 @@ def _setup_bridge_callbacks(
                 window.record_chain_latency((time.time() - cts) * 1000.0)
 
             # frame-trace: финальный transport-спан (painter→gui) + дамп полного
-            # таймлайна каждый 30-й кадр (под флагом INSPECTOR_FRAME_TRACE).
-            if frame_trace.enabled() and isinstance(data, dict):
+            # таймлайна каждый 30-й кадр (INSPECTOR_FRAME_TRACE или кадр из сэмплинга).
+            if frame_trace.is_traced(data):
                 frame_trace.record_transport(data, "gui")
                 # Накопить пер-сегментные времена → таблица «участок · мс»
                 # («Все процессы»). Публикуется усреднённо раз в секунду.
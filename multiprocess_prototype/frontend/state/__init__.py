@@ -2,15 +2,18 @@
 
 Публичный API:
     match_glob(pattern, path) → bool  — glob-матчинг сегментов пути
+    PatternIndex                — индекс паттернов: путь → подписчики
     GuiStateBindings            — менеджер реактивных подписок
     BindingHandle               — дескриптор одной подписки
 """
 
 from .glob_match import match_glob
+from .pattern_index import PatternIndex
 from .bindings import DELETED, BindingHandle, GuiStateBindings
 
 __all__ = [
     "match_glob",
+    "PatternIndex",
     "GuiStateBindings",
     "BindingHandle",
     "DELETED",
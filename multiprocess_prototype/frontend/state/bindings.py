@@ -6,6 +6,12 @@ GuiStateBindings регистрирует обратные вызовы чере
 
 Хранение виджетов — через weakref.ref для автоматической уборки при удалении.
 Авто-уборка также через сигнал widget.destroyed.
+
+Резолв пути в подписки — через ``PatternIndex`` (точный dict + wildcard-trie),
+а не линейный ``match_glob`` по всем подпискам на каждую дельту. При
+``coalesce_ms > 0`` применение копится до тика GUI: каждый виджет (и каждая
+пара fan-out × путь) получает не больше одного значения за тик — последнее;
+перезаписанные промежуточные значения считаются в ``coalesce_stats()``.
 """
 
 from __future__ import annotations
@@ -15,9 +21,11 @@ import weakref
 from dataclasses import dataclass
 from typing import Any, Callable, Protocol, TYPE_CHECKING, runtime_checkable
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget
 
 from .glob_match import match_glob
+from .pattern_index import PatternIndex
 
 if TYPE_CHECKING:
     from multiprocess_prototype.frontend.bridge_impl import DataReceiverBridge
@@ -26,6 +34,13 @@ if TYPE_CHECKING:
 # правилу 5 не глушим молча: логируем на debug, чтобы видеть при отладке биндингов.
 _logger = logging.getLogger(__name__)
 
+# Тик коалесинга по умолчанию для GUI (~60 Гц): чаще виджет всё равно не перерисуется.
+DEFAULT_COALESCE_MS = 16
+
+# Без коалесинга полная уборка мёртвых хэндлов — раз в столько state-сообщений
+# (индекс отдаёт только совпавшие подписки, мёртвые на «тихих» путях иначе копятся).
+_SWEEP_EVERY_MSGS = 256
+
 
 @runtime_checkable
 class _ReadModelLike(Protocol):
@@ -153,6 +168,7 @@ class GuiStateBindings:
         read_model: "_ReadModelLike | None" = None,
         ensure_subscription: Callable[[str], Any] | None = None,
         release_subscription: Callable[[str], Any] | None = None,
+        coalesce_ms: int = 0,
     ) -> None:
         """Инициализировать и занять state_callback у bridge.
 
@@ -172,6 +188,9 @@ class GuiStateBindings:
                 «панель мертва, забыли wildcard». refcount живёт в proxy.
             release_subscription: симметричный колбэк для unbind — снимает
                 ссылку на подписку (при обнулении refcount proxy отписывается).
+            coalesce_ms: период тика коалесинга (мс). 0 — применять сразу на
+                дельте (прежнее поведение); > 0 — копить до тика, виджету —
+                только последнее значение (``DEFAULT_COALESCE_MS`` для GUI).
         """
         self._ensure_subscription = ensure_subscription
         self._release_subscription = release_subscription
@@ -181,6 +200,20 @@ class GuiStateBindings:
         # подписчику динамически создавать виджеты по обнаруженным ключам
         # (например строки рантайм-воркеров processes.X.workers.*).
         self._fanouts: list[FanoutHandle] = []
+        # Индексы pattern → хэндлы (порядок регистрации), синхронны спискам выше.
+        self._binding_index: PatternIndex[BindingHandle] = PatternIndex()
+        self._fanout_index: PatternIndex[FanoutHandle] = PatternIndex()
+        # Коалесинг: id(handle) → (handle, value); (id(fanout), path) → (fanout, path, value).
+        self._pending: dict[int, tuple[BindingHandle, Any]] = {}
+        self._pending_fanout: dict[tuple[int, str], tuple[FanoutHandle, str, Any]] = {}
+        self._stats = {"applied": 0, "dropped": 0, "ticks": 0}
+        self._msgs_since_sweep = 0
+        self._flush_timer: QTimer | None = None
+        if coalesce_ms > 0:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(int(coalesce_ms))
+            self._flush_timer.timeout.connect(self.flush)
         # Единый read-model — источник late-binding-снимка (public: секции могут
         # читать актуальное сами, напр. io_debug при выборе плагин-ноды).
         self.read_model = read_model
@@ -257,6 +290,7 @@ class GuiStateBindings:
             reset=reset,
         )
         self._bindings.append(handle)
+        self._binding_index.add(handle.pattern, handle)
 
         # Авто-подписка: серверная подписка на pattern гарантированно есть.
         self._ensure(handle.pattern)
@@ -309,6 +343,7 @@ class GuiStateBindings:
             owner_ref=weakref.ref(owner) if owner is not None else None,
         )
         self._fanouts.append(handle)
+        self._fanout_index.add(pattern, handle)
 
         # Авто-подписка на pattern fan-out (как для bind).
         self._ensure(pattern)
@@ -334,10 +369,10 @@ class GuiStateBindings:
         Args:
             handle: дескриптор, ранее возвращённый bind_fanout().
         """
-        try:
-            self._fanouts.remove(handle)
-        except ValueError:
+        if not self._fanout_index.remove(handle.pattern, handle):
             return  # Уже снята — не падаем и не отпускаем подписку повторно
+        self._fanouts = [h for h in self._fanouts if h is not handle]
+        self._drop_pending_fanout(handle)
         self._release(handle.pattern)
 
     def unbind_by_owner(self, owner: QWidget) -> None:
@@ -363,6 +398,8 @@ class GuiStateBindings:
             kept.append(h)
         self._fanouts = kept
         for h in removed:
+            self._fanout_index.remove(h.pattern, h)
+            self._drop_pending_fanout(h)
             self._release(h.pattern)
 
     def unbind(self, handle: BindingHandle) -> None:
@@ -371,9 +408,7 @@ class GuiStateBindings:
         Args:
             handle: дескриптор, ранее возвращённый bind().
         """
-        try:
-            self._bindings.remove(handle)
-        except ValueError:
+        if not self._forget_binding(handle):
             return  # Уже удалена — не падаем и не отпускаем подписку повторно
         self._release(handle.pattern)
 
@@ -387,8 +422,8 @@ class GuiStateBindings:
             widget: Qt-виджет, чьи подписки нужно снять.
         """
         removed = [h for h in self._bindings if h.widget_ref() is widget]
-        self._bindings = [h for h in self._bindings if h.widget_ref() is not widget]
         for h in removed:
+            self._forget_binding(h)
             self._release(h.pattern)
 
     def clear(self) -> None:
@@ -396,9 +431,65 @@ class GuiStateBindings:
         patterns = [h.pattern for h in self._bindings] + [h.pattern for h in self._fanouts]
         self._bindings.clear()
         self._fanouts.clear()
+        self._binding_index.clear()
+        self._fanout_index.clear()
+        self._pending.clear()
+        self._pending_fanout.clear()
         for pat in patterns:
             self._release(pat)
 
+    def flush(self) -> None:
+        """Применить накопленные значения (тик коалесинга; можно звать вручную).
+
+        Заодно — полная уборка мёртвых хэндлов (см. ``_sweep_dead``).
+        """
+        self._sweep_dead()
+        pending, self._pending = self._pending, {}
+        pending_fanout, self._pending_fanout = self._pending_fanout, {}
+        if not pending and not pending_fanout:
+            return
+        self._stats["ticks"] += 1
+        for handle, value in pending.values():
+            self._apply_to_widget(handle, value)
+        for fanout, path, value in pending_fanout.values():
+            self._call_fanout(fanout, path, value)
+        self._stats["applied"] += len(pending) + len(pending_fanout)
+
+    def coalesce_stats(self) -> dict[str, int]:
+        """Счётчики коалесинга: applied (применено), dropped (перезаписано
+        более свежим значением до тика), ticks, pending (ждут тика)."""
+        return {**self._stats, "pending": len(self._pending) + len(self._pending_fanout)}
+
+    # ------------------------------------------------------------------
+    # Внутреннее: учёт хэндлов
+    # ------------------------------------------------------------------
+
+    def _forget_binding(self, handle: BindingHandle) -> bool:
+        """Убрать хэндл из списка, индекса и очереди коалесинга. False — уже убран."""
+        if not self._binding_index.remove(handle.pattern, handle):
+            return False
+        self._bindings = [h for h in self._bindings if h is not handle]
+        self._pending.pop(id(handle), None)
+        return True
+
+    def _sweep_dead(self) -> None:
+        """Снять ВСЕ хэндлы с умершим виджетом, а не только совпавшие с дельтой.
+
+        Уборка в ``_on_state_msg`` видит лишь подписки пути дельты: хэндл на путь,
+        который больше не обновляется, держал бы серверную подписку вечно.
+        """
+        self._msgs_since_sweep = 0
+        dead = [h for h in self._bindings if h.widget_ref() is None]
+        for d in dead:
+            if self._forget_binding(d):
+                self._release(d.pattern)
+
+    def _drop_pending_fanout(self, handle: FanoutHandle) -> None:
+        if self._pending_fanout:
+            key_id = id(handle)
+            for key in [k for k in self._pending_fanout if k[0] == key_id]:
+                del self._pending_fanout[key]
+
     # ------------------------------------------------------------------
     # Внутренний callback для bridge
     # ------------------------------------------------------------------
@@ -435,37 +526,38 @@ class GuiStateBindings:
         # задан; иначе виджет не трогаем (дельта всё равно доставлена).
         deleted = bool(msg_dict.get("deleted"))
 
+        coalesce = self._flush_timer is not None
+
         # Собираем «мёртвые» дескрипторы для последующей уборки
         dead: list[BindingHandle] = []
 
-        for handle in self._bindings:
+        # Только подписки с совпавшим паттерном (индекс), а не все подряд.
+        for handle in self._binding_index.match(path):
             # Проверяем, жив ли виджет
             if handle.widget_ref() is None:
                 dead.append(handle)
                 continue
 
-            # Проверяем совпадение паттерна
-            if not match_glob(handle.pattern, path):
-                continue
-
             if deleted:
-                if handle.reset is not _UNSET:
-                    self._apply_to_widget(handle, handle.reset)
-                # reset не задан → удаление доставлено, но виджет не трогаем
-                continue
-
-            self._apply_to_widget(handle, value)
+                if handle.reset is _UNSET:
+                    continue  # reset не задан → удаление доставлено, но виджет не трогаем
+                new_value = handle.reset
+            else:
+                new_value = value
+
+            if coalesce:
+                if id(handle) in self._pending:
+                    self._stats["dropped"] += 1
+                self._pending[id(handle)] = (handle, new_value)
+            else:
+                self._apply_to_widget(handle, new_value)
 
         # Убираем мёртвые weakref-ы. ВАЖНО: отпускаем подписку (_release), иначе
         # refcount паттерна в proxy не декрементится, если reap опередил
         # widget.destroyed→unbind_widget (единственный другой release-путь) →
         # серверная подписка утекает (5.20 review #1).
-        if dead:
-            for d in dead:
-                try:
-                    self._bindings.remove(d)
-                except ValueError:
-                    continue
+        for d in dead:
+            if self._forget_binding(d):
                 self._release(d.pattern)
 
         # Fan-out: динамическое обнаружение ключей (создание строк подписчиком).
@@ -475,12 +567,28 @@ class GuiStateBindings:
         # `if not isinstance(value, dict): return`, DELETED (не dict) пропускают —
         # обратная совместимость.
         fanout_value = DELETED if deleted else value
-        for fanout in list(self._fanouts):
-            if match_glob(fanout.pattern, path):
-                try:
-                    fanout.callback(path, fanout_value)
-                except Exception as exc:
-                    _logger.debug("bindings: fan-out callback failed on %s (pattern %s): %s", path, fanout.pattern, exc)
+        for fanout in self._fanout_index.match(path):
+            if coalesce:
+                key = (id(fanout), path)
+                if key in self._pending_fanout:
+                    self._stats["dropped"] += 1
+                self._pending_fanout[key] = (fanout, path, fanout_value)
+            else:
+                self._call_fanout(fanout, path, fanout_value)
+
+        if coalesce and (self._pending or self._pending_fanout) and not self._flush_timer.isActive():
+            self._flush_timer.start()
+        elif not coalesce:
+            # Без тика flush() полную уборку делает сам поток дельт — амортизированно.
+            self._msgs_since_sweep += 1
+            if self._msgs_since_sweep >= _SWEEP_EVERY_MSGS:
+                self._sweep_dead()
+
+    def _call_fanout(self, fanout: FanoutHandle, path: str, value: Any) -> None:
+        try:
+            fanout.callback(path, value)
+        except Exception as exc:
+            _logger.debug("bindings: fan-out callback failed on %s (pattern %s): %s", path, fanout.pattern, exc)
 
     def _apply_to_widget(self, handle: BindingHandle, value: Any) -> bool:
         """Применить значение к виджету подписки через setter.
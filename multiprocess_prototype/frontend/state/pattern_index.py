@@ -0,0 +1,174 @@
+"""pattern_index.py — Скомпилированный индекс glob-паттернов StateStore для GUI-подписок.
+
+``GuiStateBindings`` раньше на КАЖДУЮ дельту проходил все подписки и звал
+``match_glob`` — O(подписок × дельт) на Qt-потоке. Индекс резолвит путь в
+список подписчиков почти за константу:
+
+  - точные паттерны (без ``*``/``**``) — dict ``{сегменты: [...]}``;
+  - wildcard-паттерны — trie по сегментам (литерал / ``*`` / ``**``), обход
+    сразу по всем паттернам за один проход пути;
+  - результат резолва кэшируется по пути (набор путей дерева ограничен),
+    кэш сбрасывается при add/remove.
+
+Семантика матчинга — та же, что у ``match_glob`` (framework-матчер:
+``*`` — ровно один сегмент, ``**`` — ноль и более, ведущие/завершающие точки
+обрезаются). Порядок результата — порядок регистрации (как у прежнего
+линейного прохода по списку).
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+from multiprocess_framework.modules.state_store_module.core import split_pattern
+
+T = TypeVar("T")
+
+# Потолок кэша резолва: дерево StateStore конечно, но не даём ему расти
+# бесконечно на динамических ключах (воркеры/устройства) — при переполнении
+# кэш просто сбрасывается.
+_CACHE_MAX = 8192
+
+
+def _segments(pattern: str) -> tuple[str, ...]:
+    """Нормализация как у ``match_glob``: обрезать точки, разбить по сегментам."""
+    return split_pattern(pattern.strip("."))
+
+
+class _Node:
+    """Узел trie: дети по литералу, ``*``, ``**`` и подписки, оканчивающиеся здесь."""
+
+    __slots__ = ("literal", "star", "dstar", "entries")
+
+    def __init__(self) -> None:
+        self.literal: dict[str, _Node] = {}
+        self.star: _Node | None = None
+        self.dstar: _Node | None = None
+        self.entries: list[tuple[int, object]] = []
+
+
+class PatternIndex(Generic[T]):
+    """Индекс «glob-паттерн → подписчики» с резолвом пути в подписчиков.
+
+    Подписчики сравниваются по идентичности (``is``): одинаковые по полям
+    хэндлы — разные подписки.
+
+    Использование:
+        index = PatternIndex()
+        index.add("processes.*.state.fps", handle)
+        index.match("processes.cam.state.fps")  # → [handle]
+        index.remove("processes.*.state.fps", handle)
+    """
+
+    def __init__(self) -> None:
+        self._exact: dict[tuple[str, ...], list[tuple[int, T]]] = {}
+        self._root = _Node()
+        self._seq = 0
+        self._size = 0
+        self._cache: dict[str, tuple[T, ...]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, item: T) -> None:
+        """Зарегистрировать подписчика на паттерн."""
+        segs = _segments(pattern)
+        self._seq += 1
+        entry = (self._seq, item)
+        if "*" in segs or "**" in segs:
+            self._node(segs, create=True).entries.append(entry)  # type: ignore[union-attr]
+        else:
+            self._exact.setdefault(segs, []).append(entry)
+        self._size += 1
+        self._cache.clear()
+
+    def remove(self, pattern: str, item: T) -> bool:
+        """Снять подписчика с паттерна. False — такой пары нет (идемпотентно)."""
+        segs = _segments(pattern)
+        if "*" in segs or "**" in segs:
+            node = self._node(segs, create=False)
+            bucket = node.entries if node is not None else None
+        else:
+            bucket = self._exact.get(segs)
+        if not bucket:
+            return False
+        for i, (_, existing) in enumerate(bucket):
+            if existing is item:
+                del bucket[i]
+                break
+        else:
+            return False
+        if not bucket and segs in self._exact:
+            del self._exact[segs]
+        self._size -= 1
+        self._cache.clear()
+        return True
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._root = _Node()
+        self._size = 0
+        self._cache.clear()
+
+    def match(self, path: str) -> tuple[T, ...]:
+        """Все подписчики, чей паттерн совпадает с ``path``, в порядке регистрации."""
+        cached = self._cache.get(path)
+        if cached is not None:
+            return cached
+        segs = _segments(path)
+        found: dict[int, T] = {}
+        for seq, item in self._exact.get(segs, ()):
+            found[seq] = item
+        self._walk(self._root, segs, 0, found)
+        result = tuple(found[seq] for seq in sorted(found)) if len(found) > 1 else tuple(found.values())
+        if len(self._cache) >= _CACHE_MAX:
+            self._cache.clear()
+        self._cache[path] = result
+        return result
+
+    # ------------------------------------------------------------------
+    # trie
+    # ------------------------------------------------------------------
+
+    def _node(self, segs: tuple[str, ...], create: bool) -> _Node | None:
+        node = self._root
+        for seg in segs:
+            if seg == "**":
+                nxt = node.dstar
+                if nxt is None and create:
+                    nxt = node.dstar = _Node()
+            elif seg == "*":
+                nxt = node.star
+                if nxt is None and create:
+                    nxt = node.star = _Node()
+            else:
+                nxt = node.literal.get(seg)
+                if nxt is None and create:
+                    nxt = node.literal[seg] = _Node()
+            if nxt is None:
+                return None
+            node = nxt
+        return node
+
+    def _walk(self, node: _Node, segs: tuple[str, ...], i: int, found: dict[int, T]) -> None:
+        """Обход trie по пути: все ветви (литерал, ``*``, ``**``) параллельно.
+
+        Dedup по seq в ``found``: ``a.**.**``-подобные паттерны достижимы
+        несколькими путями разбиения.
+        """
+        if node.dstar is not None:
+            # '**' поглощает 0..N оставшихся сегментов.
+            for j in range(i, len(segs) + 1):
+                self._walk(node.dstar, segs, j, found)
+        if i == len(segs):
+            for seq, item in node.entries:
+                found[seq] = item  # type: ignore[assignment]
+            return
+        child = node.literal.get(segs[i])
+        if child is not None:
+            self._walk(child, segs, i + 1, found)
+        if node.star is not None:
+            self._walk(node.star, segs, i + 1, found)
+
+
+__all__ = ["PatternIndex"]
@@ -740,6 +740,34 @@ class TestReviewFixes:
         assert handle not in b._bindings  # reap убрал
         release.assert_called_once_with("a.b")
 
+    def test_flush_sweeps_dead_handles_on_quiet_paths(self, qtbot, bridge):
+        """Мёртвый хэндл на пути без дельт убирается полной уборкой во flush()."""
+        release = MagicMock()
+        b = GuiStateBindings(bridge, release_subscription=release)
+        w = QLabel()
+        qtbot.addWidget(w)
+        handle = b.bind("quiet.path", w, "text")
+        handle.widget_ref = lambda: None
+
+        b._on_state_msg({"data_type": "state_delta", "path": "other.path", "value": 1})
+        assert handle in b._bindings  # дельта чужого пути мёртвый хэндл не видит
+
+        b.flush()
+        assert handle not in b._bindings
+        release.assert_called_once_with("quiet.path")
+
+    def test_periodic_sweep_without_coalescing(self, qtbot, bridge):
+        from multiprocess_prototype.frontend.state.bindings import _SWEEP_EVERY_MSGS
+
+        b = GuiStateBindings(bridge)
+        w = QLabel()
+        qtbot.addWidget(w)
+        handle = b.bind("quiet.path", w, "text")
+        handle.widget_ref = lambda: None
+        for i in range(_SWEEP_EVERY_MSGS):
+            b._on_state_msg({"data_type": "state_delta", "path": "other.path", "value": i})
+        assert handle not in b._bindings
+
     def test_fanout_receives_DELETED_sentinel_on_delete(self, qtbot, bindings):
         """#2: fan-out получает sentinel DELETED на delete (не None)."""
         from multiprocess_prototype.frontend.state.bindings import DELETED
@@ -862,3 +890,67 @@ class TestGuiDeliveryPathIntegration:
         proxy.on_state_changed({"data": {"deltas": [delta.to_dict()]}})
 
         assert label.text() == "30"
+
+
+# ---------------------------------------------------------------------------
+# Коалесинг: не больше одного применения на виджет за тик
+# ---------------------------------------------------------------------------
+
+
+class TestCoalescing:
+    def _msg(self, path: str, value, deleted: bool = False) -> dict:
+        return {"data_type": "state_delta", "path": path, "value": value, "deleted": deleted}
+
+    def test_latest_value_applied_once_per_tick(self, qtbot, bridge):
+        b = GuiStateBindings(bridge, coalesce_ms=10_000)  # тик вручную через flush()
+        label = QLabel()
+        qtbot.addWidget(label)
+        applied: list = []
+        b.bind("processes.*.state.fps", label, "text", formatter=lambda v: applied.append(v) or v)
+
+        for fps in (10, 20, 30):
+            b._on_state_msg(self._msg("processes.cam.state.fps", fps))
+        assert label.text() == ""  # до тика виджет не трогаем
+
+        b.flush()
+        assert label.text() == "30"
+        assert applied == [30]
+        stats = b.coalesce_stats()
+        assert stats["dropped"] == 2 and stats["applied"] == 1 and stats["pending"] == 0
+
+    def test_fanout_coalesced_per_path(self, qtbot, bridge):
+        b = GuiStateBindings(bridge, coalesce_ms=10_000)
+        seen: list = []
+        b.bind_fanout("proc.*.workers.*", lambda p, v: seen.append((p, v)))
+
+        b._on_state_msg(self._msg("proc.cam.workers.w1", 1))
+        b._on_state_msg(self._msg("proc.cam.workers.w2", 5))
+        b._on_state_msg(self._msg("proc.cam.workers.w1", 2))
+        b.flush()
+
+        assert seen == [("proc.cam.workers.w1", 2), ("proc.cam.workers.w2", 5)]
+        assert b.coalesce_stats()["dropped"] == 1
+
+    def test_unbind_drops_pending_value(self, qtbot, bridge):
+        b = GuiStateBindings(bridge, coalesce_ms=10_000)
+        label = QLabel()
+        qtbot.addWidget(label)
+        handle = b.bind("a.b", label, "text")
+
+        b._on_state_msg(self._msg("a.b", "stale"))
+        b.unbind(handle)
+        b.flush()
+
+        assert label.text() == ""
+        assert b.coalesce_stats()["pending"] == 0
+
+    def test_timer_flushes_on_tick(self, qtbot, bridge):
+        b = GuiStateBindings(bridge, coalesce_ms=5)
+        label = QLabel()
+        qtbot.addWidget(label)
+        b.bind("a.b", label, "text")
+
+        b._on_state_msg(self._msg("a.b", 1))
+        b._on_state_msg(self._msg("a.b", 2))
+        qtbot.waitUntil(lambda: label.text() == "2", timeout=1000)
+        assert b.coalesce_stats()["ticks"] == 1
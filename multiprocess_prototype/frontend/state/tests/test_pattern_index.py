@@ -0,0 +1,127 @@
+"""Тесты для frontend/state/pattern_index.py.
+
+Индекс обязан давать ровно тот же набор подписчиков, что линейный проход
+``match_glob`` по всем паттернам, и в порядке регистрации.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+from multiprocess_prototype.frontend.state.glob_match import match_glob
+from multiprocess_prototype.frontend.state.pattern_index import PatternIndex
+
+PATTERNS = [
+    "processes.cam.state.fps",
+    "processes.*.state.fps",
+    "processes.*.state.*",
+    "processes.**",
+    "processes.**.fps",
+    "**",
+    "**.status",
+    "system.chain_fps",
+    "processes.*.workers.*.status",
+    "processes.**.**",
+    ".processes.cam.",
+    "",
+]
+
+PATHS = [
+    "processes.cam.state.fps",
+    "processes.det.state.fps",
+    "processes.cam.state.status",
+    "processes.cam.workers.w1.status",
+    "processes",
+    "system.chain_fps",
+    "devices.state.d1.conn",
+    "",
+]
+
+
+class Handle:
+    """Подписчик-заглушка (сравнение по идентичности)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _build(patterns):
+    index = PatternIndex()
+    handles = []
+    for pattern in patterns:
+        handle = Handle(pattern)
+        index.add(pattern, handle)
+        handles.append((pattern, handle))
+    return index, handles
+
+
+class TestMatchEquivalence:
+    def test_same_result_as_linear_match_glob(self):
+        index, handles = _build(PATTERNS)
+        for path in PATHS:
+            expected = [h for p, h in handles if match_glob(p, path)]
+            assert list(index.match(path)) == expected, path
+
+    def test_registration_order_across_exact_and_wildcard(self):
+        index = PatternIndex()
+        a, b, c = Handle("a"), Handle("b"), Handle("c")
+        index.add("x.*", a)
+        index.add("x.y", b)
+        index.add("**", c)
+        assert index.match("x.y") == (a, b, c)
+
+    def test_double_star_pattern_reported_once(self):
+        index = PatternIndex()
+        h = Handle("h")
+        index.add("a.**.**", h)
+        assert index.match("a.b.c.d") == (h,)
+
+
+class TestMutation:
+    def test_remove_is_by_identity(self):
+        index = PatternIndex()
+        first, second = Handle("same"), Handle("same")
+        index.add("a.*", first)
+        index.add("a.*", second)
+
+        assert index.remove("a.*", second) is True
+        assert index.match("a.b") == (first,)
+        assert index.remove("a.*", second) is False
+        assert len(index) == 1
+
+    def test_cache_invalidated_on_add_and_remove(self):
+        index = PatternIndex()
+        h1, h2 = Handle("h1"), Handle("h2")
+        index.add("a.b", h1)
+        assert index.match("a.b") == (h1,)
+        index.add("a.*", h2)
+        assert index.match("a.b") == (h1, h2)
+        index.remove("a.b", h1)
+        assert index.match("a.b") == (h2,)
+
+    def test_remove_unknown_pattern(self):
+        index = PatternIndex()
+        assert index.remove("no.*.such", Handle("x")) is False
+        assert index.remove("no.such", Handle("x")) is False
+
+    def test_clear(self):
+        index, _ = _build(PATTERNS)
+        index.match("processes.cam.state.fps")
+        index.clear()
+        assert len(index) == 0
+        assert index.match("processes.cam.state.fps") == ()
+
+    def test_all_pattern_permutations_match_glob(self):
+        segs = ["a", "*", "**"]
+        paths = ["", "a", "a.a", "a.b.a", "b.a.a.a"]
+        for n in range(1, 4):
+            for combo in itertools.product(segs, repeat=n):
+                pattern = ".".join(combo)
+                index = PatternIndex()
+                h = Handle(pattern)
+                index.add(pattern, h)
+                for path in paths:
+                    assert bool(index.match(path)) is match_glob(pattern, path), (pattern, path)
@@ -94,9 +94,15 @@ REG_OVERLAP  = 0x1413    -- W  : SetOverlapDistance, 0.1 мм
 REG_DRAW_HOME = 0x1414   -- W  : 1 = после прохода ехать домой (последний проход рисунка); 0 = ждать на месте
 REG_DRAW_TRAVEL = 0x1415 -- W  : скорость ПЕРЕЕЗДА с поднятым пером, % 1..100 (live из пульта)
 REG_DRAW_ACCEL = 0x1416  -- W  : ускорение рисования AccL/DecL, мм/с² (live из пульта; 0/нет = дефолт)
+-- ── РИСОВАНИЕ: конвейер проходов (ПК заливает проход N+1 во второй банк, пока рисуется N) ──
+REG_DRAW_BANK   = 0x1417 -- W  : банк точек задания 0/1; защёлкивается при приёме и сбрасывается в 0
+REG_DRAW_PASS_N = 0x1418 -- R  : счётчик завершённых проходов (mod 65536) — конец прохода виден ПК,
+                         --       даже если следующий (уже в очереди) стартовал в тот же цикл
+REG_DRAW_DONE_N_ALT = 0x1419 -- R : read-back ACK прохода из банка 1 (банк 0 — REG_DRAW_DONE_N)
 -- ── РИСОВАНИЕ: буфер точек (PTS_MAX слотов × 3 рег: X, Y, pen) ──
 REG_PTS_BASE = 0x1420
 local PTS_MAX      = 100
+local PTS_BANK_MAX = 50         -- банк конвейера = полбуфера; банк k с REG_PTS_BASE + k*PTS_BANK_MAX*3
 local POOL_BASE    = 100        -- id точек пула = POOL_BASE+1..POOL_BASE+PTS_MAX (101..200)
 -- ⚠️ АДРЕСА КОМАНДНЫХ БЛОКОВ — в свободной дыре 0x1340..0x13FF (между CONFIG 0x130B и DRAW
 --    0x1400), НИЖЕ буфера точек рисования 0x1420..0x154B. Раньше MAN/RET/TOOL стояли на
@@ -518,7 +524,18 @@ end
 -- =====================  ПРОХОД БУФЕРА (рисование)  ================
 -- Пред-чтение всей пачки → запись в ПУЛ distinct-точек → MovL(PASS) по разным точкам
 -- (контроллер делает look-ahead → плавная линия). Зовётся из Motion (function1).
-local function execute_path(count)
+local draw_pass_n = 0
+
+-- Конец прохода для ПК: ACK своего банка + счётчик проходов. BUSY=0 — вызывающий, после.
+local function finish_pass(bank, count)
+  WriteModbus((bank == 1) and REG_DRAW_DONE_N_ALT or REG_DRAW_DONE_N, "W", count)
+  draw_pass_n = (draw_pass_n + 1) % 65536
+  WriteModbus(REG_DRAW_PASS_N, "W", draw_pass_n)
+end
+
+-- bank/home защёлкнуты в motion_body при приёме: в конвейере ПК уже пишет регистры
+-- СЛЕДУЮЩЕГО прохода, пока исполняется этот.
+local function execute_path(count, bank, home)
   local pen_down = ReadModbus(REG_PEN_DOWN, "W") / XY_SCALE
   local pen_up   = ReadModbus(REG_PEN_UP,   "W") / XY_SCALE
   local spd      = ReadModbus(REG_DRAW_SPD, "W")
@@ -533,6 +550,8 @@ local function execute_path(count)
   AccL(draw_accel); DecL(draw_accel)  -- ускорение рисования с пульта (выше = быстрее на изгибах)
   if overlap < 0.1 then overlap = 0.1 end
   if count > PTS_MAX then count = PTS_MAX end
+  if bank == 1 and count > PTS_BANK_MAX then count = PTS_BANK_MAX end
+  local base = REG_PTS_BASE + bank * PTS_BANK_MAX * 3
 
   -- 1) пред-чтение пачки в таблицы (в цикле движения НЕТ Modbus-чтений)
   local px, py, pen = {}, {}, {}
@@ -540,7 +559,7 @@ local function execute_path(count)
   while got < count do
     local n = count - got
     if n > 10 then n = 10 end                        -- ≤30 регистров за чтение (как и запись с ПК)
-    local blk = MultiReadModbus(REG_PTS_BASE + got * 3, n * 3, "W")
+    local blk = MultiReadModbus(base + got * 3, n * 3, "W")
     if not blk or #blk < n * 3 then break end
     for k = 0, n - 1 do
       px[got + k + 1]  = blk[k * 3 + 1] / XY_SCALE
@@ -550,7 +569,7 @@ local function execute_path(count)
     got = got + n
   end
   if got < count then count = got end
-  if count < 1 then WriteModbus(REG_DRAW_BUSY, "W", 0); return end
+  if count < 1 then finish_pass(bank, 0); WriteModbus(REG_DRAW_BUSY, "W", 0); return end
 
   -- 2) координаты → ПУЛ distinct-точек POOL_BASE+1..POOL_BASE+count (Z по перу)
   for i = 1, count do
@@ -598,7 +617,9 @@ local function execute_path(count)
   end
 
   -- финал/после стопа: перо вверх НА МЕСТЕ. Между проходами робот ждёт здесь (не домой).
-  -- Подъём +1 см и заезд домой — только если ПК пометил этот проход последним (REG_DRAW_HOME=1).
+  -- Подъём +1 см и заезд домой — только если ПК пометил этот проход последним (home, защёлкнут
+  -- при приёме) либо Стоп (abort) с REG_DRAW_HOME=1, взведённым ПК во время прохода.
+  local aborted = draw_abort
   WriteModbus(REG_DRAW_ABORT, "W", 0)
   draw_abort     = false
   motion_stopped = false
@@ -608,7 +629,7 @@ local function execute_path(count)
   WritePoint(POOL_BASE + 1, "Y", RobotY() or py[count] or 0)
   WritePoint(POOL_BASE + 1, "Z", pen_up)
   MovL(POOL_BASE + 1)
-  if ReadModbus(REG_DRAW_HOME, "W") == 1 then
+  if home == 1 or (aborted and ReadModbus(REG_DRAW_HOME, "W") == 1) then
     WriteModbus(REG_DRAW_HOME, "W", 0)
     WritePoint(POOL_BASE + 1, "Z", pen_up + DRAW_LIFT_MM)  -- ещё +1 см вертикально (увести перо от листа)
     MovL(POOL_BASE + 1)
@@ -617,7 +638,7 @@ local function execute_path(count)
   end
   -- Read-back ACK: эхо РЕАЛЬНО выполненного count (пост-усечённого) — до обнуления PROG.
   -- ПК сверяет с размером пачки и при расхождении повторяет проход (точки не теряются молча).
-  WriteModbus(REG_DRAW_DONE_N, "W", count)
+  finish_pass(bank, count)
   WriteModbus(REG_DRAW_PROG, "W", 0)
   WriteModbus(REG_DRAW_BUSY, "W", 0)
   print("DRAW: проход завершён (" .. count .. " точек)")
@@ -663,7 +684,7 @@ local function draw_circle()
     MovP("GL_HOME")
     print("DRAW: круг завершён → подъём + домой")
   end
-  WriteModbus(REG_DRAW_DONE_N, "W", 1)  -- круг = один логический проход (read-back ACK)
+  finish_pass(0, 1)  -- круг = один логический проход (read-back ACK)
   WriteModbus(REG_DRAW_BUSY, "W", 0)
   print("DRAW: круг (" .. cx .. "," .. cy .. ") R=" .. r)
 end
@@ -926,14 +947,20 @@ local function motion_body()
       -- ================ РЕЖИМ РИСОВАНИЯ ================
       publish_pose()
       if ReadModbus(REG_DRAW_FLAG, "W") == 1 then
+        -- Защёлка задания ДО сброса флага: flag→0 для ПК = «параметры прочитаны», конвейер
+        -- сразу пишет следующее задание в те же регистры (его возьмём после этого прохода).
+        local dtype = ReadModbus(REG_DRAW_TYPE, "W")
+        local count = ReadModbus(REG_DRAW_COUNT, "W") or 0
+        local bank  = (ReadModbus(REG_DRAW_BANK, "W") == 1) and 1 or 0
+        local home  = ReadModbus(REG_DRAW_HOME, "W") or 0
+        WriteModbus(REG_DRAW_BANK, "W", 0)            -- банк потреблён: последовательный ПК его не пишет
         WriteModbus(REG_DRAW_FLAG, "W", 0)
         draw_abort = false
         WriteModbus(REG_DRAW_ABORT, "W", 0)
-        if ReadModbus(REG_DRAW_TYPE, "W") == 1 then
+        if dtype == 1 then
           draw_circle()                               -- круг через MCircle
-        else
-          local count = ReadModbus(REG_DRAW_COUNT, "W") or 0
-          if count > 0 then execute_path(count) end   -- полилиния через буфер
+        elseif count > 0 then
+          execute_path(count, bank, home)             -- полилиния через буфер (банк)
         end
       else
         -- Стоп МЕЖДУ проходами (робот стоит, busy=0 — Mirror не ловит abort в движении).
@@ -1148,6 +1175,9 @@ WriteModbus(REG_DRAW_COUNT, "W", 0)
 WriteModbus(REG_DRAW_BUSY,  "W", 0)
 WriteModbus(REG_DRAW_PROG,  "W", 0)
 WriteModbus(REG_DRAW_DONE_N, "W", 0)
+WriteModbus(REG_DRAW_DONE_N_ALT, "W", 0)
+WriteModbus(REG_DRAW_BANK,   "W", 0)
+WriteModbus(REG_DRAW_PASS_N, "W", 0)
 WriteModbus(REG_DRAW_ABORT, "W", 0)
 WriteModbus(REG_CIRC_CX,    "W", 0)
 WriteModbus(REG_CIRC_CY,    "W", 0)